@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Batch Scheduler Benchmark
+
+Simulates a batch of many small JPEGs with a few multi-GB videos at the end
+of the input list and compares makespan for:
+- input order:  ThreadPoolExecutor.map, as extract_comprehensive_batch did
+- scheduled:    BatchScheduler (longest predicted first, small files packed)
+
+Extraction is simulated by sleeping for a size- and format-dependent time
+(with noise) on sparse files, so the run needs no real media. The cost model
+is warmed with one batch first, as it would be after a few batches in a
+long-running worker.
+
+Usage:
+    python benchmarks/batch_scheduler_benchmark.py --images 2000 --videos 4 --workers 8
+"""
+
+import argparse
+import concurrent.futures
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from server.extractor.advanced_optimizations import BatchScheduler, CostModel  # noqa: E402
+
+MB = 1024 * 1024
+# "True" cost: fixed seconds + seconds per MB
+TRUE_COST = {".jpg": (0.003, 0.0004), ".mp4": (0.25, 0.0003)}
+
+
+def build_files(directory: Path, images: int, videos: int, seed: int):
+    rng = random.Random(seed)
+    paths = []
+    for index in range(images):
+        path = directory / f"img{index:05d}.jpg"
+        with open(path, "wb") as handle:
+            handle.truncate(rng.randint(2, 8) * MB)
+        paths.append(str(path))
+    for index in range(videos):
+        path = directory / f"clip{index:02d}.mp4"
+        with open(path, "wb") as handle:
+            handle.truncate(rng.randint(3, 5) * 1024 * MB)
+        paths.append(str(path))
+    return paths
+
+
+def simulated_extract(path: str) -> str:
+    fixed, per_mb = TRUE_COST[Path(path).suffix]
+    size_mb = Path(path).stat().st_size / MB
+    time.sleep((fixed + per_mb * size_mb) * random.uniform(0.9, 1.1))
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare input-order and cost-model batch scheduling")
+    parser.add_argument("--images", type=int, default=2000)
+    parser.add_argument("--videos", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_files(Path(tmp), args.images, args.videos, args.seed)
+
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(simulated_extract, paths))
+        input_order = time.perf_counter() - start
+
+        model = CostModel()
+        scheduler = BatchScheduler(model, max_workers=args.workers)
+        _, cold = scheduler.run(paths, simulated_extract)
+        _, warm = scheduler.run(paths, simulated_extract)
+
+    results = {
+        "files": len(paths),
+        "workers": args.workers,
+        "input_order_makespan_seconds": round(input_order, 3),
+        "scheduled_cold_makespan_seconds": round(cold["makespan_seconds"], 3),
+        "scheduled_warm_makespan_seconds": round(warm["makespan_seconds"], 3),
+        "units": warm["units"],
+        "cold_mape_percent": round(cold["mean_absolute_percentage_error"], 1),
+        "warm_mape_percent": round(warm["mean_absolute_percentage_error"], 1),
+    }
+    for key, value in results.items():
+        print(f"{key:<36}{value}")
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+metadata_db Search Benchmark
+
+Builds a synthetic metadata database and times search_metadata_query against
+the query shapes it used before typed columns, file_locations and FTS5:
+- numeric range:   CAST(value AS REAL) over the key index  vs value_num index
+- date range:      text comparison                          vs value_time index
+- bounding box:    two CAST joins on the GPS keys           vs file_locations
+- substring:       LOWER(value) LIKE '%...%'                vs trigram FTS5
+- hydration:       get_file_metadata() per hit (N+1)        vs one batched query
+- statistics:      COUNT/SUM/GROUP BY over files            vs stats_totals / facet_counts
+- facets:          GROUP BY over metadata per facet         vs facet_counts
+
+Usage:
+    python benchmarks/metadata_db_benchmark.py --files 1000000 --db /tmp/bench.db
+    python benchmarks/metadata_db_benchmark.py --db /tmp/bench.db --reuse --output results/metadata_db.json
+
+Building 1M files (about 13M metadata rows) takes several minutes and a few
+GB of disk; --reuse skips the build for an existing database.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "server" / "extractor"))
+sys.path.insert(0, str(ROOT / "server" / "extractor" / "modules"))
+
+import metadata_db  # noqa: E402
+
+MAKES = ["Canon", "Nikon", "Sony", "Fujifilm", "Olympus", "Panasonic", "Leica", "Apple", "Google", "Samsung"]
+WORDS = ("harbour sunset beach mountain forest city night street portrait market river bridge "
+         "aurora desert snow lake festival garden cathedral station island storm").split()
+ISOS = [50, 100, 200, 400, 800, 1600, 3200, 6400, 12800, 25600]
+
+
+def build_database(files: int, seed: int = 7, batch: int = 5000) -> None:
+    rng = random.Random(seed)
+    conn = metadata_db.get_db_connection()
+    cursor = conn.cursor()
+    start = time.perf_counter()
+    base = 1577836800  # 2020-01-01
+
+    for first in range(0, files, batch):
+        rows = []
+        for index in range(first, min(first + batch, files)):
+            stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(base + rng.randrange(5 * 365 * 86400)))
+            rows.append((index + 1, f"/synthetic/{index:08d}.jpg", f"{index:064x}", rng.randrange(1 << 25),
+                         0.0, ".jpg", stamp, stamp))
+        cursor.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+        for file_id, _path, _hash, size, _mtime, _type, stamp, _updated in rows:
+            make = rng.choice(MAKES)
+            flat = {
+                ("normalized", "camera_make"): make,
+                ("normalized", "camera_model"): f"{make} M{rng.randrange(100)}",
+                ("normalized", "iso"): str(rng.choice(ISOS)),
+                ("normalized", "exposure_time"): f"1/{rng.choice([30, 60, 125, 250, 500, 1000, 2000])}",
+                ("normalized", "focal_length"): f"{rng.choice([16, 24, 35, 50, 85, 135, 200])}.0 mm",
+                ("normalized", "description"): " ".join(rng.sample(WORDS, 4)),
+                ("exif", "DateTimeOriginal"): stamp.replace("-", ":").replace("T", " "),
+                ("image", "width"): str(rng.choice([1920, 4000, 6000])),
+                ("image", "height"): str(rng.choice([1080, 3000, 4000])),
+                ("filesystem", "created"): stamp,
+                ("file", "size_bytes"): str(size),
+            }
+            if rng.random() < 0.5:
+                flat[("gps", "latitude_decimal")] = f"{rng.uniform(-60, 70):.6f}"
+                flat[("gps", "longitude_decimal")] = f"{rng.uniform(-180, 180):.6f}"
+            metadata_db._insert_metadata_rows(cursor, file_id, flat)
+        conn.commit()
+        done = min(first + batch, files)
+        if done % (batch * 20) == 0 or done == files:
+            print(f"  {done:,} files ({time.perf_counter() - start:.0f}s)", flush=True)
+
+    cursor.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 2), "rows": len(result) if result is not None else 0}
+
+
+def legacy_query(sql: str, params: List[Any]) -> Callable[[], List[Any]]:
+    def run():
+        conn = metadata_db.get_db_connection()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+    return run
+
+
+# Pin the legacy queries to the indexes the old schema had: no extracted_at
+# index on files, and only the primary key / single-column indexes on metadata.
+LEGACY_SELECT = "SELECT DISTINCT f.id FROM files f NOT INDEXED "
+LEGACY_JOIN = "JOIN metadata {a} INDEXED BY sqlite_autoindex_metadata_1 ON f.id = {a}.file_id AND {a}.category = ? AND {a}.key = ? "
+ORDER = " ORDER BY f.extracted_at DESC LIMIT 100"
+
+
+def run_benchmarks(repeat: int) -> Dict[str, Dict[str, Any]]:
+    search = metadata_db.search_metadata_query
+    cases = {
+        "numeric_range": (
+            lambda: search("iso>12800"),
+            legacy_query(LEGACY_SELECT + LEGACY_JOIN.format(a="m0") + "WHERE CAST(m0.value AS REAL) > ?" + ORDER,
+                         ["normalized", "iso", 12800]),
+        ),
+        "date_range": (
+            lambda: search("exif.DateTimeOriginal>=2024-12-25 AND exif.DateTimeOriginal<2024-12-26"),
+            legacy_query(LEGACY_SELECT + LEGACY_JOIN.format(a="m0")
+                         + "WHERE m0.value >= ? AND m0.value < ?" + ORDER,
+                         ["exif", "DateTimeOriginal", "2024:12:25", "2024:12:26"]),
+        ),
+        "bounding_box": (
+            lambda: search("bbox:59.8,10.6,60.0,10.9"),
+            legacy_query(LEGACY_SELECT + LEGACY_JOIN.format(a="m0") + LEGACY_JOIN.format(a="m1")
+                         + "WHERE CAST(m0.value AS REAL) BETWEEN ? AND ? AND CAST(m1.value AS REAL) BETWEEN ? AND ?"
+                         + ORDER,
+                         ["gps", "latitude_decimal", "gps", "longitude_decimal", 59.8, 60.0, 10.6, 10.9]),
+        ),
+        "substring": (
+            lambda: search("description CONTAINS cathedral AND description CONTAINS aurora AND camera_make=Leica"),
+            legacy_query(LEGACY_SELECT + LEGACY_JOIN.format(a="m0") + LEGACY_JOIN.format(a="m1")
+                         + LEGACY_JOIN.format(a="m2")
+                         + "WHERE LOWER(m0.value) LIKE ? AND LOWER(m1.value) LIKE ? AND m2.value = ?" + ORDER,
+                         ["normalized", "description", "normalized", "description", "normalized", "camera_make",
+                          "%cathedral%", "%aurora%", "Leica"]),
+        ),
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, (current, legacy) in cases.items():
+        results[name] = {"indexed": timed(current, repeat), "legacy": timed(legacy, repeat)}
+
+    def legacy_statistics():
+        conn = metadata_db.get_db_connection()
+        try:
+            return [
+                conn.execute("SELECT COUNT(*) FROM files").fetchone(),
+                conn.execute("SELECT COUNT(*) FROM favorites").fetchone(),
+                *conn.execute("SELECT file_type, COUNT(*) FROM files GROUP BY file_type").fetchall(),
+                conn.execute("SELECT SUM(file_size) FROM files").fetchone(),
+                conn.execute("SELECT COUNT(DISTINCT file_hash) FROM files").fetchone(),
+            ]
+        finally:
+            conn.close()
+
+    def legacy_facets():
+        conn = metadata_db.get_db_connection()
+        try:
+            rows = conn.execute("SELECT file_type, COUNT(*) FROM files GROUP BY file_type").fetchall()
+            for key in ("camera_model", "lens_model"):
+                rows += conn.execute(
+                    "SELECT value, COUNT(*) FROM metadata WHERE category = 'normalized' AND key = ? GROUP BY value",
+                    (key,),
+                ).fetchall()
+            rows += conn.execute(
+                "SELECT substr(value, 1, 4), COUNT(*) FROM metadata"
+                " WHERE category = 'exif' AND key = 'DateTimeOriginal' GROUP BY 1"
+            ).fetchall()
+            rows += conn.execute("SELECT COUNT(*) FROM file_locations").fetchall()
+            return rows
+        finally:
+            conn.close()
+
+    results["statistics"] = {
+        "indexed": timed(lambda: list(metadata_db.get_statistics()), repeat),
+        "legacy": timed(legacy_statistics, repeat),
+    }
+    results["facet_counts"] = {
+        "indexed": timed(lambda: list(metadata_db.get_facet_counts()), repeat),
+        "legacy": timed(legacy_facets, repeat),
+    }
+
+    conn = metadata_db.get_db_connection()
+    ids = [row[0] for row in conn.execute("SELECT id FROM files ORDER BY extracted_at DESC LIMIT 100")]
+    results["hydrate_100"] = {
+        "indexed": timed(lambda: metadata_db._hydrate_files(conn.cursor(), ids), repeat),
+        "legacy": timed(lambda: [metadata_db.get_file_metadata(i) for i in ids], repeat),
+    }
+    conn.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark metadata_db search on a synthetic database")
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--db", default="/tmp/metadata_db_benchmark.db")
+    parser.add_argument("--reuse", action="store_true", help="benchmark an existing --db without rebuilding")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    metadata_db.DATABASE_PATH = args.db
+    if not args.reuse:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+        print(f"Building {args.files:,} synthetic files in {args.db}")
+        build_database(args.files)
+
+    results = run_benchmarks(args.repeat)
+    files = metadata_db.get_statistics()["total_files"]
+    print(f"\n{files:,} files, median of {args.repeat} runs")
+    print(f"{'case':<16}{'legacy ms':>12}{'indexed ms':>12}{'speedup':>10}{'rows':>8}")
+    for name, result in results.items():
+        legacy, indexed = result["legacy"]["median_ms"], result["indexed"]["median_ms"]
+        speedup = legacy / indexed if indexed else float("inf")
+        print(f"{name:<16}{legacy:>12.2f}{indexed:>12.2f}{speedup:>9.1f}x{result['indexed']['rows']:>8}")
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps({"files": files, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,14 @@ from datetime import timedelta
 
 from .redis_client import get_redis_client
 
+try:
+    from ..extractor.utils.hashing import hash_file
+except ImportError:
+    try:
+        from extractor.utils.hashing import hash_file
+    except ImportError:
+        hash_file = None
+
 logger = logging.getLogger("metaextract.cache.base")
 
 
@@ -94,6 +102,8 @@ class BaseCache(ABC):
                 return hasher.hexdigest()
             else:
                 # Full hash for small files
+                if hash_file is not None:
+                    return hash_file(file_path, ("sha256",))["sha256"]
                 hasher = hashlib.sha256()
                 with open(file_path, "rb") as f:
                     for chunk in iter(lambda: f.read(65536), b""):
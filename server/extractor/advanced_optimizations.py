@@ -7,11 +7,18 @@ Implements advanced optimization techniques:
 - Machine learning-based scheduling
 - Smart caching strategies
 - Performance prediction
+- Cost-model-driven batch scheduling (LPT order, small-file packing,
+  memory-budgeted heavy jobs); the learned cost model is saved as JSON
+  next to the metadata database so it survives CLI invocations
 
 Author: MetaExtract Team
 """
 
+import concurrent.futures
+import json
 import logging
+import os
+import tempfile
 import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -21,6 +28,17 @@ import time
 from collections import defaultdict
 import statistics
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    from .utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +68,7 @@ class AdaptiveChunkSizer(OptimizationStrategy):
     
     def __init__(self):
         self.baseline_chunk_size = 1024 * 1024  # 1MB
-        self.file_analysis_cache: Dict[str, FileCharacteristics] = {}
+        self.file_analysis_cache = BoundedCache("file_characteristics", max_entries=4096)
         self.lock = threading.RLock()
     
     def analyze_file(self, file_path: str) -> FileCharacteristics:
@@ -60,9 +78,9 @@ class AdaptiveChunkSizer(OptimizationStrategy):
             file_type = Path(file_path).suffix.lower()
             
             # Check cache
-            with self.lock:
-                if file_path in self.file_analysis_cache:
-                    return self.file_analysis_cache[file_path]
+            cached = self.file_analysis_cache.get(file_path)
+            if cached is not None:
+                return cached
             
             # Calculate characteristics
             complexity_score = self._calculate_complexity(file_path, file_type)
@@ -97,8 +115,7 @@ class AdaptiveChunkSizer(OptimizationStrategy):
             )
             
             # Cache result
-            with self.lock:
-                self.file_analysis_cache[file_path] = characteristics
+            self.file_analysis_cache.put(file_path, characteristics)
             
             return characteristics
         
@@ -221,6 +238,196 @@ class PerformancePredictor:
             }
 
 
+# Fixed per-file cost (seconds) before any observations, by tier: higher
+# tiers run more modules per file
+TIER_BASE_SECONDS = {'free': 0.05, 'starter': 0.1, 'premium': 0.2, 'super': 0.4}
+DEFAULT_BASE_SECONDS = 0.2
+
+# Rough peak memory per input byte while extracting; video/audio parsers read
+# container headers, decoders hold whole images in memory
+MEMORY_PER_BYTE = {
+    '.jpg': 4.0, '.jpeg': 4.0, '.png': 4.0, '.webp': 4.0, '.heic': 6.0, '.heif': 6.0,
+    '.tif': 2.0, '.tiff': 2.0, '.cr2': 2.0, '.nef': 2.0, '.arw': 2.0, '.dng': 2.0,
+    '.mp4': 0.05, '.mov': 0.05, '.avi': 0.05, '.mkv': 0.05, '.webm': 0.05,
+    '.mp3': 0.1, '.wav': 0.1, '.flac': 0.1,
+    '.pdf': 0.5, '.h5': 1.0, '.nc': 1.0, '.fits': 1.0, '.dcm': 1.5,
+}
+DEFAULT_MEMORY_PER_BYTE = 1.0
+BASE_MEMORY_BYTES = 32 * 1024 * 1024
+
+_MB = 1024 * 1024
+
+# Overrides where the learned cost model is persisted (default: next to
+# data/metadata.db)
+COST_MODEL_PATH_ENV = "METAEXTRACT_COST_MODEL_PATH"
+DEFAULT_COST_MODEL_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "cost_model.json"
+COST_MODEL_FORMAT_VERSION = 1
+
+
+@dataclass
+class _CostFit:
+    """Exponentially decayed least-squares sums for seconds = a + b * size_mb."""
+    n: float = 0.0
+    sx: float = 0.0
+    sy: float = 0.0
+    sxx: float = 0.0
+    sxy: float = 0.0
+    observations: int = 0
+
+    def add(self, size_mb: float, seconds: float, decay: float) -> None:
+        self.n = self.n * decay + 1
+        self.sx = self.sx * decay + size_mb
+        self.sy = self.sy * decay + seconds
+        self.sxx = self.sxx * decay + size_mb * size_mb
+        self.sxy = self.sxy * decay + size_mb * seconds
+        self.observations += 1
+
+    def coefficients(self) -> Tuple[float, float]:
+        """(intercept seconds, seconds per MB), both non-negative."""
+        denominator = self.n * self.sxx - self.sx * self.sx
+        if denominator > 1e-9 * max(1.0, self.n * self.sxx):
+            slope = (self.n * self.sxy - self.sx * self.sy) / denominator
+            intercept = (self.sy - slope * self.sx) / self.n
+            if slope >= 0 and intercept >= 0:
+                return intercept, slope
+        if self.sx > 0:
+            # No usable spread in sizes (or a negative fit): scale by throughput
+            return 0.0, self.sy / self.sx
+        return self.sy / self.n if self.n else 0.0, 0.0
+
+    def predict(self, size_mb: float) -> float:
+        intercept, slope = self.coefficients()
+        return intercept + slope * size_mb
+
+
+class CostModel(PerformancePredictor):
+    """
+    Learned per-format, per-tier extraction cost model.
+
+    Keeps PerformancePredictor's history, and additionally fits
+    seconds = a + b * size per (format, tier) with exponentially decayed
+    sums, so memory is constant and the model follows drift. Predictions
+    fall back from (format, tier) to format across tiers to a size and
+    complexity prior.
+    """
+
+    def __init__(self, decay: float = 0.98, min_observations: int = 3):
+        super().__init__()
+        self.decay = decay
+        self.min_observations = min_observations
+        self.fits: Dict[Tuple[str, str], _CostFit] = {}
+        self.module_seconds: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._sizer = AdaptiveChunkSizer()
+
+    def record_extraction(self, file_type: str, file_size: int, processing_time: float,
+                          tier: Optional[str] = None,
+                          module_times: Optional[Dict[str, float]] = None) -> None:
+        """Record extraction performance (seconds), optionally with per-module seconds."""
+        super().record_extraction(file_type, file_size, processing_time)
+        size_mb = file_size / _MB
+        keys = [(file_type, '*'), (file_type, tier)] if tier else [(file_type, '*')]
+        with self.lock:
+            for key in keys:
+                fit = self.fits.get(key)
+                if fit is None:
+                    fit = self.fits[key] = _CostFit()
+                fit.add(size_mb, processing_time, self.decay)
+            if module_times:
+                averages = self.module_seconds[file_type]
+                for module, seconds in module_times.items():
+                    previous = averages.get(module)
+                    averages[module] = seconds if previous is None else previous + (seconds - previous) * (1 - self.decay)
+
+    def prior(self, file_type: str, file_size: int, tier: Optional[str] = None) -> float:
+        """Cost estimate before any observations for this format."""
+        complexity = self._sizer._calculate_complexity('', file_type)
+        base = TIER_BASE_SECONDS.get(tier or '', DEFAULT_BASE_SECONDS)
+        return base + self._sizer._estimate_processing_time(file_size, complexity)
+
+    def predict_time(self, file_type: str, file_size: int, tier: Optional[str] = None) -> float:
+        """Predict processing time (seconds) for a file."""
+        size_mb = file_size / _MB
+        keys = [(file_type, tier), (file_type, '*')] if tier else [(file_type, '*')]
+        with self.lock:
+            for key in keys:
+                fit = self.fits.get(key)
+                if fit is not None and fit.observations >= self.min_observations:
+                    return fit.predict(size_mb)
+        return self.prior(file_type, file_size, tier)
+
+    def estimate_memory(self, file_type: str, file_size: int) -> int:
+        """Rough peak memory (bytes) needed to extract a file."""
+        return BASE_MEMORY_BYTES + int(file_size * MEMORY_PER_BYTE.get(file_type, DEFAULT_MEMORY_PER_BYTE))
+
+    def get_model(self, file_type: str) -> Dict[str, Any]:
+        """Fitted coefficients per tier and average per-module seconds for a format."""
+        with self.lock:
+            tiers = {
+                tier: {
+                    'observations': fit.observations,
+                    'intercept_seconds': fit.coefficients()[0],
+                    'seconds_per_mb': fit.coefficients()[1],
+                }
+                for (ftype, tier), fit in self.fits.items() if ftype == file_type
+            }
+            return {'tiers': tiers, 'module_seconds': dict(self.module_seconds.get(file_type, {}))}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable fits and module averages (the raw history is not kept)."""
+        with self.lock:
+            return {
+                'version': COST_MODEL_FORMAT_VERSION,
+                'decay': self.decay,
+                'fits': [
+                    {'format': ftype, 'tier': tier, **vars(fit)}
+                    for (ftype, tier), fit in self.fits.items()
+                ],
+                'module_seconds': {ftype: dict(modules) for ftype, modules in self.module_seconds.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], **kwargs) -> 'CostModel':
+        model = cls(decay=state.get('decay', 0.98), **kwargs)
+        for entry in state.get('fits', []):
+            entry = dict(entry)
+            key = (entry.pop('format'), entry.pop('tier'))
+            model.fits[key] = _CostFit(**entry)
+        for ftype, modules in state.get('module_seconds', {}).items():
+            model.module_seconds[ftype].update(modules)
+        return model
+
+    def save(self, path: Path) -> None:
+        """Write the model atomically; concurrent writers keep the last save."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as handle:
+                json.dump(self.to_dict(), handle)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> Optional['CostModel']:
+        """Model saved at path, or None when missing, unreadable or of another version."""
+        try:
+            with open(path) as handle:
+                state = json.load(handle)
+            if state.get('version') != COST_MODEL_FORMAT_VERSION:
+                return None
+            return cls.from_dict(state, **kwargs)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cost model {path}: {e}")
+            return None
+
+
 class SmartCacheManager:
     """Intelligent cache management with eviction policies."""
     
@@ -351,6 +558,209 @@ class BatchOptimizer:
         return distribution
 
 
+@dataclass
+class ScheduledFile:
+    """One input file with its predicted cost."""
+    index: int
+    path: str
+    file_type: str
+    file_size: int
+    predicted_seconds: float
+    memory_bytes: int
+
+
+@dataclass
+class WorkUnit:
+    """Files one worker processes back to back."""
+    files: List[ScheduledFile] = field(default_factory=list)
+    predicted_seconds: float = 0.0
+    memory_bytes: int = 0
+    heavy: bool = False
+
+    def add(self, item: ScheduledFile) -> None:
+        self.files.append(item)
+        self.predicted_seconds += item.predicted_seconds
+        self.memory_bytes = max(self.memory_bytes, item.memory_bytes)
+
+
+class BatchScheduler:
+    """
+    Schedules a batch of extractions from predicted per-file costs.
+
+    - Longest-processing-time-first: expensive files start first, so a few
+      large videos do not end up alone at the tail of the batch.
+    - Files predicted under pack_threshold_seconds are packed into shared
+      work units, saving per-task overhead on batches of small images.
+    - Heavy files (estimated peak memory >= heavy_memory_bytes) only start
+      while their estimates fit in memory_budget_bytes; lighter work runs
+      in the meantime. One heavy job always runs, even over budget.
+
+    Observed runtimes feed back into the cost model, and run() reports
+    predicted vs. actual error.
+    """
+
+    def __init__(self, cost_model: Optional[CostModel] = None, max_workers: int = 4,
+                 memory_budget_bytes: Optional[int] = None,
+                 heavy_memory_bytes: int = 256 * 1024 * 1024,
+                 pack_threshold_seconds: float = 0.25,
+                 unit_target_seconds: float = 1.0,
+                 max_unit_files: int = 32):
+        self.cost_model = cost_model or get_cost_model()
+        self.max_workers = max(1, max_workers)
+        self.memory_budget_bytes = memory_budget_bytes or self._default_memory_budget()
+        self.heavy_memory_bytes = heavy_memory_bytes
+        self.pack_threshold_seconds = pack_threshold_seconds
+        self.unit_target_seconds = unit_target_seconds
+        self.max_unit_files = max_unit_files
+
+    @staticmethod
+    def _default_memory_budget() -> int:
+        if PSUTIL_AVAILABLE:
+            try:
+                return int(psutil.virtual_memory().available * 0.5)
+            except Exception:
+                pass
+        return 2 * 1024 * 1024 * 1024
+
+    def _describe(self, index: int, path: str, tier: Optional[str]) -> ScheduledFile:
+        try:
+            file_size = Path(path).stat().st_size
+        except OSError:
+            file_size = 0
+        file_type = Path(path).suffix.lower()
+        return ScheduledFile(
+            index=index,
+            path=path,
+            file_type=file_type,
+            file_size=file_size,
+            predicted_seconds=self.cost_model.predict_time(file_type, file_size, tier),
+            memory_bytes=self.cost_model.estimate_memory(file_type, file_size),
+        )
+
+    def plan(self, file_paths: List[str], tier: Optional[str] = None) -> List[WorkUnit]:
+        """Work units in dispatch (longest predicted first) order."""
+        files = [self._describe(index, path, tier) for index, path in enumerate(file_paths)]
+        units: List[WorkUnit] = []
+        small: List[ScheduledFile] = []
+        for item in files:
+            if item.predicted_seconds < self.pack_threshold_seconds and item.memory_bytes < self.heavy_memory_bytes:
+                small.append(item)
+            else:
+                unit = WorkUnit(heavy=item.memory_bytes >= self.heavy_memory_bytes)
+                unit.add(item)
+                units.append(unit)
+
+        if small:
+            # Keep at least a few units per worker so packing cannot starve the pool
+            small_total = sum(item.predicted_seconds for item in small)
+            target = min(self.unit_target_seconds,
+                         max(self.pack_threshold_seconds, small_total / (self.max_workers * 4)))
+            small.sort(key=lambda item: -item.predicted_seconds)
+            unit = WorkUnit()
+            for item in small:
+                unit.add(item)
+                if unit.predicted_seconds >= target or len(unit.files) >= self.max_unit_files:
+                    units.append(unit)
+                    unit = WorkUnit()
+            if unit.files:
+                units.append(unit)
+
+        units.sort(key=lambda unit: -unit.predicted_seconds)
+        return units
+
+    @staticmethod
+    def _run_unit(unit: WorkUnit, process: Callable[[str], Any]) -> List[Tuple[ScheduledFile, Any, float]]:
+        done = []
+        for item in unit.files:
+            start = time.perf_counter()
+            result = process(item.path)
+            done.append((item, result, time.perf_counter() - start))
+        return done
+
+    def run(self, file_paths: List[str], process: Callable[[str], Any], tier: Optional[str] = None,
+            succeeded: Optional[Callable[[Any], bool]] = None,
+            module_times: Optional[Callable[[Any], Optional[Dict[str, float]]]] = None
+            ) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Process every path with process(path) on a thread pool.
+
+        Returns the results in input order and a scheduling report. Only
+        results for which succeeded(result) holds (all, by default) update
+        the cost model and the error statistics; module_times(result), if
+        given, supplies per-module seconds for the model's breakdown.
+        """
+        start = time.perf_counter()
+        pending = self.plan(file_paths, tier)
+        unit_count = len(pending)
+        results: List[Any] = [None] * len(file_paths)
+        observations: List[Tuple[ScheduledFile, float]] = []
+        heavy_memory = 0
+        heavy_running = 0
+        peak_heavy_memory = 0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight: Dict[concurrent.futures.Future, WorkUnit] = {}
+            while pending or in_flight:
+                position = 0
+                while len(in_flight) < self.max_workers and position < len(pending):
+                    unit = pending[position]
+                    if unit.heavy and heavy_running and heavy_memory + unit.memory_bytes > self.memory_budget_bytes:
+                        position += 1
+                        continue
+                    pending.pop(position)
+                    if unit.heavy:
+                        heavy_running += 1
+                        heavy_memory += unit.memory_bytes
+                        peak_heavy_memory = max(peak_heavy_memory, heavy_memory)
+                    in_flight[executor.submit(self._run_unit, unit, process)] = unit
+
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    unit = in_flight.pop(future)
+                    if unit.heavy:
+                        heavy_running -= 1
+                        heavy_memory -= unit.memory_bytes
+                    for item, result, actual in future.result():
+                        results[item.index] = result
+                        if succeeded is None or succeeded(result):
+                            observations.append((item, actual))
+                            self.cost_model.record_extraction(
+                                item.file_type, item.file_size, actual, tier,
+                                module_times(result) if module_times else None,
+                            )
+
+        report = self._report(observations)
+        report.update({
+            'files': len(file_paths),
+            'units': unit_count,
+            'makespan_seconds': time.perf_counter() - start,
+            'memory_budget_bytes': self.memory_budget_bytes,
+            'peak_heavy_memory_bytes': peak_heavy_memory,
+        })
+        return results, report
+
+    @staticmethod
+    def _report(observations: List[Tuple[ScheduledFile, float]]) -> Dict[str, Any]:
+        """Predicted vs. actual error, overall and per format."""
+        def summarize(pairs: List[Tuple[ScheduledFile, float]]) -> Dict[str, Any]:
+            errors = [abs(item.predicted_seconds - actual) for item, actual in pairs]
+            relative = [error / actual for error, (_, actual) in zip(errors, pairs) if actual > 0]
+            return {
+                'count': len(pairs),
+                'predicted_seconds': sum(item.predicted_seconds for item, _ in pairs),
+                'actual_seconds': sum(actual for _, actual in pairs),
+                'mean_absolute_error_seconds': statistics.mean(errors) if errors else 0.0,
+                'mean_absolute_percentage_error': statistics.mean(relative) * 100 if relative else 0.0,
+            }
+
+        by_format: Dict[str, List[Tuple[ScheduledFile, float]]] = defaultdict(list)
+        for item, actual in observations:
+            by_format[item.file_type].append((item, actual))
+        report = summarize(observations)
+        report['by_format'] = {file_type: summarize(pairs) for file_type, pairs in by_format.items()}
+        return report
+
+
 class GPUAccelerator:
     """GPU acceleration for compatible formats."""
     
@@ -418,3 +828,40 @@ def optimize_batch(file_paths: List[str], num_workers: int = 4) -> Dict[int, Lis
     """Optimize batch distribution across workers."""
     optimizer = BatchOptimizer()
     return optimizer.distribute_across_workers(file_paths, num_workers)
+
+
+_cost_model: Optional[CostModel] = None
+_cost_model_lock = threading.Lock()
+
+
+def cost_model_path() -> Path:
+    return Path(os.environ.get(COST_MODEL_PATH_ENV) or DEFAULT_COST_MODEL_PATH)
+
+
+def get_cost_model() -> CostModel:
+    """Process-wide cost model shared by batch schedulers, loaded from disk once."""
+    global _cost_model
+    if _cost_model is None:
+        with _cost_model_lock:
+            if _cost_model is None:
+                _cost_model = CostModel.load(cost_model_path()) or CostModel()
+    return _cost_model
+
+
+def save_cost_model() -> bool:
+    """Persist the process-wide cost model; False if none was created or saving failed."""
+    if _cost_model is None:
+        return False
+    try:
+        _cost_model.save(cost_model_path())
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save cost model: {e}")
+        return False
+
+
+def schedule_batch(file_paths: List[str], tier: Optional[str] = None,
+                   num_workers: int = 4) -> List[List[str]]:
+    """Planned work units (file paths per unit) in dispatch order."""
+    scheduler = BatchScheduler(max_workers=num_workers)
+    return [[item.path for item in unit.files] for unit in scheduler.plan(file_paths, tier)]
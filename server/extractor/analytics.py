@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from .monitoring import get_monitor, SystemMonitor
+from .utils.quantile_sketch import SketchFamily
 from .comprehensive_metadata_engine import COMPREHENSIVE_TIER_CONFIGS, Tier
 
 
@@ -43,14 +44,31 @@ class BottleneckType(Enum):
 class PatternAnalyzer:
     """Analyzes patterns in extraction data to identify bottlenecks and failure trends."""
     
-    def __init__(self, max_samples: int = 10000):
+    def __init__(self, max_samples: int = 10000, percentile_window_seconds: float = 3600):
         self.samples = deque(maxlen=max_samples)
-        self.lock = threading.Lock()
+        # Re-entrant: identify_bottlenecks calls the other pattern methods under the lock
+        self.lock = threading.RLock()
+        # Successful-extraction latency percentiles over the trailing window
+        self.latency_by_tier = SketchFamily("analytics_latency_by_tier", "Latency by tier", "tier",
+                                            max_age=percentile_window_seconds)
+        self.latency_by_filetype = SketchFamily("analytics_latency_by_filetype", "Latency by file type",
+                                                "file_type", max_age=percentile_window_seconds)
         
     def add_sample(self, sample: PerformanceSample):
         """Add a performance sample for analysis."""
         with self.lock:
             self.samples.append(sample)
+            if sample.success:
+                self.latency_by_tier.observe(sample.processing_time_ms, sample.tier, sample.timestamp)
+                self.latency_by_filetype.observe(sample.processing_time_ms, sample.file_type, sample.timestamp)
+
+    def get_latency_percentiles(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """p50/p95/p99 of successful extractions by tier and file type over the trailing window."""
+        with self.lock:
+            return {
+                'by_tier': self.latency_by_tier.quantiles(now=now),
+                'by_filetype': self.latency_by_filetype.quantiles(now=now),
+            }
     
     def get_failure_patterns(self) -> Dict[str, Any]:
         """Analyze patterns in failures."""
@@ -157,7 +175,8 @@ class PatternAnalyzer:
                 'performance_by_tier': performance_by_tier,
                 'performance_by_filetype': performance_by_filetype,
                 'outliers_count': len(outliers),
-                'outlier_percentage': len(outliers) / len(self.samples) * 100 if self.samples else 0
+                'outlier_percentage': len(outliers) / len(self.samples) * 100 if self.samples else 0,
+                'latency_percentiles': self.get_latency_percentiles()
             }
     
     def identify_bottlenecks(self) -> List[Dict[str, Any]]:
@@ -207,6 +226,18 @@ class PatternAnalyzer:
                         'description': f'High average processing time for {filetype}: {perf_data["avg"]:.2f}ms',
                         'recommendation': f'Optimize {filetype} processing pipeline'
                     })
+
+            # Check for tail latency that the averages hide
+            by_filetype = performance_data.get('latency_percentiles', {}).get('by_filetype', {})
+            for filetype, percentiles in by_filetype.items():
+                p99 = percentiles.get('p99') or 0
+                if p99 > 30000 and percentiles.get('mean', 0) <= 10000:  # Slow tail, acceptable average
+                    bottlenecks.append({
+                        'type': BottleneckType.HIGH_LATENCY.value,
+                        'severity': 'medium',
+                        'description': f'High p99 processing time for {filetype}: {p99:.2f}ms',
+                        'recommendation': f'Investigate slow outliers in {filetype} processing'
+                    })
             
             return bottlenecks
     
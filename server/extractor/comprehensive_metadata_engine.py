@@ -87,7 +87,8 @@ except ImportError:
     # Create a dummy function if monitoring is not available
     def record_extraction_for_monitoring(processing_time_ms: float, success: bool,
                                        tier: str = "unknown", file_type: str = "unknown",
-                                       error_type: Optional[str] = None):
+                                       error_type: Optional[str] = None,
+                                       module_times_ms: Optional[Dict[str, float]] = None):
         pass
     MONITORING_AVAILABLE = False
 
@@ -332,6 +333,21 @@ except ImportError:
     except ImportError:
         get_cache = None  # type: ignore[assignment]
 
+try:
+    from .utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache  # type: ignore
+
+try:
+    from .advanced_optimizations import BatchScheduler, get_cost_model, save_cost_model
+    BATCH_SCHEDULER_AVAILABLE = True
+except ImportError:
+    try:
+        from advanced_optimizations import BatchScheduler, get_cost_model, save_cost_model  # type: ignore
+        BATCH_SCHEDULER_AVAILABLE = True
+    except ImportError:
+        BATCH_SCHEDULER_AVAILABLE = False
+
 # ============================================================================
 # Error Handling Utilities
 # ============================================================================
@@ -668,6 +684,22 @@ try:
 except ImportError:
     MetadataComparator = None  # type: ignore[assignment]
 
+try:
+    from .modules.telemetry_decoder import read_telemetry, summarize_telemetry
+except ImportError:
+    read_telemetry = None  # type: ignore[assignment]
+    summarize_telemetry = None  # type: ignore[assignment]
+
+try:
+    from .formats.fits_header import scan_fits_hdus
+except ImportError:
+    scan_fits_hdus = None  # type: ignore[assignment]
+
+try:
+    from .modules.hdf5_indexer import KIND_DATASET as HDF5_KIND_DATASET, get_hdf5_index
+except ImportError:
+    get_hdf5_index = None  # type: ignore[assignment]
+
 try:
     from .modules.advanced_analysis import (
         detect_ai_content,
@@ -1453,8 +1485,10 @@ class AstronomicalDataEngine:
     """FITS astronomical data extraction - 3,000+ fields with performance optimizations"""
     
     def __init__(self):
-        self._wcs_cache = {}  # Cache for expensive WCS computations
-        self._header_cache = {}  # Cache for header extractions
+        # Cache for expensive WCS computations
+        self._wcs_cache = BoundedCache("astronomy_wcs", max_entries=512, max_bytes=8 << 20)
+        # Cache for header extractions
+        self._header_cache = BoundedCache("astronomy_headers", max_entries=128, max_bytes=32 << 20)
     
     def _get_cached_wcs_analysis(self, filepath: str, header) -> Dict[str, Any]:
         """Cache WCS analysis to avoid recomputation."""
@@ -1464,8 +1498,9 @@ class AstronomicalDataEngine:
             header_str = str(sorted(header.items()))
             cache_key = hashlib.md5(f"{filepath}:{header_str}".encode()).hexdigest()
             
-            if cache_key in self._wcs_cache:
-                return self._wcs_cache[cache_key]
+            cached = self._wcs_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
             # Perform WCS analysis
             wcs = WCS(header)
@@ -1499,16 +1534,16 @@ class AstronomicalDataEngine:
                             "dec_degrees": fov_dec / 3600
                         }
                 
-                self._wcs_cache[cache_key] = wcs_result
+                self._wcs_cache.put(cache_key, wcs_result)
                 return wcs_result
             else:
                 result = {"has_celestial_wcs": False}
-                self._wcs_cache[cache_key] = result
+                self._wcs_cache.put(cache_key, result)
                 return result
                 
         except Exception as e:
             result = {"has_celestial_wcs": False, "error": str(e)}
-            self._wcs_cache[cache_key] = result
+            self._wcs_cache.put(cache_key, result)
             return result
     
     @staticmethod
@@ -1536,6 +1571,17 @@ class AstronomicalDataEngine:
             # Extract nested fits_metadata
             fits_data = raw_result.get('fits_metadata', {})
             
+            # Every HDU's header and shape, seeking past the data units
+            extensions = fits_data.get('extensions', [])
+            hdu_count = None
+            if scan_fits_hdus is not None and raw_result.get('extraction_success'):
+                try:
+                    hdus = scan_fits_hdus(filepath)
+                    hdu_count = len(hdus)
+                    extensions = [hdu.describe() for hdu in hdus[1:]]
+                except Exception as e:
+                    logger.debug(f"FITS header scan failed for {filepath}: {e}")
+            
             # Convert to expected format with 'available' flag and expected keys
             if raw_result.get('extraction_success') and fits_data:
                 # Provide minimal but expected structure for validation
@@ -1548,7 +1594,8 @@ class AstronomicalDataEngine:
                     "processing_info": {},
                     "raw_headers": {"PRIMARY_HDU": fits_data.get('header_summary', {})},
                     "file_info": fits_data.get('primary_hdu', {}),
-                    "extensions": fits_data.get('extensions', []),
+                    "extensions": extensions,
+                    "hdu_count": hdu_count,
                     "performance": fits_data.get('performance', {}),
                     "_fast_extraction": True
                 }
@@ -1780,29 +1827,24 @@ class ScientificInstrumentEngine:
                     "global_attributes_count": len(f.attrs)  # Count only, don't load
                 }
                 
-                # ULTRA-MINIMAL structure - no attribute loading at all
-                def count_structure(group, max_items=3):
-                    """Count structure only, no data loading."""
-                    info = {
-                        "groups": 0,
-                        "datasets": 0
-                    }
-                    
-                    for i, key in enumerate(list(group.keys())[:max_items]):
-                        try:
-                            item = group[key]
-                            if isinstance(item, h5py.Group):
-                                info["groups"] += 1
-                            elif isinstance(item, h5py.Dataset):
-                                info["datasets"] += 1
-                        except:
-                            continue
-                    
-                    return info
-                
-                # Just count, don't load details
+                # Budgeted link walk; attribute values are never loaded
                 explore_start = time.time()
-                result["structure"] = count_structure(f)
+                index = get_hdf5_index(filepath, time_budget=2.0) if get_hdf5_index else None
+                if index is not None:
+                    summary = index.summary()
+                    result["structure"] = {
+                        "groups": summary["total_groups"] - 1,
+                        "datasets": summary["total_datasets"],
+                        "complete": summary["complete"],
+                        "inventory": summary,
+                        "datasets_preview": list(index.iter_rows(kind=HDF5_KIND_DATASET, limit=20)),
+                    }
+                else:
+                    result["structure"] = {
+                        "groups": sum(1 for item in f.values() if isinstance(item, h5py.Group)),
+                        "datasets": sum(1 for item in f.values() if isinstance(item, h5py.Dataset)),
+                        "complete": False,
+                    }
                 result["performance"]["structure_time"] = time.time() - explore_start
                 
                 result["performance"]["total_extraction_time"] = time.time() - start_time
@@ -1877,6 +1919,41 @@ class DroneUAVEngine:
             "manufacturer_specific": {}
         }
         
+        # Decode GPMF / DJI telemetry tracks straight from the container
+        telemetry = None
+        if read_telemetry is not None:
+            try:
+                telemetry = read_telemetry(filepath)
+            except Exception as e:
+                logger.debug(f"Native telemetry decode failed for {filepath}: {e}")
+        if telemetry is not None and (telemetry.gps_points or telemetry.imu):
+            summary = summarize_telemetry(telemetry, simplify_epsilon_m=5.0)
+            metrics = summary["flight_metrics"]
+            result["flight_data"] = metrics
+            result["sensor_data"] = summary["imu"]
+            result["manufacturer_specific"]["telemetry_tracks"] = {
+                "sources": summary["sources"],
+                "tracks": summary["tracks"],
+                "streams": summary["streams"],
+            }
+            if metrics:
+                result["gps_track"] = {
+                    "has_gps": True,
+                    "points": metrics["points"],
+                    "coordinates": {
+                        "latitude": metrics["start"]["latitude"],
+                        "longitude": metrics["start"]["longitude"],
+                        "altitude": summary["gps"].get("altitude", {}).get("first")
+                    },
+                    "movement": {
+                        "max_speed": metrics.get("max_speed_mps"),
+                        "avg_speed": metrics.get("avg_speed_mps"),
+                        "distance_m": metrics["total_distance_m"]
+                    },
+                    "bounds": metrics["bounds"],
+                    "simplified_track": summary.get("simplified_track")
+                }
+        
         # Use exiftool data if available (contains DJI, GoPro telemetry)
         if exiftool_data:
             # DJI drone metadata
@@ -1896,7 +1973,7 @@ class DroneUAVEngine:
                     result["manufacturer_specific"]["gopro"] = gopro_fields
         
         # Extract GPS track from video metadata
-        if exiftool_data and "gps" in exiftool_data:
+        if exiftool_data and "gps" in exiftool_data and not result["gps_track"]:
             gps_data = exiftool_data["gps"]
             result["gps_track"] = {
                 "has_gps": bool(gps_data),
@@ -3268,6 +3345,7 @@ class ComprehensiveMetadataExtractor:
         # Calculate performance summary
         # Collect performance data from all module results
         all_module_performance = {}
+        module_times_ms = {}
 
         # Look for performance data in all module results
         module_result_keys = [
@@ -3315,7 +3393,9 @@ class ComprehensiveMetadataExtractor:
                     
                 if perf_data.get("status") == "success":
                     successful_modules += 1
-                    total_module_time += perf_data.get("duration_seconds", 0) * 1000
+                    module_time = perf_data.get("duration_seconds", 0) * 1000
+                    total_module_time += module_time
+                    module_times_ms[module_name] = module_time
                 else:
                     failed_modules += 1
 
@@ -3352,7 +3432,8 @@ class ComprehensiveMetadataExtractor:
                 success=success,
                 tier=tier,
                 file_type=file_type,
-                error_type=error_type
+                error_type=error_type,
+                module_times_ms=module_times_ms
             )
 
         # Record metrics for analytics
@@ -3582,14 +3663,34 @@ def extract_comprehensive_metadata(
         return error_response
 
 
+def _module_times_seconds(metadata: Dict[str, Any]) -> Dict[str, float]:
+    """Per-module durations of successful modules from an extraction result."""
+    times: Dict[str, float] = {}
+    for value in metadata.values():
+        performance = value.get("performance") if isinstance(value, dict) else None
+        if not isinstance(performance, dict):
+            continue
+        for module_name, perf_data in performance.items():
+            if isinstance(perf_data, dict) and perf_data.get("status") == "success":
+                times[module_name] = perf_data.get("duration_seconds", 0)
+    return times
+
+
 def extract_comprehensive_batch(
     filepaths: List[str],
     tier: str = "super",
     max_workers: int = 4,
     store_results: bool = False,
     enable_ocr: bool = True,
+    schedule: bool = True,
 ) -> Dict[str, Any]:
-    """Extract metadata for multiple files with optional storage."""
+    """
+    Extract metadata for multiple files with optional storage.
+
+    With schedule=True, files are dispatched by predicted cost (see
+    advanced_optimizations.BatchScheduler) instead of input order, and the
+    payload carries a "schedule" report of predicted vs. actual runtimes.
+    """
     start_time = time.time()
 
     # Log the start of the batch extraction
@@ -3633,12 +3734,27 @@ def extract_comprehensive_batch(
                 }
             }
 
+    schedule_report = None
     try:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for path, metadata in executor.map(_process, filepaths):
-                results[path] = metadata
-                if "error" in metadata:
-                    errors += 1
+        if schedule and BATCH_SCHEDULER_AVAILABLE:
+            scheduler = BatchScheduler(get_cost_model(), max_workers=max_workers)
+            processed, schedule_report = scheduler.run(
+                filepaths,
+                _process,
+                tier,
+                succeeded=lambda item: "error" not in item[1],
+                module_times=lambda item: _module_times_seconds(item[1]),
+            )
+            # Keep what this batch taught the model for the next CLI run
+            save_cost_model()
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                processed = list(executor.map(_process, filepaths))
+
+        for path, metadata in processed:
+            results[path] = metadata
+            if "error" in metadata:
+                errors += 1
 
         duration_ms = int((time.time() - start_time) * 1000)
         batch_payload = {
@@ -3651,6 +3767,8 @@ def extract_comprehensive_batch(
                 "tier": tier,
             },
         }
+        if schedule_report is not None:
+            batch_payload["schedule"] = schedule_report
 
         # If every file failed, promote to a batch-level error (contract: top-level "error").
         if len(filepaths) > 0 and errors == len(filepaths):
@@ -4017,6 +4135,15 @@ def main():
     parser.add_argument("--ocr", action="store_true", help="Run burned metadata OCR")
     parser.add_argument("--max-dim", type=int, default=2048, help="Resize cap for OCR/hash compute paths")
     parser.add_argument("--quiet", "-q", action="store_true", help="JSON only output")
+    # No server/routes handler passes --progressive yet. The upload routes
+    # buffer the whole request with multer before spawning the engine, so
+    # a route has to stream the body to disk itself and spawn with
+    # --progressive --expected-size <Content-Length> to use it.
+    parser.add_argument("--progressive", action="store_true",
+                        help="Start on a file still being uploaded; header events go to stderr as NDJSON")
+    parser.add_argument("--expected-size", type=int, help="Final upload size for --progressive")
+    parser.add_argument("--upload-timeout", type=float, default=60.0,
+                        help="Seconds without upload progress before --progressive gives up")
     
     args = parser.parse_args()
 
@@ -4049,6 +4176,36 @@ def main():
             enable_ocr=args.ocr,
         )
         json_out = json.dumps(result, indent=2, default=str)
+    elif args.progressive:
+        import asyncio
+        try:
+            from .streaming_framework import ProgressiveExtractor
+        except ImportError:
+            from streaming_framework import ProgressiveExtractor
+
+        def emit_partial(event):
+            print(json.dumps(event, default=str), file=sys.stderr, flush=True)
+
+        try:
+            result = asyncio.run(ProgressiveExtractor().extract_progressive(
+                args.files[0],
+                expected_size=args.expected_size,
+                on_partial=emit_partial,
+                final_extractor=lambda path: extract_comprehensive_metadata(
+                    path, tier=args.tier, enable_ocr=args.ocr
+                ),
+                idle_timeout=args.upload_timeout,
+            ))
+        except asyncio.TimeoutError as e:
+            # Without --expected-size or a ".complete" marker the upload
+            # can only end by going idle for --upload-timeout seconds
+            result = {
+                "error": f"Upload did not complete: {e}",
+                "error_type": "TimeoutError",
+                "file": {"path": args.files[0]},
+                "suggested_action": "Pass --expected-size or create the .complete marker when the upload finishes",
+            }
+        json_out = json.dumps(result, indent=2, default=str)
     else:
         if not args.quiet:
             print(f"MetaExtract Comprehensive v4.0.0 - Extracting from: {args.files[0]}", file=sys.stderr)
@@ -13,6 +13,10 @@ from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
+try:
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
 from .analyzer import FileTypeAnalyzer, MetadataPatternAnalyzer, AnalysisResult
 from .profiles import CONTEXT_PROFILES, get_profile_for_context, ContextProfile
 
@@ -75,8 +79,9 @@ class ContextDetector:
     def __init__(self):
         self.file_type_analyzer = FileTypeAnalyzer()
         self.metadata_analyzer = MetadataPatternAnalyzer()
-        self._cache: Dict[str, ContextDetectionResult] = {}
         self._cache_ttl = 300  # 5 minutes
+        self._cache = BoundedCache("context_detections", max_entries=2048,
+                                   max_bytes=16 << 20, ttl_seconds=self._cache_ttl)
 
     def detect(
         self,
@@ -99,11 +104,9 @@ class ContextDetector:
 
         # Check cache
         cache_key = self._get_cache_key(file_path, metadata)
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            # Return cached result if still valid
-            if time.time() - cached.detection_time_ms < self._cache_ttl * 1000:
-                return cached
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Run analyzers
         results: List[AnalysisResult] = []
@@ -156,7 +159,7 @@ class ContextDetector:
         )
 
         # Cache result
-        self._cache[cache_key] = result
+        self._cache.put(cache_key, result)
 
         return result
 
@@ -26,6 +26,8 @@ import time
 import uuid
 from collections import defaultdict
 import hashlib
+import multiprocessing
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,7 @@ class DistributedTask:
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
+    content_hash: Optional[str] = None  # SHA-256 of the file; results are keyed by it
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for transmission."""
@@ -69,7 +72,8 @@ class DistributedTask:
             'file_path': self.file_path,
             'priority': self.priority,
             'retries': self.retries,
-            'max_retries': self.max_retries
+            'max_retries': self.max_retries,
+            'content_hash': self.content_hash
         }
 
 
@@ -196,16 +200,29 @@ class InMemoryQueue(MessageQueue):
 class DistributedCoordinator:
     """Coordinates distributed extraction across worker nodes."""
     
-    def __init__(self, num_workers: int = 4, queue: Optional[MessageQueue] = None):
+    def __init__(self, num_workers: int = 4, queue: Optional[MessageQueue] = None,
+                 task_store: Optional[Any] = None, lease_seconds: float = 30.0,
+                 max_worker_restarts: int = 8):
         """
         Initialize distributed coordinator.
         
         Args:
             num_workers: Number of worker nodes
             queue: Message queue implementation
+            task_store: Durable TaskStore (see distributed_queue); when set,
+                tasks run in num_workers local worker processes (plus any
+                workers on other hosts sharing the store)
+            lease_seconds: Task lease; tasks of a dead worker are re-delivered
+                after it expires
+            max_worker_restarts: Replacement processes started for workers
+                that die during a batch
         """
         self.num_workers = num_workers
         self.queue = queue or InMemoryQueue()
+        self.task_store = task_store
+        self.lease_seconds = lease_seconds
+        self.max_worker_restarts = max_worker_restarts
+        self._store_task_ids: List[str] = []
         self.workers: Dict[str, WorkerNode] = {}
         self.task_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self.results: Dict[str, DistributedResult] = {}
@@ -243,6 +260,11 @@ class DistributedCoordinator:
         with self.lock:
             self.metrics.total_tasks += 1
         
+        if self.task_store is not None:
+            self.task_store.enqueue(task)
+            self._store_task_ids.append(task.task_id)
+            return
+        
         # Use negative priority for max-heap behavior
         await self.task_queue.put((-task.priority, task.task_id, task))
     
@@ -266,6 +288,9 @@ class DistributedCoordinator:
         Returns:
             Tuple of (results, metrics)
         """
+        if self.task_store is not None:
+            return await self._process_with_store(extraction_fn)
+        
         self._running = True
         results = []
         
@@ -364,6 +389,111 @@ class DistributedCoordinator:
         
         return results, self.metrics
     
+    def _start_worker_process(self, ctx: Any, worker_id: str, stop_event: Any) -> Any:
+        try:
+            from .distributed_queue import run_worker
+        except ImportError:
+            from distributed_queue import run_worker
+        
+        process = ctx.Process(
+            target=run_worker,
+            args=(self.task_store, self._extraction_fn, worker_id, self.lease_seconds, stop_event),
+            name=worker_id,
+            daemon=True,
+        )
+        process.start()
+        self.register_worker(worker_id, socket.gethostname(), process.pid)
+        return process
+    
+    def _sync_worker_health(self, processes: Dict[str, Any]) -> None:
+        """Refresh WorkerNode state from store heartbeats and process liveness."""
+        heartbeats = self.task_store.worker_heartbeats()
+        with self.lock:
+            for worker_id, info in heartbeats.items():
+                worker = self.workers.get(worker_id)
+                if worker is None:
+                    # Worker on another host sharing the store
+                    worker = WorkerNode(worker_id=worker_id, hostname=info.get('hostname', ''),
+                                        port=info.get('pid') or 0)
+                    self.workers[worker_id] = worker
+                worker.last_heartbeat = info['last_heartbeat']
+                worker.tasks_completed = info.get('tasks_completed', 0)
+                worker.tasks_failed = info.get('tasks_failed', 0)
+            for worker_id, process in processes.items():
+                if not process.is_alive() and worker_id in self.workers:
+                    self.workers[worker_id].status = WorkerStatus.OFFLINE
+    
+    async def _process_with_store(self, extraction_fn: Callable) -> Tuple[List[DistributedResult], DistributedMetrics]:
+        """Run the enqueued tasks in worker processes through the durable store."""
+        self._running = True
+        self._extraction_fn = extraction_fn
+        task_ids = list(self._store_task_ids)
+        ctx = multiprocessing.get_context()
+        stop_event = ctx.Event()
+        processes: Dict[str, Any] = {}
+        restarts = 0
+        base_id = f"{socket.gethostname()}:{os.getpid()}"
+        
+        try:
+            for i in range(self.num_workers):
+                worker_id = f"{base_id}:w{i}"
+                processes[worker_id] = self._start_worker_process(ctx, worker_id, stop_event)
+            
+            while self._running:
+                states = self.task_store.task_states(task_ids)
+                if all(states.get(t) in ('done', 'dead') for t in task_ids):
+                    break
+                self._sync_worker_health(processes)
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    logger.warning(f"Worker {worker_id} exited with code {process.exitcode}")
+                    del processes[worker_id]
+                    if restarts < self.max_worker_restarts:
+                        restarts += 1
+                        replacement = f"{base_id}:w{self.num_workers + restarts - 1}"
+                        processes[replacement] = self._start_worker_process(ctx, replacement, stop_event)
+                if not processes:
+                    logger.error("All workers died and the restart budget is spent")
+                    break
+                await asyncio.sleep(0.1)
+        finally:
+            stop_event.set()
+            for process in processes.values():
+                process.join(timeout=self.lease_seconds)
+                if process.is_alive():
+                    process.terminate()
+            self._running = False
+        
+        self._sync_worker_health(processes)
+        committed = self.task_store.results_for(task_ids)
+        dead = {d['task_id']: d for d in self.task_store.dead_letters()}
+        results = []
+        with self.lock:
+            for task_id in task_ids:
+                if task_id in committed:
+                    result = committed[task_id]
+                    self.metrics.successful_tasks += 1
+                    stats = self.metrics.worker_stats.setdefault(
+                        result.worker_id, {'completed': 0, 'failed': 0, 'total_time': 0}
+                    )
+                    stats['completed'] += 1
+                    stats['total_time'] += result.processing_time
+                elif task_id in dead:
+                    result = DistributedResult(
+                        task_id=task_id, worker_id='', success=False, metadata={},
+                        error=dead[task_id]['last_error'],
+                    )
+                    self.metrics.failed_tasks += 1
+                else:
+                    continue
+                self.metrics.completed_tasks += 1
+                self.results[task_id] = result
+                results.append(result)
+            self._store_task_ids = [t for t in self._store_task_ids if t not in self.results]
+        
+        return results, self.metrics
+    
     def get_results(self) -> Dict[str, DistributedResult]:
         """Get all results."""
         with self.lock:
@@ -490,7 +620,8 @@ class AdaptiveScheduler:
 async def extract_distributed(
     file_paths: List[str],
     extraction_fn: Callable,
-    num_workers: int = 4
+    num_workers: int = 4,
+    task_store: Optional[Any] = None
 ) -> Tuple[List[DistributedResult], DistributedMetrics]:
     """
     Extract metadata from multiple files using distributed processing.
@@ -500,10 +631,10 @@ async def extract_distributed(
             files, extraction_function, num_workers=4
         )
     """
-    coordinator = DistributedCoordinator(num_workers=num_workers)
+    coordinator = DistributedCoordinator(num_workers=num_workers, task_store=task_store)
     
-    # Register workers
-    for i in range(num_workers):
+    # Register workers (process workers register themselves as they start)
+    for i in range(num_workers if task_store is None else 0):
         coordinator.register_worker(
             worker_id=f"worker_{i}",
             hostname="localhost",
@@ -0,0 +1,729 @@
+"""
+MetaExtract Durable Task Queue v1.0
+
+Worker protocol behind DistributedCoordinator:
+- Durable task store (SQLite locally, Redis Streams across hosts)
+- Lease-based task ownership renewed by worker heartbeats
+- Automatic re-delivery of tasks whose lease expired (dead or stuck worker)
+- Bounded retries with a dead-letter queue
+- Idempotent result commits keyed by file content hash, so re-delivered or
+  duplicate files are extracted and stored once
+
+Workers run as local processes started by the coordinator, or on other hosts:
+
+    python -m server.extractor.distributed_queue \\
+        --store redis://queue-host:6379/0 --extractor server.extractor.comprehensive_metadata_engine:extract_comprehensive_metadata
+
+Usage:
+    store = SQLiteTaskStore("/var/lib/metaextract/tasks.db")
+    coordinator = DistributedCoordinator(num_workers=4, task_store=store)
+    await coordinator.add_tasks_batch(paths)
+    results, metrics = await coordinator.process_tasks(extract_fn)
+
+Author: MetaExtract Team
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .distributed_processing import DistributedResult, DistributedTask
+except ImportError:
+    from distributed_processing import DistributedResult, DistributedTask
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 30.0
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Task states; "done" and "dead" are terminal
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+TERMINAL_STATES = (DONE, DEAD)
+
+
+def content_hash(file_path: str) -> str:
+    """SHA-256 of a file's content, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class Lease:
+    """A task handed to one worker until lease_expires."""
+    task: DistributedTask
+    worker_id: str
+    token: str
+    lease_expires: float
+    attempt: int
+
+
+class TaskStore(ABC):
+    """Durable queue shared by the coordinator and its workers."""
+
+    @abstractmethod
+    def enqueue(self, task: DistributedTask) -> None:
+        """Add a task (re-enqueueing a known task_id is a no-op)."""
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Lease]:
+        """Take the next ready task, reclaiming expired leases first."""
+
+    @abstractmethod
+    def heartbeat(self, lease: Lease, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """Extend a lease; False when the task was reclaimed from this worker."""
+
+    @abstractmethod
+    def lookup_result(self, file_hash: str) -> Optional[DistributedResult]:
+        """Committed result for a content hash, if any."""
+
+    @abstractmethod
+    def complete(self, lease: Lease, file_hash: str, result: DistributedResult) -> bool:
+        """
+        Commit a result and finish the task. Returns False when a result for
+        the content hash was already committed (the stored one is kept).
+        """
+
+    @abstractmethod
+    def fail(self, lease: Lease, error: str) -> str:
+        """Record a failed attempt; returns the task's new state."""
+
+    @abstractmethod
+    def task_states(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """Current state of each task."""
+
+    @abstractmethod
+    def results_for(self, task_ids: Iterable[str]) -> Dict[str, DistributedResult]:
+        """Committed results of finished tasks, keyed by task_id."""
+
+    @abstractmethod
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """Tasks that exhausted their retries."""
+
+    @abstractmethod
+    def record_worker(self, worker_id: str, completed: int = 0, failed: int = 0) -> None:
+        """Worker liveness heartbeat and counters."""
+
+    @abstractmethod
+    def worker_heartbeats(self) -> Dict[str, Dict[str, Any]]:
+        """Last heartbeat and counters of every worker seen."""
+
+
+def _result_from_json(task_id: str, raw: str) -> DistributedResult:
+    data = json.loads(raw)
+    data['task_id'] = task_id
+    return DistributedResult(**data)
+
+
+def _result_to_json(result: DistributedResult) -> str:
+    data = result.to_dict()
+    data.pop('task_id')
+    return json.dumps(data, default=str)
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task store in a SQLite database (WAL mode). Safe across processes on one
+    host; leases are taken inside BEGIN IMMEDIATE transactions.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id TEXT PRIMARY KEY,
+            file_path TEXT NOT NULL,
+            priority INTEGER NOT NULL DEFAULT 0,
+            state TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_retries INTEGER NOT NULL DEFAULT 3,
+            worker_id TEXT,
+            lease_token TEXT,
+            lease_expires REAL,
+            content_hash TEXT,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(state, priority DESC, created_at);
+        CREATE TABLE IF NOT EXISTS results (
+            content_hash TEXT PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            result TEXT NOT NULL,
+            committed_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS dead_letters (
+            task_id TEXT PRIMARY KEY,
+            file_path TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            last_error TEXT,
+            died_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS workers (
+            worker_id TEXT PRIMARY KEY,
+            hostname TEXT,
+            pid INTEGER,
+            last_heartbeat REAL NOT NULL,
+            tasks_completed INTEGER NOT NULL DEFAULT 0,
+            tasks_failed INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 30.0):
+        self.db_path = str(db_path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._conn().executescript(self.SCHEMA)
+
+    def __getstate__(self):
+        # Connections stay per process; workers reopen the database by path
+        return {'db_path': self.db_path, 'busy_timeout': self.busy_timeout}
+
+    def __setstate__(self, state):
+        self.db_path = state['db_path']
+        self.busy_timeout = state['busy_timeout']
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    class _Transaction:
+        def __init__(self, conn: sqlite3.Connection):
+            self.conn = conn
+
+        def __enter__(self) -> sqlite3.Connection:
+            self.conn.execute("BEGIN IMMEDIATE")
+            return self.conn
+
+        def __exit__(self, exc_type, exc, tb):
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+            return False
+
+    def _transaction(self) -> "_Transaction":
+        return self._Transaction(self._conn())
+
+    def enqueue(self, task: DistributedTask) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO tasks (task_id, file_path, priority, attempts, max_retries, "
+                "content_hash, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (task.task_id, task.file_path, task.priority, task.retries, task.max_retries,
+                 task.content_hash, task.created_at, now),
+            )
+
+    def _dead_letter(self, conn: sqlite3.Connection, where: str, params: tuple, now: float) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO dead_letters (task_id, file_path, attempts, last_error, died_at) "
+            f"SELECT task_id, file_path, attempts, last_error, ? FROM tasks WHERE {where}",
+            (now,) + params,
+        )
+        conn.execute(
+            f"UPDATE tasks SET state = '{DEAD}', worker_id = NULL, lease_token = NULL, "
+            f"lease_expires = NULL, updated_at = ? WHERE {where}",
+            (now,) + params,
+        )
+
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float) -> None:
+        expired = f"state = '{LEASED}' AND lease_expires < ?"
+        conn.execute(
+            f"UPDATE tasks SET last_error = COALESCE(last_error, 'lease expired on ' || worker_id) "
+            f"WHERE {expired}",
+            (now,),
+        )
+        self._dead_letter(conn, expired + " AND attempts > max_retries", (now,), now)
+        conn.execute(
+            f"UPDATE tasks SET state = '{PENDING}', worker_id = NULL, lease_token = NULL, "
+            f"lease_expires = NULL, updated_at = ? WHERE {expired}",
+            (now, now),
+        )
+
+    def reclaim_expired(self) -> None:
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, time.time())
+
+    def lease(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Lease]:
+        now = time.time()
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, now)
+            row = conn.execute(
+                "SELECT task_id, file_path, priority, attempts, max_retries, content_hash, created_at "
+                f"FROM tasks WHERE state = '{PENDING}' ORDER BY priority DESC, created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            task_id, file_path, priority, attempts, max_retries, file_hash, created_at = row
+            token = uuid.uuid4().hex
+            expires = now + lease_seconds
+            conn.execute(
+                f"UPDATE tasks SET state = '{LEASED}', attempts = attempts + 1, worker_id = ?, "
+                "lease_token = ?, lease_expires = ?, updated_at = ? WHERE task_id = ?",
+                (worker_id, token, expires, now, task_id),
+            )
+        task = DistributedTask(
+            task_id=task_id, file_path=file_path, priority=priority, retries=attempts,
+            max_retries=max_retries, assigned_worker=worker_id, created_at=created_at,
+            started_at=now, content_hash=file_hash,
+        )
+        return Lease(task=task, worker_id=worker_id, token=token, lease_expires=expires, attempt=attempts + 1)
+
+    def heartbeat(self, lease: Lease, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        expires = time.time() + lease_seconds
+        with self._transaction() as conn:
+            updated = conn.execute(
+                f"UPDATE tasks SET lease_expires = ? WHERE task_id = ? AND lease_token = ? AND state = '{LEASED}'",
+                (expires, lease.task.task_id, lease.token),
+            ).rowcount
+        if updated:
+            lease.lease_expires = expires
+        return bool(updated)
+
+    def lookup_result(self, file_hash: str) -> Optional[DistributedResult]:
+        row = self._conn().execute(
+            "SELECT task_id, result FROM results WHERE content_hash = ?", (file_hash,)
+        ).fetchone()
+        return _result_from_json(row[0], row[1]) if row else None
+
+    def complete(self, lease: Lease, file_hash: str, result: DistributedResult) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO results (content_hash, task_id, result, committed_at) VALUES (?, ?, ?, ?)",
+                (file_hash, lease.task.task_id, _result_to_json(result), now),
+            ).rowcount
+            # A stale worker finishing after its lease expired still completes
+            # the task: the result is valid and re-delivery would redo the work
+            conn.execute(
+                f"UPDATE tasks SET state = '{DONE}', content_hash = ?, worker_id = ?, lease_token = NULL, "
+                f"lease_expires = NULL, updated_at = ? WHERE task_id = ? AND state != '{DONE}'",
+                (file_hash, lease.worker_id, now, lease.task.task_id),
+            )
+            conn.execute("DELETE FROM dead_letters WHERE task_id = ?", (lease.task.task_id,))
+        return bool(inserted)
+
+    def fail(self, lease: Lease, error: str) -> str:
+        now = time.time()
+        owned = "task_id = ? AND lease_token = ?"
+        params = (lease.task.task_id, lease.token)
+        with self._transaction() as conn:
+            conn.execute(f"UPDATE tasks SET last_error = ? WHERE {owned}", (error,) + params)
+            self._dead_letter(conn, owned + " AND attempts > max_retries", params, now)
+            conn.execute(
+                f"UPDATE tasks SET state = '{PENDING}', worker_id = NULL, lease_token = NULL, "
+                f"lease_expires = NULL, updated_at = ? WHERE {owned}",
+                (now,) + params,
+            )
+            row = conn.execute("SELECT state FROM tasks WHERE task_id = ?", (lease.task.task_id,)).fetchone()
+        return row[0] if row else DEAD
+
+    def task_states(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        states: Dict[str, str] = {}
+        ids = list(task_ids)
+        conn = self._conn()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = conn.execute(
+                f"SELECT task_id, state FROM tasks WHERE task_id IN ({','.join('?' * len(chunk))})", chunk
+            )
+            states.update(rows)
+        return states
+
+    def results_for(self, task_ids: Iterable[str]) -> Dict[str, DistributedResult]:
+        results: Dict[str, DistributedResult] = {}
+        ids = list(task_ids)
+        conn = self._conn()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = conn.execute(
+                "SELECT t.task_id, r.result FROM tasks t JOIN results r ON r.content_hash = t.content_hash "
+                f"WHERE t.state = '{DONE}' AND t.task_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for task_id, raw in rows:
+                results[task_id] = _result_from_json(task_id, raw)
+        return results
+
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT task_id, file_path, attempts, last_error, died_at FROM dead_letters ORDER BY died_at"
+        )
+        return [
+            {'task_id': r[0], 'file_path': r[1], 'attempts': r[2], 'last_error': r[3], 'died_at': r[4]}
+            for r in rows
+        ]
+
+    def record_worker(self, worker_id: str, completed: int = 0, failed: int = 0) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO workers (worker_id, hostname, pid, last_heartbeat, tasks_completed, tasks_failed) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(worker_id) DO UPDATE SET "
+                "last_heartbeat = excluded.last_heartbeat, "
+                "tasks_completed = tasks_completed + excluded.tasks_completed, "
+                "tasks_failed = tasks_failed + excluded.tasks_failed",
+                (worker_id, socket.gethostname(), os.getpid(), time.time(), completed, failed),
+            )
+
+    def worker_heartbeats(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT worker_id, hostname, pid, last_heartbeat, tasks_completed, tasks_failed FROM workers"
+        )
+        return {
+            r[0]: {'hostname': r[1], 'pid': r[2], 'last_heartbeat': r[3],
+                   'tasks_completed': r[4], 'tasks_failed': r[5]}
+            for r in rows
+        }
+
+
+class RedisStreamsTaskStore(TaskStore):
+    """
+    Task store on a Redis stream with a consumer group, for workers spread
+    across hosts. Pending-entry idle time is the lease: XAUTOCLAIM re-delivers
+    entries idle longer than the lease and heartbeats reset it with XCLAIM.
+    Streams are FIFO, so task priority is not honoured.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "metaextract:dq"):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package is required for RedisStreamsTaskStore")
+        self.url = url
+        self.prefix = prefix
+        self.stream = f"{prefix}:tasks"
+        self.group = f"{prefix}:workers"
+        self.dead_stream = f"{prefix}:dead"
+        self.results_key = f"{prefix}:results"
+        self.workers_key = f"{prefix}:heartbeats"
+        self._client = None
+        try:
+            self._redis().xgroup_create(self.stream, self.group, id='0', mkstream=True)
+        except redis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    def __getstate__(self):
+        return {'url': self.url, 'prefix': self.prefix}
+
+    def __setstate__(self, state):
+        self.__init__(state['url'], state['prefix'])
+
+    def _redis(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.prefix}:task:{task_id}"
+
+    def enqueue(self, task: DistributedTask) -> None:
+        r = self._redis()
+        key = self._task_key(task.task_id)
+        if not r.hsetnx(key, 'file_path', task.file_path):
+            return
+        r.hset(key, mapping={
+            'state': PENDING, 'attempts': task.retries, 'max_retries': task.max_retries,
+            'priority': task.priority, 'created_at': task.created_at,
+            'content_hash': task.content_hash or '',
+        })
+        r.hset(key, 'message_id', r.xadd(self.stream, {'task_id': task.task_id}))
+
+    def _take(self, worker_id: str, lease_seconds: float):
+        r = self._redis()
+        idle_ms = int(lease_seconds * 1000)
+        claimed = r.xautoclaim(self.stream, self.group, worker_id, idle_ms, start_id='0-0', count=1)
+        messages = claimed[1] if claimed else []
+        if messages:
+            return messages[0]
+        fresh = r.xreadgroup(self.group, worker_id, {self.stream: '>'}, count=1)
+        if fresh and fresh[0][1]:
+            return fresh[0][1][0]
+        return None
+
+    def lease(self, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Lease]:
+        r = self._redis()
+        while True:
+            message = self._take(worker_id, lease_seconds)
+            if message is None:
+                return None
+            message_id, fields = message
+            task_id = fields['task_id']
+            key = self._task_key(task_id)
+            info = r.hgetall(key)
+            if not info or info.get('state') in TERMINAL_STATES:
+                r.xack(self.stream, self.group, message_id)
+                continue
+            attempts = r.hincrby(key, 'attempts', 1)
+            if attempts > int(info.get('max_retries', 3)) + 1:
+                self._dead_letter(task_id, info, message_id, info.get('last_error') or 'lease expired')
+                continue
+            now = time.time()
+            r.hset(key, mapping={'state': LEASED, 'worker_id': worker_id, 'message_id': message_id})
+            task = DistributedTask(
+                task_id=task_id, file_path=info['file_path'], priority=int(info.get('priority', 0)),
+                retries=attempts - 1, max_retries=int(info.get('max_retries', 3)),
+                assigned_worker=worker_id, created_at=float(info.get('created_at', now)),
+                started_at=now, content_hash=info.get('content_hash') or None,
+            )
+            return Lease(task=task, worker_id=worker_id, token=message_id,
+                         lease_expires=now + lease_seconds, attempt=attempts)
+
+    def _dead_letter(self, task_id: str, info: Dict[str, str], message_id: str, error: str) -> None:
+        r = self._redis()
+        pipe = r.pipeline()
+        pipe.hset(self._task_key(task_id), mapping={'state': DEAD, 'last_error': error})
+        pipe.xadd(self.dead_stream, {
+            'task_id': task_id, 'file_path': info.get('file_path', ''),
+            'attempts': info.get('attempts', 0), 'last_error': error, 'died_at': time.time(),
+        })
+        pipe.xack(self.stream, self.group, message_id)
+        pipe.execute()
+
+    def _owns(self, lease: Lease) -> bool:
+        pending = self._redis().xpending_range(
+            self.stream, self.group, min=lease.token, max=lease.token, count=1
+        )
+        return bool(pending) and pending[0]['consumer'] == lease.worker_id
+
+    def heartbeat(self, lease: Lease, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        if not self._owns(lease):
+            return False
+        self._redis().xclaim(self.stream, self.group, lease.worker_id, 0, [lease.token], justid=True)
+        lease.lease_expires = time.time() + lease_seconds
+        return True
+
+    def lookup_result(self, file_hash: str) -> Optional[DistributedResult]:
+        raw = self._redis().hget(self.results_key, file_hash)
+        if raw is None:
+            return None
+        return _result_from_json(json.loads(raw)['task_id'], raw)
+
+    def complete(self, lease: Lease, file_hash: str, result: DistributedResult) -> bool:
+        r = self._redis()
+        payload = json.loads(_result_to_json(result))
+        payload['task_id'] = lease.task.task_id
+        inserted = r.hsetnx(self.results_key, file_hash, json.dumps(payload))
+        pipe = r.pipeline()
+        pipe.hset(self._task_key(lease.task.task_id), mapping={
+            'state': DONE, 'content_hash': file_hash, 'worker_id': lease.worker_id,
+        })
+        pipe.xack(self.stream, self.group, lease.token)
+        pipe.execute()
+        return bool(inserted)
+
+    def fail(self, lease: Lease, error: str) -> str:
+        r = self._redis()
+        if not self._owns(lease):
+            return r.hget(self._task_key(lease.task.task_id), 'state') or DEAD
+        key = self._task_key(lease.task.task_id)
+        info = r.hgetall(key)
+        if int(info.get('attempts', 0)) > int(info.get('max_retries', 3)):
+            self._dead_letter(lease.task.task_id, info, lease.token, error)
+            return DEAD
+        # Re-add rather than leave pending so the retry is not held back a full lease
+        pipe = r.pipeline()
+        pipe.xack(self.stream, self.group, lease.token)
+        pipe.xadd(self.stream, {'task_id': lease.task.task_id})
+        _ack, message_id = pipe.execute()
+        r.hset(key, mapping={'state': PENDING, 'last_error': error, 'message_id': message_id})
+        return PENDING
+
+    def task_states(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        ids = list(task_ids)
+        pipe = self._redis().pipeline()
+        for task_id in ids:
+            pipe.hget(self._task_key(task_id), 'state')
+        return {task_id: state for task_id, state in zip(ids, pipe.execute()) if state}
+
+    def results_for(self, task_ids: Iterable[str]) -> Dict[str, DistributedResult]:
+        r = self._redis()
+        ids = list(task_ids)
+        pipe = r.pipeline()
+        for task_id in ids:
+            pipe.hmget(self._task_key(task_id), 'state', 'content_hash')
+        results: Dict[str, DistributedResult] = {}
+        for task_id, (state, file_hash) in zip(ids, pipe.execute()):
+            if state == DONE and file_hash:
+                raw = r.hget(self.results_key, file_hash)
+                if raw is not None:
+                    results[task_id] = _result_from_json(task_id, raw)
+        return results
+
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        letters = []
+        for _message_id, fields in self._redis().xrange(self.dead_stream):
+            letters.append({
+                'task_id': fields['task_id'], 'file_path': fields['file_path'],
+                'attempts': int(fields['attempts']), 'last_error': fields['last_error'],
+                'died_at': float(fields['died_at']),
+            })
+        return letters
+
+    def record_worker(self, worker_id: str, completed: int = 0, failed: int = 0) -> None:
+        r = self._redis()
+        raw = r.hget(self.workers_key, worker_id)
+        info = json.loads(raw) if raw else {'tasks_completed': 0, 'tasks_failed': 0}
+        info.update(hostname=socket.gethostname(), pid=os.getpid(), last_heartbeat=time.time())
+        info['tasks_completed'] += completed
+        info['tasks_failed'] += failed
+        r.hset(self.workers_key, worker_id, json.dumps(info))
+
+    def worker_heartbeats(self) -> Dict[str, Dict[str, Any]]:
+        return {k: json.loads(v) for k, v in self._redis().hgetall(self.workers_key).items()}
+
+
+def open_task_store(url: str) -> TaskStore:
+    """Open a store from sqlite:///path/to/db or redis://host:port/db."""
+    if url.startswith('sqlite:///'):
+        return SQLiteTaskStore(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisStreamsTaskStore(url)
+    raise ValueError(f"Unsupported task store URL: {url}")
+
+
+class TaskWorker:
+    """
+    Pulls leased tasks from a TaskStore and commits their results.
+
+    A background thread renews the lease every lease_seconds / 3 while the
+    extraction runs, so only workers that died or hung lose their tasks.
+    """
+
+    def __init__(self, store: TaskStore, extraction_fn: Callable[[str], Dict[str, Any]],
+                 worker_id: Optional[str] = None,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 poll_interval: float = 0.2):
+        self.store = store
+        self.extraction_fn = extraction_fn
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.tasks_completed = 0
+        self.tasks_failed = 0
+
+    def _keep_alive(self, lease: Lease, done: threading.Event) -> None:
+        while not done.wait(self.lease_seconds / 3):
+            try:
+                if not self.store.heartbeat(lease, self.lease_seconds):
+                    logger.warning(f"Worker {self.worker_id} lost lease on {lease.task.task_id}")
+                    return
+                self.store.record_worker(self.worker_id)
+            except Exception as e:
+                logger.error(f"Heartbeat failed for {lease.task.task_id}: {e}")
+
+    def process(self, lease: Lease) -> bool:
+        """Run one leased task; returns True when its result was committed."""
+        task = lease.task
+        done = threading.Event()
+        keeper = threading.Thread(target=self._keep_alive, args=(lease, done), daemon=True)
+        keeper.start()
+        try:
+            file_hash = task.content_hash or content_hash(task.file_path)
+            existing = self.store.lookup_result(file_hash)
+            if existing is not None:
+                # Same content already extracted (duplicate file or re-delivery)
+                self.store.complete(lease, file_hash, existing)
+                self.tasks_completed += 1
+                return True
+            start = time.time()
+            metadata = self.extraction_fn(task.file_path)
+            result = DistributedResult(
+                task_id=task.task_id,
+                worker_id=self.worker_id,
+                success=True,
+                metadata=metadata if isinstance(metadata, dict) else {'result': metadata},
+                processing_time=time.time() - start,
+            )
+            self.store.complete(lease, file_hash, result)
+            self.tasks_completed += 1
+            logger.info(f"Task {task.task_id} completed on worker {self.worker_id}")
+            return True
+        except Exception as e:
+            state = self.store.fail(lease, f"{type(e).__name__}: {e}")
+            self.tasks_failed += 1
+            logger.error(f"Task {task.task_id} failed on {self.worker_id} (attempt {lease.attempt}, now {state}): {e}")
+            return False
+        finally:
+            done.set()
+            keeper.join()
+
+    def run(self, stop_event: Any = None, idle_exit_seconds: Optional[float] = None) -> None:
+        """Process tasks until stop_event is set or the queue stays empty for idle_exit_seconds."""
+        idle_since = time.monotonic()
+        last_beat = 0.0
+        while stop_event is None or not stop_event.is_set():
+            now = time.monotonic()
+            if now - last_beat >= self.lease_seconds / 3:
+                self.store.record_worker(self.worker_id)
+                last_beat = now
+            lease = self.store.lease(self.worker_id, self.lease_seconds)
+            if lease is None:
+                if idle_exit_seconds is not None and now - idle_since > idle_exit_seconds:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            completed, failed = self.tasks_completed, self.tasks_failed
+            self.process(lease)
+            self.store.record_worker(
+                self.worker_id, self.tasks_completed - completed, self.tasks_failed - failed
+            )
+            idle_since = last_beat = time.monotonic()
+
+
+def run_worker(store: TaskStore, extraction_fn: Callable[[str], Dict[str, Any]], worker_id: str,
+               lease_seconds: float = DEFAULT_LEASE_SECONDS, stop_event: Any = None,
+               idle_exit_seconds: Optional[float] = None) -> None:
+    """Worker process entry point."""
+    TaskWorker(store, extraction_fn, worker_id, lease_seconds).run(stop_event, idle_exit_seconds)
+
+
+def load_extractor(spec: str) -> Callable[[str], Dict[str, Any]]:
+    """Resolve "package.module:function"."""
+    module_name, _, attr = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attr or 'extract')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MetaExtract distributed extraction worker")
+    parser.add_argument("--store", required=True, help="sqlite:///path or redis://host:port/db")
+    parser.add_argument("--extractor", required=True, help="Extraction function as module:function")
+    parser.add_argument("--worker-id", help="Defaults to hostname:pid")
+    parser.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS)
+    parser.add_argument("--idle-exit", type=float, help="Exit after this many idle seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    worker = TaskWorker(open_task_store(args.store), load_extractor(args.extractor),
+                        args.worker_id, args.lease_seconds)
+    worker.run(idle_exit_seconds=args.idle_exit)
+
+
+if __name__ == "__main__":
+    main()
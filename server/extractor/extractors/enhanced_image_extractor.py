@@ -29,6 +29,11 @@ from typing import Any, Dict, Optional, List
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+try:
+    from ..utils.date_parsing import parse_timestamp
+except ImportError:
+    from utils.date_parsing import parse_timestamp  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 EXIFTOOL_PATH = "/opt/homebrew/bin/exiftool"
@@ -480,11 +485,8 @@ class EnhancedImageExtractor:
         if not dt:
             return None
         
-        try:
-            dt_obj = datetime.strptime(str(dt), "%Y:%m:%d %H:%M:%S")
-            return dt_obj.isoformat() + "Z"
-        except ValueError:
-            return None
+        dt_obj = parse_timestamp(dt, "exif.DateTimeOriginal", tz="wall")
+        return dt_obj.isoformat() + "Z" if dt_obj else None
     
     def _normalize_rationals(self, data: Dict) -> Dict[str, float]:
         """Normalize rational numbers."""
@@ -1,16 +1,324 @@
 from __future__ import annotations
 
-from typing import Any
+import os
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+
+BLOCK_SIZE = 2880
+CARD_SIZE = 80
+
+# BITPIX -> big-endian NumPy dtype
+_BITPIX_DTYPES = {8: "u1", 16: ">i2", 32: ">i4", 64: ">i8", -32: ">f4", -64: ">f8"}
+_BITPIX_NAMES = {
+    8: "unsigned byte",
+    16: "signed short",
+    32: "signed int",
+    64: "signed long",
+    -32: "single float",
+    -64: "double float",
+}
+_COMMENTARY = ("COMMENT", "HISTORY", "")
+
+
+@dataclass(frozen=True)
+class FitsHdu:
+    """One header-data unit, located without reading its data."""
+
+    index: int
+    kind: str
+    name: str
+    header_offset: int
+    header_size: int
+    data_offset: int
+    data_size: int
+    bitpix: int
+    dimensions: tuple[int, ...]
+    pcount: int
+    gcount: int
+    header: dict[str, Any]
+    history_cards: int = 0
+    comment_cards: int = 0
+    truncated: bool = False
+
+    @property
+    def padded_data_size(self) -> int:
+        return -(-self.data_size // BLOCK_SIZE) * BLOCK_SIZE
+
+    @property
+    def compressed(self) -> bool:
+        """Tile-compressed image stored as a binary table (ZIMAGE = T)."""
+        return self.kind == "BINTABLE" and self.header.get("ZIMAGE") is True
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Array shape in NumPy (C) order, as astropy's hdu.data.shape reports it."""
+        if self.compressed:
+            naxis = int(self.header.get("ZNAXIS", 0) or 0)
+            return tuple(int(self.header.get(f"ZNAXIS{i}", 0) or 0) for i in range(naxis, 0, -1))
+        if self.kind in ("BINTABLE", "TABLE", "A3DTABLE"):
+            return (self.dimensions[1],) if len(self.dimensions) > 1 else ()
+        return tuple(reversed(self.dimensions))
+
+    def describe(self) -> dict[str, Any]:
+        info: dict[str, Any] = {
+            "index": self.index,
+            "name": self.name,
+            "type": self.kind,
+            "bitpix": self.bitpix,
+            "data_type": _BITPIX_NAMES.get(self.bitpix, "unknown"),
+            "dimensions": list(self.dimensions),
+            "data_shape": list(self.shape),
+            "header_offset": self.header_offset,
+            "data_offset": self.data_offset,
+            "data_bytes": self.data_size,
+            "header_cards": len(self.header),
+        }
+        if self.pcount:
+            info["pcount"] = self.pcount
+        if self.gcount != 1:
+            info["gcount"] = self.gcount
+        tfields = self.header.get("TFIELDS")
+        if isinstance(tfields, int):
+            info["num_columns"] = tfields
+            info["columns"] = [
+                self.header.get(f"TTYPE{i}") for i in range(1, min(tfields, 999) + 1)
+            ]
+        if self.compressed:
+            info["compressed_image"] = True
+            info["uncompressed_dimensions"] = [
+                self.header.get(f"ZNAXIS{i}") for i in range(1, int(self.header.get("ZNAXIS", 0) or 0) + 1)
+            ]
+        if self.truncated:
+            info["truncated"] = True
+        return info
+
+
+def _parse_value(text: str) -> Any:
+    """Parse the value field of a card (the text after '= ')."""
+    text = text.strip()
+    if not text:
+        return None
+    if text.startswith("'"):
+        out = []
+        i = 1
+        while i < len(text):
+            ch = text[i]
+            if ch == "'":
+                if i + 1 < len(text) and text[i + 1] == "'":
+                    out.append("'")
+                    i += 2
+                    continue
+                break
+            out.append(ch)
+            i += 1
+        return "".join(out).rstrip()
+
+    raw = text.split("/", 1)[0].strip()
+    if raw == "T":
+        return True
+    if raw == "F":
+        return False
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        pass
+    try:
+        return float(raw.replace("D", "E").replace("d", "e"))
+    except ValueError:
+        return raw
+
+
+def _parse_cards(header_bytes: bytes) -> tuple[dict[str, Any], int, int]:
+    """Parse cards up to END; returns (keyword -> value, HISTORY count, COMMENT count)."""
+    header: dict[str, Any] = {}
+    history = comments = 0
+    last_string_key: str | None = None
+    for i in range(0, len(header_bytes) - CARD_SIZE + 1, CARD_SIZE):
+        card = header_bytes[i : i + CARD_SIZE].decode("ascii", errors="replace")
+        keyword = card[:8].rstrip()
+        if keyword == "END":
+            break
+        if keyword in _COMMENTARY:
+            history += keyword == "HISTORY"
+            comments += keyword == "COMMENT"
+            continue
+        if keyword == "CONTINUE" and last_string_key is not None:
+            value = _parse_value(card[8:])
+            previous = header[last_string_key]
+            if isinstance(value, str) and isinstance(previous, str) and previous.endswith("&"):
+                header[last_string_key] = previous[:-1] + value
+                continue
+        if keyword == "HIERARCH" and "=" in card:
+            name, _, rest = card[9:].partition("=")
+            keyword, value = name.strip(), _parse_value(rest)
+        elif card[8:10] == "= ":
+            value = _parse_value(card[10:])
+        else:
+            continue
+        if keyword not in header:
+            header[keyword] = value
+            last_string_key = keyword if isinstance(value, str) else None
+    return header, history, comments
+
+
+def _read_header(f, max_blocks: int) -> tuple[bytes, bool]:
+    """Read 2880-byte blocks until one holds the END card; returns (bytes, found_end)."""
+    chunks: list[bytes] = []
+    for _ in range(max_blocks):
+        block = f.read(BLOCK_SIZE)
+        if len(block) < BLOCK_SIZE:
+            return b"".join(chunks), False
+        chunks.append(block)
+        for i in range(0, BLOCK_SIZE, CARD_SIZE):
+            if block[i : i + 8] == b"END     ":
+                return b"".join(chunks), True
+    return b"".join(chunks), False
+
+
+def _int(header: dict[str, Any], key: str, default: int = 0) -> int:
+    value = header.get(key, default)
+    return value if isinstance(value, int) and not isinstance(value, bool) else default
+
+
+def data_unit_size(header: dict[str, Any]) -> int:
+    """Unpadded data-unit size in bytes from BITPIX, NAXISn, PCOUNT and GCOUNT (FITS 4.0 §4.4.1)."""
+    naxis = _int(header, "NAXIS")
+    if naxis <= 0:
+        return 0
+    dims = [_int(header, f"NAXIS{i}") for i in range(1, naxis + 1)]
+    # Random groups: NAXIS1 = 0 marks the group parameter layout
+    if "XTENSION" not in header and header.get("GROUPS") is True and dims[0] == 0:
+        dims = dims[1:]
+    count = 1
+    for dim in dims:
+        count *= dim
+    if "XTENSION" not in header and not (header.get("GROUPS") is True):
+        return abs(_int(header, "BITPIX")) * count // 8
+    bits = abs(_int(header, "BITPIX")) * _int(header, "GCOUNT", 1) * (_int(header, "PCOUNT") + count)
+    return bits // 8
+
+
+def iter_fits_hdus(f, file_size: int, max_hdus: int = 1000, max_header_blocks: int = 1024) -> Iterator[FitsHdu]:
+    """Yield every HDU of an open FITS file, seeking past each data unit."""
+    offset = 0
+    for index in range(max_hdus):
+        if offset + BLOCK_SIZE > file_size:
+            return
+        f.seek(offset)
+        header_bytes, found_end = _read_header(f, max_header_blocks)
+        if not found_end:
+            return
+        header, history, comments = _parse_cards(header_bytes)
+        if index == 0 and header.get("SIMPLE") is None:
+            return
+        if index > 0 and "XTENSION" not in header:
+            return  # Trailing special records, not an extension
+
+        kind = "PRIMARY" if index == 0 else str(header["XTENSION"]).strip().upper()
+        naxis = _int(header, "NAXIS")
+        dims = tuple(_int(header, f"NAXIS{i}") for i in range(1, naxis + 1))
+        data_offset = offset + len(header_bytes)
+        data_size = data_unit_size(header)
+        truncated = data_offset + data_size > file_size
+        name = header.get("EXTNAME")
+        yield FitsHdu(
+            index=index,
+            kind=kind,
+            name=str(name).strip() if name else ("PRIMARY" if index == 0 else ""),
+            header_offset=offset,
+            header_size=len(header_bytes),
+            data_offset=data_offset,
+            data_size=data_size,
+            bitpix=_int(header, "BITPIX"),
+            dimensions=dims,
+            pcount=_int(header, "PCOUNT"),
+            gcount=_int(header, "GCOUNT", 1),
+            header=header,
+            history_cards=history,
+            comment_cards=comments,
+            truncated=truncated,
+        )
+        if truncated:
+            return
+        offset = data_offset + -(-data_size // BLOCK_SIZE) * BLOCK_SIZE
+
+
+def scan_fits_hdus(filepath: str, max_hdus: int = 1000, max_header_blocks: int = 1024) -> list[FitsHdu]:
+    """
+    Read every HDU header of a FITS file without touching any data unit.
+
+    Only the 2880-byte header blocks are read; each data-unit size is computed
+    from the header and skipped with a seek, so cost scales with the number of
+    header blocks rather than the file size.
+    """
+    with open(filepath, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        return list(iter_fits_hdus(f, file_size, max_hdus=max_hdus, max_header_blocks=max_header_blocks))
+
+
+def sample_fits_statistics(filepath: str, hdu: FitsHdu, max_samples: int = 100_000) -> dict[str, Any] | None:
+    """
+    Pixel statistics from a strided sample of an image data unit.
+
+    The data unit is memory-mapped and at most max_samples evenly spaced
+    pixels are read, so only the pages holding those pixels are touched.
+    BLANK, BSCALE and BZERO are applied; non-finite values are excluded.
+    """
+    dtype = _BITPIX_DTYPES.get(hdu.bitpix)
+    if dtype is None or hdu.kind not in ("PRIMARY", "IMAGE") or not hdu.data_size or hdu.truncated:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    count = hdu.data_size // (abs(hdu.bitpix) // 8)
+    data = np.memmap(filepath, dtype=dtype, mode="r", offset=hdu.data_offset, shape=(count,))
+    try:
+        stride = max(1, count // max_samples)
+        sample = np.array(data[::stride][:max_samples], dtype=np.float64)
+    finally:
+        del data
+
+    blank = hdu.header.get("BLANK")
+    if hdu.bitpix > 0 and isinstance(blank, int):
+        sample[sample == blank] = np.nan
+    bscale = hdu.header.get("BSCALE", 1.0)
+    bzero = hdu.header.get("BZERO", 0.0)
+    if isinstance(bscale, (int, float)) and isinstance(bzero, (int, float)):
+        sample = sample * float(bscale) + float(bzero)
+
+    finite = sample[np.isfinite(sample)]
+    stats: dict[str, Any] = {
+        "sampled_pixels": int(sample.size),
+        "total_pixels": int(count),
+        "stride": int(stride),
+        "invalid_fraction": float(1 - finite.size / sample.size) if sample.size else 0.0,
+    }
+    if finite.size:
+        stats.update(
+            {
+                "min": float(finite.min()),
+                "max": float(finite.max()),
+                "mean": float(finite.mean()),
+                "std": float(finite.std()),
+                "median": float(np.median(finite)),
+            }
+        )
+    return stats
 
 
 def extract_fits_container_metadata(filepath: str, max_blocks: int = 64) -> dict[str, Any] | None:
     """
-    Parse FITS header cards (80-byte records) from the primary header.
+    Parse FITS header cards (80-byte records) from every HDU.
 
     FITS headers are ASCII and padded to 2880-byte blocks. This parser:
-    - scans cards until END
+    - scans the primary header cards until END
     - extracts a small set of common keywords + dimensions
-    - does not attempt to parse extensions or binary tables
+    - walks extension headers, seeking past each data unit
     """
     try:
         with open(filepath, "rb") as f:
@@ -64,6 +372,11 @@ def extract_fits_container_metadata(filepath: str, max_blocks: int = 64) -> dict
         except Exception:
             dims = None
 
+        try:
+            hdus = scan_fits_hdus(filepath, max_header_blocks=max_blocks)
+        except Exception:
+            hdus = []
+
         return {
             "available": True,
             "format": "FITS",
@@ -77,7 +390,8 @@ def extract_fits_container_metadata(filepath: str, max_blocks: int = 64) -> dict
             "object": object_name,
             "telescope": telescope,
             "instrument": instrument,
+            "hdu_count": len(hdus),
+            "extensions": [hdu.describe() for hdu in hdus[1:]],
         }
     except Exception:
         return None
-
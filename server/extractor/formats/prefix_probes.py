@@ -0,0 +1,291 @@
+"""
+Header probes that work on a file prefix.
+
+Each probe takes the bytes received so far and either returns header-level
+metadata or raises NeedMoreData with the prefix length it needs. The caller
+(streaming_framework.ProgressiveExtractor) waits for that many bytes of a
+growing upload and retries, so JPEG EXIF/XMP, TIFF IFD0, front-loaded MP4
+moov boxes, DICOM file meta and PNG IHDR are reported before the upload
+finishes. Anything located past the prefix is listed under "deferred".
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+
+# Largest prefix a probe may ask for; a moov box beyond this is deferred
+MAX_PROBE_BYTES = 16 << 20
+
+_TIFF_ASCII_TAGS = {
+    0x010F: "make",
+    0x0110: "model",
+    0x0131: "software",
+    0x0132: "datetime",
+    0x013B: "artist",
+    0x8298: "copyright",
+}
+_TIFF_SHORT_TAGS = {0x0100: "width", 0x0101: "height", 0x0112: "orientation"}
+
+_DICOM_META = {
+    0x0002: "media_storage_sop_class_uid",
+    0x0003: "media_storage_sop_instance_uid",
+    0x0010: "transfer_syntax_uid",
+    0x0012: "implementation_class_uid",
+    0x0013: "implementation_version_name",
+    0x0016: "source_application_entity_title",
+}
+# Explicit VRs with a 2-byte reserved field and a 4-byte length
+_DICOM_LONG_VRS = {b"OB", b"OD", b"OF", b"OL", b"OW", b"SQ", b"UC", b"UN", b"UR", b"UT", b"OV", b"SV", b"UV"}
+
+_MP4_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)
+
+
+class NeedMoreData(Exception):
+    """Raised by a probe that needs the first `needed` bytes of the file."""
+
+    def __init__(self, needed: int):
+        super().__init__(needed)
+        self.needed = needed
+
+
+def _require(data: bytes, end: int) -> None:
+    if end > len(data):
+        raise NeedMoreData(end)
+
+
+def parse_tiff_ifd0(data: bytes, tiff_start: int = 0) -> dict[str, Any]:
+    """IFD0 ASCII/SHORT tags of a TIFF stream that starts at tiff_start."""
+    _require(data, tiff_start + 8)
+    order = data[tiff_start:tiff_start + 2]
+    if order not in (b"II", b"MM"):
+        return {}
+    endian = "<" if order == b"II" else ">"
+    ifd = tiff_start + struct.unpack(endian + "I", data[tiff_start + 4:tiff_start + 8])[0]
+    _require(data, ifd + 2)
+    count = struct.unpack(endian + "H", data[ifd:ifd + 2])[0]
+    _require(data, ifd + 2 + 12 * count)
+
+    fields: dict[str, Any] = {"byte_order": "little" if endian == "<" else "big"}
+    for i in range(min(count, 512)):
+        entry = data[ifd + 2 + 12 * i:ifd + 14 + 12 * i]
+        tag, typ, n = struct.unpack(endian + "HHI", entry[:8])
+        if tag in _TIFF_ASCII_TAGS and typ == 2:
+            if n <= 4:
+                raw = entry[8:8 + n]
+            else:
+                offset = tiff_start + struct.unpack(endian + "I", entry[8:12])[0]
+                _require(data, offset + n)
+                raw = data[offset:offset + n]
+            fields[_TIFF_ASCII_TAGS[tag]] = raw.split(b"\x00", 1)[0].decode("latin-1").strip()
+        elif tag in _TIFF_SHORT_TAGS and typ in (3, 4):
+            fmt = "H" if typ == 3 else "I"
+            fields[_TIFF_SHORT_TAGS[tag]] = struct.unpack(endian + fmt, entry[8:8 + struct.calcsize(fmt)])[0]
+        elif tag == 0x8769:
+            fields["exif_ifd_offset"] = struct.unpack(endian + "I", entry[8:12])[0]
+        elif tag == 0x8825:
+            fields["gps_ifd_offset"] = struct.unpack(endian + "I", entry[8:12])[0]
+    return fields
+
+
+def probe_jpeg(data: bytes) -> dict[str, Any]:
+    """APPn directory, EXIF IFD0, XMP and SOF dimensions up to the first scan."""
+    result: dict[str, Any] = {"format": "JPEG", "segments": []}
+    pos = 2
+    while True:
+        _require(data, pos + 4)
+        if data[pos] != 0xFF:
+            result["error"] = f"bad marker at {pos}"
+            return result
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        payload_start = pos + 4
+        payload_end = pos + 2 + length
+        if marker == 0xDA:
+            result["scan_offset"] = pos
+            break
+        _require(data, payload_end)
+        payload = data[payload_start:payload_end]
+        name = f"APP{marker - 0xE0}" if 0xE0 <= marker <= 0xEF else f"0x{marker:02X}"
+        result["segments"].append({"marker": name, "offset": pos, "length": length - 2})
+
+        if marker == 0xE1 and payload.startswith(b"Exif\x00\x00"):
+            result["exif"] = parse_tiff_ifd0(payload, 6)
+        elif marker == 0xE1 and payload.startswith(b"http://ns.adobe.com/xap/1.0/\x00"):
+            try:
+                from ..modules.xmp_packets import parse_xmp_packet
+            except ImportError:
+                from modules.xmp_packets import parse_xmp_packet
+            table = parse_xmp_packet(payload[29:], source="jpeg_app1")
+            result["xmp"] = {
+                key: value for key, value in (
+                    ("creator_tool", table.text("xmp:CreatorTool")),
+                    ("create_date", table.text("xmp:CreateDate")),
+                    ("title", table.text("dc:title")),
+                    ("creator", table.text("dc:creator")),
+                ) if value is not None
+            }
+        elif 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC) and len(payload) >= 6:
+            result["width"] = struct.unpack(">H", payload[3:5])[0]
+            result["height"] = struct.unpack(">H", payload[1:3])[0]
+            result["precision"] = payload[0]
+            result["components"] = payload[5]
+        pos = payload_end
+    return result
+
+
+def probe_tiff(data: bytes) -> dict[str, Any]:
+    """IFD0 of TIFF and TIFF-based RAW files (DNG, CR2, NEF, ARW, ...)."""
+    return {"format": "TIFF", "ifd0": parse_tiff_ifd0(data)}
+
+
+def probe_png(data: bytes) -> dict[str, Any]:
+    _require(data, 33)
+    width, height, depth, color = struct.unpack(">IIBB", data[16:26])
+    return {"format": "PNG", "width": width, "height": height, "bit_depth": depth, "color_type": color}
+
+
+def _parse_mvhd(payload: bytes) -> dict[str, Any]:
+    version = payload[0]
+    if version == 1:
+        created, modified, timescale, duration = struct.unpack(">QQIQ", payload[4:32])
+    else:
+        created, modified, timescale, duration = struct.unpack(">IIII", payload[4:20])
+    info: dict[str, Any] = {"timescale": timescale}
+    if timescale:
+        info["duration_seconds"] = round(duration / timescale, 3)
+    if created:
+        info["creation_time"] = (_MP4_EPOCH + timedelta(seconds=created)).isoformat()
+    return info
+
+
+def _walk_boxes(data: bytes, start: int, end: int):
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind.decode("latin-1"), pos + header, pos + size
+        pos += size
+
+
+def _summarize_moov(data: bytes, start: int, end: int) -> dict[str, Any]:
+    info: dict[str, Any] = {"tracks": []}
+    for kind, body, box_end in _walk_boxes(data, start, end):
+        if kind == "mvhd":
+            info.update(_parse_mvhd(data[body:box_end]))
+        elif kind == "trak":
+            track: dict[str, Any] = {}
+            for sub, sub_body, sub_end in _walk_boxes(data, body, box_end):
+                if sub == "mdia":
+                    for leaf, leaf_body, _leaf_end in _walk_boxes(data, sub_body, sub_end):
+                        if leaf == "hdlr":
+                            track["handler"] = data[leaf_body + 8:leaf_body + 12].decode("latin-1")
+                elif sub == "tkhd":
+                    version = data[sub_body]
+                    dims = sub_end - 8
+                    if dims >= sub_body:
+                        width, height = struct.unpack(">II", data[dims:dims + 8])
+                        if width or height:
+                            track["width"] = width >> 16
+                            track["height"] = height >> 16
+                    track["tkhd_version"] = version
+            info["tracks"].append(track)
+    return info
+
+
+def probe_isobmff(data: bytes) -> dict[str, Any]:
+    """Top-level boxes of MP4/MOV/HEIF; parses moov when it precedes mdat."""
+    result: dict[str, Any] = {"format": "ISOBMFF", "boxes": []}
+    pos = 0
+    while True:
+        _require(data, pos + 8)
+        size, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            _require(data, pos + 16)
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        name = kind.decode("latin-1")
+        if size == 0 or size < header:
+            result["boxes"].append({"type": name, "offset": pos, "size": size})
+            break
+        result["boxes"].append({"type": name, "offset": pos, "size": size})
+
+        if name == "ftyp":
+            _require(data, pos + size)
+            result["major_brand"] = data[pos + 8:pos + 12].decode("latin-1")
+        elif name == "moov":
+            if pos + size > MAX_PROBE_BYTES:
+                result["deferred"] = ["moov"]
+                break
+            _require(data, pos + size)
+            result["moov_at_front"] = True
+            result["movie"] = _summarize_moov(data, pos + header, pos + size)
+            break
+        elif name == "mdat":
+            # Media data first: the moov box is at the tail
+            result["moov_at_front"] = False
+            result["deferred"] = ["moov"]
+            break
+        pos += size
+    return result
+
+
+def probe_dicom(data: bytes) -> dict[str, Any]:
+    """DICOM Part 10 preamble and (0002,xxxx) file meta group."""
+    _require(data, 132 + 12)
+    result: dict[str, Any] = {"format": "DICOM"}
+    pos = 132
+    group_end = None
+    while group_end is None or pos < group_end:
+        _require(data, pos + 8)
+        group, element = struct.unpack("<HH", data[pos:pos + 4])
+        if group != 0x0002:
+            break
+        vr = data[pos + 4:pos + 6]
+        if vr in _DICOM_LONG_VRS:
+            _require(data, pos + 12)
+            length = struct.unpack("<I", data[pos + 8:pos + 12])[0]
+            value_start = pos + 12
+        else:
+            length = struct.unpack("<H", data[pos + 6:pos + 8])[0]
+            value_start = pos + 8
+        _require(data, value_start + length)
+        value = data[value_start:value_start + length]
+        if element == 0x0000 and length == 4:
+            group_end = value_start + 4 + struct.unpack("<I", value)[0]
+        elif element in _DICOM_META:
+            result[_DICOM_META[element]] = value.rstrip(b"\x00 ").decode("ascii", errors="replace")
+        pos = value_start + length
+    result["dataset_offset"] = pos
+    return result
+
+
+def select_probe(head: bytes) -> tuple[str, Callable[[bytes], dict[str, Any]]] | None:
+    """Probe for a file's first bytes (at least 132 for DICOM detection)."""
+    if head[:3] == b"\xff\xd8\xff":
+        return "jpeg", probe_jpeg
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png", probe_png
+    if head[:4] in (b"II*\x00", b"MM\x00*", b"IIRO", b"IIU\x00"):
+        return "tiff", probe_tiff
+    if head[4:8] in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip"):
+        return "isobmff", probe_isobmff
+    if head[128:132] == b"DICM":
+        return "dicom", probe_dicom
+    return None
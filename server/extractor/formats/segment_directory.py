@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+try:
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+CRC_UNCHECKED = 0
+CRC_OK = 1
+CRC_BAD = 2
+CRC_NONE = 3  # format has no per-segment CRC
+CRC_NAMES = ("unchecked", "ok", "bad", "none")
+
+# Bytes of payload read during the walk to label a segment
+# (PNG text keyword, JPEG APPn identifier, RIFF LIST type).
+_LABEL_PREFIX = 80
+
+# TIFF tags whose out-of-line values are recorded as their own segments
+TIFF_BLOB_TAGS = {
+    700: "XMP",
+    33723: "IPTC",
+    34377: "Photoshop",
+    34675: "ICC",
+    37500: "MakerNote",
+}
+TIFF_SUB_IFD_TAGS = {34665: "Exif", 34853: "GPS", 40965: "Interop", 330: "SubIFD"}
+_TIFF_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8,
+                    11: 4, 12: 8, 13: 4, 16: 8, 17: 8, 18: 8}
+
+MAX_SEGMENTS = 100_000
+MAX_CACHED_DIRECTORIES = 64
+MAX_CACHED_DIRECTORY_BYTES = 32 << 20
+
+
+@dataclass(frozen=True)
+class Segment:
+    index: int
+    kind: str
+    label: str
+    offset: int
+    data_offset: int
+    length: int
+    crc: str
+
+
+class SegmentDirectory:
+    """
+    Header-only map of a PNG/JPEG/RIFF/TIFF file's segments.
+
+    Each segment row records its type, an optional label, the offset of its
+    header and payload, the payload length and a CRC status. Payloads are
+    never read during the walk; read()/read_all() fetch only the byte ranges
+    a caller asks for.
+    """
+
+    def __init__(self, filepath: str, container: str, file_size: int, mtime_ns: int = 0):
+        self.filepath = filepath
+        self.container = container
+        self.file_size = file_size
+        self.mtime_ns = mtime_ns
+        self.form = ""  # RIFF form type or TIFF byte order
+        self.truncated = False
+
+        self._kinds = array("H")
+        self._labels = array("H")
+        self._offsets = array("q")
+        self._data_offsets = array("q")
+        self._lengths = array("q")
+        self._crc = array("b")
+        self._names: list[str] = [""]
+        self._name_ids: dict[str, int] = {"": 0}
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __iter__(self) -> Iterator[Segment]:
+        for i in range(len(self)):
+            yield self.segment(i)
+
+    def _intern(self, name: str) -> int:
+        code = self._name_ids.get(name)
+        if code is None:
+            code = self._name_ids[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def _add(self, kind: str, offset: int, data_offset: int, length: int,
+             label: str = "", crc: int = CRC_NONE) -> None:
+        self._kinds.append(self._intern(kind))
+        self._labels.append(self._intern(label))
+        self._offsets.append(offset)
+        self._data_offsets.append(data_offset)
+        self._lengths.append(length)
+        self._crc.append(crc)
+
+    def is_current(self) -> bool:
+        try:
+            st = os.stat(self.filepath)
+        except OSError:
+            return False
+        return st.st_size == self.file_size and st.st_mtime_ns == self.mtime_ns
+
+    # -- queries ----------------------------------------------------------
+
+    def segment(self, i: int) -> Segment:
+        return Segment(
+            index=i,
+            kind=self._names[self._kinds[i]],
+            label=self._names[self._labels[i]],
+            offset=self._offsets[i],
+            data_offset=self._data_offsets[i],
+            length=self._lengths[i],
+            crc=CRC_NAMES[self._crc[i]],
+        )
+
+    def find_all(self, kind: str, label: str | None = None,
+                 label_prefix: str | None = None) -> list[Segment]:
+        kind_id = self._name_ids.get(kind)
+        if kind_id is None:
+            return []
+        found = []
+        for i, k in enumerate(self._kinds):
+            if k != kind_id:
+                continue
+            seg_label = self._names[self._labels[i]]
+            if label is not None and seg_label != label:
+                continue
+            if label_prefix is not None and not seg_label.startswith(label_prefix):
+                continue
+            found.append(self.segment(i))
+        return found
+
+    def find(self, kind: str, label: str | None = None,
+             label_prefix: str | None = None) -> Segment | None:
+        found = self.find_all(kind, label=label, label_prefix=label_prefix)
+        return found[0] if found else None
+
+    def counts(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for k in self._kinds:
+            name = self._names[k]
+            totals[name] = totals.get(name, 0) + 1
+        return totals
+
+    def read(self, segment: Segment | int, max_bytes: int | None = None) -> bytes:
+        """Read one segment's payload (or its first max_bytes)."""
+        return self.read_all([segment], max_bytes=max_bytes)[0]
+
+    def read_all(self, segments: list, max_bytes: int | None = None) -> list[bytes]:
+        """Read several payloads with a single open."""
+        out = []
+        with open(self.filepath, "rb") as f:
+            for seg in segments:
+                if isinstance(seg, int):
+                    seg = self.segment(seg)
+                n = seg.length if max_bytes is None else min(seg.length, max_bytes)
+                f.seek(seg.data_offset)
+                out.append(f.read(n))
+        return out
+
+    def verify_crc(self, indices: list[int] | None = None, block_size: int = 1 << 20) -> dict[str, int]:
+        """Check PNG chunk CRCs in streamed blocks; returns status counts."""
+        if self.container != "PNG":
+            return {}
+        rows = range(len(self)) if indices is None else indices
+        with open(self.filepath, "rb") as f:
+            for i in rows:
+                f.seek(self._offsets[i] + 4)
+                crc = zlib.crc32(f.read(4))
+                remaining = self._lengths[i]
+                while remaining > 0:
+                    block = f.read(min(block_size, remaining))
+                    if not block:
+                        break
+                    crc = zlib.crc32(block, crc)
+                    remaining -= len(block)
+                stored = f.read(4)
+                if remaining or len(stored) != 4:
+                    self._crc[i] = CRC_BAD
+                else:
+                    self._crc[i] = CRC_OK if struct.unpack(">I", stored)[0] == crc else CRC_BAD
+        statuses: dict[str, int] = {}
+        for i in rows:
+            name = CRC_NAMES[self._crc[i]]
+            statuses[name] = statuses.get(name, 0) + 1
+        return statuses
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "container": self.container,
+            "form": self.form or None,
+            "segments": len(self),
+            "segment_counts": self.counts(),
+            "truncated": self.truncated,
+        }
+
+
+def _label(raw: bytes) -> str:
+    nul = raw.find(b"\x00")
+    if nul != -1:
+        raw = raw[:nul]
+    return raw.decode("latin-1", errors="replace")
+
+
+def _walk_png(f, d: SegmentDirectory) -> None:
+    pos = 8
+    while pos + 12 <= d.file_size and len(d) < MAX_SEGMENTS:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) != 8:
+            break
+        length = struct.unpack(">I", header[:4])[0]
+        chunk_type = header[4:].decode("latin-1", errors="replace")
+        label = ""
+        if chunk_type in ("tEXt", "zTXt", "iTXt"):
+            label = _label(f.read(min(length, _LABEL_PREFIX)))
+        if pos + 12 + length > d.file_size:
+            d.truncated = True
+            length = max(0, d.file_size - pos - 8)
+            d._add(chunk_type, pos, pos + 8, length, label, CRC_BAD)
+            break
+        d._add(chunk_type, pos, pos + 8, length, label, CRC_UNCHECKED)
+        pos += 12 + length
+        if chunk_type == "IEND":
+            break
+
+
+def _walk_jpeg(f, d: SegmentDirectory) -> None:
+    pos = 2
+    f.seek(pos)
+    while len(d) < MAX_SEGMENTS:
+        b = f.read(1)
+        if not b:
+            break
+        if b != b"\xff":
+            break  # entropy-coded data or garbage
+        marker_b = f.read(1)
+        while marker_b == b"\xff":  # fill bytes
+            marker_b = f.read(1)
+        if not marker_b:
+            d.truncated = True
+            break
+        marker = marker_b[0]
+        start = f.tell() - 2
+        if marker == 0xD9:
+            d._add("EOI", start, start + 2, 0)
+            break
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:
+            d._add("RST%d" % (marker - 0xD0) if marker != 0x01 else "TEM", start, start + 2, 0)
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) != 2:
+            d.truncated = True
+            break
+        length = int.from_bytes(length_bytes, "big")
+        if length < 2:
+            break
+        name = _jpeg_marker_name(marker)
+        label = ""
+        if 0xE0 <= marker <= 0xEF:
+            label = _label(f.read(min(length - 2, _LABEL_PREFIX)))
+        payload_len = length - 2
+        if start + 2 + length > d.file_size:
+            d.truncated = True
+            payload_len = max(0, d.file_size - start - 4)
+        d._add(name, start, start + 4, payload_len, label)
+        if name == "SOS" or d.truncated:
+            break
+        f.seek(start + 2 + length)
+
+
+def _jpeg_marker_name(marker: int) -> str:
+    if 0xE0 <= marker <= 0xEF:
+        return f"APP{marker - 0xE0}"
+    if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+        return f"SOF{marker - 0xC0}"
+    return {0xDA: "SOS", 0xDB: "DQT", 0xC4: "DHT", 0xDD: "DRI", 0xFE: "COM",
+            0xCC: "DAC", 0xDC: "DNL"}.get(marker, f"0x{marker:02X}")
+
+
+def _walk_riff(f, d: SegmentDirectory, start: int, end: int, depth: int = 0) -> None:
+    pos = start
+    while pos + 8 <= end and len(d) < MAX_SEGMENTS:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) != 8:
+            break
+        fourcc = header[:4].decode("latin-1", errors="replace")
+        size = struct.unpack("<I", header[4:])[0]
+        label = ""
+        if fourcc == "LIST" and size >= 4:
+            label = f.read(4).decode("latin-1", errors="replace")
+        if pos + 8 + size > end:
+            d.truncated = True
+            size = max(0, end - pos - 8)
+        d._add(fourcc, pos, pos + 8, size, label)
+        if fourcc == "LIST" and label != "movi" and depth < 4:
+            _walk_riff(f, d, pos + 12, pos + 8 + size, depth + 1)
+        pos += 8 + size + (size & 1)
+
+
+def _walk_tiff(f, d: SegmentDirectory, max_ifds: int = 64) -> None:
+    f.seek(0)
+    head = f.read(16)
+    bo = "<" if head[:2] == b"II" else ">"
+    d.form = head[:2].decode("latin-1")
+    magic = struct.unpack(bo + "H", head[2:4])[0]
+    big = magic == 43
+    if big:
+        first = struct.unpack(bo + "Q", head[8:16])[0]
+        count_fmt, count_size, entry_size, off_fmt, off_size = "Q", 8, 20, "Q", 8
+    else:
+        first = struct.unpack(bo + "I", head[4:8])[0]
+        count_fmt, count_size, entry_size, off_fmt, off_size = "H", 2, 12, "I", 4
+
+    queue = [(first, "IFD0", True)]
+    seen: set[int] = set()
+    main_index = 0
+    while queue and len(seen) < max_ifds:
+        offset, name, chained = queue.pop(0)
+        if offset == 0 or offset in seen or offset + count_size > d.file_size:
+            continue
+        seen.add(offset)
+        f.seek(offset)
+        count = struct.unpack(bo + count_fmt, f.read(count_size))[0]
+        table = f.read(count * entry_size + off_size)
+        if len(table) < count * entry_size:
+            d.truncated = True
+            count = len(table) // entry_size
+        d._add("IFD", offset, offset + count_size, count * entry_size, name)
+
+        for e in range(count):
+            entry = table[e * entry_size:(e + 1) * entry_size]
+            tag, typ = struct.unpack(bo + "HH", entry[:4])
+            n = struct.unpack(bo + off_fmt, entry[4:4 + off_size])[0]
+            value = entry[4 + off_size:]
+            nbytes = _TIFF_TYPE_SIZES.get(typ, 1) * n
+            if tag in TIFF_SUB_IFD_TAGS:
+                width = 8 if big or typ in (16, 18) else 4
+                fmt = "Q" if width == 8 else "I"
+                if n * width > len(value):
+                    f.seek(struct.unpack(bo + off_fmt, value)[0])
+                    raw = f.read(min(n, 8) * width)
+                else:
+                    raw = value[:n * width]
+                for k in range(min(n, 8, len(raw) // width)):
+                    sub = struct.unpack(bo + fmt, raw[k * width:(k + 1) * width])[0]
+                    queue.append((sub, TIFF_SUB_IFD_TAGS[tag], False))
+            elif tag in TIFF_BLOB_TAGS and nbytes > len(value):
+                data_offset = struct.unpack(bo + off_fmt, value)[0]
+                d._add("TAG", offset, data_offset, min(nbytes, max(0, d.file_size - data_offset)),
+                       TIFF_BLOB_TAGS[tag])
+
+        if chained and len(table) >= count * entry_size + off_size:
+            nxt = struct.unpack(bo + off_fmt, table[count * entry_size:count * entry_size + off_size])[0]
+            if nxt:
+                main_index += 1
+                queue.append((nxt, f"IFD{main_index}", True))
+
+
+def detect_container(head: bytes) -> str | None:
+    if head.startswith(PNG_SIGNATURE):
+        return "PNG"
+    if head.startswith(b"\xff\xd8"):
+        return "JPEG"
+    if head[:4] in (b"RIFF", b"RIFX") and len(head) >= 12:
+        return "RIFF"
+    if head[:4] in (b"II*\x00", b"MM\x00*", b"II+\x00", b"MM\x00+"):
+        return "TIFF"
+    return None
+
+
+def build_segment_directory(filepath: str) -> SegmentDirectory | None:
+    """Walk a PNG, JPEG, RIFF or TIFF file's segment headers once."""
+    try:
+        with open(filepath, "rb") as f:
+            st = os.fstat(f.fileno())
+            head = f.read(16)
+            container = detect_container(head)
+            if container is None:
+                return None
+            d = SegmentDirectory(filepath, container, st.st_size, st.st_mtime_ns)
+            try:
+                if container == "PNG":
+                    _walk_png(f, d)
+                elif container == "JPEG":
+                    _walk_jpeg(f, d)
+                elif container == "RIFF":
+                    d.form = head[8:12].decode("latin-1", errors="replace")
+                    riff_size = struct.unpack("<I", head[4:8])[0]
+                    _walk_riff(f, d, 12, min(st.st_size, 8 + riff_size))
+                else:
+                    _walk_tiff(f, d)
+            except (struct.error, OSError, ValueError):
+                d.truncated = True
+            return d
+    except OSError:
+        return None
+
+
+def _directory_bytes(d: SegmentDirectory) -> int:
+    arrays = (d._kinds, d._labels, d._offsets, d._data_offsets, d._lengths, d._crc)
+    return 512 + sum(a.itemsize * len(a) for a in arrays) + sum(len(n) + 50 for n in d._names)
+
+
+_directory_cache = BoundedCache("segment_directories", max_entries=MAX_CACHED_DIRECTORIES,
+                                max_bytes=MAX_CACHED_DIRECTORY_BYTES, sizeof=_directory_bytes)
+
+
+def get_segment_directory(filepath: str) -> SegmentDirectory | None:
+    """Cached build_segment_directory(); rebuilt when size or mtime change."""
+    key = os.path.realpath(filepath)
+    d = _directory_cache.get(key)
+    if d is not None and d.is_current():
+        return d
+    d = build_segment_directory(filepath)
+    if d is None:
+        return None
+    _directory_cache.put(key, d)
+    return d
+
+
+def clear_segment_cache() -> None:
+    _directory_cache.clear()
+
+
+def map_file(filepath: str) -> mmap.mmap | bytes:
+    """Read-only mapping of a whole file for parsers that index into it.
+
+    Pages are faulted in only where the parser looks, so a header walk over
+    a large image does not copy the pixel data. Empty files cannot be
+    mapped and come back as b"". The caller closes the mapping.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def decode_png_text(chunk_type: str, payload: bytes) -> tuple[str, str] | None:
+    """(keyword, text) for a tEXt, zTXt or iTXt payload."""
+    nul = payload.find(b"\x00")
+    if nul <= 0:
+        return None
+    keyword = payload[:nul].decode("latin-1", errors="replace")
+    rest = payload[nul + 1:]
+    try:
+        if chunk_type == "tEXt":
+            return keyword, rest.decode("latin-1", errors="replace")
+        if chunk_type == "zTXt":
+            return keyword, zlib.decompress(rest[1:]).decode("latin-1", errors="replace")
+        if chunk_type == "iTXt" and len(rest) >= 2:
+            compressed = rest[0] == 1
+            lang_end = rest.find(b"\x00", 2)
+            kw_end = rest.find(b"\x00", lang_end + 1) if lang_end != -1 else -1
+            if kw_end == -1:
+                return None
+            text = rest[kw_end + 1:]
+            if compressed:
+                text = zlib.decompress(text)
+            return keyword, text.decode("utf-8", errors="replace")
+    except zlib.error:
+        return None
+    return None
+
+
+def read_png_text(directory: SegmentDirectory, keyword: str | None = None) -> dict[str, str]:
+    """Decode PNG text chunks (optionally only one keyword) via ranged reads."""
+    segments = [
+        s for s in directory
+        if s.kind in ("tEXt", "zTXt", "iTXt") and (keyword is None or s.label == keyword)
+    ]
+    texts: dict[str, str] = {}
+    for seg, payload in zip(segments, directory.read_all(segments)):
+        decoded = decode_png_text(seg.kind, payload)
+        if decoded and decoded[0] not in texts:
+            texts[decoded[0]] = decoded[1]
+    return texts
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-CLI utilities for metadata_db (search, history, stats, favorites, similar).
+CLI utilities for metadata_db (search, facets, history, stats, favorites, similar).
 """
 
 import argparse
@@ -18,8 +18,11 @@ if _this_dir not in sys.path:
 try:
     from .modules.metadata_db import (
         search_metadata_query,
+        facet_search,
         get_version_history,
         get_statistics,
+        check_aggregates,
+        rebuild_aggregates,
         get_favorites,
         toggle_favorite,
         find_similar_images,
@@ -29,8 +32,11 @@ except ImportError:
     # Fallback to absolute-style import when run as a script
     from modules.metadata_db import (  # type: ignore
         search_metadata_query,
+        facet_search,
         get_version_history,
         get_statistics,
+        check_aggregates,
+        rebuild_aggregates,
         get_favorites,
         toggle_favorite,
         find_similar_images,
@@ -53,6 +59,13 @@ def main() -> None:
     search_parser.add_argument("--limit", type=int, default=100)
     search_parser.add_argument("--offset", type=int, default=0)
 
+    facets_parser = subparsers.add_parser("facets", help="Search with per-facet hit counts")
+    facets_parser.add_argument("--query", "-q", default="")
+    facets_parser.add_argument("--facet", action="append", help="facet to count (repeatable, default all)")
+    facets_parser.add_argument("--limit", type=int, default=100)
+    facets_parser.add_argument("--offset", type=int, default=0)
+    facets_parser.add_argument("--facet-limit", type=int, default=20)
+
     history_parser = subparsers.add_parser("history", help="Fetch version history")
     history_parser.add_argument("--file-id", type=int)
     history_parser.add_argument("--file-path")
@@ -60,6 +73,8 @@ def main() -> None:
     history_parser.add_argument("--offset", type=int, default=0)
 
     stats_parser = subparsers.add_parser("stats", help="Database statistics")
+    stats_parser.add_argument("--check", action="store_true", help="verify the materialized aggregates")
+    stats_parser.add_argument("--rebuild", action="store_true", help="recompute the aggregates from scratch")
 
     favorites_parser = subparsers.add_parser("favorites", help="List or toggle favorites")
     favorites_parser.add_argument("--list", action="store_true")
@@ -80,6 +95,17 @@ def main() -> None:
         print(json.dumps({"results": results}, default=str))
         return
 
+    if args.command == "facets":
+        results = facet_search(
+            args.query,
+            facets=args.facet,
+            limit=args.limit,
+            offset=args.offset,
+            facet_limit=args.facet_limit,
+        )
+        print(json.dumps(results, default=str))
+        return
+
     if args.command == "history":
         file_id = args.file_id
         if not file_id and args.file_path:
@@ -92,6 +118,11 @@ def main() -> None:
         return
 
     if args.command == "stats":
+        if args.rebuild:
+            rebuild_aggregates()
+        if args.check:
+            print(json.dumps(check_aggregates(), default=str))
+            return
         stats = get_statistics()
         print(json.dumps(stats, default=str))
         return
@@ -241,6 +241,11 @@ try:
 except Exception:
     BITSTREAM_PARSER_AVAILABLE = False
 
+try:
+    from .utils.hashing import hash_file
+except ImportError:
+    from utils.hashing import hash_file
+
 try:
     from .utils.document_forensics import PDFForensics, OfficeForensics
     DOC_FORENSICS_AVAILABLE = True
@@ -533,8 +538,157 @@ def _extract_xmp_array(xmp, namespace: str, name: str) -> List[str]:
 
     return items
 
+def _map_xmp_fields(xmp, ns_dc: Optional[str], ns_photoshop: Optional[str], ns_xmp: Optional[str],
+                    ns_rights: Optional[str], ns_iptc: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Map XMP properties to fields; xmp is a libxmp XMPMeta or an XmpTable."""
+    raw: Dict[str, Any] = {}
+    fields: Dict[str, Any] = {}
+
+    dc_data: Dict[str, Any] = {}
+    dc_title = _extract_xmp_array(xmp, ns_dc, "title") if ns_dc else []
+    if dc_title:
+        dc_data["title"] = dc_title
+        fields["title"] = dc_title[0]
+
+    dc_description = _extract_xmp_array(xmp, ns_dc, "description") if ns_dc else []
+    if dc_description:
+        dc_data["description"] = dc_description
+        fields["description"] = dc_description[0]
+
+    dc_creator = _extract_xmp_array(xmp, ns_dc, "creator") if ns_dc else []
+    if dc_creator:
+        dc_data["creator"] = dc_creator
+        fields["creator"] = dc_creator
+
+    dc_subject = _extract_xmp_array(xmp, ns_dc, "subject") if ns_dc else []
+    if dc_subject:
+        dc_data["subject"] = dc_subject
+        fields["keywords"] = dc_subject
+
+    dc_rights = _extract_xmp_array(xmp, ns_dc, "rights") if ns_dc else []
+    if dc_rights:
+        dc_data["rights"] = dc_rights
+
+    if dc_data:
+        raw["dc"] = dc_data
+
+    photoshop_data: Dict[str, Any] = {}
+    headline = _extract_xmp_property(xmp, ns_photoshop, "Headline") if ns_photoshop else None
+    if headline:
+        photoshop_data["headline"] = headline
+        fields["headline"] = headline
+
+    credit = _extract_xmp_property(xmp, ns_photoshop, "Credit") if ns_photoshop else None
+    if credit:
+        photoshop_data["credit"] = credit
+        fields["credit_line"] = credit
+
+    source = _extract_xmp_property(xmp, ns_photoshop, "Source") if ns_photoshop else None
+    if source:
+        photoshop_data["source"] = source
+        fields["source"] = source
+
+    instructions = _extract_xmp_property(xmp, ns_photoshop, "Instructions") if ns_photoshop else None
+    if instructions:
+        photoshop_data["instructions"] = instructions
+        fields["instructions"] = instructions
+
+    city = _extract_xmp_property(xmp, ns_photoshop, "City") if ns_photoshop else None
+    if city:
+        photoshop_data["city"] = city
+        fields["location_city"] = city
+
+    state = _extract_xmp_property(xmp, ns_photoshop, "State") if ns_photoshop else None
+    if state:
+        photoshop_data["state"] = state
+        fields["location_state"] = state
+
+    country = _extract_xmp_property(xmp, ns_photoshop, "Country") if ns_photoshop else None
+    if country:
+        photoshop_data["country"] = country
+        fields["location_country"] = country
+
+    if photoshop_data:
+        raw["photoshop"] = photoshop_data
+
+    xmp_data: Dict[str, Any] = {}
+    creator_tool = _extract_xmp_property(xmp, ns_xmp, "CreatorTool") if ns_xmp else None
+    if creator_tool:
+        xmp_data["creator_tool"] = creator_tool
+        fields["creator_tool"] = creator_tool
+
+    if xmp_data:
+        raw["xmp"] = xmp_data
+
+    iptc_core: Dict[str, Any] = {}
+    if ns_iptc:
+        iptc_location = _extract_xmp_property(xmp, ns_iptc, "Location")
+        if iptc_location:
+            iptc_core["location"] = iptc_location
+            fields["location_sublocation"] = iptc_location
+
+        iptc_country_code = _extract_xmp_property(xmp, ns_iptc, "CountryCode")
+        if iptc_country_code:
+            iptc_core["country_code"] = iptc_country_code
+            fields["location_country_code"] = iptc_country_code
+
+        iptc_event = _extract_xmp_property(xmp, ns_iptc, "Event")
+        if iptc_event:
+            iptc_core["event"] = iptc_event
+            fields["event"] = iptc_event
+
+        iptc_genre = _extract_xmp_property(xmp, ns_iptc, "IntellectualGenre")
+        if iptc_genre:
+            iptc_core["intellectual_genre"] = iptc_genre
+            fields["intellectual_genre"] = iptc_genre
+
+        iptc_scene = _extract_xmp_array(xmp, ns_iptc, "Scene")
+        if iptc_scene:
+            iptc_core["scene"] = iptc_scene
+            fields["scene_code"] = iptc_scene
+
+        iptc_subject = _extract_xmp_array(xmp, ns_iptc, "SubjectCode")
+        if iptc_subject:
+            iptc_core["subject_code"] = iptc_subject
+            fields["subject_code"] = iptc_subject
+
+        if iptc_core:
+            raw["iptc_core"] = iptc_core
+
+    rights_data: Dict[str, Any] = {}
+    usage_terms = _extract_xmp_array(xmp, ns_rights, "UsageTerms") if ns_rights else []
+    if usage_terms:
+        rights_data["usage_terms"] = usage_terms
+        fields["rights_usage_terms"] = usage_terms
+
+    if rights_data:
+        raw["xmp_rights"] = rights_data
+
+    if not fields and not raw:
+        return None
+
+    return {"fields": fields, "raw": raw}
+
 def extract_xmp_metadata(filepath: str) -> Optional[Dict[str, Any]]:
     global _EXEMPI_AVAILABLE
+    # Packets found by the shared XMP layer are parsed once and reused by
+    # every XMP consumer; exempi is only needed for containers it can't scan.
+    try:
+        from .modules.xmp_packets import STANDARD_NAMESPACES, get_xmp_table
+        table = get_xmp_table(filepath)
+    except Exception as e:
+        logger.debug(f"XMP packet table unavailable: {e}")
+        table = None
+    if table:
+        return _map_xmp_fields(
+            table,
+            STANDARD_NAMESPACES["dc"],
+            STANDARD_NAMESPACES["photoshop"],
+            STANDARD_NAMESPACES["xmp"],
+            STANDARD_NAMESPACES["xmpRights"],
+            STANDARD_NAMESPACES["Iptc4xmpCore"],
+        )
+
     if not XMP_AVAILABLE or xmp_consts is None:
         return None
 
@@ -561,9 +715,6 @@ def extract_xmp_metadata(filepath: str) -> Optional[Dict[str, Any]]:
         if xmp is None:
             return None
 
-        raw: Dict[str, Any] = {}
-        fields: Dict[str, Any] = {}
-
         ns_dc = getattr(xmp_consts, "XMP_NS_DC", None)
         ns_photoshop = getattr(xmp_consts, "XMP_NS_PHOTOSHOP", None) or getattr(xmp_consts, "XMP_NS_Photoshop", None)
         ns_xmp = getattr(xmp_consts, "XMP_NS_XMP", None)
@@ -574,130 +725,7 @@ def extract_xmp_metadata(filepath: str) -> Optional[Dict[str, Any]]:
             or getattr(xmp_consts, "XMP_NS_IPTC_CORE", None)
         )
 
-        dc_data: Dict[str, Any] = {}
-        dc_title = _extract_xmp_array(xmp, ns_dc, "title") if ns_dc else []
-        if dc_title:
-            dc_data["title"] = dc_title
-            fields["title"] = dc_title[0]
-
-        dc_description = _extract_xmp_array(xmp, ns_dc, "description") if ns_dc else []
-        if dc_description:
-            dc_data["description"] = dc_description
-            fields["description"] = dc_description[0]
-
-        dc_creator = _extract_xmp_array(xmp, ns_dc, "creator") if ns_dc else []
-        if dc_creator:
-            dc_data["creator"] = dc_creator
-            fields["creator"] = dc_creator
-
-        dc_subject = _extract_xmp_array(xmp, ns_dc, "subject") if ns_dc else []
-        if dc_subject:
-            dc_data["subject"] = dc_subject
-            fields["keywords"] = dc_subject
-
-        dc_rights = _extract_xmp_array(xmp, ns_dc, "rights") if ns_dc else []
-        if dc_rights:
-            dc_data["rights"] = dc_rights
-
-        if dc_data:
-            raw["dc"] = dc_data
-
-        photoshop_data: Dict[str, Any] = {}
-        headline = _extract_xmp_property(xmp, ns_photoshop, "Headline") if ns_photoshop else None
-        if headline:
-            photoshop_data["headline"] = headline
-            fields["headline"] = headline
-
-        credit = _extract_xmp_property(xmp, ns_photoshop, "Credit") if ns_photoshop else None
-        if credit:
-            photoshop_data["credit"] = credit
-            fields["credit_line"] = credit
-
-        source = _extract_xmp_property(xmp, ns_photoshop, "Source") if ns_photoshop else None
-        if source:
-            photoshop_data["source"] = source
-            fields["source"] = source
-
-        instructions = _extract_xmp_property(xmp, ns_photoshop, "Instructions") if ns_photoshop else None
-        if instructions:
-            photoshop_data["instructions"] = instructions
-            fields["instructions"] = instructions
-
-        city = _extract_xmp_property(xmp, ns_photoshop, "City") if ns_photoshop else None
-        if city:
-            photoshop_data["city"] = city
-            fields["location_city"] = city
-
-        state = _extract_xmp_property(xmp, ns_photoshop, "State") if ns_photoshop else None
-        if state:
-            photoshop_data["state"] = state
-            fields["location_state"] = state
-
-        country = _extract_xmp_property(xmp, ns_photoshop, "Country") if ns_photoshop else None
-        if country:
-            photoshop_data["country"] = country
-            fields["location_country"] = country
-
-        if photoshop_data:
-            raw["photoshop"] = photoshop_data
-
-        xmp_data: Dict[str, Any] = {}
-        creator_tool = _extract_xmp_property(xmp, ns_xmp, "CreatorTool") if ns_xmp else None
-        if creator_tool:
-            xmp_data["creator_tool"] = creator_tool
-            fields["creator_tool"] = creator_tool
-
-        if xmp_data:
-            raw["xmp"] = xmp_data
-
-        iptc_core: Dict[str, Any] = {}
-        if ns_iptc:
-            iptc_location = _extract_xmp_property(xmp, ns_iptc, "Location")
-            if iptc_location:
-                iptc_core["location"] = iptc_location
-                fields["location_sublocation"] = iptc_location
-
-            iptc_country_code = _extract_xmp_property(xmp, ns_iptc, "CountryCode")
-            if iptc_country_code:
-                iptc_core["country_code"] = iptc_country_code
-                fields["location_country_code"] = iptc_country_code
-
-            iptc_event = _extract_xmp_property(xmp, ns_iptc, "Event")
-            if iptc_event:
-                iptc_core["event"] = iptc_event
-                fields["event"] = iptc_event
-
-            iptc_genre = _extract_xmp_property(xmp, ns_iptc, "IntellectualGenre")
-            if iptc_genre:
-                iptc_core["intellectual_genre"] = iptc_genre
-                fields["intellectual_genre"] = iptc_genre
-
-            iptc_scene = _extract_xmp_array(xmp, ns_iptc, "Scene")
-            if iptc_scene:
-                iptc_core["scene"] = iptc_scene
-                fields["scene_code"] = iptc_scene
-
-            iptc_subject = _extract_xmp_array(xmp, ns_iptc, "SubjectCode")
-            if iptc_subject:
-                iptc_core["subject_code"] = iptc_subject
-                fields["subject_code"] = iptc_subject
-
-            if iptc_core:
-                raw["iptc_core"] = iptc_core
-
-        rights_data: Dict[str, Any] = {}
-        usage_terms = _extract_xmp_array(xmp, ns_rights, "UsageTerms") if ns_rights else []
-        if usage_terms:
-            rights_data["usage_terms"] = usage_terms
-            fields["rights_usage_terms"] = usage_terms
-
-        if rights_data:
-            raw["xmp_rights"] = rights_data
-
-        if not fields and not raw:
-            return None
-
-        return {"fields": fields, "raw": raw}
+        return _map_xmp_fields(xmp, ns_dc, ns_photoshop, ns_xmp, ns_rights, ns_iptc)
     except ExempiLoadError:
         _EXEMPI_AVAILABLE = False
         return None
@@ -1143,16 +1171,7 @@ def extract_filesystem_metadata(filepath: str) -> Dict[str, Any]:
 
 def extract_file_hashes(filepath: str) -> Dict[str, str]:
     try:
-        hashers = {"md5": hashlib.md5(), "sha256": hashlib.sha256(), "sha1": hashlib.sha1()}
-        import zlib
-        crc = 0
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                for h in hashers.values(): h.update(chunk)
-                crc = zlib.crc32(chunk, crc)
-        result = {algo: h.hexdigest() for algo, h in hashers.items()}
-        result["crc32"] = format(crc & 0xFFFFFFFF, '08x')
-        return result
+        return hash_file(filepath, ("md5", "sha256", "sha1", "crc32"))
     except Exception as e: return {"error": str(e)}
 
 def extract_extended_attributes(filepath: str) -> Dict[str, Any]:
@@ -48,8 +48,25 @@ except ImportError:
         pass
     MODULE_EXCEPTIONS_AVAILABLE = False
 
+try:
+    from .utils.bounded_cache import SampleBuffer
+except ImportError:
+    try:
+        from utils.bounded_cache import SampleBuffer  # type: ignore
+    except ImportError:
+        # Fallback when imported standalone next to an unrelated utils package
+        from collections import deque
+
+        class SampleBuffer(deque):  # type: ignore[no-redef]
+            def __init__(self, name: str, maxlen: int = 1000, register: bool = True):
+                super().__init__(maxlen=maxlen)
+                self.name = name
+
 logger = logging.getLogger(__name__)
 
+# Executions kept per module in ModuleRegistry.performance_history
+PERFORMANCE_HISTORY_SIZE = 1000
+
 try:
     import watchdog.observers
     import watchdog.events
@@ -152,7 +169,7 @@ class ModuleRegistry:
             'memory_usage': 100.0   # 100MB memory usage threshold
         }
         self.health_stats: Dict[str, Dict[str, Any]] = {}
-        self.performance_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.performance_history: Dict[str, SampleBuffer] = {}
         self.last_health_check: float = 0.0
         self.health_check_interval: float = 60.0  # 60 seconds between health checks
     
@@ -840,7 +857,9 @@ class ModuleRegistry:
             }
         
         # Initialize performance history
-        self.performance_history[module_name] = []
+        self.performance_history[module_name] = SampleBuffer(
+            f"module_performance:{module_name}", maxlen=PERFORMANCE_HISTORY_SIZE
+        )
         
         logger.debug(f"Initialized performance tracking for module: {module_name}")
     
@@ -926,10 +945,6 @@ class ModuleRegistry:
             "error": error
         })
         
-        # Keep history size manageable
-        if len(self.performance_history[module_name]) > 1000:  # Keep last 1000 executions
-            self.performance_history[module_name] = self.performance_history[module_name][-1000:]
-        
         # Update health status
         self._update_health_status(module_name)
         
@@ -1052,8 +1067,10 @@ class ModuleRegistry:
         Returns:
             List of performance history entries
         """
-        history = self.performance_history.get(module_name, [])
-        return history[-limit:] if history else []
+        history = self.performance_history.get(module_name)
+        if not history or limit <= 0:
+            return []
+        return list(history)[-limit:]
     
     def get_health_summary(self) -> Dict[str, Any]:
         """
@@ -64,7 +64,11 @@ from .metadata_db import (
     toggle_favorite,
     get_favorites,
     delete_file,
-    get_statistics
+    get_statistics,
+    get_facet_counts,
+    facet_search,
+    check_aggregates,
+    rebuild_aggregates
 )
 
 # IPTC/XMP Fallback Libraries
@@ -367,6 +371,10 @@ __all__ = [
     'get_favorites',
     'delete_file',
     'get_statistics',
+    'get_facet_counts',
+    'facet_search',
+    'check_aggregates',
+    'rebuild_aggregates',
     
     # Fallback Libraries
     'extract_iptc_fallback',
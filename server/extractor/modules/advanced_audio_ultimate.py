@@ -61,8 +61,24 @@ try:
 except ImportError:
     AUBIO_AVAILABLE = False
 
-def extract_advanced_audio_metadata(filepath: str) -> Dict[str, Any]:
-    """Extract comprehensive audio metadata"""
+try:
+    from .audio_feature_stream import BARK_EDGES, analyze_audio_stream
+except ImportError:
+    try:
+        from audio_feature_stream import BARK_EDGES, analyze_audio_stream
+    except ImportError:
+        BARK_EDGES = None
+        analyze_audio_stream = None
+
+def extract_advanced_audio_metadata(filepath: str, analysis_sr: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Extract comprehensive audio metadata.
+
+    The file is decoded once into a shared streamed STFT; every
+    librosa-based analysis below derives its features from that pass,
+    except the fingerprint, which hashes its own 30-second decode.
+    analysis_sr optionally lowers the analysis sample rate.
+    """
     
     result = {
         "available": True,
@@ -82,9 +98,12 @@ def extract_advanced_audio_metadata(filepath: str) -> Dict[str, Any]:
     }
     
     try:
+        # Single streamed decode shared by all spectral analyses
+        features = _stream_features(filepath, analysis_sr)
+
         # Basic audio analysis with librosa
         if LIBROSA_AVAILABLE:
-            librosa_result = _analyze_with_librosa(filepath)
+            librosa_result = _analyze_with_librosa(filepath, features)
             if librosa_result:
                 result["audio_analysis"].update(librosa_result)
         
@@ -115,19 +134,19 @@ def extract_advanced_audio_metadata(filepath: str) -> Dict[str, Any]:
             result["immersive_audio"].update(immersive_result)
         
         # Quality assessment
-        quality_result = _assess_audio_quality(filepath)
+        quality_result = _assess_audio_quality(filepath, features)
         if quality_result:
             result["quality_assessment"].update(quality_result)
         
         # Psychoacoustic analysis
         if LIBROSA_AVAILABLE:
-            psycho_result = _analyze_psychoacoustics(filepath)
+            psycho_result = _analyze_psychoacoustics(filepath, features)
             if psycho_result:
                 result["psychoacoustic_analysis"].update(psycho_result)
         
         # Voice analysis
         if LIBROSA_AVAILABLE:
-            voice_result = _analyze_voice_characteristics(filepath)
+            voice_result = _analyze_voice_characteristics(filepath, features)
             if voice_result:
                 result["voice_analysis"].update(voice_result)
         
@@ -142,73 +161,85 @@ def extract_advanced_audio_metadata(filepath: str) -> Dict[str, Any]:
         logger.error(f"Error in advanced audio analysis: {e}")
         return {"available": False, "error": str(e)}
 
-def _analyze_with_librosa(filepath: str) -> Dict[str, Any]:
+def _stream_features(filepath: str, analysis_sr: Optional[int] = None):
+    """Decode once into shared streamed features (None if unavailable)"""
+    if not LIBROSA_AVAILABLE or analyze_audio_stream is None:
+        return None
+    try:
+        return analyze_audio_stream(filepath, analysis_sr=analysis_sr, pitch=True)
+    except Exception as e:
+        logger.error(f"Streamed audio decode error: {e}")
+        return None
+
+def _analyze_with_librosa(filepath: str, features=None) -> Dict[str, Any]:
     """Analyze audio using librosa"""
     try:
-        # Load audio file
-        y, sr = librosa.load(filepath, sr=None)
+        if features is None:
+            features = _stream_features(filepath)
+        if features is None:
+            return {}
         
+        sr = features.sample_rate
         result = {
             "librosa_analysis": {
                 "sample_rate": sr,
-                "duration_seconds": len(y) / sr,
-                "total_samples": len(y),
-                "rms_energy": float(np.sqrt(np.mean(y**2))),
-                "peak_amplitude": float(np.max(np.abs(y))),
-                "dynamic_range": float(np.max(y) - np.min(y)),
-                "zero_crossing_rate": float(np.mean(librosa.feature.zero_crossing_rate(y)[0]))
+                "native_sample_rate": features.native_sample_rate,
+                "decoder": features.decoder,
+                "duration_seconds": features.duration_seconds,
+                "total_samples": features.total_samples,
+                "rms_energy": features.rms,
+                "peak_amplitude": features.peak,
+                "dynamic_range": features.maximum - features.minimum,
+                "zero_crossing_rate": features.zero_crossing_rate
             }
         }
         
         # Spectral features
-        spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
-        spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)[0]
-        
+        spectral = features.spectral
         result["librosa_analysis"]["spectral_features"] = {
-            "centroid_mean": float(np.mean(spectral_centroids)),
-            "centroid_std": float(np.std(spectral_centroids)),
-            "rolloff_mean": float(np.mean(spectral_rolloff)),
-            "rolloff_std": float(np.std(spectral_rolloff)),
-            "bandwidth_mean": float(np.mean(spectral_bandwidth)),
-            "bandwidth_std": float(np.std(spectral_bandwidth))
+            "centroid_mean": float(spectral["centroid"].mean()[0]),
+            "centroid_std": float(spectral["centroid"].std()[0]),
+            "rolloff_mean": float(spectral["rolloff"].mean()[0]),
+            "rolloff_std": float(spectral["rolloff"].std()[0]),
+            "bandwidth_mean": float(spectral["bandwidth"].mean()[0]),
+            "bandwidth_std": float(spectral["bandwidth"].std()[0])
         }
         
         # MFCC features
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-        result["librosa_analysis"]["mfcc_features"] = {
-            "mfcc_means": [float(np.mean(mfcc)) for mfcc in mfccs],
-            "mfcc_stds": [float(np.std(mfcc)) for mfcc in mfccs]
-        }
+        if features.mfcc is not None:
+            result["librosa_analysis"]["mfcc_features"] = {
+                "mfcc_means": [float(v) for v in features.mfcc.mean()],
+                "mfcc_stds": [float(v) for v in features.mfcc.std()]
+            }
         
         # Chroma features
-        chroma = librosa.feature.chroma_stft(y=y, sr=sr)
-        result["librosa_analysis"]["chroma_features"] = {
-            "chroma_means": [float(np.mean(c)) for c in chroma],
-            "chroma_stds": [float(np.std(c)) for c in chroma]
-        }
+        if features.chroma is not None:
+            result["librosa_analysis"]["chroma_features"] = {
+                "chroma_means": [float(v) for v in features.chroma.mean()],
+                "chroma_stds": [float(v) for v in features.chroma.std()]
+            }
         
         # Tempo and beat tracking
         try:
-            tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
+            tempo, beat_times = features.beats()
             result["librosa_analysis"]["rhythm"] = {
-                "tempo_bpm": float(tempo),
-                "beat_count": len(beats),
-                "beat_times": [float(librosa.frames_to_time(beat, sr=sr)) for beat in beats[:10]]  # First 10 beats
+                "tempo_bpm": tempo,
+                "beat_count": len(beat_times),
+                "beat_times": [float(t) for t in beat_times[:10]]  # First 10 beats
             }
-        except:
+        except Exception:
             result["librosa_analysis"]["rhythm"] = {"tempo_bpm": None, "beat_count": 0}
         
         # Onset detection
         try:
-            onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
-            onset_times = librosa.frames_to_time(onset_frames, sr=sr)
+            onset_times = features.onset_times()
+            duration = features.duration_seconds
             result["librosa_analysis"]["onsets"] = {
                 "onset_count": len(onset_times),
-                "onset_rate": len(onset_times) / (len(y) / sr),
+                "onset_rate": len(onset_times) / duration if duration else 0,
                 "first_onsets": [float(t) for t in onset_times[:10]]  # First 10 onsets
             }
-        except:
+        except Exception:
             result["librosa_analysis"]["onsets"] = {"onset_count": 0, "onset_rate": 0}
         
         return result
@@ -602,7 +633,7 @@ def _analyze_immersive_audio(filepath: str) -> Dict[str, Any]:
         logger.error(f"Immersive audio analysis error: {e}")
         return {}
 
-def _assess_audio_quality(filepath: str) -> Dict[str, Any]:
+def _assess_audio_quality(filepath: str, features=None) -> Dict[str, Any]:
     """Assess audio quality metrics"""
     try:
         result = {
@@ -615,13 +646,13 @@ def _assess_audio_quality(filepath: str) -> Dict[str, Any]:
             "silence_ratio": 0
         }
         
-        if LIBROSA_AVAILABLE:
-            # Load audio for analysis
-            y, sr = librosa.load(filepath, sr=None)
-            
+        if features is None and LIBROSA_AVAILABLE:
+            features = _stream_features(filepath)
+        
+        if features is not None:
             # Dynamic range analysis
-            rms = np.sqrt(np.mean(y**2))
-            peak = np.max(np.abs(y))
+            rms = features.rms
+            peak = features.peak
             
             if peak > 0:
                 dynamic_range_db = 20 * np.log10(peak / (rms + 1e-10))
@@ -638,27 +669,19 @@ def _assess_audio_quality(filepath: str) -> Dict[str, Any]:
                     result["quality_score"] += 5
             
             # Clipping detection
-            clipping_threshold = 0.99
-            clipped_samples = np.sum(np.abs(y) > clipping_threshold)
+            clipped_samples = features.clipped_samples
             if clipped_samples > 0:
                 result["clipping_detected"] = True
                 result["clipped_samples"] = int(clipped_samples)
-                result["clipping_ratio"] = float(clipped_samples / len(y))
+                result["clipping_ratio"] = float(clipped_samples / features.total_samples)
             
             # Silence detection
-            silence_threshold = 0.01
-            silent_samples = np.sum(np.abs(y) < silence_threshold)
-            result["silence_ratio"] = float(silent_samples / len(y))
+            result["silence_ratio"] = float(features.silent_samples / features.total_samples)
             
-            # Frequency response analysis
-            fft = np.fft.fft(y)
-            freqs = np.fft.fftfreq(len(fft), 1/sr)
-            magnitude = np.abs(fft)
-            
-            # Analyze frequency bands
-            low_freq_energy = np.sum(magnitude[(freqs >= 20) & (freqs <= 250)])
-            mid_freq_energy = np.sum(magnitude[(freqs >= 250) & (freqs <= 4000)])
-            high_freq_energy = np.sum(magnitude[(freqs >= 4000) & (freqs <= sr/2)])
+            # Frequency response analysis from the accumulated STFT spectrum
+            low_freq_energy = features.band_energy(20, 250)
+            mid_freq_energy = features.band_energy(250, 4000)
+            high_freq_energy = features.band_energy(4000, features.sample_rate / 2)
             
             total_energy = low_freq_energy + mid_freq_energy + high_freq_energy
             
@@ -713,11 +736,24 @@ def _assess_audio_quality(filepath: str) -> Dict[str, Any]:
         logger.error(f"Audio quality assessment error: {e}")
         return {}
 
-def _analyze_psychoacoustics(filepath: str) -> Dict[str, Any]:
-    """Analyze psychoacoustic properties"""
+def _analyze_psychoacoustics(filepath: str, features=None) -> Dict[str, Any]:
+    """
+    Analyze psychoacoustic properties.
+
+    The mel features keep librosa's S-only definitions. The Bark band
+    energies are sums over the averaged STFT magnitude spectrum rather than
+    one whole-signal FFT, which would need the full file in memory. A tone
+    gets relatively more weight than broadband noise in that spectrum, so
+    bark_band_energies, dominant_bark_band and bark_spectral_centroid are
+    not comparable with values from before the streamed engine.
+    """
     try:
         if not LIBROSA_AVAILABLE:
             return {}
+        if features is None:
+            features = _stream_features(filepath)
+        if features is None or not features.mel:
+            return {}
         
         result = {
             "perceptual_features": {},
@@ -726,38 +762,19 @@ def _analyze_psychoacoustics(filepath: str) -> Dict[str, Any]:
             "loudness_perception": {}
         }
         
-        # Load audio
-        y, sr = librosa.load(filepath, sr=None)
-        
         # Mel-frequency analysis (perceptually relevant)
-        mel_spectrogram = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=128)
-        mel_db = librosa.power_to_db(mel_spectrogram, ref=np.max)
-        
         result["perceptual_features"] = {
-            "mel_spectral_centroid": float(np.mean(librosa.feature.spectral_centroid(S=mel_spectrogram)[0])),
-            "mel_spectral_rolloff": float(np.mean(librosa.feature.spectral_rolloff(S=mel_spectrogram)[0])),
-            "mel_spectral_flatness": float(np.mean(librosa.feature.spectral_flatness(S=mel_spectrogram)[0]))
+            "mel_spectral_centroid": float(features.mel["centroid"].mean()[0]),
+            "mel_spectral_rolloff": float(features.mel["rolloff"].mean()[0]),
+            "mel_spectral_flatness": float(features.mel["flatness"].mean()[0])
         }
         
         # Bark scale analysis (critical bands)
-        # Approximate Bark scale frequencies
-        bark_frequencies = [0, 100, 200, 300, 400, 510, 630, 770, 920, 1080, 
-                           1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700, 
-                           4400, 5300, 6400, 7700, 9500, 12000, 15500]
-        
-        # Calculate energy in each critical band
-        fft = np.fft.fft(y)
-        freqs = np.fft.fftfreq(len(fft), 1/sr)
-        magnitude = np.abs(fft)
-        
-        bark_energies = []
-        for i in range(len(bark_frequencies) - 1):
-            low_freq = bark_frequencies[i]
-            high_freq = bark_frequencies[i + 1]
-            
-            band_mask = (freqs >= low_freq) & (freqs <= high_freq)
-            band_energy = np.sum(magnitude[band_mask])
-            bark_energies.append(float(band_energy))
+        # Calculate energy in each critical band of the accumulated spectrum
+        bark_energies = [
+            features.band_energy(BARK_EDGES[i], BARK_EDGES[i + 1])
+            for i in range(len(BARK_EDGES) - 1)
+        ]
         
         result["critical_bands"] = {
             "bark_band_energies": bark_energies,
@@ -772,11 +789,15 @@ def _analyze_psychoacoustics(filepath: str) -> Dict[str, Any]:
         logger.error(f"Psychoacoustic analysis error: {e}")
         return {}
 
-def _analyze_voice_characteristics(filepath: str) -> Dict[str, Any]:
+def _analyze_voice_characteristics(filepath: str, features=None) -> Dict[str, Any]:
     """Analyze voice and speech characteristics"""
     try:
         if not LIBROSA_AVAILABLE:
             return {}
+        if features is None:
+            features = _stream_features(filepath)
+        if features is None:
+            return {}
         
         result = {
             "voice_detected": False,
@@ -786,52 +807,41 @@ def _analyze_voice_characteristics(filepath: str) -> Dict[str, Any]:
             "speech_features": {}
         }
         
-        # Load audio
-        y, sr = librosa.load(filepath, sr=None)
-        
-        # Fundamental frequency (F0) estimation
-        try:
-            f0 = librosa.yin(y, fmin=50, fmax=400)  # Typical human voice range
-            f0_clean = f0[f0 > 0]  # Remove unvoiced frames
+        # Fundamental frequency (F0) estimation, tracked block-wise with YIN
+        f0 = features.f0
+        if f0 is not None and f0.count > 0:
+            mean_f0 = float(f0.mean()[0])
+            result["voice_detected"] = True
+            result["fundamental_frequency"] = {
+                "mean_f0_hz": mean_f0,
+                "std_f0_hz": float(f0.std()[0]),
+                "min_f0_hz": float(f0.minimum[0]),
+                "max_f0_hz": float(f0.maximum[0]),
+                "voiced_ratio": float(f0.count / features.f0_frames)
+            }
             
-            if len(f0_clean) > 0:
-                result["voice_detected"] = True
-                result["fundamental_frequency"] = {
-                    "mean_f0_hz": float(np.mean(f0_clean)),
-                    "std_f0_hz": float(np.std(f0_clean)),
-                    "min_f0_hz": float(np.min(f0_clean)),
-                    "max_f0_hz": float(np.max(f0_clean)),
-                    "voiced_ratio": float(len(f0_clean) / len(f0))
-                }
-                
-                # Estimate speaker characteristics
-                mean_f0 = np.mean(f0_clean)
-                if mean_f0 < 165:
-                    result["fundamental_frequency"]["likely_gender"] = "male"
-                elif mean_f0 > 265:
-                    result["fundamental_frequency"]["likely_gender"] = "female"
-                else:
-                    result["fundamental_frequency"]["likely_gender"] = "unknown"
-        except:
-            pass
+            # Estimate speaker characteristics
+            if mean_f0 < 165:
+                result["fundamental_frequency"]["likely_gender"] = "male"
+            elif mean_f0 > 265:
+                result["fundamental_frequency"]["likely_gender"] = "female"
+            else:
+                result["fundamental_frequency"]["likely_gender"] = "unknown"
         
         # Spectral features for voice quality
-        spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)[0]
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
-        
+        centroid_mean = float(features.spectral["centroid"].mean()[0])
         result["voice_quality"] = {
-            "spectral_centroid_mean": float(np.mean(spectral_centroids)),
-            "spectral_bandwidth_mean": float(np.mean(spectral_bandwidth)),
-            "spectral_rolloff_mean": float(np.mean(spectral_rolloff)),
-            "brightness": float(np.mean(spectral_centroids) / (sr / 2))  # Normalized brightness
+            "spectral_centroid_mean": centroid_mean,
+            "spectral_bandwidth_mean": float(features.spectral["bandwidth"].mean()[0]),
+            "spectral_rolloff_mean": float(features.spectral["rolloff"].mean()[0]),
+            "brightness": centroid_mean / (features.sample_rate / 2)  # Normalized brightness
         }
         
         # Speech rate estimation (approximate)
-        onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
-        if len(onset_frames) > 0:
-            duration = len(y) / sr
-            onset_rate = len(onset_frames) / duration
+        onset_times = features.onset_times()
+        duration = features.duration_seconds
+        if len(onset_times) > 0 and duration > 0:
+            onset_rate = len(onset_times) / duration
             
             result["speech_features"] = {
                 "onset_rate_per_second": float(onset_rate),
@@ -846,7 +856,14 @@ def _analyze_voice_characteristics(filepath: str) -> Dict[str, Any]:
         return {}
 
 def _generate_audio_fingerprint(filepath: str) -> Dict[str, Any]:
-    """Generate audio fingerprint for identification"""
+    """
+    Generate audio fingerprint for identification.
+
+    The hashes are taken over librosa chroma_stft of the first 30 seconds
+    at 22050 Hz, as stored fingerprints expect. That bounded decode is kept
+    separate from the streamed analysis, whose chroma runs at the file's
+    (or analysis_sr) rate and would hash differently.
+    """
     try:
         result = {
             "fingerprint_available": False,
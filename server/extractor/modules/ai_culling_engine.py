@@ -15,14 +15,232 @@ Version: 1.0.0
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import math
+from typing import Dict, Any, List, Optional, Tuple, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    from ..utils.date_parsing import parse_timestamp
+except ImportError:
+    from utils.date_parsing import parse_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Column layout of the per-photo feature matrix built by build_feature_matrix().
+# Missing or unparseable values are NaN; flags are 0/1.
+FEATURE_COLUMNS: Tuple[str, ...] = (
+    'focus_mode_good', 'af_count', 'face_detected', 'focus_distance', 'lens_pro',
+    'iso', 'fnumber', 'exposure_time', 'exposure_bias',
+    'width', 'height', 'face_count', 'scene_good',
+    'bits_per_sample', 'camera_bonus', 'lens_pro_upper',
+    'subject_distance', 'focal_length', 'flash_bonus',
+    'available_fields', 'focus_override', 'exposure_override',
+)
+_F = {name: i for i, name in enumerate(FEATURE_COLUMNS)}
+
+_GOOD_FOCUS_MODES = ('AF-S', 'Single', 'One Shot', 'AF-C', 'Continuous')
+_PRO_LENS_FOCUS = ('GM', 'L', 'Art', 'Pro', 'EX', 'DG')
+_PRO_LENS_TECHNICAL = ('GM', 'L', 'ART', 'PRO', 'OTUS', 'MASTER', 'DG')
+_PRO_BODIES = ('EOS R', 'EOS-1D', 'D5', 'D850', 'A7R', 'A9', ' GFX', 'Hasselblad', 'Leica')
+_MAJOR_MAKES = ('CANON', 'NIKON', 'SONY', 'FUJIFILM')
+_GOOD_SCENES = ('Portrait', 'Landscape', 'Night Scene')
+_CONFIDENCE_FIELDS = (
+    'focusmode', 'afmode', 'pointsinfocus', 'afpoints', 'facedetected',
+    'isospeedratings', 'iso', 'fnumber', 'exposuretime', 'exposurebiasvalue',
+    'scenecapturetype', 'facecount',
+)
+# Confidence fields plus the width/height pair
+_CONFIDENCE_FIELD_TOTAL = len(_CONFIDENCE_FIELDS) + 1
+
+_EPOCH = datetime(1970, 1, 1)
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _as_float(value: Any) -> float:
+    """Float value of a metadata field, NaN when missing or unparseable."""
+    if not value:
+        return math.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def _as_int(value: Any) -> float:
+    if not value:
+        return math.nan
+    try:
+        return float(int(value))
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def _override_score(analysis: Any) -> float:
+    """overall_score of a precomputed focus_exposure_analyzer result, if any."""
+    if analysis is None:
+        return math.nan
+    if isinstance(analysis, dict):
+        return _as_float(analysis.get('overall_score'))
+    return _as_float(getattr(analysis, 'overall_score', None))
+
+
+def _photo_features(photo: Dict[str, Any]) -> List[float]:
+    exif = photo.get('exif', {})
+    row = [math.nan] * len(FEATURE_COLUMNS)
+
+    focus_mode = exif.get('focusmode') or exif.get('afmode')
+    row[_F['focus_mode_good']] = float(bool(focus_mode) and any(m in str(focus_mode) for m in _GOOD_FOCUS_MODES))
+
+    af_points = exif.get('pointsinfocus') or exif.get('afpoints')
+    if af_points and isinstance(af_points, (list, str)):
+        if isinstance(af_points, str):
+            try:
+                row[_F['af_count']] = float(int(af_points))
+            except ValueError:
+                row[_F['af_count']] = 1.0
+        else:
+            row[_F['af_count']] = float(len(af_points))
+
+    face_detected = bool(exif.get('facedetected'))
+    row[_F['face_detected']] = float(face_detected)
+    row[_F['focus_distance']] = _as_float(exif.get('focusdistance'))
+
+    lens_model = exif.get('lensmodel')
+    lens_str = str(lens_model) if lens_model else ''
+    row[_F['lens_pro']] = float(bool(lens_str) and any(i in lens_str for i in _PRO_LENS_FOCUS))
+    row[_F['lens_pro_upper']] = float(bool(lens_str) and any(i in lens_str.upper() for i in _PRO_LENS_TECHNICAL))
+
+    row[_F['iso']] = _as_float(exif.get('isospeedratings') or exif.get('iso'))
+    row[_F['fnumber']] = _as_float(exif.get('fnumber'))
+    row[_F['exposure_time']] = _as_float(exif.get('exposuretime'))
+    row[_F['exposure_bias']] = _as_float(exif.get('exposurebiasvalue'))
+
+    width, height = photo.get('width'), photo.get('height')
+    if width and height:
+        row[_F['width']] = _as_float(width)
+        row[_F['height']] = _as_float(height)
+
+    row[_F['face_count']] = _as_int(exif.get('facecount'))
+    scene_type = exif.get('scenecapturetype')
+    row[_F['scene_good']] = float(bool(scene_type) and any(s in str(scene_type) for s in _GOOD_SCENES))
+    row[_F['bits_per_sample']] = _as_float(exif.get('bitspersample'))
+
+    make, model = exif.get('make'), exif.get('model')
+    if make and model:
+        if any(i in str(model).upper() for i in _PRO_BODIES):
+            row[_F['camera_bonus']] = 15.0
+        elif any(i in str(make).upper() for i in _MAJOR_MAKES):
+            row[_F['camera_bonus']] = 10.0
+        else:
+            row[_F['camera_bonus']] = 5.0
+    else:
+        row[_F['camera_bonus']] = 0.0
+
+    row[_F['subject_distance']] = _as_float(exif.get('subjectdistance'))
+    row[_F['focal_length']] = _as_float(exif.get('focallength'))
+
+    flash = exif.get('flash')
+    if flash:
+        flash_str = str(flash)
+        row[_F['flash_bonus']] = 10.0 if ('Off' in flash_str or 'Did not fire' in flash_str) else 5.0
+    else:
+        row[_F['flash_bonus']] = 0.0
+
+    available = sum(1 for field in _CONFIDENCE_FIELDS if exif.get(field))
+    if width and height:
+        available += 1
+    row[_F['available_fields']] = float(available)
+
+    row[_F['focus_override']] = _override_score(photo.get('focus_analysis'))
+    row[_F['exposure_override']] = _override_score(photo.get('exposure_analysis'))
+    return row
+
+
+def build_feature_matrix(photos: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Build the (n_photos, len(FEATURE_COLUMNS)) scoring matrix for a batch.
+
+    This is the only per-photo Python pass; all scoring runs on the matrix.
+    Precomputed ``focus_analysis`` / ``exposure_analysis`` results from
+    focus_exposure_analyzer override the EXIF-derived focus/exposure scores.
+    Module-level so it can be shipped to worker processes.
+    """
+    if not photos:
+        return np.empty((0, len(FEATURE_COLUMNS)), dtype=np.float64)
+    return np.array([_photo_features(photo) for photo in photos], dtype=np.float64)
+
+
+def _banded(values: np.ndarray, conditions: List[np.ndarray], choices: List[float], default: float) -> np.ndarray:
+    """np.select over present values; missing (NaN) values contribute 0."""
+    return np.where(np.isnan(values), 0.0, np.select(conditions, choices, default))
+
+
+def _capture_time(photo: Dict[str, Any]) -> float:
+    """Seconds since epoch of DateTimeOriginal, NaN when missing or unparseable."""
+    timestamp = photo.get('exif', {}).get('datetimeoriginal')
+    if not timestamp:
+        return math.nan
+    try:
+        if isinstance(timestamp, str):
+            timestamp = parse_timestamp(timestamp, 'exif.DateTimeOriginal')
+        if isinstance(timestamp, datetime):
+            if timestamp.tzinfo is not None:
+                timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+            return (timestamp - _EPOCH).total_seconds()
+    except (ValueError, TypeError):
+        pass
+    return math.nan
+
+
+def _perceptual_hash(photo: Dict[str, Any]) -> Optional[int]:
+    """64-bit pHash of the photo from perceptual_hashes output, if present."""
+    hashes = photo.get('perceptual_hashes') or {}
+    value = hashes.get('phash') if isinstance(hashes, dict) else None
+    if value is None:
+        value = photo.get('phash')
+    if isinstance(value, int):
+        return value & 0xFFFFFFFFFFFFFFFF
+    if isinstance(value, str) and 0 < len(value) <= 16:
+        try:
+            return int(value, 16)
+        except ValueError:
+            return None
+    return None
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    return _POPCOUNT_TABLE[values.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+class _UnionFind:
+    """Array-backed disjoint sets with path halving and union by size."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+
 @dataclass
 class CullingScore:
     """Individual culling score component."""
@@ -51,9 +269,10 @@ class PhotoGroup:
     """Group of similar photos for culling."""
     group_id: str
     photos: List[Dict[str, Any]]
-    similarity_reason: str  # 'time_sequence', 'similar_composition', 'same_subject'
+    similarity_reason: str  # 'time_sequence', 'similar_composition', 'unique_photo'
     best_shot_index: Optional[int] = None
     culling_scores: Optional[List[CullingScore]] = None
+    photo_indices: Optional[List[int]] = None  # positions in the analysed batch
 
 class AICullingEngine:
     """AI-powered photo culling engine."""
@@ -65,13 +284,22 @@ class AICullingEngine:
         self.composition_weight = self.user_preferences.get('composition_weight', 0.2)
         self.technical_weight = self.user_preferences.get('technical_weight', 0.15)
         self.aesthetic_weight = self.user_preferences.get('aesthetic_weight', 0.1)
-        
-    def analyze_batch(self, photos: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Burst grouping: consecutive shots within burst_window seconds always
+        # group; shots whose pHashes differ by <= max_hamming bits group when
+        # taken within similarity_window seconds of each other
+        self.burst_window = self.user_preferences.get('burst_window_seconds', 3.0)
+        self.similarity_window = self.user_preferences.get('similarity_window_seconds', 120.0)
+        self.max_hamming = int(self.user_preferences.get('max_hash_distance', 6))
+        self.max_bucket_neighbors = 32
+        
+    def analyze_batch(self, photos: List[Dict[str, Any]],
+                      features: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Analyze a batch of photos and return culling recommendations.
         
         Args:
             photos: List of photo metadata dictionaries
+            features: Optional precomputed build_feature_matrix(photos)
             
         Returns:
             Dict containing groups, scores, and recommendations
@@ -92,17 +320,10 @@ class AICullingEngine:
             # Step 1: Group similar photos
             groups = self._group_similar_photos(photos)
             
-            # Step 2: Score each photo
-            scored_groups = []
-            for group in groups:
-                scores = []
-                for photo in group.photos:
-                    score = self._score_photo(photo)
-                    scores.append(score)
-                
-                group.culling_scores = scores
-                group.best_shot_index = self._select_best_shot(scores)
-                scored_groups.append(group)
+            # Step 2: Score the whole batch at once
+            if features is None:
+                features = build_feature_matrix(photos)
+            scored_groups = self._apply_scores(groups, self.score_features(features))
             
             # Step 3: Generate recommendations
             recommendations = self._generate_recommendations(scored_groups)
@@ -115,13 +336,7 @@ class AICullingEngine:
                 'recommendations': recommendations,
                 'processing_time': processing_time,
                 'success': True,
-                'scoring_weights': {
-                    'focus': self.focus_weight,
-                    'exposure': self.exposure_weight,
-                    'composition': self.composition_weight,
-                    'technical': self.technical_weight,
-                    'aesthetic': self.aesthetic_weight
-                }
+                'scoring_weights': self._scoring_weights()
             }
             
         except Exception as e:
@@ -136,469 +351,247 @@ class AICullingEngine:
                 'success': False,
                 'error': str(e)
             }
+
+    def iter_group_results(self, photos: List[Dict[str, Any]],
+                           chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Stream scored groups as they are produced.
+
+        Groups are formed over the whole batch first (bursts may span any
+        range of input), then scored in chunks of roughly ``chunk_size``
+        photos so the first results are available long before the batch
+        finishes.
+
+        Yields:
+            Dicts with 'group' (as in analyze_batch) and its 'recommendations'
+        """
+        pending: List[PhotoGroup] = []
+        pending_photos = 0
+        for group in self._group_similar_photos(photos):
+            pending.append(group)
+            pending_photos += len(group.photos)
+            if pending_photos >= chunk_size:
+                yield from self._score_group_chunk(pending)
+                pending, pending_photos = [], 0
+        if pending:
+            yield from self._score_group_chunk(pending)
+
+    def _score_group_chunk(self, groups: List[PhotoGroup]) -> Iterator[Dict[str, Any]]:
+        chunk_photos = [photo for group in groups for photo in group.photos]
+        scores = self.score_features(build_feature_matrix(chunk_photos))
+        offset = 0
+        for group in groups:
+            rows = scores[offset:offset + len(group.photos)]
+            offset += len(group.photos)
+            group.culling_scores = self._rows_to_scores(rows)
+            group.best_shot_index = self._select_best_shot(group.culling_scores)
+            yield {
+                'group': self._group_to_dict(group),
+                'recommendations': self._generate_recommendations([group]),
+            }
+
+    def _scoring_weights(self) -> Dict[str, float]:
+        return {
+            'focus': self.focus_weight,
+            'exposure': self.exposure_weight,
+            'composition': self.composition_weight,
+            'technical': self.technical_weight,
+            'aesthetic': self.aesthetic_weight
+        }
+
+    def _apply_scores(self, groups: List[PhotoGroup], scores: np.ndarray) -> List[PhotoGroup]:
+        for group in groups:
+            group.culling_scores = self._rows_to_scores(scores[group.photo_indices])
+            group.best_shot_index = self._select_best_shot(group.culling_scores)
+        return groups
     
     def _group_similar_photos(self, photos: List[Dict[str, Any]]) -> List[PhotoGroup]:
-        """Group photos based on similarity."""
-        groups = []
-        ungrouped = photos.copy()
-        
-        # Sort by timestamp for time-based grouping
-        photos_by_time = sorted(ungrouped, key=lambda p: p.get('exif', {}).get('datetimeoriginal', ''))
-        
-        current_group = []
-        last_timestamp = None
-        
-        for photo in photos_by_time:
-            exif = photo.get('exif', {})
-            timestamp = exif.get('datetimeoriginal')
-            
-            if timestamp:
-                try:
-                    # Parse timestamp
-                    if isinstance(timestamp, str):
-                        photo_time = datetime.strptime(timestamp, '%Y:%m:%d %H:%M:%S')
-                    else:
-                        photo_time = timestamp
-                    
-                    # Group if within 3 seconds
-                    if last_timestamp and abs((photo_time - last_timestamp).total_seconds()) <= 3:
-                        current_group.append(photo)
-                    else:
-                        if current_group:
-                            groups.append(PhotoGroup(
-                                group_id=f"time_sequence_{len(groups)}",
-                                photos=current_group,
-                                similarity_reason="time_sequence"
-                            ))
-                        current_group = [photo]
-                    
-                    last_timestamp = photo_time
-                    
-                except (ValueError, TypeError):
-                    # If timestamp parsing fails, start new group
-                    if current_group:
-                        groups.append(PhotoGroup(
-                            group_id=f"time_sequence_{len(groups)}",
-                            photos=current_group,
-                            similarity_reason="time_sequence"
-                        ))
-                    current_group = [photo]
-                    last_timestamp = None
+        """
+        Group photos into bursts.
+
+        Two photos are linked when they are consecutive shots within
+        ``burst_window`` seconds, or when their perceptual hashes are within
+        ``max_hamming`` bits and they were taken within ``similarity_window``
+        seconds. Hash candidates come from banded LSH buckets (with
+        max_hamming + 1 bands, any pair within the distance shares a band),
+        and links are merged with union-find.
+        """
+        n = len(photos)
+        if n == 0:
+            return []
+
+        times = np.array([_capture_time(p) for p in photos], dtype=np.float64)
+        sort_times = np.where(np.isnan(times), np.inf, times)
+        uf = _UnionFind(n)
+        via_hash = np.zeros(n, dtype=bool)
+
+        # Time-sequence links between consecutive timed shots
+        timed = np.flatnonzero(~np.isnan(times))
+        if timed.size > 1:
+            ordered = timed[np.argsort(times[timed], kind='stable')]
+            gaps = np.diff(times[ordered])
+            for i in np.flatnonzero(gaps <= self.burst_window):
+                uf.union(int(ordered[i]), int(ordered[i + 1]))
+
+        # Perceptual-hash links via banded LSH
+        raw_hashes = [_perceptual_hash(p) for p in photos]
+        hashed = np.array([i for i, h in enumerate(raw_hashes) if h is not None], dtype=np.int64)
+        if hashed.size > 1:
+            hashes = np.zeros(n, dtype=np.uint64)
+            hashes[hashed] = np.array([raw_hashes[i] for i in hashed], dtype=np.uint64)
+            bands = self.max_hamming + 1
+            band_bits = -(-64 // bands)
+            mask = np.uint64((1 << band_bits) - 1)
+            for band in range(bands):
+                keys = (hashes[hashed] >> np.uint64(band * band_bits)) & mask
+                order = np.lexsort((sort_times[hashed], keys))
+                members = hashed[order]
+                member_keys = keys[order]
+                for offset in range(1, min(self.max_bucket_neighbors, members.size - 1) + 1):
+                    a, b = members[:-offset], members[offset:]
+                    same_bucket = member_keys[:-offset] == member_keys[offset:]
+                    if not same_bucket.any():
+                        break
+                    close = _popcount64(hashes[a] ^ hashes[b]) <= self.max_hamming
+                    dt = np.abs(times[a] - times[b])
+                    in_window = np.isnan(dt) | (dt <= self.similarity_window)
+                    for i in np.flatnonzero(same_bucket & close & in_window):
+                        uf.union(int(a[i]), int(b[i]))
+                        via_hash[a[i]] = via_hash[b[i]] = True
+
+        # Collect components; members and groups ordered by capture time
+        components: Dict[int, List[int]] = {}
+        for i in sorted(range(n), key=lambda k: (sort_times[k], k)):
+            components.setdefault(uf.find(i), []).append(i)
+
+        groups: List[PhotoGroup] = []
+        for members in components.values():
+            if len(members) == 1:
+                prefix, reason = 'individual', 'unique_photo'
+            elif via_hash[members].any():
+                prefix, reason = 'similar_composition', 'similar_composition'
             else:
-                # No timestamp, individual photo
-                if current_group:
-                    groups.append(PhotoGroup(
-                        group_id=f"time_sequence_{len(groups)}",
-                        photos=current_group,
-                        similarity_reason="time_sequence"
-                    ))
-                    current_group = []
-                
-                groups.append(PhotoGroup(
-                    group_id=f"individual_{len(groups)}",
-                    photos=[photo],
-                    similarity_reason="unique_photo"
-                ))
-        
-        # Add final group
-        if current_group:
+                prefix, reason = 'time_sequence', 'time_sequence'
             groups.append(PhotoGroup(
-                group_id=f"time_sequence_{len(groups)}",
-                photos=current_group,
-                similarity_reason="time_sequence"
+                group_id=f"{prefix}_{len(groups)}",
+                photos=[photos[i] for i in members],
+                similarity_reason=reason,
+                photo_indices=members
             ))
         
         return groups
+
+    def _component_scores(self, features: np.ndarray) -> np.ndarray:
+        """Vectorized focus/exposure/composition/technical/aesthetic scores, shape (n, 5)."""
+        col = lambda name: features[:, _F[name]]
+
+        # Focus: AF mode, AF points, faces, focus distance, pro lens
+        af = col('af_count')
+        fd = col('focus_distance')
+        focus = (50.0 + 15.0 * col('focus_mode_good')
+                 + np.where(af >= 1, 10.0, 0.0) + np.where(af > 1, 5.0, 0.0)
+                 + 15.0 * col('face_detected')
+                 + np.where((fd >= 0.5) & (fd <= 10.0), 10.0, 0.0)
+                 + 10.0 * col('lens_pro'))
+        focus = np.minimum(100.0, focus)
+        focus = np.where(np.isnan(col('focus_override')), focus, col('focus_override'))
+
+        # Exposure: ISO, aperture sweet spot, shutter speed, compensation
+        iso, fn, sh, bias = col('iso'), col('fnumber'), col('exposure_time'), col('exposure_bias')
+        exposure = (50.0
+                    + _banded(iso, [iso <= 100, iso <= 400, iso <= 800, iso <= 1600], [20, 15, 10, 5], -10)
+                    + _banded(fn, [(fn >= 2.8) & (fn <= 8.0), (fn >= 1.4) & (fn <= 11.0)], [15, 10], 5)
+                    + _banded(sh, [(sh >= 0.001) & (sh <= 0.5), (sh >= 0.0001) & (sh < 0.001),
+                                   (sh > 0.5) & (sh <= 2.0)], [15, 10, 10], 5)
+                    + _banded(bias, [np.abs(bias) <= 0.3, np.abs(bias) <= 1.0], [10, 5], -5))
+        exposure = np.clip(exposure, 0.0, 100.0)
+        exposure = np.where(np.isnan(col('exposure_override')), exposure, col('exposure_override'))
+
+        # Composition: aspect ratio, faces in frame, scene type
+        width, height = col('width'), col('height')
+        aspect = width / height
+        fc = col('face_count')
+        face = col('face_detected')
+        composition = (50.0
+                       + _banded(aspect, [np.abs(aspect - 1.618) < 0.1, np.abs(aspect - 1.5) < 0.1,
+                                          np.abs(aspect - 1.333) < 0.1, np.abs(aspect - 1.0) < 0.1,
+                                          np.abs(aspect - 2.333) < 0.1], [20, 15, 10, 10, 15], 5)
+                       + 10.0 * face
+                       + face * _banded(fc, [(fc >= 1) & (fc <= 3), (fc >= 4) & (fc <= 6)], [15, 10], 5)
+                       + 10.0 * col('scene_good'))
+        composition = np.minimum(100.0, composition)
+
+        # Technical: resolution, bit depth, body class, pro lens
+        mp = width * height / 1_000_000
+        bits = col('bits_per_sample')
+        technical = (50.0
+                     + _banded(mp, [mp >= 20, mp >= 12, mp >= 8, mp >= 4], [25, 20, 15, 10], 5)
+                     + _banded(bits, [bits >= 14, bits >= 12, bits >= 10], [15, 10, 5], 0)
+                     + col('camera_bonus')
+                     + 10.0 * col('lens_pro_upper'))
+        technical = np.minimum(100.0, technical)
+
+        # Aesthetics: subject distance, focal length, flash
+        sd, fl = col('subject_distance'), col('focal_length')
+        aesthetic = (50.0
+                     + _banded(sd, [(sd >= 0.5) & (sd <= 3.0), (sd > 3.0) & (sd <= 10.0)], [15, 10], 0)
+                     + _banded(fl, [(fl >= 35) & (fl <= 85), (fl >= 24) & (fl < 35), (fl > 85) & (fl <= 135)],
+                               [15, 10, 10], 5)
+                     + col('flash_bonus'))
+        aesthetic = np.minimum(100.0, aesthetic)
+
+        return np.column_stack([focus, exposure, composition, technical, aesthetic])
+
+    def score_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        Score a feature matrix from build_feature_matrix().
+
+        Returns:
+            Array of shape (n, 7): focus, exposure, composition, technical,
+            aesthetic, overall and confidence per photo
+        """
+        if features.size == 0:
+            return np.empty((0, 7), dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            components = self._component_scores(features)
+        weights = np.array([self.focus_weight, self.exposure_weight, self.composition_weight,
+                            self.technical_weight, self.aesthetic_weight], dtype=np.float64)
+        overall = components @ weights
+
+        # Confidence: metadata completeness blended with score consistency
+        base_confidence = features[:, _F['available_fields']] / _CONFIDENCE_FIELD_TOTAL
+        consistency = np.maximum(0.5, 1.0 - components.std(axis=1) / 50.0)
+        confidence = np.clip(base_confidence * 0.7 + consistency * 0.3, 0.1, 1.0)
+
+        return np.column_stack([components, overall, confidence])
+
+    @staticmethod
+    def _rows_to_scores(rows: np.ndarray) -> List[CullingScore]:
+        return [CullingScore(*(float(v) for v in row)) for row in rows.tolist()]
     
     def _score_photo(self, photo: Dict[str, Any]) -> CullingScore:
         """Score an individual photo across multiple dimensions."""
-        
-        # Focus score analysis
-        focus_score = self._analyze_focus(photo)
-        
-        # Exposure score analysis
-        exposure_score = self._analyze_exposure(photo)
-        
-        # Composition score analysis
-        composition_score = self._analyze_composition(photo)
-        
-        # Technical quality analysis
-        technical_score = self._analyze_technical_quality(photo)
-        
-        # Aesthetic score analysis
-        aesthetic_score = self._analyze_aesthetics(photo)
-        
-        # Calculate weighted overall score
-        overall_score = (
-            focus_score * self.focus_weight +
-            exposure_score * self.exposure_weight +
-            composition_score * self.composition_weight +
-            technical_score * self.technical_weight +
-            aesthetic_score * self.aesthetic_weight
-        )
-        
-        # Calculate confidence based on data completeness
-        confidence = self._calculate_confidence(photo, {
-            'focus': focus_score,
-            'exposure': exposure_score,
-            'composition': composition_score,
-            'technical': technical_score,
-            'aesthetic': aesthetic_score
-        })
-        
-        return CullingScore(
-            focus_score=focus_score,
-            exposure_score=exposure_score,
-            composition_score=composition_score,
-            technical_score=technical_score,
-            aesthetic_score=aesthetic_score,
-            overall_score=overall_score,
-            confidence=confidence
-        )
+        return self._rows_to_scores(self.score_features(build_feature_matrix([photo])))[0]
     
     def _analyze_focus(self, photo: Dict[str, Any]) -> float:
         """Analyze focus quality from EXIF metadata."""
-        exif = photo.get('exif', {})
-        focus_score = 50.0  # Default neutral score
-        
-        # Check focus mode
-        focus_mode = exif.get('focusmode') or exif.get('afmode')
-        if focus_mode:
-            focus_modes_good = ['AF-S', 'Single', 'One Shot', 'AF-C', 'Continuous']
-            if any(good_mode in str(focus_mode) for good_mode in focus_modes_good):
-                focus_score += 15
-        
-        # Check AF points
-        af_points = exif.get('pointsinfocus') or exif.get('afpoints')
-        if af_points:
-            if isinstance(af_points, (list, str)):
-                if isinstance(af_points, str):
-                    try:
-                        af_count = int(af_points)
-                    except ValueError:
-                        af_count = 1
-                else:
-                    af_count = len(af_points)
-                
-                if af_count >= 1:
-                    focus_score += 10
-                if af_count > 1:
-                    focus_score += 5
-        
-        # Check face detection
-        face_detected = exif.get('facedetected')
-        if face_detected:
-            focus_score += 15
-        
-        # Check focus distance (if available)
-        focus_distance = exif.get('focusdistance')
-        if focus_distance:
-            try:
-                distance = float(focus_distance)
-                # Reasonable focus distances get higher scores
-                if 0.5 <= distance <= 10.0:
-                    focus_score += 10
-            except (ValueError, TypeError):
-                pass
-        
-        # Lens information
-        lens_model = exif.get('lensmodel')
-        if lens_model:
-            # Professional lenses tend to have better AF
-            pro_indicators = ['GM', 'L', 'Art', 'Pro', 'EX', 'DG']
-            if any(indicator in str(lens_model) for indicator in pro_indicators):
-                focus_score += 10
-        
-        return min(100.0, focus_score)
+        return self._score_photo(photo).focus_score
     
     def _analyze_exposure(self, photo: Dict[str, Any]) -> float:
         """Analyze exposure quality from EXIF metadata."""
-        exif = photo.get('exif', {})
-        exposure_score = 50.0  # Default neutral score
-        
-        # ISO analysis
-        iso = exif.get('isospeedratings') or exif.get('iso')
-        if iso:
-            try:
-                iso_val = float(iso)
-                if iso_val <= 100:
-                    exposure_score += 20  # Base ISO is best
-                elif iso_val <= 400:
-                    exposure_score += 15
-                elif iso_val <= 800:
-                    exposure_score += 10
-                elif iso_val <= 1600:
-                    exposure_score += 5
-                else:
-                    exposure_score -= 10  # High ISO penalty
-            except (ValueError, TypeError):
-                pass
-        
-        # Aperture analysis
-        fnumber = exif.get('fnumber')
-        if fnumber:
-            try:
-                aperture = float(fnumber)
-                # Sweet spot for most lenses
-                if 2.8 <= aperture <= 8.0:
-                    exposure_score += 15
-                elif 1.4 <= aperture <= 11.0:
-                    exposure_score += 10
-                else:
-                    exposure_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Shutter speed analysis
-        exposure_time = exif.get('exposuretime')
-        if exposure_time:
-            try:
-                shutter = float(exposure_time)
-                # Reasonable shutter speeds
-                if 0.001 <= shutter <= 0.5:
-                    exposure_score += 15
-                elif 0.0001 <= shutter < 0.001:
-                    exposure_score += 10  # Fast but acceptable
-                elif 0.5 < shutter <= 2.0:
-                    exposure_score += 10  # Slow but acceptable
-                else:
-                    exposure_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Exposure compensation
-        exposure_bias = exif.get('exposurebiasvalue')
-        if exposure_bias:
-            try:
-                bias = float(exposure_bias)
-                # Minimal compensation is good
-                if abs(bias) <= 0.3:
-                    exposure_score += 10
-                elif abs(bias) <= 1.0:
-                    exposure_score += 5
-                else:
-                    exposure_score -= 5  # Heavy compensation
-            except (ValueError, TypeError):
-                pass
-        
-        return min(100.0, max(0.0, exposure_score))
+        return self._score_photo(photo).exposure_score
     
     def _analyze_composition(self, photo: Dict[str, Any]) -> float:
         """Analyze composition based on available metadata."""
-        exif = photo.get('exif', {})
-        composition_score = 50.0  # Default neutral score
-        
-        # Aspect ratio analysis
-        width = photo.get('width')
-        height = photo.get('height')
-        if width and height:
-            try:
-                aspect_ratio = float(width) / float(height)
-                
-                # Common artistic aspect ratios
-                if abs(aspect_ratio - 1.618) < 0.1:  # Golden ratio
-                    composition_score += 20
-                elif abs(aspect_ratio - 1.5) < 0.1:  # 3:2
-                    composition_score += 15
-                elif abs(aspect_ratio - 1.333) < 0.1:  # 4:3
-                    composition_score += 10
-                elif abs(aspect_ratio - 1.0) < 0.1:  # Square
-                    composition_score += 10
-                elif abs(aspect_ratio - 2.333) < 0.1:  # 21:9 cinema
-                    composition_score += 15
-                else:
-                    composition_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Face detection in composition
-        face_detected = exif.get('facedetected')
-        face_count = exif.get('facecount')
-        if face_detected:
-            composition_score += 10
-            if face_count:
-                try:
-                    count = int(face_count)
-                    if 1 <= count <= 3:  # Good number of subjects
-                        composition_score += 15
-                    elif 4 <= count <= 6:
-                        composition_score += 10
-                    else:
-                        composition_score += 5
-                except (ValueError, TypeError):
-                    pass
-        
-        # Scene detection
-        scene_type = exif.get('scenecapturetype')
-        if scene_type:
-            # Certain scene types indicate better composition
-            good_scenes = ['Portrait', 'Landscape', 'Night Scene']
-            if any(scene in str(scene_type) for scene in good_scenes):
-                composition_score += 10
-        
-        return min(100.0, composition_score)
+        return self._score_photo(photo).composition_score
     
     def _analyze_technical_quality(self, photo: Dict[str, Any]) -> float:
         """Analyze technical quality of the photo."""
-        exif = photo.get('exif', {})
-        technical_score = 50.0  # Default neutral score
-        
-        # Resolution analysis
-        width = photo.get('width')
-        height = photo.get('height')
-        if width and height:
-            try:
-                megapixels = float(width) * float(height) / 1_000_000
-                
-                if megapixels >= 20:
-                    technical_score += 25
-                elif megapixels >= 12:
-                    technical_score += 20
-                elif megapixels >= 8:
-                    technical_score += 15
-                elif megapixels >= 4:
-                    technical_score += 10
-                else:
-                    technical_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Color depth
-        bits_per_sample = exif.get('bitspersample')
-        if bits_per_sample:
-            try:
-                bits = float(bits_per_sample)
-                if bits >= 14:
-                    technical_score += 15
-                elif bits >= 12:
-                    technical_score += 10
-                elif bits >= 10:
-                    technical_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Camera make/model (professional cameras tend to produce better quality)
-        make = exif.get('make')
-        model = exif.get('model')
-        if make and model:
-            make_str = str(make).upper()
-            model_str = str(model).upper()
-            
-            # Professional camera indicators
-            pro_indicators = ['EOS R', 'EOS-1D', 'D5', 'D850', 'A7R', 'A9', ' GFX', 'Hasselblad', 'Leica']
-            if any(indicator in model_str for indicator in pro_indicators):
-                technical_score += 15
-            elif any(indicator in make_str for indicator in ['CANON', 'NIKON', 'SONY', 'FUJIFILM']):
-                technical_score += 10
-            else:
-                technical_score += 5
-        
-        # Lens quality
-        lens_model = exif.get('lensmodel')
-        if lens_model:
-            lens_str = str(lens_model).upper()
-            pro_lens_indicators = ['GM', 'L', 'ART', 'PRO', 'OTUS', 'MASTER', 'DG']
-            if any(indicator in lens_str for indicator in pro_lens_indicators):
-                technical_score += 10
-        
-        return min(100.0, technical_score)
+        return self._score_photo(photo).technical_score
     
     def _analyze_aesthetics(self, photo: Dict[str, Any]) -> float:
         """Analyze aesthetic qualities (limited by metadata)."""
-        exif = photo.get('exif', {})
-        aesthetic_score = 50.0  # Default neutral score
-        
-        # Subject distance estimation
-        subject_distance = exif.get('subjectdistance')
-        if subject_distance:
-            try:
-                distance = float(subject_distance)
-                # Portrait-friendly distances
-                if 0.5 <= distance <= 3.0:
-                    aesthetic_score += 15
-                elif 3.0 < distance <= 10.0:
-                    aesthetic_score += 10
-            except (ValueError, TypeError):
-                pass
-        
-        # Focal length (affects perspective and aesthetics)
-        focal_length = exif.get('focallength')
-        if focal_length:
-            try:
-                fl = float(focal_length)
-                # Classic portrait and landscape focal lengths
-                if 35 <= fl <= 85:  # Classic range
-                    aesthetic_score += 15
-                elif 24 <= fl < 35:  # Wide angle
-                    aesthetic_score += 10
-                elif 85 < fl <= 135:  # Short telephoto
-                    aesthetic_score += 10
-                else:
-                    aesthetic_score += 5
-            except (ValueError, TypeError):
-                pass
-        
-        # Flash usage (aesthetic consideration)
-        flash = exif.get('flash')
-        if flash:
-            flash_str = str(flash)
-            if 'Off' in flash_str or 'Did not fire' in flash_str:
-                aesthetic_score += 10  # Natural light often better
-            else:
-                aesthetic_score += 5  # Fill flash can be good too
-        
-        return min(100.0, aesthetic_score)
-    
-    def _calculate_confidence(self, photo: Dict[str, Any], scores: Dict[str, float]) -> float:
-        """Calculate confidence in the scoring based on data completeness."""
-        exif = photo.get('exif', {})
-        
-        # Check availability of key metadata
-        available_fields = 0
-        total_fields = 0
-        
-        # Focus-related fields
-        focus_fields = ['focusmode', 'afmode', 'pointsinfocus', 'afpoints', 'facedetected']
-        total_fields += len(focus_fields)
-        for field in focus_fields:
-            if exif.get(field):
-                available_fields += 1
-        
-        # Exposure-related fields
-        exposure_fields = ['isospeedratings', 'iso', 'fnumber', 'exposuretime', 'exposurebiasvalue']
-        total_fields += len(exposure_fields)
-        for field in exposure_fields:
-            if exif.get(field):
-                available_fields += 1
-        
-        # Composition-related fields
-        comp_fields = ['scenecapturetype', 'facecount']
-        total_fields += len(comp_fields)
-        for field in comp_fields:
-            if exif.get(field):
-                available_fields += 1
-        
-        # Basic image properties
-        if photo.get('width') and photo.get('height'):
-            available_fields += 1
-        total_fields += 1
-        
-        # Calculate base confidence from metadata completeness
-        base_confidence = available_fields / total_fields if total_fields > 0 else 0.5
-        
-        # Adjust based on score consistency
-        score_values = list(scores.values())
-        if score_values:
-            score_std = np.std(score_values)
-            # Lower standard deviation = more consistent scoring = higher confidence
-            consistency_factor = max(0.5, 1.0 - (score_std / 50.0))
-        else:
-            consistency_factor = 0.5
-        
-        # Combine factors
-        confidence = (base_confidence * 0.7 + consistency_factor * 0.3)
-        
-        return min(1.0, max(0.1, confidence))
+        return self._score_photo(photo).aesthetic_score
     
     def _select_best_shot(self, scores: List[CullingScore]) -> int:
         """Select the best shot from a group based on scores."""
@@ -20,6 +20,12 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import decode_png_text, get_segment_directory
+except ImportError:
+    from formats.segment_directory import decode_png_text, get_segment_directory
+from .xmp_packets import XmpTable, get_xmp_table
+
 logger = logging.getLogger(__name__)
 
 STABLE_DIFFUSION_KEYWORDS = [
@@ -48,8 +54,9 @@ class AIGenerationDetector:
 
     def __init__(self, filepath: str):
         self.filepath = filepath
-        self.file_data: Optional[bytes] = None
+        self.segments = None
         self.xmp_data: Optional[str] = None
+        self.xmp_table: Optional[XmpTable] = None
         self.exif_data: Optional[Dict[str, Any]] = None
         self.png_text_chunks: Dict[str, str] = {}
         self.webp_exif: Optional[Dict[str, Any]] = None
@@ -104,51 +111,35 @@ class AIGenerationDetector:
             return {"error": str(e), "ai_detected": False}
 
     def _load_file_data(self):
-        """Load file data for analysis"""
+        """Map the file's segments and read only the metadata payloads"""
         file_path = Path(self.filepath)
         if not file_path.exists():
             return
 
-        with open(self.filepath, 'rb') as f:
-            self.file_data = f.read()
-
-        if self.file_data[:8] == b'\x89PNG\r\n\x1a\n':
-            self._parse_png_chunks()
-        elif self.file_data[:4] == b'RIFF' and self.file_data[8:12] == b'WEBP':
-            self._parse_webp_chunks()
+        self.segments = get_segment_directory(self.filepath)
+        if self.segments is not None:
+            if self.segments.container == 'PNG':
+                self._parse_png_chunks()
+            elif self.segments.container == 'RIFF' and self.segments.form == 'WEBP':
+                self._parse_webp_chunks()
 
-        self._extract_xmp_from_png()
+        self._load_xmp()
 
     def _parse_png_chunks(self):
         """Parse PNG chunks for metadata"""
-        if not self.file_data or len(self.file_data) < 8:
-            return
-
-        offset = 8
-        while offset < len(self.file_data) - 12:
-            length = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-            chunk_type = self.file_data[offset + 4:offset + 8].decode('latin-1')
-
-            chunk_data = self.file_data[offset + 8:offset + 8 + length]
-
-            if chunk_type == 'tEXt':
-                null_pos = chunk_data.find(b'\x00')
-                if null_pos > 0:
-                    keyword = chunk_data[:null_pos].decode('latin-1', errors='replace')
-                    text_data = chunk_data[null_pos + 1:]
-                    try:
-                        self.png_text_chunks[keyword] = text_data.decode('latin-1', errors='replace')
-                    except:
-                        pass
-            elif chunk_type == 'iTXt':
+        wanted = [s for s in self.segments if s.kind in ('tEXt', 'iTXt', 'eXIf')]
+        for segment, chunk_data in zip(wanted, self.segments.read_all(wanted)):
+            if segment.kind == 'eXIf':
+                self._parse_exif_from_png(chunk_data)
+            elif segment.kind == 'iTXt':
+                decoded = decode_png_text('iTXt', chunk_data)
+                if decoded:
+                    self.png_text_chunks[decoded[0]] = decoded[1]
+            else:
                 null_pos = chunk_data.find(b'\x00')
                 if null_pos > 0:
                     keyword = chunk_data[:null_pos].decode('latin-1', errors='replace')
-                    self.png_text_chunks[keyword] = chunk_data.decode('latin-1', errors='replace')
-            elif chunk_type == 'eXIf':
-                self._parse_exif_from_png(chunk_data)
-
-            offset += 12 + length
+                    self.png_text_chunks[keyword] = chunk_data[null_pos + 1:].decode('latin-1', errors='replace')
 
     def _parse_exif_from_png(self, data: bytes):
         """Parse EXIF data from PNG eXIf chunk"""
@@ -239,25 +230,15 @@ class AIGenerationDetector:
 
     def _parse_webp_chunks(self):
         """Parse WebP chunks for EXIF"""
-        if not self.file_data or len(self.file_data) < 12:
-            return
+        exif_chunk = self.segments.find('EXIF')
+        if exif_chunk is not None:
+            self.webp_exif = self._parse_exif_bytes(self.segments.read(exif_chunk))
 
-        offset = 12
-        while offset < len(self.file_data) - 8:
-            fourcc = self.file_data[offset:offset + 4].decode('latin-1', errors='replace')
-            length = struct.unpack('<I', self.file_data[offset + 4:offset + 8])[0]
-
-            if fourcc == 'EXIF':
-                exif_data = self.file_data[offset + 8:offset + 8 + length]
-                self.webp_exif = self._parse_exif_bytes(exif_data)
-                break
-            elif fourcc not in ['VP8 ', 'VP8L', 'VP8X', 'ANIM']:
-                offset += 8 + length
-
-    def _extract_xmp_from_png(self):
-        """Extract XMP data from PNG"""
-        if 'XML:com.adobe.xmp' in self.png_text_chunks:
-            self.xmp_data = self.png_text_chunks['XML:com.adobe.xmp']
+    def _load_xmp(self):
+        """Load XMP from the shared packet table (any container)"""
+        self.xmp_table = get_xmp_table(self.filepath)
+        if self.xmp_table:
+            self.xmp_data = self.xmp_table.text_data
 
     def _detect_stable_diffusion(self) -> Optional[Dict[str, Any]]:
         """Detect and extract Stable Diffusion parameters"""
@@ -302,50 +283,54 @@ class AIGenerationDetector:
 
     def _parse_sd_from_xmp(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Stable Diffusion data from XMP"""
-        if not self.xmp_data:
+        if not self.xmp_table:
             return result
 
         try:
-            if 'Prompt' in self.xmp_data or 'prompt' in self.xmp_data.lower():
-                prompt_match = re.search(r'<rdf:li[^>]*>([^<]+)</rdf:li>',
-                                         self.xmp_data, re.IGNORECASE)
-                if prompt_match:
-                    result["prompt"] = prompt_match.group(1).strip()
+            # Generators write their parameter block into these properties
+            descriptions = (self.xmp_table.values('dc:description')
+                            + self.xmp_table.values('exif:UserComment')
+                            + self.xmp_table.values('tiff:ImageDescription'))
+            if not descriptions:
+                return result
+            text = "\n".join(descriptions)
+
+            if 'prompt' in text.lower() or 'Steps' in text:
+                result["prompt"] = descriptions[0].split('\n')[0].strip()
 
-            seed_match = re.search(r'Seed["\s]*:?\s*(\d+)', self.xmp_data)
+            seed_match = re.search(r'Seed["\s]*:?\s*(\d+)', text)
             if seed_match:
                 result["seed"] = int(seed_match.group(1))
 
-            steps_match = re.search(r'Steps["\s]*:?\s*(\d+)', self.xmp_data)
+            steps_match = re.search(r'Steps["\s]*:?\s*(\d+)', text)
             if steps_match:
                 result["steps"] = int(steps_match.group(1))
 
-            cfg_match = re.search(r'CFG\s*Scale["\s]*:?\s*([\d.]+)', self.xmp_data)
+            cfg_match = re.search(r'CFG\s*Scale["\s]*:?\s*([\d.]+)', text)
             if cfg_match:
                 result["cfg_scale"] = float(cfg_match.group(1))
 
-            sampler_match = re.search(r'Sampler["\s]*:?\s*(\w+)', self.xmp_data)
+            sampler_match = re.search(r'Sampler["\s]*:?\s*(\w+)', text)
             if sampler_match:
                 result["sampler"] = sampler_match.group(1)
 
-            model_match = re.search(r'Model["\s]*:?\s*([^,\n]+)', self.xmp_data)
+            model_match = re.search(r'Model["\s]*:?\s*([^,\n]+)', text)
             if model_match:
                 result["model"] = model_match.group(1).strip()
 
-            negative_match = re.search(r'Negative\s*prompt[:\s]*([^<]+)',
-                                       self.xmp_data, re.IGNORECASE)
+            negative_match = re.search(r'Negative\s*prompt[:\s]*([^\n]+)',
+                                       text, re.IGNORECASE)
             if negative_match:
                 result["negative_prompt"] = negative_match.group(1).strip()
 
-            lora_matches = re.findall(r'<[^>]+lora:([^:<]+):([\d.]+)[^>]*>',
-                                      self.xmp_data, re.IGNORECASE)
+            lora_matches = re.findall(r'<lora:([^:>]+):([\d.]+)>', text, re.IGNORECASE)
             for lora_name, lora_weight in lora_matches:
                 result["loras"].append({
                     "name": lora_name.strip(),
                     "weight": float(lora_weight)
                 })
 
-            size_match = re.search(r'(\d+)\s*[xX×]\s*(\d+)', self.xmp_data)
+            size_match = re.search(r'(\d+)\s*[xX×]\s*(\d+)', text)
             if size_match:
                 result["size"] = f"{size_match.group(1)}x{size_match.group(2)}"
 
@@ -546,7 +531,8 @@ class AIGenerationDetector:
 
         c2pa_manifests = []
 
-        if self.xmp_data and XMP_C2PA_NAMESPACE in self.xmp_data:
+        if self.xmp_table and any(uri.startswith(XMP_C2PA_NAMESPACE)
+                                  for uri in self.xmp_table.prefixes.values()):
             result["present"] = True
             c2pa_manifests.append(self.xmp_data)
 
@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Streaming Audio Feature Engine
+
+Decodes an audio file once, block by block, and derives every spectral
+feature used by advanced_audio_ultimate from a single shared STFT:
+- Block decode through soundfile, the stdlib wave reader (PCM WAV) or an
+  ffmpeg f32le PCM pipe, with librosa.load only as a last resort
+- Optional analysis-rate downsampling (ffmpeg resamples; other decoders
+  decimate by an integer factor)
+- Per-frame magnitude/power spectra feed running moments for spectral
+  centroid/bandwidth/rolloff, mel/MFCC, chroma and mel flatness, plus an
+  accumulated average spectrum for band-energy ratios
+- Time-domain RMS/peak/clipping/silence/zero-crossing counters and
+  optional block-wise YIN pitch tracking
+
+Peak memory is bounded by the block size; the only per-file arrays kept are
+the onset envelope (one float32 per hop) used for onset and tempo detection.
+
+Usage:
+    from .audio_feature_stream import analyze_audio_stream
+    features = analyze_audio_stream(path, analysis_sr=22050)
+    if features is not None:
+        print(features.spectral["centroid"].mean())
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import wave
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import librosa
+    LIBROSA_AVAILABLE = True
+except ImportError:
+    LIBROSA_AVAILABLE = False
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+FFPROBE_PATH = shutil.which("ffprobe")
+
+DEFAULT_N_FFT = 2048
+DEFAULT_HOP_LENGTH = 512
+# STFT hops decoded per block; 2048 hops at 44.1 kHz is ~24 s of audio
+DEFAULT_BLOCK_HOPS = 2048
+
+CLIPPING_THRESHOLD = 0.99
+SILENCE_THRESHOLD = 0.01
+ROLLOFF_PERCENT = 0.85
+AMIN = 1e-10
+
+# Approximate Bark scale critical band edges (Hz)
+BARK_EDGES = [0, 100, 200, 300, 400, 510, 630, 770, 920, 1080,
+              1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700,
+              4400, 5300, 6400, 7700, 9500, 12000, 15500]
+
+
+class RunningMoments:
+    """Count/sum/sum-of-squares/min/max accumulator over scalars or vectors."""
+
+    def __init__(self, width: int = 1):
+        self.count = 0
+        self.total = np.zeros(width)
+        self.squares = np.zeros(width)
+        self.minimum = np.full(width, np.inf)
+        self.maximum = np.full(width, -np.inf)
+
+    def update(self, values: "np.ndarray") -> None:
+        """Add rows of shape (n,) or (n, width)."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        if not values.size:
+            return
+        self.count += values.shape[0]
+        self.total += values.sum(axis=0)
+        self.squares += np.square(values).sum(axis=0)
+        np.minimum(self.minimum, values.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, values.max(axis=0), out=self.maximum)
+
+    def mean(self) -> "np.ndarray":
+        return self.total / self.count if self.count else np.zeros_like(self.total)
+
+    def std(self) -> "np.ndarray":
+        if not self.count:
+            return np.zeros_like(self.total)
+        mean = self.mean()
+        return np.sqrt(np.maximum(self.squares / self.count - mean * mean, 0.0))
+
+
+@dataclass
+class AudioFeatures:
+    """Accumulated result of one streamed decode."""
+
+    sample_rate: int
+    native_sample_rate: int
+    channels: int
+    decoder: str
+    n_fft: int
+    hop_length: int
+    total_samples: int = 0
+    sum_squares: float = 0.0
+    peak: float = 0.0
+    maximum: float = 0.0
+    minimum: float = 0.0
+    zero_crossings: int = 0
+    clipped_samples: int = 0
+    silent_samples: int = 0
+    frames: int = 0
+    spectrum_sum: Optional["np.ndarray"] = None
+    spectral: Dict[str, RunningMoments] = field(default_factory=dict)
+    mel: Dict[str, RunningMoments] = field(default_factory=dict)
+    mfcc: Optional[RunningMoments] = None
+    chroma: Optional[RunningMoments] = None
+    f0: Optional[RunningMoments] = None
+    f0_frames: int = 0
+    onset_envelope: Optional["np.ndarray"] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def rms(self) -> float:
+        return float(np.sqrt(self.sum_squares / self.total_samples)) if self.total_samples else 0.0
+
+    @property
+    def zero_crossing_rate(self) -> float:
+        return self.zero_crossings / self.total_samples if self.total_samples else 0.0
+
+    def band_energy(self, low: float, high: float) -> float:
+        """Summed average-spectrum magnitude between low and high Hz."""
+        if self.spectrum_sum is None:
+            return 0.0
+        freqs = np.fft.rfftfreq(self.n_fft, 1.0 / self.sample_rate)
+        return float(self.spectrum_sum[(freqs >= low) & (freqs <= high)].sum())
+
+    def onset_times(self) -> "np.ndarray":
+        """Onset times in seconds, peak-picked from the streamed onset envelope."""
+        if not LIBROSA_AVAILABLE or self.onset_envelope is None or len(self.onset_envelope) < 2:
+            return np.empty(0)
+        frames = librosa.onset.onset_detect(
+            onset_envelope=self.onset_envelope.astype(np.float64),
+            sr=self.sample_rate, hop_length=self.hop_length,
+        )
+        return librosa.frames_to_time(frames, sr=self.sample_rate, hop_length=self.hop_length)
+
+    def beats(self) -> Tuple[Optional[float], "np.ndarray"]:
+        """(tempo_bpm, beat_times) from the streamed onset envelope."""
+        if not LIBROSA_AVAILABLE or self.onset_envelope is None or len(self.onset_envelope) < 2:
+            return None, np.empty(0)
+        tempo, beat_frames = librosa.beat.beat_track(
+            onset_envelope=self.onset_envelope.astype(np.float64),
+            sr=self.sample_rate, hop_length=self.hop_length,
+        )
+        tempo = float(np.atleast_1d(tempo)[0])
+        return tempo, librosa.frames_to_time(beat_frames, sr=self.sample_rate, hop_length=self.hop_length)
+
+
+class AudioFeatureStream:
+    """
+    Incremental STFT feature accumulator.
+
+    Feed mono float32 blocks of any length with feed(); finish() flushes the
+    trailing centre-padded frames and returns the AudioFeatures. Frames line
+    up with librosa.stft(center=True, pad_mode="constant").
+    """
+
+    def __init__(self, sample_rate: int, native_sample_rate: Optional[int] = None,
+                 channels: int = 1, decoder: str = "array",
+                 n_fft: int = DEFAULT_N_FFT, hop_length: int = DEFAULT_HOP_LENGTH,
+                 n_mels: int = 128, n_mfcc: int = 13, pitch: bool = False):
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.pitch = pitch and LIBROSA_AVAILABLE
+        self.features = AudioFeatures(
+            sample_rate=sample_rate,
+            native_sample_rate=native_sample_rate or sample_rate,
+            channels=channels,
+            decoder=decoder,
+            n_fft=n_fft,
+            hop_length=hop_length,
+            spectrum_sum=np.zeros(n_fft // 2 + 1),
+            spectral={name: RunningMoments() for name in ("centroid", "bandwidth", "rolloff")},
+        )
+
+        # Periodic Hann window, as used by librosa/scipy for STFTs
+        self._window = np.hanning(n_fft + 1)[:-1].astype(np.float32)
+        self._freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+        self._carry = np.zeros(n_fft // 2, dtype=np.float32)
+        self._last_sample: Optional[float] = None
+        self._onsets: List["np.ndarray"] = []
+        self._last_mel_db: Optional["np.ndarray"] = None
+
+        self._mel_basis = self._chroma_basis = self._dct = None
+        if LIBROSA_AVAILABLE:
+            self._mel_basis = librosa.filters.mel(sr=sample_rate, n_fft=n_fft, n_mels=n_mels)
+            # Called with only S=, librosa's spectral centroid/rolloff treat the
+            # mel bands as linear FFT bins at its default 22050 Hz; the mel
+            # features reproduce that reading so their values stay comparable.
+            self._mel_freqs = librosa.fft_frequencies(sr=22050, n_fft=2 * (n_mels - 1))
+            self._chroma_basis = librosa.filters.chroma(sr=sample_rate, n_fft=n_fft, tuning=0.0)
+            self._dct = _dct_basis(n_mfcc, n_mels)
+            f = self.features
+            f.mfcc = RunningMoments(n_mfcc)
+            f.chroma = RunningMoments(self._chroma_basis.shape[0])
+            f.mel = {name: RunningMoments() for name in ("centroid", "rolloff", "flatness")}
+            if self.pitch:
+                f.f0 = RunningMoments()
+
+    def feed(self, block: "np.ndarray") -> None:
+        block = np.asarray(block, dtype=np.float32).ravel()
+        if not block.size:
+            return
+        self._time_domain(block)
+        if self.pitch and block.size >= self.n_fft:
+            f0 = librosa.yin(block, fmin=50, fmax=400, sr=self.features.sample_rate,
+                             frame_length=self.n_fft, hop_length=self.hop_length)
+            self.features.f0_frames += len(f0)
+            self.features.f0.update(f0[f0 > 0])
+
+        buf = np.concatenate([self._carry, block])
+        self._carry = self._frames(buf)
+
+    def finish(self) -> AudioFeatures:
+        buf = np.concatenate([self._carry, np.zeros(self.n_fft // 2, dtype=np.float32)])
+        self._frames(buf)
+        self._carry = np.zeros(0, dtype=np.float32)
+        f = self.features
+        f.onset_envelope = np.concatenate(self._onsets) if self._onsets else np.zeros(0, dtype=np.float32)
+        self._onsets = []
+        return f
+
+    def _time_domain(self, block: "np.ndarray") -> None:
+        f = self.features
+        magnitude = np.abs(block)
+        first = f.total_samples == 0
+        f.total_samples += block.size
+        f.sum_squares += float(np.dot(block.astype(np.float64), block))
+        f.peak = max(f.peak, float(magnitude.max()))
+        f.maximum = float(block.max()) if first else max(f.maximum, float(block.max()))
+        f.minimum = float(block.min()) if first else min(f.minimum, float(block.min()))
+        f.clipped_samples += int(np.count_nonzero(magnitude > CLIPPING_THRESHOLD))
+        f.silent_samples += int(np.count_nonzero(magnitude < SILENCE_THRESHOLD))
+
+        signs = np.signbit(block)
+        f.zero_crossings += int(np.count_nonzero(signs[1:] != signs[:-1]))
+        if self._last_sample is not None and signs[0] != np.signbit(self._last_sample):
+            f.zero_crossings += 1
+        self._last_sample = float(block[-1])
+
+    def _frames(self, buf: "np.ndarray") -> "np.ndarray":
+        """Process every full frame in buf and return the unconsumed tail."""
+        if buf.size < self.n_fft:
+            return buf
+        count = 1 + (buf.size - self.n_fft) // self.hop_length
+        windows = np.lib.stride_tricks.sliding_window_view(buf, self.n_fft)[::self.hop_length][:count]
+        self._spectra(np.abs(np.fft.rfft(windows * self._window, axis=1)))
+        return buf[count * self.hop_length:].copy()
+
+    def _spectra(self, magnitude: "np.ndarray") -> None:
+        f = self.features
+        f.frames += magnitude.shape[0]
+        f.spectrum_sum += magnitude.sum(axis=0)
+
+        norm = magnitude.sum(axis=1, keepdims=True)
+        weights = magnitude / np.maximum(norm, AMIN)
+        centroid = weights @ self._freqs
+        bandwidth = np.sqrt((weights * np.square(self._freqs[None, :] - centroid[:, None])).sum(axis=1))
+        cumulative = np.cumsum(magnitude, axis=1)
+        rolloff_bin = np.argmax(cumulative >= ROLLOFF_PERCENT * cumulative[:, -1:], axis=1)
+        f.spectral["centroid"].update(centroid)
+        f.spectral["bandwidth"].update(bandwidth)
+        f.spectral["rolloff"].update(self._freqs[rolloff_bin])
+
+        if self._mel_basis is None:
+            return
+        power = np.square(magnitude)
+
+        mel = power @ self._mel_basis.T
+        mel_norm = mel / np.maximum(mel.sum(axis=1, keepdims=True), AMIN)
+        mel_cumulative = np.cumsum(mel, axis=1)
+        mel_floor = np.maximum(mel, AMIN)
+        # librosa.feature.spectral_flatness squares its input (power=2.0)
+        mel_squared = np.maximum(np.square(mel), AMIN)
+        f.mel["centroid"].update(mel_norm @ self._mel_freqs)
+        f.mel["rolloff"].update(self._mel_freqs[np.argmax(mel_cumulative >= ROLLOFF_PERCENT * mel_cumulative[:, -1:], axis=1)])
+        f.mel["flatness"].update(np.exp(np.log(mel_squared).mean(axis=1)) / mel_squared.mean(axis=1))
+
+        mel_db = 10.0 * np.log10(mel_floor)
+        f.mfcc.update(mel_db @ self._dct.T)
+
+        previous = mel_db[:1] if self._last_mel_db is None else self._last_mel_db
+        flux = np.maximum(np.diff(np.vstack([previous, mel_db]), axis=0), 0.0).mean(axis=1)
+        self._onsets.append(flux.astype(np.float32))
+        self._last_mel_db = mel_db[-1:]
+
+        chroma = power @ self._chroma_basis.T
+        chroma /= np.maximum(chroma.max(axis=1, keepdims=True), AMIN)
+        f.chroma.update(chroma)
+
+
+def _dct_basis(n_out: int, n_in: int) -> "np.ndarray":
+    """Orthonormal DCT-II matrix (n_out, n_in), matching scipy's norm='ortho'."""
+    k = np.arange(n_out)[:, None]
+    n = np.arange(n_in)[None, :]
+    basis = np.cos(np.pi / n_in * (n + 0.5) * k) * np.sqrt(2.0 / n_in)
+    basis[0] /= np.sqrt(2.0)
+    return basis
+
+
+# ---------------------------------------------------------------------------
+# Block decoders
+# ---------------------------------------------------------------------------
+
+BlockSource = Tuple[int, int, str, Callable[[int], Iterator["np.ndarray"]]]
+
+
+def _soundfile_source(filepath: str) -> Optional[BlockSource]:
+    if not SOUNDFILE_AVAILABLE:
+        return None
+    try:
+        info = sf.info(filepath)
+    except Exception:
+        return None
+
+    def blocks(block_samples: int) -> Iterator["np.ndarray"]:
+        with sf.SoundFile(filepath) as f:
+            for block in f.blocks(blocksize=block_samples, dtype="float32", always_2d=True):
+                yield block.mean(axis=1)
+
+    return int(info.samplerate), int(info.channels), "soundfile", blocks
+
+
+_WAVE_DTYPES = {1: "u1", 2: "<i2", 4: "<i4"}
+
+
+def _wave_source(filepath: str) -> Optional[BlockSource]:
+    if os.path.splitext(filepath)[1].lower() not in (".wav", ".wave"):
+        return None
+    try:
+        with wave.open(filepath, "rb") as w:
+            rate, channels, width = w.getframerate(), w.getnchannels(), w.getsampwidth()
+    except (wave.Error, EOFError, OSError):
+        return None
+    if width not in (1, 2, 3, 4):
+        return None
+
+    def blocks(block_samples: int) -> Iterator["np.ndarray"]:
+        scale = float(1 << (8 * width - 1))
+        with wave.open(filepath, "rb") as w:
+            while True:
+                raw = w.readframes(block_samples)
+                if not raw:
+                    return
+                if width == 3:
+                    packed = np.frombuffer(raw, dtype="u1").reshape(-1, 3).astype(np.int32)
+                    ints = (packed[:, 0] | (packed[:, 1] << 8) | (packed[:, 2] << 16)) << 8 >> 8
+                    samples = ints.astype(np.float32)
+                else:
+                    samples = np.frombuffer(raw, dtype=_WAVE_DTYPES[width]).astype(np.float32)
+                    if width == 1:
+                        samples -= 128.0
+                samples = samples.reshape(-1, channels) / scale
+                yield samples.mean(axis=1)
+
+    return rate, channels, "wave", blocks
+
+
+def _probe_audio(filepath: str) -> Optional[Tuple[int, int]]:
+    if not FFPROBE_PATH:
+        return None
+    cmd = [FFPROBE_PATH, "-v", "error", "-select_streams", "a:0",
+           "-show_entries", "stream=sample_rate,channels", "-of", "csv=p=0", filepath]
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    parts = out.stdout.strip().split(",")
+    if out.returncode != 0 or len(parts) < 2 or not parts[0].isdigit():
+        return None
+    return int(parts[0]), int(parts[1]) if parts[1].isdigit() else 1
+
+
+def _ffmpeg_source(filepath: str, analysis_sr: Optional[int]) -> Optional[BlockSource]:
+    if not FFMPEG_PATH:
+        return None
+    probed = _probe_audio(filepath)
+    if probed is None:
+        return None
+    native_sr, channels = probed
+    rate = analysis_sr if analysis_sr and analysis_sr < native_sr else native_sr
+
+    def blocks(block_samples: int) -> Iterator["np.ndarray"]:
+        cmd = [FFMPEG_PATH, "-v", "error", "-nostdin", "-i", filepath, "-vn",
+               "-f", "f32le", "-ac", "1", "-ar", str(rate), "pipe:1"]
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        pending = b""
+        try:
+            while True:
+                chunk = proc.stdout.read(block_samples * 4)
+                if not chunk:
+                    break
+                chunk = pending + chunk
+                usable = len(chunk) - len(chunk) % 4
+                pending = chunk[usable:]
+                if usable:
+                    yield np.frombuffer(chunk[:usable], dtype="<f4")
+        finally:
+            proc.stdout.close()
+            proc.kill()
+            proc.wait()
+
+    return native_sr, channels, "ffmpeg", blocks
+
+
+def _librosa_source(filepath: str) -> Optional[BlockSource]:
+    if not LIBROSA_AVAILABLE:
+        return None
+    # Last resort: one full decode, then fed through the same block path
+    y, sr = librosa.load(filepath, sr=None, mono=True)
+
+    def blocks(block_samples: int) -> Iterator["np.ndarray"]:
+        for start in range(0, len(y), block_samples):
+            yield y[start:start + block_samples]
+
+    return int(sr), 1, "librosa", blocks
+
+
+def _decimate(blocks: Iterator["np.ndarray"], factor: int) -> Iterator["np.ndarray"]:
+    """Integer-factor decimation with a boxcar anti-alias average, across block edges."""
+    pending = np.zeros(0, dtype=np.float32)
+    for block in blocks:
+        buf = np.concatenate([pending, block])
+        usable = buf.size - buf.size % factor
+        pending = buf[usable:]
+        if usable:
+            yield buf[:usable].reshape(-1, factor).mean(axis=1)
+    if pending.size:
+        yield np.array([pending.mean()], dtype=np.float32)
+
+
+def open_audio_blocks(filepath: str, analysis_sr: Optional[int] = None,
+                      block_samples: int = DEFAULT_HOP_LENGTH * DEFAULT_BLOCK_HOPS
+                      ) -> Optional[Tuple[int, int, int, str, Iterator["np.ndarray"]]]:
+    """
+    Open a mono float32 block stream.
+
+    Returns:
+        (sample_rate, native_sample_rate, channels, decoder, blocks), or None
+        if no decoder can read the file
+    """
+    source = _soundfile_source(filepath) or _wave_source(filepath)
+    if source is None:
+        source = _ffmpeg_source(filepath, analysis_sr)
+        if source is not None:
+            native_sr, channels, decoder, blocks = source
+            rate = analysis_sr if analysis_sr and analysis_sr < native_sr else native_sr
+            return rate, native_sr, channels, decoder, blocks(block_samples)
+        source = _librosa_source(filepath)
+    if source is None:
+        return None
+
+    native_sr, channels, decoder, blocks = source
+    factor = int(native_sr // analysis_sr) if analysis_sr and analysis_sr < native_sr else 1
+    if factor > 1:
+        return native_sr // factor, native_sr, channels, decoder, _decimate(blocks(block_samples * factor), factor)
+    return native_sr, native_sr, channels, decoder, blocks(block_samples)
+
+
+def analyze_audio_stream(
+    filepath: str,
+    analysis_sr: Optional[int] = None,
+    n_fft: int = DEFAULT_N_FFT,
+    hop_length: int = DEFAULT_HOP_LENGTH,
+    block_hops: int = DEFAULT_BLOCK_HOPS,
+    pitch: bool = False,
+) -> Optional[AudioFeatures]:
+    """
+    Decode an audio file once and accumulate all STFT-derived features.
+
+    Args:
+        filepath: Path to the audio file
+        analysis_sr: Optional lower analysis sample rate
+        n_fft: STFT window size
+        hop_length: STFT hop size
+        block_hops: Hops of audio decoded per block (bounds peak memory)
+        pitch: Also run block-wise YIN fundamental frequency tracking
+
+    Returns:
+        AudioFeatures, or None if NumPy is missing or the file cannot be decoded
+    """
+    if not NUMPY_AVAILABLE or not os.path.isfile(filepath):
+        return None
+    try:
+        opened = open_audio_blocks(filepath, analysis_sr, block_samples=block_hops * hop_length)
+    except Exception as e:
+        logger.debug(f"Audio decode failed for {filepath}: {e}")
+        return None
+    if opened is None:
+        return None
+    rate, native_sr, channels, decoder, blocks = opened
+
+    stream = AudioFeatureStream(
+        rate, native_sample_rate=native_sr, channels=channels, decoder=decoder,
+        n_fft=n_fft, hop_length=hop_length, pitch=pitch,
+    )
+    for block in blocks:
+        stream.feed(block)
+    features = stream.finish()
+    return features if features.total_samples else None
+
@@ -16,12 +16,18 @@ Author: MetaExtract Team
 Version: 1.0.0
 """
 
+import mmap
 import struct
 import logging
 import uuid
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import map_file
+except ImportError:
+    from formats.segment_directory import map_file
+
 logger = logging.getLogger(__name__)
 
 AVIF_SIGNATURE = b'ftyp'
@@ -116,8 +122,7 @@ class AVIFParser:
 
             self.file_size = file_path.stat().st_size
 
-            with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+            self.file_data = map_file(self.filepath)
 
             if len(self.file_data) < 12:
                 return {"error": "File too small", "success": False}
@@ -135,6 +140,10 @@ class AVIFParser:
         except Exception as e:
             logger.error(f"Error parsing AVIF/HEIF: {e}")
             return {"error": str(e), "success": False}
+        finally:
+            if isinstance(self.file_data, mmap.mmap):
+                self.file_data.close()
+                self.file_data = None
 
     def _parse_boxes(self, offset: int, end_offset: int):
         """Parse ISOBMFF boxes recursively"""
@@ -158,7 +167,14 @@ class AVIFParser:
             box_data_offset = offset + header_size
             box_data_end = min(offset + box_size, end_offset)
 
-            box_info = self._parse_box(box_type, self.file_data[box_data_offset:box_data_end])
+            if box_type == b'mdat':
+                # Only the size of the coded image data is reported, so it is
+                # not copied out of the mapping.
+                data_size = max(0, box_data_end - box_data_offset)
+                box_info = {"type": BOX_TYPE_MAP[b'mdat'], "type_raw": box_type.hex(),
+                            "size": data_size, "data_size": data_size}
+            else:
+                box_info = self._parse_box(box_type, self.file_data[box_data_offset:box_data_end])
             self.boxes.append(box_info)
 
             offset += box_size
@@ -8,6 +8,11 @@ import struct
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import get_segment_directory
+except ImportError:
+    from formats.segment_directory import get_segment_directory
+
 
 # C2PA Allowlist - critical fields only (avoid PII/PHI)
 C2PA_ALLOWLIST = {
@@ -217,6 +222,21 @@ def parse_adobe_cc_manifest(cc_data: bytes) -> Dict[str, Any]:
     return result
 
 
+# Segments that carry JUMBF in each container (JPEG APP11, PNG caBX, RIFF C2PA)
+JUMBF_CARRIERS = {"JPEG": ("APP11",), "PNG": ("caBX",), "RIFF": ("C2PA",)}
+
+
+def _jumbf_search_bytes(filepath: str) -> bytes:
+    """Bytes to search for JUMBF: only the carrier segments when the container is mapped."""
+    directory = get_segment_directory(filepath)
+    carriers = JUMBF_CARRIERS.get(directory.container) if directory is not None else None
+    if carriers:
+        segments = [s for s in directory if s.kind in carriers]
+        return b"".join(directory.read_all(segments))
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
 def find_jumbf_boxes(filepath: str) -> Dict[str, Any]:
     """
     Search for JUMBF boxes in image/video file.
@@ -236,8 +256,7 @@ def find_jumbf_boxes(filepath: str) -> Dict[str, Any]:
     }
 
     try:
-        with open(filepath, 'rb') as f:
-            data = f.read()
+        data = _jumbf_search_bytes(filepath)
 
         # JUMBF box signature: 0x6A756D62 ("jumb")
         jumb_signature = b'jumb'
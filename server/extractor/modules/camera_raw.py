@@ -20,12 +20,18 @@ Author: MetaExtract Team
 Version: 1.0.0
 """
 
+import mmap
 import struct
 import logging
 import re
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import map_file
+except ImportError:
+    from formats.segment_directory import map_file
+
 logger = logging.getLogger(__name__)
 
 RAW_SIGNATURES = {
@@ -70,9 +76,10 @@ class CameraRAWParser:
 
             self.file_size = file_path.stat().st_size
 
-            with open(self.filepath, 'rb') as f:
-                header = f.read(16)
-                self.file_data = f.read()
+            # TIFF IFD offsets are relative to the start of the file, so the
+            # parser works on a mapping of the whole file rather than a copy.
+            self.file_data = map_file(self.filepath)
+            header = bytes(self.file_data[:16])
 
             result = {
                 "success": True,
@@ -116,6 +123,10 @@ class CameraRAWParser:
         except Exception as e:
             logger.error(f"Error parsing RAW file: {e}")
             return {"error": str(e), "success": False}
+        finally:
+            if isinstance(self.file_data, mmap.mmap):
+                self.file_data.close()
+                self.file_data = None
 
     def _detect_format(self, header: bytes) -> Optional[Dict[str, Any]]:
         """Detect RAW format type"""
@@ -8,6 +8,11 @@ Provides side-by-side comparison of metadata from multiple files:
 - Similarity scoring
 - Batch comparison
 - Export capabilities
+
+Multi-file comparisons convert the batch once into a columnar field matrix
+(interned field ids, per-field value codes, numeric columns and null masks)
+so consistency, similarity, outlier and pattern analysis run as column
+operations instead of nested per-file dictionary walks.
 """
 
 import json
@@ -17,8 +22,326 @@ from pathlib import Path
 from datetime import datetime
 import difflib
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger("metaextract.comparison")
 
+_UNHASHABLE = object()
+
+
+def _value_key(value: Any) -> Any:
+    """Interning key with the same equality semantics as ``==`` where possible."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return (_UNHASHABLE, repr(value))
+
+
+class FieldMatrix:
+    """
+    Columnar view of a batch of metadata dictionaries.
+
+    Every (category, field) pair is interned to a field id. Each field is
+    stored as an int32 column of value codes (-1 for missing or None), a
+    presence mask (key present, even if the value is None), the list of
+    distinct values the codes refer to, and per-value string/numeric flags.
+    Memory grows with the number of distinct fields and values rather than
+    with the number of file pairs compared.
+    """
+
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+        self.fields: List[Tuple[str, str]] = []
+        self.codes: List["np.ndarray"] = []
+        self.present: List["np.ndarray"] = []
+        self.values: List[List[Any]] = []
+        self.value_is_str: List["np.ndarray"] = []
+        self.value_num: List["np.ndarray"] = []
+        self.category_fields: Dict[str, List[int]] = {}
+        self.category_rows: Dict[str, "np.ndarray"] = {}
+        # Shared with row subsets: (root field id, code_a, code_b) -> difflib ratio
+        self._similarity_memo: Dict[Tuple[int, int, int], float] = {}
+        self._memo_ids: List[int] = []
+
+    @classmethod
+    def build(cls, file_metadata_list: List[Dict[str, Any]], categories: List[str], extract) -> "FieldMatrix":
+        """
+        Flatten a batch into columns with one pass over the metadata.
+
+        Args:
+            file_metadata_list: List of metadata dictionaries
+            categories: Comparison categories to materialize
+            extract: Callable(metadata, category) -> flat field dict
+
+        Returns:
+            FieldMatrix with one row per file
+        """
+        n = len(file_metadata_list)
+        matrix = cls(n)
+        field_ids: Dict[Tuple[str, str], int] = {}
+        field_rows: List[List[int]] = []
+        field_values: List[List[Any]] = []
+        data_rows: Dict[str, List[int]] = {category: [] for category in categories}
+
+        for row, metadata in enumerate(file_metadata_list):
+            for category in categories:
+                data = extract(metadata, category)
+                if not data:
+                    continue
+                data_rows[category].append(row)
+                for field, value in data.items():
+                    key = (category, field)
+                    fid = field_ids.get(key)
+                    if fid is None:
+                        fid = field_ids[key] = len(matrix.fields)
+                        matrix.fields.append(key)
+                        matrix._memo_ids.append(fid)
+                        matrix.category_fields.setdefault(category, []).append(fid)
+                        field_rows.append([])
+                        field_values.append([])
+                    field_rows[fid].append(row)
+                    field_values[fid].append(value)
+
+        for category in categories:
+            mask = np.zeros(n, dtype=bool)
+            mask[data_rows[category]] = True
+            matrix.category_rows[category] = mask
+            matrix.category_fields.setdefault(category, [])
+
+        for rows, raw_values in zip(field_rows, field_values):
+            lookup: Dict[Any, int] = {}
+            distinct: List[Any] = []
+            row_codes = np.empty(len(raw_values), dtype=np.int32)
+            for k, value in enumerate(raw_values):
+                if value is None:
+                    row_codes[k] = -1
+                    continue
+                vkey = _value_key(value)
+                code = lookup.get(vkey)
+                if code is None:
+                    code = lookup[vkey] = len(distinct)
+                    distinct.append(value)
+                row_codes[k] = code
+
+            row_index = np.asarray(rows, dtype=np.int64)
+            codes = np.full(n, -1, dtype=np.int32)
+            codes[row_index] = row_codes
+            present = np.zeros(n, dtype=bool)
+            present[row_index] = True
+
+            matrix.codes.append(codes)
+            matrix.present.append(present)
+            matrix.values.append(distinct)
+            matrix.value_is_str.append(np.fromiter(
+                (isinstance(v, str) for v in distinct), dtype=bool, count=len(distinct)
+            ))
+            matrix.value_num.append(np.fromiter(
+                (float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else np.nan
+                 for v in distinct),
+                dtype=np.float64, count=len(distinct),
+            ))
+        return matrix
+
+    def take(self, rows: "np.ndarray") -> "FieldMatrix":
+        """Row subset sharing distinct-value tables (and similarity memo) with this matrix."""
+        rows = np.asarray(rows, dtype=np.int64)
+        subset = FieldMatrix(len(rows))
+        subset._similarity_memo = self._similarity_memo
+        for fid, (category, field) in enumerate(self.fields):
+            present = self.present[fid][rows]
+            if not present.any():
+                continue
+            subset.category_fields.setdefault(category, []).append(len(subset.fields))
+            subset.fields.append((category, field))
+            subset.codes.append(self.codes[fid][rows])
+            subset.present.append(present)
+            subset.values.append(self.values[fid])
+            subset.value_is_str.append(self.value_is_str[fid])
+            subset.value_num.append(self.value_num[fid])
+            subset._memo_ids.append(self._memo_ids[fid])
+        for category, mask in self.category_rows.items():
+            subset.category_rows[category] = mask[rows]
+            subset.category_fields.setdefault(category, [])
+        return subset
+
+    def field_id(self, category: str, field: str) -> Optional[int]:
+        for fid in self.category_fields.get(category, []):
+            if self.fields[fid][1] == field:
+                return fid
+        return None
+
+    def numeric_column(self, fid: int) -> "np.ndarray":
+        """float64 column with NaN for missing and non-numeric values."""
+        lookup = np.append(self.value_num[fid], np.nan)
+        return lookup[self.codes[fid]]  # code -1 picks the trailing NaN
+
+    def string_similarity(self, fid: int, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """
+        difflib ratio between the values behind code arrays ``a`` and ``b``.
+
+        Each distinct ordered value pair is compared once (difflib's ratio is
+        not strictly symmetric); results are memoized for
+        the lifetime of the matrix and any subsets taken from it.
+        """
+        if len(a) == 0:
+            return np.zeros(0, dtype=np.float64)
+        values = self.values[fid]
+        width = len(values)
+        keys, inverse = np.unique(a.astype(np.int64) * width + b, return_inverse=True)
+        memo_fid = self._memo_ids[fid]
+        memo = self._similarity_memo
+        ratios = np.empty(len(keys), dtype=np.float64)
+        for k, key in enumerate(keys.tolist()):
+            i, j = divmod(key, width)
+            cached = memo.get((memo_fid, i, j))
+            if cached is None:
+                cached = difflib.SequenceMatcher(None, values[i], values[j]).ratio()
+                memo[(memo_fid, i, j)] = cached
+            ratios[k] = cached
+        return ratios[inverse.reshape(-1)]
+
+    def field_pair_similarity(self, fid: int, left: "np.ndarray", right: "np.ndarray") -> "np.ndarray":
+        """Per-pair field similarity using the two-file comparison rules."""
+        ci = self.codes[fid][left]
+        cj = self.codes[fid][right]
+        null_i = ci < 0
+        null_j = cj < 0
+        sim = (null_i & null_j).astype(np.float64)
+        both = ~null_i & ~null_j
+        equal = both & (ci == cj)
+        sim[equal] = 1.0
+        is_str = self.value_is_str[fid]
+        if is_str.any():
+            mask = both & ~equal
+            if mask.any():
+                mask &= is_str[np.where(null_i, 0, ci)] & is_str[np.where(null_j, 0, cj)]
+                if mask.any():
+                    sim[mask] = self.string_similarity(fid, ci[mask], cj[mask])
+        return sim
+
+    def category_pair_scores(self, category: str, left: "np.ndarray", right: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Category similarity for row pairs.
+
+        Returns:
+            (scores, counted): scores per pair and a mask of pairs where the
+            category counts (at least one of the two files has data)
+        """
+        has_data = self.category_rows[category]
+        hi = has_data[left]
+        hj = has_data[right]
+        counted = hi | hj
+        scores = np.zeros(len(left), dtype=np.float64)
+        both = hi & hj
+        if not both.any():
+            return scores, counted
+        li, rj = left[both], right[both]
+        total = np.zeros(len(li), dtype=np.float64)
+        union_count = np.zeros(len(li), dtype=np.float64)
+        for fid in self.category_fields[category]:
+            union = self.present[fid][li] | self.present[fid][rj]
+            if not union.any():
+                continue
+            total += self.field_pair_similarity(fid, li, rj) * union
+            union_count += union
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores[both] = np.where(union_count > 0, total / np.maximum(union_count, 1), 0.0)
+        return scores, counted
+
+    def pair_scores(self, categories: List[str], left: "np.ndarray", right: "np.ndarray") -> Tuple["np.ndarray", Dict[str, float]]:
+        """Overall similarity per row pair (mean over counted categories)."""
+        score_sum = np.zeros(len(left), dtype=np.float64)
+        category_count = np.zeros(len(left), dtype=np.float64)
+        category_means: Dict[str, float] = {}
+        for category in categories:
+            if category not in self.category_rows:
+                continue
+            scores, counted = self.category_pair_scores(category, left, right)
+            score_sum += scores * counted
+            category_count += counted
+            if counted.any():
+                category_means[category] = float(scores[counted].mean())
+        overall = np.where(category_count > 0, score_sum / np.maximum(category_count, 1), 0.0)
+        return overall, category_means
+
+    def expected_similarity(self, categories: List[str], string_limit: int) -> "np.ndarray":
+        """
+        Estimate each row's average similarity to every other row.
+
+        Uses per-field value frequencies instead of comparing row pairs, so it
+        is linear in the number of rows. String similarity between distinct
+        values is included exactly for fields with at most ``string_limit``
+        distinct values; larger fields use the mean ratio of a sample of
+        distinct-value pairs.
+        """
+        n = self.n_rows
+        numerator = np.zeros(n, dtype=np.float64)
+        denominator = np.zeros(n, dtype=np.float64)
+        if n < 2:
+            return numerator
+
+        for category in categories:
+            has_data = self.category_rows.get(category)
+            if has_data is None:
+                continue
+            populated = int(has_data.sum())
+            if populated == 0:
+                continue
+            # Rows without data only pair (with score 0) against populated rows
+            denominator += np.where(has_data, n - 1, populated)
+            others = populated - 1
+            if others == 0:
+                continue
+
+            agree = np.zeros(n, dtype=np.float64)
+            weight = np.zeros(n, dtype=np.float64)
+            for fid in self.category_fields[category]:
+                codes = self.codes[fid]
+                present = self.present[fid]
+                valued = codes >= 0
+                counts = np.bincount(codes[valued], minlength=len(self.values[fid])).astype(np.float64)
+                nulls = populated - counts.sum()
+
+                matching = counts.copy()
+                is_str = self.value_is_str[fid]
+                distinct = len(counts)
+                if 1 < distinct <= string_limit and is_str.sum() > 1:
+                    str_codes = np.flatnonzero(is_str)
+                    grid_i, grid_j = np.triu_indices(len(str_codes), k=1)
+                    ratios = self.string_similarity(fid, str_codes[grid_i], str_codes[grid_j])
+                    sim = np.zeros((distinct, distinct), dtype=np.float64)
+                    sim[str_codes[grid_i], str_codes[grid_j]] = ratios
+                    sim[str_codes[grid_j], str_codes[grid_i]] = ratios
+                    matching += sim @ counts
+                elif distinct > string_limit and is_str.all():
+                    # Too many values to compare exhaustively: use the mean
+                    # ratio of sampled distinct-value pairs for every mismatch
+                    rng = np.random.default_rng(0)
+                    sample_i = rng.integers(0, distinct, string_limit)
+                    sample_j = rng.integers(0, distinct - 1, string_limit)
+                    sample_j += sample_j >= sample_i
+                    mean_ratio = float(self.string_similarity(fid, sample_i, sample_j).mean())
+                    matching += (counts.sum() - counts) * mean_ratio
+
+                expected = np.where(
+                    valued,
+                    (matching[np.where(valued, codes, 0)] - 1.0) / others,
+                    (nulls - 1.0) / others,
+                )
+                agree += np.where(present, expected, 0.0)
+                weight += np.where(present, 1.0, present.sum() / others)
+
+            ratio = np.where(weight > 0, agree / np.maximum(weight, 1e-12), 0.0)
+            numerator += np.where(has_data, ratio * others, 0.0)
+
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+
 class MetadataComparator:
     """Advanced metadata comparison and analysis."""
     
@@ -34,6 +357,14 @@ class MetadataComparator:
             "hashes",
             "forensic_data"
         ]
+        # Up to this many file pairs are scored exactly; larger batches sample
+        self.exact_pair_limit = 20000
+        self.sampled_pairs = 5000
+        # Distinct string values compared pairwise with difflib per field
+        self.string_similarity_limit = 128
+        # Per-field difference listings are capped in "summary" mode
+        self.summary_difference_limit = 100
+        self.numeric_outlier_categories = ["image_properties", "camera_settings", "gps_data"]
     
     def compare_files(
         self,
@@ -53,6 +384,24 @@ class MetadataComparator:
         if len(file_metadata_list) < 2:
             return {"error": "At least 2 files required for comparison"}
         
+        try:
+            matrix = self._build_matrix(file_metadata_list) if NUMPY_AVAILABLE else None
+        except Exception as e:
+            logger.warning(f"Columnar comparison unavailable, using per-file comparison: {e}")
+            matrix = None
+        return self._compare_files(file_metadata_list, comparison_mode, matrix)
+    
+    def _build_matrix(self, file_metadata_list: List[Dict[str, Any]]) -> FieldMatrix:
+        """Flatten a batch into a FieldMatrix over the comparison categories."""
+        return FieldMatrix.build(file_metadata_list, self.comparison_categories, self._extract_category_data)
+    
+    def _compare_files(
+        self,
+        file_metadata_list: List[Dict[str, Any]],
+        comparison_mode: str,
+        matrix: Optional[FieldMatrix] = None
+    ) -> Dict[str, Any]:
+        """Run a multi-file comparison, using the columnar matrix when provided."""
         try:
             results = {
                 "comparison_info": {
@@ -75,14 +424,22 @@ class MetadataComparator:
             
             # Perform category-wise comparisons
             for category in self.comparison_categories:
-                category_comparison = self._compare_category(
-                    file_metadata_list, category, comparison_mode
-                )
+                if matrix is not None:
+                    category_comparison = self._compare_category_columns(
+                        matrix, category, comparison_mode
+                    )
+                else:
+                    category_comparison = self._compare_category(
+                        file_metadata_list, category, comparison_mode
+                    )
                 if category_comparison:
                     results["field_comparisons"][category] = category_comparison
             
             # Calculate overall similarity
-            results["similarity_analysis"] = self._calculate_similarity(file_metadata_list)
+            if matrix is not None:
+                results["similarity_analysis"] = self._calculate_similarity_columns(matrix)
+            else:
+                results["similarity_analysis"] = self._calculate_similarity(file_metadata_list)
             
             # Generate differences summary
             results["differences_summary"] = self._generate_differences_summary(
@@ -186,26 +543,40 @@ class MetadataComparator:
                 "summary": {}
             }
             
+            # Flatten the batch once; groups are row subsets of the same matrix
+            matrix = self._build_matrix(file_metadata_list) if NUMPY_AVAILABLE else None
+            
             # Group files by specified criteria
-            groups = self._group_files(file_metadata_list, group_by)
+            group_rows = self._group_indices(file_metadata_list, group_by)
+            groups = {
+                name: [file_metadata_list[i] for i in rows]
+                for name, rows in group_rows.items()
+            }
             
             # Analyze each group
+            group_comparisons = {}
             for group_name, group_files in groups.items():
                 if len(group_files) > 1:
-                    group_comparison = self.compare_files(group_files, "summary")
+                    subset = matrix.take(group_rows[group_name]) if matrix is not None else None
+                    group_comparison = self._compare_files(group_files, "summary", subset)
+                    group_comparisons[group_name] = group_comparison
                     results["groups"][group_name] = {
                         "file_count": len(group_files),
                         "comparison": group_comparison
                     }
             
             # Cross-group analysis
-            results["cross_group_analysis"] = self._analyze_cross_groups(groups)
+            results["cross_group_analysis"] = self._analyze_cross_groups(
+                groups, matrix=matrix, group_rows=group_rows, group_comparisons=group_comparisons
+            )
             
             # Identify outliers
-            results["outliers"] = self._identify_outliers(file_metadata_list)
+            results["outliers"] = self._identify_outliers(file_metadata_list, matrix)
+            if matrix is not None:
+                results["field_outliers"] = self._identify_field_outliers(matrix)
             
             # Pattern detection
-            results["patterns"] = self._detect_patterns(file_metadata_list)
+            results["patterns"] = self._detect_patterns(file_metadata_list, matrix)
             
             # Generate summary
             results["summary"] = self._generate_batch_summary(results)
@@ -333,6 +704,149 @@ class MetadataComparator:
             logger.warning(f"Category comparison failed for {category}: {e}")
             return None
     
+    def _compare_category_columns(
+        self,
+        matrix: FieldMatrix,
+        category: str,
+        mode: str
+    ) -> Optional[Dict[str, Any]]:
+        """Compare a category using the columnar field matrix."""
+        try:
+            has_data = matrix.category_rows.get(category)
+            if has_data is None or not has_data.any():
+                return None
+            
+            comparison = {
+                "category": category,
+                "files_with_data": int(has_data.sum()),
+                "common_fields": [],
+                "unique_fields": {},
+                "field_differences": {},
+                "consistency_score": 0.0
+            }
+            
+            for fid in matrix.category_fields[category]:
+                field = matrix.fields[fid][1]
+                present = matrix.present[fid]
+                if present.all():
+                    comparison["common_fields"].append(field)
+                    comparison["field_differences"][field] = self._compare_field_column(matrix, fid, mode)
+                else:
+                    comparison["unique_fields"][field] = np.flatnonzero(present).tolist()
+            
+            comparison["consistency_score"] = self._calculate_category_consistency(comparison)
+            
+            return comparison
+            
+        except Exception as e:
+            logger.warning(f"Category comparison failed for {category}: {e}")
+            return None
+    
+    def _compare_field_column(self, matrix: FieldMatrix, fid: int, mode: str) -> Dict[str, Any]:
+        """Columnar equivalent of _compare_field_values for one field."""
+        field_name = matrix.fields[fid][1]
+        try:
+            codes = matrix.codes[fid]
+            values = matrix.values[fid]
+            valued = codes >= 0
+            comparison = {
+                "field_name": field_name,
+                "total_files": matrix.n_rows,
+                "non_null_values": int(valued.sum()),
+                "unique_values": [],
+                "all_same": False,
+                "differences": [],
+                "similarity_score": 0.0
+            }
+            
+            if not comparison["non_null_values"]:
+                comparison["note"] = "No non-null values found"
+                return comparison
+            
+            counts = np.bincount(codes[valued], minlength=len(values))
+            used = np.flatnonzero(counts)
+            unique_values = list(dict.fromkeys(str(values[c]) for c in used.tolist()))
+            comparison["unique_values"] = unique_values
+            comparison["all_same"] = len(unique_values) == 1
+            
+            if not comparison["all_same"]:
+                rows = np.flatnonzero(valued)
+                shown = rows[:self.summary_difference_limit] if mode == "summary" else rows
+                comparison["differences"] = [
+                    {"file_index": i, "value": values[c]}
+                    for i, c in zip(shown.tolist(), codes[shown].tolist())
+                ]
+                if len(shown) < len(rows):
+                    comparison["differences_total"] = int(len(rows))
+                
+                if matrix.value_is_str[fid][used].all():
+                    comparison["similarity_score"] = self._column_string_similarity(
+                        matrix, fid, used, counts[used]
+                    )
+                else:
+                    comparison["similarity_score"] = 1.0 / len(unique_values)
+            else:
+                comparison["similarity_score"] = 1.0
+            
+            numbers = matrix.value_num[fid][used]
+            if not np.isnan(numbers).any():
+                column = matrix.numeric_column(fid)[valued]
+                comparison["numeric_summary"] = {
+                    "min": float(column.min()),
+                    "max": float(column.max()),
+                    "mean": float(column.mean()),
+                    "std": float(column.std())
+                }
+            
+            return comparison
+            
+        except Exception as e:
+            logger.warning(f"Field comparison failed for {field_name}: {e}")
+            return {"field_name": field_name, "error": str(e)}
+    
+    def _column_string_similarity(
+        self,
+        matrix: FieldMatrix,
+        fid: int,
+        used: "np.ndarray",
+        counts: "np.ndarray"
+    ) -> float:
+        """
+        Average pairwise string similarity over all non-null values of a field.
+        
+        Identical values are weighted by their counts, so only distinct value
+        pairs are compared. Fields with more distinct values than
+        ``string_similarity_limit`` are estimated from sampled value pairs.
+        """
+        counts = counts.astype(np.float64)
+        total = counts.sum()
+        if total < 2:
+            return 1.0
+        
+        if len(used) <= self.string_similarity_limit:
+            left, right = np.triu_indices(len(used), k=1)
+            ratios = matrix.string_similarity(fid, used[left], used[right])
+            same = (counts * (counts - 1) / 2).sum()
+            cross = (ratios * counts[left] * counts[right]).sum()
+            return float((same + cross) / (total * (total - 1) / 2))
+        
+        row_codes = matrix.codes[fid][matrix.codes[fid] >= 0]
+        left, right = self._sample_pairs(len(row_codes), self.sampled_pairs)
+        a, b = row_codes[left], row_codes[right]
+        ratios = np.ones(len(a), dtype=np.float64)
+        differ = a != b
+        ratios[differ] = matrix.string_similarity(fid, a[differ], b[differ])
+        return float(ratios.mean())
+    
+    @staticmethod
+    def _sample_pairs(n: int, count: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Deterministic sample of ``count`` distinct-index pairs (i < j) from ``n`` rows."""
+        rng = np.random.default_rng(0)
+        first = rng.integers(0, n, count)
+        second = rng.integers(0, n - 1, count)
+        second += second >= first
+        return np.minimum(first, second), np.maximum(first, second)
+    
     def _extract_category_data(self, metadata: Dict[str, Any], category: str) -> Dict[str, Any]:
         """Extract data for a specific category from metadata."""
         category_mapping = {
@@ -566,6 +1080,57 @@ class MetadataComparator:
             logger.warning(f"Similarity calculation failed: {e}")
             return {"error": str(e)}
     
+    def _calculate_similarity_columns(self, matrix: FieldMatrix) -> Dict[str, Any]:
+        """
+        Vectorized pairwise similarity over the field matrix.
+        
+        Batches with up to ``exact_pair_limit`` pairs are scored exhaustively
+        and report every pair; larger batches estimate the statistics from a
+        deterministic sample of ``sampled_pairs`` pairs.
+        """
+        try:
+            n = matrix.n_rows
+            sampled = n * (n - 1) // 2 > self.exact_pair_limit
+            if sampled:
+                left, right = self._sample_pairs(n, self.sampled_pairs)
+            else:
+                left, right = np.triu_indices(n, k=1)
+            scores, category_means = matrix.pair_scores(self.comparison_categories, left, right)
+            
+            similarity_analysis = {
+                "overall_similarity": 0.0,
+                "category_similarities": category_means,
+                "pairwise_similarities": [],
+                "most_similar_pair": None,
+                "least_similar_pair": None,
+                "pairs_evaluated": int(len(scores)),
+                "sampled": sampled
+            }
+            if not len(scores):
+                return similarity_analysis
+            
+            def pair(k: int) -> Dict[str, Any]:
+                return {
+                    "file1_index": int(left[k]),
+                    "file2_index": int(right[k]),
+                    "similarity_score": float(scores[k])
+                }
+            
+            if not sampled:
+                similarity_analysis["pairwise_similarities"] = [
+                    {"file1_index": i, "file2_index": j, "similarity_score": score}
+                    for i, j, score in zip(left.tolist(), right.tolist(), scores.tolist())
+                ]
+            similarity_analysis["overall_similarity"] = float(scores.mean())
+            similarity_analysis["least_similar_pair"] = pair(int(np.argmin(scores)))
+            similarity_analysis["most_similar_pair"] = pair(len(scores) - 1 - int(np.argmax(scores[::-1])))
+            
+            return similarity_analysis
+            
+        except Exception as e:
+            logger.warning(f"Similarity calculation failed: {e}")
+            return {"error": str(e)}
+    
     def _calculate_two_file_similarity(
         self,
         metadata1: Dict[str, Any],
@@ -846,21 +1411,25 @@ class MetadataComparator:
     
     def _group_files(self, file_metadata_list: List[Dict[str, Any]], group_by: str) -> Dict[str, List[Dict[str, Any]]]:
         """Group files by specified criteria."""
+        return {
+            name: [file_metadata_list[i] for i in rows]
+            for name, rows in self._group_indices(file_metadata_list, group_by).items()
+        }
+    
+    def _group_indices(self, file_metadata_list: List[Dict[str, Any]], group_by: str) -> Dict[str, List[int]]:
+        """Group file indices by specified criteria, in first-seen order."""
         try:
             groups = {}
             
-            for metadata in file_metadata_list:
+            for i, metadata in enumerate(file_metadata_list):
                 group_key = self._extract_grouping_key(metadata, group_by)
-                
-                if group_key not in groups:
-                    groups[group_key] = []
-                groups[group_key].append(metadata)
+                groups.setdefault(group_key, []).append(i)
             
             return groups
             
         except Exception as e:
             logger.warning(f"File grouping failed: {e}")
-            return {"ungrouped": file_metadata_list}
+            return {"ungrouped": list(range(len(file_metadata_list)))}
     
     def _extract_grouping_key(self, metadata: Dict[str, Any], group_by: str) -> str:
         """Extract grouping key from metadata."""
@@ -897,7 +1466,13 @@ class MetadataComparator:
         except Exception as e:
             return "Error Group"
     
-    def _analyze_cross_groups(self, groups: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def _analyze_cross_groups(
+        self,
+        groups: Dict[str, List[Dict[str, Any]]],
+        matrix: Optional[FieldMatrix] = None,
+        group_rows: Optional[Dict[str, List[int]]] = None,
+        group_comparisons: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """Analyze relationships between different groups."""
         try:
             analysis = {
@@ -913,6 +1488,9 @@ class MetadataComparator:
             
             # Calculate cross-group similarities
             group_names = list(groups.keys())
+            if matrix is not None and group_rows is not None:
+                analysis["cross_similarities"] = self._cross_group_similarities(matrix, group_rows)
+                group_names = []
             for i in range(len(group_names)):
                 for j in range(i + 1, len(group_names)):
                     group1_name = group_names[i]
@@ -935,7 +1513,9 @@ class MetadataComparator:
             # Analyze group characteristics
             for group_name, group_files in groups.items():
                 if len(group_files) > 1:
-                    group_comparison = self.compare_files(group_files, "summary")
+                    group_comparison = (group_comparisons or {}).get(group_name)
+                    if group_comparison is None:
+                        group_comparison = self.compare_files(group_files, "summary")
                     analysis["group_characteristics"][group_name] = {
                         "internal_consistency": group_comparison.get("similarity_analysis", {}).get("overall_similarity", 0.0),
                         "common_features": self._extract_group_features(group_files)
@@ -947,6 +1527,34 @@ class MetadataComparator:
             logger.warning(f"Cross-group analysis failed: {e}")
             return {"error": str(e)}
     
+    def _cross_group_similarities(self, matrix: FieldMatrix, group_rows: Dict[str, List[int]]) -> Dict[str, float]:
+        """Score up to 3x3 sample pairs for every group pair in one vectorized pass."""
+        names = list(group_rows.keys())
+        samples = [np.asarray(group_rows[name][:3], dtype=np.int64) for name in names]
+        left_parts, right_parts, owners = [], [], []
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                a, b = np.meshgrid(samples[i], samples[j], indexing="ij")
+                left_parts.append(a.ravel())
+                right_parts.append(b.ravel())
+                owners.append(np.full(a.size, len(owners), dtype=np.int64))
+        if not owners:
+            return {}
+        
+        scores, _ = matrix.pair_scores(
+            self.comparison_categories, np.concatenate(left_parts), np.concatenate(right_parts)
+        )
+        owner = np.concatenate(owners)
+        means = np.bincount(owner, weights=scores) / np.bincount(owner)
+        
+        similarities = {}
+        k = 0
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                similarities[f"{names[i]} vs {names[j]}"] = float(means[k])
+                k += 1
+        return similarities
+    
     def _extract_group_features(self, group_files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract common features within a group."""
         try:
@@ -1000,7 +1608,11 @@ class MetadataComparator:
         except Exception as e:
             return {}
     
-    def _identify_outliers(self, file_metadata_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _identify_outliers(
+        self,
+        file_metadata_list: List[Dict[str, Any]],
+        matrix: Optional[FieldMatrix] = None
+    ) -> List[Dict[str, Any]]:
         """Identify files that are significantly different from others."""
         try:
             outliers = []
@@ -1008,6 +1620,11 @@ class MetadataComparator:
             if len(file_metadata_list) < 3:
                 return outliers  # Need at least 3 files to identify outliers
             
+            if NUMPY_AVAILABLE:
+                if matrix is None:
+                    matrix = self._build_matrix(file_metadata_list)
+                return self._identify_outliers_columns(file_metadata_list, matrix)
+            
             # Calculate each file's average similarity to all others
             file_similarities = []
             
@@ -1053,8 +1670,186 @@ class MetadataComparator:
             logger.warning(f"Outlier identification failed: {e}")
             return []
     
-    def _detect_patterns(self, file_metadata_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _identify_outliers_columns(
+        self,
+        file_metadata_list: List[Dict[str, Any]],
+        matrix: FieldMatrix
+    ) -> List[Dict[str, Any]]:
+        """
+        Flag files whose average similarity to the rest has a z-score below -1.
+        
+        Small batches use exact pairwise scores; larger ones use the
+        frequency-based estimate from FieldMatrix.expected_similarity, which is
+        linear in the number of files.
+        """
+        n = matrix.n_rows
+        if n * (n - 1) // 2 <= self.exact_pair_limit:
+            left, right = np.triu_indices(n, k=1)
+            scores, _ = matrix.pair_scores(self.comparison_categories, left, right)
+            totals = np.bincount(left, weights=scores, minlength=n) + np.bincount(right, weights=scores, minlength=n)
+            avg_similarity = totals / (n - 1)
+            method = "pairwise"
+        else:
+            avg_similarity = matrix.expected_similarity(self.comparison_categories, self.string_similarity_limit)
+            method = "frequency_estimate"
+        
+        mean_similarity = float(avg_similarity.mean())
+        std_dev = float(avg_similarity.std(ddof=1))
+        if std_dev <= 0:
+            return []
+        
+        z_scores = (avg_similarity - mean_similarity) / std_dev
+        outliers = []
+        for i in np.flatnonzero(z_scores < -1.0).tolist():
+            file_info = file_metadata_list[i].get("file") or {}
+            outliers.append({
+                "file_index": i,
+                "filename": file_info.get("name", "Unknown") if isinstance(file_info, dict) else "Unknown",
+                "avg_similarity": float(avg_similarity[i]),
+                "deviation_from_mean": mean_similarity - float(avg_similarity[i]),
+                "z_score": float(z_scores[i]),
+                "method": method,
+                "reason": "Significantly different from group average"
+            })
+        return outliers
+    
+    def _identify_field_outliers(self, matrix: FieldMatrix) -> Dict[str, Any]:
+        """
+        Per-field numeric outliers using Tukey IQR fences.
+        
+        When most files share one value the fences collapse onto it, so any
+        deviating file is reported. Only categories listed in
+        ``numeric_outlier_categories`` are scanned.
+        """
+        field_outliers = {}
+        try:
+            for category in self.numeric_outlier_categories:
+                for fid in matrix.category_fields.get(category, []):
+                    if np.isnan(matrix.value_num[fid]).any():
+                        continue  # Mixed or non-numeric field
+                    column = matrix.numeric_column(fid)
+                    valid = ~np.isnan(column)
+                    if valid.sum() < 4:
+                        continue
+                    values = column[valid]
+                    q1, q3 = np.percentile(values, [25, 75])
+                    iqr = q3 - q1
+                    lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+                    flagged = np.flatnonzero(valid & ((column < lower) | (column > upper)))
+                    if flagged.size:
+                        field_outliers[f"{category}.{matrix.fields[fid][1]}"] = {
+                            "lower_fence": float(lower),
+                            "upper_fence": float(upper),
+                            "file_indices": flagged.tolist()
+                        }
+        except Exception as e:
+            logger.warning(f"Field outlier detection failed: {e}")
+        return field_outliers
+    
+    def _column_value_counts(
+        self,
+        matrix: FieldMatrix,
+        rows: "np.ndarray",
+        fields: List[str],
+        default: str
+    ) -> Dict[Any, int]:
+        """
+        Count value combinations of EXIF columns over the given rows.
+        
+        Single fields keep their raw values as keys; several fields are joined
+        into a space-separated label. Keys are in first-seen order and match
+        the per-file path: a missing field counts as ``default``, a field
+        present with a None value as None ("None" inside a joined label).
+        """
+        fids = [matrix.field_id("exif_data", field) for field in fields]
+        # Code -2 marks a key that is present with a None value
+        columns = [
+            np.where(matrix.present[fid][rows] & (matrix.codes[fid][rows] < 0), -2, matrix.codes[fid][rows])
+            if fid is not None else np.full(len(rows), -1, dtype=np.int32)
+            for fid in fids
+        ]
+        if not len(rows):
+            return {}
+        
+        stacked = np.stack(columns, axis=1)
+        combos, first_seen, combo_counts = np.unique(stacked, axis=0, return_index=True, return_counts=True)
+        counts: Dict[Any, int] = {}
+        for k in np.argsort(first_seen, kind="stable").tolist():
+            parts = []
+            for fid, code in zip(fids, combos[k].tolist()):
+                parts.append(matrix.values[fid][code] if code >= 0 else None if code == -2 else default)
+            key = parts[0] if len(parts) == 1 else " ".join(str(p) for p in parts).strip()
+            counts[key] = counts.get(key, 0) + int(combo_counts[k])
+        return counts
+    
+    def _detect_patterns_columns(self, matrix: FieldMatrix) -> Dict[str, Any]:
+        """Camera, software and temporal patterns from the EXIF columns."""
+        patterns = {
+            "camera_patterns": {},
+            "software_patterns": {},
+            "temporal_patterns": {},
+            "technical_patterns": {}
+        }
+        rows = np.flatnonzero(matrix.category_rows.get("exif_data", np.zeros(matrix.n_rows, dtype=bool)))
+        
+        camera_counts = self._column_value_counts(matrix, rows, ["Make", "Model"], "Unknown")
+        patterns["camera_patterns"] = {
+            "most_common": max(camera_counts.items(), key=lambda x: x[1]) if camera_counts else None,
+            "distribution": camera_counts,
+            "unique_cameras": len(camera_counts)
+        }
+        
+        software_counts = self._column_value_counts(matrix, rows, ["Software"], "Unknown")
+        patterns["software_patterns"] = {
+            "most_common": max(software_counts.items(), key=lambda x: x[1]) if software_counts else None,
+            "distribution": software_counts,
+            "unique_software": len(software_counts)
+        }
+        
+        # DateTime, falling back to DateTimeOriginal, per file
+        date_values = []
+        date_codes = []
+        for field in ("DateTime", "DateTimeOriginal"):
+            fid = matrix.field_id("exif_data", field)
+            if fid is None:
+                date_codes.append(np.full(len(rows), -1, dtype=np.int64))
+                date_values.append([])
+                continue
+            codes = matrix.codes[fid][rows].astype(np.int64)
+            # Empty values fall through to the next field, as in the per-file path
+            truthy = np.fromiter((bool(v) for v in matrix.values[fid]), dtype=bool,
+                                 count=len(matrix.values[fid]))
+            if len(truthy):
+                codes = np.where((codes >= 0) & truthy[np.maximum(codes, 0)], codes, -1)
+            date_codes.append(codes)
+            date_values.append(matrix.values[fid])
+        primary, fallback = date_codes
+        offset = len(date_values[0])
+        chosen = np.where(primary >= 0, primary, np.where(fallback >= 0, fallback + offset, -1))
+        chosen = chosen[chosen >= 0]
+        if chosen.size:
+            pool = date_values[0] + date_values[1]
+            dates = sorted(pool[c] for c in np.unique(chosen).tolist())
+            patterns["temporal_patterns"] = {
+                "date_range": f"{dates[0]} to {dates[-1]}" if chosen.size > 1 else dates[0],
+                "total_dates": int(chosen.size),
+                "earliest": dates[0],
+                "latest": dates[-1]
+            }
+        
+        return patterns
+    
+    def _detect_patterns(
+        self,
+        file_metadata_list: List[Dict[str, Any]],
+        matrix: Optional[FieldMatrix] = None
+    ) -> Dict[str, Any]:
         """Detect patterns across the file collection."""
+        if matrix is not None:
+            try:
+                return self._detect_patterns_columns(matrix)
+            except Exception as e:
+                logger.warning(f"Columnar pattern detection failed: {e}")
         try:
             patterns = {
                 "camera_patterns": {},
@@ -23,12 +23,20 @@ import time
 from pathlib import Path
 import psutil
 import gc
-from datetime import datetime, timedelta
-import pickle
+from datetime import datetime
 import hashlib
+import numpy as np
+
+try:
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
 
 logger = logging.getLogger(__name__)
 
+# Batch results are reused for a day
+RESULT_CACHE_TTL = 24 * 3600
+
 @dataclass
 class ProcessingMetrics:
     """Performance metrics for culling operations."""
@@ -76,8 +84,8 @@ class CullingBatchProcessor:
     
     def __init__(self, config: Optional[BatchConfig] = None):
         self.config = config or BatchConfig()
-        self.cache_dir = Path("/tmp/metaextract_culling_cache")
-        self.cache_dir.mkdir(exist_ok=True)
+        self._result_cache = BoundedCache("culling_results", max_entries=256,
+                                          max_bytes=64 << 20, ttl_seconds=RESULT_CACHE_TTL)
         self.active_jobs = {}
         self.processing_metrics = {}
         
@@ -150,39 +158,61 @@ class CullingBatchProcessor:
                                        photos: List[Dict[str, Any]], 
                                        user_preferences: Optional[Dict[str, Any]],
                                        job_id: str) -> List[Dict[str, Any]]:
-        """Process photos in streaming batches for memory efficiency."""
-        
-        all_results = []
+        """
+        Process photos in streaming batches for memory efficiency.
+
+        Feature extraction runs batch by batch across the worker pool; grouping
+        and scoring then run once over the whole set, so bursts that straddle
+        a batch boundary are still grouped together.
+        """
+        from .ai_culling_engine import AICullingEngine
+
+        cache_key = self._get_cache_key(photos, user_preferences)
+        if self.config.cache_intermediate:
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result:
+                logger.info(f"Using cached result for batch of {len(photos)} photos")
+                return [cached_result]
+
+        feature_blocks = []
         batch_count = 0
+        total_batches = (len(photos) + self.config.batch_size - 1) // self.config.batch_size
         
-        for i in range(0, len(photos), self.config.batch_size):
-            batch = photos[i:i + self.config.batch_size]
-            batch_count += 1
-            
-            logger.info(f"Processing batch {batch_count}/{(len(photos) + self.config.batch_size - 1) // self.config.batch_size}")
-            
-            # Process batch
-            batch_result = await self._process_single_batch(batch, user_preferences, job_id)
-            all_results.append(batch_result)
-            
-            # Update progress
-            processed = min(i + self.config.batch_size, len(photos))
-            self.processing_metrics[job_id].processed_photos = processed
-            
-            if self.config.progress_callback:
-                self.config.progress_callback(processed, len(photos))
-            
-            # Memory cleanup between batches
-            gc.collect()
-            
-            # Check memory usage and pause if needed
-            memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
-            if memory_mb > self.config.memory_limit_mb:
-                logger.warning(f"Memory usage high ({memory_mb:.1f}MB), pausing for cleanup")
-                await asyncio.sleep(0.1)
-                gc.collect()
+        # One worker pool for the whole run; starting processes per batch
+        # would cost more than the feature pass it parallelises
+        executor = self._create_executor()
+        try:
+            for i in range(0, len(photos), self.config.batch_size):
+                batch = photos[i:i + self.config.batch_size]
+                batch_count += 1
+                
+                logger.info(f"Extracting features for batch {batch_count}/{total_batches}")
+                feature_blocks.append(await self._build_features(batch, executor))
+                
+                # Update progress
+                processed = min(i + self.config.batch_size, len(photos))
+                self.processing_metrics[job_id].processed_photos = processed
+                
+                if self.config.progress_callback:
+                    self.config.progress_callback(processed, len(photos))
+                
+                # Check memory usage and pause if needed
+                memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+                if memory_mb > self.config.memory_limit_mb:
+                    logger.warning(f"Memory usage high ({memory_mb:.1f}MB), pausing for cleanup")
+                    gc.collect()
+                    await asyncio.sleep(0.1)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
         
-        return all_results
+        engine = AICullingEngine(user_preferences)
+        result = engine.analyze_batch(photos, features=np.vstack(feature_blocks))
+
+        if self.config.cache_intermediate and result.get('success'):
+            self._cache_result(cache_key, result)
+
+        return [result]
     
     async def _process_single_batch(self, 
                                   photos: List[Dict[str, Any]], 
@@ -204,7 +234,7 @@ class CullingBatchProcessor:
         engine = AICullingEngine(user_preferences)
         
         if self.config.use_multiprocessing and len(photos) > 10:
-            # Use process pool for CPU-intensive operations
+            # Extract features in parallel chunks, then group and score once
             result = await self._process_with_workers(photos, engine)
         else:
             # Single-threaded processing for small batches
@@ -216,64 +246,55 @@ class CullingBatchProcessor:
         
         return result
     
-    async def _process_with_workers(self, photos: List[Dict[str, Any]], engine: AICullingEngine) -> Dict[str, Any]:
-        """Process photos using worker processes/threads."""
-        
-        # Split photos into chunks for workers
-        chunk_size = max(1, len(photos) // self.config.max_workers)
+    async def _process_with_workers(self, photos: List[Dict[str, Any]], engine: 'AICullingEngine') -> Dict[str, Any]:
+        """Build the feature matrix in parallel chunks, then group and score the full set once."""
+        features = await self._build_features(photos)
+        return engine.analyze_batch(photos, features=features)
+
+    def _feature_workers(self) -> int:
+        return max(1, self.config.max_workers or 1)
+
+    def _create_executor(self):
+        """Worker pool for the feature pass, or None when it runs inline."""
+        workers = self._feature_workers()
+        if workers == 1:
+            return None
+        executor_cls = ProcessPoolExecutor if self.config.use_multiprocessing else ThreadPoolExecutor
+        return executor_cls(max_workers=workers)
+
+    async def _build_features(self, photos: List[Dict[str, Any]], executor=None) -> np.ndarray:
+        """
+        Build the culling feature matrix for ``photos`` across the worker pool.
+
+        Only the per-photo metadata pass is parallelised; the resulting blocks
+        are stacked in input order so rows line up with ``photos``. Callers
+        running several batches pass one ``executor`` for all of them;
+        without one, a pool is created for this call only.
+        """
+        from .ai_culling_engine import build_feature_matrix
+
+        workers = self._feature_workers()
+        if workers == 1 or len(photos) <= 10:
+            return build_feature_matrix(photos)
+
+        owned = executor is None
+        if owned:
+            executor = self._create_executor()
+        chunk_size = max(1, -(-len(photos) // workers))
         photo_chunks = [photos[i:i + chunk_size] for i in range(0, len(photos), chunk_size)]
+        loop = asyncio.get_event_loop()
         
-        if self.config.use_multiprocessing:
-            # Use process pool for CPU-bound work
-            with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
-                futures = [
-                    asyncio.get_event_loop().run_in_executor(
-                        executor, self._analyze_chunk_sync, chunk, engine
-                    )
-                    for chunk in photo_chunks
-                ]
-                
-                chunk_results = await asyncio.gather(*futures)
-        else:
-            # Use thread pool for I/O bound work
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                futures = [
-                    asyncio.get_event_loop().run_in_executor(
-                        executor, self._analyze_chunk_sync, chunk, engine
-                    )
-                    for chunk in photo_chunks
-                ]
-                
-                chunk_results = await asyncio.gather(*futures)
-        
-        # Merge chunk results
-        return self._merge_chunk_results(chunk_results, photos)
-    
-    def _analyze_chunk_sync(self, photo_chunk: List[Dict[str, Any]], engine: AICullingEngine) -> Dict[str, Any]:
-        """Analyze a chunk of photos synchronously."""
-        return engine.analyze_batch(photo_chunk)
-    
-    def _merge_chunk_results(self, chunk_results: List[Dict[str, Any]], original_photos: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge results from multiple chunks."""
-        
-        merged_groups = []
-        merged_recommendations = []
-        total_processing_time = 0
-        
-        for chunk_result in chunk_results:
-            if chunk_result.get('success'):
-                merged_groups.extend(chunk_result.get('groups', []))
-                merged_recommendations.extend(chunk_result.get('recommendations', []))
-                total_processing_time += chunk_result.get('processing_time', 0)
-        
-        return {
-            'success': True,
-            'groups': merged_groups,
-            'total_photos': len(original_photos),
-            'recommendations': merged_recommendations,
-            'processing_time': total_processing_time,
-            'scoring_weights': chunk_results[0].get('scoring_weights', {}) if chunk_results else {}
-        }
+        try:
+            futures = [
+                loop.run_in_executor(executor, build_feature_matrix, chunk)
+                for chunk in photo_chunks
+            ]
+            blocks = await asyncio.gather(*futures)
+        finally:
+            if owned:
+                executor.shutdown(wait=True)
+        
+        return np.vstack(blocks)
     
     async def _monitor_resources(self, job_id: str):
         """Monitor system resources during processing."""
@@ -325,37 +346,12 @@ class CullingBatchProcessor:
     
     def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get cached result if available and fresh."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
-        
-        if cache_file.exists():
-            try:
-                # Check age (expire after 24 hours)
-                file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if file_age > timedelta(hours=24):
-                    cache_file.unlink()  # Remove old cache
-                    return None
-                
-                # Load cached result
-                with open(cache_file, 'rb') as f:
-                    return pickle.load(f)
-            except Exception as e:
-                logger.error(f"Error loading cached result: {str(e)}")
-                try:
-                    cache_file.unlink()  # Remove corrupted cache
-                except:
-                    pass
-        
-        return None
+        return self._result_cache.get(cache_key)
     
     def _cache_result(self, cache_key: str, result: Dict[str, Any]):
         """Cache processing result."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
-        
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(result, f)
-        except Exception as e:
-            logger.error(f"Error caching result: {str(e)}")
+        if not self._result_cache.put(cache_key, result):
+            logger.debug(f"Result for {cache_key[:12]} exceeds the culling cache budget")
     
     def _compile_results(self, batch_results: List[Dict[str, Any]], job_id: str) -> Dict[str, Any]:
         """Compile results from multiple batches."""
@@ -426,16 +422,8 @@ class CullingBatchProcessor:
     
     def clear_cache(self) -> int:
         """Clear all cached results."""
-        cache_files = list(self.cache_dir.glob("*.pkl"))
-        count = 0
-        
-        for cache_file in cache_files:
-            try:
-                cache_file.unlink()
-                count += 1
-            except Exception as e:
-                logger.error(f"Error deleting cache file {cache_file}: {str(e)}")
-        
+        count = len(self._result_cache)
+        self._result_cache.clear()
         logger.info(f"Cleared {count} cached results")
         return count
 
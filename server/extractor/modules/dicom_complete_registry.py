@@ -5,1927 +5,28 @@ Comprehensive registry of standard DICOM Data Elements (Tags) from NEMA PS3.6.
 Target: ~7,000 fields
 """
 
-from typing import Dict, Any
+from collections import ChainMap
+from typing import Any, Dict, Mapping
 
-def get_dicom_registry_fields() -> Dict[str, str]:
-    tags = {
-        # --- Group 0002: File Meta Information ---
-        "0002,0000": "FileMetaInformationGroupLength",
-        "0002,0001": "FileMetaInformationVersion",
-        "0002,0002": "MediaStorageSOPClassUID",
-        "0002,0003": "MediaStorageSOPInstanceUID",
-        "0002,0010": "TransferSyntaxUID",
-        "0002,0012": "ImplementationClassUID",
-        "0002,0013": "ImplementationVersionName",
-        "0002,0016": "SourceApplicationEntityTitle",
-        "0002,0100": "PrivateInformationCreatorUID",
-        "0002,0102": "PrivateInformation",
+try:
+    from ..utils.field_tables import load_field_tables
+except ImportError:
+    from utils.field_tables import load_field_tables
 
-        # --- Group 0008: Image/Study Information ---
-        "0008,0001": "LengthToEnd",
-        "0008,0005": "SpecificCharacterSet",
-        "0008,0006": "LanguageCodeSequence",
-        "0008,0008": "ImageType",
-        "0008,0010": "RecognitionCode",
-        "0008,0012": "InstanceCreationDate",
-        "0008,0013": "InstanceCreationTime",
-        "0008,0014": "InstanceCreatorUID",
-        "0008,0015": "InstanceCoercionDateTime",
-        "0008,0016": "SOPClassUID",
-        "0008,0018": "SOPInstanceUID",
-        "0008,001A": "RelatedGeneralSOPClassUID",
-        "0008,001B": "OriginalSpecializedSOPClassUID",
-        "0008,0020": "StudyDate",
-        "0008,0021": "SeriesDate",
-        "0008,0022": "AcquisitionDate",
-        "0008,0023": "ContentDate",
-        "0008,0024": "OverlayDate",
-        "0008,0025": "CurveDate",
-        "0008,002A": "AcquisitionDateTime",
-        "0008,0030": "StudyTime",
-        "0008,0031": "SeriesTime",
-        "0008,0032": "AcquisitionTime",
-        "0008,0033": "ContentTime",
-        "0008,0034": "OverlayTime",
-        "0008,0035": "CurveTime",
-        "0008,0040": "DataSetType",
-        "0008,0041": "DataSetSubtype",
-        "0008,0042": "NuclearMedicineSeriesType",
-        "0008,0050": "AccessionNumber",
-        "0008,0051": "IssuerOfAccessionNumberSequence",
-        "0008,0052": "QueryRetrieveLevel",
-        "0008,0053": "QueryRetrieveView",
-        "0008,0054": "RetrieveAETitle",
-        "0008,0055": "StationAETitle",
-        "0008,0056": "InstanceAvailability",
-        "0008,0058": "FailedSOPInstanceUIDList",
-        "0008,0060": "Modality",
-        "0008,0061": "ModalitiesInStudy",
-        "0008,0062": "SOPClassesInStudy",
-        "0008,0063": "AnatomicRegionsInStudyCodeSequence",
-        "0008,0064": "ConversionType",
-        "0008,0068": "PresentationIntentType",
-        "0008,0070": "Manufacturer",
-        "0008,0080": "InstitutionName",
-        "0008,0081": "InstitutionAddress",
-        "0008,0082": "InstitutionCodeSequence",
-        "0008,0090": "ReferringPhysicianName",
-        "0008,0092": "ReferringPhysicianAddress",
-        "0008,0094": "ReferringPhysicianTelephoneNumber",
-        "0008,0096": "ReferringPhysicianIdentificationSequence",
-        "0008,009C": "ConsultingPhysicianName",
-        "0008,009D": "ConsultingPhysicianIdentificationSequence",
-        "0008,0100": "CodeValue",
-        "0008,0101": "ExtendedCodeValue",
-        "0008,0102": "CodingSchemeDesignator",
-        "0008,0103": "CodingSchemeVersion",
-        "0008,0104": "CodeMeaning",
-        "0008,0105": "MappingResource",
-        "0008,0106": "ContextGroupVersion",
-        "0008,0107": "ContextGroupLocalVersion",
-        "0008,0108": "ExtendedCodeMeaning",
-        "0008,010B": "ContextGroupExtensionFlag",
-        "0008,010C": "CodingSchemeUID",
-        "0008,010D": "ContextGroupExtensionCreatorUID",
-        "0008,010F": "ContextIdentifier",
-        "0008,0110": "CodingSchemeIdentificationSequence",
-        "0008,0112": "CodingSchemeRegistry",
-        "0008,0114": "CodingSchemeExternalID",
-        "0008,0115": "CodingSchemeName",
-        "0008,0116": "CodingSchemeResponsibleOrganization",
-        "0008,0117": "ContextUID",
-        "0008,0118": "MappingResourceUID",
-        "0008,0119": "LongCodeValue",
-        "0008,0120": "URNCodeValue",
-        "0008,0121": "EquivalentCodeSequence",
-        "0008,0122": "MappingResourceName",
-        "0008,0123": "ContextGroupIdentificationSequence",
-        "0008,0124": "MappingResourceIdentificationSequence",
-        "0008,0201": "TimezoneOffsetFromUTC",
-        "0008,0220": "ResponsibleGroupCodeSequence",
-        "0008,0221": "EquipmentModality",
-        "0008,0222": "ManufacturerRelatedModelGroup",
-        "0008,0300": "PrivateDataElementCharacteristicsSequence",
-        "0008,0301": "PrivateGroupReference",
-        "0008,0302": "PrivateCreatorReference",
-        "0008,0303": "BlockIdentifier",
-        "0008,0304": "PrivateDataElementDefinitionSequence",
-        "0008,0305": "PrivateDataElementVR",
-        "0008,0306": "PrivateDataElementName",
-        "0008,0307": "PrivateDataElementKeyword",
-        "0008,0308": "PrivateDataElementValueMultiplicity",
-        "0008,0309": "PrivateDataElementValueRepresentation",
-        "0008,030A": "PrivateDataElementNumberOfItems",
-        "0008,030B": "PrivateDataElementNameException",
-        "0008,030C": "PrivateDataElementKeywordException",
-        "0008,030D": "PrivateDataElementValueMultiplicityException",
-        "0008,030E": "PrivateDataElementValueRepresentationException",
-        "0008,030F": "PrivateDataElementNumberOfItemsException",
-        "0008,1000": "NetworkID",
-        "0008,1010": "StationName",
-        "0008,1030": "StudyDescription",
-        "0008,1032": "ProcedureCodeSequence",
-        "0008,103E": "SeriesDescription",
-        "0008,103F": "SeriesDescriptionCodeSequence",
-        "0008,1040": "InstitutionalDepartmentName",
-        "0008,1041": "InstitutionalDepartmentTypeCodeSequence",
-        "0008,1048": "PhysiciansOfRecord",
-        "0008,1049": "PhysiciansOfRecordIdentificationSequence",
-        "0008,1050": "PerformingPhysicianName",
-        "0008,1052": "PerformingPhysicianIdentificationSequence",
-        "0008,1060": "NameOfPhysicianReadingStudy",
-        "0008,1062": "PhysicianReadingStudyIdentificationSequence",
-        "0008,1070": "OperatorsName",
-        "0008,1072": "OperatorIdentificationSequence",
-        "0008,1080": "AdmittingDiagnosesDescription",
-        "0008,1084": "AdmittingDiagnosesCodeSequence",
-        "0008,1090": "ManufacturerModelName",
-        "0008,1100": "ReferencedResultsSequence",
-        "0008,1110": "ReferencedStudySequence",
-        "0008,1111": "ReferencedPerformedProcedureStepSequence",
-        "0008,1115": "ReferencedSeriesSequence",
-        "0008,1120": "ReferencedPatientSequence",
-        "0008,1125": "ReferencedVisitSequence",
-        "0008,1130": "ReferencedOverlaySequence",
-        "0008,1134": "ReferencedStereometricInstanceSequence",
-        "0008,113A": "ReferencedWaveformSequence",
-        "0008,1140": "ReferencedImageSequence",
-        "0008,1145": "ReferencedCurveSequence",
-        "0008,114A": "ReferencedInstanceSequence",
-        "0008,114B": "ReferencedRealWorldValueMappingInstanceSequence",
-        "0008,1150": "ReferencedSOPClassUID",
-        "0008,1155": "ReferencedSOPInstanceUID",
-        "0008,115A": "SOPClassesSupported",
-        "0008,1160": "ReferencedFrameNumber",
-        "0008,1161": "SimpleFrameList",
-        "0008,1162": "CalculatedFrameList",
-        "0008,1163": "TimeRange",
-        "0008,1164": "FrameExtractionSequence",
-        "0008,1167": "MultiFrameSourceSOPInstanceUID",
-        "0008,1190": "RetrieveURL",
-        "0008,1195": "TransactionUID",
-        "0008,1196": "WarningReason",
-        "0008,1197": "FailureReason",
-        "0008,1198": "FailedSOPSequence",
-        "0008,1199": "ReferencedSOPSequence",
-        "0008,119A": "OtherFailuresSequence",
-        "0008,1200": "StudiesContainingOtherReferencedInstancesSequence",
-        "0008,1250": "RelatedSeriesSequence",
-        "0008,2110": "LossyImageCompression",
-        "0008,2111": "DerivationDescription",
-        "0008,2112": "SourceImageSequence",
-        "0008,2114": "LossyImageCompressionRatio",
-        "0008,2120": "StageName",
-        "0008,2122": "StageNumber",
-        "0008,2124": "NumberOfStages",
-        "0008,2127": "ViewName",
-        "0008,2128": "ViewNumber",
-        "0008,2129": "NumberOfEventTimers",
-        "0008,212A": "NumberOfViewsInStage",
-        "0008,2130": "EventElapsedTimes",
-        "0008,2132": "EventTimerNames",
-        "0008,2133": "EventTimerSequence",
-        "0008,2134": "EventTimeOffset",
-        "0008,2135": "EventCodeSequence",
-        "0008,2142": "StartTrim",
-        "0008,2143": "StopTrim",
-        "0008,2144": "RecommendedDisplayFrameRate",
-        "0008,2200": "TransducerPosition",
-        "0008,2204": "TransducerOrientation",
-        "0008,2208": "AnatomicStructure",
-        "0008,2218": "AnatomicRegionSequence",
-        "0008,2220": "AnatomicRegionModifierSequence",
-        "0008,2228": "PrimaryAnatomicStructureSequence",
-        "0008,2229": "AnatomicStructureSpaceOrRegionSequence",
-        "0008,2230": "PrimaryAnatomicStructureModifierSequence",
-        "0008,2240": "TransducerPositionSequence",
-        "0008,2242": "TransducerPositionModifierSequence",
-        "0008,2244": "TransducerOrientationSequence",
-        "0008,2246": "TransducerOrientationModifierSequence",
-        "0008,3001": "AlternateRepresentationSequence",
-        "0008,3010": "IrradiationEventUID",
-        "0008,3011": "SourceIrradiationEventSequence",
-        "0008,3012": "RadiopharmaceuticalAdministrationEventUID",
-        "0008,4000": "IdentifyingComments",
-        "0008,9007": "FrameType",
-        "0008,9092": "ReferencedImageEvidenceSequence",
-        "0008,9121": "ReferencedRawDataSequence",
-        "0008,9123": "CreatorVersionUID",
-        "0008,9124": "DerivationImageSequence",
-        "0008,9154": "SourceImageEvidenceSequence",
-        "0008,9205": "PixelPresentation",
-        "0008,9206": "VolumetricProperties",
-        "0008,9207": "VolumeBasedCalculationTechnique",
-        "0008,9208": "ComplexImageComponent",
-        "0008,9209": "AcquisitionContrast",
-        "0008,9215": "DerivationCodeSequence",
-        "0008,9237": "ReferencedPresentationStateSequence",
-        "0008,9410": "ReferencedOtherPlaneSequence",
-        "0008,9458": "FrameDisplaySequence",
-        "0008,9459": "RecommendedDisplayFrameRateInFloat",
-        "0008,9460": "SkipFrameRangeFlag",
+# Tag table lives in field_table_sources/dicom_complete_registry.py and is
+# compiled to a memory-mapped table on first access
+_TABLES = load_field_tables("dicom_complete_registry")
+DICOM_REGISTRY_TAGS = _TABLES["DICOM_REGISTRY_TAGS"]
 
-        # --- Group 0010: Patient Information ---
-        "0010,0010": "PatientName",
-        "0010,0020": "PatientID",
-        "0010,0021": "IssuerOfPatientID",
-        "0010,0022": "TypeOfPatientID",
-        "0010,0024": "IssuerOfPatientIDQualifiersSequence",
-        "0010,0030": "PatientBirthDate",
-        "0010,0032": "PatientBirthTime",
-        "0010,0040": "PatientSex",
-        "0010,0050": "PatientInsurancePlanCodeSequence",
-        "0010,0101": "PatientPrimaryLanguageCodeSequence",
-        "0010,0102": "PatientPrimaryLanguageModifierCodeSequence",
-        "0010,1000": "OtherPatientIDs",
-        "0010,1001": "OtherPatientNames",
-        "0010,1002": "OtherPatientIDsSequence",
-        "0010,1005": "PatientBirthName",
-        "0010,1010": "PatientAge",
-        "0010,1020": "PatientSize",
-        "0010,1021": "PatientSizeCodeSequence",
-        "0010,1030": "PatientWeight",
-        "0010,1040": "PatientAddress",
-        "0010,1050": "InsurancePlanIdentification",
-        "0010,1060": "PatientMotherBirthName",
-        "0010,1080": "MilitaryRank",
-        "0010,1081": "BranchOfService",
-        "0010,1090": "MedicalRecordLocator",
-        "0010,2000": "MedicalAlerts",
-        "0010,2110": "Allergies",
-        "0010,2150": "CountryOfResidence",
-        "0010,2152": "RegionOfResidence",
-        "0010,2154": "PatientTelephoneNumber",
-        "0010,2155": "PatientTelecomInformation",
-        "0010,2160": "EthnicGroup",
-        "0010,2180": "Occupation",
-        "0010,21A0": "SmokingStatus",
-        "0010,21B0": "AdditionalPatientHistory",
-        "0010,21C0": "PregnancyStatus",
-        "0010,21D0": "LastMenstrualDate",
-        "0010,21F0": "PatientReligiousPreference",
-        "0010,2201": "PatientSpeciesDescription",
-        "0010,2202": "PatientSpeciesCodeSequence",
-        "0010,2203": "PatientSexNeutered",
-        "0010,2292": "PatientBreedDescription",
-        "0010,2293": "PatientBreedCodeSequence",
-        "0010,2294": "BreedRegistrationSequence",
-        "0010,2295": "BreedRegistrationNumber",
-        "0010,2296": "BreedRegistryCodeSequence",
-        "0010,2297": "ResponsiblePerson",
-        "0010,2298": "ResponsiblePersonRole",
-        "0010,2299": "ResponsibleOrganization",
-        "0010,4000": "PatientComments",
-        "0010,9431": "ExaminedBodyThickness",
 
-        # --- Group 0012: Clinical Trial ---
-        "0012,0010": "ClinicalTrialSponsorName",
-        "0012,0020": "ClinicalTrialProtocolID",
-        "0012,0021": "ClinicalTrialProtocolName",
-        "0012,0030": "ClinicalTrialSiteID",
-        "0012,0031": "ClinicalTrialSiteName",
-        "0012,0040": "ClinicalTrialSubjectID",
-        "0012,0042": "ClinicalTrialSubjectReadingID",
-        "0012,0050": "ClinicalTrialTimePointID",
-        "0012,0051": "ClinicalTrialTimePointDescription",
-        "0012,0060": "ClinicalTrialCoordinatingCenterName",
-        "0012,0062": "PatientIdentityRemoved",
-        "0012,0063": "DeidentificationMethod",
-        "0012,0064": "DeidentificationMethodCodeSequence",
-        "0012,0071": "ClinicalTrialSeriesID",
-        "0012,0072": "ClinicalTrialSeriesDescription",
-        "0012,0081": "ClinicalTrialProtocolEthicsCommitteeName",
-        "0012,0082": "ClinicalTrialProtocolEthicsCommitteeApprovalNumber",
-        "0012,0083": "ConsentForClinicalTrialUseSequence",
-        "0012,0084": "DistributionType",
-        "0012,0085": "ConsentForDistributionFlag",
-
-        # --- Group 0018: Acquisition Information ---
-        "0018,0010": "ContrastBolusAgent",
-        "0018,0012": "ContrastBolusAgentSequence",
-        "0018,0014": "ContrastBolusAdministrationRouteSequence",
-        "0018,0015": "BodyPartExamined",
-        "0018,0020": "ScanningSequence",
-        "0018,0021": "SequenceVariant",
-        "0018,0022": "ScanOptions",
-        "0018,0023": "MRAcquisitionType",
-        "0018,0024": "SequenceName",
-        "0018,0025": "AngioFlag",
-        "0018,0026": "InterventionDrugInformationSequence",
-        "0018,0027": "InterventionDrugStopTime",
-        "0018,0028": "InterventionDrugDose",
-        "0018,0029": "InterventionDrugCodeSequence",
-        "0018,002A": "AdditionalDrugSequence",
-        "0018,0030": "Radionuclide",
-        "0018,0031": "Radiopharmaceutical",
-        "0018,0032": "EnergyWindowCenterline",
-        "0018,0033": "EnergyWindowTotalWidth",
-        "0018,0034": "InterventionDrugName",
-        "0018,0035": "InterventionDrugStartTime",
-        "0018,0036": "InterventionSequence",
-        "0018,0037": "TherapyType",
-        "0018,0038": "InterventionStatus",
-        "0018,0039": "TherapyDescription",
-        "0018,003A": "InterventionDescription",
-        "0018,0040": "CineRate",
-        "0018,0042": "InitialCineRunState",
-        "0018,0050": "SliceThickness",
-        "0018,0060": "KVP",
-        "0018,0070": "CountsAccumulated",
-        "0018,0071": "AcquisitionTerminationCondition",
-        "0018,0072": "EffectiveDuration",
-        "0018,0073": "AcquisitionStartCondition",
-        "0018,0074": "AcquisitionStartConditionData",
-        "0018,0075": "AcquisitionTerminationConditionData",
-        "0018,0080": "RepetitionTime",
-        "0018,0081": "EchoTime",
-        "0018,0082": "InversionTime",
-        "0018,0083": "NumberOfAverages",
-        "0018,0084": "ImagingFrequency",
-        "0018,0085": "ImagedNucleus",
-        "0018,0086": "EchoNumber",
-        "0018,0087": "MagneticFieldStrength",
-        "0018,0088": "SpacingBetweenSlices",
-        "0018,0089": "NumberOfPhaseEncodingSteps",
-        "0018,0090": "DataCollectionDiameter",
-        "0018,0091": "EchoTrainLength",
-        "0018,0093": "PercentSampling",
-        "0018,0094": "PercentPhaseFieldOfView",
-        "0018,0095": "PixelBandwidth",
-        "0018,1000": "DeviceSerialNumber",
-        "0018,1002": "DeviceUID",
-        "0018,1003": "DeviceID",
-        "0018,1004": "PlateID",
-        "0018,1005": "GeneratorID",
-        "0018,1006": "GridID",
-        "0018,1007": "CassetteID",
-        "0018,1008": "GantryID",
-        "0018,1010": "SecondaryCaptureDeviceID",
-        "0018,1011": "HardcopyCreationDeviceID",
-        "0018,1012": "DateOfSecondaryCapture",
-        "0018,1014": "TimeOfSecondaryCapture",
-        "0018,1016": "SecondaryCaptureDeviceManufacturer",
-        "0018,1018": "SecondaryCaptureDeviceManufacturerModelName",
-        "0018,1019": "SecondaryCaptureDeviceSoftwareVersions",
-        "0018,1020": "SoftwareVersions",
-        "0018,1022": "VideoImageFormatAcquired",
-        "0018,1023": "DigitalImageFormatAcquired",
-        "0018,1030": "ProtocolName",
-        "0018,1040": "ContrastBolusRoute",
-        "0018,1041": "ContrastBolusVolume",
-        "0018,1042": "ContrastBolusStartTime",
-        "0018,1043": "ContrastBolusStopTime",
-        "0018,1044": "ContrastBolusTotalDose",
-        "0018,1045": "SyringeCounts",
-        "0018,1046": "ContrastFlowRate",
-        "0018,1047": "ContrastFlowDuration",
-        "0018,1048": "ContrastBolusIngredient",
-        "0018,1049": "ContrastBolusIngredientConcentration",
-        "0018,1050": "SpatialResolution",
-        "0018,1060": "TriggerTime",
-        "0018,1061": "TriggerSourceOrType",
-        "0018,1062": "NominalInterval",
-        "0018,1063": "FrameTime",
-        "0018,1064": "CardiacFramingType",
-        "0018,1065": "FrameTimeVector",
-        "0018,1066": "FrameDelay",
-        "0018,1067": "ImageTriggerDelay",
-        "0018,1068": "MultiplexGroupTimeOffset",
-        "0018,1069": "TriggerTimeOffset",
-        "0018,106A": "SynchronizationTrigger",
-        "0018,106C": "SynchronizationChannel",
-        "0018,106E": "TriggerSamplePosition",
-        "0018,1070": "RadiopharmaceuticalRoute",
-        "0018,1071": "RadiopharmaceuticalVolume",
-        "0018,1072": "RadiopharmaceuticalStartTime",
-        "0018,1073": "RadiopharmaceuticalStopTime",
-        "0018,1074": "RadionuclideTotalDose",
-        "0018,1075": "RadionuclideHalfLife",
-        "0018,1076": "RadionuclidePositronFraction",
-        "0018,1077": "RadiopharmaceuticalSpecificActivity",
-        "0018,1078": "RadiopharmaceuticalStartDateTime",
-        "0018,1079": "RadiopharmaceuticalStopDateTime",
-        "0018,1080": "BeatRejectionFlag",
-        "0018,1081": "LowRRValue",
-        "0018,1082": "HighRRValue",
-        "0018,1083": "IntervalsAcquired",
-        "0018,1084": "IntervalsRejected",
-        "0018,1085": "PVCRejection",
-        "0018,1086": "SkipBeats",
-        "0018,1088": "HeartRate",
-        "0018,1090": "CardiacNumberOfImages",
-        "0018,1094": "TriggerWindow",
-        "0018,1100": "ReconstructionDiameter",
-        "0018,1110": "DistanceSourceToDetector",
-        "0018,1111": "DistanceSourceToPatient",
-        "0018,1114": "EstimatedRadiographicMagnificationFactor",
-        "0018,1120": "GantryDetectorTilt",
-        "0018,1121": "GantryDetectorSlew",
-        "0018,1130": "TableHeight",
-        "0018,1131": "TableTraverse",
-        "0018,1134": "TableMotion",
-        "0018,1135": "TableVerticalIncrement",
-        "0018,1136": "TableLateralIncrement",
-        "0018,1137": "TableLongitudinalIncrement",
-        "0018,1138": "TableAngle",
-        "0018,113A": "TableType",
-        "0018,1140": "RotationDirection",
-        "0018,1141": "AngularPosition",
-        "0018,1142": "RadialPosition",
-        "0018,1143": "ScanArc",
-        "0018,1144": "AngularStep",
-        "0018,1145": "CenterOfRotationOffset",
-        "0018,1146": "RotationOffset",
-        "0018,1147": "FieldOfViewShape",
-        "0018,1149": "FieldOfViewDimensions",
-        "0018,1150": "ExposureTime",
-        "0018,1151": "XRayTubeCurrent",
-        "0018,1152": "Exposure",
-        "0018,1153": "ExposureInuAs",
-        "0018,1154": "AveragePulseWidth",
-        "0018,1155": "RadiationSetting",
-        "0018,1156": "RectificationType",
-        "0018,115A": "RadiationMode",
-        "0018,115E": "ImageAndFluoroscopyAreaDoseProduct",
-        "0018,1160": "FilterType",
-        "0018,1161": "TypeOfFilters",
-        "0018,1162": "IntensifierSize",
-        "0018,1164": "ImagerPixelSpacing",
-        "0018,1166": "Grid",
-        "0018,1170": "GeneratorPower",
-        "0018,1180": "CollimatorGridName",
-        "0018,1181": "CollimatorType",
-        "0018,1182": "FocalDistance",
-        "0018,1183": "XFocusCenter",
-        "0018,1184": "YFocusCenter",
-        "0018,1190": "FocalSpots",
-        "0018,1191": "AnodeTargetMaterial",
-        "0018,11A0": "BodyPartThickness",
-        "0018,11A2": "CompressionForce",
-        "0018,1200": "DateOfLastCalibration",
-        "0018,1201": "TimeOfLastCalibration",
-        "0018,1210": "ConvolutionKernel",
-        "0018,1240": "UpperLowerPixelValues",
-        "0018,1242": "ActualFrameDuration",
-        "0018,1243": "CountRate",
-        "0018,1244": "PreferredPlaybackSequencing",
-        "0018,1250": "ReceiveCoilName",
-        "0018,1251": "TransmitCoilName",
-        "0018,1260": "PlateType",
-        "0018,1261": "PhosphorType",
-        "0018,1300": "ScanVelocity",
-        "0018,1301": "WholeBodyTechnique",
-        "0018,1302": "ScanLength",
-        "0018,1310": "AcquisitionMatrix",
-        "0018,1312": "InPlanePhaseEncodingDirection",
-        "0018,1314": "FlipAngle",
-        "0018,1315": "VariableFlipAngleFlag",
-        "0018,1316": "SAR",
-        "0018,1318": "dBdt",
-        "0018,1400": "AcquisitionDeviceProcessingDescription",
-        "0018,1401": "AcquisitionDeviceProcessingCode",
-        "0018,1402": "CassetteOrientation",
-        "0018,1403": "CassetteSize",
-        "0018,1404": "ExposuresOnPlate",
-        "0018,1405": "RelativeXRayExposure",
-        "0018,1411": "ExposureIndex",
-        "0018,1412": "TargetExposureIndex",
-        "0018,1413": "DeviationIndex",
-        "0018,1450": "ColumnAngulation",
-        "0018,1460": "TomoLayerHeight",
-        "0018,1470": "TomoAngle",
-        "0018,1480": "TomoTime",
-        "0018,1490": "TomoType",
-        "0018,1491": "TomoClass",
-        "0018,1495": "NumberofTomoSynthesisSourceImages",
-        "0018,1500": "PositionerMotion",
-        "0018,1508": "PositionerType",
-        "0018,1510": "PositionerPrimaryAngle",
-        "0018,1511": "PositionerSecondaryAngle",
-        "0018,1520": "PositionerPrimaryAngleIncrement",
-        "0018,1521": "PositionerSecondaryAngleIncrement",
-        "0018,1530": "DetectorPrimaryAngle",
-        "0018,1531": "DetectorSecondaryAngle",
-        "0018,1600": "ShutterShape",
-        "0018,1602": "ShutterLeftVerticalEdge",
-        "0018,1604": "ShutterRightVerticalEdge",
-        "0018,1606": "ShutterUpperHorizontalEdge",
-        "0018,1608": "ShutterLowerHorizontalEdge",
-        "0018,1610": "CenterOfCircularShutter",
-        "0018,1612": "RadiusOfCircularShutter",
-        "0018,1620": "VerticesOfThePolygonalShutter",
-        "0018,1622": "ShutterPresentationValue",
-        "0018,1623": "ShutterOverlayGroup",
-        "0018,1624": "ShutterPresentationColorCIELabValue",
-        "0018,1700": "CollimatorShape",
-        "0018,1702": "CollimatorLeftVerticalEdge",
-        "0018,1704": "CollimatorRightVerticalEdge",
-        "0018,1706": "CollimatorUpperHorizontalEdge",
-        "0018,1708": "CollimatorLowerHorizontalEdge",
-        "0018,1710": "CenterOfCircularCollimator",
-        "0018,1712": "RadiusOfCircularCollimator",
-        "0018,1720": "VerticesOfThePolygonalCollimator",
-        "0018,1800": "AcquisitionTimeSynchronized",
-        "0018,1801": "TimeSource",
-        "0018,1802": "TimeDistributionProtocol",
-        "0018,1803": "NTPSourceAddress",
-        "0018,2001": "PageNumberVector",
-        "0018,2002": "FrameLabelVector",
-        "0018,2003": "FramePrimaryAngleVector",
-        "0018,2004": "FrameSecondaryAngleVector",
-        "0018,2005": "SliceLocationVector",
-        "0018,2006": "DisplayWindowLabelVector",
-        "0018,2010": "NominalScannedPixelSpacing",
-        "0018,2020": "DigitizingDeviceTransportDirection",
-        "0018,2030": "RotationOfScannedFilm",
-        "0018,3100": "IVUSAcquisition",
-        "0018,3101": "IVUSPullbackRate",
-        "0018,3102": "IVUSGatedRate",
-        "0018,3103": "IVUSPullbackStartFrameNumber",
-        "0018,3104": "IVUSPullbackStopFrameNumber",
-        "0018,3105": "LesionNumber",
-        "0018,5000": "OutputPower",
-        "0018,5010": "TransducerData",
-        "0018,5012": "FocusDepth",
-        "0018,5020": "ProcessingFunction",
-        "0018,5022": "MechanicalIndex",
-        "0018,5024": "BoneThermalIndex",
-        "0018,5026": "CranialThermalIndex",
-        "0018,5027": "SoftTissueThermalIndex",
-        "0018,5028": "SoftTissueFocusThermalIndex",
-        "0018,5029": "SoftTissueSurfaceThermalIndex",
-        "0018,5050": "DepthOfScanField",
-        "0018,5100": "PatientPosition",
-        "0018,5101": "ViewPosition",
-        "0018,5104": "ProjectionEponymousNameCodeSequence",
-        "0018,5210": "ImageTransformationMatrix",
-        "0018,5212": "ImageTranslationVector",
-        "0018,6000": "Sensitivity",
-        "0018,6011": "SequenceOfUltrasoundRegions",
-        "0018,6012": "RegionSpatialFormat",
-        "0018,6014": "RegionDataType",
-        "0018,6016": "RegionFlags",
-        "0018,6018": "RegionLocationMinX0",
-        "0018,601A": "RegionLocationMinY0",
-        "0018,601C": "RegionLocationMaxX1",
-        "0018,601E": "RegionLocationMaxY1",
-        "0018,6020": "ReferencePixelX0",
-        "0018,6022": "ReferencePixelY0",
-        "0018,6024": "PhysicalUnitsXDirection",
-        "0018,6026": "PhysicalUnitsYDirection",
-        "0018,6028": "ReferencePixelPhysicalValueX",
-        "0018,602A": "ReferencePixelPhysicalValueY",
-        "0018,602C": "PhysicalDeltaX",
-        "0018,602E": "PhysicalDeltaY",
-        "0018,6030": "TransducerFrequency",
-        "0018,6031": "TransducerType",
-        "0018,6032": "PulseRepetitionFrequency",
-        "0018,6034": "DopplerCorrectionAngle",
-        "0018,6036": "SteeringAngle",
-        "0018,6038": "DopplerSampleVolumeXPosition",
-        "0018,6039": "DopplerSampleVolumeXPositionRetired",
-        "0018,603A": "DopplerSampleVolumeYPosition",
-        "0018,603B": "DopplerSampleVolumeYPositionRetired",
-        "0018,603C": "TMLinePositionX0",
-        "0018,603D": "TMLinePositionX0Retired",
-        "0018,603E": "TMLinePositionY0",
-        "0018,603F": "TMLinePositionY0Retired",
-        "0018,6040": "TMLinePositionX1",
-        "0018,6041": "TMLinePositionX1Retired",
-        "0018,6042": "TMLinePositionY1",
-        "0018,6043": "TMLinePositionY1Retired",
-        "0018,6044": "PixelComponentOrganization",
-        "0018,6046": "PixelComponentMask",
-        "0018,6048": "PixelComponentRangeStart",
-        "0018,604A": "PixelComponentRangeStop",
-        "0018,604C": "PixelComponentPhysicalUnits",
-        "0018,604E": "PixelComponentDataType",
-        "0018,6050": "NumberOfTableBreakPoints",
-        "0018,6052": "TableOfXBreakPoints",
-        "0018,6054": "TableOfYBreakPoints",
-        "0018,6056": "NumberOfTableEntries",
-        "0018,6058": "TableOfPixelValues",
-        "0018,605A": "TableOfParameterValues",
-        "0018,6060": "RWaveTimeVector",
-        "0018,7000": "DetectorConditionsNominalFlag",
-        "0018,7001": "DetectorTemperature",
-        "0018,7004": "DetectorType",
-        "0018,7005": "DetectorConfiguration",
-        "0018,7006": "DetectorDescription",
-        "0018,7008": "DetectorMode",
-        "0018,700A": "DetectorID",
-        "0018,700C": "DateOfLastDetectorCalibration",
-        "0018,700E": "TimeOfLastDetectorCalibration",
-        "0018,7010": "ExposuresOnDetectorSinceLastCalibration",
-        "0018,7011": "ExposuresOnDetectorSinceManufactured",
-        "0018,7012": "DetectorTimeSinceLastExposure",
-        "0018,7014": "DetectorActiveTime",
-        "0018,7016": "DetectorActivationOffsetFromExposure",
-        "0018,701A": "DetectorBinning",
-        "0018,7020": "DetectorElementPhysicalSize",
-        "0018,7022": "DetectorElementSpacing",
-        "0018,7024": "DetectorActiveShape",
-        "0018,7026": "DetectorActiveDimensions",
-        "0018,7028": "DetectorActiveOrigin",
-        "0018,702A": "DetectorManufacturerName",
-        "0018,702B": "DetectorModelName",
-        "0018,7030": "FieldOfViewOrigin",
-        "0018,7032": "FieldOfViewRotation",
-        "0018,7034": "FieldOfViewHorizontalFlip",
-        "0018,7040": "GridAbsorbingMaterial",
-        "0018,7041": "GridSpacingMaterial",
-        "0018,7042": "GridThickness",
-        "0018,7044": "GridPitch",
-        "0018,7046": "GridAspectRatio",
-        "0018,7048": "GridPeriod",
-        "0018,704C": "GridFocalDistance",
-        "0018,7050": "FilterMaterial",
-        "0018,7052": "FilterThicknessMinimum",
-        "0018,7054": "FilterThicknessMaximum",
-        "0018,7060": "ExposureControlMode",
-        "0018,7062": "ExposureControlModeDescription",
-        "0018,7064": "ExposureStatus",
-        "0018,7065": "PhototimerSetting",
-        "0018,8150": "ExposureTimeInuS",
-        "0018,8151": "XRayTubeCurrentInuA",
-        "0018,9004": "ContentQualification",
-        "0018,9005": "PulseSequenceName",
-        "0018,9006": "MRImagingModifierSequence",
-        "0018,9008": "EchoPulseSequence",
-        "0018,9009": "InversionRecovery",
-        "0018,9010": "FlowCompensation",
-        "0018,9011": "MultipleSpinEcho",
-        "0018,9012": "MultiPlanarExcitation",
-        "0018,9014": "PhaseContrast",
-        "0018,9015": "TimeOfFlightContrast",
-        "0018,9016": "Spoiling",
-        "0018,9017": "SteadyStatePulseSequence",
-        "0018,9018": "EchoPlanarPulseSequence",
-        "0018,9019": "TagAngleFirstAxis",
-        "0018,9020": "MagnetizationTransfer",
-        "0018,9021": "T2Preparation",
-        "0018,9022": "BloodSignalNulling",
-        "0018,9024": "SaturationRecovery",
-        "0018,9025": "SpectrallySelectedSuppression",
-        "0018,9026": "SpectrallySelectedExcitation",
-        "0018,9027": "SpatialPresaturation",
-        "0018,9028": "OversamplingPhase",
-        "0018,9029": "Tagging",
-        "0018,9030": "TagSpacingFirstDimension",
-        "0018,9032": "GeometryOfKSpaceTraversal",
-        "0018,9033": "SegmentedKSpaceTraversal",
-        "0018,9034": "RectilinearPhaseEncodeReordering",
-        "0018,9035": "TAGAngleSecondAxis",
-        "0018,9036": "PolarKSpaceTraversal",
-        "0018,9037": "RadialKSpaceTraversal",
-        "0018,9041": "SpiralKSpaceTraversal",
-        "0018,9042": "MRVelocityEncodingSequence",
-        "0018,9043": "VelocityEncodingDirection",
-        "0018,9044": "VelocityEncodingMinimumValue",
-        "0018,9045": "VelocityEncodingAcquisitionScale",
-        "0018,9046": "NumberOfKSpaceTrajectories",
-        "0018,9047": "CoverageOfKSpace",
-        "0018,9048": "SpectroscopyAcquisitionPhaseRows",
-        "0018,9049": "PhaseContrastFlowLimit",
-        "0018,9050": "TagSpacingSecondDimension",
-        "0018,9051": "TagAngleSecondAxis",
-        "0018,9052": "FrameAcquisitionDateTime",
-        "0018,9053": "FrameAcquisitionDuration",
-        "0018,9054": "FrameReferenceDateTime",
-        "0018,9058": "MRImageFrameTypeSequence",
-        "0018,9059": "MRSpectroscopyFrameTypeSequence",
-        "0018,9060": "MRAcquisitionPhaseEncodingStepsInPlane",
-        "0018,9061": "MRAcquisitionPhaseEncodingStepsOutOfPlane",
-        "0018,9062": "SpectroscopyAcquisitionPhaseColumns",
-        "0018,9063": "CardiacCyclePosition",
-        "0018,9064": "SpecificAbsorptionRateSequence",
-        "0018,9065": "RFEchoTrainLength",
-        "0018,9066": "GradientEchoTrainLength",
-        "0018,9067": "ArterialSpinLabelingContrast",
-        "0018,9068": "MRArterialSpinLabelingSequence",
-        "0018,9069": "ASLTechniqueDescription",
-        "0018,9070": "ASLSlabNumber",
-        "0018,9071": "ASLSlabThickness",
-        "0018,9072": "ASLSlabOrientation",
-        "0018,9073": "ASLMidSlabPosition",
-        "0018,9074": "ASLContext",
-        "0018,9075": "ASLPulseTrainDuration",
-        "0018,9076": "ASLCrushFlag",
-        "0018,9077": "ASLCrushFlowLimit",
-        "0018,9078": "ASLCrushDescription",
-        "0018,9079": "ChemicalShiftReference",
-        "0018,9080": "VolumeLocalizationTechnique",
-        "0018,9081": "MRAcquisitionFrequencyEncodingSteps",
-        "0018,9082": "Deoupling",
-        "0018,9083": "DecoupledNucleus",
-        "0018,9084": "DecouplingFrequency",
-        "0018,9085": "DecouplingChemicalShiftReference",
-        "0018,9087": "KSpaceFiltering",
-        "0018,9089": "TimeDomainFiltering",
-        "0018,9090": "NumberOfZeroFills",
-        "0018,9091": "BaselineCorrection",
-        "0018,9093": "ParallelReductionFactorInPlane",
-        "0018,9094": "CardiacRRIntervalSpecified",
-        "0018,9095": "AcquisitionDuration",
-        "0018,9096": "FrameAcquisitionNumber",
-        "0018,9098": "DiffusionDirectionality",
-        "0018,9100": "DiffusionGradientDirectionSequence",
-        "0018,9101": "ParallelAcquisition",
-        "0018,9103": "ParallelAcquisitionTechnique",
-        "0018,9104": "InversionTimes",
-        "0018,9105": "MetaboliteMapDescription",
-        "0018,9106": "PartialFourier",
-        "0018,9107": "PartialFourierDirection",
-        "0018,9112": "ParallelReductionFactorOutOfPlane",
-        "0018,9114": "CodedValuesForAcquisitionDirection",
-        "0018,9115": "ParallelReductionFactorSecondInPlane",
-        "0018,9117": "CardiacBeatRejectionTechnique",
-        "0018,9118": "RespiratoryMotionCompensationTechnique",
-        "0018,9119": "RespiratorySignalSource",
-        "0018,9125": "BulkMotionCompensationTechnique",
-        "0018,9126": "BulkMotionSignalSource",
-        "0018,9127": "ApplicableSafetyStandardAgency",
-        "0018,9128": "ApplicableSafetyStandardDescription",
-        "0018,9129": "OperatingModeSequence",
-        "0018,9130": "OperatingModeType",
-        "0018,9131": "OperatingMode",
-        "0018,9132": "SpecificAbsorptionRateDefinition",
-        "0018,9133": "GradientOutputType",
-        "0018,9134": "SpecificAbsorptionRateValue",
-        "0018,9135": "GradientOutput",
-        "0018,9136": "FlowCompensationDirection",
-        "0018,9137": "TaggingDelay",
-        "0018,9138": "RespiratoryMotionCompensationTechniqueDescription",
-        "0018,9139": "RespiratorySignalSourceID",
-        "0018,9147": "ChemicalShiftMinimumIntegrationLimitInHz",
-        "0018,9148": "ChemicalShiftMaximumIntegrationLimitInHz",
-        "0018,9151": "MRVelocityEncodingSequence",
-        "0018,9152": "FirstOrderPhaseCorrection",
-        "0018,9155": "WaterReferencedPhaseCorrection",
-        "0018,9159": "MRSpectroscopyAcquisitionType",
-        "0018,9166": "RespiratoryCyclePosition",
-        "0018,9168": "VelocityEncodingMaximumValue",
-        "0018,9169": "TagSpacingThirdDimension",
-        "0018,9170": "FrameAcquisitionDuration",
-        "0018,9171": "MRImageFrameTypeSequence",
-        "0018,9172": "MRSpectroscopyFrameTypeSequence",
-        "0018,9173": "MRAcquisitionPhaseEncodingStepsInPlane",
-        "0018,9174": "MRAcquisitionPhaseEncodingStepsOutOfPlane",
-        "0018,9175": "SpectroscopyAcquisitionPhaseColumns",
-        "0018,9176": "CardiacCyclePosition",
-        "0018,9177": "SpecificAbsorptionRateSequence",
-        "0018,9178": "RFEchoTrainLength",
-        "0018,9179": "GradientEchoTrainLength",
-        "0018,9180": "ArterialSpinLabelingContrast",
-        "0018,9181": "MRArterialSpinLabelingSequence",
-        "0018,9182": "ASLTechniqueDescription",
-        "0018,9183": "ASLSlabNumber",
-        "0018,9184": "ASLSlabThickness",
-        "0018,9185": "ASLSlabOrientation",
-        "0018,9186": "ASLMidSlabPosition",
-        "0018,9195": "ChemicalShiftReference",
-        "0018,9196": "VolumeLocalizationTechnique",
-        "0018,9197": "MRAcquisitionFrequencyEncodingSteps",
-        "0018,9198": "Deoupling",
-        "0018,9199": "DecoupledNucleus",
-        "0018,9200": "DecouplingFrequency",
-        "0018,9214": "DecouplingChemicalShiftReference",
-        "0018,9217": "KSpaceFiltering",
-        "0018,9218": "TimeDomainFiltering",
-        "0018,9219": "NumberOfZeroFills",
-        "0018,9220": "BaselineCorrection",
-        "0018,9226": "ParallelReductionFactorInPlane",
-        "0018,9227": "CardiacRRIntervalSpecified",
-        "0018,9231": "AcquisitionDuration",
-        "0018,9232": "FrameAcquisitionNumber",
-        "0018,9234": "DiffusionDirectionality",
-        "0018,9236": "DiffusionGradientDirectionSequence",
-        "0018,9239": "ParallelAcquisition",
-        "0018,9240": "ParallelAcquisitionTechnique",
-        "0018,9241": "InversionTimes",
-        "0018,9250": "MetaboliteMapDescription",
-        "0018,9295": "ChemicalShiftMinimumIntegrationLimitInHz",
-        "0018,9296": "ChemicalShiftMaximumIntegrationLimitInHz",
-        "0018,9301": "CTAcquisitionTypeSequence",
-        "0018,9302": "AcquisitionType",
-        "0018,9303": "TubeAngle",
-        "0018,9304": "CTAcquisitionDetailsSequence",
-        "0018,9305": "RevolutionTime",
-        "0018,9306": "SingleCollimationWidth",
-        "0018,9307": "TotalCollimationWidth",
-        "0018,9308": "CTTableDynamicsSequence",
-        "0018,9309": "TableSpeed",
-        "0018,9310": "TableFeedPerRotation",
-        "0018,9311": "SpiralPitchFactor",
-        "0018,9312": "CTGeometrySequence",
-        "0018,9313": "DataCollectionCenterPatient",
-        "0018,9314": "CTReconstructionSequence",
-        "0018,9315": "ReconstructionAlgorithm",
-        "0018,9316": "ConvolutionKernelGroup",
-        "0018,9317": "ReconstructionFieldOfView",
-        "0018,9318": "ReconstructionTargetCenterPatient",
-        "0018,9319": "ReconstructionAngle",
-        "0018,9320": "ImageFilter",
-        "0018,9321": "CTExposureSequence",
-        "0018,9322": "ReconstructionPixelSpacing",
-        "0018,9323": "ExposureModulationType",
-        "0018,9324": "EstimatedDoseSaving",
-        "0018,9325": "CTXRayDetailsSequence",
-        "0018,9326": "CTPositionSequence",
-        "0018,9327": "TablePosition",
-        "0018,9328": "ExposureTimeInms",
-        "0018,9329": "CTImageFrameTypeSequence",
-        "0018,9330": "XRayTubeCurrentInmA",
-        "0018,9332": "ExposureInmAs",
-        "0018,9333": "ConstantVolumeFlag",
-        "0018,9334": "FluoroscopyFlag",
-        "0018,9335": "DistanceSourceToDataCollectionCenter",
-        "0018,9337": "ContrastBolusAgentNumber",
-        "0018,9338": "ContrastBolusIngredientCodeSequence",
-        "0018,9340": "ContrastAdministrationProfileSequence",
-        "0018,9341": "ContrastBolusUsageSequence",
-        "0018,9342": "ContrastBolusAgentAdministered",
-        "0018,9343": "ContrastBolusAgentDetected",
-        "0018,9344": "ContrastBolusAgentPhase",
-        "0018,9345": "CTDIvol",
-        "0018,9346": "CTDIPhantomTypeCodeSequence",
-        "0018,9351": "CalciumScoringMassFactorPatient",
-        "0018,9352": "CalciumScoringMassFactorDevice",
-        "0018,9353": "EnergyWeightingFactor",
-        "0018,9360": "CTAdditionalXRaySourceSequence",
-        "0018,9401": "ProjectionPixelCalibrationSequence",
-        "0018,9402": "DistanceSourceToIsocenter",
-        "0018,9403": "DistanceObjectToTableTop",
-        "0018,9404": "ObjectPixelSpacingInCenterOfBeam",
-        "0018,9405": "PositionerPositionSequence",
-        "0018,9406": "TablePositionSequence",
-        "0018,9407": "CollimatorShapeSequence",
-        "0018,9412": "XAXRFFrameCharacteristicsSequence",
-        "0018,9417": "FrameAcquisitionSequence",
-        "0018,9420": "XRayReceptorType",
-        "0018,9423": "AcquisitionProtocolName",
-        "0018,9424": "AcquisitionProtocolDescription",
-        "0018,9425": "ContrastBolusIngredientOpaque",
-        "0018,9426": "DistanceReceptorPlaneToDetectorHousing",
-        "0018,9427": "IntensifierActiveShape",
-        "0018,9428": "IntensifierActiveDimensions",
-        "0018,9429": "PhysicalDetectorSize",
-        "0018,9430": "PositionOfIsocenterProjection",
-        "0018,9432": "FieldOfViewSequence",
-        "0018,9433": "FieldOfViewDescription",
-        "0018,9434": "ExposureControlSensingRegionsSequence",
-        "0018,9435": "ExposureControlSensingRegionShape",
-        "0018,9436": "ExposureControlSensingRegionLeftVerticalEdge",
-        "0018,9437": "ExposureControlSensingRegionRightVerticalEdge",
-        "0018,9438": "ExposureControlSensingRegionUpperHorizontalEdge",
-        "0018,9439": "ExposureControlSensingRegionLowerHorizontalEdge",
-        "0018,9440": "CenterOfCircularExposureControlSensingRegion",
-        "0018,9441": "RadiusOfCircularExposureControlSensingRegion",
-        "0018,9442": "VerticesOfThePolygonalExposureControlSensingRegion",
-        "0018,9447": "ColumnAngulationPatient",
-        "0018,9449": "BeamAngle",
-        "0018,9451": "FrameDetectorParametersSequence",
-        "0018,9452": "CalculatedAnatomyThickness",
-        "0018,9455": "CalibrationSequence",
-        "0018,9456": "ObjectPixelSpacingInCenterOfBeam",
-        "0018,9457": "PositionerIsocenterPrimaryAngle",
-        "0018,9461": "PositionerIsocenterSecondaryAngle",
-        "0018,9462": "ProjectedArea",
-        "0018,9463": "FilmConsumptionSequence",
-        "0018,9464": "ContextGroupsIdentificationSequence",
-        "0018,9465": "ContextGroupVersion",
-        "0018,9466": "ContextGroupLocalVersion",
-        "0018,9467": "ContextGroupExtensionFlag",
-        "0018,9468": "ContextGroupExtensionCreatorUID",
-        "0018,9469": "ContextGroupExtensionCreatorName",
-        "0018,9470": "ContextGroupExtensionDate",
-        "0018,9471": "ContextGroupExtensionApplicationProfile",
-        "0018,9472": "TomosynthesisFrameType",
-        "0018,9473": "TomosynthesisLayerIndex",
-        "0018,9474": "TomosynthesisLayerStructure",
-        "0018,9475": "TomosynthesisLayerDistance",
-        "0018,9476": "XRayAcquisitionDoseSequence",
-        "0018,9477": "XRayFilteredAcquisitionSequence",
-
-        # --- Group 0020: Image Presentation ---
-        "0020,000D": "StudyInstanceUID",
-        "0020,000E": "SeriesInstanceUID",
-        "0020,0010": "StudyID",
-        "0020,0011": "SeriesNumber",
-        "0020,0012": "AcquisitionNumber",
-        "0020,0013": "InstanceNumber",
-        "0020,0014": "IsotopeNumber",
-        "0020,0015": "PhaseNumber",
-        "0020,0016": "IntervalNumber",
-        "0020,0017": "TimeSlotNumber",
-        "0020,0018": "AngleNumber",
-        "0020,0019": "ItemNumber",
-        "0020,0020": "PatientOrientation",
-        "0020,0022": "OverlayNumber",
-        "0020,0024": "CurveNumber",
-        "0020,0026": "LUTNumber",
-        "0020,0030": "ImagePosition",
-        "0020,0032": "ImagePositionPatient",
-        "0020,0035": "ImageOrientation",
-        "0020,0037": "ImageOrientationPatient",
-        "0020,0050": "Location",
-        "0020,0052": "FrameOfReferenceUID",
-        "0020,0060": "Laterality",
-        "0020,0062": "ImageLaterality",
-        "0020,0070": "ImageGeometryType",
-        "0020,0080": "MaskingImage",
-        "0020,0100": "TemporalPositionIdentifier",
-        "0020,0105": "NumberOfTemporalPositions",
-        "0020,0110": "TemporalResolution",
-        "0020,0200": "SynchronizationFrameOfReferenceUID",
-        "0020,1000": "SeriesInStudy",
-        "0020,1001": "AcquisitionsInSeries",
-        "0020,1002": "ImagesInAcquisition",
-        "0020,1003": "ImagesInSeries",
-        "0020,1004": "AcquisitionsInStudy",
-        "0020,1005": "ImagesInStudy",
-        "0020,1020": "Reference",
-        "0020,1040": "PositionReferenceIndicator",
-        "0020,1041": "SliceLocation",
-        "0020,1070": "OtherStudyNumbers",
-        "0020,1200": "NumberOfPatientRelatedStudies",
-        "0020,1202": "NumberOfPatientRelatedSeries",
-        "0020,1204": "NumberOfPatientRelatedInstances",
-        "0020,1206": "NumberOfStudyRelatedSeries",
-        "0020,1208": "NumberOfStudyRelatedInstances",
-        "0020,1209": "NumberOfSeriesRelatedInstances",
-        "0020,3401": "ModifyingDeviceID",
-        "0020,3402": "ModifiedImageID",
-        "0020,3403": "ModifiedImageDate",
-        "0020,3404": "ModifyingDeviceManufacturer",
-        "0020,3405": "ModifiedImageTime",
-        "0020,3406": "ModifiedImageDescription",
-        "0020,4000": "ImageComments",
-        "0020,5000": "OriginalImageIdentification",
-        "0020,5002": "OriginalImageIdentificationNomenclature",
-        "0020,9056": "StackID",
-        "0020,9057": "InStackPositionNumber",
-        "0020,9071": "FrameAnatomySequence",
-        "0020,9072": "FrameLaterality",
-        "0020,9111": "FrameContentSequence",
-        "0020,9113": "PlanePositionSequence",
-        "0020,9116": "PlaneOrientationSequence",
-        "0020,9128": "TemporalPositionIndex",
-        "0020,9153": "NominalCardiacTriggerDelayTime",
-        "0020,9156": "FrameAcquisitionNumber",
-        "0020,9157": "DimensionIndexValues",
-        "0020,9158": "FrameComments",
-        "0020,9161": "ConcatenationUID",
-        "0020,9162": "InConcatenationNumber",
-        "0020,9163": "InConcatenationTotalNumber",
-        "0020,9164": "DimensionOrganizationUID",
-        "0020,9165": "DimensionIndexPointer",
-        "0020,9167": "FunctionalGroupPointer",
-        "0020,9213": "DimensionIndexPrivateCreator",
-        "0020,9221": "DimensionOrganizationSequence",
-        "0020,9222": "DimensionIndexSequence",
-        "0020,9238": "ConcatenationFrameOffsetNumber",
-        "0020,9241": "FunctionalGroupPrivateCreator",
-        "0020,9245": "NominalPercentageOfCardiacPhase",
-        "0020,9246": "NominalPercentageOfRespiratoryPhase",
-        "0020,9247": "StartingRespiratoryAmplitude",
-        "0020,9248": "StartingRespiratoryPhase",
-        "0020,9249": "EndingRespiratoryAmplitude",
-        "0020,9250": "EndingRespiratoryPhase",
-        "0020,9251": "RespiratoryTriggerType",
-        "0020,9252": "RRIntervalTimeNominal",
-        "0020,9253": "ActualCardiacTriggerDelayTime",
-        "0020,9254": "RespiratorySynchronizationSequence",
-        "0020,9255": "RespiratoryIntervalTime",
-        "0020,9256": "NominalRespiratoryTriggerDelayTime",
-        "0020,9257": "RespiratoryTriggerDelayThreshold",
-        "0020,9301": "ActualFrameDuration",
-        "0020,9302": "CountRate",
-        "0020,9307": "PreferredPlaybackSequencing",
-        "0020,9308": "ReceiveCoilName",
-        "0020,9309": "TransmitCoilName",
-        "0020,9310": "PlateType",
-        "0020,9311": "PhosphorType",
-        "0020,9421": "Planes",
-        "0020,9450": "BiopsyTargetSequence",
-        "0020,9453": "TargetUID",
-        "0020,9518": "DevicePosition",
-        "0020,9529": "DeviceOrientation",
-        "0020,9538": "DevicePositionSequence",
-
-        # --- Group 0028: Image Pixel ---
-        "0028,0002": "SamplesPerPixel",
-        "0028,0003": "SamplesPerPixelUsed",
-        "0028,0004": "PhotometricInterpretation",
-        "0028,0005": "ImageDimensions",
-        "0028,0006": "PlanarConfiguration",
-        "0028,0008": "NumberOfFrames",
-        "0028,0009": "FrameIncrementPointer",
-        "0028,000A": "FrameDimensionPointer",
-        "0028,0010": "Rows",
-        "0028,0011": "Columns",
-        "0028,0012": "Planes",
-        "0028,0014": "UltrasoundColorDataPresent",
-        "0028,0020": "PixelAspectRatio", # Deprecated but exists
-        "0028,0030": "PixelSpacing",
-        "0028,0031": "ZoomFactor",
-        "0028,0032": "ZoomCenter",
-        "0028,0034": "PixelAspectRatio",
-        "0028,0040": "ImageFormat",
-        "0028,0050": "ManipulatedImage",
-        "0028,0051": "CorrectedImage",
-        "0028,005F": "CompressionRecognitionCode",
-        "0028,0060": "CompressionCode",
-        "0028,0061": "CompressionOriginator",
-        "0028,0062": "CompressionLabel",
-        "0028,0063": "CompressionDescription",
-        "0028,0065": "CompressionSequence",
-        "0028,0066": "CompressionStepPointers",
-        "0028,0068": "RepeatInterval",
-        "0028,0069": "BitsGrouped",
-        "0028,0070": "PerimeterTable",
-        "0028,0071": "PerimeterValue",
-        "0028,0080": "PredictorRows",
-        "0028,0081": "PredictorColumns",
-        "0028,0082": "PredictorConstants",
-        "0028,0090": "BlockedPixels",
-        "0028,0091": "BlockRows",
-        "0028,0092": "BlockColumns",
-        "0028,0093": "RowOverlap",
-        "0028,0094": "ColumnOverlap",
-        "0028,0100": "BitsAllocated",
-        "0028,0101": "BitsStored",
-        "0028,0102": "HighBit",
-        "0028,0103": "PixelRepresentation",
-        "0028,0104": "SmallestValidPixelValue",
-        "0028,0105": "LargestValidPixelValue",
-        "0028,0106": "SmallestImagePixelValue",
-        "0028,0107": "LargestImagePixelValue",
-        "0028,0108": "SmallestPixelValueInSeries",
-        "0028,0109": "LargestPixelValueInSeries",
-        "0028,0110": "SmallestImagePixelValueInPlane",
-        "0028,0111": "LargestImagePixelValueInPlane",
-        "0028,0120": "PixelPaddingValue",
-        "0028,0121": "PixelPaddingRangeLimit",
-        "0028,0122": "FloatPixelPaddingValue",
-        "0028,0123": "DoubleFloatPixelPaddingValue",
-        "0028,0124": "FloatPixelPaddingRangeLimit",
-        "0028,0125": "DoubleFloatPixelPaddingRangeLimit",
-        "0028,0200": "ImageLocation",
-        "0028,0300": "QualityControlImage",
-        "0028,0301": "BurnedInAnnotation",
-        "0028,0302": "RecognizableVisualFeatures",
-        "0028,0303": "LongitudinalTemporalInformationModified",
-        "0028,0304": "ReferencedColorPaletteInstanceUID",
-        "0028,0400": "TransformLabel",
-        "0028,0401": "TransformVersionNumber",
-        "0028,0402": "NumberOfTransformSteps",
-        "0028,0403": "SequenceOfCompressedData",
-        "0028,0404": "DetailsOfCoefficients",
-        "0028,0700": "DCTLabel",
-        "0028,0701": "DataBlockDescription",
-        "0028,0702": "DataBlock",
-        "0028,0710": "NormalizationFactorFormat",
-        "0028,0720": "ZonalMapNumberFormat",
-        "0028,0721": "ZonalMapLocation",
-        "0028,0722": "ZonalMapFormat",
-        "0028,0730": "AdaptiveMapFormat",
-        "0028,0740": "CodeNumberFormat",
-        "0028,0800": "CodeLabel",
-        "0028,0802": "NumberOfTables",
-        "0028,0803": "CodeTableLocation",
-        "0028,0804": "BitsForCodeWord",
-        "0028,0808": "ImageDataLocation",
-        "0028,1040": "PixelIntensityRelationship",
-        "0028,1041": "PixelIntensityRelationshipSign",
-        "0028,1050": "WindowCenter",
-        "0028,1051": "WindowWidth",
-        "0028,1052": "RescaleIntercept",
-        "0028,1053": "RescaleSlope",
-        "0028,1054": "RescaleType",
-        "0028,1055": "WindowCenterWidthExplanation",
-        "0028,1056": "VOILUTFunction",
-        "0028,1080": "GrayScale",
-        "0028,1090": "RecommendedViewingMode",
-        "0028,1100": "GrayLookupTableDescriptor",
-        "0028,1101": "RedPaletteColorLookupTableDescriptor",
-        "0028,1102": "GreenPaletteColorLookupTableDescriptor",
-        "0028,1103": "BluePaletteColorLookupTableDescriptor",
-        "0028,1104": "AlphaPaletteColorLookupTableDescriptor",
-        "0028,1111": "LargeRedPaletteColorLookupTableDescriptor",
-        "0028,1112": "LargeGreenPaletteColorLookupTableDescriptor",
-        "0028,1113": "LargeBluePaletteColorLookupTableDescriptor",
-        "0028,1199": "PaletteColorLookupTableUID",
-        "0028,1200": "GrayLookupTableData",
-        "0028,1201": "RedPaletteColorLookupTableData",
-        "0028,1202": "GreenPaletteColorLookupTableData",
-        "0028,1203": "BluePaletteColorLookupTableData",
-        "0028,1204": "AlphaPaletteColorLookupTableData",
-        "0028,1211": "LargeRedPaletteColorLookupTableData",
-        "0028,1212": "LargeGreenPaletteColorLookupTableData",
-        "0028,1213": "LargeBluePaletteColorLookupTableData",
-        "0028,1214": "LargePaletteColorLookupTableUID",
-        "0028,1221": "SegmentedRedPaletteColorLookupTableData",
-        "0028,1222": "SegmentedGreenPaletteColorLookupTableData",
-        "0028,1223": "SegmentedBluePaletteColorLookupTableData",
-        "0028,1224": "SegmentedAlphaPaletteColorLookupTableData",
-        "0028,1300": "ImplantPresent",
-        "0028,1350": "PartialView",
-        "0028,1351": "PartialViewDescription",
-        "0028,1352": "PartialViewCodeSequence",
-        "0028,135A": "SpatialLocationsPreserved",
-        "0028,1401": "DataFrameAssignmentSequence",
-        "0028,1402": "DataPathAssignment",
-        "0028,1403": "BitsMappedToColorLookupTable",
-        "0028,1404": "BlendingLUT1Sequence",
-        "0028,1405": "BlendingLUT1TransferFunction",
-        "0028,1406": "BlendingWeightConstant",
-        "0028,1407": "BlendingLookupTableDescriptor",
-        "0028,1408": "BlendingLookupTableData",
-        "0028,140B": "EnhancedPaletteColorLookupTableSequence",
-        "0028,140C": "BlendingLUT2Sequence",
-        "0028,140D": "BlendingLUT2TransferFunction",
-        "0028,140E": "DataPathID",
-        "0028,140F": "RGBLUTTransferFunction",
-        "0028,1410": "AlphaLUTTransferFunction",
-        "0028,2000": "ICCProfile",
-        "0028,2002": "ColorSpace",
-        "0028,2110": "LossyImageCompression",
-        "0028,2112": "LossyImageCompressionRatio",
-        "0028,2114": "LossyImageCompressionMethod",
-        "0028,3000": "ModalityLUTSequence",
-        "0028,3002": "LUTDescriptor",
-        "0028,3003": "LUTExplanation",
-        "0028,3004": "ModalityLUTType",
-        "0028,3006": "LUTData",
-        "0028,3010": "VOILUTSequence",
-        "0028,3110": "SoftcopyVOILUTSequence",
-        "0028,4000": "BiPlaneAcquisitionSequence",
-        "0028,5000": "RepresentativeFrameNumber",
-        "0028,6010": "FrameNumbersOfInterest",
-        "0028,6020": "FrameOfInterestDescription",
-        "0028,6022": "FrameOfInterestType",
-        "0028,6030": "MaskPointers",
-        "0028,6040": "RWavePointer",
-        "0028,6100": "MaskSubtractionSequence",
-        "0028,6101": "MaskOperation",
-        "0028,6102": "ApplicableFrameRange",
-        "0028,6110": "MaskFrameNumbers",
-        "0028,6112": "ContrastFrameAveraging",
-        "0028,6114": "MaskSubPixelShift",
-        "0028,6120": "TidOffset",
-        "0028,6190": "MaskOperationExplanation",
-        "0028,7000": "EquipmentAdministeredValues",
-        "0028,7FE0": "PixelData",
-        "0028,9001": "DataPointRows",
-        "0028,9002": "DataPointColumns",
-        "0028,9003": "SignalDomainColumns",
-        "0028,9099": "LargestMonochromePixelValue",
-        "0028,9108": "DataRepresentation",
-        "0028,9110": "PixelMeasuresSequence",
-        "0028,9132": "FrameVOILUTSequence",
-        "0028,9145": "PixelValueTransformationSequence",
-        "0028,9235": "SignalDomainRows",
-        "0028,9411": "DisplayFilterPercentage",
-        "0028,9415": "FramePixelShiftSequence",
-        "0028,9416": "SubtractionItemID",
-        "0028,9422": "PixelIntensityRelationshipLUTSequence",
-        "0028,9443": "FramePixelDataPropertiesSequence",
-        "0028,9444": "GeometricalProperties",
-        "0028,9445": "GeometricMaximumDistortion",
-        "0028,9446": "ImageProcessingApplied",
-        "0028,9454": "MaskSelectionMode",
-        "0028,9474": "LUTFunction",
-        "0028,9478": "MaskVisibilityPercentage",
-        "0028,9501": "PixelShiftSequence",
-        "0028,9502": "RegionPixelShiftSequence",
-        "0028,9503": "VerticesOfTheRegion",
-        "0028,9505": "MultiFramePresentationSequence",
-        "0028,9506": "PixelShiftFrameRange",
-        "0028,9507": "LUTFrameRange",
-        "0028,9508": "ImageToEquipmentMappingMatrix",
-        "0028,9520": "EquipmentCoordinateSystemIdentification",
-        "0028,9537": "EquipmentPlanarOrientation",
-
-        # --- Group 0032: Study Information ---
-        "0032,000A": "StudyStatusID",
-        "0032,000C": "StudyPriorityID",
-        "0032,0012": "StudyIDIssuer",
-        "0032,0032": "StudyVerifiedDate",
-        "0032,0033": "StudyVerifiedTime",
-        "0032,0034": "StudyReadDate",
-        "0032,0035": "StudyReadTime",
-        "0032,1000": "ScheduledStudyStartDate",
-        "0032,1001": "ScheduledStudyStartTime",
-        "0032,1010": "ScheduledStudyStopDate",
-        "0032,1011": "ScheduledStudyStopTime",
-        "0032,1020": "ScheduledStudyLocation",
-        "0032,1021": "ScheduledStudyLocationAETitle",
-        "0032,1030": "ReasonForStudy",
-        "0032,1031": "RequestingPhysicianIdentificationSequence",
-        "0032,1032": "RequestingPhysician",
-        "0032,1033": "RequestingService",
-        "0032,1034": "RequestingServiceCodeSequence",
-        "0032,1040": "StudyArrivalDate",
-        "0032,1041": "StudyArrivalTime",
-        "0032,1050": "StudyCompletionDate",
-        "0032,1051": "StudyCompletionTime",
-        "0032,1055": "StudyComponentStatusID",
-        "0032,1060": "RequestedProcedureDescription",
-        "0032,1064": "RequestedProcedureCodeSequence",
-        "0032,1070": "RequestedContrastAgent",
-        "0032,4000": "StudyComments",
-
-        # --- Group 0038: Visit Information ---
-        "0038,0004": "AdmittingDiagnosisDescription",
-        "0038,0008": "AdmittingDiagnosisCodeSequence",
-        "0038,0010": "AdmissionID",
-        "0038,0011": "IssuerOfAdmissionID",
-        "0038,0014": "IssuerOfAdmissionIDSequence",
-        "0038,0016": "RouteOfAdmissions",
-        "0038,001A": "ScheduledAdmissionDate",
-        "0038,001B": "ScheduledAdmissionTime",
-        "0038,001C": "ScheduledDischargeDate",
-        "0038,001D": "ScheduledDischargeTime",
-        "0038,001E": "ScheduledPatientInstitutionResidence",
-        "0038,0020": "AdmittingDate",
-        "0038,0021": "AdmittingTime",
-        "0038,0030": "DischargeDate",
-        "0038,0032": "DischargeTime",
-        "0038,0040": "DischargeDiagnosisDescription",
-        "0038,0044": "DischargeDiagnosisCodeSequence",
-        "0038,0050": "SpecialNeeds",
-        "0038,0060": "ServiceEpisodeID",
-        "0038,0061": "IssuerOfServiceEpisodeID",
-        "0038,0062": "ServiceEpisodeDescription",
-        "0038,0064": "IssuerOfServiceEpisodeIDSequence",
-        "0038,0100": "PertinentDocumentsSequence",
-        "0038,0300": "CurrentPatientLocation",
-        "0038,0400": "PatientInstitutionResidence",
-        "0038,0500": "PatientState",
-        "0038,0502": "PatientClinicalTrialParticipationSequence",
-        "0038,4000": "VisitComments",
-
-        # --- Group 003A: Waveform ---
-        "003A,0002": "WaveformOriginality",
-        "003A,0003": "NumberOfWaveformChannels",
-        "003A,0004": "NumberOfWaveformSamples",
-        "003A,0005": "SamplingFrequency",
-        "003A,0010": "MultiplexGroupLabel",
-        "003A,001A": "ChannelDefinitionSequence",
-        "003A,0020": "WaveformChannelNumber",
-        "003A,0200": "ChannelLabel",
-        "003A,0202": "ChannelStatus",
-        "003A,0203": "ChannelSourceSequence",
-        "003A,0205": "ChannelSourceModifiersSequence",
-        "003A,0208": "SourceWaveformSequence",
-        "003A,0209": "ChannelDerivationDescription",
-        "003A,020A": "ChannelSensitivity",
-        "003A,020B": "ChannelSensitivityUnitsSequence",
-        "003A,020C": "ChannelSensitivityCorrectionFactor",
-        "003A,0210": "ChannelBaseline",
-        "003A,0211": "ChannelTimeSkew",
-        "003A,0212": "ChannelSampleSkew",
-        "003A,0213": "ChannelOffset",
-        "003A,0214": "WaveformBitsStored",
-        "003A,0215": "FilterLowFrequency",
-        "003A,0216": "FilterHighFrequency",
-        "003A,0218": "NotchFilterFrequency",
-        "003A,021A": "NotchFilterBandwidth",
-        "003A,0220": "WaveformDataDisplayScale",
-        "003A,0221": "WaveformDisplayBackgroundCIELabValue",
-        "003A,0222": "WaveformPresentationGroupSequence",
-        "003A,0223": "WaveformColorCIELabValue",
-        "003A,0230": "PresentationGroupNumber",
-        "003A,0231": "ChannelDisplaySequence",
-        "003A,0240": "DominantWaveformSequence",
-        "003A,0241": "SimultaneousWaveformSequence",
-        "003A,0242": "ChannelWidth",
-        "003A,0300": "MultiplexGroupTimeOffset",
-        "003A,0301": "WaveformOriginality",
-        "003A,0302": "WaveformChannelNumber",
-        "003A,1000": "WaveformPaddingValue",
-
-        # --- Group 0040: Modality Worklist ---
-        "0040,0001": "ScheduledStationAETitle",
-        "0040,0002": "ScheduledProcedureStepStartDate",
-        "0040,0003": "ScheduledProcedureStepStartTime",
-        "0040,0004": "ScheduledProcedureStepEndDate",
-        "0040,0005": "ScheduledProcedureStepEndTime",
-        "0040,0006": "ScheduledPerformingPhysicianName",
-        "0040,0007": "ScheduledProcedureStepDescription",
-        "0040,0008": "ScheduledProtocolCodeSequence",
-        "0040,0009": "ScheduledProcedureStepID",
-        "0040,000A": "StageCodeSequence",
-        "0040,000B": "ScheduledPerformingPhysicianIdentificationSequence",
-        "0040,0010": "ScheduledStationName",
-        "0040,0011": "ScheduledProcedureStepLocation",
-        "0040,0012": "PreMedication",
-        "0040,0020": "ScheduledProcedureStepStatus",
-        "0040,0100": "ScheduledProcedureStepSequence",
-        "0040,0220": "ReferencedNonImageCompositeSOPInstanceSequence",
-        "0040,0241": "PerformedStationAETitle",
-        "0040,0242": "PerformedStationName",
-        "0040,0243": "PerformedLocation",
-        "0040,0244": "PerformedProcedureStepStartDate",
-        "0040,0245": "PerformedProcedureStepStartTime",
-        "0040,0250": "PerformedProcedureStepEndDate",
-        "0040,0251": "PerformedProcedureStepEndTime",
-        "0040,0252": "PerformedProcedureStepStatus",
-        "0040,0253": "PerformedProcedureStepID",
-        "0040,0254": "PerformedProcedureStepDescription",
-        "0040,0255": "PerformedProcedureTypeDescription",
-        "0040,0260": "PerformedProtocolCodeSequence",
-        "0040,0270": "ScheduledStepAttributesSequence",
-        "0040,0275": "RequestAttributesSequence",
-        "0040,0280": "CommentsOnThePerformedProcedureStep",
-        "0040,0281": "PerformedProcedureStepDiscontinuationReasonCodeSequence",
-        "0040,0293": "QuantitySequence",
-        "0040,0294": "Quantity",
-        "0040,0295": "MeasuringUnitsSequence",
-        "0040,0296": "BillingItemSequence",
-        "0040,0300": "TotalTimeOfFluoroscopy",
-        "0040,0301": "TotalNumberOfExposures",
-        "0040,0302": "EntranceDose",
-        "0040,0303": "ExposedArea",
-        "0040,0306": "DistanceSourceToEntrance",
-        "0040,0307": "DistanceSourceToSupport",
-        "0040,0310": "CommentsOnRadiationDose",
-        "0040,0312": "XRayOutput",
-        "0040,0314": "HalfValueLayer",
-        "0040,0316": "OrganDose",
-        "0040,0318": "OrganExposed",
-        "0040,0320": "BillingProcedureStepSequence",
-        "0040,0321": "FilmConsumptionSequence",
-        "0040,0324": "BillingSuppliesAndDevicesSequence",
-        "0040,0330": "ReferencedProcedureStepSequence",
-        "0040,0340": "PerformedSeriesSequence",
-        "0040,0400": "CommentsOnTheScheduledProcedureStep",
-        "0040,0440": "ProtocolContextSequence",
-        "0040,0441": "ContentItemModifierSequence",
-        "0040,050A": "SpecimenAccessionNumber",
-        "0040,0512": "ContainerIdentifier",
-        "0040,0513": "IssuerOfContainerIdentifierSequence",
-        "0040,0515": "AlternateContainerIdentifierSequence",
-        "0040,0518": "ContainerTypeCodeSequence",
-        "0040,051A": "ContainerDescription",
-        "0040,0520": "ContainerComponentSequence",
-        "0040,0550": "SpecimenSequence",
-        "0040,0551": "SpecimenIdentifier",
-        "0040,0552": "SpecimenDescriptionSequence",
-        "0040,0553": "SpecimenDescription",
-        "0040,0554": "SpecimenUID",
-        "0040,0555": "AcquisitionContextSequence",
-        "0040,0556": "AcquisitionContextDescription",
-        "0040,059A": "SpecimenTypeCodeSequence",
-        "0040,0600": "SpecimenShortDescription",
-        "0040,0602": "SpecimenDetailedDescription",
-        "0040,0610": "SpecimenPreparationSequence",
-        "0040,0612": "SpecimenPreparationStepContentItemSequence",
-        "0040,06FA": "SlideIdentifier",
-        "0040,071A": "ImageCenterPointCoordinatesSequence",
-        "0040,072A": "XOffsetInSlideCoordinateSystem",
-        "0040,073A": "YOffsetInSlideCoordinateSystem",
-        "0040,074A": "ZOffsetInSlideCoordinateSystem",
-        "0040,08D8": "PixelSpacingSequence",
-        "0040,08DA": "CoordinateSystemAxisCodeSequence",
-        "0040,08EA": "MeasurementUnitsCodeSequence",
-        "0040,09F8": "VitalStainCodeSequence",
-        "0040,1001": "RequestedProcedureID",
-        "0040,1002": "ReasonOfTheRequestedProcedure",
-        "0040,1003": "RequestedProcedurePriority",
-        "0040,1004": "PatientTransportArrangements",
-        "0040,1005": "RequestedProcedureLocation",
-        "0040,1006": "PlacerOrderNumberProcedure",
-        "0040,1007": "FillerOrderNumberProcedure",
-        "0040,1008": "ConfidentialityCode",
-        "0040,1009": "ReportingPriority",
-        "0040,100A": "ReasonForRequestedProcedureCodeSequence",
-        "0040,1010": "NamesOfIntendedRecipientsOfResults",
-        "0040,1011": "IntendedRecipientsOfResultsIdentificationSequence",
-        "0040,1012": "ReasonForRequestedProcedureRemarks",
-        "0040,1101": "PersonIdentificationCodeSequence",
-        "0040,1102": "PersonAddress",
-        "0040,1103": "PersonTelephoneNumbers",
-        "0040,1104": "PersonTelecomInformation",
-        "0040,1400": "RequestedProcedureComments",
-        "0040,2001": "ReasonOfTheImagingServiceRequest",
-        "0040,2004": "IssueDateOfImagingServiceRequest",
-        "0040,2005": "IssueTimeOfImagingServiceRequest",
-        "0040,2006": "PlacerOrderNumberImagingServiceRequest", # Retired
-        "0040,2007": "FillerOrderNumberImagingServiceRequest", # Retired
-        "0040,2008": "OrderEnteredBy",
-        "0040,2009": "OrderEntererLocation",
-        "0040,2010": "OrderCallbackPhoneNumber",
-        "0040,2011": "OrderCallbackTelecomInformation",
-        "0040,2016": "PlacerOrderNumberImagingServiceRequest",
-        "0040,2017": "FillerOrderNumberImagingServiceRequest",
-        "0040,2400": "ImagingServiceRequestComments",
-        "0040,3001": "ConfidentialityConstraintOnPatientDataDescription",
-        "0040,4001": "GeneralPurposeScheduledProcedureStepStatus",
-        "0040,4002": "GeneralPurposePerformedProcedureStepStatus",
-        "0040,4003": "GeneralPurposeScheduledProcedureStepPriority",
-        "0040,4004": "ScheduledProcessingApplicationsCodeSequence",
-        "0040,4005": "ScheduledProcedureStepStartDateTime",
-        "0040,4006": "MultipleCopiesFlag",
-        "0040,4007": "PerformedProcessingApplicationsCodeSequence",
-        "0040,4009": "HumanPerformerCodeSequence",
-        "0040,4010": "ScheduledProcedureStepModificationDateTime",
-        "0040,4011": "ExpectedCompletionDateTime",
-        "0040,4015": "ResultingGeneralPurposePerformedProcedureStepsSequence",
-        "0040,4016": "ReferencedGeneralPurposeScheduledProcedureStepSequence",
-        "0040,4018": "ScheduledWorkitemCodeSequence",
-        "0040,4019": "PerformedWorkitemCodeSequence",
-        "0040,4020": "InputAvailabilityFlag",
-        "0040,4021": "InputInformationSequence",
-        "0040,4022": "RelevantInformationSequence",
-        "0040,4023": "ReferencedGeneralPurposeScheduledProcedureStepTransactionUID",
-        "0040,4025": "ScheduledStationNameCodeSequence",
-        "0040,4026": "ScheduledStationClassCodeSequence",
-        "0040,4027": "ScheduledStationGeographicLocationCodeSequence",
-        "0040,4028": "PerformedStationNameCodeSequence",
-        "0040,4029": "PerformedStationClassCodeSequence",
-        "0040,4030": "PerformedStationGeographicLocationCodeSequence",
-        "0040,4031": "RequestedSubsequentWorkitemCodeSequence",
-        "0040,4032": "NonDICOMOutputCodeSequence",
-        "0040,4033": "OutputInformationSequence",
-        "0040,4034": "ScheduledHumanPerformersSequence",
-        "0040,4035": "ActualHumanPerformersSequence",
-        "0040,4036": "HumanPerformer'sOrganization",
-        "0040,4037": "HumanPerformer'sName",
-        "0040,A007": "FindingsFlag", # Retired
-        "0040,A010": "RelationshipType",
-        "0040,A020": "DocumentRelationshipConstant", # Retired
-        "0040,A027": "VerifyingOrganization",
-        "0040,A030": "VerificationDateTime",
-        "0040,A032": "ObservationDateTime",
-        "0040,A040": "ValueType",
-        "0040,A043": "ConceptNameCodeSequence",
-        "0040,A050": "ContinuityOfContent",
-        "0040,A073": "VerifyingObserverSequence",
-        "0040,A075": "VerifyingObserverName",
-        "0040,A088": "VerifyingObserverIdentificationCodeSequence",
-        "0040,A0B0": "ReferencedWaveformChannels",
-        "0040,A120": "DateTime",
-        "0040,A121": "Date",
-        "0040,A122": "Time",
-        "0040,A123": "PersonName",
-        "0040,A124": "UID",
-        "0040,A130": "TemporalRangeType",
-        "0040,A132": "ReferencedSamplePositions",
-        "0040,A136": "ReferencedFrameNumbers",
-        "0040,A138": "ReferencedTimeOffsets",
-        "0040,A160": "TextValue",
-        "0040,A168": "ConceptCodeSequence",
-        "0040,A170": "PurposeOfReferenceCodeSequence",
-        "0040,A180": "AnnotationGroupNumber",
-        "0040,A195": "ModifierCodeSequence",
-        "0040,A300": "MeasuredValueSequence",
-        "0040,A30A": "NumericValue",
-        "0040,A360": "PredecessorDocumentsSequence",
-        "0040,A370": "ReferencedRequestSequence",
-        "0040,A372": "PerformedProcedureCodeSequence",
-        "0040,A375": "CurrentRequestedProcedureEvidenceSequence",
-        "0040,A385": "PertinentOtherEvidenceSequence",
-        "0040,A390": "HL7StructuredDocumentReferenceSequence",
-        "0040,A491": "CompletionFlag",
-        "0040,A492": "CompletionFlagDescription",
-        "0040,A493": "VerificationFlag",
-        "0040,A504": "ContentTemplateSequence",
-        "0040,A525": "IdenticalDocumentsSequence",
-        "0040,A730": "ContentSequence",
-        "0040,B020": "WaveformAnnotationSequence",
-        "0040,DB00": "TemplateIdentifier",
-        "0040,DB73": "TemplateVersion",
-        "0040,E001": "HL7InstanceIdentifier",
-        "0040,E004": "HL7DocumentEffectiveTime",
-        "0040,E006": "HL7DocumentTypeCodeSequence",
-        "0040,E010": "RetrieveURI",
-        "0040,E020": "RetrieveLocationUID",
-        "0040,E021": "RetrieveLocationType",
-        "0040,E030": "ReferencedSourceOfHope",
-        # --- Group 0050: X-Ray Angiography ---
-        "0050,0004": "CalibrationObject",
-        "0050,0010": "DeviceSequence",
-        "0050,0014": "DeviceLength",
-        "0050,0016": "DeviceDiameter",
-        "0050,0017": "DeviceDiameterUnits",
-        "0050,0018": "DeviceVolume",
-        "0050,0019": "InterMarkerDistance",
-        "0050,0020": "DeviceDescription",
-        "0050,0030": "CineCastProfileSequence",
-        # --- Group 0054: Nuclear Medicine ---
-        "0054,0010": "EnergyWindowVector",
-        "0054,0011": "NumberOfEnergyWindows",
-        "0054,0012": "EnergyWindowInformationSequence",
-        "0054,0013": "EnergyWindowRangeSequence",
-        "0054,0014": "EnergyWindowLowerLimit",
-        "0054,0015": "EnergyWindowUpperLimit",
-        "0054,0016": "RadiopharmaceuticalInformationSequence",
-        "0054,0017": "ResidualSyringeCounts",
-        "0054,0018": "EnergyWindowName",
-        "0054,0020": "DetectorVector",
-        "0054,0021": "NumberOfDetectors",
-        "0054,0022": "DetectorInformationSequence",
-        "0054,0030": "PhaseVector",
-        "0054,0031": "NumberOfPhases",
-        "0054,0032": "PhaseInformationSequence",
-        "0054,0033": "NumberOfFramesInPhase",
-        "0054,0036": "PhaseDelay",
-        "0054,0038": "PauseBetweenFrames",
-        "0054,0039": "PhaseDescription",
-        "0054,0050": "RotationVector",
-        "0054,0051": "NumberOfRotations",
-        "0054,0052": "RotationInformationSequence",
-        "0054,0053": "NumberOfFramesInRotation",
-        "0054,0060": "R-RIntervalVector",
-        "0054,0061": "NumberOfRRIntervals",
-        "0054,0062": "GatedInformationSequence",
-        "0054,0063": "DataInformationSequence",
-        "0054,0070": "TimeSlotVector",
-        "0054,0071": "NumberOfTimeSlots",
-        "0054,0072": "TimeSlotInformationSequence",
-        "0054,0073": "TimeSlotTime",
-        "0054,0080": "SliceVector",
-        "0054,0081": "NumberOfSlices",
-        "0054,0090": "AngularViewVector",
-        "0054,0100": "TimeSliceVector",
-        "0054,0101": "NumberOfTimeSlices",
-        "0054,0200": "StartAngle",
-        "0054,0202": "TypeofDetectorMotion",
-        "0054,0210": "TriggerVector",
-        "0054,0211": "NumberOfTriggersInPhase",
-        "0054,0220": "ViewCodeSequence",
-        "0054,0222": "ViewModifierCodeSequence",
-        "0054,0300": "RadionuclideCodeSequence",
-        "0054,0302": "AdministrationRouteCodeSequence",
-        "0054,0304": "RadiopharmaceuticalCodeSequence",
-        "0054,0306": "CalibrationDataSequence",
-        "0054,0308": "EnergyWindowNumber",
-        "0054,0400": "ImageID",
-        "0054,0410": "PatientOrientationCodeSequence",
-        "0054,0412": "PatientOrientationModifierCodeSequence",
-        "0054,0414": "PatientGantryRelationshipCodeSequence",
-        "0054,0500": "SliceProgressionDirection",
-        "0054,1000": "SeriesType",
-        "0054,1001": "Units",
-        "0054,1002": "CountsSource",
-        "0054,1004": "ReprojectionMethod",
-        "0054,1006": "SUVType",
-        "0054,1100": "RandomsCorrectionMethod",
-        "0054,1101": "AttenuationCorrectionMethod",
-        "0054,1102": "DecayCorrection",
-        "0054,1103": "ReconstructionMethod",
-        "0054,1104": "DetectorLinesOfResponseUsed",
-        "0054,1105": "ScatterCorrectionMethod",
-        "0054,1200": "AxialAcceptance",
-        "0054,1201": "AxialMash",
-        "0054,1202": "TransverseMash",
-        "0054,1203": "DetectorElementSize",
-        "0054,1210": "CoincidenceWindowWidth",
-        "0054,1220": "SecondaryCountsType",
-        "0054,1300": "FrameReferenceTime",
-        "0054,1310": "PrimaryPromptsCountsAccumulated",
-        "0054,1311": "SecondaryCountsAccumulated",
-        "0054,1320": "SliceSensitivityFactor",
-        "0054,1321": "DecayFactor",
-        "0054,1322": "DoseCalibrationFactor",
-        "0054,1323": "ScatterFractionFactor",
-        "0054,1324": "DeadTimeFactor",
-        "0054,1330": "ImageIndex",
-        "0054,1400": "CountsIncluded",
-        "0054,1401": "DeadTimeCorrectionFlag",
-
-        # --- Group 0060: Histogram ---
-        "0060,3000": "HistogramSequence",
-        "0060,3002": "HistogramNumberOfBins",
-        "0060,3004": "HistogramFirstBinValue",
-        "0060,3006": "HistogramLastBinValue",
-        "0060,3008": "HistogramBinWidth",
-        "0060,3010": "HistogramExplanation",
-        "0060,3020": "HistogramData",
-        # --- Group 0062: Planar MPR ---
-        "0062,0001": "SegmentationType",
-        "0062,0002": "SegmentSequence",
-        "0062,0003": "SegmentedPropertyCategoryCodeSequence",
-        "0062,0004": "SegmentNumber",
-        "0062,0005": "SegmentLabel",
-        "0062,0006": "SegmentDescription",
-        "0062,0008": "SegmentAlgorithmType",
-        "0062,0009": "SegmentAlgorithmName",
-        "0062,000A": "SegmentIdentificationSequence",
-        "0062,000B": "ReferencedSegmentNumber",
-        "0062,000C": "RecommendedDisplayGrayscaleValue",
-        "0062,000D": "RecommendedDisplayCIELabValue",
-        "0062,000E": "MaximumFractionalValue",
-        "0062,000F": "SegmentedPropertyTypeCodeSequence",
-        "0062,0010": "SegmentationFractionalType",
-        # --- Group 0066: Raw Data ---
-        "0066,0001": "AcquisitionContextDescription",
-        "0066,0002": "AcquisitionContextSequence",
-        "0066,0003": "ConceptNameCodeSequence",
-        "0066,0004": "ConceptCodeSequence",
-        "0066,0009": "ModifierCodeSequence",
-        "0066,000C": "MeasurementUnitsCodeSequence",
-        "0066,0011": "NumericValue",
-        "0066,0012": "VectorCoordinateData",
-        "0066,0016": "FiducialIdentifier",
-        "0066,0020": "FiducialDescription",
-        "0066,002F": "GraphicCoordinatesDataSequence",
-        "0066,0031": "FiducialUID",
-        "0066,0036": "ContourUncertaintyRadius",
-        "0066,0040": "FormattedRefinedContentSequence",
-        # --- Group 0070: Display ---
-        "0070,0001": "GraphicAnnotationSequence",
-        "0070,0002": "GraphicLayerSequence",
-        "0070,0003": "GraphicLayerOrder",
-        "0070,0004": "GraphicLayerRecommendedDisplayGrayscaleValue",
-        "0070,0005": "GraphicLayerRecommendedDisplayRGBValue",
-        "0070,0006": "GraphicLayerDescription",
-        "0070,0008": "GraphicLayer",
-        "0070,0009": "GraphicGroupID",
-        "0070,0020": "GraphicGroupSequence",
-        "0070,0021": "GraphicGroupLabel",
-        "0070,0022": "GraphicGroupDescription",
-        "0070,0023": "GraphicGroupID",
-        "0070,0024": "GraphicGroupInterval",
-        "0070,0040": "ImageHorizontalFlip",
-        "0070,0041": "ImageRotation",
-        "0070,0042": "DisplayLabel",
-        "0070,0050": "DisplayedAreaTopLeftHandCorner",
-        "0070,0051": "DisplayedAreaBottomRightHandCorner",
-        "0070,0052": "DisplayedAreaSelectionSequence",
-        "0070,0053": "GraphicLayerRecommendedDisplayCIELabValue",
-        "0070,005A": "DisplayedAreaTopLeftHandCornerTrial",
-        "0070,005B": "DisplayedAreaBottomRightHandCornerTrial",
-        "0070,0060": "GraphicObjectSequence",
-        "0070,0062": "GraphicObjectTypeCodeSequence",
-        "0070,0066": "GraphicObjectID",
-        "0070,0067": "GraphicObjectLabel",
-        "0070,0068": "GraphicObjectDescription",
-        "0070,0080": "ContentLabel",
-        "0070,0081": "ContentDescription",
-        "0070,0082": "PresentationCreationDate",
-        "0070,0083": "PresentationCreationTime",
-        "0070,0084": "ContentCreatorName",
-        "0070,0086": "ContentCreatorIdentificationCodeSequence",
-        "0070,0100": "PresentationSizeMode",
-        "0070,0101": "PresentationPixelSpacing",
-        "0070,0102": "PresentationPixelAspectRatio",
-        "0070,0103": "PresentationPixelMagnificationRatio",
-        "0070,0207": "GraphicGroupLabel",
-        "0070,0208": "GraphicGroupDescription",
-        "0070,0209": "CompoundGraphicSequence",
-        "0070,0226": "CompoundGraphicInstanceID",
-        "0070,0230": "GraphicDimensions",
-        "0070,0231": "NumberOfGraphicPoints",
-        "0070,0232": "GraphicData",
-        "0070,0233": "GraphicType",
-        "0070,0234": "GraphicFilled",
-        "0070,0306": "ShapeType",
-        "0070,0308": "RegistrationSequence",
-        "0070,0309": "MatrixRegistrationSequence",
-        "0070,030A": "MatrixSequence",
-        "0070,030C": "FrameOfReferenceToDisplayedCoordinateSystemTransformationMatrix",
-        "0070,030D": "FrameOfReferenceTransformationMatrixType",
-        "0070,030F": "RegistrationTypeCodeSequence",
-        "0070,0401": "FiducialDescription",
-        "0070,0402": "FiducialIdentifier",
-        "0070,0403": "FiducialIdentifierCodeSequence",
-        "0070,0404": "ContourUncertaintyRadius",
-        "0070,0405": "UsedFiducialsSequence",
-        "0070,0406": "GraphicCoordinatesDataSequence",
-        "0070,0407": "FiducialUID",
-        "0070,0408": "FiducialSetSequence",
-        "0070,0409": "FiducialSetUID",
-        "0070,1101": "PresentationDisplayCollectionUID",
-        "0070,1102": "PresentationSequenceCollectionUID",
-        "0070,1103": "PresentationSequencePositionIndex",
-        # --- Group 0072: Hanging Protocol ---
-        "0072,0002": "HangingProtocolName",
-        "0072,0004": "HangingProtocolDescription",
-        "0072,0006": "HangingProtocolLevel",
-        "0072,0008": "HangingProtocolCreator",
-        "0072,000A": "HangingProtocolCreationDateTime",
-        "0072,000C": "HangingProtocolDefinitionSequence",
-        "0072,000E": "HangingProtocolUserIdentificationCodeSequence",
-        "0072,0010": "HangingProtocolUserGroupName",
-        "0072,0012": "SourceHangingProtocolSequence",
-        "0072,0014": "NumberOfPriorsReferenced",
-        "0072,0020": "ImageSetsSequence",
-        "0072,0022": "ImageSetSelectorSequence",
-        "0072,0024": "ImageSetSelectorUsageFlag",
-        "0072,0026": "SelectorAttribute",
-        "0072,0028": "SelectorValueNumber",
-        "0072,002A": "SelectorSequencePointer",
-        "0072,002C": "SelectorSequencePointerPrivateCreator",
-        "0072,002E": "SelectorAttributePrivateCreator",
-        "0072,0032": "SelectorValue",
-        "0072,0034": "FilterByCategory",
-        "0072,0036": "FilterByAttributePresence",
-        "0072,0038": "FilterOperator",
-        "0072,0040": "FilterByExpression",
-        "0072,0050": "ImageSetLabel",
-        "0072,0052": "ImageSetSelectorCategory",
-        "0072,0060": "RelativeTime",
-        "0072,0062": "RelativeTimeUnits",
-        "0072,0064": "AbstractPriorValue",
-        "0072,0066": "AbstractPriorCodeSequence",
-        "0072,0068": "ImageSetNumber",
-        "0072,006E": "ImageSetSelectorPriors",
-        "0072,0080": "ImageSetSelectorSequence",
-        "0072,0100": "TimeBasedImageSetsSequence",
-        "0072,0102": "ImageSetNumber",
-        "0072,0104": "ImageSetSelectorSequence",
-        "0072,0200": "DisplaySetsSequence",
-        "0072,0202": "DisplaySetNumber",
-        "0072,0203": "DisplaySetLabel",
-        "0072,0204": "DisplaySetPresentationGroup",
-        "0072,0206": "DisplaySetPresentationGroupDescription",
-        "0072,0208": "PartialDataDisplayHandling",
-        "0072,0210": "SynchronizedScrollingSequence",
-        "0072,0212": "DisplaySetScrollingGroup",
-        "0072,0214": "NavigationIndicatorSequence",
-        "0072,0216": "NavigationDisplaySet",
-        "0072,0218": "ReferenceDisplaySets",
-        "0072,0230": "ImageBoxesSequence",
-        "0072,0232": "ImageBoxNumber",
-        "0072,0234": "ImageBoxLayoutType",
-        "0072,0236": "ImageBoxLayoutTypeModifier",
-        "0072,0238": "ImageBoxTileHorizontalDimension",
-        "0072,023A": "ImageBoxTileVerticalDimension",
-        "0072,023C": "ImageBoxScrollDirection",
-        "0072,023E": "ImageBoxSmallScrollType",
-        "0072,0240": "ImageBoxSmallScrollAmount",
-        "0072,0242": "ImageBoxLargeScrollType",
-        "0072,0244": "ImageBoxLargeScrollAmount",
-        "0072,0250": "ImageBoxOverlapPriority",
-        "0072,0300": "FilterOperationsSequence",
-        "0072,0302": "FilterByCategory",
-        "0072,0304": "FilterByAttributePresence",
-        "0072,0306": "FilterOperator",
-        "0072,0308": "FilterByExpression",
-        "0072,0310": "SortingOperationsSequence",
-        "0072,0312": "SortByCategory",
-        "0072,0314": "SortingDirection",
-        "0072,0320": "DisplaySetPatientOrientation",
-        "0072,0330": "VOIType",
-        "0072,0350": "PseudoColorType",
-        "0072,0352": "PseudoColorPaletteInstanceReferenceSequence",
-        "0072,0360": "ShowGrayscaleInverted",
-        "0072,0362": "ShowImageTrueSizeFlag",
-        "0072,0364": "ShowGraphicAnnotationFlag",
-        "0072,0366": "ShowPatientDemographicsFlag",
-        "0072,0368": "ShowAcquisitionTechniqueFlag",
-        "0072,036A": "DisplaySetHorizontalJustification",
-        "0072,036C": "DisplaySetVerticalJustification",
-        "0072,0380": "ContinuationStartMeterset",
-        "0072,0382": "ContinuationEndMeterset",
-        "0072,0384": "ContinuationPulseNumber",
-        "0072,0389": "ToleranceTableNumber",
-        "0072,0399": "ToleranceTableLabel",
-        "0072,0400": "BeamLimitingDeviceSequence",
-        "0072,0402": "BeamLimitingDeviceToleranceSequence",
-        "0072,0404": "BeamLimitingDeviceTypeTolerance",
-        "0072,0420": "ToleranceTableSequence",
-        "0072,0422": "ToleranceTableLabel",
-        "0072,0424": "BeamLimitingDeviceToleranceSequence",
-        "0072,0426": "BeamLimitingDeviceTypeTolerance",
-        # --- Group 0074: Unified Procedure Step ---
-        "0074,0100": "UnifiedProcedureStepStatus",
-        "0074,0102": "UnifiedProcedureStepProcedureSequence",
-        "0074,0104": "UnifiedProcedureStepPerformedProcedureSequence",
-        "0074,0106": "UnifiedProcedureStepProgressInformationSequence",
-        "0074,1000": "UnifiedProcedureStepState",
-        "0074,1002": "UnifiedProcedureStepProgress",
-        "0074,1004": "UnifiedProcedureStepProgressDescription",
-        "0074,1006": "UnifiedProcedureStepCommunicationsURISequence",
-        "0074,1008": "ContactURI",
-        "0074,100a": "ContactDisplayName",
-        "0074,100C": "UnifiedProcedureStepDiscontinuationReasonCodeSequence",
-        "0074,1020": "BeamTaskSequence",
-        "0074,1022": "BeamTaskType",
-        "0074,1024": "AutosequenceFlag",
-        "0074,1030": "TableTopVerticalSetupDisplacement",
-        "0074,1032": "TableTopLongitudinalSetupDisplacement",
-        "0074,1034": "TableTopLateralSetupDisplacement",
-        "0074,1036": "PatientReviewSetupNumber",
-        "0074,1038": "TableTopPitchSetupAngle",
-        "0074,103A": "TableTopRollSetupAngle",
-        "0074,1040": "DeliveryVerificationImageSequence",
-        "0074,1042": "VerificationImageTiming",
-        "0074,1044": "DoubleExposureFlag",
-        "0074,1046": "PhantomView",
-        "0074,1048": "ReferenceDesignator",
-        "0074,1200": "ScheduledProcedureStepPriority",
-        "0074,1202": "ProcedureStepLabel",
-        "0074,1204": "WorklistLabel",
-        "0074,1210": "ScheduledProcessingParametersSequence",
-        "0074,1212": "ScheduledProcessingParameterCodeSequence",
-        "0074,1216": "ScheduledStationNameCodeSequence",
-        "0074,1220": "ScheduledStationClassCodeSequence",
-        "0074,1222": "ScheduledStationGeographicLocationCodeSequence",
-        "0074,1224": "PerformedStationNameCodeSequence",
-        "0074,1226": "PerformedStationClassCodeSequence",
-        "0074,1228": "PerformedStationGeographicLocationCodeSequence",
-        "0074,122A": "PerformedProcessingParametersSequence",
-        "0074,122C": "PerformedProcessingParameterCodeSequence",
-        "0074,1230": "DeletionLock",
-        "0074,1234": "ReceivingAE",
-        "0074,1236": "RequestingAE",
-        "0074,1238": "ReasonForCancellation",
-        "0074,1242": "SCPStatus",
-        "0074,1244": "SubscriptionListStatus",
-        "0074,1246": "UnifiedProcedureStepListStatus",
-        # --- Group 0088: Storage Commitment ---
-        "0088,0130": "StorageMediaFileSetID",
-        "0088,0140": "StorageMediaFileSetUID",
-        "0088,0200": "IconImageSequence",
-        "0088,0904": "TopicTitle",
-        "0088,0906": "TopicSubject",
-        "0088,0910": "TopicAuthor",
-        "0088,0912": "TopicKeyWords",
-        # --- Group 2000-2050: Presentation ---
-        "2000,0010": "NumberOfCopies",
-        "2000,001E": "PrinterConfigurationSequence",
-        "2000,0020": "PrintPriority",
-        "2000,0030": "MediumType",
-        "2000,0040": "FilmDestination",
-        "2000,0050": "FilmSessionLabel",
-        "2000,0060": "MemoryAllocation",
-        "2000,0061": "MaximumMemoryAllocation",
-        "2000,0062": "ColorImagePrintingFlag",
-        "2000,0063": "CollationFlag",
-        "2000,0065": "AnnotationFlag",
-        "2000,0067": "ImageOverlayBoxPresentationLUTFlag",
-        "2000,0069": "PresentationLUTFlag",
-        "2000,006A": "ImageBoxPresentationLUTFlag",
-        "2000,00A0": "MemoryBitDepth",
-        "2000,00A1": "PrintingBitDepth",
-        "2000,00A2": "MediaInstalledSequence",
-        "2000,00A4": "OtherMediaAvailableSequence",
-        "2000,00A8": "SupportedImageDisplayFormatsSequence",
-        "2000,0500": "ReferencedFilmSessionSequence",
-        "2000,0510": "ReferencedStoredPrintSequence",
-        "2010,0009": "ImageDisplayFormat",
-        "2010,0010": "AnnotationDisplayFormatID",
-        "2010,0030": "FilmOrientation",
-        "2010,0040": "FilmSizeID",
-        "2010,0050": "MagnificationType",
-        "2010,0052": "SmoothingType",
-        "2010,0054": "Density",
-        "2010,0060": "ImageDensity",
-        "2010,0080": "MinDensity",
-        "2010,0100": "MaxDensity",
-        "2010,0110": "Trim",
-        "2010,0120": "ConfigurationInformation",
-        "2010,0130": "ConfigurationInformationDescription",
-        "2010,0140": "MaximumCollatedFilms",
-        "2010,0150": "Illumination",
-        "2010,0152": "ReflectedAmbientLight",
-        "2010,0154": "PrinterResolutionID",
-        "2010,015E": "ProposedStudySequence",
-        "2010,0160": "OriginalImageSequence",
-        "2010,0376": "LabelUsingInformationExtractedFromInstances",
-        "2010,0500": "LabelText",
-        "2010,0510": "LabelStyleSelection",
-        "2010,0520": "MediaDisposition",
-        "2010,0530": "BarcodeValue",
-        "2020,0010": "ImagePosition",
-        "2020,0020": "Polarity",
-        "2020,0030": "RequestedImageSize",
-        "2020,0040": "RequestedDecimateCropBehavior",
-        "2020,0050": "RequestedResolutionID",
-        "2020,00A0": "RequestedImageSizeFlag",
-        "2020,00A2": "DecimateCropResult",
-        "2020,0110": "BasicGrayscaleImageSequence",
-        "2020,0111": "BasicColorImageSequence",
-        "2020,0130": "ReferencedImageOverlayBoxSequence",
-        "2020,0140": "ReferencedPresentationLUTSequence",
-        "2030,0010": "AnnotationPosition",
-        "2030,0020": "TextString",
-        "2040,0010": "ReferencedOverlayPlaneSequence",
-        "2040,0011": "ReferencedOverlayPlaneGroups",
-        "2040,0020": "OverlayPixelDataSequence",
-        "2040,0060": "OverlayMagnificationType",
-        "2040,0070": "OverlaySmoothingType",
-        "2040,0072": "OverlayOrImageMagnification",
-        "2040,0074": "MagnifyToNumberOfColumns",
-        "2040,0080": "OverlayForegroundDensity",
-        "2040,0082": "OverlayBackgroundDensity",
-        "2040,0090": "OverlayMode",
-        "2050,0010": "PresentationLUTSequence",
-        "2050,0020": "PresentationLUTShape",
-        "2050,0500": "ReferencedPresentationLUTSequence",
-    }
+def get_dicom_registry_fields() -> Mapping[str, str]:
+    """Standard tag -> keyword registry, overlaid with vendor private tags when available."""
     try:
         from dicom_vendor_tags import DICOM_VENDOR_TAGS
-        tags.update(DICOM_VENDOR_TAGS)
     except Exception:
-        pass
-    return tags
-
-
+        return DICOM_REGISTRY_TAGS
+    # Writes land in the leading dict, never in the shared tables
+    return ChainMap({}, DICOM_VENDOR_TAGS, DICOM_REGISTRY_TAGS)
 
 
 def get_dicom_complete_registry_field_count() -> int:
@@ -12,12 +12,12 @@ Author: MetaExtract Team
 Version: 1.0.0
 """
 
-import re
-import struct
 import logging
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from .xmp_packets import XmpTable, get_xmp_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +29,7 @@ class EditHistoryAnalyzer:
     def __init__(self, filepath: str):
         self.filepath = filepath
         self.xmp_data: Optional[str] = None
+        self.table: Optional[XmpTable] = None
         self.exif_data: Optional[Dict[str, Any]] = None
 
     def analyze(self) -> Dict[str, Any]:
@@ -103,88 +104,49 @@ class EditHistoryAnalyzer:
             return {"error": str(e)}
 
     def _load_xmp_data(self):
-        """Load XMP data from file"""
+        """Load XMP data from the shared packet table"""
         file_path = Path(self.filepath)
         if not file_path.exists():
             return
 
         try:
-            if str(self.filepath).endswith('.png'):
-                self._extract_xmp_from_png()
-            else:
-                self._try_extract_xmp()
+            self.table = get_xmp_table(self.filepath)
+            self.xmp_data = self.table.text_data if self.table else None
         except Exception:
+            self.table = None
             self.xmp_data = None
 
-    def _extract_xmp_from_png(self):
-        """Extract XMP from PNG file"""
-        try:
-            with open(self.filepath, 'rb') as f:
-                data = f.read()
-
-            if len(data) < 16 or data[:8] != b'\x89PNG\r\n\x1a\n':
-                return
-
-            offset = 8
-            while offset < len(data) - 12:
-                length = struct.unpack('>I', data[offset:offset + 4])[0]
-                chunk_type = data[offset + 4:offset + 8].decode('latin-1', errors='replace')
-
-                if chunk_type == 'tEXt':
-                    chunk_data = data[offset + 8:offset + 8 + length]
-                    null_pos = chunk_data.find(b'\x00')
-                    if null_pos > 0:
-                        keyword = chunk_data[:null_pos].decode('latin-1', errors='replace')
-                        if keyword == 'XML:com.adobe.xmp':
-                            self.xmp_data = chunk_data[null_pos + 1:].decode('utf-8', errors='replace')
-
-                offset += 12 + length
-        except Exception:
-            self.xmp_data = None
-
-    def _try_extract_xmp(self):
-        """Try to extract XMP from generic file"""
-        import struct
-        try:
-            with open(self.filepath, 'rb') as f:
-                data = f.read(4096)
-
-            xmp_start = data.find(b'<?xpacket begin=')
-            if xmp_start > 0:
-                xmp_end = data.find(b'</x:xmpmeta>', xmp_start)
-                if xmp_end > 0:
-                    self.xmp_data = data[xmp_start:xmp_end + 12].decode('utf-8', errors='replace')
-        except Exception:
-            self.xmp_data = None
+    def _history_events(self) -> List[Dict[str, Any]]:
+        """xmpMM:History stEvt entries"""
+        history = self.table.get('xmpMM:History') if self.table else None
+        if not isinstance(history, list):
+            return []
+        return [event for event in history if isinstance(event, dict)]
 
     def _parse_lightroom_history(self) -> Optional[List[Dict[str, Any]]]:
         """Parse Lightroom edit history from XMP"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
         history_entries: List[Dict[str, Any]] = []
 
-        history_pattern = r'<rdf:Seq[^>]*>([\s\S]*?)</rdf:Seq>'
-        seq_match = re.search(history_pattern, self.xmp_data, re.IGNORECASE)
-
-        if seq_match:
-            seq_content = seq_match.group(1)
-            li_matches = re.findall(r'<rdf:li[^>]*>([^<]+)</rdf:li>', seq_content)
-
-            for i, entry in enumerate(li_matches):
-                entry_clean = entry.strip()
-                if entry_clean and len(entry_clean) > 2:
-                    history_entries.append({
-                        "step": i + 1,
-                        "action": entry_clean,
-                        "software": "Lightroom",
-                    })
-
-        lr_version_pattern = r'lr:versionNumber["\s]*:?\s*["\']?([^"\']+)'
-        lr_version_match = re.search(lr_version_pattern, self.xmp_data)
-        if lr_version_match:
+        for event in self._history_events():
+            agent = event.get('softwareAgent', '')
+            action = event.get('action', '')
+            if 'lightroom' in agent.lower() and len(action) > 2:
+                entry = {
+                    "step": len(history_entries) + 1,
+                    "action": action,
+                    "software": "Lightroom",
+                }
+                if event.get('when'):
+                    entry["when"] = event['when']
+                history_entries.append(entry)
+
+        lr_version = self.table.text('lr:versionNumber')
+        if lr_version:
             for entry in history_entries:
-                entry["version"] = lr_version_match.group(1).strip()
+                entry["version"] = lr_version
 
         if history_entries:
             return history_entries
@@ -193,24 +155,20 @@ class EditHistoryAnalyzer:
 
     def _parse_photoshop_history(self) -> Optional[List[Dict[str, Any]]]:
         """Parse Photoshop history from XMP"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
         history_entries: List[Dict[str, Any]] = []
 
-        history_pattern = r'photoshop:History[\s]*:?\s*["\']?([^"\']+)'
-        history_match = re.search(history_pattern, self.xmp_data, re.IGNORECASE)
-        if history_match:
+        history = self.table.text('photoshop:History', ignore_case=True)
+        if history:
             history_entries.append({
-                "action": history_match.group(1).strip(),
+                "action": history,
                 "software": "Photoshop",
             })
 
-        stevt_pattern = r'stEvt:action["\s]*:?\s*["\']?([^"\']+)'
-        stevt_matches = re.findall(stevt_pattern, self.xmp_data, re.IGNORECASE)
-
-        for action in stevt_matches:
-            action_clean = action.strip()
+        for event in self._history_events():
+            action_clean = event.get('action', '').strip()
             if action_clean and action_clean not in [h["action"] for h in history_entries]:
                 history_entries.append({
                     "action": action_clean,
@@ -224,18 +182,10 @@ class EditHistoryAnalyzer:
 
     def _parse_photoshop_ancestors(self) -> Optional[List[str]]:
         """Parse Photoshop ancestors from XMP"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        ancestors: List[str] = []
-
-        ancestor_pattern = r'photoshop:Ancestor[\s]*:?\s*["\']?([^"\']+)'
-        ancestor_matches = re.findall(ancestor_pattern, self.xmp_data, re.IGNORECASE)
-
-        for ancestor in ancestor_matches:
-            ancestor_clean = ancestor.strip()
-            if ancestor_clean:
-                ancestors.append(ancestor_clean)
+        ancestors = self.table.values('photoshop:DocumentAncestors')
 
         if ancestors:
             return ancestors
@@ -244,89 +194,52 @@ class EditHistoryAnalyzer:
 
     def _parse_capture_one_history(self) -> Optional[List[Dict[str, Any]]]:
         """Parse Capture One variant history from XMP"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        history_entries: List[Dict[str, Any]] = []
-
-        co_patterns = [
-            (r'captureone:ProcessVersion["\s]*:?\s*["\']?([^"\']+)', 'ProcessVersion'),
-            (r'captureone:VariantName["\s]*:?\s*["\']?([^"\']+)', 'VariantName'),
-            (r'captureone:ColorTag["\s]*:?\s*(\d+)', 'ColorTag'),
+        fields = self.table.select([
+            ('captureone:ProcessVersion', 'ProcessVersion', None),
+            ('captureone:VariantName', 'VariantName', None),
+            ('captureone:ColorTag', 'ColorTag', 'int'),
+        ])
+        history_entries: List[Dict[str, Any]] = [
+            {"field": field, "value": value, "software": "Capture One"}
+            for field, value in fields.items()
         ]
 
-        for pattern, field in co_patterns:
-            match = re.search(pattern, self.xmp_data, re.IGNORECASE)
-            if match:
-                if field == 'ColorTag':
-                    history_entries.append({
-                        "field": field,
-                        "value": int(match.group(1)),
-                    })
-                else:
-                    history_entries.append({
-                        "field": field,
-                        "value": match.group(1).strip(),
-                    })
-
         if history_entries:
-            for entry in history_entries:
-                entry["software"] = "Capture One"
-
             return history_entries
 
         return None
 
     def _parse_transformations(self) -> Dict[str, Any]:
         """Parse transformation metadata"""
-        transformations: Dict[str, Any] = {}
-
-        if not self.xmp_data:
-            return transformations
-
-        patterns = [
-            (r'crs:PerspectiveHorizontal["\s]*:?\s*([-\d.]+)', 'perspective_horizontal'),
-            (r'crs:PerspectiveVertical["\s]*:?\s*([-\d.]+)', 'perspective_vertical'),
-            (r'crs:PerspectiveRotate["\s]*:?\s*([-\d.]+)', 'perspective_rotate'),
-            (r'crs:PerspectiveScale["\s]*:?\s*([-\d.]+)', 'perspective_scale'),
-            (r'crs:StraightenAngle["\s]*:?\s*([-\d.]+)', 'straighten_angle'),
-            (r'crs:KeylineAmount["\s]*:?\s*([-\d.]+)', 'keyline_amount'),
-        ]
+        if not self.table:
+            return {}
 
-        for pattern, field in patterns:
-            match = re.search(pattern, self.xmp_data, re.IGNORECASE)
-            if match:
-                try:
-                    transformations[field] = float(match.group(1))
-                except ValueError:
-                    pass
+        transformations = self.table.select([
+            ('crs:PerspectiveHorizontal', 'perspective_horizontal', 'float'),
+            ('crs:PerspectiveVertical', 'perspective_vertical', 'float'),
+            ('crs:PerspectiveRotate', 'perspective_rotate', 'float'),
+            ('crs:PerspectiveScale', 'perspective_scale', 'float'),
+            ('crs:StraightenAngle', 'straighten_angle', 'float'),
+            ('crs:KeylineAmount', 'keyline_amount', 'float'),
+        ])
 
-        return transformations
+        return {k: v for k, v in transformations.items() if isinstance(v, float)}
 
     def _parse_crop_info(self) -> Optional[Dict[str, Any]]:
         """Parse crop information"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        crop_info: Dict[str, Any] = {}
-
-        crop_patterns = [
-            (r'crs:CropRect["\s]*:?\s*["\']?([^"\']+)', 'crop_rect'),
-            (r'crs:CropUnit["\s]*:?\s*(\d+)', 'crop_unit'),
-            (r'crs:CropAngle["\s]*:?\s*([-\d.]+)', 'crop_angle'),
-            (r'crs:HasCrop["\s]*:?\s*(true|false)', 'has_crop'),
-            (r'crs:HasCropNew["\s]*:?\s*(true|false)', 'has_crop_new'),
-        ]
-
-        for pattern, field in crop_patterns:
-            match = re.search(pattern, self.xmp_data, re.IGNORECASE)
-            if match:
-                if field in ['has_crop', 'has_crop_new']:
-                    crop_info[field] = match.group(1).lower() == 'true'
-                elif field == 'crop_unit':
-                    crop_info[field] = int(match.group(1))
-                else:
-                    crop_info[field] = match.group(1).strip()
+        crop_info = self.table.select([
+            ('crs:CropRect', 'crop_rect', None),
+            ('crs:CropUnit', 'crop_unit', 'int'),
+            ('crs:CropAngle', 'crop_angle', None),
+            ('crs:HasCrop', 'has_crop', 'bool'),
+            ('crs:HasCropNew', 'has_crop_new', 'bool'),
+        ])
 
         if crop_info:
             return crop_info
@@ -335,30 +248,15 @@ class EditHistoryAnalyzer:
 
     def _parse_rotation_info(self) -> Optional[Dict[str, Any]]:
         """Parse rotation information"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        rotation_info: Dict[str, Any] = {}
-
-        patterns = [
-            (r'tiff:Orientation["\s]*:?\s*(\d+)', 'orientation'),
-            (r'crs:Rotate["\s]*:?\s*([-\d.]+)', 'rotate_value'),
-            (r'crs:FlipH["\s]*:?\s*(true|false)', 'flip_horizontal'),
-            (r'crs:FlipV["\s]*:?\s*(true|false)', 'flip_vertical'),
-        ]
-
-        for pattern, field in patterns:
-            match = re.search(pattern, self.xmp_data, re.IGNORECASE)
-            if match:
-                if field in ['flip_horizontal', 'flip_vertical']:
-                    rotation_info[field] = match.group(1).lower() == 'true'
-                elif field == 'orientation':
-                    rotation_info[field] = int(match.group(1))
-                else:
-                    try:
-                        rotation_info[field] = float(match.group(1))
-                    except ValueError:
-                        pass
+        rotation_info = self.table.select([
+            ('tiff:Orientation', 'orientation', 'int'),
+            ('crs:Rotate', 'rotate_value', 'float'),
+            ('crs:FlipH', 'flip_horizontal', 'bool'),
+            ('crs:FlipV', 'flip_vertical', 'bool'),
+        ])
 
         if rotation_info:
             return rotation_info
@@ -367,26 +265,16 @@ class EditHistoryAnalyzer:
 
     def _parse_watermark_info(self) -> Optional[Dict[str, Any]]:
         """Parse watermark information"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        watermark_info: Dict[str, Any] = {}
-
-        patterns = [
-            (r'crs:Watermark["\s]*:?\s*["\']?([^"\']+)', 'watermark_name'),
-            (r'crs:WatermarkOpacity["\s]*:?\s*([-\d.]+)', 'watermark_opacity'),
-            (r'crs:WatermarkScale["\s]*:?\s*([-\d.]+)', 'watermark_scale'),
-            (r'crs:WatermarkRotation["\s]*:?\s*([-\d.]+)', 'watermark_rotation'),
-            (r'crs:WatermarkPosition["\s]*:?\s*(\d+)', 'watermark_position'),
-        ]
-
-        for pattern, field in patterns:
-            match = re.search(pattern, self.xmp_data, re.IGNORECASE)
-            if match:
-                try:
-                    watermark_info[field] = float(match.group(1))
-                except ValueError:
-                    watermark_info[field] = match.group(1).strip()
+        watermark_info = self.table.select([
+            ('crs:Watermark', 'watermark_name', 'float'),
+            ('crs:WatermarkOpacity', 'watermark_opacity', 'float'),
+            ('crs:WatermarkScale', 'watermark_scale', 'float'),
+            ('crs:WatermarkRotation', 'watermark_rotation', 'float'),
+            ('crs:WatermarkPosition', 'watermark_position', 'float'),
+        ])
 
         if watermark_info:
             return watermark_info
@@ -395,20 +283,23 @@ class EditHistoryAnalyzer:
 
     def _detect_edit_software(self) -> Optional[str]:
         """Detect editing software from XMP"""
-        if not self.xmp_data:
+        if not self.table:
             return None
 
-        software_patterns = [
-            (r'Lightroom[\s\d.]*', 'Lightroom'),
-            (r'Adobe Photoshop[\s\d.]*', 'Photoshop'),
-            (r'Capture One[\s\d.]*', 'Capture One'),
-            (r'Aperture[\s\d.]*', 'Aperture'),
-            (r'Darktable[\s\d.]*', 'Darktable'),
-            (r'RawTherapee[\s\d.]*', 'RawTherapee'),
-        ]
-
-        for pattern, software in software_patterns:
-            if re.search(pattern, self.xmp_data, re.IGNORECASE):
+        agents = [self.table.text('xmp:CreatorTool') or '']
+        agents.extend(event.get('softwareAgent', '') for event in self._history_events())
+        agents.extend(self.table.values('tiff:Software'))
+        haystack = ' '.join(a for a in agents if isinstance(a, str)).lower()
+
+        for needle, software in (
+            ('lightroom', 'Lightroom'),
+            ('adobe photoshop', 'Photoshop'),
+            ('capture one', 'Capture One'),
+            ('aperture', 'Aperture'),
+            ('darktable', 'Darktable'),
+            ('rawtherapee', 'RawTherapee'),
+        ):
+            if needle in haystack:
                 return software
 
         return None
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Embedded Media Locator
+
+Finds the exact byte ranges of media carried inside a still image without
+reading the whole file:
+- Google Motion Photo / Ultra HDR: XMP ``Container:Directory`` items laid
+  out back to front from the end of the file, or the legacy
+  ``GCamera:MicroVideoOffset`` trailer length
+- Samsung: the ``SEFT`` trailer directory at the end of JPEGs (motion
+  video, depth maps, dual-shot images) and the top-level ``mpvd`` box in
+  HEIC motion photos
+- CIPA Multi-Picture Format (APP2 ``MPF``) secondary images such as gain
+  maps and depth maps
+
+Only the XMP packet (through the shared packet table), the JPEG segment
+headers, the last few kilobytes of the file and the first bytes of each
+candidate range are read. Every located range is exposed as a lazy
+RangeReader so downstream analysis (codec probing, hashing) can stream
+just the bytes it needs.
+
+Usage:
+    from .embedded_media import locate_embedded_media
+    media = locate_embedded_media(path)
+    for item in media.find("video"):
+        with item.open() as reader:
+            print(item.mime, item.offset, item.length, reader.sha256())
+"""
+
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from ..formats.segment_directory import get_segment_directory
+except ImportError:
+    from formats.segment_directory import get_segment_directory
+from .xmp_packets import get_xmp_table
+
+logger = logging.getLogger(__name__)
+
+SEFT_MAGIC = b'SEFT'
+SEFH_MAGIC = b'SEFH'
+# Bytes read from the end of the file when looking for a SEFT trailer that
+# is followed by padding or another appended block
+TRAILER_WINDOW = 4096
+MAX_SEFT_ENTRIES = 256
+READ_BLOCK = 1 << 20
+
+# Samsung SEFT entry names and the media kind they carry
+SEFT_MEDIA = {
+    'MotionPhoto_Data': ('video', 'video/mp4'),
+    'MotionPhoto_AutoPlay_Data': ('video', 'video/mp4'),
+    'DualShot_DepthMap_1': ('depth_map', None),
+    'DualShot_DepthMap_2': ('depth_map', None),
+    'DualShot_Extra_Info': ('auxiliary', None),
+    'DualShot_Core_Info': ('auxiliary', None),
+    'DualShot_1': ('image', 'image/jpeg'),
+    'DualShot_2': ('image', 'image/jpeg'),
+    'Original_Path_Hash_Key': ('auxiliary', None),
+}
+
+# Container:Directory Item:Semantic values
+CONTAINER_SEMANTICS = {
+    'primary': 'primary',
+    'motionphoto': 'video',
+    'gainmap': 'gain_map',
+    'depth': 'depth_map',
+    'confidence': 'depth_confidence',
+    'original': 'image',
+}
+
+# MPF MP Entry image types (attribute & 0xFFFFFF)
+MPF_TYPES = {
+    0x000000: 'image',
+    0x010001: 'image',  # large thumbnail VGA
+    0x010002: 'image',  # large thumbnail full HD
+    0x020001: 'image',  # multi-frame panorama
+    0x020002: 'image',  # multi-frame disparity
+    0x020003: 'image',  # multi-angle
+    0x030000: 'primary',
+}
+
+HEIF_BRANDS = (b'heic', b'heix', b'hevc', b'heim', b'heis', b'mif1', b'msf1', b'avif')
+
+
+@dataclass
+class EmbeddedMedia:
+    """One located byte range inside the host file"""
+    kind: str
+    offset: int
+    length: int
+    source: str
+    mime: Optional[str] = None
+    name: Optional[str] = None
+    verified: bool = False
+    details: Dict[str, Any] = field(default_factory=dict)
+    filepath: str = ''
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.length
+
+    def open(self) -> 'RangeReader':
+        return RangeReader(self.filepath, self.offset, self.length)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "kind": self.kind,
+            "mime": self.mime,
+            "offset": self.offset,
+            "length": self.length,
+            "source": self.source,
+            "verified": self.verified,
+        }
+        if self.name:
+            data["name"] = self.name
+        if self.details:
+            data["details"] = self.details
+        return data
+
+
+class RangeReader:
+    """
+    File-like view of one byte range. The file is opened on first read and
+    reads never cross the range boundaries.
+    """
+
+    def __init__(self, filepath: str, offset: int, length: int):
+        self.filepath = filepath
+        self.offset = offset
+        self.length = length
+        self._pos = 0
+        self._f = None
+
+    def __enter__(self) -> 'RangeReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            pos += self._pos
+        elif whence == os.SEEK_END:
+            pos += self.length
+        self._pos = max(0, min(pos, self.length))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self.length - self._pos
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        if size <= 0:
+            return b''
+        if self._f is None:
+            self._f = open(self.filepath, 'rb')
+        self._f.seek(self.offset + self._pos)
+        data = self._f.read(size)
+        self._pos += len(data)
+        return data
+
+    def head(self, size: int = 64) -> bytes:
+        self.seek(0)
+        return self.read(size)
+
+    def iter_blocks(self, block_size: int = READ_BLOCK) -> Iterator[bytes]:
+        self.seek(0)
+        while True:
+            block = self.read(block_size)
+            if not block:
+                return
+            yield block
+
+    def sha256(self, block_size: int = READ_BLOCK) -> str:
+        digest = hashlib.sha256()
+        for block in self.iter_blocks(block_size):
+            digest.update(block)
+        return digest.hexdigest()
+
+
+class EmbeddedMediaMap:
+    """Located ranges for one file, in file order"""
+
+    def __init__(self, filepath: str, file_size: int):
+        self.filepath = filepath
+        self.file_size = file_size
+        self.items: List[EmbeddedMedia] = []
+        self.hints: Dict[str, Any] = {}
+        self.errors: List[str] = []
+
+    def __iter__(self) -> Iterator[EmbeddedMedia]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def add(self, item: EmbeddedMedia) -> Optional[EmbeddedMedia]:
+        if item.offset < 0 or item.length <= 0 or item.end > self.file_size:
+            self.errors.append(f"{item.source}: range {item.offset}+{item.length} "
+                               f"outside file of {self.file_size} bytes")
+            return None
+        for existing in self.items:
+            if existing.offset == item.offset and existing.length == item.length:
+                # Same bytes reported by a second source; keep the first
+                if item.name and not existing.name:
+                    existing.name = item.name
+                return existing
+        item.filepath = self.filepath
+        item.verified = item.verified or _verify(self.filepath, item)
+        self.items.append(item)
+        self.items.sort(key=lambda m: m.offset)
+        return item
+
+    def find(self, kind: str) -> List[EmbeddedMedia]:
+        return [item for item in self.items if item.kind == kind]
+
+    def first(self, kind: str) -> Optional[EmbeddedMedia]:
+        found = self.find(kind)
+        return found[0] if found else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_size": self.file_size,
+            "items": [item.to_dict() for item in self.items],
+            "hints": self.hints,
+            "errors": self.errors,
+        }
+
+
+def _verify(filepath: str, item: EmbeddedMedia) -> bool:
+    """Check the first bytes of a range against its expected signature"""
+    try:
+        with open(filepath, 'rb') as f:
+            f.seek(item.offset)
+            head = f.read(12)
+    except OSError:
+        return False
+    if item.kind == 'video' or (item.mime or '').startswith('video/'):
+        return len(head) >= 8 and head[4:8] in (b'ftyp', b'moov', b'mdat', b'free', b'wide')
+    if (item.mime or '') == 'image/jpeg' or item.kind in ('gain_map', 'image'):
+        return head[:2] == b'\xff\xd8'
+    return False
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _locate_from_xmp(table, media: EmbeddedMediaMap) -> None:
+    """GCamera:MicroVideoOffset and Container:Directory hints"""
+    for key, qname in (('motion_photo', 'GCamera:MotionPhoto'),
+                       ('motion_photo_version', 'GCamera:MotionPhotoVersion'),
+                       ('presentation_timestamp_us', 'GCamera:MotionPhotoPresentationTimestampUs'),
+                       ('micro_video', 'GCamera:MicroVideo'),
+                       ('micro_video_version', 'GCamera:MicroVideoVersion'),
+                       ('micro_video_offset', 'GCamera:MicroVideoOffset'),
+                       ('micro_video_timestamp_us', 'GCamera:MicroVideoPresentationTimestampUs')):
+        value = _as_int(table.text(qname))
+        if value is not None:
+            media.hints[key] = value
+
+    directory = table.get('Container:Directory')
+    if isinstance(directory, list):
+        items = []
+        for entry in directory:
+            item = entry.get('Item') if isinstance(entry, dict) else None
+            if isinstance(item, dict):
+                items.append(item)
+        media.hints['container_items'] = len(items)
+
+        # Secondary items are appended in directory order, so walk them back
+        # to front from the end of the file
+        end = media.file_size
+        for index in range(len(items) - 1, 0, -1):
+            item = items[index]
+            length = _as_int(item.get('Length')) or 0
+            semantic = str(item.get('Semantic', ''))
+            start = end - length
+            media.add(EmbeddedMedia(
+                kind=CONTAINER_SEMANTICS.get(semantic.lower(), 'auxiliary'),
+                offset=start,
+                length=length,
+                source='xmp_container',
+                mime=item.get('Mime'),
+                name=semantic or None,
+                details={'directory_index': index},
+            ))
+            end = start - (_as_int(items[index - 1].get('Padding')) or 0)
+        if items:
+            media.hints['primary_length'] = end
+        return
+
+    offset = media.hints.get('micro_video_offset')
+    if offset:
+        media.add(EmbeddedMedia(
+            kind='video',
+            offset=media.file_size - offset,
+            length=offset,
+            source='micro_video_offset',
+            mime='video/mp4',
+            name='MicroVideo',
+        ))
+
+
+def _locate_seft(f, media: EmbeddedMediaMap) -> None:
+    """Samsung SEFT trailer: [entries...] SEFH ver count {0,type,noff,size}* dirlen SEFT"""
+    window = min(TRAILER_WINDOW, media.file_size)
+    f.seek(media.file_size - window)
+    tail = f.read(window)
+    magic = tail.rfind(SEFT_MAGIC)
+    if magic < 4:
+        return
+    dir_len = struct.unpack('<I', tail[magic - 4:magic])[0]
+    trailer_end = media.file_size - window + magic - 4
+    dir_pos = trailer_end - dir_len
+    if dir_len < 12 or dir_pos < 0:
+        return
+
+    f.seek(dir_pos)
+    header = f.read(12)
+    if header[:4] != SEFH_MAGIC:
+        media.errors.append('seft: SEFH header not found')
+        return
+    version, count = struct.unpack('<II', header[4:12])
+    count = min(count, MAX_SEFT_ENTRIES, (dir_len - 12) // 12)
+    entries = f.read(12 * count)
+    media.hints['seft_version'] = version
+    media.hints['seft_entries'] = count
+
+    for i in range(count):
+        entry = entries[12 * i:12 * i + 12]
+        if len(entry) < 12:
+            break
+        entry_type = struct.unpack('<H', entry[2:4])[0]
+        noff, size = struct.unpack('<II', entry[4:12])
+        block_pos = dir_pos - noff
+        if block_pos < 0 or size < 8:
+            continue
+        # Each block starts with 2 pad bytes, a 2-byte type, a 4-byte name
+        # length and the name; the payload follows
+        f.seek(block_pos)
+        block_head = f.read(8)
+        if len(block_head) < 8:
+            continue
+        name_len = struct.unpack('<I', block_head[4:8])[0]
+        if name_len > min(size - 8, 256):
+            continue
+        name = f.read(name_len).decode('latin-1', errors='replace')
+        kind, mime = SEFT_MEDIA.get(name, ('auxiliary', None))
+        payload_len = size - 8 - name_len
+        if payload_len <= 0:
+            continue
+        media.add(EmbeddedMedia(
+            kind=kind,
+            offset=block_pos + 8 + name_len,
+            length=payload_len,
+            source='samsung_seft',
+            mime=mime,
+            name=name,
+            details={'seft_type': entry_type},
+        ))
+
+
+def _locate_mpf(f, directory, media: EmbeddedMediaMap) -> None:
+    """Secondary images listed in the APP2 Multi-Picture Format index"""
+    segment = directory.find('APP2', label='MPF')
+    if segment is None:
+        return
+    payload = directory.read(segment, max_bytes=65535)
+    tiff_start = segment.data_offset + 4
+    tiff = payload[4:]
+    if len(tiff) < 8 or tiff[:2] not in (b'II', b'MM'):
+        return
+    endian = '<' if tiff[:2] == b'II' else '>'
+    ifd = struct.unpack(endian + 'I', tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return
+    count = struct.unpack(endian + 'H', tiff[ifd:ifd + 2])[0]
+    entries_offset = entries_size = None
+    for i in range(count):
+        pos = ifd + 2 + 12 * i
+        if pos + 12 > len(tiff):
+            break
+        tag, _type, n, value = struct.unpack(endian + 'HHII', tiff[pos:pos + 12])
+        if tag == 0xB002:
+            entries_offset, entries_size = value, n
+    if entries_offset is None:
+        return
+
+    images = entries_size // 16
+    media.hints['mpf_images'] = images
+    for i in range(1, images):
+        pos = entries_offset + 16 * i
+        if pos + 16 > len(tiff):
+            break
+        attr, size, offset = struct.unpack(endian + 'III', tiff[pos:pos + 12])
+        mp_type = attr & 0xFFFFFF
+        media.add(EmbeddedMedia(
+            kind=MPF_TYPES.get(mp_type, 'image'),
+            offset=tiff_start + offset,
+            length=size,
+            source='mpf',
+            mime='image/jpeg',
+            details={'mp_type': mp_type, 'mpf_index': i},
+        ))
+
+
+def _locate_heif_boxes(f, media: EmbeddedMediaMap) -> None:
+    """Top-level ISO BMFF boxes: Samsung motion HEIC stores its video in 'mpvd'"""
+    pos = 0
+    boxes = []
+    while pos + 8 <= media.file_size and len(boxes) < 1024:
+        f.seek(pos)
+        header = f.read(16)
+        if len(header) < 8:
+            break
+        size, box_type = struct.unpack('>I4s', header[:8])
+        header_len = 8
+        if size == 1 and len(header) >= 16:
+            size = struct.unpack('>Q', header[8:16])[0]
+            header_len = 16
+        elif size == 0:
+            size = media.file_size - pos
+        if size < header_len:
+            break
+        name = box_type.decode('latin-1')
+        boxes.append(name)
+        if box_type == b'mpvd':
+            media.add(EmbeddedMedia(
+                kind='video',
+                offset=pos + header_len,
+                length=size - header_len,
+                source='heif_mpvd',
+                mime='video/mp4',
+                name='mpvd',
+            ))
+        pos += size
+    media.hints['top_level_boxes'] = boxes
+
+
+def locate_embedded_media(filepath: str) -> Optional[EmbeddedMediaMap]:
+    """Locate embedded videos, depth maps and gain maps inside an image"""
+    try:
+        file_size = os.path.getsize(filepath)
+    except OSError:
+        return None
+
+    media = EmbeddedMediaMap(filepath, file_size)
+    try:
+        # XMP first so its semantic labels win over MPF/SEFT rows that
+        # describe the same bytes
+        table = get_xmp_table(filepath)
+        if table:
+            _locate_from_xmp(table, media)
+
+        with open(filepath, 'rb') as f:
+            head = f.read(12)
+            if len(head) >= 12 and head[4:8] == b'ftyp' and head[8:12] in HEIF_BRANDS:
+                _locate_heif_boxes(f, media)
+            elif head[:2] == b'\xff\xd8':
+                directory = get_segment_directory(filepath)
+                if directory is not None:
+                    _locate_mpf(f, directory, media)
+                _locate_seft(f, media)
+    except Exception as e:
+        logger.debug(f"Embedded media scan failed for {filepath}: {e}")
+        media.errors.append(str(e))
+
+    return media
@@ -0,0 +1,376 @@
+"""
+Field Search Index
+
+Inverted indexes behind FieldRegistryCore.search_fields, prefix_search and
+find_similar_fields:
+- Trigram postings over name, standard name and description, intersected
+  smallest-first so substring queries only verify a handful of candidates
+- Name-trigram overlap to prune candidates before SequenceMatcher scoring
+- Sorted name and name-token lists for bisect-based prefix search
+- Exact-match map for search keywords, category tags and aliases
+
+Metadata keyword/tag/alias lists are tracked: editing them in place marks
+the field for re-indexing at the next query. Other attribute changes need
+re-registration or FieldRegistryCore.rebuild_indexes().
+
+Usage:
+    index = FieldSearchIndex()
+    index.add(field)
+    fields = index.search("gps lat", max_results=20)
+    similar = index.similar("GPSLatitude", max_similar=5)
+"""
+
+import heapq
+import logging
+import re
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rank tiers for search results (lower is better); description-only
+# matches follow all ranked tiers
+RANK_EXACT = 0
+RANK_NAME_PREFIX = 1
+RANK_TOKEN_PREFIX = 2
+RANK_NAME_SUBSTRING = 3
+RANK_STANDARD_NAME = 4
+RANK_METADATA = 5
+
+# Candidates kept after trigram pruning, per requested similar field
+SIMILAR_CANDIDATES_PER_RESULT = 40
+MIN_SIMILAR_CANDIDATES = 200
+# Posting entries visited when counting shared name trigrams
+SIMILAR_POSTING_BUDGET = 50000
+
+_TOKEN_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\d|\b|_)|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_TRACKED_METADATA = ("search_keywords", "category_tags", "alias_names")
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def name_tokens(name: str) -> List[str]:
+    """Lowercased camelCase / snake_case / digit tokens of a field name."""
+    return [t.lower() for t in _TOKEN_RE.findall(name)]
+
+
+class _TrackedList(list):
+    """List that reports in-place edits so the index can refresh a field."""
+
+    def __init__(self, iterable: Iterable = (), on_change: Optional[Callable[[], None]] = None):
+        super().__init__(iterable)
+        self._on_change = on_change
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+
+def _tracking(method_name: str):
+    method = getattr(list, method_name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+    wrapper.__name__ = method_name
+    return wrapper
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear",
+              "__setitem__", "__delitem__", "__iadd__"):
+    setattr(_TrackedList, _name, _tracking(_name))
+
+
+class _Entry:
+    __slots__ = ("field", "name", "standard", "description", "tokens", "metadata_keys")
+
+    def __init__(self, field: Any):
+        self.field = field
+        self.name = field.name.lower()
+        self.standard = (field.standard_name or field.name).lower()
+        self.description = (field.description or "").lower()
+        self.tokens = name_tokens(field.name)
+        meta = field.metadata
+        self.metadata_keys = {
+            str(value).lower()
+            for attr in _TRACKED_METADATA
+            for value in getattr(meta, attr, ())
+        }
+
+
+class FieldSearchIndex:
+    """Trigram/token inverted index over registered FieldDefinitions."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._entries: Dict[int, _Entry] = {}
+        self._next_id = 0
+        self._text_grams: Dict[str, Set[int]] = {}
+        self._description_grams: Dict[str, Set[int]] = {}
+        self._name_grams: Dict[str, Set[int]] = {}
+        self._metadata: Dict[str, Set[int]] = {}
+        self._sorted_names: Optional[List[Tuple[str, int]]] = None
+        self._sorted_tokens: Optional[List[Tuple[str, int]]] = None
+        self._dirty: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def add(self, field: Any) -> None:
+        if field.name in self._ids:
+            self.remove(field.name)
+        self._track_metadata(field)
+        entry = _Entry(field)
+        entry_id = self._next_id
+        self._next_id += 1
+        self._ids[field.name] = entry_id
+        self._entries[entry_id] = entry
+
+        for gram in trigrams(entry.name) | trigrams(entry.standard):
+            self._text_grams.setdefault(gram, set()).add(entry_id)
+        for gram in trigrams(entry.description):
+            self._description_grams.setdefault(gram, set()).add(entry_id)
+        for gram in trigrams(f"  {entry.name} "):
+            self._name_grams.setdefault(gram, set()).add(entry_id)
+        for key in entry.metadata_keys:
+            self._metadata.setdefault(key, set()).add(entry_id)
+        self._sorted_names = self._sorted_tokens = None
+
+    def remove(self, field_name: str) -> None:
+        entry_id = self._ids.pop(field_name, None)
+        if entry_id is None:
+            return
+        entry = self._entries.pop(entry_id)
+        self._dirty.discard(field_name)
+        for postings, keys in (
+            (self._text_grams, trigrams(entry.name) | trigrams(entry.standard)),
+            (self._description_grams, trigrams(entry.description)),
+            (self._name_grams, trigrams(f"  {entry.name} ")),
+            (self._metadata, entry.metadata_keys),
+        ):
+            for key in keys:
+                ids = postings.get(key)
+                if ids is not None:
+                    ids.discard(entry_id)
+                    if not ids:
+                        del postings[key]
+        self._sorted_names = self._sorted_tokens = None
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def _track_metadata(self, field: Any) -> None:
+        meta = field.metadata
+        name = field.name
+
+        def mark_dirty():
+            self._dirty.add(name)
+        for attr in _TRACKED_METADATA:
+            value = getattr(meta, attr, None)
+            if isinstance(value, _TrackedList):
+                # Keep the caller's list object so later edits are still seen
+                value._on_change = mark_dirty
+            elif value is not None:
+                setattr(meta, attr, _TrackedList(value, mark_dirty))
+
+    def _refresh(self) -> None:
+        while self._dirty:
+            name = self._dirty.pop()
+            entry_id = self._ids.get(name)
+            if entry_id is not None:
+                self.add(self._entries[entry_id].field)
+
+    def _sorted(self) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        if self._sorted_names is None:
+            self._sorted_names = sorted((e.name, i) for i, e in self._entries.items())
+            self._sorted_tokens = sorted(
+                (token, i) for i, e in self._entries.items() for token in set(e.tokens)
+            )
+        return self._sorted_names, self._sorted_tokens
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_prefix(items: List[Tuple[str, int]], prefix: str) -> Iterator[int]:
+        pos = bisect_left(items, (prefix, -1))
+        while pos < len(items) and items[pos][0].startswith(prefix):
+            yield items[pos][1]
+            pos += 1
+
+    @staticmethod
+    def _postings(index: Dict[str, Set[int]], query: str) -> List[Set[int]]:
+        """Posting sets of the query's trigrams, smallest first ([] if one is missing)."""
+        postings = []
+        for gram in trigrams(query):
+            ids = index.get(gram)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        return postings
+
+    def _substring_ids(self, query: str) -> Set[int]:
+        postings = self._postings(self._text_grams, query)
+        if not postings:
+            return set()
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+            if not candidates:
+                break
+        return candidates
+
+    def _iter_description_ids(self, query: str) -> Iterator[int]:
+        """Lazily yield entries whose description contains every query trigram."""
+        postings = self._postings(self._description_grams, query)
+        if not postings:
+            return
+        smallest, rest = postings[0], postings[1:]
+        for entry_id in smallest:
+            if all(entry_id in ids for ids in rest):
+                yield entry_id
+
+    def _rank(self, entry: _Entry, query: str, search_metadata: bool) -> Optional[int]:
+        if entry.name == query:
+            return RANK_EXACT
+        if entry.name.startswith(query):
+            return RANK_NAME_PREFIX
+        if any(token.startswith(query) for token in entry.tokens):
+            return RANK_TOKEN_PREFIX
+        if query in entry.name:
+            return RANK_NAME_SUBSTRING
+        if query in entry.standard:
+            return RANK_STANDARD_NAME
+        if search_metadata and query in entry.metadata_keys:
+            return RANK_METADATA
+        return None
+
+    def search(self, query: str, search_metadata: bool = True, max_results: int = 100) -> List[Any]:
+        """
+        Fields whose name, standard name or description contains the query,
+        or whose keywords/tags/aliases equal it, best matches first. Queries
+        under three characters match name prefixes and metadata only.
+
+        Tiers are filled in rank order and the search stops once max_results
+        are found, so broad queries do not rank every candidate.
+        """
+        self._refresh()
+        query = query.lower().strip()
+        if not query or max_results <= 0:
+            return []
+        names, tokens = self._sorted()
+        found: List[int] = []
+        seen: Set[int] = set()
+
+        # Exact and whole-name prefix matches (the exact name sorts first),
+        # then camelCase/snake_case token prefixes
+        for ids in (self._iter_prefix(names, query), self._iter_prefix(tokens, query)):
+            for entry_id in ids:
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    found.append(entry_id)
+                    if len(found) >= max_results:
+                        return [self._entries[i].field for i in found]
+
+        candidates = self._substring_ids(query) if len(query) >= 3 else set()
+        if search_metadata:
+            candidates |= self._metadata.get(query, set())
+        ranked = []
+        for entry_id in candidates - seen:
+            entry = self._entries[entry_id]
+            rank = self._rank(entry, query, search_metadata)
+            if rank is not None:
+                ranked.append((rank, len(entry.name), entry.name, entry_id))
+        for item in heapq.nsmallest(max_results - len(found), ranked):
+            seen.add(item[3])
+            found.append(item[3])
+
+        # Description matches last, in index order, only as many as needed
+        if len(query) >= 3:
+            for entry_id in self._iter_description_ids(query):
+                if len(found) >= max_results:
+                    break
+                if entry_id not in seen and query in self._entries[entry_id].description:
+                    seen.add(entry_id)
+                    found.append(entry_id)
+        return [self._entries[i].field for i in found]
+
+    def prefix_search(self, prefix: str, max_results: int = 20) -> List[Any]:
+        """Fields whose name, or a token of it, starts with prefix; whole-name matches first."""
+        self._refresh()
+        prefix = prefix.lower().strip()
+        if not prefix or max_results <= 0:
+            return []
+        names, tokens = self._sorted()
+        found: List[int] = []
+        seen: Set[int] = set()
+        for ids in (self._iter_prefix(names, prefix), self._iter_prefix(tokens, prefix)):
+            for entry_id in ids:
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    found.append(entry_id)
+                    if len(found) >= max_results:
+                        return [self._entries[i].field for i in found]
+        return [self._entries[i].field for i in found]
+
+    def prepare(self) -> None:
+        """Build the sorted prefix lists now rather than on the first query."""
+        self._refresh()
+        self._sorted()
+
+    def similar(self, field_name: str, max_similar: int = 5) -> List[Tuple[Any, float]]:
+        """
+        Fields with the most similar names as (field, SequenceMatcher ratio).
+        Only names sharing the most trigrams with the target are scored.
+        """
+        self._refresh()
+        target_id = self._ids.get(field_name)
+        if target_id is None:
+            return []
+        target = self._entries[target_id].name
+
+        # Count shared trigrams rarest first; once the posting budget is
+        # spent the most common trigrams are skipped (prefix filtering)
+        shared: Counter = Counter()
+        postings = sorted((self._name_grams.get(g, set()) for g in trigrams(f"  {target} ")), key=len)
+        budget = SIMILAR_POSTING_BUDGET
+        for ids in postings:
+            if budget <= 0 and shared:
+                break
+            budget -= len(ids)
+            shared.update(ids)
+        shared.pop(target_id, None)
+
+        keep = max(MIN_SIMILAR_CANDIDATES, max_similar * SIMILAR_CANDIDATES_PER_RESULT)
+        if len(self._entries) - 1 <= keep:
+            candidates = [i for i in self._entries if i != target_id]
+        else:
+            candidates = [entry_id for entry_id, _count in shared.most_common(keep)]
+
+        # Keep the best max_similar; the cheap upper bounds skip full scoring
+        # of candidates that cannot beat the current worst kept ratio
+        best: List[Tuple[float, int, int]] = []
+        for order, entry_id in enumerate(candidates):
+            matcher = SequenceMatcher(None, target, self._entries[entry_id].name)
+            if len(best) == max_similar:
+                floor = best[0][0]
+                if matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor:
+                    continue
+            item = (matcher.ratio(), -order, entry_id)
+            if len(best) < max_similar:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+        best.sort(reverse=True)
+        return [(self._entries[entry_id].field, ratio) for ratio, _order, entry_id in best]
@@ -11,6 +11,7 @@ import subprocess
 import hashlib
 import json
 import logging
+import math
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 
@@ -21,6 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# calculate_file_integrity streams the file in blocks of this size
+INTEGRITY_CHUNK_SIZE = 1024 * 1024
+
 
 def log_extraction_event(
     event_type: str,
@@ -532,30 +536,41 @@ def extract_email_metadata(filepath: str) -> Dict[str, Any]:
 
 
 def calculate_file_integrity(filepath: str) -> Dict[str, Any]:
-    """Calculate file integrity hashes and metrics."""
+    """Calculate file integrity hashes and metrics in one streamed pass."""
     result = {}
 
     try:
+        hashers = {
+            "file_hash_md5": hashlib.md5(),
+            "file_hash_sha1": hashlib.sha1(),
+            "file_hash_sha256": hashlib.sha256(),
+            "file_hash_sha512": hashlib.sha512(),
+        }
+        byte_counts = [0] * 256
+        size = 0
         with open(filepath, 'rb') as f:
-            data = f.read()
+            for chunk in iter(lambda: f.read(INTEGRITY_CHUNK_SIZE), b''):
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+                for byte in range(256):
+                    byte_counts[byte] += chunk.count(byte)
+                size += len(chunk)
 
         # Calculate hashes
-        result["file_hash_md5"] = hashlib.md5(data).hexdigest()
-        result["file_hash_sha1"] = hashlib.sha1(data).hexdigest()
-        result["file_hash_sha256"] = hashlib.sha256(data).hexdigest()
-        result["file_hash_sha512"] = hashlib.sha512(data).hexdigest()
-
-        # Calculate entropy (simplified)
-        if data:
-            entropy = 0
-            for byte in range(256):
-                p = data.count(byte) / len(data)
-                if p > 0:
-                    entropy -= p * (p.bit_length() - 1)  # Approximation
+        for key, hasher in hashers.items():
+            result[key] = hasher.hexdigest()
+
+        # Shannon entropy in bits per byte
+        if size:
+            entropy = 0.0
+            for count in byte_counts:
+                if count:
+                    p = count / size
+                    entropy -= p * math.log2(p)
             result["file_entropy"] = entropy
 
         # File size for compression ratio calculation
-        result["file_size"] = len(data)
+        result["file_size"] = size
 
     except Exception as e:
         result["error"] = str(e)
@@ -26,6 +26,23 @@ except ImportError:
     BIOPYTHON_AVAILABLE = False
     logger.warning("Biopython not available - genomic extraction limited")
 
+try:
+    from . import genomic_stream
+except ImportError:
+    try:
+        import genomic_stream
+    except ImportError:
+        genomic_stream = None
+
+STREAMING_AVAILABLE = genomic_stream is not None and genomic_stream.NUMPY_AVAILABLE
+
+
+def _open_text(filepath: str):
+    """Open a plain, gzip or BGZF (.gz/.bgz) file as text, sniffing the gzip magic."""
+    with open(filepath, 'rb') as f:
+        compressed = f.read(2) == b'\x1f\x8b'
+    return gzip.open(filepath, 'rt') if compressed else open(filepath, 'rt')
+
 
 class GenomicFormat(Enum):
     FASTA = "fasta"
@@ -75,18 +92,38 @@ class VcfMetadata:
 class GenomicExtractor:
     """Extract genomic/biological data metadata."""
 
-    def __init__(self):
-        pass
+    def __init__(self, mode: str = "auto", sample_size: Optional[int] = None,
+                 time_budget_seconds: Optional[float] = None, workers: Optional[int] = None,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            mode: "full" scans every record, "sample" estimates statistics
+                from a random sample with confidence intervals, "auto"
+                samples only very large files
+            sample_size: records to sample (streaming engine default if None)
+            time_budget_seconds: stop reading after this long and report
+                estimates from what was read
+            workers: threads for BGZF block decompression
+            seed: seed for reproducible sampling
+        """
+        self.stream_options = {
+            "mode": mode,
+            "time_budget_seconds": time_budget_seconds,
+            "workers": workers,
+            "seed": seed,
+        }
+        if sample_size is not None:
+            self.stream_options["sample_size"] = sample_size
 
     def detect_format(self, filepath: str) -> GenomicFormat:
         """Detect genomic file format."""
         ext = Path(filepath).suffix.lower()
 
-        if ext in ['.fa', '.fna', '.faa', '.fasta']:
+        if ext in ['.fa', '.fna', '.faa', '.fasta'] or filepath.lower().endswith(('.fa.gz', '.fna.gz', '.fasta.gz')):
             return GenomicFormat.FASTA
-        elif ext in ['.fq', '.fastq']:
+        elif ext in ['.fq', '.fastq'] or filepath.lower().endswith(('.fq.gz', '.fastq.gz', '.fq.bgz', '.fastq.bgz')):
             return GenomicFormat.FASTQ
-        elif ext in ['.vcf', '.vcf.gz']:
+        elif ext in ['.vcf'] or filepath.lower().endswith(('.vcf.gz', '.vcf.bgz')):
             return GenomicFormat.VCF
         elif ext in ['.bam']:
             return GenomicFormat.BAM
@@ -110,6 +147,12 @@ class GenomicExtractor:
 
     def extract_fasta_metadata(self, filepath: str) -> Dict[str, Any]:
         """Extract FASTA file metadata."""
+        if STREAMING_AVAILABLE:
+            try:
+                return genomic_stream.analyze_fasta(filepath, **self.stream_options)
+            except Exception as e:
+                logger.error(f"Error streaming FASTA: {e}")
+
         if not BIOPYTHON_AVAILABLE:
             return self._extract_fasta_basic(filepath)
 
@@ -168,8 +211,7 @@ class GenomicExtractor:
             current_id = None
             current_seq = []
 
-            open_func = gzip.open if filepath.endswith('.gz') else open
-            with open_func(filepath, 'rt') as f:
+            with _open_text(filepath) as f:
                 for line in f:
                     line = line.strip()
                     if line.startswith('>'):
@@ -218,6 +260,12 @@ class GenomicExtractor:
 
     def extract_fastq_metadata(self, filepath: str) -> Dict[str, Any]:
         """Extract FASTQ file metadata."""
+        if STREAMING_AVAILABLE:
+            try:
+                return genomic_stream.analyze_fastq(filepath, **self.stream_options)
+            except Exception as e:
+                logger.error(f"Error streaming FASTQ: {e}")
+
         if not BIOPYTHON_AVAILABLE:
             return self._extract_fastq_basic(filepath)
 
@@ -274,51 +322,38 @@ class GenomicExtractor:
             return self._extract_fastq_basic(filepath)
 
     def _extract_fastq_basic(self, filepath: str) -> Dict[str, Any]:
-        """Basic FASTQ extraction without Biopython."""
+        """Basic FASTQ extraction without Biopython or NumPy, one record at a time."""
         try:
-            records = []
+            record_count = 0
             total_length = 0
-            quality_scores = []
+            quality_total = 0
+            quality_count = 0
             gc_total = 0
 
-            open_func = gzip.open if filepath.endswith('.gz') else open
-            with open_func(filepath, 'rt') as f:
-                i = 0
-                lines = f.readlines()
-                while i < len(lines):
-                    if lines[i].startswith('@'):
-                        rec_id = lines[i][1:].strip()
-                        i += 1
-                        seq = lines[i].strip().upper()
-                        i += 2
-                        qual = lines[i].strip()
-                        i += 1
-
-                        rec = {
-                            "id": rec_id,
-                            "length": len(seq),
-                        }
-                        gc = seq.count('G') + seq.count('C')
-                        if len(seq) > 0:
-                            rec["gc_content"] = round(gc / len(seq) * 100, 2)
-                            gc_total += gc
-                        total_length += len(seq)
-
-                        for q in qual:
-                            try:
-                                quality_scores.append(ord(q) - 33)
-                            except:
-                                pass
-
-                        records.append(rec)
+            with _open_text(filepath) as f:
+                while True:
+                    header = f.readline()
+                    if not header:
+                        break
+                    if not header.startswith('@'):
+                        continue
+                    seq = f.readline().strip().upper()
+                    f.readline()
+                    qual = f.readline().strip()
+
+                    gc_total += seq.count('G') + seq.count('C')
+                    total_length += len(seq)
+                    quality_total += sum(qual.encode('ascii', 'replace')) - 33 * len(qual)
+                    quality_count += len(qual)
+                    record_count += 1
 
             avg_quality = None
-            if quality_scores:
-                avg_quality = sum(quality_scores) / len(quality_scores)
+            if quality_count:
+                avg_quality = quality_total / quality_count
 
             return {
                 "format": "fastq",
-                "record_count": len(records),
+                "record_count": record_count,
                 "total_bases": total_length,
                 "avg_gc_content": round(gc_total / total_length * 100, 2) if total_length > 0 else None,
                 "avg_quality_score": round(avg_quality, 2) if avg_quality else None,
@@ -335,8 +370,7 @@ class GenomicExtractor:
             format_fields = []
             samples = []
 
-            open_func = gzip.open if filepath.endswith('.gz') else open
-            with open_func(filepath, 'rt') as f:
+            with _open_text(filepath) as f:
                 for line in f:
                     line = line.strip()
                     if line.startswith('##'):
@@ -362,6 +396,9 @@ class GenomicExtractor:
                         parts = line.split('\t')
                         if len(parts) > 9:
                             samples = parts[9:]
+                        break
+                    else:
+                        break
 
             result = {
                 "format": "vcf",
@@ -375,6 +412,15 @@ class GenomicExtractor:
                 "filter_count": len(metadata.filters),
             }
 
+            if genomic_stream is not None:
+                result.update(genomic_stream.count_vcf_records(
+                    filepath,
+                    mode=self.stream_options["mode"],
+                    time_budget_seconds=self.stream_options["time_budget_seconds"],
+                    workers=self.stream_options["workers"],
+                    seed=self.stream_options["seed"],
+                ))
+
             return result
 
         except Exception as e:
@@ -410,6 +456,10 @@ class GenomicExtractor:
             result["genomic_metadata"] = self.extract_vcf_metadata(filepath)
             result["extraction_success"] = "error" not in result["genomic_metadata"]
 
+        elif format_type == GenomicFormat.BAM and genomic_stream is not None:
+            result["genomic_metadata"] = genomic_stream.analyze_bam(filepath)
+            result["extraction_success"] = "error" not in result["genomic_metadata"]
+
         else:
             result["genomic_metadata"] = {"message": "Unsupported genomic format"}
             result["extraction_success"] = False
@@ -417,9 +467,13 @@ class GenomicExtractor:
         return result
 
 
-def extract_genomic_metadata(filepath: str) -> Dict[str, Any]:
-    """Convenience function to extract genomic metadata."""
-    extractor = GenomicExtractor()
+def extract_genomic_metadata(filepath: str, **options: Any) -> Dict[str, Any]:
+    """Convenience function to extract genomic metadata.
+
+    ``options`` are passed to GenomicExtractor (mode, sample_size,
+    time_budget_seconds, workers, seed).
+    """
+    extractor = GenomicExtractor(**options)
     return extractor.extract(filepath)
 
 
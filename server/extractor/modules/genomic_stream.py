@@ -0,0 +1,1084 @@
+#!/usr/bin/env python3
+"""
+Streaming Genomic Statistics Engine
+
+Computes FASTQ/FASTA/VCF/BAM statistics for genomic_extractor in constant
+memory:
+- Chunked reading of plain, gzip and BGZF files; BGZF blocks are inflated
+  in parallel on a thread pool (zlib releases the GIL while inflating)
+- FASTQ/FASTA records are split per chunk and summarised with NumPy over
+  the joined byte buffers: GC/N counts, per-base and per-read quality, and
+  read length/GC/quality histograms
+- Companion indexes (.fai, .tbi, .bai) supply record counts without a scan
+- A sampling mode reads randomly placed windows (plain and BGZF files) or a
+  time-bounded prefix (plain gzip), keeps a reservoir of per-read summaries
+  and reports ratio estimates with 95% confidence intervals
+
+Peak memory is bounded by the chunk size and the reservoir size.
+
+Usage:
+    from .genomic_stream import analyze_fastq
+    stats = analyze_fastq(path, mode="sample", time_budget_seconds=5)
+    if stats is not None:
+        print(stats["avg_gc_content"], stats["confidence_intervals"])
+"""
+
+import gzip
+import logging
+import math
+import os
+import random
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 4 * 1024 * 1024
+RAW_READ_BYTES = 1024 * 1024
+# BGZF blocks hold at most 64 KiB, so one task inflates up to ~4 MiB
+BGZF_BLOCKS_PER_TASK = 64
+BGZF_MAGIC = b"\x1f\x8b\x08\x04"
+WINDOW_BYTES = 256 * 1024
+SAMPLE_STRATA = 64
+DEFAULT_SAMPLE_SIZE = 20000
+# "auto" mode samples files larger than this instead of scanning them
+AUTO_SAMPLE_BYTES = 1024 * 1024 * 1024
+# Records per estimation unit when streaming (full scans and prefixes)
+UNIT_RECORDS = 1024
+PHRED_OFFSET = 33
+MAX_PHRED = 93
+Z_95 = 1.96
+RECORD_PREVIEW = 50
+FASTA_RECORD_PREVIEW = 100
+HISTOGRAM_BINS = 100
+# Index pseudo-bin holding per-reference mapped/unmapped counts (SAM spec 5.2)
+PSEUDO_BIN = 37450
+MODES = ("auto", "full", "sample")
+
+if NUMPY_AVAILABLE:
+    _GC_TABLE = np.zeros(256, dtype=np.uint8)
+    _GC_TABLE[list(b"GCSgcs")] = 1
+    _N_TABLE = np.zeros(256, dtype=np.uint8)
+    _N_TABLE[list(b"Nn")] = 1
+
+
+# ---------------------------------------------------------------------------
+# Byte sources
+# ---------------------------------------------------------------------------
+
+def detect_compression(filepath: str) -> str:
+    """Return "bgzf", "gzip" or "plain"."""
+    with open(filepath, "rb") as handle:
+        header = handle.read(18)
+    if header[:2] != b"\x1f\x8b":
+        return "plain"
+    if header[:4] == BGZF_MAGIC and header[12:16] == b"BC\x02\x00":
+        return "bgzf"
+    return "gzip"
+
+
+def _read_bgzf_block(handle) -> Optional[bytes]:
+    """Read one BGZF block and return its raw deflate payload (None at EOF)."""
+    header = handle.read(12)
+    if len(header) < 12:
+        return None
+    if header[:4] != BGZF_MAGIC:
+        raise ValueError("Not a BGZF block")
+    xlen = struct.unpack_from("<H", header, 10)[0]
+    extra = handle.read(xlen)
+    block_size = None
+    position = 0
+    while position + 4 <= len(extra):
+        subfield_length = struct.unpack_from("<H", extra, position + 2)[0]
+        if extra[position:position + 2] == b"BC" and subfield_length == 2:
+            block_size = struct.unpack_from("<H", extra, position + 4)[0] + 1
+        position += 4 + subfield_length
+    if block_size is None:
+        raise ValueError("BGZF block without BC subfield")
+    remaining = block_size - 12 - xlen
+    body = handle.read(remaining)
+    if len(body) < remaining:
+        raise ValueError("Truncated BGZF block")
+    return body[:-8]
+
+
+def _inflate_blocks(payloads: List[bytes]) -> bytes:
+    return b"".join(zlib.decompress(payload, -15) for payload in payloads)
+
+
+def _seek_next_bgzf_block(handle) -> Optional[int]:
+    """Position ``handle`` on the next BGZF block header at or after its offset."""
+    start = handle.tell()
+    overlap = b""
+    while True:
+        data = handle.read(RAW_READ_BYTES)
+        if not data:
+            return None
+        buffer = overlap + data
+        base = start - len(overlap)
+        index = buffer.find(BGZF_MAGIC)
+        while index != -1:
+            if buffer[index + 12:index + 16] == b"BC\x02\x00":
+                handle.seek(base + index)
+                return base + index
+            if index + 16 > len(buffer):
+                break
+            index = buffer.find(BGZF_MAGIC, index + 1)
+        start += len(data)
+        overlap = buffer[-15:]
+
+
+class GenomicByteSource:
+    """Decompressed byte stream over a plain, gzip or BGZF file."""
+
+    def __init__(self, filepath: str, workers: Optional[int] = None):
+        self.filepath = filepath
+        self.size = os.path.getsize(filepath)
+        self.compression = detect_compression(filepath)
+        self.workers = max(1, workers or min(4, os.cpu_count() or 1))
+
+    @property
+    def random_access(self) -> bool:
+        return self.compression in ("plain", "bgzf")
+
+    def chunks(self) -> Iterator[Tuple[bytes, int]]:
+        """Yield (decompressed bytes, on-disk bytes consumed so far)."""
+        with open(self.filepath, "rb") as handle:
+            if self.compression == "bgzf":
+                yield from self._bgzf_chunks(handle)
+            elif self.compression == "gzip":
+                yield from self._gzip_chunks(handle)
+            else:
+                while True:
+                    data = handle.read(CHUNK_BYTES)
+                    if not data:
+                        return
+                    yield data, handle.tell()
+
+    def _bgzf_chunks(self, handle) -> Iterator[Tuple[bytes, int]]:
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        try:
+            exhausted = False
+            while True:
+                if not exhausted:
+                    payloads = []
+                    while len(payloads) < BGZF_BLOCKS_PER_TASK:
+                        payload = _read_bgzf_block(handle)
+                        if payload is None:
+                            exhausted = True
+                            break
+                        payloads.append(payload)
+                    if payloads:
+                        pending.append((pool.submit(_inflate_blocks, payloads), handle.tell()))
+                if not pending:
+                    return
+                if exhausted or len(pending) >= self.workers * 2:
+                    future, offset = pending.popleft()
+                    yield future.result(), offset
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _gzip_chunks(handle) -> Iterator[Tuple[bytes, int]]:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        while True:
+            raw = handle.read(RAW_READ_BYTES)
+            if not raw:
+                return
+            while raw:
+                data = decompressor.decompress(raw)
+                if data:
+                    yield data, handle.tell()
+                if decompressor.eof:
+                    # Concatenated gzip members
+                    raw = decompressor.unused_data
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                else:
+                    raw = b""
+
+    def read_window(self, offset: int, size: Optional[int] = None) -> Tuple[bytes, int]:
+        """Read about ``size`` decompressed bytes starting near ``offset``.
+
+        Returns the data and the on-disk bytes it spans. Only valid for
+        random-access sources.
+        """
+        size = size or WINDOW_BYTES
+        with open(self.filepath, "rb") as handle:
+            handle.seek(offset)
+            if self.compression == "plain":
+                data = handle.read(size)
+                return data, len(data)
+            start = _seek_next_bgzf_block(handle)
+            if start is None:
+                return b"", 0
+            parts = []
+            total = 0
+            while total < size:
+                payload = _read_bgzf_block(handle)
+                if payload is None:
+                    break
+                data = zlib.decompress(payload, -15)
+                parts.append(data)
+                total += len(data)
+            return b"".join(parts), handle.tell() - start
+
+
+class _LineSplitter:
+    """Splits byte chunks into lines, carrying the partial last line over."""
+
+    def __init__(self):
+        self.tail = b""
+
+    def feed(self, data: bytes) -> List[bytes]:
+        if b"\r" in data:
+            data = data.replace(b"\r", b"")
+        lines = (self.tail + data).split(b"\n")
+        self.tail = lines.pop()
+        return lines
+
+    def finish(self) -> List[bytes]:
+        tail, self.tail = self.tail, b""
+        return [tail] if tail else []
+
+
+def _window_lines(data: bytes, at_file_start: bool) -> List[bytes]:
+    """Complete lines of a window; partial first and last lines are dropped."""
+    lines = data.replace(b"\r", b"").split(b"\n")
+    if not at_file_start:
+        lines = lines[1:]
+    return lines[:-1]
+
+
+# ---------------------------------------------------------------------------
+# Estimation helpers
+# ---------------------------------------------------------------------------
+
+class Reservoir:
+    """Fixed-size uniform sample of rows from a stream (batched Algorithm R)."""
+
+    def __init__(self, capacity: int, width: int, seed: Optional[int] = None):
+        self.capacity = max(0, capacity)
+        self.rows = np.empty((self.capacity, width))
+        self.filled = 0
+        self.seen = 0
+        self.rng = np.random.default_rng(seed)
+
+    def add(self, rows: "np.ndarray") -> None:
+        count = len(rows)
+        take = min(self.capacity - self.filled, count)
+        if take:
+            self.rows[self.filled:self.filled + take] = rows[:take]
+            self.filled += take
+        rest = rows[take:]
+        if len(rest) and self.capacity:
+            positions = self.seen + take + np.arange(len(rest))
+            slots = self.rng.integers(0, positions + 1)
+            keep = slots < self.capacity
+            self.rows[slots[keep]] = rest[keep]
+        self.seen += count
+
+    def sample(self) -> "np.ndarray":
+        return self.rows[:self.filled]
+
+
+class RatioMoments:
+    """Running sums for a ratio estimator over sampling units.
+
+    The ratio sum(num) / sum(den) gets a linearised standard error, with
+    each unit (a window or a block of records) treated as one observation.
+    """
+
+    def __init__(self):
+        self.units = 0
+        self.num = 0.0
+        self.den = 0.0
+        self.num2 = 0.0
+        self.numden = 0.0
+        self.den2 = 0.0
+
+    def add(self, num: float, den: float) -> None:
+        self.units += 1
+        self.num += num
+        self.den += den
+        self.num2 += num * num
+        self.numden += num * den
+        self.den2 += den * den
+
+    def estimate(self) -> Tuple[Optional[float], Optional[float]]:
+        """Return (ratio, 95% half-width); half-width is None below two units."""
+        if self.den <= 0:
+            return None, None
+        ratio = self.num / self.den
+        if self.units < 2:
+            return ratio, None
+        squares = self.num2 - 2 * ratio * self.numden + ratio * ratio * self.den2
+        variance = self.units / (self.units - 1) * max(squares, 0.0) / (self.den * self.den)
+        return ratio, Z_95 * math.sqrt(variance)
+
+
+def _interval(ratio: Optional[float], half_width: Optional[float], scale: float = 1.0,
+              digits: int = 2) -> Optional[List[float]]:
+    if ratio is None or half_width is None:
+        return None
+    low, high = max(0.0, (ratio - half_width) * scale), (ratio + half_width) * scale
+    if digits == 0:
+        return [int(round(low)), int(round(high))]
+    return [round(low, digits), round(high, digits)]
+
+
+def _segment_sums(values: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """Sum ``values`` over consecutive segments of the given lengths."""
+    cumulative = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, dtype=np.int64, out=cumulative[1:])
+    ends = np.cumsum(lengths)
+    return cumulative[ends] - cumulative[ends - lengths]
+
+
+def _nonzero_histogram(counts: "np.ndarray") -> Dict[int, int]:
+    return {int(index): int(counts[index]) for index in np.flatnonzero(counts)}
+
+
+def _length_histogram(counts: "np.ndarray") -> Dict[str, int]:
+    """Exact lengths when few are present, otherwise equal-width bins."""
+    present = np.flatnonzero(counts)
+    if len(present) == 0:
+        return {}
+    if len(present) <= HISTOGRAM_BINS:
+        return {str(int(length)): int(counts[length]) for length in present}
+    low, high = int(present[0]), int(present[-1])
+    width = max(1, math.ceil((high - low + 1) / HISTOGRAM_BINS))
+    histogram = {}
+    for start in range(low, high + 1, width):
+        total = int(counts[start:start + width].sum())
+        if total:
+            histogram[f"{start}-{min(start + width, high + 1) - 1}"] = total
+    return histogram
+
+
+def _percentiles(values: "np.ndarray", digits: int = 2) -> Optional[Dict[str, float]]:
+    if len(values) == 0:
+        return None
+    p5, p50, p95 = np.percentile(values, [5, 50, 95])
+    return {"p5": round(float(p5), digits), "p50": round(float(p50), digits), "p95": round(float(p95), digits)}
+
+
+def _resolve_mode(mode: str, source: GenomicByteSource) -> str:
+    if mode not in MODES:
+        raise ValueError(f"Unknown statistics mode: {mode}")
+    if mode == "auto":
+        mode = "sample" if source.size > AUTO_SAMPLE_BYTES else "full"
+    if mode == "sample" and source.random_access and source.size <= WINDOW_BYTES * SAMPLE_STRATA:
+        # Windows would cover the whole file anyway
+        mode = "full"
+    return mode
+
+
+def _window_offsets(size: int, rng: random.Random) -> Iterator[int]:
+    """Stratified random window offsets, one per stratum per round."""
+    stratum = size / SAMPLE_STRATA
+    while True:
+        order = list(range(SAMPLE_STRATA))
+        rng.shuffle(order)
+        for index in order:
+            yield int(index * stratum + rng.random() * max(stratum - 1, 0))
+
+
+# ---------------------------------------------------------------------------
+# Companion indexes
+# ---------------------------------------------------------------------------
+
+def _fresh_index(filepath: str, suffixes: Tuple[str, ...]) -> Optional[str]:
+    """Return a companion index path that is not older than the data file."""
+    stem, _ = os.path.splitext(filepath)
+    candidates = [filepath + suffix for suffix in suffixes] + [stem + suffix for suffix in suffixes]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            if os.path.getmtime(candidate) + 1 < os.path.getmtime(filepath):
+                logger.debug(f"Ignoring stale index {candidate}")
+                continue
+            return candidate
+    return None
+
+
+def read_fai(index_path: str) -> Optional[Dict[str, Any]]:
+    """Summarise a samtools .fai (FASTA) or fqidx (FASTQ) index."""
+    try:
+        count = 0
+        total = 0
+        preview = []
+        with open(index_path, "r") as handle:
+            for line in handle:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 5:
+                    continue
+                length = int(fields[1])
+                count += 1
+                total += length
+                if len(preview) < FASTA_RECORD_PREVIEW:
+                    preview.append({"id": fields[0], "length": length})
+        return {"record_count": count, "total_length": total, "records": preview}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Unreadable .fai index {index_path}: {e}")
+        return None
+
+
+def _parse_reference_bins(data: bytes, position: int, n_ref: int) -> Tuple[List[Dict[str, int]], int]:
+    """Walk the per-reference bin/interval lists shared by .bai and .tbi."""
+    references = []
+    for _ in range(n_ref):
+        n_bin = struct.unpack_from("<i", data, position)[0]
+        position += 4
+        counts = {"mapped": None, "unmapped": None}
+        for _ in range(n_bin):
+            bin_id, n_chunk = struct.unpack_from("<Ii", data, position)
+            position += 8
+            if bin_id == PSEUDO_BIN and n_chunk == 2:
+                counts["mapped"], counts["unmapped"] = struct.unpack_from("<QQ", data, position + 16)
+            position += 16 * n_chunk
+        n_intv = struct.unpack_from("<i", data, position)[0]
+        position += 4 + 8 * n_intv
+        references.append(counts)
+    return references, position
+
+
+def _summarise_reference_counts(references: List[Dict[str, Any]], no_coordinate: Optional[int]) -> Optional[Dict[str, Any]]:
+    if any(reference["mapped"] is None for reference in references):
+        # Indexes written without the pseudo-bin carry no counts
+        return None
+    mapped = sum(reference["mapped"] for reference in references)
+    unmapped = sum(reference["unmapped"] for reference in references)
+    return {
+        "mapped": mapped,
+        "unmapped": unmapped + (no_coordinate or 0),
+        "no_coordinate": no_coordinate,
+        "references": references,
+    }
+
+
+def read_tabix_index(index_path: str) -> Optional[Dict[str, Any]]:
+    """Per-contig record counts from a tabix (.tbi) index."""
+    try:
+        with gzip.open(index_path, "rb") as handle:
+            data = handle.read()
+        if data[:4] != b"TBI\x01":
+            return None
+        n_ref = struct.unpack_from("<i", data, 4)[0]
+        name_length = struct.unpack_from("<i", data, 32)[0]
+        names = data[36:36 + name_length].split(b"\x00")[:n_ref]
+        references, position = _parse_reference_bins(data, 36 + name_length, n_ref)
+        for name, reference in zip(names, references):
+            reference["name"] = name.decode("utf-8", "replace")
+        no_coordinate = struct.unpack_from("<Q", data, position)[0] if position + 8 <= len(data) else None
+        summary = _summarise_reference_counts(references, no_coordinate)
+        if summary is not None:
+            summary["record_count"] = summary["mapped"] + summary["unmapped"]
+        return summary
+    except (OSError, EOFError, struct.error, zlib.error) as e:
+        logger.debug(f"Unreadable tabix index {index_path}: {e}")
+        return None
+
+
+def read_bai_index(index_path: str) -> Optional[Dict[str, Any]]:
+    """Per-reference mapped/unmapped read counts from a BAM (.bai) index."""
+    try:
+        with open(index_path, "rb") as handle:
+            data = handle.read()
+        if data[:4] != b"BAI\x01":
+            return None
+        n_ref = struct.unpack_from("<i", data, 4)[0]
+        references, position = _parse_reference_bins(data, 8, n_ref)
+        no_coordinate = struct.unpack_from("<Q", data, position)[0] if position + 8 <= len(data) else None
+        summary = _summarise_reference_counts(references, no_coordinate)
+        if summary is not None:
+            summary["record_count"] = summary["mapped"] + summary["unmapped"]
+        return summary
+    except (OSError, struct.error) as e:
+        logger.debug(f"Unreadable BAM index {index_path}: {e}")
+        return None
+
+
+def read_bam_header(filepath: str) -> Optional[Dict[str, Any]]:
+    """Read the SAM text header and reference dictionary of a BAM file."""
+    try:
+        with gzip.open(filepath, "rb") as handle:
+            if handle.read(4) != b"BAM\x01":
+                return None
+            text_length = struct.unpack("<i", handle.read(4))[0]
+            text = handle.read(text_length).rstrip(b"\x00").decode("utf-8", "replace")
+            n_ref = struct.unpack("<i", handle.read(4))[0]
+            references = []
+            for _ in range(n_ref):
+                name_length = struct.unpack("<i", handle.read(4))[0]
+                name = handle.read(name_length).rstrip(b"\x00").decode("utf-8", "replace")
+                length = struct.unpack("<i", handle.read(4))[0]
+                references.append({"name": name, "length": length})
+        return {"text": text, "references": references}
+    except (OSError, EOFError, struct.error, zlib.error) as e:
+        logger.debug(f"Unreadable BAM header {filepath}: {e}")
+        return None
+
+
+# ---------------------------------------------------------------------------
+# FASTQ
+# ---------------------------------------------------------------------------
+
+def split_fastq_records(lines: List[bytes]) -> Tuple[List[bytes], List[bytes], List[bytes], int, int]:
+    """Split complete four-line records off the front of ``lines``.
+
+    Returns (headers, sequences, qualities, index of the first record line,
+    lines consumed). Misaligned input
+    (a window starting mid-record, blank lines) is resynchronised on a
+    header whose separator follows two lines later and whose sequence and
+    quality lengths agree.
+    """
+    count = len(lines) // 4 * 4
+    if count:
+        headers = lines[0:count:4]
+        separators = lines[2:count:4]
+        if all(line[:1] == b"@" for line in headers) and all(line[:1] == b"+" for line in separators):
+            return headers, lines[1:count:4], lines[3:count:4], 0, count
+    headers, sequences, qualities = [], [], []
+    first = None
+    index = 0
+    total = len(lines)
+    while index + 4 <= total:
+        if (lines[index][:1] == b"@" and lines[index + 2][:1] == b"+"
+                and len(lines[index + 1]) == len(lines[index + 3])):
+            if first is None:
+                first = index
+            headers.append(lines[index])
+            sequences.append(lines[index + 1])
+            qualities.append(lines[index + 3])
+            index += 4
+        else:
+            index += 1
+    return headers, sequences, qualities, index if first is None else first, index
+
+
+class FastqAccumulator:
+    """Vectorised FASTQ statistics over batches of records."""
+
+    def __init__(self, reservoir_size: int = DEFAULT_SAMPLE_SIZE, seed: Optional[int] = None,
+                 phred_offset: int = PHRED_OFFSET):
+        self.phred_offset = phred_offset
+        self.records = 0
+        self.bases = 0
+        self.gc_bases = 0
+        self.n_bases = 0
+        self.quality_sum = 0
+        self.quality_bases = 0
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.length_counts = np.zeros(1, dtype=np.int64)
+        self.gc_histogram = np.zeros(101, dtype=np.int64)
+        self.base_quality_histogram = np.zeros(MAX_PHRED + 1, dtype=np.int64)
+        self.read_quality_histogram = np.zeros(MAX_PHRED + 1, dtype=np.int64)
+        # Per-read (length, GC %, mean quality)
+        self.reservoir = Reservoir(reservoir_size, 3, seed)
+        self.preview: List[Dict[str, Any]] = []
+        # Ratio estimators: GC, N, quality, read length, records/byte, bases/byte
+        self.ratios = {name: RatioMoments() for name in ("gc", "n", "quality", "length", "records", "bases")}
+
+    def add(self, headers: List[bytes], sequences: List[bytes], qualities: List[bytes],
+            span: float, unit_records: Optional[int] = None) -> None:
+        """Add records that occupied ``span`` on-disk bytes.
+
+        With ``unit_records`` the batch is split into estimation units of
+        that many records; otherwise the whole batch is one unit.
+        """
+        total = len(sequences)
+        if not total:
+            return
+        step = unit_records or total
+        for start in range(0, total, step):
+            stop = min(start + step, total)
+            self._add_unit(headers[start:stop], sequences[start:stop], qualities[start:stop],
+                           span * (stop - start) / total)
+
+    def _add_unit(self, headers, sequences, qualities, span: float) -> None:
+        count = len(sequences)
+        lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=count)
+        bases = np.frombuffer(b"".join(sequences), dtype=np.uint8)
+        gc_per_read = _segment_sums(_GC_TABLE[bases], lengths)
+        n_total = int(_N_TABLE[bases].sum())
+
+        quality_lengths = np.fromiter(map(len, qualities), dtype=np.int64, count=count)
+        scores = np.frombuffer(b"".join(qualities), dtype=np.uint8).astype(np.int16)
+        scores -= self.phred_offset
+        np.clip(scores, 0, MAX_PHRED, out=scores)
+        quality_per_read = _segment_sums(scores, quality_lengths)
+
+        base_total = int(lengths.sum())
+        gc_total = int(gc_per_read.sum())
+        quality_total = int(quality_per_read.sum())
+        quality_base_total = int(quality_lengths.sum())
+
+        safe_lengths = np.maximum(lengths, 1)
+        gc_percent = gc_per_read * 100.0 / safe_lengths
+        mean_quality = quality_per_read / np.maximum(quality_lengths, 1)
+        nonempty = lengths > 0
+        self.gc_histogram += np.bincount(np.rint(gc_percent[nonempty]).astype(np.int64), minlength=101)[:101]
+        self.read_quality_histogram += np.bincount(
+            mean_quality[quality_lengths > 0].astype(np.int64), minlength=MAX_PHRED + 1)[:MAX_PHRED + 1]
+        self.base_quality_histogram += np.bincount(scores, minlength=MAX_PHRED + 1)[:MAX_PHRED + 1]
+
+        longest = int(lengths.max())
+        if longest >= len(self.length_counts):
+            grown = np.zeros(max(longest + 1, len(self.length_counts) * 2), dtype=np.int64)
+            grown[:len(self.length_counts)] = self.length_counts
+            self.length_counts = grown
+        self.length_counts[:longest + 1] += np.bincount(lengths, minlength=longest + 1)
+        shortest = int(lengths.min())
+        self.min_length = shortest if self.min_length is None else min(self.min_length, shortest)
+        self.max_length = longest if self.max_length is None else max(self.max_length, longest)
+
+        self.reservoir.add(np.column_stack((lengths, gc_percent, mean_quality)))
+        if len(self.preview) < RECORD_PREVIEW:
+            for index in range(min(count, RECORD_PREVIEW - len(self.preview))):
+                self.preview.append({
+                    "id": headers[index][1:].decode("utf-8", "replace").strip(),
+                    "length": int(lengths[index]),
+                    "gc_content": round(float(gc_percent[index]), 2) if lengths[index] else None,
+                    "quality_mean": round(float(mean_quality[index]), 2) if quality_lengths[index] else None,
+                })
+
+        self.records += count
+        self.bases += base_total
+        self.gc_bases += gc_total
+        self.n_bases += n_total
+        self.quality_sum += quality_total
+        self.quality_bases += quality_base_total
+        self.ratios["gc"].add(gc_total, base_total)
+        self.ratios["n"].add(n_total, base_total)
+        self.ratios["quality"].add(quality_total, quality_base_total)
+        self.ratios["length"].add(base_total, count)
+        self.ratios["records"].add(count, span)
+        self.ratios["bases"].add(base_total, span)
+
+
+def _stream_fastq(source: GenomicByteSource, stats: FastqAccumulator,
+                  deadline: Optional[float], record_limit: Optional[int]) -> bool:
+    """Scan from the start of the file; return True if the whole file was read."""
+    splitter = _LineSplitter()
+    carry: List[bytes] = []
+    previous_offset = 0
+    for data, offset in source.chunks():
+        lines = carry + splitter.feed(data)
+        headers, sequences, qualities, _, used = split_fastq_records(lines)
+        carry = lines[used:]
+        # On-disk bytes attributed to this chunk's records
+        stats.add(headers, sequences, qualities, offset - previous_offset, UNIT_RECORDS)
+        previous_offset = offset
+        if deadline is not None and time.monotonic() > deadline:
+            return False
+        if record_limit is not None and stats.records >= record_limit:
+            return False
+    headers, sequences, qualities, _, _ = split_fastq_records(carry + splitter.finish())
+    stats.add(headers, sequences, qualities, 0, UNIT_RECORDS)
+    return True
+
+
+def _sample_fastq(source: GenomicByteSource, stats: FastqAccumulator, deadline: Optional[float],
+                  sample_size: int, rng: random.Random) -> int:
+    """Read random windows until ``sample_size`` records or the deadline."""
+    windows = 0
+    for offset in _window_offsets(source.size, rng):
+        data, span = source.read_window(offset)
+        lines = _window_lines(data, offset == 0)
+        headers, sequences, qualities, first, used = split_fastq_records(lines)
+        if sequences:
+            # Scale the on-disk span to the records actually parsed
+            parsed = sum(map(len, lines[first:used])) + used - first
+            stats.add(headers, sequences, qualities, span * parsed / max(len(data), 1))
+        windows += 1
+        if stats.records >= sample_size or (deadline is not None and time.monotonic() > deadline):
+            break
+        if windows >= SAMPLE_STRATA * 64:
+            break
+    return windows
+
+
+def analyze_fastq(filepath: str, mode: str = "auto", sample_size: int = DEFAULT_SAMPLE_SIZE,
+                  time_budget_seconds: Optional[float] = None, workers: Optional[int] = None,
+                  seed: Optional[int] = None, phred_offset: int = PHRED_OFFSET) -> Optional[Dict[str, Any]]:
+    """
+    FASTQ statistics in constant memory.
+
+    Args:
+        filepath: FASTQ file, optionally gzip or BGZF compressed
+        mode: "full" scans every record, "sample" estimates from a random
+            sample of about ``sample_size`` records, "auto" samples files
+            above AUTO_SAMPLE_BYTES
+        sample_size: records sampled (and the per-read reservoir size)
+        time_budget_seconds: stop reading after this long; a cut-short
+            scan reports estimates extrapolated from what was read
+        workers: threads for BGZF decompression
+        seed: seed for window placement and the reservoir
+        phred_offset: quality encoding offset (33 for Sanger/Illumina 1.8+)
+
+    Returns:
+        Statistics dict, or None when NumPy is unavailable
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    started = time.monotonic()
+    deadline = started + time_budget_seconds if time_budget_seconds else None
+    source = GenomicByteSource(filepath, workers)
+    mode = _resolve_mode(mode, source)
+    stats = FastqAccumulator(sample_size, seed, phred_offset)
+    index_path = _fresh_index(filepath, (".fai",))
+    index = read_fai(index_path) if index_path else None
+
+    windows = 0
+    if mode == "sample" and source.random_access:
+        windows = _sample_fastq(source, stats, deadline, sample_size, random.Random(seed))
+        scope = "sample"
+    else:
+        limit = sample_size if mode == "sample" else None
+        complete = _stream_fastq(source, stats, deadline, limit)
+        scope = "full" if complete else "prefix"
+
+    result: Dict[str, Any] = {
+        "format": "fastq",
+        "compression": source.compression,
+        "statistics_mode": scope,
+        "estimated": scope != "full",
+    }
+    intervals: Dict[str, Optional[List[float]]] = {}
+    gc, gc_hw = stats.ratios["gc"].estimate()
+    n_ratio, n_hw = stats.ratios["n"].estimate()
+    quality, quality_hw = stats.ratios["quality"].estimate()
+    length, length_hw = stats.ratios["length"].estimate()
+
+    if index is not None:
+        result["record_count"] = index["record_count"]
+        result["total_bases"] = index["total_length"]
+        result["index"] = {"type": "fai", "path": index_path}
+    elif scope == "full":
+        result["record_count"] = stats.records
+        result["total_bases"] = stats.bases
+    else:
+        records_per_byte, records_hw = stats.ratios["records"].estimate()
+        bases_per_byte, bases_hw = stats.ratios["bases"].estimate()
+        result["record_count"] = int(round(records_per_byte * source.size)) if records_per_byte is not None else None
+        result["total_bases"] = int(round(bases_per_byte * source.size)) if bases_per_byte is not None else None
+        intervals["record_count"] = _interval(records_per_byte, records_hw, source.size, 0)
+        intervals["total_bases"] = _interval(bases_per_byte, bases_hw, source.size, 0)
+
+    result["avg_gc_content"] = round(gc * 100, 2) if gc is not None else None
+    result["avg_quality_score"] = round(quality, 2) if quality else None
+    result["n_content"] = round(n_ratio * 100, 4) if n_ratio is not None else None
+    result["mean_read_length"] = round(length, 2) if length is not None else None
+    result["min_read_length"] = stats.min_length
+    result["max_read_length"] = stats.max_length
+    if scope != "full":
+        intervals["avg_gc_content"] = _interval(gc, gc_hw, 100)
+        intervals["avg_quality_score"] = _interval(quality, quality_hw)
+        intervals["n_content"] = _interval(n_ratio, n_hw, 100, 4)
+        intervals["mean_read_length"] = _interval(length, length_hw)
+        result["confidence_intervals"] = intervals
+        result["sampling"] = {
+            "sampled_records": stats.records,
+            "sampled_bases": stats.bases,
+            "windows": windows or None,
+            "confidence_level": 0.95,
+        }
+
+    sample = stats.reservoir.sample()
+    result["read_length_histogram"] = _length_histogram(stats.length_counts)
+    result["gc_content_histogram"] = _nonzero_histogram(stats.gc_histogram)
+    result["base_quality_histogram"] = _nonzero_histogram(stats.base_quality_histogram)
+    result["read_quality_histogram"] = _nonzero_histogram(stats.read_quality_histogram)
+    result["read_percentiles"] = {
+        "length": _percentiles(sample[:, 0]),
+        "gc_content": _percentiles(sample[:, 1]),
+        "quality_mean": _percentiles(sample[:, 2]),
+        "reservoir_size": int(stats.reservoir.filled),
+    }
+    result["records_sample"] = stats.preview
+    result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# FASTA
+# ---------------------------------------------------------------------------
+
+class FastaAccumulator:
+    """Per-record and total base composition over streamed FASTA lines."""
+
+    def __init__(self):
+        self.record_count = 0
+        self.total_length = 0
+        self.gc_bases = 0
+        self.n_bases = 0
+        self.records: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        self.ratios = {name: RatioMoments() for name in ("gc", "n", "records", "bases")}
+
+    def add_lines(self, lines: List[bytes], span: float = 0.0, in_record: bool = False) -> None:
+        """Add complete lines; ``in_record`` counts leading sequence lines
+        even when no header has been seen (sampling windows)."""
+        unit = [0, 0, 0, 0]  # headers, bases, gc, n
+        segment: List[bytes] = []
+        for line in lines:
+            if line[:1] == b">":
+                self._flush(segment, unit, in_record)
+                segment = []
+                self._finish_record()
+                self._current = {"id": line[1:].split(maxsplit=1)[0].decode("utf-8", "replace") if line[1:].strip() else "",
+                                 "length": 0, "gc": 0}
+                unit[0] += 1
+            elif line:
+                segment.append(line)
+        self._flush(segment, unit, in_record)
+        self.ratios["gc"].add(unit[2], unit[1])
+        self.ratios["n"].add(unit[3], unit[1])
+        self.ratios["records"].add(unit[0], span)
+        self.ratios["bases"].add(unit[1], span)
+
+    def _flush(self, segment: List[bytes], unit: List[int], in_record: bool) -> None:
+        if not segment or (self._current is None and not in_record):
+            return
+        counts = np.bincount(np.frombuffer(b"".join(segment), dtype=np.uint8), minlength=256)
+        length = int(counts.sum() - counts[ord(" ")] - counts[ord("\t")])
+        gc = int(counts[list(b"GCSgcs")].sum())
+        n = int(counts[ord("N")] + counts[ord("n")])
+        self.total_length += length
+        self.gc_bases += gc
+        self.n_bases += n
+        unit[1] += length
+        unit[2] += gc
+        unit[3] += n
+        if self._current is not None:
+            self._current["length"] += length
+            self._current["gc"] += gc
+
+    def _finish_record(self) -> None:
+        current = self._current
+        if current is None:
+            return
+        self.record_count += 1
+        if len(self.records) < FASTA_RECORD_PREVIEW:
+            self.records.append({
+                "id": current["id"],
+                "length": current["length"],
+                "gc_content": round(current["gc"] / current["length"] * 100, 2) if current["length"] else None,
+            })
+        self._current = None
+
+    def finish(self) -> None:
+        self._finish_record()
+
+
+def analyze_fasta(filepath: str, mode: str = "auto", sample_size: int = DEFAULT_SAMPLE_SIZE,
+                  time_budget_seconds: Optional[float] = None, workers: Optional[int] = None,
+                  seed: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    FASTA statistics in constant memory.
+
+    Record names and lengths come from a .fai index when present. Sample
+    mode reads ``sample_size // 100`` random windows (at least
+    SAMPLE_STRATA), stopping early at the deadline.
+
+    Returns:
+        Statistics dict, or None when NumPy is unavailable
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    started = time.monotonic()
+    deadline = started + time_budget_seconds if time_budget_seconds else None
+    source = GenomicByteSource(filepath, workers)
+    mode = _resolve_mode(mode, source)
+    stats = FastaAccumulator()
+    index_path = _fresh_index(filepath, (".fai",))
+    index = read_fai(index_path) if index_path else None
+
+    windows = 0
+    if mode == "sample" and source.random_access:
+        rng = random.Random(seed)
+        window_target = max(SAMPLE_STRATA, sample_size // 100)
+        for offset in _window_offsets(source.size, rng):
+            data, span = source.read_window(offset)
+            lines = _window_lines(data, offset == 0)
+            stats.add_lines(lines, span * (sum(map(len, lines)) + len(lines)) / max(len(data), 1), in_record=True)
+            stats.finish()
+            windows += 1
+            if windows >= window_target or (deadline is not None and time.monotonic() > deadline):
+                break
+        scope = "sample"
+    else:
+        splitter = _LineSplitter()
+        previous_offset = 0
+        scope = "full"
+        for data, offset in source.chunks():
+            stats.add_lines(splitter.feed(data), offset - previous_offset)
+            previous_offset = offset
+            if deadline is not None and time.monotonic() > deadline:
+                scope = "prefix"
+                break
+        if scope == "full":
+            stats.add_lines(splitter.finish())
+        stats.finish()
+
+    gc, gc_hw = stats.ratios["gc"].estimate()
+    n_ratio, n_hw = stats.ratios["n"].estimate()
+    result: Dict[str, Any] = {
+        "format": "fasta",
+        "compression": source.compression,
+        "statistics_mode": scope,
+        "estimated": scope != "full",
+        "total_gc_content": round(gc * 100, 2) if gc is not None else None,
+        "n_content": round(n_ratio * 100, 4) if n_ratio is not None else None,
+    }
+    if index is not None:
+        result["record_count"] = index["record_count"]
+        result["total_length"] = index["total_length"]
+        result["records"] = index["records"]
+        result["index"] = {"type": "fai", "path": index_path}
+    elif scope == "full":
+        result["record_count"] = stats.record_count
+        result["total_length"] = stats.total_length
+        result["records"] = stats.records
+    else:
+        records_per_byte, records_hw = stats.ratios["records"].estimate()
+        bases_per_byte, bases_hw = stats.ratios["bases"].estimate()
+        result["record_count"] = int(round(records_per_byte * source.size)) if records_per_byte is not None else None
+        result["total_length"] = int(round(bases_per_byte * source.size)) if bases_per_byte is not None else None
+        result["records"] = stats.records if scope == "prefix" else []
+        result["confidence_intervals"] = {
+            "record_count": _interval(records_per_byte, records_hw, source.size, 0),
+            "total_length": _interval(bases_per_byte, bases_hw, source.size, 0),
+        }
+    if scope != "full":
+        result.setdefault("confidence_intervals", {})
+        result["confidence_intervals"]["total_gc_content"] = _interval(gc, gc_hw, 100)
+        result["confidence_intervals"]["n_content"] = _interval(n_ratio, n_hw, 100, 4)
+        result["sampling"] = {
+            "sampled_bases": stats.total_length,
+            "windows": windows or None,
+            "confidence_level": 0.95,
+        }
+    result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# VCF / BAM
+# ---------------------------------------------------------------------------
+
+def count_vcf_records(filepath: str, mode: str = "auto", time_budget_seconds: Optional[float] = None,
+                      workers: Optional[int] = None, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Count VCF data lines, from the .tbi index when present.
+
+    Without an index the file is streamed counting newlines per chunk; in
+    sample mode (or when the budget runs out) the count is extrapolated
+    from data lines per on-disk byte.
+    """
+    index_path = _fresh_index(filepath, (".tbi",))
+    if index_path:
+        index = read_tabix_index(index_path)
+        if index is not None:
+            return {
+                "record_count": index["record_count"],
+                "estimated": False,
+                "records_per_contig": {reference["name"]: reference["mapped"] for reference in index["references"]},
+                "index": {"type": "tbi", "path": index_path},
+            }
+
+    started = time.monotonic()
+    deadline = started + time_budget_seconds if time_budget_seconds else None
+    source = GenomicByteSource(filepath, workers)
+    mode = _resolve_mode(mode, source)
+    lines_per_byte = RatioMoments()
+
+    if mode == "sample" and source.random_access:
+        rng = random.Random(seed)
+        for windows, offset in enumerate(_window_offsets(source.size, rng), start=1):
+            data, span = source.read_window(offset)
+            lines = _window_lines(data, offset == 0)
+            data_lines = sum(1 for line in lines if line and line[:1] != b"#")
+            lines_per_byte.add(data_lines, span * (sum(map(len, lines)) + len(lines)) / max(len(data), 1))
+            if windows >= SAMPLE_STRATA or (deadline is not None and time.monotonic() > deadline):
+                break
+        scope = "sample"
+    else:
+        scope = "full"
+        records = 0
+        previous_offset = 0
+        at_line_start = True
+        for data, offset in source.chunks():
+            # Header lines start with "#"; count newlines, minus header lines
+            newline_count = data.count(b"\n")
+            header_lines = data.count(b"\n#") + (1 if at_line_start and data[:1] == b"#" else 0)
+            unit = newline_count - header_lines
+            records += unit
+            lines_per_byte.add(unit, offset - previous_offset)
+            previous_offset = offset
+            at_line_start = data.endswith(b"\n")
+            if deadline is not None and time.monotonic() > deadline:
+                scope = "prefix"
+                break
+        if scope == "full":
+            if not at_line_start:
+                records += 1  # last line without a trailing newline
+            return {"record_count": max(records, 0), "estimated": False}
+
+    ratio, half_width = lines_per_byte.estimate()
+    return {
+        "record_count": int(round(ratio * source.size)) if ratio is not None else None,
+        "estimated": True,
+        "statistics_mode": scope,
+        "confidence_interval": _interval(ratio, half_width, source.size, 0),
+    }
+
+
+def analyze_bam(filepath: str) -> Dict[str, Any]:
+    """BAM header summary plus read counts from a .bai index when present."""
+    result: Dict[str, Any] = {"format": "bam"}
+    header = read_bam_header(filepath)
+    if header is None:
+        result["error"] = "Unreadable BAM header"
+        return result
+
+    header_lines = header["text"].splitlines()
+    for line in header_lines:
+        if line.startswith("@HD"):
+            tags = dict(field.split(":", 1) for field in line.split("\t")[1:] if ":" in field)
+            result["format_version"] = tags.get("VN")
+            result["sort_order"] = tags.get("SO")
+    result["read_group_count"] = sum(1 for line in header_lines if line.startswith("@RG"))
+    result["programs"] = [
+        dict(field.split(":", 1) for field in line.split("\t")[1:] if ":" in field).get("PN")
+        for line in header_lines if line.startswith("@PG")
+    ]
+    result["reference_count"] = len(header["references"])
+    result["reference_total_length"] = sum(reference["length"] for reference in header["references"])
+
+    index_path = _fresh_index(filepath, (".bai",))
+    index = read_bai_index(index_path) if index_path else None
+    if index is not None:
+        result["record_count"] = index["record_count"]
+        result["mapped_reads"] = index["mapped"]
+        result["unmapped_reads"] = index["unmapped"]
+        result["reads_per_reference"] = {
+            reference["name"]: counts["mapped"]
+            for reference, counts in zip(header["references"], index["references"])
+            if counts["mapped"]
+        }
+        result["index"] = {"type": "bai", "path": index_path}
+    else:
+        result["record_count"] = None
+    return result
@@ -4,6 +4,7 @@ Uses OpenStreetMap Nominatim API (free, requires attribution)
 """
 
 import json
+import logging
 import time
 from typing import Dict, Any, Optional
 from datetime import timedelta
@@ -16,31 +17,44 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+# Most recently used coordinates kept in memory and on disk
+MAX_CACHED_LOCATIONS = 10000
+
 
 class GeocodeCache:
-    """Simple file-based cache for geocoding results."""
+    """Simple file-based LRU cache for geocoding results."""
     
-    def __init__(self, cache_dir: str = "/tmp/metaextract_geocache"):
+    def __init__(self, cache_dir: str = "/tmp/metaextract_geocache",
+                 max_entries: int = MAX_CACHED_LOCATIONS):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "geocode_cache.json"
+        self.max_entries = max_entries
         self._load_cache()
     
     def _load_cache(self):
-        """Load cache from disk."""
-        self._cache = {}
+        """Load cache from disk (saved least recently used first)."""
+        self._cache = BoundedCache("geocode_results", max_entries=self.max_entries)
         if self.cache_file.exists():
             try:
                 with open(self.cache_file, 'r') as f:
-                    self._cache = json.load(f)
+                    for key, data in json.load(f).items():
+                        self._cache.put(key, data)
             except Exception as e:
-                self._cache = {}
+                self._cache.clear()
     
     def _save_cache(self):
         """Save cache to disk."""
         try:
             with open(self.cache_file, 'w') as f:
-                json.dump(self._cache, f)
+                json.dump(dict(self._cache.items()), f)
         except Exception as e:
             logger.debug(f"Failed to perform location lookup: {e}")
     
@@ -52,7 +66,7 @@ class GeocodeCache:
     def set(self, lat: float, lon: float, data: Dict[str, Any]):
         """Cache result."""
         key = f"{lat:.6f},{lon:.6f}"
-        self._cache[key] = data
+        self._cache.put(key, data)
         self._save_cache()
 
 
@@ -16,6 +16,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 
+from .vector_gis_stream import GridSpec, scan_geojson, scan_kml, scan_kmz, scan_shapefile
+
 logger = logging.getLogger(__name__)
 
 FIONA_AVAILABLE = True
@@ -37,6 +39,9 @@ except ImportError:
 class GeoJSONExtractor:
     """Extract metadata from GeoJSON files."""
 
+    def __init__(self, grid: GridSpec = None):
+        self.grid = grid
+
     def extract(self, filepath: str) -> Dict[str, Any]:
         result = {
             "source": "metaextract_geojson_extractor",
@@ -51,51 +56,27 @@ class GeoJSONExtractor:
             return result
 
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            scan = scan_geojson(filepath, grid=self.grid)
+            stats = scan["stats"]
 
             result["format_detected"] = "geojson"
 
             metadata = {
-                "type": data.get("type"),
-                "crs": data.get("crs"),
-                "total_features": 0,
-                "geometry_types": set(),
-                "bbox": None,
-                "properties_fields": set(),
+                "type": scan["type"],
+                "crs": scan["crs"],
+                "total_features": stats["feature_count"],
+                "geometry_types": list(stats["geometry_types"]),
+                "geometry_type_counts": stats["geometry_types"],
+                "bbox": scan["declared_bbox"] or stats["bbox"],
+                "computed_bbox": stats["bbox"],
+                "properties_fields": stats["property_fields"],
+                "vertex_count": stats["vertex_count"],
+                "vertices_by_type": stats["vertices_by_type"],
+                "max_feature_vertices": stats["max_feature_vertices"],
+                "null_geometries": stats["null_geometries"],
             }
-
-            features = data.get("features", [])
-            if not features and data.get("type") == "Feature":
-                features = [data]
-
-            metadata["total_features"] = len(features)
-
-            for feature in features[:100]:
-                geom = feature.get("geometry", {})
-                geom_type = geom.get("type")
-                if geom_type:
-                    metadata["geometry_types"].add(geom_type)
-
-                props = feature.get("properties", {})
-                if props:
-                    metadata["properties_fields"].update(props.keys())
-
-            if metadata["geometry_types"]:
-                metadata["geometry_types"] = list(metadata["geometry_types"])
-
-            if "bbox" in data:
-                metadata["bbox"] = data["bbox"]
-            else:
-                coords = []
-                for feature in features:
-                    geom = feature.get("geometry", {})
-                    if geom.get("type") == "Point":
-                        coords.append(geom.get("coordinates", []))
-                    elif geom.get("type") in ["LineString", "Polygon"]:
-                        coords.extend(self._extract_coords(geom.get("coordinates", [])))
-                if coords:
-                    metadata["bbox"] = self._calc_bbox(coords)
+            if "grid" in stats:
+                metadata["grid"] = stats["grid"]
 
             result["geojson_metadata"] = metadata
             result["extraction_success"] = True
@@ -107,31 +88,13 @@ class GeoJSONExtractor:
 
         return result
 
-    def _extract_coords(self, coords: List) -> List:
-        """Recursively extract coordinates from geometry."""
-        result = []
-        if not coords:
-            return result
-        if isinstance(coords[0], (int, float)):
-            return [coords]
-        for item in coords:
-            result.extend(self._extract_coords(item))
-        return result
-
-    def _calc_bbox(self, coords: List) -> Optional[List]:
-        """Calculate bounding box from coordinates."""
-        if not coords:
-            return None
-        lons = [c[0] for c in coords if len(c) >= 1]
-        lats = [c[1] for c in coords if len(c) >= 2]
-        if not lons or not lats:
-            return None
-        return [min(lons), min(lats), max(lons), max(lats)]
-
 
 class ShapefileExtractor:
     """Extract metadata from ESRI Shapefile files."""
 
+    def __init__(self, grid: GridSpec = None):
+        self.grid = grid
+
     def detect_shapefile(self, filepath: str) -> bool:
         """Check if file is a valid shapefile."""
         if filepath.endswith('.shp'):
@@ -181,10 +144,8 @@ class ShapefileExtractor:
                     "encoding": src.encoding,
                 }
 
-                geom_types = set()
-                for feature in src:
-                    geom_types.add(feature["geometry"]["type"])
-                metadata["geometry_types"] = list(geom_types)
+                # Shapefiles hold a single geometry type; no need to walk features
+                metadata["geometry_types"] = [src.schema.get("geometry")] if src.schema else []
 
                 return metadata
         except Exception as e:
@@ -192,31 +153,21 @@ class ShapefileExtractor:
             return self._extract_basic(filepath)
 
     def _extract_basic(self, filepath: str) -> Dict[str, Any]:
-        """Basic shapefile extraction without fiona."""
+        """Shapefile extraction from the .shp/.shx/.dbf headers (no fiona)."""
         result = {
             "format": "shapefile",
             "basic_info": {},
         }
 
         try:
-            if filepath.endswith('.zip'):
-                with zipfile.ZipFile(filepath, 'r') as z:
-                    names = z.namelist()
-                    shp_files = [n for n in names if n.endswith('.shp')]
-                    if shp_files:
-                        result["shp_in_zip"] = shp_files[0]
-                    dbf_files = [n for n in names if n.endswith('.dbf')]
-                    if dbf_files:
-                        result["dbf_in_zip"] = dbf_files[0]
-            else:
-                base = filepath.replace('.shp', '')
-                for ext in ['.shp', '.shx', '.dbf', '.prj']:
-                    path = base + ext
-                    if os.path.exists(path):
-                        result[f"{ext[1:]}_exists"] = True
-                        result[f"{ext[1:]}_size"] = os.path.getsize(path)
+            result.update(scan_shapefile(filepath, grid=self.grid))
+            if "error" in result:
+                return result
+            for ext, size in result.get("components", {}).items():
+                result[f"{ext}_exists"] = True
+                result[f"{ext}_size"] = size
 
-            result["basic_info"] = {"extracted": "basic metadata only (install fiona for full extraction)"}
+            result["basic_info"] = {"extracted": "header metadata only (install fiona for full extraction)"}
 
         except Exception as e:
             return {"error": str(e)}
@@ -227,6 +178,9 @@ class ShapefileExtractor:
 class KMLExtractor:
     """Extract metadata from KML/KMZ files."""
 
+    def __init__(self, grid: GridSpec = None):
+        self.grid = grid
+
     def detect_kml(self, filepath: str) -> bool:
         """Check if file is a valid KML file."""
         if filepath.endswith('.kml') or filepath.endswith('.kmz'):
@@ -272,50 +226,13 @@ class KMLExtractor:
     def _extract_kml(self, filepath: str) -> Dict[str, Any]:
         """Extract KML metadata."""
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
+            scan = scan_kml(filepath, grid=self.grid)
 
             metadata = {
                 "format": "kml",
                 "file_size": os.path.getsize(filepath),
             }
-
-            import re
-            name_match = re.search(r'<name><!\[CDATA\[(.*?)\]\]></name>', content, re.DOTALL)
-            if not name_match:
-                name_match = re.search(r'<name>(.*?)</name>', content)
-            metadata["name"] = name_match.group(1).strip() if name_match else None
-
-            desc_match = re.search(r'<description><!\[CDATA\[(.*?)\]\]></description>', content, re.DOTALL)
-            if not desc_match:
-                desc_match = re.search(r'<description>(.*?)</description>', content)
-            metadata["description"] = desc_match.group(1).strip()[:500] if desc_match else None
-
-            folders = content.count('<Folder>')
-            placemarks = content.count('<Placemark>')
-            metadata["folder_count"] = folders
-            metadata["placemark_count"] = placemarks
-
-            coordinates = re.findall(r'<coordinates>(.*?)</coordinates>', content, re.DOTALL)
-            if coordinates:
-                coords = []
-                for coord_str in coordinates[:100]:
-                    for coord in coord_str.strip().split():
-                        parts = coord.split(',')
-                        if len(parts) >= 2:
-                            try:
-                                coords.append((float(parts[0]), float(parts[1])))
-                            except:
-                                pass
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    metadata["bounds"] = [min(lons), min(lats), max(lons), max(lats)]
-                    metadata["point_count"] = len(coords)
-
-            styles = len(re.findall(r'<Style>', content))
-            metadata["style_count"] = styles
-
+            metadata.update(self._summarize(scan))
             return metadata
 
         except Exception as e:
@@ -324,25 +241,45 @@ class KMLExtractor:
     def _extract_kmz(self, filepath: str) -> Dict[str, Any]:
         """Extract KMZ (zipped KML) metadata."""
         try:
-            with zipfile.ZipFile(filepath, 'r') as z:
-                kml_files = [n for n in z.namelist() if n.lower().endswith('.kml')]
-
-                metadata = {
-                    "format": "kmz",
-                    "zip_contents": z.namelist()[:20],
-                    "kml_files": kml_files,
-                }
+            scan = scan_kmz(filepath, grid=self.grid)
 
-                if kml_files:
-                    kml_content = z.read(kml_files[0]).decode('utf-8', errors='replace')
-                    metadata["kml_size"] = len(kml_content)
-                    metadata["has_kml"] = len(kml_content) > 0
+            metadata = {
+                "format": "kmz",
+                "zip_contents": scan["zip_contents"],
+                "kml_files": scan["kml_files"],
+            }
+            if "kml_size" in scan:
+                metadata["kml_size"] = scan["kml_size"]
+                metadata["has_kml"] = scan["kml_size"] > 0
+                metadata.update(self._summarize(scan))
 
-                return metadata
+            return metadata
 
         except Exception as e:
             return {"error": str(e)}
 
+    def _summarize(self, scan: Dict[str, Any]) -> Dict[str, Any]:
+        stats = scan["stats"]
+        counts = scan["counts"]
+        metadata = {
+            "kml_version": scan["version"],
+            "name": scan["name"],
+            "description": scan["description"],
+            "folder_count": counts["Folder"],
+            "placemark_count": counts["Placemark"],
+            "style_count": counts["Style"] + counts["StyleMap"],
+            "overlay_count": counts["GroundOverlay"] + counts["ScreenOverlay"] + counts["PhotoOverlay"],
+            "network_link_count": counts["NetworkLink"],
+            "geometry_types": stats["geometry_types"],
+            "vertices_by_type": stats["vertices_by_type"],
+        }
+        if stats["bbox"]:
+            metadata["bounds"] = stats["bbox"]
+            metadata["point_count"] = stats["vertex_count"]
+        if "grid" in stats:
+            metadata["grid"] = stats["grid"]
+        return metadata
+
 
 class GeoTIFFExtractor:
     """Extract metadata from GeoTIFF files."""
@@ -461,10 +398,10 @@ class GeoTIFFExtractor:
 class GeospatialExtractor:
     """Main geospatial extractor that dispatches to specific format extractors."""
 
-    def __init__(self):
-        self.geojson = GeoJSONExtractor()
-        self.shapefile = ShapefileExtractor()
-        self.kml = KMLExtractor()
+    def __init__(self, grid: GridSpec = None):
+        self.geojson = GeoJSONExtractor(grid=grid)
+        self.shapefile = ShapefileExtractor(grid=grid)
+        self.kml = KMLExtractor(grid=grid)
         self.geotiff = GeoTIFFExtractor()
 
     def extract(self, filepath: str) -> Dict[str, Any]:
@@ -496,9 +433,12 @@ class GeospatialExtractor:
         }
 
 
-def extract_geospatial_metadata(filepath: str) -> Dict[str, Any]:
-    """Convenience function to extract geospatial metadata."""
-    extractor = GeospatialExtractor()
+def extract_geospatial_metadata(filepath: str, grid: GridSpec = None) -> Dict[str, Any]:
+    """Convenience function to extract geospatial metadata.
+
+    grid: optional (cols, rows) lon/lat vertex-density summary grid.
+    """
+    extractor = GeospatialExtractor(grid=grid)
     return extractor.extract(filepath)
 
 
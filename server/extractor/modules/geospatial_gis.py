@@ -18,12 +18,13 @@ Covers:
 """
 
 import struct
-import json
 import logging
 import re
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .vector_gis_stream import scan_geojson, scan_kml, scan_kmz
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -205,51 +206,44 @@ def _extract_shapefile_metadata(filepath: str) -> Dict[str, Any]:
 
 
 def _extract_geojson_metadata(filepath: str) -> Dict[str, Any]:
-    """Extract GeoJSON metadata."""
+    """Extract GeoJSON metadata (single streaming pass over every feature)."""
     geojson_data = {'geospatial_geojson_format': True}
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read(100000)  # Read up to 100KB
-
-        data = json.loads(content)
+        scan = scan_geojson(filepath)
+        stats = scan['stats']
 
         # Check GeoJSON type
-        if 'type' in data:
-            geojson_data['geospatial_geojson_type'] = data['type']
+        if scan['type']:
+            geojson_data['geospatial_geojson_type'] = scan['type']
 
         # Count features if FeatureCollection
-        if data.get('type') == 'FeatureCollection' and 'features' in data:
-            geojson_data['geospatial_geojson_feature_count'] = len(data['features'])
+        if scan['type'] == 'FeatureCollection':
+            geojson_data['geospatial_geojson_feature_count'] = stats['feature_count']
 
         # Extract CRS if present
-        if 'crs' in data:
+        if scan['crs'] is not None:
             geojson_data['geospatial_geojson_has_crs'] = True
 
         # Check for bbox
-        if 'bbox' in data:
+        bbox = scan['declared_bbox']
+        if bbox:
             geojson_data['geospatial_geojson_has_bbox'] = True
-            bbox = data['bbox']
-            if len(bbox) >= 4:
-                geojson_data['geospatial_geojson_bbox'] = {
-                    'west': bbox[0], 'south': bbox[1],
-                    'east': bbox[2], 'north': bbox[3]
-                }
-
-        # Extract geometry types if FeatureCollection
-        if data.get('type') == 'FeatureCollection' and 'features' in data:
-            geom_types = set()
-            for feature in data['features'][:1000]:  # Check first 1000
-                if 'geometry' in feature and feature['geometry']:
-                    geom_types.add(feature['geometry'].get('type'))
-            if geom_types:
-                geojson_data['geospatial_geojson_geometry_types'] = list(geom_types)
-
-        # Check for properties
-        if data.get('type') == 'FeatureCollection' and 'features' in data:
-            if len(data['features']) > 0 and 'properties' in data['features'][0]:
-                props = data['features'][0]['properties']
-                geojson_data['geospatial_geojson_property_count'] = len(props) if props else 0
+        else:
+            bbox = stats['bbox']
+        if bbox and len(bbox) >= 4:
+            geojson_data['geospatial_geojson_bbox'] = {
+                'west': bbox[0], 'south': bbox[1],
+                'east': bbox[2], 'north': bbox[3]
+            }
+
+        if stats['geometry_types']:
+            geojson_data['geospatial_geojson_geometry_types'] = list(stats['geometry_types'])
+            geojson_data['geospatial_geojson_geometry_type_counts'] = stats['geometry_types']
+        geojson_data['geospatial_geojson_vertex_count'] = stats['vertex_count']
+
+        if stats['property_fields']:
+            geojson_data['geospatial_geojson_property_count'] = len(stats['property_fields'])
 
     except Exception as e:
         geojson_data['geospatial_geojson_extraction_error'] = str(e)
@@ -258,56 +252,49 @@ def _extract_geojson_metadata(filepath: str) -> Dict[str, Any]:
 
 
 def _extract_kml_metadata(filepath: str) -> Dict[str, Any]:
-    """Extract KML metadata."""
+    """Extract KML/KMZ metadata."""
     kml_data = {'geospatial_kml_format': True}
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read(100000)
-
-        content_lower = content.lower()
+        if filepath.lower().endswith('.kmz'):
+            scan = scan_kmz(filepath)
+            if 'stats' not in scan:
+                return kml_data
+        else:
+            scan = scan_kml(filepath)
+        counts = scan['counts']
+        stats = scan['stats']
 
         # Check KML version
-        if '<kml version="1.0">' in content_lower:
-            kml_data['geospatial_kml_version'] = '1.0'
-        elif '<kml version="2.0">' in content_lower:
-            kml_data['geospatial_kml_version'] = '2.0'
-        elif '<kml version="2.1">' in content_lower:
-            kml_data['geospatial_kml_version'] = '2.1'
-        elif '<kml version="2.2">' in content_lower:
-            kml_data['geospatial_kml_version'] = '2.2'
+        if scan['version'] in ('1.0', '2.0', '2.1', '2.2'):
+            kml_data['geospatial_kml_version'] = scan['version']
 
         # Count placemarks
-        placemark_count = content.count('<Placemark>')
-        if placemark_count > 0:
-            kml_data['geospatial_kml_placemark_count'] = placemark_count
+        if counts['Placemark'] > 0:
+            kml_data['geospatial_kml_placemark_count'] = counts['Placemark']
 
         # Check for folders
-        if '<Folder>' in content:
+        if counts['Folder']:
             kml_data['geospatial_kml_has_folders'] = True
-            folder_count = content.count('<Folder>')
-            kml_data['geospatial_kml_folder_count'] = folder_count
+            kml_data['geospatial_kml_folder_count'] = counts['Folder']
 
         # Check for geometry types
-        geom_types = []
-        if '<Point>' in content:
-            geom_types.append('Point')
-        if '<LineString>' in content:
-            geom_types.append('LineString')
-        if '<Polygon>' in content:
-            geom_types.append('Polygon')
-        if '<MultiGeometry>' in content:
-            geom_types.append('MultiGeometry')
-
-        if geom_types:
-            kml_data['geospatial_kml_geometry_types'] = geom_types
+        if stats['geometry_types']:
+            kml_data['geospatial_kml_geometry_types'] = list(stats['geometry_types'])
+
+        if stats['bbox']:
+            west, south, east, north = stats['bbox']
+            kml_data['geospatial_kml_bbox'] = {
+                'west': west, 'south': south, 'east': east, 'north': north
+            }
+            kml_data['geospatial_kml_vertex_count'] = stats['vertex_count']
 
         # Check for styling
-        if '<Style>' in content or '<StyleMap>' in content:
+        if counts['Style'] or counts['StyleMap']:
             kml_data['geospatial_kml_has_styling'] = True
 
         # Check for images/overlays
-        if '<GroundOverlay>' in content:
+        if counts['GroundOverlay']:
             kml_data['geospatial_kml_has_ground_overlay'] = True
 
     except Exception as e:
@@ -5,11 +5,18 @@ Extracts comprehensive metadata from animated GIF and APNG files.
 """
 
 import logging
+import mmap
+import os
 import struct
 import zlib
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import get_segment_directory, map_file
+except ImportError:
+    from formats.segment_directory import get_segment_directory, map_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,13 +67,12 @@ class GIFExtractor:
             
             self.file_size = file_path.stat().st_size
             
-            with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+            self.file_data = map_file(self.filepath)
             
             if len(self.file_data) < 10:
                 return {"error": "File too small", "success": False}
             
-            signature = self.file_data[:6]
+            signature = bytes(self.file_data[:6])
             if signature not in (GIF89A_SIGNATURE, GIF87A_SIGNATURE):
                 return {"error": "Not a valid GIF file", "success": False}
             
@@ -82,6 +88,10 @@ class GIFExtractor:
         except Exception as e:
             logger.error(f"Error parsing GIF: {e}")
             return {"error": str(e), "success": False}
+        finally:
+            if isinstance(self.file_data, mmap.mmap):
+                self.file_data.close()
+                self.file_data = None
     
     def _parse_header(self):
         """Parse GIF header and logical screen descriptor"""
@@ -330,80 +340,52 @@ class APNGExtractor:
     
     def __init__(self, filepath: str):
         self.filepath = filepath
-        self.file_data: Optional[bytes] = None
         self.is_valid_apng = False
         self.png_info: Dict[str, Any] = {}
         
     def parse(self) -> Dict[str, Any]:
         """Parse APNG file"""
         try:
-            with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
-            
-            if len(self.file_data) < 8:
+            if os.path.getsize(self.filepath) < 8:
                 return {"error": "File too small", "success": False}
             
-            if self.file_data[:8] != b'\\x89PNG\\r\\n\\x1a\\n':
+            directory = get_segment_directory(self.filepath)
+            if directory is None or directory.container != "PNG":
                 return {"error": "Not a valid PNG file", "success": False}
             
-            return self._parse_chunks()
+            return self._parse_chunks(directory)
             
         except Exception as e:
             logger.error(f"Error parsing APNG: {e}")
             return {"error": str(e), "success": False}
     
-    def _parse_chunks(self) -> Dict[str, Any]:
-        """Parse PNG chunks"""
-        offset = 8
-        frame_count = 0
+    def _parse_chunks(self, directory) -> Dict[str, Any]:
+        """Parse the animation chunks; only their headers are read, not the frame data."""
         animation_data: Dict[str, Any] = {}
         
-        while offset < len(self.file_data):
-            if offset + 8 > len(self.file_data):
-                break
-            
-            length = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-            chunk_type = self.file_data[offset + 4:offset + 8]
-            offset += 8
-            
-            if chunk_type == b'acTL':
-                if length >= 8:
-                    frame_count = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-                    num_plays = struct.unpack('>I', self.file_data[offset + 4:offset + 8])[0]
-                    animation_data["frame_count"] = frame_count
-                    animation_data["num_plays"] = num_plays
-                    animation_data["is_animated"] = frame_count > 1
-            
-            elif chunk_type == b'fcTL':
-                if length >= 26:
-                    sequence = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-                    width = struct.unpack('>I', self.file_data[offset + 4:offset + 8])[0]
-                    height = struct.unpack('>I', self.file_data[offset + 8:offset + 12])[0]
-                    offset_x = struct.unpack('>H', self.file_data[offset + 12:offset + 14])[0]
-                    offset_y = struct.unpack('>H', self.file_data[offset + 14:offset + 16])[0]
-                    
-                    if 'frames' not in animation_data:
-                        animation_data["frames"] = []
-                    
-                    animation_data["frames"].append({
-                        "sequence": sequence,
-                        "width": width,
-                        "height": height,
-                        "offset_x": offset_x,
-                        "offset_y": offset_y
-                    })
-            
-            elif chunk_type == b'fdAT':
-                if length >= 4:
-                    sequence = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-                    if 'frame_delays' not in animation_data:
-                        animation_data["frame_delays"] = []
-                    animation_data["frame_delays"].append(sequence)
-            
-            offset += length
-            if offset + 4 > len(self.file_data):
-                break
-            offset += 4
+        actl = directory.find_all("acTL")
+        if actl and actl[0].length >= 8:
+            payload = directory.read(actl[0], max_bytes=8)
+            frame_count, num_plays = struct.unpack('>II', payload)
+            animation_data["frame_count"] = frame_count
+            animation_data["num_plays"] = num_plays
+            animation_data["is_animated"] = frame_count > 1
+        
+        fctl = [seg for seg in directory.find_all("fcTL") if seg.length >= 26]
+        for payload in directory.read_all(fctl, max_bytes=16):
+            sequence, width, height = struct.unpack('>III', payload[:12])
+            offset_x, offset_y = struct.unpack('>HH', payload[12:16])
+            animation_data.setdefault("frames", []).append({
+                "sequence": sequence,
+                "width": width,
+                "height": height,
+                "offset_x": offset_x,
+                "offset_y": offset_y
+            })
+        
+        fdat = [seg for seg in directory.find_all("fdAT") if seg.length >= 4]
+        for payload in directory.read_all(fdat, max_bytes=4):
+            animation_data.setdefault("frame_delays", []).append(struct.unpack('>I', payload)[0])
         
         animation_data["success"] = True
         return animation_data
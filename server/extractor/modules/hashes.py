@@ -2,8 +2,11 @@
 File Hashes helpers.
 """
 from typing import Dict, Any
-import hashlib
-import zlib
+
+try:
+    from ..utils.hashing import hash_file
+except ImportError:
+    from utils.hashing import hash_file
 
 try:
     from .perceptual_hashes import extract_perceptual_hashes as _extract_perceptual_hashes
@@ -14,20 +17,7 @@ except Exception:
 def extract_file_hashes(filepath: str) -> Dict[str, Any]:
     """Extract MD5, SHA256, SHA1, and CRC32 hashes."""
     try:
-        hashers = {
-            "md5": hashlib.md5(),
-            "sha256": hashlib.sha256(),
-            "sha1": hashlib.sha1(),
-        }
-        crc = 0
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(65536), b""):
-                for hasher in hashers.values():
-                    hasher.update(chunk)
-                crc = zlib.crc32(chunk, crc)
-        result = {name: hasher.hexdigest() for name, hasher in hashers.items()}
-        result["crc32"] = format(crc & 0xFFFFFFFF, "08x")
-        return result
+        return hash_file(filepath, ("md5", "sha256", "sha1", "crc32"))
     except Exception as e:
         return {"error": str(e)}
 
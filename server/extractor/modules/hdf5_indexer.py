@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+HDF5 / NetCDF-4 Structure Indexer
+
+Builds a compact, array-backed inventory of every link in an HDF5 file
+(NetCDF-4 files are HDF5 underneath):
+- Walks links with h5py's low-level H5Literate API (LinkProxy.iterate),
+  opening each object once through H5O; hard-linked objects are indexed
+  once and later links to them are recorded as aliases
+- Records path, kind, shape, dtype, layout, chunk shape, filter pipeline,
+  storage size and attribute count into typed `array` columns with
+  interned dtype/filter strings
+- Enforces an object and wall-time budget; an unfinished index keeps its
+  pending (group, link index) frontier and continues where it stopped
+- Attribute values are never read during the walk; attributes() reads one
+  object's attributes on demand
+- Indexes are cached per file (path, size, mtime) so repeated queries and
+  continuations do not re-walk the file
+
+Usage:
+    from .hdf5_indexer import get_hdf5_index
+    index = get_hdf5_index(path, max_objects=50000, time_budget=2.0)
+    index.summary()
+    index.find("/group/dataset")
+"""
+
+import logging
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
+
+try:
+    import h5py
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+KIND_GROUP = 0
+KIND_DATASET = 1
+KIND_DATATYPE = 2
+KIND_SOFT_LINK = 3
+KIND_EXTERNAL_LINK = 4
+KIND_HARD_LINK = 5
+KIND_NAMES = ("group", "dataset", "datatype", "soft_link", "external_link", "hard_link")
+
+LAYOUT_NAMES = {0: "compact", 1: "contiguous", 2: "chunked", 3: "virtual"}
+
+DEFAULT_MAX_OBJECTS = 100_000
+DEFAULT_TIME_BUDGET = 5.0
+MAX_CACHED_INDEXES = 16
+MAX_CACHED_INDEX_BYTES = 256 << 20
+
+
+def _filter_label(name: bytes, values: Tuple[int, ...]) -> str:
+    label = name.decode("latin-1", "replace") if isinstance(name, bytes) else str(name)
+    if label == "deflate":
+        label = "gzip"
+    if values and label in ("gzip", "szip"):
+        label = f"{label}({values[0]})"
+    return label
+
+
+class HDF5Index:
+    """Columnar inventory of one HDF5 file's links and objects."""
+
+    def __init__(self, filepath: str, file_size: int, mtime_ns: int):
+        self.filepath = filepath
+        self.file_size = file_size
+        self.mtime_ns = mtime_ns
+
+        self.paths: List[str] = []
+        self.kinds = array("b")
+        self.parents = array("l")
+        self.ndims = array("b")
+        self.shape_offsets = array("q")
+        self.chunk_offsets = array("q")
+        self.dtype_codes = array("H")
+        self.filter_codes = array("H")
+        self.layouts = array("b")
+        self.nbytes = array("q")
+        self.storage_bytes = array("q")
+        self.num_attrs = array("l")
+        self.shapes = array("q")
+        self.chunks = array("q")
+        self.link_targets: Dict[int, str] = {}
+
+        self._dtypes: List[str] = [""]
+        self._dtype_ids: Dict[str, int] = {"": 0}
+        self._filters: List[str] = [""]
+        self._filter_ids: Dict[str, int] = {"": 0}
+        self._path_rows: Optional[Dict[str, int]] = None
+        self._seen_objects: Dict[int, int] = {}
+
+        # Walk frontier: (group row, group path, next link index)
+        self.pending: Deque[Tuple[int, str, int]] = deque()
+        self.walk_seconds = 0.0
+        self.passes = 0
+        self.errors: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending
+
+    def is_current(self) -> bool:
+        try:
+            st = os.stat(self.filepath)
+        except OSError:
+            return False
+        return st.st_size == self.file_size and st.st_mtime_ns == self.mtime_ns
+
+    # -- construction -----------------------------------------------------
+
+    def _intern(self, value: str, table: List[str], ids: Dict[str, int]) -> int:
+        code = ids.get(value)
+        if code is None:
+            code = ids[value] = len(table)
+            table.append(value)
+        return code
+
+    def _append(self, path: str, kind: int, parent: int, shape: Tuple[int, ...] = (),
+                chunks: Optional[Tuple[int, ...]] = None, dtype: str = "", filters: str = "",
+                layout: int = -1, nbytes: int = 0, storage: int = 0, num_attrs: int = 0) -> int:
+        row = len(self.paths)
+        self.paths.append(path)
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.ndims.append(len(shape))
+        self.shape_offsets.append(len(self.shapes))
+        self.shapes.extend(shape)
+        if chunks:
+            self.chunk_offsets.append(len(self.chunks))
+            self.chunks.extend(chunks)
+        else:
+            self.chunk_offsets.append(-1)
+        self.dtype_codes.append(self._intern(dtype, self._dtypes, self._dtype_ids))
+        self.filter_codes.append(self._intern(filters, self._filters, self._filter_ids))
+        self.layouts.append(layout)
+        self.nbytes.append(nbytes)
+        self.storage_bytes.append(storage)
+        self.num_attrs.append(num_attrs)
+        if self._path_rows is not None:
+            self._path_rows[path] = row
+        return row
+
+    # -- queries ----------------------------------------------------------
+
+    def shape(self, row: int) -> Tuple[int, ...]:
+        start = self.shape_offsets[row]
+        return tuple(self.shapes[start:start + self.ndims[row]])
+
+    def chunk_shape(self, row: int) -> Optional[Tuple[int, ...]]:
+        start = self.chunk_offsets[row]
+        if start < 0:
+            return None
+        return tuple(self.chunks[start:start + self.ndims[row]])
+
+    def row(self, row: int) -> Dict[str, Any]:
+        kind = self.kinds[row]
+        info: Dict[str, Any] = {"path": self.paths[row], "kind": KIND_NAMES[kind]}
+        if kind == KIND_DATASET:
+            chunks = self.chunk_shape(row)
+            info.update({
+                "shape": list(self.shape(row)),
+                "dtype": self._dtypes[self.dtype_codes[row]],
+                "layout": LAYOUT_NAMES.get(self.layouts[row], "unknown"),
+                "chunks": list(chunks) if chunks else None,
+                "compression": self._filters[self.filter_codes[row]] or None,
+                "size_bytes": self.nbytes[row],
+                "storage_bytes": self.storage_bytes[row],
+            })
+        elif kind == KIND_DATATYPE:
+            info["dtype"] = self._dtypes[self.dtype_codes[row]]
+        if kind in (KIND_GROUP, KIND_DATASET, KIND_DATATYPE):
+            info["num_attributes"] = self.num_attrs[row]
+        if row in self.link_targets:
+            info["target"] = self.link_targets[row]
+        return info
+
+    def find(self, path: str) -> Optional[Dict[str, Any]]:
+        """Look up one path ("/a/b" or "a/b")."""
+        if self._path_rows is None:
+            self._path_rows = {p: i for i, p in enumerate(self.paths)}
+        if not path.startswith("/"):
+            path = "/" + path
+        row = self._path_rows.get(path)
+        return self.row(row) if row is not None else None
+
+    def iter_rows(self, kind: Optional[int] = None, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        emitted = 0
+        for row, row_kind in enumerate(self.kinds):
+            if kind is not None and row_kind != kind:
+                continue
+            if limit is not None and emitted >= limit:
+                return
+            emitted += 1
+            yield self.row(row)
+
+    def children(self, path: str) -> List[Dict[str, Any]]:
+        if self._path_rows is None:
+            self._path_rows = {p: i for i, p in enumerate(self.paths)}
+        parent = self._path_rows.get(path if path.startswith("/") else "/" + path)
+        if parent is None:
+            return []
+        return [self.row(row) for row, p in enumerate(self.parents) if p == parent]
+
+    def counts(self) -> Dict[str, int]:
+        totals = [0] * len(KIND_NAMES)
+        for kind in self.kinds:
+            totals[kind] += 1
+        return {KIND_NAMES[i]: n for i, n in enumerate(totals)}
+
+    def attributes(self, path: str, max_attributes: int = 256) -> Dict[str, Any]:
+        """Read one object's attributes from the file, on demand."""
+        if not H5PY_AVAILABLE:
+            return {}
+        attrs: Dict[str, Any] = {}
+        with h5py.File(self.filepath, "r") as f:
+            obj = f[path]
+            for i, key in enumerate(obj.attrs.keys()):
+                if i >= max_attributes:
+                    break
+                try:
+                    value = obj.attrs[key]
+                except Exception as e:
+                    attrs[key] = f"<unreadable: {e}>"
+                    continue
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8", errors="replace")
+                elif hasattr(value, "tolist"):
+                    value = value.tolist()
+                attrs[key] = value
+        return attrs
+
+    def summary(self) -> Dict[str, Any]:
+        counts = self.counts()
+        dataset_rows = [r for r, k in enumerate(self.kinds) if k == KIND_DATASET]
+        compressed = sum(1 for r in dataset_rows if self.filter_codes[r])
+        chunked = sum(1 for r in dataset_rows if self.chunk_offsets[r] >= 0)
+        return {
+            "objects_indexed": len(self),
+            "complete": self.complete,
+            "pending_groups": len(self.pending),
+            "counts": counts,
+            "total_datasets": counts["dataset"],
+            "total_groups": counts["group"],
+            "chunked_datasets": chunked,
+            "compressed_datasets": compressed,
+            "total_size_bytes": sum(self.nbytes[r] for r in dataset_rows),
+            "total_storage_bytes": sum(self.storage_bytes[r] for r in dataset_rows),
+            "dtypes": sorted(d for d in self._dtypes if d),
+            "compression_filters": sorted(f for f in self._filters if f),
+            "walk_seconds": round(self.walk_seconds, 4),
+            "passes": self.passes,
+        }
+
+
+def _index_object(index: HDF5Index, fid, path: str, parent: int) -> None:
+    """Open one hard-linked object through H5O and append its row."""
+    oid = h5py.h5o.open(fid, path.encode("utf-8"))
+    info = h5py.h5o.get_info(oid)
+    # Object header address identifies the object; fileno is per-open and
+    # changes between continuation passes, and external links are not followed
+    key = info.addr
+    if key in index._seen_objects:
+        row = index._append(path, KIND_HARD_LINK, parent)
+        index.link_targets[row] = index.paths[index._seen_objects[key]]
+        return
+
+    if info.type == h5py.h5o.TYPE_DATASET:
+        dcpl = oid.get_create_plist()
+        layout = dcpl.get_layout()
+        chunks = dcpl.get_chunk() if layout == h5py.h5d.CHUNKED else None
+        filters = "+".join(
+            _filter_label(entry[3], entry[2])
+            for entry in (dcpl.get_filter(i) for i in range(dcpl.get_nfilters()))
+        )
+        dtype = oid.dtype
+        shape = oid.shape or ()
+        count = 1
+        for dim in shape:
+            count *= dim
+        row = index._append(
+            path, KIND_DATASET, parent, shape=shape, chunks=chunks,
+            dtype=str(dtype), filters=filters, layout=layout,
+            nbytes=count * dtype.itemsize, storage=oid.get_storage_size(),
+            num_attrs=info.num_attrs,
+        )
+    elif info.type == h5py.h5o.TYPE_GROUP:
+        row = index._append(path, KIND_GROUP, parent, num_attrs=info.num_attrs)
+        index.pending.append((row, path, 0))
+    else:
+        row = index._append(path, KIND_DATATYPE, parent, dtype=str(oid.dtype),
+                            num_attrs=info.num_attrs)
+    index._seen_objects[key] = row
+
+
+def continue_index(index: HDF5Index, max_objects: int = DEFAULT_MAX_OBJECTS,
+                   time_budget: float = DEFAULT_TIME_BUDGET) -> HDF5Index:
+    """
+    Walk more of the file, resuming from the index's pending frontier.
+
+    Args:
+        index: Index to extend (a fresh one starts at the root group)
+        max_objects: Objects to add in this pass
+        time_budget: Wall-clock seconds for this pass
+
+    Returns:
+        The same index, possibly still incomplete
+    """
+    if not H5PY_AVAILABLE:
+        return index
+    with index._lock:
+        if index.complete and len(index):
+            return index
+        _walk(index, max_objects, time_budget)
+    return index
+
+
+def _walk(index: HDF5Index, max_objects: int, time_budget: float) -> None:
+    start = time.perf_counter()
+    deadline = start + time_budget
+    limit = len(index) + max_objects
+    index.passes += 1
+
+    with h5py.File(index.filepath, "r") as f:
+        fid = f.id
+        if not len(index):
+            root = h5py.h5o.open(fid, b"/")
+            info = h5py.h5o.get_info(root)
+            row = index._append("/", KIND_GROUP, -1, num_attrs=info.num_attrs)
+            index._seen_objects[info.addr] = row
+            index.pending.append((row, "/", 0))
+
+        while index.pending:
+            group_row, group_path, next_idx = index.pending.popleft()
+            prefix = "" if group_path == "/" else group_path
+
+            def visit(name, link):
+                path = f"{prefix}/{name.decode('utf-8', errors='replace')}"
+                try:
+                    if link.type == h5py.h5l.TYPE_HARD:
+                        _index_object(index, fid, path, group_row)
+                    elif link.type == h5py.h5l.TYPE_SOFT:
+                        row = index._append(path, KIND_SOFT_LINK, group_row)
+                        index.link_targets[row] = fid.links.get_val(path.encode("utf-8")).decode("utf-8", "replace")
+                    else:
+                        row = index._append(path, KIND_EXTERNAL_LINK, group_row)
+                        target = fid.links.get_val(path.encode("utf-8"))
+                        index.link_targets[row] = ":".join(
+                            t.decode("utf-8", "replace") if isinstance(t, bytes) else str(t) for t in target
+                        )
+                except Exception as e:
+                    if len(index.errors) < 100:
+                        index.errors.append(f"{path}: {e}")
+                if len(index) >= limit or time.perf_counter() >= deadline:
+                    return True
+                return None
+
+            try:
+                stopped, resume_idx = fid.links.iterate(
+                    visit, info=True, obj_name=group_path.encode("utf-8"),
+                    idx_type=h5py.h5.INDEX_NAME, order=h5py.h5.ITER_INC, idx=next_idx,
+                )
+            except Exception as e:
+                index.errors.append(f"{group_path}: {e}")
+                continue
+            if stopped:
+                # Budget spent: resume this group first next time
+                index.pending.appendleft((group_row, group_path, resume_idx))
+                break
+
+    index.walk_seconds += time.perf_counter() - start
+
+
+def build_index(filepath: str, max_objects: int = DEFAULT_MAX_OBJECTS,
+                time_budget: float = DEFAULT_TIME_BUDGET) -> Optional[HDF5Index]:
+    """Index a file from scratch (None if h5py is missing or it is not HDF5)."""
+    if not H5PY_AVAILABLE or not is_hdf5(filepath):
+        return None
+    st = os.stat(filepath)
+    index = HDF5Index(filepath, st.st_size, st.st_mtime_ns)
+    return continue_index(index, max_objects=max_objects, time_budget=time_budget)
+
+
+def is_hdf5(filepath: str) -> bool:
+    """Signature check; HDF5 superblocks may sit at 0, 512, 1024, 2048, ..."""
+    try:
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            offset = 0
+            while offset + 8 <= size:
+                f.seek(offset)
+                if f.read(8) == HDF5_SIGNATURE:
+                    return True
+                offset = 512 if offset == 0 else offset * 2
+    except OSError:
+        return False
+    return False
+
+
+def _index_bytes(index: HDF5Index) -> int:
+    arrays = (index.kinds, index.parents, index.ndims, index.shape_offsets, index.chunk_offsets,
+              index.dtype_codes, index.filter_codes, index.layouts, index.nbytes,
+              index.storage_bytes, index.num_attrs, index.shapes, index.chunks)
+    return (1024 + sum(a.itemsize * len(a) for a in arrays)
+            + sum(len(p) + 50 for p in index.paths) + 100 * len(index._seen_objects))
+
+
+_index_cache = BoundedCache("hdf5_indexes", max_entries=MAX_CACHED_INDEXES,
+                            max_bytes=MAX_CACHED_INDEX_BYTES, sizeof=_index_bytes)
+
+
+def get_hdf5_index(filepath: str, max_objects: int = DEFAULT_MAX_OBJECTS,
+                   time_budget: float = DEFAULT_TIME_BUDGET) -> Optional[HDF5Index]:
+    """
+    Cached index for a file; a cached partial index is continued with the
+    given budget instead of being rebuilt.
+    """
+    key = os.path.realpath(filepath)
+    index = _index_cache.get(key)
+    if index is not None and not index.is_current():
+        _index_cache.pop(key)
+        index = None
+
+    if index is None:
+        index = build_index(filepath, max_objects=max_objects, time_budget=time_budget)
+        if index is None:
+            return None
+    elif not index.complete:
+        continue_index(index, max_objects=max_objects, time_budget=time_budget)
+
+    # Re-put so the byte estimate follows a continued walk
+    _index_cache.put(key, index)
+    return index
+
+
+def clear_index_cache() -> None:
+    _index_cache.clear()
@@ -130,7 +130,13 @@ class ICCProfileParser:
             self.file_size = file_path.stat().st_size
 
             with open(self.filepath, 'rb') as f:
-                self.profile_data = f.read()
+                header = f.read(128)
+                # Read only the declared profile size, not anything appended
+                declared = struct.unpack('>I', header[:4])[0] if len(header) >= 4 else 0
+                if 128 < declared < self.file_size:
+                    self.profile_data = header + f.read(declared - 128)
+                else:
+                    self.profile_data = header + f.read()
 
             if len(self.profile_data) < 128:
                 return {"error": "Profile too small", "success": False}
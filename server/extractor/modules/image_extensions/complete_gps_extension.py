@@ -16,6 +16,11 @@ except ImportError:
 
 from .base import ImageExtensionBase, ImageExtractionResult, safe_extract_image_field, get_image_file_info
 
+try:
+    from ...utils.hashing import hash_file
+except ImportError:
+    from utils.hashing import hash_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -383,7 +388,6 @@ class CompleteGPSImageExtension(ImageExtensionBase):
     def _extract_forensic_metadata(self, filepath: str, result: ImageExtractionResult):
         """Extract forensic metadata"""
         try:
-            import hashlib
             import os
 
             forensic_dict = {}
@@ -395,10 +399,9 @@ class CompleteGPSImageExtension(ImageExtensionBase):
             forensic_dict["file_size"] = stat.st_size
 
             # File hashes
-            with open(filepath, 'rb') as f:
-                file_content = f.read()
-                forensic_dict["file_hash_md5"] = hashlib.md5(file_content).hexdigest()
-                forensic_dict["file_hash_sha256"] = hashlib.sha256(file_content).hexdigest()
+            digests = hash_file(filepath, ("md5", "sha256"))
+            forensic_dict["file_hash_md5"] = digests["md5"]
+            forensic_dict["file_hash_sha256"] = digests["sha256"]
 
             forensic_dict["is_authenticated"] = False
             forensic_dict["security_flags"] = ["unauthenticated_content"]
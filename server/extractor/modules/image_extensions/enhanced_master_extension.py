@@ -12,6 +12,11 @@ import threading
 
 from .base import ImageExtensionBase, ImageExtractionResult, safe_extract_image_field, get_image_file_info
 
+try:
+    from ...utils.bounded_cache import BoundedCache
+except ImportError:
+    from utils.bounded_cache import BoundedCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,17 +57,19 @@ class EnhancedMasterExtension(ImageExtensionBase):
 
         # Smart caching system to avoid redundant operations
         self._cache_lock = threading.Lock()
-        self._image_cache = {}  # Cache for basic image data
-        self._exif_cache = {}  # Cache for EXIF data
+        self._image_cache = BoundedCache("enhanced_master_images", max_entries=1024)  # Basic image data
+        self._exif_cache = BoundedCache("enhanced_master_exif", max_entries=256,
+                                        max_bytes=16 << 20)  # EXIF data
         self._cache_hits = 0
         self._cache_misses = 0
 
     def _get_cached_image_data(self, filepath: str):
         """Get cached basic image data or extract and cache it"""
         with self._cache_lock:
-            if filepath in self._image_cache:
+            cached = self._image_cache.get(filepath)
+            if cached is not None:
                 self._cache_hits += 1
-                return self._image_cache[filepath]
+                return cached
 
             self._cache_misses += 1
 
@@ -81,7 +88,7 @@ class EnhancedMasterExtension(ImageExtensionBase):
                         "size_bytes": Path(filepath).stat().st_size
                     }
 
-                    self._image_cache[filepath] = image_data
+                    self._image_cache.put(filepath, image_data)
                     return image_data
             except Exception as e:
                 logger.warning(f"Failed to cache image data: {e}")
@@ -90,9 +97,10 @@ class EnhancedMasterExtension(ImageExtensionBase):
     def _get_cached_exif_data(self, filepath: str):
         """Get cached EXIF data or extract and cache it"""
         with self._cache_lock:
-            if filepath in self._exif_cache:
+            cached = self._exif_cache.get(filepath)
+            if cached is not None:
                 self._cache_hits += 1
-                return self._exif_cache[filepath]
+                return cached
 
             self._cache_misses += 1
 
@@ -113,10 +121,10 @@ class EnhancedMasterExtension(ImageExtensionBase):
                                     value = str(value)[:100]
                             exif_dict[str(tag)] = value
 
-                        self._exif_cache[filepath] = exif_dict
+                        self._exif_cache.put(filepath, exif_dict)
                         return exif_dict
                     else:
-                        self._exif_cache[filepath] = {}
+                        self._exif_cache.put(filepath, {})
                         return {}
             except Exception as e:
                 logger.warning(f"Failed to cache EXIF data: {e}")
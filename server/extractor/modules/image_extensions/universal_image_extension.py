@@ -11,6 +11,11 @@ from pathlib import Path
 
 from .base import ImageExtensionBase, ImageExtractionResult, safe_extract_image_field, get_image_file_info
 
+try:
+    from ...utils.hashing import hash_file
+except ImportError:
+    from utils.hashing import hash_file
+
 logger = logging.getLogger(__name__)
 
 
@@ -146,8 +151,6 @@ class UniversalImageExtension(ImageExtensionBase):
             Extraction result dictionary
         """
         try:
-            import hashlib
-
             # Extract basic file info
             file_info = get_image_file_info(filepath)
             if "error" not in file_info:
@@ -155,18 +158,18 @@ class UniversalImageExtension(ImageExtensionBase):
 
             # Calculate file hashes
             try:
-                with open(filepath, 'rb') as f:
-                    file_content = f.read()
-                    result.add_metadata("md5_hash", hashlib.md5(file_content).hexdigest())
-                    result.add_metadata("sha256_hash", hashlib.sha256(file_content).hexdigest()[:32])
+                digests = hash_file(filepath, ("md5", "sha256"))
+                result.add_metadata("md5_hash", digests["md5"])
+                result.add_metadata("sha256_hash", digests["sha256"][:32])
 
-                    # Detect file signature
-                    header = file_content[:32]
-                    result.add_metadata("header_hex", header.hex())
+                # Detect file signature
+                with open(filepath, 'rb') as f:
+                    header = f.read(32)
+                result.add_metadata("header_hex", header.hex())
 
-                    signatures = self._detect_signatures(header)
-                    if signatures:
-                        result.add_metadata("detected_signatures", signatures)
+                signatures = self._detect_signatures(header)
+                if signatures:
+                    result.add_metadata("detected_signatures", signatures)
 
             except Exception as e:
                 result.add_warning(f"Could not calculate hashes: {str(e)[:100]}")
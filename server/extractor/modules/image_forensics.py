@@ -19,6 +19,8 @@ import hashlib
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+from .xmp_packets import XmpTable, get_xmp_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,8 +31,9 @@ class ImageForensicsAnalyzer:
 
     def __init__(self, filepath: str):
         self.filepath = filepath
-        self.file_data: Optional[bytes] = None
+        self.header: Optional[bytes] = None
         self.xmp_data: Optional[str] = None
+        self.xmp_table: Optional[XmpTable] = None
         self.exif_data: Optional[Dict[str, Any]] = None
 
     def analyze(self) -> Dict[str, Any]:
@@ -83,44 +86,27 @@ class ImageForensicsAnalyzer:
             return {"error": str(e), "manipulation_detected": False}
 
     def _load_file_data(self):
-        """Load file data for analysis"""
+        """Load the file signature; the analyses below only branch on format"""
         file_path = Path(self.filepath)
         if not file_path.exists():
             return
 
         try:
             with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+                self.header = f.read(16)
         except Exception:
-            self.file_data = None
-
-        self._extract_xmp_from_png()
-
-    def _extract_xmp_from_png(self):
-        """Extract XMP data from PNG if present"""
-        if not self.file_data or len(self.file_data) < 16:
-            return
-
-        if self.file_data[:8] != b'\x89PNG\r\n\x1a\n':
-            return
+            self.header = None
 
-        offset = 8
-        while offset < len(self.file_data) - 12:
-            length = struct.unpack('>I', self.file_data[offset:offset + 4])[0]
-            chunk_type = self.file_data[offset + 4:offset + 8].decode('latin-1', errors='replace')
+        self._load_xmp()
 
-            if chunk_type == 'tEXt':
-                chunk_data = self.file_data[offset + 8:offset + 8 + length]
-                null_pos = chunk_data.find(b'\x00')
-                if null_pos > 0:
-                    keyword = chunk_data[:null_pos].decode('latin-1', errors='replace')
-                    if keyword == 'XML:com.adobe.xmp':
-                        try:
-                            self.xmp_data = chunk_data[null_pos + 1:].decode('utf-8', errors='replace')
-                        except Exception:
-                            self.xmp_data = None
-
-            offset += 12 + length
+    def _load_xmp(self):
+        """Load XMP from the shared packet table"""
+        try:
+            self.xmp_table = get_xmp_table(self.filepath)
+            self.xmp_data = self.xmp_table.text_data if self.xmp_table else None
+        except Exception:
+            self.xmp_table = None
+            self.xmp_data = None
 
     def _analyze_ela(self) -> Optional[Dict[str, Any]]:
         """Perform Error Level Analysis"""
@@ -132,10 +118,10 @@ class ImageForensicsAnalyzer:
             "ela_heatmap_regions": [],
         }
 
-        if not self.file_data:
+        if not self.header:
             return None
 
-        if self.file_data[:8] == b'\x89PNG\r\n\x1a\n':
+        if self.header[:8] == b'\x89PNG\r\n\x1a\n':
             result["ela_detected"] = True
             result["ela_mean"] = 3.5
             result["ela_std"] = 2.8
@@ -151,7 +137,7 @@ class ImageForensicsAnalyzer:
                 if region["suspicious"]:
                     result["high_error_regions"].append(region["region"])
 
-        elif self.file_data[:2] == b'\xFF\xD8':
+        elif self.header[:2] == b'\xFF\xD8':
             result["ela_detected"] = True
             result["ela_mean"] = 4.2
             result["ela_std"] = 3.1
@@ -182,7 +168,7 @@ class ImageForensicsAnalyzer:
             "sensor_pattern_noise": None,
         }
 
-        if not self.file_data:
+        if not self.header:
             return None
 
         result["noise_variance"] = 12.5
@@ -216,7 +202,7 @@ class ImageForensicsAnalyzer:
             "clone_detection": None,
         }
 
-        if not self.file_data:
+        if not self.header:
             return None
 
         result["duplicate_regions"] = [
@@ -265,18 +251,11 @@ class ImageForensicsAnalyzer:
                 "details": f"Found multiple editing software: {software_matches}",
             })
 
-        datetime_patterns = [
-            r'dateTimeOriginal["\s]*:?\s*["\']?([^"\']+)',
-            r'dateTimeDigitized["\s]*:?\s*["\']?([^"\']+)',
-            r'CreateDate["\s]*:?\s*["\']?([^"\']+)',
-        ]
-
         found_dates = []
-        for pattern in datetime_patterns:
-            import re
-            match = re.search(pattern, self.xmp_data)
-            if match:
-                found_dates.append(match.group(1))
+        for qname in ('exif:DateTimeOriginal', 'exif:DateTimeDigitized', 'xmp:CreateDate'):
+            value = self.xmp_table.text(qname, ignore_case=True)
+            if value:
+                found_dates.append(value)
 
         if len(found_dates) > 1:
             unique_dates = set(found_dates)
@@ -301,10 +280,10 @@ class ImageForensicsAnalyzer:
             "quantization_tables": None,
         }
 
-        if not self.file_data:
+        if not self.header:
             return None
 
-        if self.file_data[:2] == b'\xFF\xD8':
+        if self.header[:2] == b'\xFF\xD8':
             result["quality_estimate"] = 85.0
             result["compression_artifacts"] = [
                 {"type": "blocking", "severity": "low", "location": "uniform"},
@@ -318,7 +297,7 @@ class ImageForensicsAnalyzer:
                 "chrominance": [17, 18, 24, 47, 99, 99, 99, 99],
             }
 
-        elif self.file_data[:8] == b'\x89PNG\r\n\x1a\n':
+        elif self.header[:8] == b'\x89PNG\r\n\x1a\n':
             result["quality_estimate"] = 95.0
             result["compression_artifacts"] = [
                 {"type": "filtering", "severity": "none", "location": "all"},
@@ -10,6 +10,8 @@ import json
 import shutil
 import subprocess
 
+from .xmp_packets import XmpTable, get_xmp_table
+
 try:
     from pyexiv2 import Image as ExivImage
     EXIV2_AVAILABLE = True
@@ -270,14 +272,62 @@ XMP_ADOBE_STOCK = {
 }
 
 
+# Result section -> field table for XMP read from the shared packet table
+XMP_SECTIONS = {
+    "dublin_core": XMP_DUBLIN_CORE_FIELDS,
+    "photoshop": XMP_PHOTOSHOP_FIELDS,
+    "dc_prefs": XMP_DC_PREFS_FIELDS,
+    "rights_management": XMP_RIGHTS_MANAGEMENT,
+    "creator_contact": XMP_CREATOR_CONTACT,
+    "adobe_stock": XMP_ADOBE_STOCK,
+}
+
+
+def _read_xmp_tag(table: XmpTable, tag: str) -> Optional[str]:
+    """Value of an exiv2-style key ("Xmp.dc.title") from an XMP table."""
+    _, prefix, name = tag.split(".", 2)
+    if prefix == "creatorContactInfo":
+        # IPTC Core stores contact details as fields of one struct
+        contact = table.get("Iptc4xmpCore", "CreatorContactInfo")
+        value = contact.get(name) if isinstance(contact, dict) else None
+    elif table.resolve(prefix) is None:
+        return None
+    else:
+        value = table.get(prefix, name)
+    if isinstance(value, list):
+        items = [v for v in value if isinstance(v, str) and v]
+        value = ", ".join(items) if items else None
+    if not isinstance(value, str) or not value:
+        return None
+    return value
+
+
+def _extract_xmp_sections(table: XmpTable, sections: Dict[str, Dict[str, str]]) -> None:
+    for section, fields in XMP_SECTIONS.items():
+        for tag, field in fields.items():
+            value = _read_xmp_tag(table, tag)
+            if value:
+                sections[section][field] = value
+
+
 def extract_iptc_xmp_metadata(filepath: str) -> Optional[Dict[str, Any]]:
     """Extract IPTC and XMP professional metadata from images."""
     if not EXIV2_AVAILABLE or ExivImage is None:
         # Fallback to exiftool when available.
         raw = _run_exiftool_iptc_xmp(filepath)
         if not raw:
-            # Preserve existing behavior when neither `pyexiv2` nor exiftool are available.
-            raise ImportError("pyexiv2 is required but not installed")
+            table = get_xmp_table(filepath)
+            if not table:
+                # Preserve existing behavior when neither `pyexiv2` nor exiftool are available.
+                raise ImportError("pyexiv2 is required but not installed")
+            xmp_only: Dict[str, Any] = {
+                "iptc": {},
+                "xmp": {section: {} for section in XMP_SECTIONS},
+                "available": True,
+            }
+            _extract_xmp_sections(table, xmp_only["xmp"])
+            xmp_only["fields_extracted"] = sum(len(v) for v in xmp_only["xmp"].values())
+            return xmp_only
 
         result: Dict[str, Any] = {
             "iptc": {},
@@ -363,59 +413,10 @@ def extract_iptc_xmp_metadata(filepath: str) -> Optional[Dict[str, Any]]:
             except Exception as e:
                 continue
         
-        # Extract XMP Dublin Core
-        for tag, field in XMP_DUBLIN_CORE_FIELDS.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["dublin_core"][field] = str(value)
-            except Exception as e:
-                continue
-        
-        # Extract XMP Photoshop
-        for tag, field in XMP_PHOTOSHOP_FIELDS.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["photoshop"][field] = str(value)
-            except Exception as e:
-                continue
-        
-        # Extract XMP DC Prefs
-        for tag, field in XMP_DC_PREFS_FIELDS.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["dc_prefs"][field] = str(value)
-            except Exception as e:
-                continue
-        
-        # Extract XMP Rights Management
-        for tag, field in XMP_RIGHTS_MANAGEMENT.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["rights_management"][field] = str(value)
-            except Exception as e:
-                continue
-        
-        # Extract XMP Creator Contact
-        for tag, field in XMP_CREATOR_CONTACT.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["creator_contact"][field] = str(value)
-            except Exception as e:
-                continue
-        
-        # Extract XMP Adobe Stock
-        for tag, field in XMP_ADOBE_STOCK.items():
-            try:
-                value = img.read_xmp(tag)
-                if value:
-                    result["xmp"]["adobe_stock"][field] = str(value)
-            except Exception as e:
-                continue
+        # XMP comes from the shared packet table (parsed once per file)
+        table = get_xmp_table(filepath)
+        if table:
+            _extract_xmp_sections(table, result["xmp"])
         
         # Count fields
         total_fields = (
@@ -3,8 +3,13 @@ IPTC and XMP Fallback Libraries
 Alternative extraction methods when pyexiv2 is unavailable
 """
 
+import logging
 from typing import Dict, Any, Optional, List
 
+from .xmp_packets import get_xmp_table
+
+logger = logging.getLogger(__name__)
+
 
 try:
     from iptcinfo3 import IPTCInfo
@@ -86,9 +91,17 @@ def extract_iptc_fallback(filepath: str) -> Optional[Dict[str, Any]]:
         return {"error": f"Failed to extract IPTC: {str(e)}"}
 
 
+XMP_FALLBACK_SECTIONS = {
+    "http://purl.org/dc/elements/1.1/": "dublin_core",
+    "http://ns.adobe.com/photoshop/1.0/": "photoshop",
+    "http://ns.adobe.com/xap/1.0/rights/": "rights",
+    "http://ns.adobe.com/dcprefs/1.0/": "dc_prefs",
+}
+
+
 def extract_xmp_fallback(filepath: str) -> Optional[Dict[str, Any]]:
     """
-    Extract XMP metadata using libxmp as fallback.
+    Extract XMP metadata from the shared packet table, with libxmp as fallback.
     
     Args:
         filepath: Path to image file
@@ -96,7 +109,26 @@ def extract_xmp_fallback(filepath: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary with XMP metadata organized by namespace
     """
+    result = {
+        "dublin_core": {},
+        "photoshop": {},
+        "rights": {},
+        "dc_prefs": {},
+        "available": True
+    }
+
+    table = get_xmp_table(filepath)
+    if table:
+        for ns, key, value in table.iter_properties():
+            section = XMP_FALLBACK_SECTIONS.get(ns)
+            if section:
+                result[section][key] = value
+        return result
+
     if not LIBXMP_AVAILABLE:
+        if table is not None:
+            # Readable file without any XMP packet
+            return {"xmp": {}, "available": True}
         return {"error": "libxmp (python-xmp-toolkit) not installed"}
     
     try:
@@ -106,14 +138,6 @@ def extract_xmp_fallback(filepath: str) -> Optional[Dict[str, Any]]:
         if not xmp:
             return {"xmp": {}, "available": True}
         
-        result = {
-            "dublin_core": {},
-            "photoshop": {},
-            "rights": {},
-            "dc_prefs": {},
-            "available": True
-        }
-        
         try:
             xmp_dict = object_to_dict(xmp)
             
@@ -178,7 +202,7 @@ def extract_all_metadata_with_fallbacks(filepath: str) -> Dict[str, Any]:
     xmp_result = extract_xmp_fallback(filepath)
     if "error" not in xmp_result:
         result["xmp"] = xmp_result
-        result["extraction_methods"].append("libxmp")
+        result["extraction_methods"].append("xmp_packets" if get_xmp_table(filepath) else "libxmp")
     
     total_fields = (
         len(result["iptc"]["core"]) +
@@ -8,5555 +8,144 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 import re
 
-
-CANON_CAMERA_SETTINGS = {
-    "CanonCS_MacroMode": "canon_macro_mode",
-    "CanonCS_SelfTimer": "canon_self_timer",
-    "CanonCS_Quality": "canon_quality",
-    "CanonCS_FlashMode": "canon_flash_mode",
-    "CanonCS_ContinuousDrive": "canon_continuous_drive",
-    "CanonCS_FocusMode": "canon_focus_mode",
-    "CanonCS_RecordMode": "canon_record_mode",
-    "CanonCS_ImageSize": "canon_image_size",
-    "CanonCS_EasyMode": "canon_easy_mode",
-    "CanonCS_DigitalZoom": "canon_digital_zoom",
-    "CanonCS_Contrast": "canon_contrast",
-    "CanonCS_Saturation": "canon_saturation",
-    "CanonCS_Sharpness": "canon_sharpness",
-    "CanonCS_ISOSpeed": "canon_iso_speed",
-    "CanonCS_MeteringMode": "canon_metering_mode",
-    "CanonCS_AFPoint": "canon_af_point",
-    "CanonCS_ExposureMode": "canon_exposure_mode",
-    "CanonCS_LensType": "canon_lens_type",
-    "CanonCS_LongFocalLength": "canon_long_focal_length",
-    "CanonCS_ShortFocalLength": "canon_short_focal_length",
-    "CanonCS_FocalUnits": "canon_focal_units",
-    "CanonCS_MaxAperture": "canon_max_aperture",
-    "CanonCS_MinAperture": "canon_min_aperture",
-    "CanonCS_FlashActivity": "canon_flash_activity",
-    "CanonCS_FlashDetails": "canon_flash_details",
-    "CanonCS_FocusContinuous": "canon_focus_continuous",
-    "CanonCS_AESetting": "canon_ae_setting",
-    "CanonCS_ImageStabilization": "canon_image_stabilization",
-    "CanonCS_DisplayAperture": "canon_display_aperture",
-    "CanonCS_ZoomSourceWidth": "canon_zoom_source_width",
-    "CanonCS_ZoomTargetWidth": "canon_zoom_target_width",
-    "CanonCS_SpotMeteringMode": "canon_spot_metering_mode",
-    "CanonCS_PhotoEffect": "canon_photo_effect",
-    "CanonCS_ManualFlashOutput": "canon_manual_flash_output",
-    "CanonCS_ColorTone": "canon_color_tone",
-    "CanonCS_SRAWQuality": "canon_sraw_quality",
-    "CanonCS_FlashGuideNumber": "canon_flash_guide_number",
-    "CanonCS_AFImageWidth": "canon_af_image_width",
-    "CanonCS_AFImageHeight": "canon_af_image_height",
-    "CanonCS_AFTrackingSensitivity": "canon_af_tracking_sensitivity",
-    "CanonCS_AFCase": "canon_af_case",
-    "CanonCS_AFIntegrationTime": "canon_af_integration_time",
-    "CanonCS_AFSubjectSearchStrategy": "canon_af_subject_search_strategy",
-    "CanonCS_AFSubjectSize": "canon_af_subject_size",
-    "CanonCS_SmallestFocalLength": "canon_smallest_focal",
-    "CanonCS_LargestFocalLength": "canon_largest_focal",
-    "CanonCS_MinFocalLength35mmEq": "canon_min_focal_35mm",
-    "CanonCS_MaxFocalLength35mmEq": "canon_max_focal_35mm",
-    "CanonCS_EVFAccel": "canon_evf_acceleration",
-    "CanonCS_FlashExposureLock": "canon_flash_exposure_lock",
-    "CanonCS_FocusMetering": "canon_focus_metering",
-    "CanonCS_AutoFocusMinimumISO": "canon_af_min_iso",
-    "CanonCS_CustomFunctions": "canon_custom_functions",
-    "CanonCS_ToneCurve": "canon_tone_curve",
-    "CanonCS_SharpnessFactor": "canon_sharpness_factor",
-    "CanonCS_ShadowCorrection": "canon_shadow_correction",
-    "CanonCS_GainControl": "canon_gain_control",
-    "CanonCS_LensAberrationCorrection": "canon_lens_aberration_correction",
-    "CanonCS_LongExposureNR": "canon_long_exposure_nr",
-    "CanonCS_HighISONoiseReduction": "canon_high_iso_nr",
-    "CanonCS_FlashExposureComp": "canon_flash_exposure_comp",
-    "CanonCS_FocusDistanceUpper": "canon_focus_distance_upper",
-    "CanonCS_FocusDistanceLower": "canon_focus_distance_lower",
-    "CanonCS_BracketMode": "canon_bracket_mode",
-    "CanonCS_BracketValue": "canon_bracket_value",
-    "CanonCS_ExposureLevelIncrements": "canon_exposure_level_increments",
-    "CanonCS_AEBShotCount": "canon_aeb_shot_count",
-    "CanonCS_AEBSequence": "canon_aeb_sequence",
-    "CanonCS_FlashSyncSpeedAv": "canon_flash_sync_speed_av",
-    "CanonCS_ShutterAeLock": "canon_shutter_ae_lock",
-    "CanonCS_AFAssistBeam": "canon_af_assist_beam",
-    "CanonCS_ImageReviewTime": "canon_image_review_time",
-    "CanonCS_AspectRatio": "canon_aspect_ratio",
-    "CanonCS_CropImageWidth": "canon_crop_image_width",
-    "CanonCS_CropImageHeight": "canon_crop_image_height",
-    "CanonCS_CropMode": "canon_crop_mode",
-    "CanonCS_DriveMode": "canon_drive_mode",
-    "CanonCS_BurstSpeed": "canon_burst_speed",
-    "CanonCS_BurstCount": "canon_burst_count",
-    "CanonCS_SilentShooting": "canon_silent_shooting",
-    "CanonCS_SelfTimerCount": "canon_self_timer_count",
-    "CanonCS_MirrorLockup": "canon_mirror_lockup",
-    "CanonCS_Antiflicker": "canon_antiflicker",
-    "CanonCS_PanasonicFunction": "canon_panasonic_function",
-    "CanonCS_PanasonicMode": "canon_panasonic_mode",
-    # Modern Canon EOS R series additions (2020-2024)
-    "CanonCS_DualPixelAF": "canon_dual_pixel_af",
-    "CanonCS_EyeDetectionAF": "canon_eye_detection_af",
-    "CanonCS_AnimalDetectionAF": "canon_animal_detection_af",
-    "CanonCS_VehicleDetectionAF": "canon_vehicle_detection_af",
-    "CanonCS_HeadDetectionAF": "canon_head_detection_af",
-    "CanonCS_BodyDetectionAF": "canon_body_detection_af",
-    "CanonCS_MultiFunctionButton": "canon_multi_function_button",
-    "CanonCS_ControlRing": "canon_control_ring",
-    "CanonCS_TouchAndDragAF": "canon_touch_drag_af",
-    "CanonCS_HDRMode": "canon_hdr_mode",
-    "CanonCS_PanoramaMode": "canon_panorama_mode",
-    "CanonCS_HFRMode": "canon_hfr_mode",
-    "CanonCS_RAWBurstMode": "canon_raw_burst_mode",
-    "CanonCS_EOSiTR": "canon_eos_itr",
-    "CanonCS_LightSourceDetection": "canon_light_source_detection",
-}
-
-CANON_SHOT_INFO = {
-    "CanonSI_AutoISO": "canon_auto_iso",
-    "CanonSI_BaseISO": "canon_base_iso",
-    "CanonSI_MeasuredEV": "canon_measured_ev",
-    "CanonSI_TargetAperture": "canon_target_aperture",
-    "CanonSI_TargetExposureTime": "canon_target_exposure_time",
-    "CanonSI_ExposureCompensation": "canon_exposure_compensation",
-    "CanonSI_WhiteBalance": "canon_white_balance",
-    "CanonSI_SlowShutter": "canon_slow_shutter",
-    "CanonSI_SequenceNumber": "canon_sequence_number",
-    "CanonSI_OpticalZoomCode": "canon_optical_zoom_code",
-    "CanonSI_CameraTemperature": "canon_camera_temperature",
-    "CanonSI_FlashGuideNumber": "canon_flash_guide_number",
-    "CanonSI_AFPointsInFocus": "canon_af_points_in_focus",
-    "CanonSI_FlashExposureComp": "canon_flash_exposure_comp",
-    "CanonSI_AutoExposureBracketing": "canon_auto_exposure_bracketing",
-    "CanonSI_AEBBracketValue": "canon_aeb_bracket_value",
-    "CanonSI_ControlMode": "canon_control_mode",
-    "CanonSI_FocusDistanceUpper": "canon_focus_distance_upper",
-    "CanonSI_FocusDistanceLower": "canon_focus_distance_lower",
-    "CanonSI_NDFilter": "canon_nd_filter",
-    "CanonSI_SelfTimer2": "canon_self_timer_2",
-    "CanonSI_BulbDuration": "canon_bulb_duration",
-    "CanonSI_CameraType": "canon_camera_type",
-    "CanonSI_AutoRotate": "canon_auto_rotate",
-    "CanonSI_SensingMethod": "canon_sensing_method",
-    "CanonSI_ContentType": "canon_content_type",
-    "CanonSI_CustomFunctions": "canon_custom_functions",
-    "CanonSI_CustomFunction1": "canon_custom_function_1",
-    "CanonSI_CustomFunction2": "canon_custom_function_2",
-    "CanonSI_CustomFunction3": "canon_custom_function_3",
-    "CanonSI_CustomFunction4": "canon_custom_function_4",
-    "CanonSI_CustomFunction5": "canon_custom_function_5",
-    "CanonSI_CustomFunction6": "canon_custom_function_6",
-    "CanonSI_CustomFunction7": "canon_custom_function_7",
-    "CanonSI_CustomFunction8": "canon_custom_function_8",
-    "CanonSI_CustomFunction9": "canon_custom_function_9",
-    "CanonSI_CustomFunction10": "canon_custom_function_10",
-    "CanonSI_AspectRatioInfo": "canon_aspect_ratio_info",
-    "CanonSI_CroppedImageWidth": "canon_cropped_image_width",
-    "CanonSI_CroppedImageHeight": "canon_cropped_image_height",
-    "CanonSI_CroppingType": "canon_cropping_type",
-    "CanonSI_PreviewCodec": "canon_preview_codec",
-    "CanonSI_PreviewDimensions": "canon_preview_dimensions",
-    "CanonSI_PrimaryAFPoint": "canon_primary_af_point",
-    "CanonSI_AFPointsUsed": "canon_af_points_used",
-    "CanonSI_AFMode": "canon_af_mode",
-    "CanonSI_LensType": "canon_lens_type",
-    "CanonSI_LensSerialNumber": "canon_lens_serial",
-    "CanonSI_LensModel": "canon_lens_model",
-    "CanonSI_LensFirmwareVersion": "canon_lens_firmware",
-    "CanonSI_InternalSerialNumber": "canon_internal_serial",
-    "CanonSI_DustRemovalData": "canon_dust_removal_data",
-    "CanonSI_FlashMetering": "canon_flash_metering",
-    "CanonSI_LensModel2": "canon_lens_model_2",
-    "CanonSI_ColorDataVersion": "canon_color_data_version",
-    "CanonSI_CameraInfoVersion": "canon_camera_info_version",
-    "CanonSI_WB_SRGGB": "canon_wb_srggb",
-    "CanonSI_ColorTemperature": "canon_color_temperature",
-    "CanonSI_SensorRedLevel": "canon_sensor_red_level",
-    "CanonSI_SensorBlueLevel": "canon_sensor_blue_level",
-    "CanonSI_SensorGreenLevel": "canon_sensor_green_level",
-    "CanonSI_Vignetting": "canon_vignetting",
-    "CanonSI_ChromaticAberration": "canon_chromatic_aberration",
-    "CanonSI_ColorMatrix": "canon_color_matrix",
-    "CanonSI_BlackLevel": "canon_black_level",
-    "CanonSI_WhiteBalanceOffset": "canon_wb_offset",
-    "CanonSI_LinearityTable": "canon_linearity_table",
-    "CanonSI_DefectMatrix": "canon_defect_matrix",
-}
-
-CANON_PICTURE_STYLE = {
-    "CanonPS_ContrastStd": "canon_ps_contrast_std",
-    "CanonPS_ContrastPortrait": "canon_ps_contrast_portrait",
-    "CanonPS_ContrastLandscape": "canon_ps_contrast_landscape",
-    "CanonPS_ContrastNeutral": "canon_ps_contrast_neutral",
-    "CanonPS_ContrastFaithful": "canon_ps_contrast_faithful",
-    "CanonPS_ContrastMonochrome": "canon_ps_contrast_monochrome",
-    "CanonPS_ContrastUserDef1": "canon_ps_contrast_ud1",
-    "CanonPS_ContrastUserDef2": "canon_ps_contrast_ud2",
-    "CanonPS_ContrastUserDef3": "canon_ps_contrast_ud3",
-    "CanonPS_SharpnessStd": "canon_ps_sharpness_std",
-    "CanonPS_SharpnessPortrait": "canon_ps_sharpness_portrait",
-    "CanonPS_SharpnessLandscape": "canon_ps_sharpness_landscape",
-    "CanonPS_SharpnessNeutral": "canon_ps_sharpness_neutral",
-    "CanonPS_SharpnessFaithful": "canon_ps_sharpness_faithful",
-    "CanonPS_SharpnessMonochrome": "canon_ps_sharpness_monochrome",
-    "CanonPS_SharpnessUserDef1": "canon_ps_sharpness_ud1",
-    "CanonPS_SharpnessUserDef2": "canon_ps_sharpness_ud2",
-    "CanonPS_SharpnessUserDef3": "canon_ps_sharpness_ud3",
-    "CanonPS_SaturationStd": "canon_ps_saturation_std",
-    "CanonPS_SaturationPortrait": "canon_ps_saturation_portrait",
-    "CanonPS_SaturationLandscape": "canon_ps_saturation_landscape",
-    "CanonPS_SaturationNeutral": "canon_ps_saturation_neutral",
-    "CanonPS_SaturationFaithful": "canon_ps_saturation_faithful",
-    "CanonPS_SaturationMonochrome": "canon_ps_saturation_monochrome",
-    "CanonPS_SaturationUserDef1": "canon_ps_saturation_ud1",
-    "CanonPS_SaturationUserDef2": "canon_ps_saturation_ud2",
-    "CanonPS_SaturationUserDef3": "canon_ps_saturation_ud3",
-    "CanonPS_ColorToneStd": "canon_ps_color_tone_std",
-    "CanonPS_ColorTonePortrait": "canon_ps_color_tone_portrait",
-    "CanonPS_ColorToneLandscape": "canon_ps_color_tone_landscape",
-    "CanonPS_ColorToneNeutral": "canon_ps_color_tone_neutral",
-    "CanonPS_ColorToneFaithful": "canon_ps_color_tone_faithful",
-    "CanonPS_ColorToneMonochrome": "canon_ps_color_tone_monochrome",
-    "CanonPS_FilterEffectMonochrome": "canon_ps_filter_mono",
-    "CanonPS_ToningEffectMonochrome": "canon_ps_toning_mono",
-    "CanonPS_UserDef1Name": "canon_ps_ud1_name",
-    "CanonPS_UserDef2Name": "canon_ps_ud2_name",
-    "CanonPS_UserDef3Name": "canon_ps_ud3_name",
-    "CanonPS_BaseSettings": "canon_ps_base_settings",
-    "CanonPS_RawJpgStyle": "canon_ps_raw_jpg_style",
-    "CanonPS_ColorSpace": "canon_ps_color_space",
-    "CanonPS_ToneCurve": "canon_ps_tone_curve",
-    "CanonPS_ToneCurveStatus": "canon_ps_tone_curve_status",
-}
-
-CANON_LENS_INFO = {
-    "CanonLI_LensSerialNumber": "canon_lens_serial_number",
-    "CanonLI_InternalSerialNumber": "canon_internal_serial_number",
-    "CanonLI_FirmwareVersion": "canon_firmware_version",
-    "CanonLI_LensModel": "canon_lens_model",
-    "CanonLI_LensID": "canon_lens_id",
-    "CanonLI_ImageStabilization": "canon_lens_is",
-    "CanonLI_MinFocusDistance": "canon_min_focus_distance",
-    "CanonLI_MaxFocusDistance": "canon_max_focus_distance",
-    "CanonLI_MaxAperture": "canon_lens_max_aperture",
-    "CanonLI_MinAperture": "canon_lens_min_aperture",
-    "CanonLI_FilterDiameter": "canon_filter_diameter",
-    "CanonLI_LensWeight": "canon_lens_weight",
-    "CanonLI_LensLength": "canon_lens_length",
-    "CanonLI_LensDiameter": "canon_lens_diameter",
-    "CanonLI_MountType": "canon_mount_type",
-    "CanonLI_Teleconverter": "canon_teleconverter",
-    "CanonLI_ExtensionTube": "canon_extension_tube",
-    "CanonLI_LensFirmware": "canon_lens_firmware",
-    "CanonLI_MinFocalLength": "canon_lens_min_focal",
-    "CanonLI_MaxFocalLength": "canon_lens_max_focal",
-    "CanonLI_MaxMagnification": "canon_lens_max_mag",
-    "CanonLI_FilterSize": "canon_filter_size",
-    "CanonLI_HoodModel": "canon_hood_model",
-    "CanonLI_LensType1": "canon_lens_type_1",
-    "CanonLI_LensType2": "canon_lens_type_2",
-    "CanonLI_LensType3": "canon_lens_type_3",
-    "CanonLI_LensType4": "canon_lens_type_4",
-    "CanonLI_FocalLengthMultiplier": "canon_focal_mult",
-    "CanonLI_AFDriverVersion": "canon_af_driver_ver",
-    "CanonLI_MotorDriverVersion": "canon_motor_driver_ver",
-    "CanonLI_FocusLensPosition": "canon_focus_lens_pos",
-    "CanonLI_FocusLensAxis1": "canon_focus_lens_axis_1",
-    "CanonLI_FocusLensAxis2": "canon_focus_lens_axis_2",
-    "CanonLI_FocusLensAxis3": "canon_focus_lens_axis_3",
-    "CanonLI_FocusLensAxis4": "canon_focus_lens_axis_4",
-    "CanonLI_FocusLensAxis5": "canon_focus_lens_axis_5",
-    "CanonLI_FocusLensAxis6": "canon_focus_lens_axis_6",
-    "CanonLI_FocusLensAxis7": "canon_focus_lens_axis_7",
-    "CanonLI_FocusLensAxis8": "canon_focus_lens_axis_8",
-    "CanonLI_ExitPupilPosition": "canon_exit_pupil_pos",
-    "CanonLI_AFMicroAdj": "canon_af_micro_adj",
-    "CanonLI_AFMicroAdjValue": "canon_af_micro_adj_val",
-}
-
-NIKON_ISO_INFO = {
-    "NikonISOInfo_ISO": "nikon_iso",
-    "NikonISOInfo_ISOExpansion": "nikon_iso_expansion",
-    "NikonISOInfo_ISOExpansion2": "nikon_iso_expansion_2",
-    "NikonISOInfo_ISOSettings": "nikon_iso_settings",
-    "NikonISOInfo_HighISONoiseReduction": "nikon_high_iso_nr",
-    "NikonISOInfo_LowISONoiseReduction": "nikon_low_iso_nr",
-    "NikonISOInfo_ActiveDLighting": "nikon_active_d_lighting",
-    "NikonISOInfo_ISOAutoShutterTime": "nikon_iso_auto_shutter_time",
-    "NikonISOInfo_ISOAutoHiLimit": "nikon_iso_auto_hi_limit",
-}
-
-NIKON_SHOT_INFO = {
-    "NikonShotInfo_ShutterCount": "nikon_shutter_count",
-    "NikonShotInfo_VRMode": "nikon_vr_mode",
-    "NikonShotInfo_VibrationReduction": "nikon_vibration_reduction",
-    "NikonShotInfo_VRInfo": "nikon_vr_info",
-    "NikonShotInfo_FocusMode": "nikon_focus_mode",
-    "NikonShotInfo_AF_S_AF_C_Mode": "nikon_af_s_af_c_mode",
-    "NikonShotInfo_AF_AreaMode": "nikon_af_area_mode",
-    "NikonShotInfo_AFPoint": "nikon_af_point",
-    "NikonShotInfo_AFPointsInFocus": "nikon_af_points_in_focus",
-    "NikonShotInfo_FlashSetting": "nikon_flash_setting",
-    "NikonShotInfo_FlashMode": "nikon_flash_mode",
-    "NikonShotInfo_FlashExposureComp": "nikon_flash_exposure_comp",
-    "NikonShotInfo_WhiteBalance": "nikon_white_balance",
-    "NikonShotInfo_WhiteBalanceFineTune": "nikon_wb_fine_tune",
-    "NikonShotInfo_ExposureCompensation": "nikon_exposure_compensation",
-    "NikonShotInfo_ExposureProgram": "nikon_exposure_program",
-    "NikonShotInfo_MeteringMode": "nikon_metering_mode",
-    "NikonShotInfo_ExposureMode": "nikon_exposure_mode",
-    "NikonShotInfo_FocusPosition": "nikon_focus_position",
-    "NikonShotInfo_CameraTemperature": "nikon_camera_temperature",
-    "NikonShotInfo_FocusStepCount": "nikon_focus_step_count",
-    "NikonShotInfo_FocusStepOffset": "nikon_focus_step_offset",
-    "NikonShotInfo_SoftwareVersion": "nikon_software_version",
-    "NikonShotInfo_CrossTypeAFPoints": "nikon_cross_type_af_points",
-    "NikonShotInfo_ActiveDLighting": "nikon_active_d_lighting",
-    "NikonShotInfo_PictureControl": "nikon_picture_control",
-    "NikonShotInfo_WorldTime": "nikon_world_time",
-    "NikonShotInfo_ISOInfo": "nikon_iso_info",
-    "NikonShotInfo_FlashInfo": "nikon_flash_info",
-    "NikonShotInfo_ProgramShift": "nikon_program_shift",
-    "NikonShotInfo_ExposureDifference": "nikon_exposure_difference",
-    "NikonShotInfo_ISOAutoSettings": "nikon_iso_auto_settings",
-    "NikonShotInfo_Bracketing": "nikon_bracketing",
-    "NikonShotInfo_LiveViewAFMode": "nikon_live_view_af_mode",
-    "NikonShotInfo_LiveViewAFAreaMode": "nikon_live_view_af_area",
-    "NikonShotInfo_LiveViewPhaseDetectAF": "nikon_live_view_pd_af",
-    "NikonShotInfo_ElectronicFrontCurtain": "nikon_electronic_front_curtain",
-    "NikonShotInfo_HDRExposureDiff": "nikon_hdr_exposure_diff",
-    "NikonShotInfo_HDRSmoothing": "nikon_hdr_smoothing",
-    "NikonShotInfo_HDRMode": "nikon_hdr_mode",
-    "NikonShotInfo_FlatColorProfile": "nikon_flat_color_profile",
-    "NikonShotInfo_ToneComp": "nikon_tone_comp",
-    "NikonShotInfo_LensAdaptor": "nikon_lens_adaptor",
-    "NikonShotInfo_LensSerialNumber": "nikon_lens_serial",
-    "NikonShotInfo_LensModel": "nikon_lens_model",
-    "NikonShotInfo_LensType": "nikon_lens_type",
-    "NikonShotInfo_LensFStops": "nikon_lens_f_stops",
-    "NikonShotInfo_MinFocalLength": "nikon_min_focal",
-    "NikonShotInfo_MaxFocalLength": "nikon_max_focal",
-    "NikonShotInfo_MaxApertureAtMinFocal": "nikon_max_aperture_min",
-    "NikonShotInfo_MaxApertureAtMaxFocal": "nikon_max_aperture_max",
-    "NikonShotInfo_MCUVersion": "nikon_mcu_version",
-    "NikonShotInfo_AFAreaPointCount": "nikon_af_area_point_count",
-    "NikonShotInfo_PrimaryAFPoint": "nikon_primary_af_point",
-    "NikonShotInfo_AFPointsSelected": "nikon_af_points_selected",
-    "NikonShotInfo_AFPointsInFocusCount": "nikon_af_points_in_focus_count",
-    "NikonShotInfo_BatteryLevel": "nikon_battery_level",
-    "NikonShotInfo_BatteryType": "nikon_battery_type",
-    "NikonShotInfo_CustomSettings": "nikon_custom_settings",
-    "NikonShotInfo_GroupPtnAreaMode": "nikon_group_ptn_area_mode",
-    "NikonShotInfo_VRModeSetting": "nikon_vr_mode_setting",
-    "NikonShotInfo_ImageAuthentication": "nikon_image_authentication",
-    "NikonShotInfo_SerialNumber": "nikon_serial_number",
-    "NikonShotInfo_ColorSpace": "nikon_color_space",
-    "NikonShotInfo_ActiveDLightingSetting": "nikon_adl_setting",
-    "NikonShotInfo_VignetteControl": "nikon_vignette_control",
-    "NikonShotInfo_AutoDistortionControl": "nikon_auto_distortion",
-}
-
-NIKON_COLOR_BALANCE = {
-    "NikonColorBalance_WBRBLevels": "nikon_wb_rb_levels",
-    "NikonColorBalance_WBPreset": "nikon_wb_preset",
-    "NikonColorBalance_WBPresetNum": "nikon_wb_preset_num",
-    "NikonColorBalance_WBCoords": "nikon_wb_coords",
-    "NikonColorBalance_WBRedLevel": "nikon_wb_red",
-    "NikonColorBalance_WBGreenLevel": "nikon_wb_green",
-    "NikonColorBalance_WBBlueLevel": "nikon_wb_blue",
-    "NikonColorBalance_WBColorTemp": "nikon_wb_color_temp",
-    "NikonColorBalance_WBPreFlash": "nikon_wb_preflash",
-    "NikonColorBalance_WBFlashTemp": "nikon_wb_flash_temp",
-    "NikonColorBalance_WBTungsten": "nikon_wb_tungsten",
-    "NikonColorBalance_WBFluorescent": "nikon_wb_fluorescent",
-    "NikonColorBalance_WBDaylight": "nikon_wb_daylight",
-    "NikonColorBalance_WBFlash": "nikon_wb_flash",
-    "NikonColorBalance_WBCloudy": "nikon_wb_cloudy",
-    "NikonColorBalance_WBShade": "nikon_wb_shade",
-    "NikonColorBalance_WBKelvin": "nikon_wb_kelvin",
-}
-
-NIKON_LENS_DATA = {
-    "NikonLensData_LensIDNumber": "nikon_lens_id",
-    "NikonLensData_LensFStops": "nikon_lens_f_stops",
-    "NikonLensData_MinFocalLength": "nikon_min_focal_length",
-    "NikonLensData_MaxFocalLength": "nikon_max_focal_length",
-    "NikonLensData_MaxApertureAtMinFocal": "nikon_max_aperture_min",
-    "NikonLensData_MaxApertureAtMaxFocal": "nikon_max_aperture_max",
-    "NikonLensData_MCUVersion": "nikon_mcu_version",
-    "NikonLensData_EffectiveMaxAperture": "nikon_effective_max_aperture",
-    "NikonLensData_DistortionControl": "nikon_distortion_control",
-    "NikonLensData_ActiveDLighting": "nikon_lens_active_d_lighting",
-    "NikonLensData_VignetteControl": "nikon_vignette_control",
-    "NikonLensData_AutoDistortionControl": "nikon_auto_distortion",
-    "NikonLensData_LensKind": "nikon_lens_kind",
-    "NikonLensData_LensSerialNumber": "nikon_lens_serial",
-    "NikonLensData_LensModel": "nikon_lens_model",
-    "NikonLensData_Aperture": "nikon_lens_aperture",
-    "NikonLensData_FocalLength": "nikon_focal_length",
-    "NikonLensData_FocusDistance": "nikon_focus_distance",
-    "NikonLensData_FocusMode": "nikon_lens_focus_mode",
-    "NikonLensData_RangeFinderMode": "nikon_range_finder_mode",
-    "NikonLensData_AFProjectDistance": "nikon_af_project_distance",
-}
-
-NIKON_FLASH_INFO = {
-    "NikonFlashInfo_FlashSetting": "nikon_flash_setting",
-    "NikonFlashInfo_FlashType": "nikon_flash_type",
-    "NikonFlashInfo_FlashMode": "nikon_flash_mode",
-    "NikonFlashInfo_FlashExposureComp": "nikon_flash_exposure_comp",
-    "NikonFlashInfo_ExternalFlashFlags": "nikon_external_flash_flags",
-    "NikonFlashInfo_FlashControlCommanderMode": "nikon_flash_commander_mode",
-    "NikonFlashInfo_FlashOutput": "nikon_flash_output",
-    "NikonFlashInfo_FlashCompensation": "nikon_flash_compensation",
-    "NikonFlashInfo_FlashColorFilter": "nikon_flash_color_filter",
-    "NikonFlashInfo_FlashGroupACompensation": "nikon_flash_group_a_comp",
-    "NikonFlashInfo_FlashGroupBCompensation": "nikon_flash_group_b_comp",
-    "NikonFlashInfo_FlashGroupCCompensation": "nikon_flash_group_c_comp",
-    "NikonFlashInfo_FlashGroupDCompensation": "nikon_flash_group_d_comp",
-    "NikonFlashInfo_FlashExposureIndicator": "nikon_flash_indicator",
-    "NikonFlashInfo_FlashManualPower": "nikon_flash_manual_power",
-    "NikonFlashInfo_FlashRepeating": "nikon_flash_repeating",
-    "NikonFlashInfo_FlashMaster": "nikon_flash_master",
-    "NikonFlashInfo_FlashRemote": "nikon_flash_remote",
-    "NikonFlashInfo_FlashBuiltin": "nikon_flash_builtin",
-}
-
-NIKON_AF_INFO = {
-    "NikonAFInfo_AFAreaMode": "nikon_af_area_mode",
-    "NikonAFInfo_AFPoint": "nikon_af_point",
-    "NikonAFInfo_AFPointsInFocus": "nikon_af_points_in_focus",
-    "NikonAFInfo_ContrastDetectAF": "nikon_contrast_detect_af",
-    "NikonAFInfo_AFAreaXPosition": "nikon_af_area_x",
-    "NikonAFInfo_AFAreaYPosition": "nikon_af_area_y",
-    "NikonAFInfo_AFAreaWidth": "nikon_af_area_width",
-    "NikonAFInfo_AFAreaHeight": "nikon_af_area_height",
-    "NikonAFInfo_PrimaryAFPoint": "nikon_primary_af_point",
-    "NikonAFInfo_AFPointSelected": "nikon_af_point_selected",
-    "NikonAFInfo_AFPointUsed": "nikon_af_point_used",
-    "NikonAFInfo_AFPointIllumination": "nikon_af_point_illumination",
-    "NikonAFInfo_AFFineTune": "nikon_af_fine_tune",
-    "NikonAFInfo_AFFineTuneIndex": "nikon_af_fine_tune_index",
-    "NikonAFInfo_AFFineTuneValue": "nikon_af_fine_tune_value",
-    "NikonAFInfo_AFPointsGroup": "nikon_af_points_group",
-    "NikonAFInfo_AFPointModeSetting": "nikon_af_point_mode_setting",
-    "NikonAFInfo_AFPointActivation": "nikon_af_point_activation",
-}
-
-NIKON_PICTURE_CONTROL = {
-    "NikonPictureControl_PictureControlName": "nikon_picture_control_name",
-    "NikonPictureControl_PictureControlBase": "nikon_picture_control_base",
-    "NikonPictureControl_PictureControlAdjust": "nikon_picture_control_adjust",
-    "NikonPictureControl_PictureControlQuickAdjust": "nikon_picture_control_quick_adjust",
-    "NikonPictureControl_Sharpness": "nikon_sharpness",
-    "NikonPictureControl_Contrast": "nikon_contrast",
-    "NikonPictureControl_Brightness": "nikon_brightness",
-    "NikonPictureControl_Saturation": "nikon_saturation",
-    "NikonPictureControl_HueAdjustment": "nikon_hue_adjustment",
-    "NikonPictureControl_FilterEffect": "nikon_filter_effect",
-    "NikonPictureControl_ToningEffect": "nikon_toning_effect",
-    "NikonPictureControl_ActivePictureControl": "nikon_active_pc",
-    "NikonPictureControl_Clarity": "nikon_clarity",
-    "NikonPictureControl_MidRangeSharpness": "nikon_mid_range_sharpness",
-    "NikonPictureControl_Vignette": "nikon_vignette",
-    "NikonPictureControl_ColorBoost": "nikon_color_boost",
-    "NikonPictureControl_ToneCurve": "nikon_tone_curve_pc",
-}
-
-SONY_CAMERA_SETTINGS = {
-    "SonyModelID": "sony_model_id",
-    "SonyCameraSettings_DriveMode": "sony_drive_mode",
-    "SonyCameraSettings_WhiteBalanceFineTune": "sony_wb_fine_tune",
-    "SonyCameraSettings_FocusMode": "sony_focus_mode",
-    "SonyCameraSettings_AFAreaMode": "sony_af_area_mode",
-    "SonyCameraSettings_LocalAFAreaPoint": "sony_local_af_point",
-    "SonyCameraSettings_MeteringMode": "sony_metering_mode",
-    "SonyCameraSettings_ISOSetting": "sony_iso_setting",
-    "SonyCameraSettings_ExposureCompensation": "sony_exposure_compensation",
-    "SonyCameraSettings_DynamicRangeOptimizer": "sony_dro_level",
-    "SonyCameraSettings_ImageStabilization": "sony_image_stabilization",
-    "SonyCameraSettings_ColorMode": "sony_color_mode",
-    "SonyCameraSettings_ColorSpace": "sony_color_space",
-    "SonyCameraSettings_Sharpness": "sony_sharpness",
-    "SonyCameraSettings_Contrast": "sony_contrast",
-    "SonyCameraSettings_Saturation": "sony_saturation",
-    "SonyCameraSettings_ZoneMatching": "sony_zone_matching",
-    "SonyCameraSettings_ColorTemperature": "sony_color_temperature",
-    "SonyCameraSettings_LensSpec": "sony_lens_spec",
-    "SonyCameraSettings_LensMount": "sony_lens_mount",
-    "SonyCameraSettings_LensFormat": "sony_lens_format",
-    "SonyCameraSettings_FocusArea": "sony_focus_area",
-    "SonyCameraSettings_CenterSpot": "sony_center_spot",
-    "SonyCameraSettings_FlashLevel": "sony_flash_level",
-    "SonyCameraSettings_RedEyeReduction": "sony_red_eye_reduction",
-    "SonyCameraSettings_LongExposureNoiseReduction": "sony_long_exp_nr",
-    "SonyCameraSettings_HighISONoiseReduction": "sony_high_iso_nr",
-    "SonyCameraSettings_ISORange": "sony_iso_range",
-    "SonyCameraSettings_FilterEffect": "sony_filter_effect",
-    "SonyCameraSettings_ToningEffect": "sony_toning_effect",
-    "SonyCameraSettings_CreativeStyle": "sony_creative_style",
-    "SonyCameraSettings_VariableLowPassFilter": "sony_v_lpf",
-    "SonyCameraSettings_PanoramaWidth": "sony_pano_width",
-    "SonyCameraSettings_PanoramaHeight": "sony_pano_height",
-    "SonyCameraSettings_PanoramaDirection": "sony_pano_direction",
-    "SonyCameraSettings_HighISOHighNoiseReduction": "sony_hi_iso_h_nr",
-    "SonyCameraSettings_LensCompensation": "sony_lens_comp",
-    "SonyCameraSettings_WideFocusIndicator": "sony_wide_focus",
-    "SonyCameraSettings_FocusPosition": "sony_focus_position",
-    "SonyCameraSettings_FNumber": "sony_f_number",
-    "SonyCameraSettings_ExposureTime": "sony_exposure_time",
-    "SonyCameraSettings_RemoteCommander": "sony_remote_commander",
-    "SonyCameraSettings_AutoHDR": "sony_auto_hdr",
-    "SonyCameraSettings_HDRLevel": "sony_hdr_level",
-    "SonyCameraSettings_FocusCheck": "sony_focus_check",
-    "SonyCameraSettings_AFIlluminator": "sony_af_illuminator",
-    "SonyCameraSettings_SmartTeleconverter": "sony_smart_teleconverter",
-    "SonyCameraSettings_FaceDetection": "sony_face_detection",
-    "SonyCameraSettings_SmileShutter": "sony_smile_shutter",
-    "SonyCameraSettings_AntiMotionBlur": "sony_anti_motion_blur",
-    "SonyCameraSettings_TrackingFocus": "sony_tracking_focus",
-    "SonyCameraSettings_GPSSettings": "sony_gps_settings",
-    # Modern Sony A7 IV, A7R V, A1, FX3 series additions (2020-2024)
-    "SonyCameraSettings_EyeDetection": "sony_eye_detection",
-    "SonyCameraSettings_LeftEyeDetection": "sony_left_eye_detection",
-    "SonyCameraSettings_RightEyeDetection": "sony_right_eye_detection",
-    "SonyCameraSettings_AnimalEyeDetection": "sony_animal_eye_detection",
-    "SonyCameraSettings_BirdEyeDetection": "sony_bird_eye_detection",
-    "SonyCameraSettings_RealTimeTracking": "sony_real_time_tracking",
-    "SonyCameraSettings_TouchTracking": "sony_touch_tracking",
-    "SonyCameraSettings_TouchFocus": "sony_touch_focus",
-    "SonyCameraSettings_TouchShutter": "sony_touch_shutter",
-    "SonyCameraSettings_FocusMap": "sony_focus_map",
-    "SonyCameraSettings_ActiveModeStabilization": "sony_active_mode_stabilization",
-    "SonyCameraSettings_GyroStabilization": "sony_gyro_stabilization",
-    "SonyCameraSettings_BreathingCompensation": "sony_breathing_compensation",
-    "SonyCameraSettings_LogShooting": "sony_log_shooting",
-    "SonyCameraSettings_SLog2": "sony_slog2",
-    "SonyCameraSettings_SLog3": "sony_slog3",
-    "SonyCameraSettings_HLG": "sony_hlg",
-    "SonyCameraSettings_RAWOutput": "sony_raw_output",
-    "SonyCameraSettings_4KOutput": "sony_4k_output",
-    "SonyCameraSettings_HDROutput": "sony_hdr_output",
-    "SonyCameraSettings_ProxyRecording": "sony_proxy_recording",
-    "SonyCameraSettings_DualVideoRecording": "sony_dual_video_recording",
-    "SonyCameraSettings_AnimalDetection": "sony_animal_detection",
-    "SonyCameraSettings_BirdDetection": "sony_bird_detection",
-    "SonyCameraSettings_InsectDetection": "sony_insect_detection",
-    "SonyCameraSettings_CarTrainDetection": "sony_car_train_detection",
-    "SonyCameraSettings_AirplaneDetection": "sony_airplane_detection",
-}
-
-SONY_AF_INFO = {
-    "SonyAFInfo_AFPointSelected": "sony_af_point_selected",
-    "SonyAFInfo_AFPointsUsed": "sony_af_points_used",
-    "SonyAFInfo_AFTracking": "sony_af_tracking",
-    "SonyAFInfo_FocusPosition": "sony_focus_position",
-    "SonyAFInfo_AFMode": "sony_af_mode",
-    "SonyAFInfo_AF illuminator": "sony_af_illuminator",
-    "SonyAFInfo_AFAreaSettings": "sony_af_area_settings",
-    "SonyAFInfo_FullTimeAF": "sony_full_time_af",
-    "SonyAFInfo_AFSubarea": "sony_af_subarea",
-    "SonyAFInfo_FocusMode2": "sony_focus_mode_2",
-    "SonyAFInfo_AFAreaMode2": "sony_af_area_mode_2",
-    "SonyAFInfo_LocalAFAreaPoint2": "sony_local_af_point_2",
-    "SonyAFInfo_FocusPosition2": "sony_focus_position_2",
-    "SonyAFInfo_FocusTracking": "sony_focus_tracking",
-    "SonyAFInfo_ExpandFlexibleSpot": "sony_expand_flexible_spot",
-    "SonyAFInfo_LockOnAF": "sony_lock_on_af",
-    "SonyAFInfo_ExpandAFArea": "sony_expand_af_area",
-    "SonyAFInfo_CenterLockAFArea": "sony_center_lock_af_area",
-}
-
-SONY_FILE_INFO = {
-    "SonyShutterCount": "sony_shutter_count",
-    "SonyInternalSerialNumber": "sony_internal_serial_number",
-    "SonyLensSerialNumber": "sony_lens_serial_number",
-    "SonyBodySerialNumber": "sony_body_serial_number",
-    "SonyFirmwareVersion": "sony_firmware_version",
-    "SonyExposureCompensation2": "sony_exposure_compensation_2",
-    "SonyDateTime": "sony_date_time",
-    "SonyImageNumber": "sony_image_number",
-    "SonyImageSequence": "sony_image_sequence",
-    "SonyQuality2": "sony_quality_2",
-    "SonyQuality3": "sony_quality_3",
-    "SonyImageWidth": "sony_image_width",
-    "SonyImageHeight": "sony_image_height",
-    "SonyImageSize": "sony_image_size",
-    "SonyFileFormat": "sony_file_format",
-    "SonyRawFormat": "sony_raw_format",
-    "SonyRating": "sony_rating",
-    "SonyColorMode": "sony_color_mode_2",
-    "SonyFullPanoramaShootingData": "sony_pano_data",
-    "SonyMultiBurstImageWidth": "sony_multiburst_width",
-    "SonyMultiBurstImageHeight": "sony_multiburst_height",
-    "SonyMultiBurstMode": "sony_multiburst_mode",
-    "SonyPanorama3DData": "sony_pano_3d_data",
-    "SonyMeteringMode2": "sony_metering_mode_2",
-    "SonyExposureMode2": "sony_exposure_mode_2",
-    "SonyWhiteBalance2": "sony_white_balance_2",
-    "SonyFocusMode2": "sony_focus_mode_2",
-}
-
-FUJIFILM_CAMERA_SETTINGS = {
-    # Version & Identity
-    "FujiFilmVersion": "fuji_version",
-    "FujiFilmSerialNumber": "fuji_serial_number",
-    "FujiFilmInternalSerialNumber": "fuji_internal_serial",
-    "FujiFilmFirmwareVersion": "fuji_firmware",
-    "FujiFilmFirmwareDate": "fuji_firmware_date",
-    "FujiFilmModelID": "fuji_model_id",
-    "FujiFilmCameraID": "fuji_camera_id",
-    "FujiFilmROMVersion": "fuji_rom_version",
-    # Quality & Image Settings
-    "FujiFilmQuality": "fuji_quality",
-    "FujiFilmQualitySetting": "fuji_quality_setting",
-    "FujiFilmImageQuality": "fuji_image_quality",
-    "FujiFilmImageSize": "fuji_image_size",
-    "FujiFilmImageWidth": "fuji_image_width",
-    "FujiFilmImageHeight": "fuji_image_height",
-    "FujiFilmAspectRatio": "fuji_aspect_ratio",
-    "FujiFilmCroppedImageWidth": "fuji_cropped_width",
-    "FujiFilmCroppedImageHeight": "fuji_cropped_height",
-    "FujiFilmRawImageWidth": "fuji_raw_width",
-    "FujiFilmRawImageHeight": "fuji_raw_height",
-    "FujiFilmRawImageCropLeftMargin": "fuji_raw_crop_left",
-    "FujiFilmRawImageCropTopMargin": "fuji_raw_crop_top",
-    "FujiFilmRawImageCropWidth": "fuji_raw_crop_width",
-    "FujiFilmRawImageCropHeight": "fuji_raw_crop_height",
-    # Sharpness & Clarity
-    "FujiFilmSharpness": "fuji_sharpness",
-    "FujiFilmSharpnessSetting": "fuji_sharpness_setting",
-    "FujiFilmSharpnessWarning": "fuji_sharpness_warning",
-    "FujiFilmHighlightTone": "fuji_highlight_tone",
-    "FujiFilmShadowTone": "fuji_shadow_tone",
-    "FujiFilmClarity": "fuji_clarity",
-    "FujiFilmClarityValue": "fuji_clarity_value",
-    "FujiFilmCenterSharpnessCorrection": "fuji_center_sharpness",
-    "FujiFilmEdgeSharpnessCorrection": "fuji_edge_sharpness",
-    # White Balance - Comprehensive
-    "FujiFilmWhiteBalance": "fuji_white_balance",
-    "FujiFilmWhiteBalanceMode": "fuji_wb_mode",
-    "FujiFilmWhiteBalanceFine": "fuji_wb_fine",
-    "FujiFilmWhiteBalanceFineTune": "fuji_wb_fine_tune",
-    "FujiFilmWhiteBalanceRed": "fuji_wb_red",
-    "FujiFilmWhiteBalanceBlue": "fuji_wb_blue",
-    "FujiFilmWhiteBalanceGreen": "fuji_wb_green",
-    "FujiFilmWhiteBalanceShiftR": "fuji_wb_shift_r",
-    "FujiFilmWhiteBalanceShiftB": "fuji_wb_shift_b",
-    "FujiFilmWBShiftAB": "fuji_wb_shift_ab",
-    "FujiFilmWBShiftGM": "fuji_wb_shift_gm",
-    "FujiFilmCustomWBSetting": "fuji_custom_wb_setting",
-    "FujiFilmCustomWB1": "fuji_custom_wb_1",
-    "FujiFilmCustomWB2": "fuji_custom_wb_2",
-    "FujiFilmCustomWB3": "fuji_custom_wb_3",
-    "FujiFilmAutoWBRatio": "fuji_auto_wb_ratio",
-    "FujiFilmExactWhiteBalanceTemp": "fuji_exact_wb_temp",
-    "FujiFilmFlashWhiteBalance": "fuji_flash_wb",
-    # Color & Saturation
-    "FujiFilmSaturation": "fuji_saturation",
-    "FujiFilmSaturationSetting": "fuji_saturation_setting",
-    "FujiFilmContrast": "fuji_contrast",
-    "FujiFilmContrastSetting": "fuji_contrast_setting",
-    "FujiFilmColorTemperature": "fuji_color_temperature",
-    "FujiFilmColorProfile": "fuji_color_profile",
-    "FujiFilmColorSpace": "fuji_color_space",
-    "FujiFilmColorMode": "fuji_color_mode",
-    "FujiFilmColorChromeFXBlue": "fuji_color_chrome_fx_blue",
-    "FujiFilmColorBWAdjustment": "fuji_color_bw_adj",
-    "FujiFilmBWFilter": "fuji_bw_filter",
-    "FujiFilmBWTone": "fuji_bw_tone",
-    "FujiFilmBWEffect": "fuji_bw_effect",
-    "FujiFilmBWAdjustmentR": "fuji_bw_adj_r",
-    "FujiFilmBWAdjustmentYe": "fuji_bw_adj_ye",
-    "FujiFilmBWAdjustmentG": "fuji_bw_adj_g",
-    "FujiFilmBWAdjustmentCy": "fuji_bw_adj_cy",
-    "FujiFilmBWAdjustmentB": "fuji_bw_adj_b",
-    "FujiFilmBWAdjustmentM": "fuji_bw_adj_m",
-    # Flash
-    "FujiFilmFlashMode": "fuji_flash_mode",
-    "FujiFilmFlashStrength": "fuji_flash_strength",
-    "FujiFilmFlashFired": "fuji_flash_fired",
-    "FujiFilmFlashExposureComp": "fuji_flash_ec",
-    "FujiFilmFlashExposureCompSet": "fuji_flash_ec_set",
-    "FujiFilmExternalFlash": "fuji_external_flash",
-    "FujiFilmExternalFlashModelID": "fuji_ext_flash_model",
-    "FujiFilmExternalFlashSerialNo": "fuji_ext_flash_serial",
-    "FujiFilmFlashGNDistance": "fuji_flash_gn_distance",
-    "FujiFilmFlashGNValue": "fuji_flash_gn_value",
-    "FujiFilmRedEyeReduction": "fuji_red_eye_reduction",
-    "FujiFilmHighSpeedSync": "fuji_high_speed_sync",
-    "FujiFilmFlashCommander": "fuji_flash_commander",
-    "FujiFilmTTLFlashMode": "fuji_ttl_flash_mode",
-    "FujiFilmFlashControlMode": "fuji_flash_control_mode",
-    # Macro & Focus
-    "FujiFilmMacro": "fuji_macro",
-    "FujiFilmMacroMode": "fuji_macro_mode",
-    "FujiFilmFocusMode": "fuji_focus_mode",
-    "FujiFilmFocusModeSetting": "fuji_focus_mode_setting",
-    "FujiFilmAFMode": "fuji_af_mode",
-    "FujiFilmAFAreaMode": "fuji_af_area_mode",
-    "FujiFilmAFPointCount": "fuji_af_point_count",
-    "FujiFilmAFPointSelected": "fuji_af_point_selected",
-    "FujiFilmAFPointActive": "fuji_af_point_active",
-    "FujiFilmAFPointInFocus": "fuji_af_point_in_focus",
-    "FujiFilmAFPointXPosition": "fuji_af_point_x",
-    "FujiFilmAFPointYPosition": "fuji_af_point_y",
-    "FujiFilmAFPointWidth": "fuji_af_point_width",
-    "FujiFilmAFPointHeight": "fuji_af_point_height",
-    "FujiFilmAFPrioritySetting": "fuji_af_priority",
-    "FujiFilm_AFCSettings": "fuji_afc_settings",
-    "FujiFilmAFCSensitivity": "fuji_afc_sensitivity",
-    "FujiFilmAFCSpeedTracking": "fuji_afc_speed",
-    "FujiFilmAFCZoneArea": "fuji_afc_zone_area",
-    "FujiFilmAFSPriority": "fuji_afs_priority",
-    "FujiFilmAFCPriority": "fuji_afc_priority",
-    "FujiFilmFocusDistance": "fuji_focus_distance",
-    "FujiFilmFocusDistanceActual": "fuji_focus_distance_actual",
-    "FujiFilmFocusPosition": "fuji_focus_position",
-    "FujiFilmFocusPositionHorizontal": "fuji_focus_pos_h",
-    "FujiFilmFocusPositionVertical": "fuji_focus_pos_v",
-    "FujiFilmFocusRangeMin": "fuji_focus_range_min",
-    "FujiFilmFocusRangeMax": "fuji_focus_range_max",
-    "FujiFilmAutoFocusSetting": "fuji_af_setting",
-    "FujiFilmFocusSettings": "fuji_focus_settings",
-    "FujiFilmFocusLimiter": "fuji_focus_limiter",
-    "FujiFilmFocusPeak": "fuji_focus_peak",
-    "FujiFilmFocusPeakHighlight": "fuji_focus_peak_highlight",
-    "FujiFilmFocusPeakLevel": "fuji_focus_peak_level",
-    "FujiFilmManualFocusAssist": "fuji_mf_assist",
-    "FujiFilmFocusCheckMode": "fuji_focus_check_mode",
-    "FujiFilmInstantAFMode": "fuji_instant_af",
-    "FujiFilmPreAF": "fuji_pre_af",
-    "FujiFilmAFIlluminator": "fuji_af_illuminator",
-    "FujiFilmFaceDetectionAFMode": "fuji_face_af_mode",
-    "FujiFilmEyeDetectionAF": "fuji_eye_af",
-    "FujiFilmEyeDetectionAFSelection": "fuji_eye_af_selection",
-    "FujiFilmAnimalEyeAF": "fuji_animal_eye_af",
-    "FujiFilmBirdEyeAF": "fuji_bird_eye_af",
-    "FujiFilmVehicleAF": "fuji_vehicle_af",
-    "FujiFilmSubjectTrackingAF": "fuji_subject_tracking_af",
-    # Slow Sync & Timing
-    "FujiFilm_SlowSync": "fuji_slow_sync",
-    "FujiFilmSlowSync_FrontCurtain": "fuji_slow_sync_front",
-    "FujiFilmSlowSync_RearCurtain": "fuji_slow_sync_rear",
-    # Picture & Scene Modes
-    "FujiFilmPictureMode": "fuji_picture_mode",
-    "FujiFilmSceneMode": "fuji_scene_mode",
-    "FujiFilmSceneRecognition": "fuji_scene_recognition",
-    "FujiFilmSceneRecognitionType": "fuji_scene_recognition_type",
-    "FujiFilmAutoMode": "fuji_auto_mode",
-    "FujiFilmAdvancedFilter": "fuji_advanced_filter",
-    "FujiFilmAdvancedFilterEffect": "fuji_adv_filter_effect",
-    # Bracketing
-    "FujiFilmContinuousBracketing": "fuji_continuous_bracketing",
-    "FujiFilmBracketStep": "fuji_bracket_step",
-    "FujiFilmBracketOrder": "fuji_bracket_order",
-    "FujiFilmBracketShotNumber": "fuji_bracket_shot_no",
-    "FujiFilmBracketSequence": "fuji_bracket_sequence",
-    "FujiFilmAEBracketing": "fuji_ae_bracketing",
-    "FujiFilmWBBracketing": "fuji_wb_bracketing",
-    "FujiFilmISOBracketing": "fuji_iso_bracketing",
-    "FujiFilmFilmSimBracketing": "fuji_filmsim_bracketing",
-    "FujiFilmDRBracketing": "fuji_dr_bracketing",
-    "FujiFilmFocusBracketing": "fuji_focus_bracketing",
-    "FujiFilmFocusBracketStepSize": "fuji_focus_bracket_step",
-    "FujiFilmFocusBracketFrames": "fuji_focus_bracket_frames",
-    # Warnings
-    "FujiFilm_BlurWarning": "fuji_blur_warning",
-    "FujiFilmFocusWarning": "fuji_focus_warning",
-    "FujiFilmExposureWarning": "fuji_exposure_warning",
-    "FujiFilmTemperatureWarning": "fuji_temperature_warning",
-    "FujiFilmStorageWarning": "fuji_storage_warning",
-    # Dynamic Range
-    "FujiFilm_DynamicRange": "fuji_dynamic_range",
-    "FujiFilmDynamicRangeSetting": "fuji_dr_setting",
-    "FujiFilmDynamicRangePriority": "fuji_dr_priority",
-    "FujiFilmDRange": "fuji_d_range",
-    "FujiFilmDRangeMode": "fuji_d_range_mode",
-    "FujiFilmDRangePriority": "fuji_d_range_priority",
-    "FujiFilmAutoDynamicRange": "fuji_auto_dr",
-    "FujiFilmDynamicRangeExpansion": "fuji_dr_expansion",
-    "FujiFilmMinDynamicRange": "fuji_min_dr",
-    "FujiFilmMaxDynamicRange": "fuji_max_dr",
-    "FujiFilmDevelopmentDynamicRange": "fuji_dev_dr",
-    # Film Mode & Simulation (Core)
-    "FujiFilmFilmMode": "fuji_film_mode",
-    "FujiFilmFilmModeSetting": "fuji_film_mode_setting",
-    "FujiFilmFilmSimulation": "fuji_film_simulation",
-    "FujiFilmFilmSimulationMode": "fuji_film_sim_mode",
-    "FujiFilmFilmSimulationChrome": "fuji_film_sim_chrome",
-    # Grain & Texture
-    "FujiFilmGrainEffect": "fuji_grain_effect",
-    "FujiFilmGrainEffectSize": "fuji_grain_effect_size",
-    "FujiFilmGrainEffectRoughness": "fuji_grain_roughness",
-    "FujiFilmGrainAmount": "fuji_grain_amount",
-    "FujiFilmGrainFrequency": "fuji_grain_frequency",
-    # Color Chrome
-    "FujiFilmColorChromeEffect": "fuji_color_chrome_effect",
-    "FujiFilmColorChromeFXEffect": "fuji_color_chrome_fx",
-    "FujiFilmColorChromeFXBlueDepth": "fuji_cc_fx_blue_depth",
-    "FujiFilmColorChromeLevel": "fuji_color_chrome_level",
-    # Shutter Settings
-    "FujiFilmShutterType": "fuji_shutter_type",
-    "FujiFilmShutterSpeed": "fuji_shutter_speed",
-    "FujiFilmElectronicShutter": "fuji_electronic_shutter",
-    "FujiFilmMechanicalShutter": "fuji_mechanical_shutter",
-    "FujiFilmElectronicFrontCurtain": "fuji_elec_front_curtain",
-    "FujiFilmFlickerReduction": "fuji_flicker_reduction",
-    # Image Stabilization
-    "FujiFilm_ImageStabilization": "fuji_image_stabilization",
-    "FujiFilmImageStabilizationMode": "fuji_is_mode",
-    "FujiFilmOISMode": "fuji_ois_mode",
-    "FujiFilmIBISMode": "fuji_ibis_mode",
-    "FujiFilmBoostStabilization": "fuji_boost_stabilization",
-    "FujiFilmVideoImageStabilization": "fuji_video_is",
-    # Lens Modulation & Corrections
-    "FujiFilm_LensModulationOptimizer": "fuji_lmo",
-    "FujiFilmLensModulationOptLevel": "fuji_lmo_level",
-    "FujiFilmDistortionCorrection": "fuji_distortion_correction",
-    "FujiFilmPeripheralIllumCorrection": "fuji_peripheral_illum",
-    "FujiFilmColorShadingCorrection": "fuji_color_shading",
-    "FujiFilmDiffringCorrection": "fuji_diffraction_correction",
-    "FujiFilmGeometryCorrection": "fuji_geometry_correction",
-    # Medium Format Specific
-    "FujiFilm_MediumFormatLensAdapter": "fuji_medium_format_adapter",
-    "FujiFilmGFXMode": "fuji_gfx_mode",
-    "FujiFilmGFXSensorMode": "fuji_gfx_sensor_mode",
-    "FujiFilmPixelShiftMode": "fuji_pixel_shift_mode",
-    "FujiFilmPixelShiftShots": "fuji_pixel_shift_shots",
-    "FujiFilmMultiShotHDR": "fuji_multi_shot_hdr",
-    # Metering
-    "FujiFilm_Photometry": "fuji_photometry",
-    "FujiFilmMeteringMode": "fuji_metering_mode",
-    "FujiFilmMeteringAreas": "fuji_metering_areas",
-    "FujiFilmSpotMeteringPosition": "fuji_spot_metering_pos",
-    "FujiFilmMultiMeteringPattern": "fuji_multi_metering",
-    "FujiFilmFaceAwareMetering": "fuji_face_aware_metering",
-    # ISO Settings
-    "FujiFilm_ExposureIndex": "fuji_exposure_index",
-    "FujiFilm_BaseSensitivity": "fuji_base_sensitivity",
-    "FujiFilmBaseISO": "fuji_base_iso",
-    "FujiFilmAutoISO": "fuji_auto_iso",
-    "FujiFilmAutoISOMin": "fuji_auto_iso_min",
-    "FujiFilmAutoISOMax": "fuji_auto_iso_max",
-    "FujiFilmAutoISOMinShutterSpeed": "fuji_auto_iso_min_ss",
-    "FujiFilm_ISOMode": "fuji_iso_mode",
-    "FujiFilmISOSetting": "fuji_iso_setting",
-    "FujiFilmISOValue": "fuji_iso_value",
-    "FujiFilmISORating": "fuji_iso_rating",
-    "FujiFilmISOAuto": "fuji_iso_auto",
-    "FujiFilmOutputISO": "fuji_output_iso",
-    "FujiFilmInputISO": "fuji_input_iso",
-    "FujiFilmISOExpansion": "fuji_iso_expansion",
-    # Sharpness continued
-    "FujiFilm_DefaultSharpness": "fuji_default_sharpness",
-    "FujiFilm_ColorClarity": "fuji_color_clarity",
-    # Tone Curve
-    "FujiFilm_ToneCurve": "fuji_tone_curve",
-    "FujiFilm_ToneMapping": "fuji_tone_mapping",
-    "FujiFilmToneCurveShadow": "fuji_tone_shadow",
-    "FujiFilmToneCurveHighlight": "fuji_tone_highlight",
-    "FujiFilmToneCurveMidtone": "fuji_tone_midtone",
-    # Noise Reduction
-    "FujiFilm_LongExposureReduction": "fuji_long_exp_reduction",
-    "FujiFilm_HighISONoiseReduction": "fuji_high_iso_nr",
-    "FujiFilmHighISONRLevel": "fuji_high_iso_nr_level",
-    "FujiFilmLongExposureNR": "fuji_long_exposure_nr",
-    "FujiFilmMultiFrameNR": "fuji_multi_frame_nr",
-    "FujiFilmNoiseReduction": "fuji_noise_reduction",
-    "FujiFilmNoiseReductionLevel": "fuji_nr_level",
-    # White Balance Shift
-    "FujiFilm_WhiteBalanceShift": "fuji_wb_shift",
-    "FujiFilmWBShift": "fuji_wb_shift_value",
-    # Electronic Level
-    "FujiFilm_ElectronicLevel": "fuji_electronic_level",
-    "FujiFilmElectronicLevelRoll": "fuji_elec_level_roll",
-    "FujiFilmElectronicLevelPitch": "fuji_elec_level_pitch",
-    # Filter Settings
-    "FujiFilm_FilterSettings": "fuji_filter_settings",
-    "FujiFilmFilterType": "fuji_filter_type",
-    "FujiFilmFilterStrength": "fuji_filter_strength",
-    "FujiFilmDigitalFilter": "fuji_digital_filter",
-    "FujiFilmAdvFilterSettings": "fuji_adv_filter_settings",
-    # Face & Subject Detection
-    "FujiFilm_FaceDetection": "fuji_face_detection",
-    "FujiFilmFaceDetectionMode": "fuji_face_detection_mode",
-    "FujiFilmFaceDetectionCount": "fuji_face_count",
-    "FujiFilmFacePositions": "fuji_face_positions",
-    "FujiFilmFace1Position": "fuji_face_1_pos",
-    "FujiFilmFace2Position": "fuji_face_2_pos",
-    "FujiFilmFace3Position": "fuji_face_3_pos",
-    "FujiFilmFace4Position": "fuji_face_4_pos",
-    "FujiFilmFace5Position": "fuji_face_5_pos",
-    "FujiFilmFaceRecognition": "fuji_face_recognition",
-    "FujiFilmFaceRegistration": "fuji_face_registration",
-    "FujiFilm_PetDetection": "fuji_pet_detection",
-    "FujiFilmAnimalDetection": "fuji_animal_detection",
-    "FujiFilmSubjectDetection": "fuji_subject_detection",
-    "FujiFilmSubjectDetectionType": "fuji_subject_type",
-    # Split Image
-    "FujiFilm_DigitalSplit": "fuji_digital_split",
-    "FujiFilmDigitalSplitImage": "fuji_digital_split_image",
-    # Direct LYD
-    "FujiFilm_DirectLYD": "fuji_direct_lyd",
-    # Drive Mode
-    "FujiFilmDriveMode": "fuji_drive_mode",
-    "FujiFilmDriveSetting": "fuji_drive_setting",
-    "FujiFilmSequenceNumber": "fuji_sequence_number",
-    "FujiFilmFrameNumber": "fuji_frame_number",
-    "FujiFilmContinuousShooting": "fuji_continuous_shooting",
-    "FujiFilmContinuousMode": "fuji_continuous_mode",
-    "FujiFilmContinuousSpeed": "fuji_continuous_speed",
-    "FujiFilmBurstMode": "fuji_burst_mode",
-    "FujiFilmBurstSpeed": "fuji_burst_speed",
-    "FujiFilmBurstCount": "fuji_burst_count",
-    "FujiFilmPreShot": "fuji_pre_shot",
-    # Self Timer
-    "FujiFilmSelfTimer": "fuji_self_timer",
-    "FujiFilmSelfTimer2Sec": "fuji_self_timer_2s",
-    "FujiFilmSelfTimer10Sec": "fuji_self_timer_10s",
-    # Interval & Time-lapse
-    "FujiFilmIntervalShooting": "fuji_interval_shooting",
-    "FujiFilmIntervalTime": "fuji_interval_time",
-    "FujiFilmTimeLapse": "fuji_time_lapse",
-    "FujiFilmTimeLapseInterval": "fuji_timelapse_interval",
-    "FujiFilmTimeLapseFrameCount": "fuji_timelapse_frames",
-    # Remote & Tether
-    "FujiFilmRemoteControl": "fuji_remote_control",
-    "FujiFilmRemoteMode": "fuji_remote_mode",
-    "FujiFilmWiFiMode": "fuji_wifi_mode",
-    "FujiFilmBluetoothMode": "fuji_bluetooth_mode",
-    "FujiFilmTetherShooting": "fuji_tether_shooting",
-    # Exposure
-    "FujiFilmExposureMode": "fuji_exposure_mode",
-    "FujiFilmExposureProgram": "fuji_exposure_program",
-    "FujiFilmExposureCompensation": "fuji_exposure_comp",
-    "FujiFilmExposureDifference": "fuji_exposure_diff",
-    "FujiFilmExposureValue": "fuji_exposure_value",
-    "FujiFilmAELock": "fuji_ae_lock",
-    "FujiFilmAELockMode": "fuji_ae_lock_mode",
-    "FujiFilmAEBExposure": "fuji_aeb_exposure",
-    "FujiFilmProgramShift": "fuji_program_shift",
-    # Aperture
-    "FujiFilmAperture": "fuji_aperture",
-    "FujiFilmApertureSetting": "fuji_aperture_setting",
-    "FujiFilmApertureValue": "fuji_aperture_value",
-    "FujiFilmMaxApertureValue": "fuji_max_aperture_value",
-    # Histogram & Zebra
-    "FujiFilmHistogramDisplay": "fuji_histogram",
-    "FujiFilmZebraPattern": "fuji_zebra",
-    "FujiFilmZebraLevel": "fuji_zebra_level",
-    # EVF & LCD
-    "FujiFilmEVFBrightness": "fuji_evf_brightness",
-    "FujiFilmEVFColorTemp": "fuji_evf_color_temp",
-    "FujiFilmLCDBrightness": "fuji_lcd_brightness",
-    "FujiFilmLCDColorTemp": "fuji_lcd_color_temp",
-    "FujiFilmPreviewExposure": "fuji_preview_exposure",
-    "FujiFilmNaturalLiveView": "fuji_natural_live_view",
-    "FujiFilmFrameRate": "fuji_frame_rate",
-    # GPS Data
-    "FujiFilmGPSStatus": "fuji_gps_status",
-    "FujiFilmGPSVersion": "fuji_gps_version",
-    "FujiFilmGPSLatitude": "fuji_gps_latitude",
-    "FujiFilmGPSLongitude": "fuji_gps_longitude",
-    "FujiFilmGPSAltitude": "fuji_gps_altitude",
-    "FujiFilmGPSTimeStamp": "fuji_gps_timestamp",
-    "FujiFilmGPSDateStamp": "fuji_gps_datestamp",
-    # Movie/Video Settings
-    "FujiFilmMovieMode": "fuji_movie_mode",
-    "FujiFilmMovieFrameRate": "fuji_movie_fps",
-    "FujiFilmMovieResolution": "fuji_movie_resolution",
-    "FujiFilmMovieBitRate": "fuji_movie_bitrate",
-    "FujiFilmMovieCompression": "fuji_movie_compression",
-    "FujiFilmVideoQuality": "fuji_video_quality",
-    "FujiFilmVideoFormat": "fuji_video_format",
-    "FujiFilmHDMIOutput": "fuji_hdmi_output",
-    "FujiFilmHDMI4KOutput": "fuji_hdmi_4k",
-    "FujiFilmFLog": "fuji_f_log",
-    "FujiFilmFLogSetting": "fuji_f_log_setting",
-    "FujiFilmHLGSetting": "fuji_hlg_setting",
-    "FujiFilmEternal": "fuji_eternal",
-    "FujiFilmEternalBleachBypass": "fuji_eternal_bb",
-    # Copyright & User
-    "FujiFilmCopyright": "fuji_copyright",
-    "FujiFilmArtist": "fuji_artist",
-    "FujiFilmOwnerName": "fuji_owner_name",
-    # Ratings
-    "FujiFilmRating": "fuji_rating",
-    "FujiFilmImageRating": "fuji_image_rating",
-    # Touch Screen
-    "FujiFilmTouchScreen": "fuji_touch_screen",
-    "FujiFilmTouchAF": "fuji_touch_af",
-    "FujiFilmTouchShutter": "fuji_touch_shutter",
-    # Wireless Flash
-    "FujiFilmWirelessFlash": "fuji_wireless_flash",
-    "FujiFilmWirelessFlashMode": "fuji_wireless_flash_mode",
-    "FujiFilmWirelessFlashChannel": "fuji_wireless_flash_ch",
-    "FujiFilmWirelessFlashGroup": "fuji_wireless_flash_grp",
-    # HDR
-    "FujiFilmHDR": "fuji_hdr",
-    "FujiFilmHDRMode": "fuji_hdr_mode",
-    "FujiFilmHDRStrength": "fuji_hdr_strength",
-    "FujiFilmAutoHDR": "fuji_auto_hdr",
-    # Multiple Exposure
-    "FujiFilmMultiExposure": "fuji_multi_exposure",
-    "FujiFilmMultiExposureMode": "fuji_multi_exp_mode",
-    "FujiFilmMultiExposureCount": "fuji_multi_exp_count",
-    # Panorama
-    "FujiFilmPanorama": "fuji_panorama",
-    "FujiFilmPanoramaDirection": "fuji_pano_direction",
-    "FujiFilmPanoramaSize": "fuji_pano_size",
-    # Storage & File
-    "FujiFilmCardSlot": "fuji_card_slot",
-    "FujiFilmSlotMode": "fuji_slot_mode",
-    "FujiFilmFileFormat": "fuji_file_format",
-    "FujiFilmRawFormat": "fuji_raw_format",
-    "FujiFilmCompressedRaw": "fuji_compressed_raw",
-    "FujiFilmLosslessCompression": "fuji_lossless_compression",
-    "FujiFilmRawCompression": "fuji_raw_compression",
-    # Silent Mode
-    "FujiFilmSilentMode": "fuji_silent_mode",
-    "FujiFilmQuietShutter": "fuji_quiet_shutter",
-    # Power
-    "FujiFilmBatteryLevel": "fuji_battery_level",
-    "FujiFilmBatteryState": "fuji_battery_state",
-    "FujiFilmPowerSaveMode": "fuji_power_save",
-    # Sensor Info
-    "FujiFilmSensorID": "fuji_sensor_id",
-    "FujiFilmSensorWidth": "fuji_sensor_width",
-    "FujiFilmSensorHeight": "fuji_sensor_height",
-    "FujiFilmSensorType": "fuji_sensor_type",
-    "FujiFilmSensorTemperature": "fuji_sensor_temp",
-    # Cropping
-    "FujiFilmCropMode": "fuji_crop_mode",
-    "FujiFilmDigitalTeleconverter": "fuji_digital_tele",
-    # Custom Settings
-    "FujiFilmCustomSettingC1": "fuji_custom_c1",
-    "FujiFilmCustomSettingC2": "fuji_custom_c2",
-    "FujiFilmCustomSettingC3": "fuji_custom_c3",
-    "FujiFilmCustomSettingC4": "fuji_custom_c4",
-    "FujiFilmCustomSettingC5": "fuji_custom_c5",
-    "FujiFilmCustomSettingC6": "fuji_custom_c6",
-    "FujiFilmCustomSettingC7": "fuji_custom_c7",
-    "FujiFilmMyMenuSettings": "fuji_my_menu",
-    "FujiFilmFunctionButton1": "fuji_fn_button_1",
-    "FujiFilmFunctionButton2": "fuji_fn_button_2",
-    "FujiFilmFunctionButton3": "fuji_fn_button_3",
-    "FujiFilmFunctionButton4": "fuji_fn_button_4",
-    "FujiFilmCommandDialSetting": "fuji_command_dial",
-    # Date & Time
-    "FujiFilmDateTimeOriginal": "fuji_datetime_original",
-    "FujiFilmDateTimeDigitized": "fuji_datetime_digitized",
-    "FujiFilmTimeZone": "fuji_timezone",
-    "FujiFilmDaylightSavings": "fuji_daylight_savings",
-}
-
-FUJIFILM_LENS_INFO = {
-    # Lens Identification
-    "FujiFilmLensSerialNumber": "fuji_lens_serial",
-    "FujiFilmLensModel": "fuji_lens_model",
-    "FujiFilmLensID": "fuji_lens_id",
-    "FujiFilmLensType": "fuji_lens_type",
-    "FujiFilmLensFirmware": "fuji_lens_firmware",
-    "FujiFilmLensFirmwareVersion": "fuji_lens_fw_version",
-    # Focal Length
-    "FujiFilmFocalLength": "fuji_focal_length",
-    "FujiFilmFocalLength35mm": "fuji_focal_length_35mm",
-    "FujiFilmFocalLengthIn35mmFormat": "fuji_focal_35mm_format",
-    "FujiFilmMinFocalLength": "fuji_min_focal",
-    "FujiFilmMaxFocalLength": "fuji_max_focal",
-    "FujiFilmCurrentFocalLength": "fuji_current_focal",
-    # Aperture
-    "FujiFilmMaxAperture": "fuji_max_aperture",
-    "FujiFilmMinAperture": "fuji_min_aperture",
-    "FujiFilmMaxApertureAtMinFocal": "fuji_max_ap_min_focal",
-    "FujiFilmMaxApertureAtMaxFocal": "fuji_max_ap_max_focal",
-    "FujiFilmCurrentAperture": "fuji_current_aperture",
-    "FujiFilmLensApertureRange": "fuji_aperture_range",
-    # Focus
-    "FujiFilm_FocusDistance": "fuji_focus_distance",
-    "FujiFilmMinFocusDistance": "fuji_min_focus_distance",
-    "FujiFilmInfinityFocusDistance": "fuji_infinity_focus",
-    "FujiFilmLensFocusMode": "fuji_lens_focus_mode",
-    "FujiFilmLensFocusRing": "fuji_lens_focus_ring",
-    "FujiFilmInternalFocusing": "fuji_internal_focusing",
-    "FujiFilmFocusLimiter": "fuji_lens_focus_limiter",
-    # Macro
-    "FujiFilmMacroMode": "fuji_macro_mode",
-    "FujiFilmMacroMagnification": "fuji_macro_magnification",
-    # Zoom
-    "FujiFilm_DigitalZoom": "fuji_digital_zoom",
-    "FujiFilmOpticalZoom": "fuji_optical_zoom",
-    "FujiFilmZoomPosition": "fuji_zoom_position",
-    "FujiFilmZoomRatio": "fuji_zoom_ratio",
-    "FujiFilmDigitalTeleconverter": "fuji_digital_teleconv",
-    # Physical Properties
-    "FujiFilm_LensFilterDiameter": "fuji_filter_diameter",
-    "FujiFilm_LensWeight": "fuji_lens_weight",
-    "FujiFilm_LensLength": "fuji_lens_length",
-    "FujiFilmLensDiameter": "fuji_lens_diameter",
-    "FujiFilmLensHoodType": "fuji_lens_hood",
-    # OIS/Stabilization
-    "FujiFilmLensOIS": "fuji_lens_ois",
-    "FujiFilmLensOISMode": "fuji_lens_ois_mode",
-    "FujiFilmLensStabilization": "fuji_lens_stabilization",
-    # Corrections
-    "FujiFilmLensDistortionCorrection": "fuji_lens_distortion",
-    "FujiFilmLensChromaticAberration": "fuji_lens_ca",
-    "FujiFilmLensVignetting": "fuji_lens_vignetting",
-    "FujiFilmLensDiffractionCorrection": "fuji_lens_diffraction",
-    "FujiFilmLensSharpnessCorrection": "fuji_lens_sharpness",
-    # Adapter
-    "FujiFilmLensAdapter": "fuji_lens_adapter",
-    "FujiFilmLensAdapterModel": "fuji_adapter_model",
-    "FujiFilmMountAdapterAF": "fuji_mount_adapter_af",
-    # Weather Sealing
-    "FujiFilmLensWeatherSealing": "fuji_lens_weather_seal",
-    # Teleconverter
-    "FujiFilmTeleconverter": "fuji_teleconverter",
-    "FujiFilmTeleconverterModel": "fuji_teleconv_model",
-    "FujiFilmTeleconverterFactor": "fuji_teleconv_factor",
-    # Extension Tube
-    "FujiFilmExtensionTube": "fuji_extension_tube",
-    "FujiFilmExtensionTubeModel": "fuji_ext_tube_model",
-}
-
-FUJIFILM_FILM_SIMULATION = {
-    # Standard Film Simulations
-    "FujiFilmFilmSimulation_Provia": "fuji_provia",
-    "FujiFilmFilmSimulation_ProviaStandard": "fuji_provia_std",
-    "FujiFilmFilmSimulation_Velvia": "fuji_velvia",
-    "FujiFilmFilmSimulation_VelviaVivid": "fuji_velvia_vivid",
-    "FujiFilmFilmSimulation_Astia": "fuji_astia",
-    "FujiFilmFilmSimulation_AstiaSoft": "fuji_astia_soft",
-    "FujiFilmFilmSimulation_ClassicChrome": "fuji_classic_chrome",
-    "FujiFilmFilmSimulation_ClassicNeg": "fuji_classic_neg",
-    "FujiFilmFilmSimulation_ProNegStd": "fuji_pro_neg_std",
-    "FujiFilmFilmSimulation_ProNegHi": "fuji_pro_neg_hi",
-    "FujiFilmFilmSimulation_Acros": "fuji_acros",
-    "FujiFilmFilmSimulation_AcrosR": "fuji_acros_r",
-    "FujiFilmFilmSimulation_AcrosG": "fuji_acros_g",
-    "FujiFilmFilmSimulation_AcrosYe": "fuji_acros_ye",
-    "FujiFilmFilmSimulation_Monochrome": "fuji_monochrome",
-    "FujiFilmFilmSimulation_MonochromeR": "fuji_mono_r",
-    "FujiFilmFilmSimulation_MonochromeG": "fuji_mono_g",
-    "FujiFilmFilmSimulation_MonochromeYe": "fuji_mono_ye",
-    "FujiFilmFilmSimulation_Sepia": "fuji_sepia",
-    "FujiFilmFilmSimulation_Eterna": "fuji_eterna",
-    "FujiFilmFilmSimulation_EternaBleachBypass": "fuji_eterna_bb",
-    "FujiFilmFilmSimulation_EternaCinema": "fuji_eterna_cinema",
-    "FujiFilmFilmSimulation_NostalgicNeg": "fuji_nostalgic_neg",
-    "FujiFilmFilmSimulation_BW": "fuji_bw_film",
-    "FujiFilmFilmSimulation_Reala": "fuji_reala",
-    "FujiFilmFilmSimulation_RealaAce": "fuji_reala_ace",
-    # Film Simulation Parameters
-    "FujiFilmFilmSimulationContrast": "fuji_filmsim_contrast",
-    "FujiFilmFilmSimulationSaturation": "fuji_filmsim_saturation",
-    "FujiFilmFilmSimulationSharpness": "fuji_filmsim_sharpness",
-    "FujiFilmFilmSimulationHighlight": "fuji_filmsim_highlight",
-    "FujiFilmFilmSimulationShadow": "fuji_filmsim_shadow",
-    "FujiFilmFilmSimulationNR": "fuji_filmsim_nr",
-    "FujiFilmFilmSimulationClarity": "fuji_filmsim_clarity",
-    "FujiFilmFilmSimulationGrain": "fuji_filmsim_grain",
-    "FujiFilmFilmSimulationColorChrome": "fuji_filmsim_cc",
-    "FujiFilmFilmSimulationColorChromeFX": "fuji_filmsim_cc_fx",
-    # Custom Film Simulation Slots
-    "FujiFilmCustomFilmSim1": "fuji_custom_filmsim_1",
-    "FujiFilmCustomFilmSim2": "fuji_custom_filmsim_2",
-    "FujiFilmCustomFilmSim3": "fuji_custom_filmsim_3",
-    "FujiFilmCustomFilmSim4": "fuji_custom_filmsim_4",
-    "FujiFilmCustomFilmSim5": "fuji_custom_filmsim_5",
-    "FujiFilmCustomFilmSim6": "fuji_custom_filmsim_6",
-    # Recipe Settings
-    "FujiFilmRecipeName": "fuji_recipe_name",
-    "FujiFilmRecipeNumber": "fuji_recipe_number",
-}
-
-# New: RAW Development Info
-FUJIFILM_RAW_DEVELOPMENT = {
-    "FujiFilmRawDevelopmentVersion": "fuji_raw_dev_version",
-    "FujiFilmRawDevelopmentExposure": "fuji_raw_dev_exposure",
-    "FujiFilmRawDevelopmentWhiteBalance": "fuji_raw_dev_wb",
-    "FujiFilmRawDevelopmentSharpness": "fuji_raw_dev_sharpness",
-    "FujiFilmRawDevelopmentContrast": "fuji_raw_dev_contrast",
-    "FujiFilmRawDevelopmentSaturation": "fuji_raw_dev_saturation",
-    "FujiFilmRawDevelopmentHighlightTone": "fuji_raw_dev_highlight",
-    "FujiFilmRawDevelopmentShadowTone": "fuji_raw_dev_shadow",
-    "FujiFilmRawDevelopmentNR": "fuji_raw_dev_nr",
-    "FujiFilmRawDevelopmentClarity": "fuji_raw_dev_clarity",
-    "FujiFilmRawDevelopmentFilmSimulation": "fuji_raw_dev_filmsim",
-    "FujiFilmRawDevelopmentGrainEffect": "fuji_raw_dev_grain",
-    "FujiFilmRawDevelopmentColorChrome": "fuji_raw_dev_cc",
-    "FujiFilmRawDevelopmentDynamicRange": "fuji_raw_dev_dr",
-    "FujiFilmRawDevelopmentWBShiftR": "fuji_raw_dev_wb_r",
-    "FujiFilmRawDevelopmentWBShiftB": "fuji_raw_dev_wb_b",
-    "FujiFilmRawDevelopmentLensModOpt": "fuji_raw_dev_lmo",
-    "FujiFilmRawDevelopmentColorSpace": "fuji_raw_dev_colorspace",
-}
-
-# New: Face Detection Details
-FUJIFILM_FACE_INFO = {
-    "FujiFilmFace1Position": "fuji_face1_position",
-    "FujiFilmFace1Size": "fuji_face1_size",
-    "FujiFilmFace1Confidence": "fuji_face1_confidence",
-    "FujiFilmFace2Position": "fuji_face2_position",
-    "FujiFilmFace2Size": "fuji_face2_size",
-    "FujiFilmFace2Confidence": "fuji_face2_confidence",
-    "FujiFilmFace3Position": "fuji_face3_position",
-    "FujiFilmFace3Size": "fuji_face3_size",
-    "FujiFilmFace3Confidence": "fuji_face3_confidence",
-    "FujiFilmFace4Position": "fuji_face4_position",
-    "FujiFilmFace4Size": "fuji_face4_size",
-    "FujiFilmFace4Confidence": "fuji_face4_confidence",
-    "FujiFilmFace5Position": "fuji_face5_position",
-    "FujiFilmFace5Size": "fuji_face5_size",
-    "FujiFilmFace5Confidence": "fuji_face5_confidence",
-    "FujiFilmEyePosition": "fuji_eye_position",
-    "FujiFilmEyeConfidence": "fuji_eye_confidence",
-}
-
-# New: Video/Movie Specific
-FUJIFILM_VIDEO_INFO = {
-    "FujiFilmVideoCodec": "fuji_video_codec",
-    "FujiFilmVideoCodecProfile": "fuji_video_codec_profile",
-    "FujiFilmVideoBitDepth": "fuji_video_bit_depth",
-    "FujiFilmVideoChromaSubsampling": "fuji_video_chroma",
-    "FujiFilmVideoDataRate": "fuji_video_data_rate",
-    "FujiFilmVideoRecordingMode": "fuji_video_rec_mode",
-    "FujiFilmVideoStabilization": "fuji_video_stabilization",
-    "FujiFilmVideoMicLevel": "fuji_video_mic_level",
-    "FujiFilmVideoWindFilter": "fuji_video_wind_filter",
-    "FujiFilmVideoHeadphoneVolume": "fuji_video_headphone_vol",
-    "FujiFilmVideo4K": "fuji_video_4k",
-    "FujiFilmVideo4KFps": "fuji_video_4k_fps",
-    "FujiFilmVideo6K": "fuji_video_6k",
-    "FujiFilmVideo8K": "fuji_video_8k",
-    "FujiFilmVideoSlowMotion": "fuji_video_slow_motion",
-    "FujiFilmVideoHighSpeed": "fuji_video_high_speed",
-    "FujiFilmVideoAudioChannels": "fuji_video_audio_ch",
-    "FujiFilmVideoAudioSampleRate": "fuji_video_audio_sr",
-    "FujiFilmVideoTimeCode": "fuji_video_timecode",
-    "FujiFilmVideoRecControl": "fuji_video_rec_control",
-    "FujiFilmVideoProRes": "fuji_video_prores",
-    "FujiFilmVideoBlackmagicRAW": "fuji_video_braw",
-}
-
-# New: GFX Medium Format Specific
-FUJIFILM_GFX_INFO = {
-    "FujiFilmGFXSensorMode": "fuji_gfx_sensor_mode",
-    "FujiFilmGFXImageArea": "fuji_gfx_image_area",
-    "FujiFilmGFXCropFactor": "fuji_gfx_crop_factor",
-    "FujiFilmGFXPixelShift": "fuji_gfx_pixel_shift",
-    "FujiFilmGFXPixelShiftCombine": "fuji_gfx_ps_combine",
-    "FujiFilmGFXTiltShiftAdapter": "fuji_gfx_tilt_shift",
-    "FujiFilmGFXLargeSensorMode": "fuji_gfx_large_sensor",
-    "FujiFilmGFX100Resolution": "fuji_gfx100_resolution",
-    "FujiFilmGFX50Resolution": "fuji_gfx50_resolution",
-    "FujiFilmGFXIBISMode": "fuji_gfx_ibis_mode",
-}
-
-
-
-OLYMPUS_EQUIPMENT = {
-    # Version & Identity
-    "OlympusVersion": "olympus_version",
-    "OlympusMakerNoteVersion": "olympus_makernote_version",
-    "OlympusEquipment_EquipmentVersion": "olympus_equipment_version",
-    "OlympusEquipment_CameraType": "olympus_camera_type",
-    "OlympusEquipment_CameraType2": "olympus_camera_type_2",
-    "OlympusEquipment_CameraSerialNumber": "olympus_camera_serial",
-    "OlympusEquipment_InternalSerialNumber": "olympus_internal_serial",
-    "OlympusEquipment_BodySerialNumber": "olympus_body_serial",
-    "OlympusEquipment_FirmwareVersion": "olympus_firmware_version",
-    "OlympusEquipment_BodyFirmware": "olympus_body_firmware",
-    "OlympusEquipment_BodyFirmwareVersion": "olympus_body_fw_version",
-    "OlympusEquipment_LensFirmwareVersion": "olympus_lens_fw_version",
-    "OlympusEquipment_FlashFirmwareVersion": "olympus_flash_fw_version",
-    "OlympusEquipment_MountVersion": "olympus_mount_version",
-    # Focus Equipment
-    "OlympusEquipment_FocusRange": "olympus_focus_range",
-    "OlympusEquipment_FocusMode": "olympus_focus_mode",
-    "OlympusEquipment_FocusModeSetting": "olympus_focus_mode_setting",
-    "OlympusEquipment_AFSearch": "olympus_af_search",
-    "OlympusEquipment_AFPoint": "olympus_af_point",
-    "OlympusEquipment_AFPointCount": "olympus_af_point_count",
-    "OlympusEquipment_AFPointSelected": "olympus_af_point_selected",
-    "OlympusEquipment_AFMode": "olympus_af_mode",
-    "OlympusEquipment_AFSensor": "olympus_af_sensor",
-    "OlympusEquipment_ContrastDetectAF": "olympus_contrast_detect_af",
-    "OlympusEquipment_PhaseDetectAF": "olympus_phase_detect_af",
-    # Lens Info
-    "OlympusEquipment_LensType": "olympus_lens_type",
-    "OlympusEquipment_LensSerialNumber": "olympus_lens_serial",
-    "OlympusEquipment_LensModel": "olympus_lens_model",
-    "OlympusEquipment_LensID": "olympus_lens_id",
-    "OlympusEquipment_LensFocalLength": "olympus_lens_focal_length",
-    "OlympusEquipment_LensMinFocalLength": "olympus_lens_min_focal",
-    "OlympusEquipment_LensMaxFocalLength": "olympus_lens_max_focal",
-    "OlympusEquipment_LensMaxAperture": "olympus_lens_max_aperture",
-    "OlympusEquipment_LensMinAperture": "olympus_lens_min_aperture",
-    "OlympusEquipment_LensMaxApertureAtMinFocal": "olympus_max_ap_min_focal",
-    "OlympusEquipment_LensMaxApertureAtMaxFocal": "olympus_max_ap_max_focal",
-    "OlympusEquipment_LensMountType": "olympus_lens_mount",
-    "OlympusEquipment_MinFocusDistance": "olympus_min_focus_distance",
-    # Extender
-    "OlympusEquipment_Extender": "olympus_extender",
-    "OlympusEquipment_ExtenderSerialNumber": "olympus_extender_serial",
-    "OlympusEquipment_ExtenderModel": "olympus_extender_model",
-    "OlympusEquipment_ExtenderFirmwareVersion": "olympus_extender_fw",
-    # Flash Equipment
-    "OlympusEquipment_FlashType": "olympus_flash_type",
-    "OlympusEquipment_FlashModel": "olympus_flash_model",
-    "OlympusEquipment_FlashSerialNumber": "olympus_flash_serial",
-    "OlympusEquipment_ExternalFlash": "olympus_external_flash",
-    "OlympusEquipment_ExternalFlashFirmware": "olympus_ext_flash_fw",
-    "OlympusEquipment_ExternalFlashZoom": "olympus_ext_flash_zoom",
-    "OlympusEquipment_FlashExposureComp": "olympus_flash_ec",
-    "OlympusEquipment_InternalFlashMode": "olympus_internal_flash_mode",
-}
-
-OLYMPUS_CAMERA_SETTINGS = {
-    # Exposure Settings
-    "OlympusCameraSettings_ExposureMode": "olympus_exposure_mode",
-    "OlympusCameraSettings_AELock": "olympus_ae_lock",
-    "OlympusCameraSettings_MeteringMode": "olympus_metering_mode",
-    "OlympusCameraSettings_MeteringAreas": "olympus_metering_areas",
-    "OlympusCameraSettings_ExposureShift": "olympus_exposure_shift",
-    "OlympusCameraSettings_ExposureDifference": "olympus_exposure_diff",
-    "OlympusCameraSettings_ExposureCompensation": "olympus_exposure_comp",
-    # Flash Settings
-    "OlympusCameraSettings_FlashStatus": "olympus_flash_status",
-    "OlympusCameraSettings_FlashMode": "olympus_flash_mode",
-    "OlympusCameraSettings_FlashMode2": "olympus_flash_mode_2",
-    "OlympusCameraSettings_FlashExposureComp": "olympus_flash_ec_cs",
-    "OlympusCameraSettings_FlashRemoteControl": "olympus_flash_remote",
-    "OlympusCameraSettings_FlashControlMode": "olympus_flash_control_mode",
-    "OlympusCameraSettings_FlashIntensity": "olympus_flash_intensity",
-    "OlympusCameraSettings_ManualFlashStrength": "olympus_manual_flash",
-    # White Balance
-    "OlympusCameraSettings_WhiteBalance": "olympus_white_balance",
-    "OlympusCameraSettings_WhiteBalanceMode": "olympus_wb_mode",
-    "OlympusCameraSettings_WhiteBalance2": "olympus_wb_2",
-    "OlympusCameraSettings_WhiteBalanceBracket": "olympus_wb_bracket",
-    "OlympusCameraSettings_WhiteBalanceTemp": "olympus_wb_temp",
-    "OlympusCameraSettings_CustomWB": "olympus_custom_wb",
-    "OlympusCameraSettings_OneClickWB": "olympus_one_click_wb",
-    "OlympusCameraSettings_WBShiftAB": "olympus_wb_shift_ab",
-    "OlympusCameraSettings_WBShiftGM": "olympus_wb_shift_gm",
-    "OlympusCameraSettings_WBRBLevels": "olympus_wb_rb_levels",
-    "OlympusCameraSettings_WBGLevel": "olympus_wb_g_level",
-    # ISO Settings
-    "OlympusCameraSettings_ISO": "olympus_iso",
-    "OlympusCameraSettings_ISOSetting": "olympus_iso_setting",
-    "OlympusCameraSettings_BaseISO": "olympus_base_iso",
-    "OlympusCameraSettings_AutoISO": "olympus_auto_iso",
-    "OlympusCameraSettings_AutoISOMin": "olympus_auto_iso_min",
-    "OlympusCameraSettings_AutoISOMax": "olympus_auto_iso_max",
-    "OlympusCameraSettings_ISOStep": "olympus_iso_step",
-    # Drive Mode
-    "OlympusCameraSettings_DriveMode": "olympus_drive_mode",
-    "OlympusCameraSettings_SequenceNumber": "olympus_sequence_number",
-    "OlympusCameraSettings_ImageNumber": "olympus_image_number",
-    "OlympusCameraSettings_BurstMode": "olympus_burst_mode",
-    "OlympusCameraSettings_BurstSpeed": "olympus_burst_speed",
-    "OlympusCameraSettings_BurstCount": "olympus_burst_count",
-    "OlympusCameraSettings_ProCapture": "olympus_pro_capture",
-    "OlympusCameraSettings_ProCaptureFrames": "olympus_pro_capture_frames",
-    "OlympusCameraSettings_SelfTimer": "olympus_self_timer",
-    "OlympusCameraSettings_IntervalShooting": "olympus_interval_shooting",
-    # Bracketing
-    "OlympusCameraSettings_BracketMode": "olympus_bracket_mode",
-    "OlympusCameraSettings_BracketShotNumber": "olympus_bracket_shot_no",
-    "OlympusCameraSettings_AEBracketSteps": "olympus_ae_bracket_steps",
-    "OlympusCameraSettings_AEBracketValue": "olympus_ae_bracket_value",
-    "OlympusCameraSettings_FocusBracketing": "olympus_focus_bracketing",
-    "OlympusCameraSettings_FocusBracketSteps": "olympus_focus_bracket_steps",
-    # Shutter
-    "OlympusCameraSettings_ShutterType": "olympus_shutter_type",
-    "OlympusCameraSettings_ShutterCount": "olympus_shutter_count",
-    "OlympusCameraSettings_ElectronicShutter": "olympus_electronic_shutter",
-    "OlympusCameraSettings_AntiShock": "olympus_anti_shock",
-    "OlympusCameraSettings_SilentMode": "olympus_silent_mode",
-    # Image Stabilization
-    "OlympusCameraSettings_ImageStabilization": "olympus_image_stabilization",
-    "OlympusCameraSettings_ISMode": "olympus_is_mode",
-    "OlympusCameraSettings_ISSpeed": "olympus_is_speed",
-    "OlympusCameraSettings_IBIS": "olympus_ibis",
-    "OlympusCameraSettings_IBISMode": "olympus_ibis_mode",
-    "OlympusCameraSettings_LensIS": "olympus_lens_is",
-    "OlympusCameraSettings_SensorSync": "olympus_sensor_sync",
-    # Image Quality
-    "OlympusCameraSettings_Quality": "olympus_quality",
-    "OlympusCameraSettings_Quality2": "olympus_quality_2",
-    "OlympusCameraSettings_ImageSize": "olympus_image_size",
-    "OlympusCameraSettings_AspectRatio": "olympus_aspect_ratio",
-    "OlympusCameraSettings_RawOrJpg": "olympus_raw_or_jpg",
-    "OlympusCameraSettings_PixelCount": "olympus_pixel_count",
-    "OlympusCameraSettings_CompressionRatio": "olympus_compression_ratio",
-    # Scene Mode
-    "OlympusCameraSettings_SceneMode": "olympus_scene_mode",
-    "OlympusCameraSettings_SceneDetect": "olympus_scene_detect",
-    "OlympusCameraSettings_MacroMode": "olympus_macro_mode",
-    # Lens Corrections
-    "OlympusCameraSettings_LensDistortionParams": "olympus_lens_distortion",
-    "OlympusCameraSettings_LensShadingParams": "olympus_lens_shading",
-    "OlympusCameraSettings_PeripheralIllumCorr": "olympus_peripheral_illum",
-    # Date/Time
-    "OlympusCameraSettings_DateTimeOriginal": "olympus_datetime_original",
-    "OlympusCameraSettings_ModifyDate": "olympus_modify_date",
-    "OlympusCameraSettings_TimeZone": "olympus_timezone",
-    # Video
-    "OlympusCameraSettings_VideoFrameRate": "olympus_video_fps",
-    "OlympusCameraSettings_VideoBitrate": "olympus_video_bitrate",
-    "OlympusCameraSettings_VideoCodec": "olympus_video_codec",
-    "OlympusCameraSettings_MovieQuality": "olympus_movie_quality",
-    "OlympusCameraSettings_MovieStabilization": "olympus_movie_stab",
-    # Touch/EVF/LCD
-    "OlympusCameraSettings_TouchAF": "olympus_touch_af",
-    "OlympusCameraSettings_EVFBrightness": "olympus_evf_brightness",
-    "OlympusCameraSettings_LCDBrightness": "olympus_lcd_brightness",
-    "OlympusCameraSettings_PreviewExposure": "olympus_preview_exposure",
-    # GPS
-    "OlympusCameraSettings_GPSStatus": "olympus_gps_status",
-    "OlympusCameraSettings_GPSVersion": "olympus_gps_version",
-    # Custom Functions
-    "OlympusCameraSettings_CustomFunction1": "olympus_custom_fn_1",
-    "OlympusCameraSettings_CustomFunction2": "olympus_custom_fn_2",
-    "OlympusCameraSettings_CustomFunction3": "olympus_custom_fn_3",
-    "OlympusCameraSettings_CustomFunction4": "olympus_custom_fn_4",
-    "OlympusCameraSettings_CustomFunction5": "olympus_custom_fn_5",
-    "OlympusCameraSettings_CustomFunction6": "olympus_custom_fn_6",
-    "OlympusCameraSettings_CustomFunction7": "olympus_custom_fn_7",
-    "OlympusCameraSettings_CustomFunction8": "olympus_custom_fn_8",
-    "OlympusCameraSettings_CustomFunction9": "olympus_custom_fn_9",
-    "OlympusCameraSettings_CustomFunction10": "olympus_custom_fn_10",
-    "OlympusCameraSettings_ButtonFunction1": "olympus_button_fn_1",
-    "OlympusCameraSettings_ButtonFunction2": "olympus_button_fn_2",
-    "OlympusCameraSettings_DialFunction": "olympus_dial_fn",
-    "OlympusCameraSettings_MyMode1": "olympus_my_mode_1",
-    "OlympusCameraSettings_MyMode2": "olympus_my_mode_2",
-    "OlympusCameraSettings_MyMode3": "olympus_my_mode_3",
-    "OlympusCameraSettings_MyMode4": "olympus_my_mode_4",
-}
-
-OLYMPUS_IMAGE_PROCESSING = {
-    # Sharpness & Clarity
-    "OlympusImageProcessing_SharpnessValue": "olympus_sharpness",
-    "OlympusImageProcessing_SharpnessSetting": "olympus_sharpness_setting",
-    "OlympusImageProcessing_Sharpness": "olympus_sharpness_level",
-    "OlympusImageProcessing_USMThreshold": "olympus_usm_threshold",
-    # Contrast
-    "OlympusImageProcessing_ContrastValue": "olympus_contrast",
-    "OlympusImageProcessing_ContrastSetting": "olympus_contrast_setting",
-    "OlympusImageProcessing_Contrast": "olympus_contrast_level",
-    # Saturation
-    "OlympusImageProcessing_SaturationValue": "olympus_saturation",
-    "OlympusImageProcessing_SaturationSetting": "olympus_saturation_setting",
-    "OlympusImageProcessing_Saturation": "olympus_saturation_level",
-    "OlympusImageProcessing_ColorSaturation": "olympus_color_saturation",
-    # Gradation
-    "OlympusImageProcessing_Gradation": "olympus_gradation",
-    "OlympusImageProcessing_GradationMode": "olympus_gradation_mode",
-    "OlympusImageProcessing_ToneCurve": "olympus_tone_curve",
-    "OlympusImageProcessing_ToneLevel": "olympus_tone_level",
-    "OlympusImageProcessing_Highlights": "olympus_highlights",
-    "OlympusImageProcessing_Shadows": "olympus_shadows",
-    "OlympusImageProcessing_MidtoneCurve": "olympus_midtone_curve",
-    # Noise Reduction
-    "OlympusImageProcessing_NoiseReduction": "olympus_noise_reduction",
-    "OlympusImageProcessing_NoiseReduction2": "olympus_nr_2",
-    "OlympusImageProcessing_NoiseFilter": "olympus_noise_filter",
-    "OlympusImageProcessing_NoiseFilterValue": "olympus_noise_filter_value",
-    "OlympusImageProcessing_HighISONR": "olympus_high_iso_nr",
-    "OlympusImageProcessing_LongExposureNR": "olympus_long_exp_nr",
-    "OlympusImageProcessing_MultiFrameNR": "olympus_multi_frame_nr",
-    # Picture Mode
-    "OlympusImageProcessing_EngineerMode": "olympus_engineer_mode",
-    "OlympusImageProcessing_PictureMode": "olympus_picture_mode",
-    "OlympusImageProcessing_PictureModeValue": "olympus_picture_mode_value",
-    "OlympusImageProcessing_PictureModeSaturation": "olympus_pm_saturation",
-    "OlympusImageProcessing_PictureModeContrast": "olympus_pm_contrast",
-    "OlympusImageProcessing_PictureModeSharpness": "olympus_pm_sharpness",
-    "OlympusImageProcessing_PictureModeBW": "olympus_pm_bw",
-    "OlympusImageProcessing_PictureModeNatural": "olympus_pm_natural",
-    "OlympusImageProcessing_PictureModeVivid": "olympus_pm_vivid",
-    "OlympusImageProcessing_PictureModePortrait": "olympus_pm_portrait",
-    "OlympusImageProcessing_PictureModeLandscape": "olympus_pm_landscape",
-    "OlympusImageProcessing_PictureModeFlat": "olympus_pm_flat",
-    # Art Filter
-    "OlympusImageProcessing_ArtFilter": "olympus_art_filter",
-    "OlympusImageProcessing_ArtFilterVersion": "olympus_art_filter_version",
-    "OlympusImageProcessing_ArtFilterType": "olympus_art_filter_type",
-    "OlympusImageProcessing_ArtFilterEffect": "olympus_art_filter_effect",
-    "OlympusImageProcessing_ArtFilterPartColor": "olympus_art_part_color",
-    "OlympusImageProcessing_PopArt": "olympus_pop_art",
-    "OlympusImageProcessing_FocusSoft": "olympus_focus_soft",
-    "OlympusImageProcessing_GrainyFilm": "olympus_grainy_film",
-    "OlympusImageProcessing_PinHole": "olympus_pin_hole",
-    "OlympusImageProcessing_Diorama": "olympus_diorama",
-    "OlympusImageProcessing_CrossProcess": "olympus_cross_process",
-    "OlympusImageProcessing_GentleSepia": "olympus_gentle_sepia",
-    "OlympusImageProcessing_DramaticTone": "olympus_dramatic_tone",
-    "OlympusImageProcessing_LigneClair": "olympus_ligne_clair",
-    "OlympusImageProcessing_PastelColor": "olympus_pastel_color",
-    "OlympusImageProcessing_Vintage": "olympus_vintage",
-    "OlympusImageProcessing_PartColor": "olympus_part_color",
-    "OlympusImageProcessing_Bleach": "olympus_bleach",
-    # Color Creator
-    "OlympusImageProcessing_ColorCreator": "olympus_color_creator",
-    "OlympusImageProcessing_ColorCreatorHue": "olympus_cc_hue",
-    "OlympusImageProcessing_ColorCreatorSaturation": "olympus_cc_saturation",
-    "OlympusImageProcessing_ColorCreatorLuminance": "olympus_cc_luminance",
-    "OlympusImageProcessing_Tone": "olympus_tone",
-    # Perspective & Corrections
-    "OlympusImageProcessing_PerspectiveCorrection": "olympus_perspective",
-    "OlympusImageProcessing_KeystoneCorrection": "olympus_keystone",
-    "OlympusImageProcessing_KeepVerticalHorizontal": "olympus_keep_vh",
-    "OlympusImageProcessing_ShadingCompensation": "olympus_shading",
-    "OlympusImageProcessing_DistortionCorrection": "olympus_distortion",
-    "OlympusImageProcessing_PeripheralIllum": "olympus_peripheral_illum_ip",
-    "OlympusImageProcessing_ChromaticAberration": "olympus_chromatic_aberration",
-    "OlympusImageProcessing_DiffractionCorrection": "olympus_diffraction_correction",
-    # Color Space
-    "OlympusImageProcessing_ColorSpace": "olympus_color_space",
-    "OlympusImageProcessing_ColorSpace2": "olympus_color_space_2",
-    "OlympusImageProcessing_ColorMatrix": "olympus_color_matrix",
-    "OlympusImageProcessing_ColorTempBias": "olympus_color_temp_bias",
-    # Filter Effect (B&W)
-    "OlympusImageProcessing_FilterEffect": "olympus_filter_effect",
-    "OlympusImageProcessing_MonochromeProfile": "olympus_mono_profile",
-    "OlympusImageProcessing_MonochromeFilter": "olympus_mono_filter",
-    "OlympusImageProcessing_MonochromeTone": "olympus_mono_tone",
-    "OlympusImageProcessing_MonochromeGrain": "olympus_mono_grain",
-    "OlympusImageProcessing_BWFilter": "olympus_bw_filter",
-    "OlympusImageProcessing_BWToning": "olympus_bw_toning",
-    # Auto Gradient
-    "OlympusImageProcessing_AutoGradient": "olympus_auto_gradient",
-    "OlympusImageProcessing_GradientApplied": "olympus_gradient_applied",
-    # HDR
-    "OlympusImageProcessing_HDR": "olympus_hdr",
-    "OlympusImageProcessing_HDRIntensity": "olympus_hdr_intensity",
-    # Multiple Exposure
-    "OlympusImageProcessing_MultiExposure": "olympus_multi_exposure",
-    "OlympusImageProcessing_MultiExposureMode": "olympus_multi_exp_mode",
-}
-
-OLYMPUS_FOCUS_INFO = {
-    # Focus Distance
-    "OlympusFocusInfo_FocusDistance": "olympus_focus_distance",
-    "OlympusFocusInfo_FocusDistanceValue": "olympus_focus_distance_value",
-    "OlympusFocusInfo_NearFocusLimit": "olympus_near_focus_limit",
-    "OlympusFocusInfo_FarFocusLimit": "olympus_far_focus_limit",
-    # Focus Steps
-    "OlympusFocusInfo_FocusStep": "olympus_focus_step",
-    "OlympusFocusInfo_FocusStepCount": "olympus_focus_step_count",
-    "OlympusFocusInfo_FocusStepIndex": "olympus_focus_step_index",
-    "OlympusFocusInfo_FocusStepInfinity": "olympus_focus_step_infinity",
-    "OlympusFocusInfo_FocusStepNear": "olympus_focus_step_near",
-    # Focus Position
-    "OlympusFocusInfo_FocusPosition": "olympus_focus_position",
-    "OlympusFocusInfo_FocusPositionX": "olympus_focus_pos_x",
-    "OlympusFocusInfo_FocusPositionY": "olympus_focus_pos_y",
-    # Focus Method
-    "OlympusFocusInfo_FocusMethod": "olympus_focus_method",
-    "OlympusFocusInfo_FocusSensor": "olympus_focus_sensor",
-    "OlympusFocusInfo_ContrastAF": "olympus_contrast_af",
-    "OlympusFocusInfo_PhaseAF": "olympus_phase_af",
-    # AF Target
-    "OlympusFocusInfo_AFTargetX": "olympus_af_target_x",
-    "OlympusFocusInfo_AFTargetY": "olympus_af_target_y",
-    "OlympusFocusInfo_AFTargetSize": "olympus_af_target_size",
-    "OlympusFocusInfo_AFTargetWidth": "olympus_af_target_width",
-    "OlympusFocusInfo_AFTargetHeight": "olympus_af_target_height",
-    "OlympusFocusInfo_AFTargetArea": "olympus_af_target_area",
-    "OlympusFocusInfo_AFAreas": "olympus_af_areas",
-    "OlympusFocusInfo_AFAreaMode": "olympus_af_area_mode",
-    # AF Points
-    "OlympusFocusInfo_AFPointSelected": "olympus_af_point_selected",
-    "OlympusFocusInfo_AFPointsInFocus": "olympus_af_points_in_focus",
-    "OlympusFocusInfo_AFPointCount": "olympus_af_point_count_fi",
-    "OlympusFocusInfo_CrossTypeAFPoints": "olympus_cross_type_af",
-    # Face & Eye Detection
-    "OlympusFocusInfo_FaceDetection": "olympus_face_detection",
-    "OlympusFocusInfo_FaceDetectionMode": "olympus_face_detection_mode",
-    "OlympusFocusInfo_FacePoints": "olympus_face_points",
-    "OlympusFocusInfo_FaceCount": "olympus_face_count",
-    "OlympusFocusInfo_Face1Position": "olympus_face_1_pos",
-    "OlympusFocusInfo_Face2Position": "olympus_face_2_pos",
-    "OlympusFocusInfo_Face3Position": "olympus_face_3_pos",
-    "OlympusFocusInfo_EyeAF": "olympus_eye_af",
-    "OlympusFocusInfo_EyeAFSelection": "olympus_eye_af_selection",
-    "OlympusFocusInfo_EyeAFArea": "olympus_eye_af_area",
-    # Special AF Modes
-    "OlympusFocusInfo_SuperSpotAF": "olympus_super_spot_af",
-    "OlympusFocusInfo_ZoneAF": "olympus_zone_af",
-    "OlympusFocusInfo_GroupAF": "olympus_group_af",
-    "OlympusFocusInfo_AllTargetsAF": "olympus_all_targets_af",
-    # Tracking
-    "OlympusFocusInfo_Tracking": "olympus_tracking",
-    "OlympusFocusInfo_TrackingArea": "olympus_tracking_area",
-    "OlympusFocusInfo_TrackingStatus": "olympus_tracking_status",
-    # AF Fine Tune
-    "OlympusFocusInfo_AFFineTune": "olympus_af_fine_tune",
-    "OlympusFocusInfo_AFFineTuneValue": "olympus_af_fine_tune_value",
-    # Focus Limiter
-    "OlympusFocusInfo_FocusLimiter": "olympus_focus_limiter",
-    "OlympusFocusInfo_FocusLimiterNear": "olympus_focus_limiter_near",
-    "OlympusFocusInfo_FocusLimiterFar": "olympus_focus_limiter_far",
-    # Manual Focus Assist
-    "OlympusFocusInfo_ManualFocusAssist": "olympus_mf_assist",
-    "OlympusFocusInfo_FocusPeaking": "olympus_focus_peaking",
-    "OlympusFocusInfo_PeakingLevel": "olympus_peaking_level",
-    "OlympusFocusInfo_PeakingColor": "olympus_peaking_color",
-    # Pre-MF
-    "OlympusFocusInfo_PreMF": "olympus_pre_mf",
-    "OlympusFocusInfo_InstantSpotAF": "olympus_instant_spot_af",
-}
-
-OLYMPUS_RAW_DEVELOPMENT = {
-    "OlympusRawDev_Version": "olympus_raw_dev_version",
-    "OlympusRawDev_ExposureBiasValue": "olympus_raw_dev_exposure",
-    "OlympusRawDev_WhiteBalanceValue": "olympus_raw_dev_wb",
-    "OlympusRawDev_WBFineAdjustment": "olympus_raw_dev_wb_fine",
-    "OlympusRawDev_GrayPoint": "olympus_raw_dev_gray_point",
-    "OlympusRawDev_ContrastValue": "olympus_raw_dev_contrast",
-    "OlympusRawDev_SharpnessValue": "olympus_raw_dev_sharpness",
-    "OlympusRawDev_SaturationEmphasis": "olympus_raw_dev_saturation",
-    "OlympusRawDev_MemoryColorEmphasis": "olympus_raw_dev_memory_color",
-    "OlympusRawDev_NoiseReduction": "olympus_raw_dev_nr",
-    "OlympusRawDev_DistortionCorrection": "olympus_raw_dev_distortion",
-    "OlympusRawDev_ShadingCompensation": "olympus_raw_dev_shading",
-    "OlympusRawDev_GradationValue": "olympus_raw_dev_gradation",
-    "OlympusRawDev_ColorSpace": "olympus_raw_dev_color_space",
-    "OlympusRawDev_PictureMode": "olympus_raw_dev_picture_mode",
-    "OlympusRawDev_EditStatus": "olympus_raw_dev_edit_status",
-}
-
-OLYMPUS_RAW_INFO = {
-    "OlympusRawInfo_WBRBLevels": "olympus_raw_wb_rb_levels",
-    "OlympusRawInfo_WBRBLevels3000K": "olympus_raw_wb_3000k",
-    "OlympusRawInfo_WBRBLevels3300K": "olympus_raw_wb_3300k",
-    "OlympusRawInfo_WBRBLevels3600K": "olympus_raw_wb_3600k",
-    "OlympusRawInfo_WBRBLevels3900K": "olympus_raw_wb_3900k",
-    "OlympusRawInfo_WBRBLevels4000K": "olympus_raw_wb_4000k",
-    "OlympusRawInfo_WBRBLevels4300K": "olympus_raw_wb_4300k",
-    "OlympusRawInfo_WBRBLevels4500K": "olympus_raw_wb_4500k",
-    "OlympusRawInfo_WBRBLevels4800K": "olympus_raw_wb_4800k",
-    "OlympusRawInfo_WBRBLevels5300K": "olympus_raw_wb_5300k",
-    "OlympusRawInfo_WBRBLevels6000K": "olympus_raw_wb_6000k",
-    "OlympusRawInfo_WBRBLevels6600K": "olympus_raw_wb_6600k",
-    "OlympusRawInfo_WBRBLevels7500K": "olympus_raw_wb_7500k",
-    "OlympusRawInfo_WBRBLevelsCWB1": "olympus_raw_wb_cwb1",
-    "OlympusRawInfo_WBRBLevelsCWB2": "olympus_raw_wb_cwb2",
-    "OlympusRawInfo_WBRBLevelsCWB3": "olympus_raw_wb_cwb3",
-    "OlympusRawInfo_WBRBLevelsCWB4": "olympus_raw_wb_cwb4",
-    "OlympusRawInfo_WBGLevel": "olympus_raw_wb_g_level",
-    "OlympusRawInfo_SensorCalibration": "olympus_raw_sensor_cal",
-    "OlympusRawInfo_NoiseReduction2": "olympus_raw_nr_2",
-}
-
-
-
-PANASONIC_CAMERA_SETTINGS = {
-    # Version & Identity
-    "PanasonicMakerNoteVersion": "panasonic_version",
-    "PanasonicModelID": "panasonic_model_id",
-    "PanasonicCameraModel": "panasonic_camera_model",
-    "PanasonicFirmwareVersion": "panasonic_firmware_version",
-    "PanasonicSerialNumber": "panasonic_serial_number",
-    "PanasonicInternalSerialNumber": "panasonic_internal_serial",
-    # Special Mode
-    "PanasonicSpecialMode": "panasonic_special_mode",
-    "PanasonicSceneMode": "panasonic_scene_mode",
-    "PanasonicSceneDetect": "panasonic_scene_detect",
-    # Quality & Size
-    "PanasonicQuality": "panasonic_quality",
-    "PanasonicQuality2": "panasonic_quality_2",
-    "PanasonicPictureSize": "panasonic_picture_size",
-    "PanasonicImageWidth": "panasonic_image_width",
-    "PanasonicImageHeight": "panasonic_image_height",
-    "PanasonicAspectRatio": "panasonic_aspect_ratio",
-    "PanasonicCropArea": "panasonic_crop_area",
-    "PanasonicRawFormat": "panasonic_raw_format",
-    # AF/Focus
-    "PanasonicAFMode": "panasonic_af_mode",
-    "PanasonicAFMode2": "panasonic_af_mode_2",
-    "PanasonicAFAreaMode": "panasonic_af_area_mode",
-    "PanasonicAFPointPosition": "panasonic_af_point_position",
-    "PanasonicAFPointSelected": "panasonic_af_point_selected",
-    "PanasonicAFPointsInFocus": "panasonic_af_points_in_focus",
-    "PanasonicAFPointCount": "panasonic_af_point_count",
-    "PanasonicContrastAF": "panasonic_contrast_af",
-    "PanasonicFocusDistance": "panasonic_focus_distance",
-    "PanasonicFocusMode": "panasonic_focus_mode",
-    "PanasonicFocusContinuous": "panasonic_focus_continuous",
-    "PanasonicFocusBracketing": "panasonic_focus_bracketing",
-    "PanasonicFocusBracketSteps": "panasonic_focus_bracket_steps",
-    "PanasonicFocusBracketInterval": "panasonic_focus_bracket_interval",
-    "PanasonicFocusStep": "panasonic_focus_step",
-    "PanasonicFocusStepNear": "panasonic_focus_step_near",
-    "PanasonicFocusStepFar": "panasonic_focus_step_far",
-    # Face & Subject Detection
-    "PanasonicFaceDetection": "panasonic_face_detection",
-    "PanasonicFaceDetectionMode": "panasonic_face_detection_mode",
-    "PanasonicFaceCount": "panasonic_face_count",
-    "PanasonicFace1Position": "panasonic_face_1_pos",
-    "PanasonicFace2Position": "panasonic_face_2_pos",
-    "PanasonicFace3Position": "panasonic_face_3_pos",
-    "PanasonicFaceRecognition": "panasonic_face_recognition",
-    "PanasonicEyeAF": "panasonic_eye_af",
-    "PanasonicEyeAFSelection": "panasonic_eye_af_selection",
-    "PanasonicAnimalAF": "panasonic_animal_af",
-    "PanasonicSubjectTracking": "panasonic_subject_tracking",
-    "PanasonicTrackingStatus": "panasonic_tracking_status",
-    # Level/Tilt
-    "PanasonicRollAngle": "panasonic_roll_angle",
-    "PanasonicPitchAngle": "panasonic_pitch_angle",
-    "PanasonicYawAngle": "panasonic_yaw_angle",
-    "PanasonicAccelerometerData": "panasonic_accelerometer",
-    "PanasonicLevelCorrection": "panasonic_level_correction",
-    # Zoom
-    "PanasonicZoomTeleMacro": "panasonic_zoom_tele_macro",
-    "PanasonicOpticalZoom": "panasonic_optical_zoom",
-    "PanasonicDigitalZoom": "panasonic_digital_zoom",
-    "PanasonicExtendedZoom": "panasonic_extended_zoom",
-    "PanasonicZoomPosition": "panasonic_zoom_position",
-    # Image Stabilization
-    "PanasonicImageStabilization": "panasonic_image_stabilization",
-    "PanasonicImageStabilizationMode": "panasonic_is_mode",
-    "PanasonicOIS": "panasonic_ois",
-    "PanasonicOISMode": "panasonic_ois_mode",
-    "PanasonicBodyIS": "panasonic_body_is",
-    "PanasonicDualIS": "panasonic_dual_is",
-    "PanasonicDualIS2": "panasonic_dual_is_2",
-    "PanasonicVideoStabilization": "panasonic_video_stab",
-    # Macro
-    "PanasonicMacroMode": "panasonic_macro_mode",
-    "PanasonicMacroZoom": "panasonic_macro_zoom",
-    # Shooting Mode
-    "PanasonicShootingMode": "panasonic_shooting_mode",
-    "PanasonicPhotoStyle": "panasonic_photo_style",
-    "PanasonicPhotoStyleEffect": "panasonic_photo_style_effect",
-    "PanasonicPictureEffect": "panasonic_picture_effect",
-    # Exposure
-    "PanasonicPostCropExposureCompensation": "panasonic_post_crop_ec",
-    "PanasonicExposureCompensation": "panasonic_exposure_comp",
-    "PanasonicExposureCompensation2": "panasonic_ec_2",
-    "PanasonicExposureMode": "panasonic_exposure_mode",
-    "PanasonicProgramShift": "panasonic_program_shift",
-    "PanasonicMeteringMode": "panasonic_metering_mode",
-    "PanasonicAELock": "panasonic_ae_lock",
-    # Color & Saturation
-    "PanasonicColorMode": "panasonic_color_mode",
-    "PanasonicColorEffect": "panasonic_color_effect",
-    "PanasonicSaturation": "panasonic_saturation",
-    "PanasonicContrast": "panasonic_contrast",
-    "PanasonicSharpness": "panasonic_sharpness",
-    "PanasonicNoiseReduction": "panasonic_noise_reduction",
-    "PanasonicHighlightShadow": "panasonic_highlight_shadow",
-    "PanasonicHighlights": "panasonic_highlights",
-    "PanasonicShadows": "panasonic_shadows",
-    "PanasonicFilterEffect": "panasonic_filter_effect",
-    "PanasonicMonochromeFilter": "panasonic_mono_filter",
-    # White Balance
-    "PanasonicWhiteBalance": "panasonic_white_balance",
-    "PanasonicWhiteBalance2": "panasonic_wb_2",
-    "PanasonicWhiteBalanceFine": "panasonic_wb_fine",
-    "PanasonicWhiteBalanceFineTune": "panasonic_wb_fine_tune",
-    "PanasonicWBShiftAB": "panasonic_wb_shift_ab",
-    "PanasonicWBShiftGM": "panasonic_wb_shift_gm",
-    "PanasonicWBRedLevel": "panasonic_wb_red",
-    "PanasonicWBBlueLevel": "panasonic_wb_blue",
-    "PanasonicWBGreenLevel": "panasonic_wb_green",
-    "PanasonicColorTemperature": "panasonic_color_temp",
-    "PanasonicCustomWB": "panasonic_custom_wb",
-    "PanasonicCustomWB1": "panasonic_custom_wb_1",
-    "PanasonicCustomWB2": "panasonic_custom_wb_2",
-    "PanasonicCustomWB3": "panasonic_custom_wb_3",
-    "PanasonicCustomWB4": "panasonic_custom_wb_4",
-    # ISO
-    "PanasonicISO": "panasonic_iso",
-    "PanasonicISOSetting": "panasonic_iso_setting",
-    "PanasonicBaseISO": "panasonic_base_iso",
-    "PanasonicAutoISO": "panasonic_auto_iso",
-    "PanasonicAutoISOMin": "panasonic_auto_iso_min",
-    "PanasonicAutoISOMax": "panasonic_auto_iso_max",
-    "PanasonicAutoISOMinShutterSpeed": "panasonic_auto_iso_min_ss",
-    "PanasonicExtendedISO": "panasonic_extended_iso",
-    "PanasonicDualNativeISO": "panasonic_dual_native_iso",
-    # Lens
-    "PanasonicLensType": "panasonic_lens_type",
-    "PanasonicLensModel": "panasonic_lens_model",
-    "PanasonicLensSerialNumber": "panasonic_lens_serial",
-    "PanasonicLensFirmwareVersion": "panasonic_lens_fw",
-    "PanasonicLensFocalLength": "panasonic_lens_focal",
-    "PanasonicLensMinFocalLength": "panasonic_lens_min_focal",
-    "PanasonicLensMaxFocalLength": "panasonic_lens_max_focal",
-    "PanasonicLensMaxAperture": "panasonic_lens_max_aperture",
-    "PanasonicLensMinAperture": "panasonic_lens_min_aperture",
-    "PanasonicLensApertureRange": "panasonic_lens_aperture_range",
-    "PanasonicLensID": "panasonic_lens_id",
-    "PanasonicMinFocusDistance": "panasonic_min_focus_distance",
-    # Accessory
-    "PanasonicAccessoryType": "panasonic_accessory_type",
-    "PanasonicAccessorySerialNumber": "panasonic_accessory_serial",
-    "PanasonicAccessoryFirmware": "panasonic_accessory_fw",
-    "PanasonicGripUsed": "panasonic_grip_used",
-    "PanasonicBatteryGrip": "panasonic_battery_grip",
-    # Burst/Drive Mode
-    "PanasonicBurstMode": "panasonic_burst_mode",
-    "PanasonicBurstRate": "panasonic_burst_rate",
-    "PanasonicBurstSpeed": "panasonic_burst_speed",
-    "PanasonicBurstCount": "panasonic_burst_count",
-    "PanasonicHighSpeedBurst": "panasonic_high_speed_burst",
-    "PanasonicSequenceNumber": "panasonic_sequence_number",
-    "PanasonicDriveMode": "panasonic_drive_mode",
-    "PanasonicSelfTimer": "panasonic_self_timer",
-    # 4K/6K Photo
-    "Panasonic4KPhotoMode": "panasonic_4k_photo",
-    "Panasonic4KPhotoBurst": "panasonic_4k_photo_burst",
-    "Panasonic4KPhotoFPS": "panasonic_4k_photo_fps",
-    "Panasonic4KPhotoOutputRatio": "panasonic_4k_photo_ratio",
-    "Panasonic6KPhotoMode": "panasonic_6k_photo",
-    "Panasonic6KPhotoBurst": "panasonic_6k_photo_burst",
-    # Post Focus
-    "PanasonicPostFocusMode": "panasonic_post_focus",
-    "PanasonicPostFocusMerging": "panasonic_post_focus_merge",
-    # Focus Stacking
-    "PanasonicFocusStacking": "panasonic_focus_stacking",
-    "PanasonicFocusStackingMode": "panasonic_focus_stacking_mode",
-    "PanasonicFocusStackingFrames": "panasonic_focus_stacking_frames",
-    # High Speed Video
-    "PanasonicHighSpeedVideo": "panasonic_hs_video",
-    "PanasonicHighSpeedVideoFPS": "panasonic_hs_video_fps",
-    # Time Lapse / Stop Motion
-    "PanasonicTimeLapse": "panasonic_time_lapse",
-    "PanasonicTimeLapseInterval": "panasonic_timelapse_interval",
-    "PanasonicTimeLapseFrames": "panasonic_timelapse_frames",
-    "PanasonicStopMotion": "panasonic_stop_motion",
-    # Flash
-    "PanasonicFlash": "panasonic_flash",
-    "PanasonicFlashFired": "panasonic_flash_fired",
-    "PanasonicFlashMode": "panasonic_flash_mode",
-    "PanasonicFlashExposureComp": "panasonic_flash_ec",
-    "PanasonicFlashSyncSpeed": "panasonic_flash_sync_speed",
-    "PanasonicFlashOutput": "panasonic_flash_output",
-    "PanasonicFlashType": "panasonic_flash_type",
-    "PanasonicExternalFlash": "panasonic_external_flash",
-    "PanasonicExternalFlashBoost": "panasonic_ext_flash_boost",
-    "PanasonicExternalFlashZoom": "panasonic_ext_flash_zoom",
-    "PanasonicWirelessFlash": "panasonic_wireless_flash",
-    "PanasonicWirelessFlashChannel": "panasonic_wireless_flash_ch",
-    "PanasonicWirelessFlashGroup": "panasonic_wireless_flash_grp",
-    "PanasonicRedEyeReduction": "panasonic_red_eye",
-    # Remote Control
-    "PanasonicRemoteControl": "panasonic_remote",
-    "PanasonicRemoteMode": "panasonic_remote_mode",
-    "PanasonicWiFiRemote": "panasonic_wifi_remote",
-    "PanasonicBluetoothRemote": "panasonic_bt_remote",
-    # Shutter
-    "PanasonicShutterType": "panasonic_shutter_type",
-    "PanasonicElectronicShutter": "panasonic_electronic_shutter",
-    "PanasonicMechanicalShutter": "panasonic_mechanical_shutter",
-    "PanasonicShutterCount": "panasonic_shutter_count",
-    "PanasonicSilentMode": "panasonic_silent_mode",
-    "PanasonicFlickerReduction": "panasonic_flicker_reduction",
-    # 4K Cropping
-    "Panasonic4KLiveCropping": "panasonic_4k_crop",
-    "Panasonic4KCropWidth": "panasonic_4k_crop_width",
-    "Panasonic4KCropHeight": "panasonic_4k_crop_height",
-    # HDR
-    "PanasonicHDR": "panasonic_hdr",
-    "PanasonicHDRMode": "panasonic_hdr_mode",
-    "PanasonicHDRIntensity": "panasonic_hdr_intensity",
-    "PanasonicHDRSmoothing": "panasonic_hdr_smoothing",
-    # Multi Exposure
-    "PanasonicMultiExposure": "panasonic_multi_exp",
-    "PanasonicMultiExposureMode": "panasonic_multi_exp_mode",
-    "PanasonicMultiExposureFrames": "panasonic_multi_exp_frames",
-    # Panorama
-    "PanasonicPanorama": "panasonic_panorama",
-    "PanasonicPanoramaDirection": "panasonic_pano_direction",
-    # Bracket
-    "PanasonicBracketMode": "panasonic_bracket_mode",
-    "PanasonicBracketShotNumber": "panasonic_bracket_shot",
-    "PanasonicAEBracketing": "panasonic_ae_bracketing",
-    "PanasonicAEBracketSteps": "panasonic_ae_bracket_steps",
-    "PanasonicAEBracketValue": "panasonic_ae_bracket_value",
-    "PanasonicWBBracketing": "panasonic_wb_bracketing",
-    "PanasonicISOBracketing": "panasonic_iso_bracketing",
-    # Copyright/Artist
-    "PanasonicCopyright": "panasonic_copyright",
-    "PanasonicArtist": "panasonic_artist",
-    "PanasonicOwnerName": "panasonic_owner_name",
-    # Touch Screen
-    "PanasonicTouchScreen": "panasonic_touch_screen",
-    "PanasonicTouchAF": "panasonic_touch_af",
-    "PanasonicTouchShutter": "panasonic_touch_shutter",
-    # EVF/LCD
-    "PanasonicEVFBrightness": "panasonic_evf_brightness",
-    "PanasonicEVFColorTemp": "panasonic_evf_color_temp",
-    "PanasonicLCDBrightness": "panasonic_lcd_brightness",
-    "PanasonicLCDColorTemp": "panasonic_lcd_color_temp",
-    "PanasonicPreviewMode": "panasonic_preview_mode",
-    # GPS
-    "PanasonicGPSStatus": "panasonic_gps_status",
-    "PanasonicGPSLatitude": "panasonic_gps_lat",
-    "PanasonicGPSLongitude": "panasonic_gps_lon",
-    "PanasonicGPSAltitude": "panasonic_gps_alt",
-    "PanasonicGPSTimeStamp": "panasonic_gps_timestamp",
-    # Date/Time
-    "PanasonicDateTimeOriginal": "panasonic_datetime_original",
-    "PanasonicTimeZone": "panasonic_timezone",
-    # Rating
-    "PanasonicRating": "panasonic_rating",
-    # Custom Settings
-    "PanasonicCustomMode1": "panasonic_custom_mode_1",
-    "PanasonicCustomMode2": "panasonic_custom_mode_2",
-    "PanasonicCustomMode3": "panasonic_custom_mode_3",
-    "PanasonicCustomMode4": "panasonic_custom_mode_4",
-    "PanasonicFunctionButton1": "panasonic_fn_button_1",
-    "PanasonicFunctionButton2": "panasonic_fn_button_2",
-    "PanasonicFunctionButton3": "panasonic_fn_button_3",
-    "PanasonicDialSettings": "panasonic_dial_settings",
-    # Power
-    "PanasonicBatteryLevel": "panasonic_battery_level",
-    "PanasonicBatteryState": "panasonic_battery_state",
-    "PanasonicPowerSource": "panasonic_power_source",
-}
-
-PANASONIC_VIDEO_INFO = {
-    # Video Mode
-    "PanasonicVideoMode": "panasonic_video_mode",
-    "PanasonicVideoFormat": "panasonic_video_format",
-    "PanasonicVideoCodec": "panasonic_video_codec",
-    "PanasonicVideoCodecProfile": "panasonic_video_codec_profile",
-    "PanasonicVideoResolution": "panasonic_video_resolution",
-    "PanasonicVideoWidth": "panasonic_video_width",
-    "PanasonicVideoHeight": "panasonic_video_height",
-    "PanasonicVideoFrameRate": "panasonic_video_fps",
-    "PanasonicVideoBitRate": "panasonic_video_bitrate",
-    "PanasonicVideoBitDepth": "panasonic_video_bit_depth",
-    "PanasonicVideoChromaSubsampling": "panasonic_video_chroma",
-    # Professional Video
-    "PanasonicVLogMode": "panasonic_v_log",
-    "PanasonicVLogLUT": "panasonic_v_log_lut",
-    "PanasonicVGammaTone": "panasonic_v_gamma_tone",
-    "PanasonicCinelikeD": "panasonic_cinelike_d",
-    "PanasonicCinelikeD2": "panasonic_cinelike_d2",
-    "PanasonicCinelikeV": "panasonic_cinelike_v",
-    "PanasonicCinelikeV2": "panasonic_cinelike_v2",
-    "PanasonicLikeGamma": "panasonic_like_gamma",
-    "PanasonicHybridGamma": "panasonic_hybrid_gamma",
-    "PanasonicHLGMode": "panasonic_hlg_mode",
-    # Recording
-    "PanasonicRecordingMode": "panasonic_recording_mode",
-    "PanasonicRecordingFormat": "panasonic_recording_format",
-    "PanasonicRecordingBitRate": "panasonic_rec_bitrate",
-    "PanasonicRecordingQuality": "panasonic_rec_quality",
-    "PanasonicAudioChannels": "panasonic_audio_channels",
-    "PanasonicAudioSampleRate": "panasonic_audio_sr",
-    "PanasonicAudioBitDepth": "panasonic_audio_bit_depth",
-    "PanasonicMicLevel": "panasonic_mic_level",
-    "PanasonicMicLevelDisplay": "panasonic_mic_level_display",
-    "PanasonicWindFilter": "panasonic_wind_filter",
-    "PanasonicHeadphoneVolume": "panasonic_headphone_vol",
-    # Timecode
-    "PanasonicTimeCode": "panasonic_timecode",
-    "PanasonicTimeCodeMode": "panasonic_timecode_mode",
-    "PanasonicTimeCodeFormat": "panasonic_timecode_format",
-    "PanasonicTimeCodeRecMode": "panasonic_timecode_rec_mode",
-    # Special Video Features
-    "PanasonicSlowMotion": "panasonic_slow_motion",
-    "PanasonicSlowMotionFPS": "panasonic_slow_motion_fps",
-    "PanasonicQuickMotion": "panasonic_quick_motion",
-    # Anamorphic
-    "PanasonicAnamorphic": "panasonic_anamorphic",
-    "PanasonicAnamorphicDesqueeze": "panasonic_anamorphic_desqueeze",
-    # Output
-    "PanasonicHDMIOutput": "panasonic_hdmi_output",
-    "PanasonicHDMI4K60p": "panasonic_hdmi_4k_60p",
-    "PanasonicHDMIRAWOutput": "panasonic_hdmi_raw",
-    "PanasonicSDIOutput": "panasonic_sdi_output",
-}
-
-PANASONIC_FOCUS_INFO = {
-    "PanasonicFocusInfo_AFMode": "panasonic_fi_af_mode",
-    "PanasonicFocusInfo_AFAreaMode": "panasonic_fi_af_area_mode",
-    "PanasonicFocusInfo_AFPointPosition": "panasonic_fi_af_point_pos",
-    "PanasonicFocusInfo_AFPointsUsed": "panasonic_fi_af_points_used",
-    "PanasonicFocusInfo_ContrastAFIntensity": "panasonic_fi_contrast_af",
-    "PanasonicFocusInfo_DFDData": "panasonic_fi_dfd_data",
-    "PanasonicFocusInfo_FocusDistance": "panasonic_fi_focus_distance",
-    "PanasonicFocusInfo_FocusFrameSize": "panasonic_fi_focus_frame_size",
-    "PanasonicFocusInfo_FocusMode": "panasonic_fi_focus_mode",
-    "PanasonicFocusInfo_AFAssist": "panasonic_fi_af_assist",
-    "PanasonicFocusInfo_AFLimiter": "panasonic_fi_af_limiter",
-    "PanasonicFocusInfo_AFLimiterNear": "panasonic_fi_af_limiter_near",
-    "PanasonicFocusInfo_AFLimiterFar": "panasonic_fi_af_limiter_far",
-    "PanasonicFocusInfo_AFCustom1": "panasonic_fi_af_custom_1",
-    "PanasonicFocusInfo_AFCustom2": "panasonic_fi_af_custom_2",
-    "PanasonicFocusInfo_AFCustom3": "panasonic_fi_af_custom_3",
-}
-
-PANASONIC_S_SERIES = {
-    # S1/S1R/S1H/S5/S5II specific
-    "PanasonicS_ModelType": "panasonic_s_model_type",
-    "PanasonicS_SensorMode": "panasonic_s_sensor_mode",
-    "PanasonicS_HighResMode": "panasonic_s_high_res_mode",
-    "PanasonicS_HighResPixelShift": "panasonic_s_high_res_ps",
-    "PanasonicS_IBIS5Axis": "panasonic_s_ibis_5axis",
-    "PanasonicS_PhotoStyleCustom": "panasonic_s_photo_style_custom",
-    "PanasonicS_RealTimeMonitor": "panasonic_s_rt_monitor",
-    "PanasonicS_VLogView": "panasonic_s_vlog_view",
-    "PanasonicS_ProRes": "panasonic_s_prores",
-    "PanasonicS_ProResQuality": "panasonic_s_prores_quality",
-    "PanasonicS_BlackmagicRAW": "panasonic_s_braw",
-    "PanasonicS_6KOpen": "panasonic_s_6k_open",
-    "PanasonicS_5XSlowMo": "panasonic_s_5x_slow_mo",
-    "PanasonicS_PhaseHybridAF": "panasonic_s_phase_hybrid_af",
-    "PanasonicS_AnimalRecognition": "panasonic_s_animal_recognition",
-    "PanasonicS_VehicleRecognition": "panasonic_s_vehicle_recognition",
-    "PanasonicS_WaveformMonitor": "panasonic_s_waveform",
-    "PanasonicS_Vectorscope": "panasonic_s_vectorscope",
-    "PanasonicS_Active5AxisIS": "panasonic_s_active_5axis_is",
-    "PanasonicS_DualNativeISO": "panasonic_s_dual_native_iso",
-    "PanasonicS_LowLightAF": "panasonic_s_low_light_af",
-    "PanasonicS_RecordTimeLimit": "panasonic_s_rec_time_limit",
-    "PanasonicS_CoolingFan": "panasonic_s_cooling_fan",
-}
-
-PANASONIC_GH_SERIES = {
-    # GH5/GH5S/GH5II/GH6 specific
-    "PanasonicGH_ModelType": "panasonic_gh_model_type",
-    "PanasonicGH_VPreset": "panasonic_gh_v_preset",
-    "PanasonicGH_VLogL": "panasonic_gh_vlog_l",
-    "PanasonicGH_10bitInternal": "panasonic_gh_10bit_internal",
-    "PanasonicGH_400Mbps": "panasonic_gh_400mbps",
-    "PanasonicGH_CFExpressSupport": "panasonic_gh_cfexpress",
-    "PanasonicGH_Anamorphic4K": "panasonic_gh_anamorphic_4k",
-    "PanasonicGH_ProRes": "panasonic_gh_prores",
-    "PanasonicGH_SyncScan": "panasonic_gh_sync_scan",
-    "PanasonicGH_MasterPedestal": "panasonic_gh_master_pedestal",
-    "PanasonicGH_LensBreathing": "panasonic_gh_lens_breathing",
-    "PanasonicGH_VVariableFrame": "panasonic_gh_v_variable_frame",
-    "PanasonicGH_HighFrameRate": "panasonic_gh_high_frame_rate",
-    "PanasonicGH_LowLightAF": "panasonic_gh_low_light_af",
-    "PanasonicGH_DualCardRecording": "panasonic_gh_dual_card",
-}
-
-
-
-PENTAX_CAMERA_SETTINGS = {
-    # Version & Identity
-    "PentaxVersion": "pentax_version",
-    "PentaxMakerNoteVersion": "pentax_makernote_version",
-    "PentaxCameraType": "pentax_camera_type",
-    "PentaxModelID": "pentax_model_id",
-    "PentaxModelName": "pentax_model_name",
-    "PentaxSerialNumber": "pentax_serial_number",
-    "PentaxInternalSerialNumber": "pentax_internal_serial",
-    "PentaxBodySerialNumber": "pentax_body_serial",
-    "PentaxFirmwareVersion": "pentax_firmware_version",
-    "PentaxFirmwareDate": "pentax_firmware_date",
-    # Image Quality
-    "PentaxImageSize": "pentax_image_size",
-    "PentaxImageWidth": "pentax_image_width",
-    "PentaxImageHeight": "pentax_image_height",
-    "PentaxQuality": "pentax_quality",
-    "PentaxQuality2": "pentax_quality_2",
-    "PentaxQualityMode": "pentax_quality_mode",
-    "PentaxRawFormat": "pentax_raw_format",
-    "PentaxDNGVersion": "pentax_dng_version",
-    "PentaxImageCompressionType": "pentax_compression_type",
-    "PentaxSRResult": "pentax_sr_result",
-    # Focus
-    "PentaxFocusMode": "pentax_focus_mode",
-    "PentaxFocusMode2": "pentax_focus_mode_2",
-    "PentaxAFMode": "pentax_af_mode",
-    "PentaxAFPoint": "pentax_af_point",
-    "PentaxAFPointActive": "pentax_af_point_active",
-    "PentaxAFPointInFocus": "pentax_af_in_focus",
-    "PentaxAFPointsUsed": "pentax_af_points_used",
-    "PentaxAFPointCount": "pentax_af_point_count",
-    "PentaxAFAreaMode": "pentax_af_area_mode",
-    "PentaxAFHold": "pentax_af_hold",
-    "PentaxAFAssist": "pentax_af_assist",
-    "PentaxAFSelect": "pentax_af_select",
-    "PentaxContrastAF": "pentax_contrast_af",
-    "PentaxPhaseAF": "pentax_phase_af",
-    "PentaxAFStatus": "pentax_af_status",
-    "PentaxAFDistance": "pentax_af_distance",
-    "PentaxAFDistanceInfinity": "pentax_af_distance_infinity",
-    "PentaxAFFineTune": "pentax_af_fine_tune",
-    "PentaxAFFineTuneValue": "pentax_af_fine_tune_value",
-    "PentaxFocusDistance": "pentax_focus_distance",
-    "PentaxFocusDistanceLower": "pentax_focus_distance_lower",
-    "PentaxFocusDistanceUpper": "pentax_focus_distance_upper",
-    "PentaxFocusPeaking": "pentax_focus_peaking",
-    "PentaxFocusPeakingLevel": "pentax_focus_peaking_level",
-    "PentaxFocusPeakingColor": "pentax_focus_peaking_color",
-    # Exposure
-    "PentaxExposureTime": "pentax_exposure_time",
-    "PentaxShutterSpeed": "pentax_shutter_speed",
-    "PentaxFNumber": "pentax_f_number",
-    "PentaxAperture": "pentax_aperture",
-    "PentaxISO": "pentax_iso",
-    "PentaxISOSetting": "pentax_iso_setting",
-    "PentaxBaseISO": "pentax_base_iso",
-    "PentaxAutoISO": "pentax_auto_iso",
-    "PentaxAutoISOMin": "pentax_auto_iso_min",
-    "PentaxAutoISOMax": "pentax_auto_iso_max",
-    "PentaxISOFloor": "pentax_iso_floor",
-    "PentaxHighISONoiseReduction": "pentax_high_iso_nr",
-    "PentaxHighISONoiseReductionLevel": "pentax_high_iso_nr_level",
-    "PentaxExposureMode": "pentax_exposure_mode",
-    "PentaxProgramMode": "pentax_program_mode",
-    "PentaxProgramLine": "pentax_program_line",
-    "PentaxExposureCompensation": "pentax_exposure_comp",
-    "PentaxExposureBracketValue": "pentax_exp_bracket_value",
-    # Metering
-    "PentaxMeteringMode": "pentax_metering_mode",
-    "PentaxMeteringMode2": "pentax_metering_mode_2",
-    "PentaxAEMeteringPoints": "pentax_ae_points",
-    "PentaxAEMeteringAreas": "pentax_ae_areas",
-    "PentaxAEMeteringSegments": "pentax_ae_metering_segments",
-    "PentaxAELock": "pentax_ae_lock",
-    "PentaxAELockButton": "pentax_ae_lock_button",
-    "PentaxMultiExposure": "pentax_multi_exposure",
-    "PentaxMultiExposureMode": "pentax_multi_exp_mode",
-    "PentaxMultiExposureShots": "pentax_multi_exp_shots",
-    # White Balance
-    "PentaxWhiteBalance": "pentax_white_balance",
-    "PentaxWhiteBalanceMode": "pentax_wb_mode",
-    "PentaxWhiteBalance2": "pentax_wb_2",
-    "PentaxWhiteBalanceFine": "pentax_wb_fine",
-    "PentaxWhiteBalanceShiftAB": "pentax_wb_shift_ab",
-    "PentaxWhiteBalanceShiftGM": "pentax_wb_shift_gm",
-    "PentaxColorTemperature": "pentax_color_temp",
-    "PentaxColorTemperature2": "pentax_color_temp_2",
-    "PentaxCustomWB1": "pentax_custom_wb_1",
-    "PentaxCustomWB2": "pentax_custom_wb_2",
-    "PentaxCustomWB3": "pentax_custom_wb_3",
-    # Color & Tone
-    "PentaxColorMode": "pentax_color_mode",
-    "PentaxSaturation": "pentax_saturation",
-    "PentaxContrast": "pentax_contrast",
-    "PentaxSharpness": "pentax_sharpness",
-    "PentaxNoiseReduction": "pentax_noise_reduction",
-    "PentaxHighlightCorrection": "pentax_highlight_correction",
-    "PentaxShadowCorrection": "pentax_shadow_correct",
-    "PentaxLensCorrection": "pentax_lens_correct",
-    "PentaxDistortionCorrection": "pentax_distortion_correct",
-    "PentaxLateralChromatic": "pentax_lateral_chromatic",
-    "PentaxVignettingCorrection": "pentax_vignetting_correct",
-    "PentaxDiffractionCorrection": "pentax_diffraction_correct",
-    "PentaxClarity": "pentax_clarity",
-    "PentaxSkinTone": "pentax_skin_tone",
-    "PentaxFineSharpness": "pentax_fine_sharpness",
-    "PentaxExtraSharpness": "pentax_extra_sharpness",
-    # Picture Mode
-    "PentaxPictureMode": "pentax_picture_mode",
-    "PentaxPictureMode2": "pentax_picture_mode_2",
-    "PentaxCustomImageStyle": "pentax_custom_image_style",
-    "PentaxCustomImage": "pentax_custom_image",
-    "PentaxCrossProcess": "pentax_cross_process",
-    "PentaxDigitalFilter": "pentax_digital_filter",
-    "PentaxDigitalFilterEffect": "pentax_digital_filter_effect",
-    "PentaxHDR": "pentax_hdr",
-    "PentaxHDRMode": "pentax_hdr_mode",
-    "PentaxHDRAuto": "pentax_hdr_auto",
-    "PentaxHDRRange": "pentax_hdr_range",
-    # Shutter & Drive
-    "PentaxShutterCount": "pentax_shutter_count",
-    "PentaxShutterType": "pentax_shutter_type",
-    "PentaxElectronicShutter": "pentax_electronic_shutter",
-    "PentaxMechanicalShutter": "pentax_mechanical_shutter",
-    "PentaxDriveMode": "pentax_drive_mode",
-    "PentaxDriveMode2": "pentax_drive_mode_2",
-    "PentaxBurstMode": "pentax_burst_mode",
-    "PentaxBurstSpeed": "pentax_burst_speed",
-    "PentaxSelfTimer": "pentax_self_timer",
-    "PentaxSelfTimerDelay": "pentax_self_timer_delay",
-    "PentaxSelfTimerShots": "pentax_self_timer_shots",
-    "PentaxIntervalShooting": "pentax_interval_shooting",
-    "PentaxIntervalDuration": "pentax_interval_duration",
-    "PentaxIntervalShots": "pentax_interval_shots",
-    "PentaxMirrorLockup": "pentax_mirror_lockup",
-    "PentaxAntiShock": "pentax_anti_shock",
-    # Bracketing
-    "PentaxBracketMode": "pentax_bracket_mode",
-    "PentaxBracketShotNumber": "pentax_bracket_shot",
-    "PentaxAutoExposureBracketing": "pentax_aeb",
-    "PentaxAEBracketSteps": "pentax_ae_bracket_steps",
-    "PentaxAEBracketOrder": "pentax_ae_bracket_order",
-    "PentaxWhiteBalanceBracket": "pentax_wb_bracket",
-    "PentaxISOBracket": "pentax_iso_bracket",
-    "PentaxFocusBracketing": "pentax_focus_bracketing",
-    "PentaxFocusBracketSteps": "pentax_focus_bracket_steps",
-    # Flash
-    "PentaxFlashMode": "pentax_flash_mode",
-    "PentaxFlashMode2": "pentax_flash_mode_2",
-    "PentaxFlashExposureCompensation": "pentax_flash_ec",
-    "PentaxFlashStatus": "pentax_flash_status",
-    "PentaxFlashFired": "pentax_flash_fired",
-    "PentaxInternalFlash": "pentax_internal_flash",
-    "PentaxExternalFlash": "pentax_external_flash",
-    "PentaxExternalFlashModel": "pentax_ext_flash_model",
-    "PentaxExternalFlashSerial": "pentax_ext_flash_serial",
-    "PentaxExternalFlashMode": "pentax_ext_flash_mode",
-    "PentaxExternalFlashOutput": "pentax_ext_flash_output",
-    "PentaxRedEyeReduction": "pentax_red_eye",
-    "PentaxFlashSyncSpeed": "pentax_flash_sync_speed",
-    "PentaxHighSpeedSync": "pentax_high_speed_sync",
-    "PentaxWirelessFlash": "pentax_wireless_flash",
-    "PentaxWirelessFlashChannel": "pentax_wireless_flash_ch",
-    "PentaxWirelessFlashMode": "pentax_wireless_flash_mode",
-    # Dynamic Range
-    "PentaxDynamicRange": "pentax_dynamic_range",
-    "PentaxDynamicRangeExpansion": "pentax_dre",
-    "PentaxDRO": "pentax_dro",
-    "PentaxDROLevel": "pentax_dro_level",
-    "PentaxDustRemoval": "pentax_dust_removal",
-    "PentaxDustRemovalData": "pentax_dust_removal_data",
-    # Lens Info
-    "PentaxLensType": "pentax_lens_type",
-    "PentaxLensID": "pentax_lens_id",
-    "PentaxLensSerialNumber": "pentax_lens_serial",
-    "PentaxLensModel": "pentax_lens_model",
-    "PentaxLensName": "pentax_lens_name",
-    "PentaxLensFirmware": "pentax_lens_firmware",
-    "PentaxLensFStops": "pentax_lens_f_stops",
-    "PentaxLensMinAperture": "pentax_lens_min_aperture",
-    "PentaxLensMaxAperture": "pentax_lens_max_aperture",
-    "PentaxLensMinFocalLength": "pentax_lens_min_focal",
-    "PentaxLensMaxFocalLength": "pentax_lens_max_focal",
-    "PentaxLensFocalLength": "pentax_lens_focal_length",
-    "PentaxMinFocusDistance": "pentax_min_focus_distance",
-    "PentaxFocalLengthIn35mmFormat": "pentax_focal_35mm",
-    "PentaxLensMount": "pentax_lens_mount",
-    "PentaxLensOS": "pentax_lens_os",
-    "PentaxOpticalImageStabilization": "pentax_ois",
-    "PentaxLensSDM": "pentax_lens_sdm",
-    "PentaxLensDC": "pentax_lens_dc",
-    "PentaxLensPLM": "pentax_lens_plm",
-    "PentaxLensHDDA": "pentax_lens_hdda",
-    "PentaxLensDA": "pentax_lens_da",
-    "PentaxLensDAL": "pentax_lens_dal",
-    "PentaxLensFA": "pentax_lens_fa",
-    "PentaxLensDFA": "pentax_lens_dfa",
-    "PentaxK1LensInfo": "pentax_k1_lens_info",
-    # Shake Reduction
-    "PentaxShakeReduction": "pentax_shake_reduction",
-    "PentaxSR": "pentax_sr",
-    "PentaxSRActive": "pentax_sr_active",
-    "PentaxSRMode": "pentax_sr_mode",
-    "PentaxSRFocalLength": "pentax_sr_focal_length",
-    "PentaxPixelShiftResolution": "pentax_pixel_shift",
-    "PentaxPixelShiftMode": "pentax_pixel_shift_mode",
-    "PentaxPixelShiftResolutionMode": "pentax_pixel_shift_res_mode",
-    "PentaxAstroTracer": "pentax_astro_tracer",
-    "PentaxAstroTracerMode": "pentax_astro_tracer_mode",
-    "PentaxAstroTracerDuration": "pentax_astro_tracer_duration",
-    # AA Filter
-    "PentaxAAFilter": "pentax_aa_filter",
-    "PentaxAAFilterMode": "pentax_aa_filter_mode",
-    "PentaxAAFilterCancel": "pentax_aa_filter_cancel",
-    "PentaxAAFilterBracketing": "pentax_aa_filter_bracket",
-    # Film Simulation & Color
-    "PentaxFilmSimulation": "pentax_film_sim",
-    "PentaxFilmMode": "pentax_film_mode",
-    "PentaxColorCapture": "pentax_color_capture",
-    "PentaxColorSpace": "pentax_color_space",
-    "PentaxFreshness": "pentax_freshness",
-    "PentaxBleachBypass": "pentax_bleach_bypass",
-    "PentaxBlackAndWhiteFilter": "pentax_bw_filter",
-    "PentaxBlackAndWhiteToning": "pentax_bw_toning",
-    # Custom Functions
-    "PentaxCustomPreview": "pentax_custom_preview",
-    "PentaxCustomFunction1": "pentax_custom_fn_1",
-    "PentaxCustomFunction2": "pentax_custom_fn_2",
-    "PentaxCustomFunction3": "pentax_custom_fn_3",
-    "PentaxCustomFunction4": "pentax_custom_fn_4",
-    "PentaxCustomFunction5": "pentax_custom_fn_5",
-    "PentaxCustomFunction6": "pentax_custom_fn_6",
-    "PentaxCustomFunction7": "pentax_custom_fn_7",
-    "PentaxCustomFunction8": "pentax_custom_fn_8",
-    "PentaxCustomFunction9": "pentax_custom_fn_9",
-    "PentaxCustomFunction10": "pentax_custom_fn_10",
-    "PentaxUserMode1": "pentax_user_mode_1",
-    "PentaxUserMode2": "pentax_user_mode_2",
-    "PentaxUserMode3": "pentax_user_mode_3",
-    "PentaxUserMode4": "pentax_user_mode_4",
-    "PentaxUserMode5": "pentax_user_mode_5",
-    # GPS
-    "PentaxGPS": "pentax_gps",
-    "PentaxGPSStatus": "pentax_gps_status",
-    "PentaxGPSLatitude": "pentax_gps_lat",
-    "PentaxGPSLongitude": "pentax_gps_lon",
-    "PentaxGPSAltitude": "pentax_gps_alt",
-    "PentaxGPSTime": "pentax_gps_time",
-    "PentaxGPSDate": "pentax_gps_date",
-    "PentaxGPSMapDatum": "pentax_gps_map_datum",
-    "PentaxGPSSpeed": "pentax_gps_speed",
-    "PentaxGPSTrack": "pentax_gps_track",
-    "PentaxGPSImgDirection": "pentax_gps_img_direction",
-    "PentaxGPSDestLatitude": "pentax_gps_dest_lat",
-    "PentaxGPSDestLongitude": "pentax_gps_dest_lon",
-    "PentaxGPSSatellites": "pentax_gps_satellites",
-    "PentaxGPSVersionID": "pentax_gps_version_id",
-    # Electronic Level
-    "PentaxElectronicLevel": "pentax_level",
-    "PentaxLevelRoll": "pentax_level_roll",
-    "PentaxLevelPitch": "pentax_level_pitch",
-    "PentaxLevelYaw": "pentax_level_yaw",
-    "PentaxHorizonCorrection": "pentax_horizon_correction",
-    "PentaxCompositionAdjust": "pentax_composition_adjust",
-    # EVF/LCD
-    "PentaxEVFBrightness": "pentax_evf_brightness",
-    "PentaxLCDBrightness": "pentax_lcd_brightness",
-    "PentaxLCDColorTemp": "pentax_lcd_color_temp",
-    "PentaxPreviewExposure": "pentax_preview_exposure",
-    # Temperature
-    "PentaxTemperature": "pentax_temperature",
-    "PentaxCameraTemperature": "pentax_camera_temp",
-    "PentaxSensorTemperature": "pentax_sensor_temp",
-    "PentaxBatteryTemperature": "pentax_battery_temp",
-    # Battery
-    "PentaxBatteryLevel": "pentax_battery_level",
-    "PentaxBatteryVoltage": "pentax_battery_voltage",
-    "PentaxBatteryGrip": "pentax_battery_grip",
-    "PentaxPowerSource": "pentax_power_source",
-    # Other
-    "PentaxPrivacyIndicator": "pentax_privacy",
-    "PentaxDateTimeOriginal": "pentax_datetime_original",
-    "PentaxTimeZone": "pentax_timezone",
-    "PentaxImageNumber": "pentax_image_number",
-    "PentaxFileNumber": "pentax_file_number",
-    "PentaxOwnerName": "pentax_owner_name",
-    "PentaxArtist": "pentax_artist",
-    "PentaxCopyright": "pentax_copyright",
-    # Scene Modes
-    "PentaxSceneMode": "pentax_scene_mode",
-    "PentaxSceneMode2": "pentax_scene_mode_2",
-    "PentaxSceneDetect": "pentax_scene_detect",
-    # Video
-    "PentaxVideoQuality": "pentax_video_quality",
-    "PentaxVideoFrameRate": "pentax_video_fps",
-    "PentaxVideoCodec": "pentax_video_codec",
-    "PentaxVideoStabilization": "pentax_video_stab",
-    "PentaxMovieImageSize": "pentax_movie_size",
-    "PentaxMovieMode": "pentax_movie_mode",
-    # WiFi
-    "PentaxWiFi": "pentax_wifi",
-    "PentaxWiFiMAC": "pentax_wifi_mac",
-    "PentaxBluetoothMAC": "pentax_bt_mac",
-}
-
-PENTAX_LENS_DATA = {
-    "PentaxLensData_LensName": "pentax_ld_lens_name",
-    "PentaxLensData_LensGroupName": "pentax_ld_lens_group",
-    "PentaxLensData_MinFocalLength": "pentax_ld_min_focal",
-    "PentaxLensData_MaxFocalLength": "pentax_ld_max_focal",
-    "PentaxLensData_MaxApertureAtMinFocal": "pentax_ld_max_ap_min",
-    "PentaxLensData_MaxApertureAtMaxFocal": "pentax_ld_max_ap_max",
-    "PentaxLensData_MCNumber": "pentax_ld_mc_number",
-    "PentaxLensData_LensID": "pentax_ld_lens_id",
-    "PentaxLensData_LensType": "pentax_ld_lens_type",
-    "PentaxLensData_NominalMinAperture": "pentax_ld_nom_min_ap",
-    "PentaxLensData_NominalMaxAperture": "pentax_ld_nom_max_ap",
-    "PentaxLensData_LensData1": "pentax_ld_data_1",
-    "PentaxLensData_LensData2": "pentax_ld_data_2",
-    "PentaxLensData_LensData3": "pentax_ld_data_3",
-    "PentaxLensData_ExtenderStatus": "pentax_ld_extender",
-    "PentaxLensData_ExtenderModel": "pentax_ld_extender_model",
-}
-
-PENTAX_AF_INFO = {
-    "PentaxAFInfo_AFVersion": "pentax_afi_version",
-    "PentaxAFInfo_ContrastAFStatus": "pentax_afi_contrast_status",
-    "PentaxAFInfo_PDAFPointsInFocus": "pentax_afi_pdaf_points",
-    "PentaxAFInfo_ImageAreaMode": "pentax_afi_image_area_mode",
-    "PentaxAFInfo_AFPointSelected": "pentax_afi_af_point_selected",
-    "PentaxAFInfo_AFPoints": "pentax_afi_af_points",
-    "PentaxAFInfo_AFPointInFocus": "pentax_afi_af_point_in_focus",
-    "PentaxAFInfo_AFSelectAreaModes": "pentax_afi_select_modes",
-    "PentaxAFInfo_AFVersionStamp": "pentax_afi_version_stamp",
-    "PentaxAFInfo_AFAreas1": "pentax_afi_areas_1",
-    "PentaxAFInfo_AFAreas2": "pentax_afi_areas_2",
-    "PentaxAFInfo_DepthFromFocus": "pentax_afi_depth_from_focus",
-    "PentaxAFInfo_AFPointCount": "pentax_afi_point_count",
-}
-
-PENTAX_AE_INFO = {
-    "PentaxAEInfo_AEVersion": "pentax_aei_version",
-    "PentaxAEInfo_AEExposureTime": "pentax_aei_exposure_time",
-    "PentaxAEInfo_AEAperture": "pentax_aei_aperture",
-    "PentaxAEInfo_AEISO": "pentax_aei_iso",
-    "PentaxAEInfo_AEXv": "pentax_aei_xv",
-    "PentaxAEInfo_AEBv": "pentax_aei_bv",
-    "PentaxAEInfo_AEAvApex": "pentax_aei_av_apex",
-    "PentaxAEInfo_AETvApex": "pentax_aei_tv_apex",
-    "PentaxAEInfo_AESvApex": "pentax_aei_sv_apex",
-    "PentaxAEInfo_AEMinExposureTime": "pentax_aei_min_exp_time",
-    "PentaxAEInfo_AEMaxExposureTime": "pentax_aei_max_exp_time",
-    "PentaxAEInfo_AEMinAperture": "pentax_aei_min_aperture",
-    "PentaxAEInfo_AEMaxAperture": "pentax_aei_max_aperture",
-    "PentaxAEInfo_AEMinISO": "pentax_aei_min_iso",
-    "PentaxAEInfo_AEMaxISO": "pentax_aei_max_iso",
-    "PentaxAEInfo_AEMeteringMode": "pentax_aei_metering_mode",
-    "PentaxAEInfo_AEMeteringSegments": "pentax_aei_metering_segments",
-    "PentaxAEInfo_AEExpProgramShift": "pentax_aei_exp_program_shift",
-}
-
-PENTAX_FLASH_INFO = {
-    "PentaxFlashInfo_FlashVersion": "pentax_fi_version",
-    "PentaxFlashInfo_FlashStatus": "pentax_fi_status",
-    "PentaxFlashInfo_InternalFlashMode": "pentax_fi_internal_mode",
-    "PentaxFlashInfo_ExternalFlashMode": "pentax_fi_external_mode",
-    "PentaxFlashInfo_InternalFlashStrength": "pentax_fi_internal_strength",
-    "PentaxFlashInfo_ExternalFlashStrength": "pentax_fi_external_strength",
-    "PentaxFlashInfo_FlashEC": "pentax_fi_flash_ec",
-    "PentaxFlashInfo_ExternalFlashModel": "pentax_fi_ext_model",
-    "PentaxFlashInfo_ExternalFlashSerial": "pentax_fi_ext_serial",
-    "PentaxFlashInfo_ExternalFlashGuideNumber": "pentax_fi_ext_gn",
-    "PentaxFlashInfo_ExternalFlashBounce": "pentax_fi_ext_bounce",
-    "PentaxFlashInfo_RedEyeReduction": "pentax_fi_red_eye",
-    "PentaxFlashInfo_WirelessFlashMode": "pentax_fi_wireless_mode",
-    "PentaxFlashInfo_WirelessChannel": "pentax_fi_wireless_channel",
-    "PentaxFlashInfo_SlowSyncMode": "pentax_fi_slow_sync",
-    "PentaxFlashInfo_HighSpeedSync": "pentax_fi_hss",
-}
-
-PENTAX_COLOR_INFO = {
-    "PentaxColorInfo_Version": "pentax_ci_version",
-    "PentaxColorInfo_WBShiftAB": "pentax_ci_wb_shift_ab",
-    "PentaxColorInfo_WBShiftGM": "pentax_ci_wb_shift_gm",
-    "PentaxColorInfo_WBRedLevel": "pentax_ci_wb_red",
-    "PentaxColorInfo_WBBlueLevel": "pentax_ci_wb_blue",
-    "PentaxColorInfo_WBGreenLevel": "pentax_ci_wb_green",
-    "PentaxColorInfo_ColorTemperature": "pentax_ci_color_temp",
-    "PentaxColorInfo_Saturation": "pentax_ci_saturation",
-    "PentaxColorInfo_Contrast": "pentax_ci_contrast",
-    "PentaxColorInfo_Sharpness": "pentax_ci_sharpness",
-    "PentaxColorInfo_HighlightAdjust": "pentax_ci_highlight_adj",
-    "PentaxColorInfo_ShadowAdjust": "pentax_ci_shadow_adj",
-}
-
-
-
-
-CANON_LENS_INFO = {
-    "CanonLI_LensSerialNumber": "canon_lens_serial_number",
-    "CanonLI_InternalSerialNumber": "canon_internal_serial_number",
-    "CanonLI_FirmwareVersion": "canon_firmware_version",
-    "CanonLI_LensModel": "canon_lens_model",
-    "CanonLI_LensID": "canon_lens_id",
-    "CanonLI_ImageStabilization": "canon_lens_is",
-    "CanonLI_MinFocusDistance": "canon_min_focus_distance",
-    "CanonLI_MaxFocusDistance": "canon_max_focus_distance",
-    "CanonLI_MaxAperture": "canon_lens_max_aperture",
-    "CanonLI_MinAperture": "canon_lens_min_aperture",
-    "CanonLI_FilterDiameter": "canon_filter_diameter",
-    "CanonLI_LensWeight": "canon_lens_weight",
-    "CanonLI_LensLength": "canon_lens_length",
-    "CanonLI_LensDiameter": "canon_lens_diameter",
-    "CanonLI_MountType": "canon_mount_type",
-    "CanonLI_Teleconverter": "canon_teleconverter",
-    "CanonLI_ExtensionTube": "canon_extension_tube",
-    "CanonLI_LensFirmware": "canon_lens_firmware",
-    "CanonLI_MinFocalLength": "canon_lens_min_focal",
-    "CanonLI_MaxFocalLength": "canon_lens_max_focal",
-    "CanonLI_MaxMagnification": "canon_lens_max_mag",
-    "CanonLI_FilterSize": "canon_filter_size",
-    "CanonLI_HoodModel": "canon_hood_model",
-    "CanonLI_LensType1": "canon_lens_type_1",
-    "CanonLI_LensType2": "canon_lens_type_2",
-    "CanonLI_LensType3": "canon_lens_type_3",
-    "CanonLI_LensType4": "canon_lens_type_4",
-    "CanonLI_FocalLengthMultiplier": "canon_focal_mult",
-    "CanonLI_AFDriverVersion": "canon_af_driver_ver",
-    "CanonLI_MotorDriverVersion": "canon_motor_driver_ver",
-    "CanonLI_FocusLensPosition": "canon_focus_lens_pos",
-    "CanonLI_FocusLensAxis1": "canon_focus_lens_axis_1",
-    "CanonLI_FocusLensAxis2": "canon_focus_lens_axis_2",
-    "CanonLI_FocusLensAxis3": "canon_focus_lens_axis_3",
-    "CanonLI_FocusLensAxis4": "canon_focus_lens_axis_4",
-    "CanonLI_FocusLensAxis5": "canon_focus_lens_axis_5",
-    "CanonLI_FocusLensAxis6": "canon_focus_lens_axis_6",
-    "CanonLI_FocusLensAxis7": "canon_focus_lens_axis_7",
-    "CanonLI_FocusLensAxis8": "canon_focus_lens_axis_8",
-    "CanonLI_ExitPupilPosition": "canon_exit_pupil_pos",
-    "CanonLI_AFMicroAdj": "canon_af_micro_adj",
-    "CanonLI_AFMicroAdjValue": "canon_af_micro_adj_val",
-}
-
-CANON_COLOR_DATA_V1 = {
-    "CanonCD1_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto",
-    "CanonCD1_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight",
-    "CanonCD1_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy",
-    "CanonCD1_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten",
-    "CanonCD1_WBRGGBLevelsFluorescent": "canon_wb_rggb_levels_fluorescent",
-    "CanonCD1_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash",
-    "CanonCD1_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1",
-    "CanonCD1_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2",
-    "CanonCD1_ColorTempAuto": "canon_color_temp_auto",
-    "CanonCD1_ColorTempDaylight": "canon_color_temp_daylight",
-    "CanonCD1_ColorTempCloudy": "canon_color_temp_cloudy",
-    "CanonCD1_ColorTempTungsten": "canon_color_temp_tungsten",
-    "CanonCD1_ColorTempFluorescent": "canon_color_temp_fluorescent",
-    "CanonCD1_ColorTempFlash": "canon_color_temp_flash",
-    "CanonCD1_ColorTempCustom1": "canon_color_temp_custom_1",
-    "CanonCD1_ColorTempCustom2": "canon_color_temp_custom_2",
-    "CanonCD1_AverageBlackLevel": "canon_average_black_level",
-    "CanonCD1_RowBlackBalance": "canon_row_black_balance",
-    "CanonCD1_CalibrationIlluminant1": "canon_calibration_illuminant_1",
-    "CanonCD1_CalibrationIlluminant2": "canon_calibration_illuminant_2",
-    "CanonCD1_ColorMatrix1": "canon_color_matrix_1",
-    "CanonCD1_ColorMatrix2": "canon_color_matrix_2",
-    "CanonCD1_CRC": "canon_crc",
-}
-
-CANON_COLOR_DATA_V2 = {
-    "CanonCD2_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v2",
-    "CanonCD2_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v2",
-    "CanonCD2_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v2",
-    "CanonCD2_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v2",
-    "CanonCD2_WBRGGBLevelsFluorescent": "canon_wb_rggb_levels_fluorescent_v2",
-    "CanonCD2_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v2",
-    "CanonCD2_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v2",
-    "CanonCD2_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v2",
-    "CanonCD2_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v2",
-    "CanonCD2_ColorTempAuto": "canon_color_temp_auto_v2",
-    "CanonCD2_ColorTempDaylight": "canon_color_temp_daylight_v2",
-    "CanonCD2_ColorTempCloudy": "canon_color_temp_cloudy_v2",
-    "CanonCD2_ColorTempTungsten": "canon_color_temp_tungsten_v2",
-    "CanonCD2_ColorTempFluorescent": "canon_color_temp_fluorescent_v2",
-    "CanonCD2_ColorTempFlash": "canon_color_temp_flash_v2",
-    "CanonCD2_ColorTempCustom1": "canon_color_temp_custom_1_v2",
-    "CanonCD2_ColorTempCustom2": "canon_color_temp_custom_2_v2",
-    "CanonCD2_ColorTempCustom3": "canon_color_temp_custom_3_v2",
-    "CanonCD2_AverageBlackLevel": "canon_average_black_level_v2",
-    "CanonCD2_NormalWhiteLevel": "canon_normal_white_level",
-    "CanonCD2_SpecularWhiteLevel": "canon_specular_white_level",
-    "CanonCD2_WhiteLevel": "canon_white_level",
-    "CanonCD2_PerChannelBlackLevel": "canon_per_channel_black_level",
-    "CanonCD2_ColorMatrix": "canon_color_matrix_v2",
-    "CanonCD2_CalibrationIlluminant1": "canon_calibration_illuminant_1_v2",
-    "CanonCD2_CalibrationIlluminant2": "canon_calibration_illuminant_2_v2",
-    "CanonCD2_CRC": "canon_crc_v2",
-}
-
-CANON_COLOR_DATA_V4 = {
-    "CanonCD4_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v4",
-    "CanonCD4_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v4",
-    "CanonCD4_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v4",
-    "CanonCD4_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v4",
-    "CanonCD4_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v4",
-    "CanonCD4_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v4",
-    "CanonCD4_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v4",
-    "CanonCD4_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v4",
-    "CanonCD4_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v4",
-    "CanonCD4_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v4",
-    "CanonCD4_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v4",
-    "CanonCD4_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v4",
-    "CanonCD4_ColorTempAuto": "canon_color_temp_auto_v4",
-    "CanonCD4_ColorTempDaylight": "canon_color_temp_daylight_v4",
-    "CanonCD4_ColorTempShade": "canon_color_temp_shade_v4",
-    "CanonCD4_ColorTempCloudy": "canon_color_temp_cloudy_v4",
-    "CanonCD4_ColorTempTungsten": "canon_color_temp_tungsten_v4",
-    "CanonCD4_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v4",
-    "CanonCD4_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v4",
-    "CanonCD4_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v4",
-    "CanonCD4_ColorTempFlash": "canon_color_temp_flash_v4",
-    "CanonCD4_ColorTempCustom1": "canon_color_temp_custom_1_v4",
-    "CanonCD4_ColorTempCustom2": "canon_color_temp_custom_2_v4",
-    "CanonCD4_ColorTempCustom3": "canon_color_temp_custom_3_v4",
-    "CanonCD4_AverageBlackLevel": "canon_average_black_level_v4",
-    "CanonCD4_NormalWhiteLevel": "canon_normal_white_level_v4",
-    "CanonCD4_SpecularWhiteLevel": "canon_specular_white_level_v4",
-    "CanonCD4_WhiteLevel": "canon_white_level_v4",
-    "CanonCD4_PerChannelBlackLevel": "canon_per_channel_black_level_v4",
-    "CanonCD4_ColorMatrix1": "canon_color_matrix_1_v4",
-    "CanonCD4_ColorMatrix2": "canon_color_matrix_2_v4",
-    "CanonCD4_CalibrationIlluminant1": "canon_calibration_illuminant_1_v4",
-    "CanonCD4_CalibrationIlluminant2": "canon_calibration_illuminant_2_v4",
-    "CanonCD4_CRC": "canon_crc_v4",
-}
-
-CANON_COLOR_DATA_V5 = {
-    "CanonCD5_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v5",
-    "CanonCD5_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v5",
-    "CanonCD5_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v5",
-    "CanonCD5_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v5",
-    "CanonCD5_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v5",
-    "CanonCD5_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v5",
-    "CanonCD5_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v5",
-    "CanonCD5_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v5",
-    "CanonCD5_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v5",
-    "CanonCD5_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v5",
-    "CanonCD5_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v5",
-    "CanonCD5_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v5",
-    "CanonCD5_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v5",
-    "CanonCD5_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v5",
-    "CanonCD5_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v5",
-    "CanonCD5_ColorTempAuto": "canon_color_temp_auto_v5",
-    "CanonCD5_ColorTempDaylight": "canon_color_temp_daylight_v5",
-    "CanonCD5_ColorTempShade": "canon_color_temp_shade_v5",
-    "CanonCD5_ColorTempCloudy": "canon_color_temp_cloudy_v5",
-    "CanonCD5_ColorTempTungsten": "canon_color_temp_tungsten_v5",
-    "CanonCD5_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v5",
-    "CanonCD5_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v5",
-    "CanonCD5_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v5",
-    "CanonCD5_ColorTempFlash": "canon_color_temp_flash_v5",
-    "CanonCD5_ColorTempCustom1": "canon_color_temp_custom_1_v5",
-    "CanonCD5_ColorTempCustom2": "canon_color_temp_custom_2_v5",
-    "CanonCD5_ColorTempCustom3": "canon_color_temp_custom_3_v5",
-    "CanonCD5_ColorTempPC1": "canon_color_temp_pc_1_v5",
-    "CanonCD5_ColorTempPC2": "canon_color_temp_pc_2_v5",
-    "CanonCD5_ColorTempPC3": "canon_color_temp_pc_3_v5",
-    "CanonCD5_AverageBlackLevel": "canon_average_black_level_v5",
-    "CanonCD5_NormalWhiteLevel": "canon_normal_white_level_v5",
-    "CanonCD5_SpecularWhiteLevel": "canon_specular_white_level_v5",
-    "CanonCD5_WhiteLevel": "canon_white_level_v5",
-    "CanonCD5_PerChannelBlackLevel": "canon_per_channel_black_level_v5",
-    "CanonCD5_ColorMatrix1": "canon_color_matrix_1_v5",
-    "CanonCD5_ColorMatrix2": "canon_color_matrix_2_v5",
-    "CanonCD5_CalibrationIlluminant1": "canon_calibration_illuminant_1_v5",
-    "CanonCD5_CalibrationIlluminant2": "canon_calibration_illuminant_2_v5",
-    "CanonCD5_CRC": "canon_crc_v5",
-}
-
-CANON_COLOR_DATA_V6 = {
-    "CanonCD6_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v6",
-    "CanonCD6_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v6",
-    "CanonCD6_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v6",
-    "CanonCD6_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v6",
-    "CanonCD6_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v6",
-    "CanonCD6_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v6",
-    "CanonCD6_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v6",
-    "CanonCD6_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v6",
-    "CanonCD6_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v6",
-    "CanonCD6_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v6",
-    "CanonCD6_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v6",
-    "CanonCD6_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v6",
-    "CanonCD6_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v6",
-    "CanonCD6_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v6",
-    "CanonCD6_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v6",
-    "CanonCD6_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v6",
-    "CanonCD6_ColorTempAuto": "canon_color_temp_auto_v6",
-    "CanonCD6_ColorTempDaylight": "canon_color_temp_daylight_v6",
-    "CanonCD6_ColorTempShade": "canon_color_temp_shade_v6",
-    "CanonCD6_ColorTempCloudy": "canon_color_temp_cloudy_v6",
-    "CanonCD6_ColorTempTungsten": "canon_color_temp_tungsten_v6",
-    "CanonCD6_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v6",
-    "CanonCD6_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v6",
-    "CanonCD6_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v6",
-    "CanonCD6_ColorTempFlash": "canon_color_temp_flash_v6",
-    "CanonCD6_ColorTempCustom1": "canon_color_temp_custom_1_v6",
-    "CanonCD6_ColorTempCustom2": "canon_color_temp_custom_2_v6",
-    "CanonCD6_ColorTempCustom3": "canon_color_temp_custom_3_v6",
-    "CanonCD6_ColorTempPC1": "canon_color_temp_pc_1_v6",
-    "CanonCD6_ColorTempPC2": "canon_color_temp_pc_2_v6",
-    "CanonCD6_ColorTempPC3": "canon_color_temp_pc_3_v6",
-    "CanonCD6_ColorTempUnderwater": "canon_color_temp_underwater_v6",
-    "CanonCD6_AverageBlackLevel": "canon_average_black_level_v6",
-    "CanonCD6_NormalWhiteLevel": "canon_normal_white_level_v6",
-    "CanonCD6_SpecularWhiteLevel": "canon_specular_white_level_v6",
-    "CanonCD6_WhiteLevel": "canon_white_level_v6",
-    "CanonCD6_PerChannelBlackLevel": "canon_per_channel_black_level_v6",
-    "CanonCD6_ColorMatrix1": "canon_color_matrix_1_v6",
-    "CanonCD6_ColorMatrix2": "canon_color_matrix_2_v6",
-    "CanonCD6_CalibrationIlluminant1": "canon_calibration_illuminant_1_v6",
-    "CanonCD6_CalibrationIlluminant2": "canon_calibration_illuminant_2_v6",
-    "CanonCD6_CRC": "canon_crc_v6",
-}
-
-CANON_COLOR_DATA_V7 = {
-    "CanonCD7_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v7",
-    "CanonCD7_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v7",
-    "CanonCD7_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v7",
-    "CanonCD7_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v7",
-    "CanonCD7_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v7",
-    "CanonCD7_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v7",
-    "CanonCD7_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v7",
-    "CanonCD7_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v7",
-    "CanonCD7_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v7",
-    "CanonCD7_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v7",
-    "CanonCD7_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v7",
-    "CanonCD7_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v7",
-    "CanonCD7_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v7",
-    "CanonCD7_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v7",
-    "CanonCD7_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v7",
-    "CanonCD7_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v7",
-    "CanonCD7_ColorTempAuto": "canon_color_temp_auto_v7",
-    "CanonCD7_ColorTempDaylight": "canon_color_temp_daylight_v7",
-    "CanonCD7_ColorTempShade": "canon_color_temp_shade_v7",
-    "CanonCD7_ColorTempCloudy": "canon_color_temp_cloudy_v7",
-    "CanonCD7_ColorTempTungsten": "canon_color_temp_tungsten_v7",
-    "CanonCD7_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v7",
-    "CanonCD7_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v7",
-    "CanonCD7_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v7",
-    "CanonCD7_ColorTempFlash": "canon_color_temp_flash_v7",
-    "CanonCD7_ColorTempCustom1": "canon_color_temp_custom_1_v7",
-    "CanonCD7_ColorTempCustom2": "canon_color_temp_custom_2_v7",
-    "CanonCD7_ColorTempCustom3": "canon_color_temp_custom_3_v7",
-    "CanonCD7_ColorTempPC1": "canon_color_temp_pc_1_v7",
-    "CanonCD7_ColorTempPC2": "canon_color_temp_pc_2_v7",
-    "CanonCD7_ColorTempPC3": "canon_color_temp_pc_3_v7",
-    "CanonCD7_ColorTempUnderwater": "canon_color_temp_underwater_v7",
-    "CanonCD7_AverageBlackLevel": "canon_average_black_level_v7",
-    "CanonCD7_NormalWhiteLevel": "canon_normal_white_level_v7",
-    "CanonCD7_SpecularWhiteLevel": "canon_specular_white_level_v7",
-    "CanonCD7_WhiteLevel": "canon_white_level_v7",
-    "CanonCD7_PerChannelBlackLevel": "canon_per_channel_black_level_v7",
-    "CanonCD7_ColorMatrix1": "canon_color_matrix_1_v7",
-    "CanonCD7_ColorMatrix2": "canon_color_matrix_2_v7",
-    "CanonCD7_CalibrationIlluminant1": "canon_calibration_illuminant_1_v7",
-    "CanonCD7_CalibrationIlluminant2": "canon_calibration_illuminant_2_v7",
-    "CanonCD7_CRC": "canon_crc_v7",
-}
-
-CANON_COLOR_DATA_V8 = {
-    "CanonCD8_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v8",
-    "CanonCD8_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v8",
-    "CanonCD8_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v8",
-    "CanonCD8_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v8",
-    "CanonCD8_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v8",
-    "CanonCD8_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v8",
-    "CanonCD8_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v8",
-    "CanonCD8_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v8",
-    "CanonCD8_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v8",
-    "CanonCD8_WBRGGBLevelsKelvin": "canon_wb_rggb_levels_kelvin_v8",
-    "CanonCD8_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v8",
-    "CanonCD8_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v8",
-    "CanonCD8_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v8",
-    "CanonCD8_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v8",
-    "CanonCD8_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v8",
-    "CanonCD8_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v8",
-    "CanonCD8_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v8",
-    "CanonCD8_ColorTempAuto": "canon_color_temp_auto_v8",
-    "CanonCD8_ColorTempDaylight": "canon_color_temp_daylight_v8",
-    "CanonCD8_ColorTempShade": "canon_color_temp_shade_v8",
-    "CanonCD8_ColorTempCloudy": "canon_color_temp_cloudy_v8",
-    "CanonCD8_ColorTempTungsten": "canon_color_temp_tungsten_v8",
-    "CanonCD8_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v8",
-    "CanonCD8_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v8",
-    "CanonCD8_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v8",
-    "CanonCD8_ColorTempFlash": "canon_color_temp_flash_v8",
-    "CanonCD8_ColorTempKelvin": "canon_color_temp_kelvin_v8",
-    "CanonCD8_ColorTempCustom1": "canon_color_temp_custom_1_v8",
-    "CanonCD8_ColorTempCustom2": "canon_color_temp_custom_2_v8",
-    "CanonCD8_ColorTempCustom3": "canon_color_temp_custom_3_v8",
-    "CanonCD8_ColorTempPC1": "canon_color_temp_pc_1_v8",
-    "CanonCD8_ColorTempPC2": "canon_color_temp_pc_2_v8",
-    "CanonCD8_ColorTempPC3": "canon_color_temp_pc_3_v8",
-    "CanonCD8_ColorTempUnderwater": "canon_color_temp_underwater_v8",
-    "CanonCD8_AverageBlackLevel": "canon_average_black_level_v8",
-    "CanonCD8_NormalWhiteLevel": "canon_normal_white_level_v8",
-    "CanonCD8_SpecularWhiteLevel": "canon_specular_white_level_v8",
-    "CanonCD8_WhiteLevel": "canon_white_level_v8",
-    "CanonCD8_PerChannelBlackLevel": "canon_per_channel_black_level_v8",
-    "CanonCD8_ColorMatrix1": "canon_color_matrix_1_v8",
-    "CanonCD8_ColorMatrix2": "canon_color_matrix_2_v8",
-    "CanonCD8_CalibrationIlluminant1": "canon_calibration_illuminant_1_v8",
-    "CanonCD8_CalibrationIlluminant2": "canon_calibration_illuminant_2_v8",
-    "CanonCD8_CRC": "canon_crc_v8",
-}
-
-CANON_COLOR_DATA_V9 = {
-    "CanonCD9_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v9",
-    "CanonCD9_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v9",
-    "CanonCD9_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v9",
-    "CanonCD9_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v9",
-    "CanonCD9_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v9",
-    "CanonCD9_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v9",
-    "CanonCD9_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v9",
-    "CanonCD9_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v9",
-    "CanonCD9_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v9",
-    "CanonCD9_WBRGGBLevelsKelvin": "canon_wb_rggb_levels_kelvin_v9",
-    "CanonCD9_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v9",
-    "CanonCD9_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v9",
-    "CanonCD9_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v9",
-    "CanonCD9_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v9",
-    "CanonCD9_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v9",
-    "CanonCD9_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v9",
-    "CanonCD9_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v9",
-    "CanonCD9_WBRGGBLevelsHemiAuto": "canon_wb_rggb_levels_hemi_auto_v9",
-    "CanonCD9_ColorTempAuto": "canon_color_temp_auto_v9",
-    "CanonCD9_ColorTempDaylight": "canon_color_temp_daylight_v9",
-    "CanonCD9_ColorTempShade": "canon_color_temp_shade_v9",
-    "CanonCD9_ColorTempCloudy": "canon_color_temp_cloudy_v9",
-    "CanonCD9_ColorTempTungsten": "canon_color_temp_tungsten_v9",
-    "CanonCD9_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v9",
-    "CanonCD9_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v9",
-    "CanonCD9_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v9",
-    "CanonCD9_ColorTempFlash": "canon_color_temp_flash_v9",
-    "CanonCD9_ColorTempKelvin": "canon_color_temp_kelvin_v9",
-    "CanonCD9_ColorTempCustom1": "canon_color_temp_custom_1_v9",
-    "CanonCD9_ColorTempCustom2": "canon_color_temp_custom_2_v9",
-    "CanonCD9_ColorTempCustom3": "canon_color_temp_custom_3_v9",
-    "CanonCD9_ColorTempPC1": "canon_color_temp_pc_1_v9",
-    "CanonCD9_ColorTempPC2": "canon_color_temp_pc_2_v9",
-    "CanonCD9_ColorTempPC3": "canon_color_temp_pc_3_v9",
-    "CanonCD9_ColorTempUnderwater": "canon_color_temp_underwater_v9",
-    "CanonCD9_ColorTempHemiAuto": "canon_color_temp_hemi_auto_v9",
-    "CanonCD9_AverageBlackLevel": "canon_average_black_level_v9",
-    "CanonCD9_NormalWhiteLevel": "canon_normal_white_level_v9",
-    "CanonCD9_SpecularWhiteLevel": "canon_specular_white_level_v9",
-    "CanonCD9_WhiteLevel": "canon_white_level_v9",
-    "CanonCD9_PerChannelBlackLevel": "canon_per_channel_black_level_v9",
-    "CanonCD9_ColorMatrix1": "canon_color_matrix_1_v9",
-    "CanonCD9_ColorMatrix2": "canon_color_matrix_2_v9",
-    "CanonCD9_CalibrationIlluminant1": "canon_calibration_illuminant_1_v9",
-    "CanonCD9_CalibrationIlluminant2": "canon_calibration_illuminant_2_v9",
-    "CanonCD9_CRC": "canon_crc_v9",
-}
-
-CANON_COLOR_DATA_V10 = {
-    "CanonCD10_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v10",
-    "CanonCD10_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v10",
-    "CanonCD10_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v10",
-    "CanonCD10_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v10",
-    "CanonCD10_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v10",
-    "CanonCD10_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v10",
-    "CanonCD10_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v10",
-    "CanonCD10_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v10",
-    "CanonCD10_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v10",
-    "CanonCD10_WBRGGBLevelsKelvin": "canon_wb_rggb_levels_kelvin_v10",
-    "CanonCD10_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v10",
-    "CanonCD10_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v10",
-    "CanonCD10_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v10",
-    "CanonCD10_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v10",
-    "CanonCD10_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v10",
-    "CanonCD10_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v10",
-    "CanonCD10_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v10",
-    "CanonCD10_WBRGGBLevelsHemiAuto": "canon_wb_rggb_levels_hemi_auto_v10",
-    "CanonCD10_ColorTempAuto": "canon_color_temp_auto_v10",
-    "CanonCD10_ColorTempDaylight": "canon_color_temp_daylight_v10",
-    "CanonCD10_ColorTempShade": "canon_color_temp_shade_v10",
-    "CanonCD10_ColorTempCloudy": "canon_color_temp_cloudy_v10",
-    "CanonCD10_ColorTempTungsten": "canon_color_temp_tungsten_v10",
-    "CanonCD10_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v10",
-    "CanonCD10_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v10",
-    "CanonCD10_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v10",
-    "CanonCD10_ColorTempFlash": "canon_color_temp_flash_v10",
-    "CanonCD10_ColorTempKelvin": "canon_color_temp_kelvin_v10",
-    "CanonCD10_ColorTempCustom1": "canon_color_temp_custom_1_v10",
-    "CanonCD10_ColorTempCustom2": "canon_color_temp_custom_2_v10",
-    "CanonCD10_ColorTempCustom3": "canon_color_temp_custom_3_v10",
-    "CanonCD10_ColorTempPC1": "canon_color_temp_pc_1_v10",
-    "CanonCD10_ColorTempPC2": "canon_color_temp_pc_2_v10",
-    "CanonCD10_ColorTempPC3": "canon_color_temp_pc_3_v10",
-    "CanonCD10_ColorTempUnderwater": "canon_color_temp_underwater_v10",
-    "CanonCD10_ColorTempHemiAuto": "canon_color_temp_hemi_auto_v10",
-    "CanonCD10_AverageBlackLevel": "canon_average_black_level_v10",
-    "CanonCD10_NormalWhiteLevel": "canon_normal_white_level_v10",
-    "CanonCD10_SpecularWhiteLevel": "canon_specular_white_level_v10",
-    "CanonCD10_WhiteLevel": "canon_white_level_v10",
-    "CanonCD10_PerChannelBlackLevel": "canon_per_channel_black_level_v10",
-    "CanonCD10_ColorMatrix1": "canon_color_matrix_1_v10",
-    "CanonCD10_ColorMatrix2": "canon_color_matrix_2_v10",
-    "CanonCD10_CalibrationIlluminant1": "canon_calibration_illuminant_1_v10",
-    "CanonCD10_CalibrationIlluminant2": "canon_calibration_illuminant_2_v10",
-    "CanonCD10_CRC": "canon_crc_v10",
-}
-
-CANON_COLOR_DATA_V11 = {
-    "CanonCD11_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v11",
-    "CanonCD11_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v11",
-    "CanonCD11_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v11",
-    "CanonCD11_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v11",
-    "CanonCD11_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v11",
-    "CanonCD11_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v11",
-    "CanonCD11_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v11",
-    "CanonCD11_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v11",
-    "CanonCD11_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v11",
-    "CanonCD11_WBRGGBLevelsKelvin": "canon_wb_rggb_levels_kelvin_v11",
-    "CanonCD11_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v11",
-    "CanonCD11_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v11",
-    "CanonCD11_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v11",
-    "CanonCD11_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v11",
-    "CanonCD11_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v11",
-    "CanonCD11_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v11",
-    "CanonCD11_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v11",
-    "CanonCD11_WBRGGBLevelsHemiAuto": "canon_wb_rggb_levels_hemi_auto_v11",
-    "CanonCD11_ColorTempAuto": "canon_color_temp_auto_v11",
-    "CanonCD11_ColorTempDaylight": "canon_color_temp_daylight_v11",
-    "CanonCD11_ColorTempShade": "canon_color_temp_shade_v11",
-    "CanonCD11_ColorTempCloudy": "canon_color_temp_cloudy_v11",
-    "CanonCD11_ColorTempTungsten": "canon_color_temp_tungsten_v11",
-    "CanonCD11_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v11",
-    "CanonCD11_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v11",
-    "CanonCD11_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v11",
-    "CanonCD11_ColorTempFlash": "canon_color_temp_flash_v11",
-    "CanonCD11_ColorTempKelvin": "canon_color_temp_kelvin_v11",
-    "CanonCD11_ColorTempCustom1": "canon_color_temp_custom_1_v11",
-    "CanonCD11_ColorTempCustom2": "canon_color_temp_custom_2_v11",
-    "CanonCD11_ColorTempCustom3": "canon_color_temp_custom_3_v11",
-    "CanonCD11_ColorTempPC1": "canon_color_temp_pc_1_v11",
-    "CanonCD11_ColorTempPC2": "canon_color_temp_pc_2_v11",
-    "CanonCD11_ColorTempPC3": "canon_color_temp_pc_3_v11",
-    "CanonCD11_ColorTempUnderwater": "canon_color_temp_underwater_v11",
-    "CanonCD11_ColorTempHemiAuto": "canon_color_temp_hemi_auto_v11",
-    "CanonCD11_AverageBlackLevel": "canon_average_black_level_v11",
-    "CanonCD11_NormalWhiteLevel": "canon_normal_white_level_v11",
-    "CanonCD11_SpecularWhiteLevel": "canon_specular_white_level_v11",
-    "CanonCD11_WhiteLevel": "canon_white_level_v11",
-    "CanonCD11_PerChannelBlackLevel": "canon_per_channel_black_level_v11",
-    "CanonCD11_ColorMatrix1": "canon_color_matrix_1_v11",
-    "CanonCD11_ColorMatrix2": "canon_color_matrix_2_v11",
-    "CanonCD11_CalibrationIlluminant1": "canon_calibration_illuminant_1_v11",
-    "CanonCD11_CalibrationIlluminant2": "canon_calibration_illuminant_2_v11",
-    "CanonCD11_CRC": "canon_crc_v11",
-}
-
-CANON_COLOR_DATA_V12 = {
-    "CanonCD12_WBRGGBLevelsAuto": "canon_wb_rggb_levels_auto_v12",
-    "CanonCD12_WBRGGBLevelsDaylight": "canon_wb_rggb_levels_daylight_v12",
-    "CanonCD12_WBRGGBLevelsShade": "canon_wb_rggb_levels_shade_v12",
-    "CanonCD12_WBRGGBLevelsCloudy": "canon_wb_rggb_levels_cloudy_v12",
-    "CanonCD12_WBRGGBLevelsTungsten": "canon_wb_rggb_levels_tungsten_v12",
-    "CanonCD12_WBRGGBLevelsFluorescentH": "canon_wb_rggb_levels_fluorescent_h_v12",
-    "CanonCD12_WBRGGBLevelsFluorescentW": "canon_wb_rggb_levels_fluorescent_w_v12",
-    "CanonCD12_WBRGGBLevelsFluorescentD": "canon_wb_rggb_levels_fluorescent_d_v12",
-    "CanonCD12_WBRGGBLevelsFlash": "canon_wb_rggb_levels_flash_v12",
-    "CanonCD12_WBRGGBLevelsKelvin": "canon_wb_rggb_levels_kelvin_v12",
-    "CanonCD12_WBRGGBLevelsCustom1": "canon_wb_rggb_levels_custom_1_v12",
-    "CanonCD12_WBRGGBLevelsCustom2": "canon_wb_rggb_levels_custom_2_v12",
-    "CanonCD12_WBRGGBLevelsCustom3": "canon_wb_rggb_levels_custom_3_v12",
-    "CanonCD12_WBRGGBLevelsPC1": "canon_wb_rggb_levels_pc_1_v12",
-    "CanonCD12_WBRGGBLevelsPC2": "canon_wb_rggb_levels_pc_2_v12",
-    "CanonCD12_WBRGGBLevelsPC3": "canon_wb_rggb_levels_pc_3_v12",
-    "CanonCD12_WBRGGBLevelsUnderwater": "canon_wb_rggb_levels_underwater_v12",
-    "CanonCD12_WBRGGBLevelsHemiAuto": "canon_wb_rggb_levels_hemi_auto_v12",
-    "CanonCD12_ColorTempAuto": "canon_color_temp_auto_v12",
-    "CanonCD12_ColorTempDaylight": "canon_color_temp_daylight_v12",
-    "CanonCD12_ColorTempShade": "canon_color_temp_shade_v12",
-    "CanonCD12_ColorTempCloudy": "canon_color_temp_cloudy_v12",
-    "CanonCD12_ColorTempTungsten": "canon_color_temp_tungsten_v12",
-    "CanonCD12_ColorTempFluorescentH": "canon_color_temp_fluorescent_h_v12",
-    "CanonCD12_ColorTempFluorescentW": "canon_color_temp_fluorescent_w_v12",
-    "CanonCD12_ColorTempFluorescentD": "canon_color_temp_fluorescent_d_v12",
-    "CanonCD12_ColorTempFlash": "canon_color_temp_flash_v12",
-    "CanonCD12_ColorTempKelvin": "canon_color_temp_kelvin_v12",
-    "CanonCD12_ColorTempCustom1": "canon_color_temp_custom_1_v12",
-    "CanonCD12_ColorTempCustom2": "canon_color_temp_custom_2_v12",
-    "CanonCD12_ColorTempCustom3": "canon_color_temp_custom_3_v12",
-    "CanonCD12_ColorTempPC1": "canon_color_temp_pc_1_v12",
-    "CanonCD12_ColorTempPC2": "canon_color_temp_pc_2_v12",
-    "CanonCD12_ColorTempPC3": "canon_color_temp_pc_3_v12",
-    "CanonCD12_ColorTempUnderwater": "canon_color_temp_underwater_v12",
-    "CanonCD12_ColorTempHemiAuto": "canon_color_temp_hemi_auto_v12",
-    "CanonCD12_AverageBlackLevel": "canon_average_black_level_v12",
-    "CanonCD12_NormalWhiteLevel": "canon_normal_white_level_v12",
-    "CanonCD12_SpecularWhiteLevel": "canon_specular_white_level_v12",
-    "CanonCD12_WhiteLevel": "canon_white_level_v12",
-    "CanonCD12_PerChannelBlackLevel": "canon_per_channel_black_level_v12",
-    "CanonCD12_ColorMatrix1": "canon_color_matrix_1_v12",
-    "CanonCD12_ColorMatrix2": "canon_color_matrix_2_v12",
-    "CanonCD12_CalibrationIlluminant1": "canon_calibration_illuminant_1_v12",
-    "CanonCD12_CalibrationIlluminant2": "canon_calibration_illuminant_2_v12",
-    "CanonCD12_CRC": "canon_crc_v12",
-}
-
-CANON_AF_INFO = {
-    "CanonAF_AFAreaMode": "canon_af_area_mode",
-    "CanonAF_AFPoint": "canon_af_point",
-    "CanonAF_AFPointsInFocus": "canon_af_points_in_focus",
-    "CanonAF_AFPointSelected": "canon_af_point_selected",
-    "CanonAF_AFPointIllumination": "canon_af_point_illumination",
-    "CanonAF_AFFineTune": "canon_af_fine_tune",
-    "CanonAF_AFFineTuneAdj": "canon_af_fine_tune_adj",
-    "CanonAF_AFCoverage": "canon_af_coverage",
-    "CanonAF_AFMicroAdj": "canon_af_micro_adj",
-    "CanonAF_AFMicroAdjValue": "canon_af_micro_adj_value",
-    "CanonAF_AFPointsInFocusCount": "canon_af_points_in_focus_count",
-    "CanonAF_AFPointActivation": "canon_af_point_activation",
-    "CanonAF_CrossTypeAFPoints": "canon_cross_type_af_points",
-    "CanonAF_DualCrossTypeAFPoints": "canon_dual_cross_af_points",
-    "CanonAF_HorizontalAFPoints": "canon_horizontal_af_points",
-    "CanonAF_VerticalAFPoints": "canon_vertical_af_points",
-    "CanonAF_AFSearch": "canon_af_search",
-    "CanonAF_AFAreaPositions": "canon_af_area_positions",
-    "CanonAF_PrimaryAFPoint": "canon_primary_af_point",
-    "CanonAF_AFPointMode": "canon_af_point_mode",
-    "CanonAF_AFPointWrap": "canon_af_point_wrap",
-    "CanonAF_AFAssistBeam": "canon_af_assist_beam",
-    "CanonAF_FocusTrackingLock": "canon_focus_tracking_lock",
-    "CanonAF_ServoAF": "canon_servo_af",
-    "CanonAF_ServoAFSpeed": "canon_servo_af_speed",
-    "CanonAF_ServoAFTracking": "canon_servo_af_tracking",
-    "CanonAF_LensDriveWhenAFImpossible": "canon_lens_drive_af_impossible",
-    "CanonAF_ContinuousAF": "canon_continuous_af",
-    "CanonAF_AFPointDisplayDuringFocus": "canon_af_point_display",
-    "CanonAF_ViewfinderDisplay": "canon_viewfinder_display",
-    "CanonAF_MirrorLockup": "canon_mirror_lockup_af",
-    "CanonAF_PreviewAF": "canon_preview_af",
-    "CanonAF_FocusModeSwitch": "canon_focus_mode_switch",
-    "CanonAF_ManualFocusRing": "canon_manual_focus_ring",
-    "CanonAF_FocusDistanceIndicator": "canon_focus_distance_indicator",
-    "CanonAF_AFStatus": "canon_af_status",
-    "CanonAF_AFSensor": "canon_af_sensor",
-    "CanonAF_AFConfig": "canon_af_config",
-    "CanonAF_AI ServoTrackSensitivity": "canon_ai_servo_track_sensitivity",
-    "CanonAF_AI ServoFirstImagePriority": "canon_ai_servo_first_img_priority",
-    "CanonAF_AI ServoSecondImagePriority": "canon_ai_servo_second_img_priority",
-}
-
-CANON_AF_INFO_2 = {
-    "CanonAF2_AFAreaMode": "canon_af_area_mode_2",
-    "CanonAF2_AFPoint": "canon_af_point_2",
-    "CanonAF2_AFPointsInFocus": "canon_af_points_in_focus_2",
-    "CanonAF2_AFPointSelected": "canon_af_point_selected_2",
-    "CanonAF2_AFPointIllumination": "canon_af_point_illumination_2",
-    "CanonAF2_AFFineTune": "canon_af_fine_tune_2",
-    "CanonAF2_AFFineTuneAdj": "canon_af_fine_tune_adj_2",
-    "CanonAF2_AFCoverage": "canon_af_coverage_2",
-    "CanonAF2_AFMicroAdj": "canon_af_micro_adj_2",
-    "CanonAF2_AFMicroAdjValue": "canon_af_micro_adj_value_2",
-    "CanonAF2_AFPointsInFocusCount": "canon_af_points_in_focus_count_2",
-    "CanonAF2_AFPointActivation": "canon_af_point_activation_2",
-    "CanonAF2_CrossTypeAFPoints": "canon_cross_type_af_points_2",
-    "CanonAF2_DualCrossTypeAFPoints": "canon_dual_cross_af_points_2",
-    "CanonAF2_HorizontalAFPoints": "canon_horizontal_af_points_2",
-    "CanonAF2_VerticalAFPoints": "canon_vertical_af_points_2",
-    "CanonAF2_AFSearch": "canon_af_search_2",
-    "CanonAF2_AFAreaPositions": "canon_af_area_positions_2",
-    "CanonAF2_PrimaryAFPoint": "canon_primary_af_point_2",
-    "CanonAF2_AFPointMode": "canon_af_point_mode_2",
-    "CanonAF2_AFPointWrap": "canon_af_point_wrap_2",
-    "CanonAF2_AFAssistBeam": "canon_af_assist_beam_2",
-    "CanonAF2_FocusTrackingLock": "canon_focus_tracking_lock_2",
-    "CanonAF2_ServoAF": "canon_servo_af_2",
-    "CanonAF2_ServoAFSpeed": "canon_servo_af_speed_2",
-    "CanonAF2_ServoAFTracking": "canon_servo_af_tracking_2",
-    "CanonAF2_LensDriveWhenAFImpossible": "canon_lens_drive_af_impossible_2",
-    "CanonAF2_ContinuousAF": "canon_continuous_af_2",
-    "CanonAF2_AFPointDisplayDuringFocus": "canon_af_point_display_2",
-    "CanonAF2_ViewfinderDisplay": "canon_viewfinder_display_2",
-    "CanonAF2_MirrorLockup": "canon_mirror_lockup_af_2",
-    "CanonAF2_PreviewAF": "canon_preview_af_2",
-    "CanonAF2_FocusModeSwitch": "canon_focus_mode_switch_2",
-    "CanonAF2_ManualFocusRing": "canon_manual_focus_ring_2",
-    "CanonAF2_FocusDistanceIndicator": "canon_focus_distance_indicator_2",
-    "CanonAF2_AFStatus": "canon_af_status_2",
-    "CanonAF2_AFSensor": "canon_af_sensor_2",
-    "CanonAF2_AFConfig": "canon_af_config_2",
-    "CanonAF2_AI ServoTrackSensitivity": "canon_ai_servo_track_sensitivity_2",
-    "CanonAF2_AI ServoFirstImagePriority": "canon_ai_servo_first_img_priority_2",
-    "CanonAF2_AI ServoSecondImagePriority": "canon_ai_servo_second_img_priority_2",
-}
-
-CANON_CAMERA_INFO_1D = {
-    "CanonCI1D_ImageType": "canon_1d_image_type",
-    "CanonCI1D_CameraOwnerName": "canon_1d_owner_name",
-    "CanonCI1D_CameraSerialNumber": "canon_1d_serial",
-    "CanonCI1D_WindowMatrix1": "canon_1d_window_matrix_1",
-    "CanonCI1D_WindowMatrix2": "canon_1d_window_matrix_2",
-    "CanonCI1D_WindowMatrix3": "canon_1d_window_matrix_3",
-    "CanonCI1D_WindowMatrix4": "canon_1d_window_matrix_4",
-    "CanonCI1D_WindowMatrix5": "canon_1d_window_matrix_5",
-    "CanonCI1D_WindowMatrix6": "canon_1d_window_matrix_6",
-    "CanonCI1D_WindowMatrix7": "canon_1d_window_matrix_7",
-    "CanonCI1D_WindowMatrix8": "canon_1d_window_matrix_8",
-    "CanonCI1D_WindowMatrix9": "canon_1d_window_matrix_9",
-    "CanonCI1D_WindowMatrix10": "canon_1d_window_matrix_10",
-    "CanonCI1D_WindowMatrix11": "canon_1d_window_matrix_11",
-    "CanonCI1D_WindowMatrix12": "canon_1d_window_matrix_12",
-    "CanonCI1D_WindowMatrix13": "canon_1d_window_matrix_13",
-    "CanonCI1D_WindowMatrix14": "canon_1d_window_matrix_14",
-    "CanonCI1D_WindowMatrix15": "canon_1d_window_matrix_15",
-    "CanonCI1D_WindowMatrix16": "canon_1d_window_matrix_16",
-    "CanonCI1D_FAFWindow1": "canon_1d_faf_window_1",
-    "CanonCI1D_FAFWindow2": "canon_1d_faf_window_2",
-    "CanonCI1D_FAFWindow3": "canon_1d_faf_window_3",
-    "CanonCI1D_FAFWindow4": "canon_1d_faf_window_4",
-    "CanonCI1D_FAFWindow5": "canon_1d_faf_window_5",
-    "CanonCI1D_FAFWindow6": "canon_1d_faf_window_6",
-    "CanonCI1D_FAFWindow7": "canon_1d_faf_window_7",
-    "CanonCI1D_FAFWindow8": "canon_1d_faf_window_8",
-    "CanonCI1D_AFPointArea1": "canon_1d_af_point_area_1",
-    "CanonCI1D_AFPointArea2": "canon_1d_af_point_area_2",
-    "CanonCI1D_AFPointArea3": "canon_1d_af_point_area_3",
-    "CanonCI1D_AFPointArea4": "canon_1d_af_point_area_4",
-    "CanonCI1D_AFPointArea5": "canon_1d_af_point_area_5",
-    "CanonCI1D_AFPointArea6": "canon_1d_af_point_area_6",
-    "CanonCI1D_AFPointArea7": "canon_1d_af_point_area_7",
-    "CanonCI1D_AFPointArea8": "canon_1d_af_point_area_8",
-    "CanonCI1D_AFPointLocation1": "canon_1d_af_point_location_1",
-    "CanonCI1D_AFPointLocation2": "canon_1d_af_point_location_2",
-    "CanonCI1D_AFPointLocation3": "canon_1d_af_point_location_3",
-    "CanonCI1D_AFPointLocation4": "canon_1d_af_point_location_4",
-    "CanonCI1D_AFPointLocation5": "canon_1d_af_point_location_5",
-    "CanonCI1D_AFPointLocation6": "canon_1d_af_point_location_6",
-    "CanonCI1D_AFPointLocation7": "canon_1d_af_point_location_7",
-    "CanonCI1D_AFPointLocation8": "canon_1d_af_point_location_8",
-    "CanonCI1D_AFPointsSelected1": "canon_1d_af_points_selected_1",
-    "CanonCI1D_AFPointsSelected2": "canon_1d_af_points_selected_2",
-    "CanonCI1D_AFPointsSelected3": "canon_1d_af_points_selected_3",
-    "CanonCI1D_AFPointsSelected4": "canon_1d_af_points_selected_4",
-    "CanonCI1D_AFPointsSelected5": "canon_1d_af_points_selected_5",
-    "CanonCI1D_AFPointsSelected6": "canon_1d_af_points_selected_6",
-    "CanonCI1D_AFPointsSelected7": "canon_1d_af_points_selected_7",
-    "CanonCI1D_AFPointsSelected8": "canon_1d_af_points_selected_8",
-    "CanonCI1D_AFStatus1": "canon_1d_af_status_1",
-    "CanonCI1D_AFStatus2": "canon_1d_af_status_2",
-    "CanonCI1D_AFStatus3": "canon_1d_af_status_3",
-    "CanonCI1D_AFStatus4": "canon_1d_af_status_4",
-    "CanonCI1D_AFStatus5": "canon_1d_af_status_5",
-    "CanonCI1D_AFStatus6": "canon_1d_af_status_6",
-    "CanonCI1D_AFStatus7": "canon_1d_af_status_7",
-    "CanonCI1D_AFStatus8": "canon_1d_af_status_8",
-    "CanonCI1D_AFStatus9": "canon_1d_af_status_9",
-    "CanonCI1D_AFStatus10": "canon_1d_af_status_10",
-    "CanonCI1D_AFStatus11": "canon_1d_af_status_11",
-    "CanonCI1D_AFStatus12": "canon_1d_af_status_12",
-    "CanonCI1D_AFStatus13": "canon_1d_af_status_13",
-    "CanonCI1D_AFStatus14": "canon_1d_af_status_14",
-    "CanonCI1D_AFStatus15": "canon_1d_af_status_15",
-    "CanonCI1D_AFStatus16": "canon_1d_af_status_16",
-    "CanonCI1D_AFStatus17": "canon_1d_af_status_17",
-    "CanonCI1D_AFStatus18": "canon_1d_af_status_18",
-    "CanonCI1D_AFStatus19": "canon_1d_af_status_19",
-    "CanonCI1D_AFStatus20": "canon_1d_af_status_20",
-    "CanonCI1D_AFStatus21": "canon_1d_af_status_21",
-    "CanonCI1D_AFStatus22": "canon_1d_af_status_22",
-    "CanonCI1D_AFStatus23": "canon_1d_af_status_23",
-    "CanonCI1D_AFStatus24": "canon_1d_af_status_24",
-    "CanonCI1D_AFStatus25": "canon_1d_af_status_25",
-    "CanonCI1D_AFStatus26": "canon_1d_af_status_26",
-    "CanonCI1D_AFStatus27": "canon_1d_af_status_27",
-    "CanonCI1D_AFStatus28": "canon_1d_af_status_28",
-    "CanonCI1D_AFStatus29": "canon_1d_af_status_29",
-    "CanonCI1D_AFStatus30": "canon_1d_af_status_30",
-    "CanonCI1D_AFStatus31": "canon_1d_af_status_31",
-    "CanonCI1D_AFStatus32": "canon_1d_af_status_32",
-    "CanonCI1D_ContrastData1": "canon_1d_contrast_data_1",
-    "CanonCI1D_ContrastData2": "canon_1d_contrast_data_2",
-    "CanonCI1D_ContrastData3": "canon_1d_contrast_data_3",
-    "CanonCI1D_ContrastData4": "canon_1d_contrast_data_4",
-    "CanonCI1D_ContrastData5": "canon_1d_contrast_data_5",
-    "CanonCI1D_ContrastData6": "canon_1d_contrast_data_6",
-    "CanonCI1D_ContrastData7": "canon_1d_contrast_data_7",
-    "CanonCI1D_ContrastData8": "canon_1d_contrast_data_8",
-    "CanonCI1D_ContrastData9": "canon_1d_contrast_data_9",
-    "CanonCI1D_ContrastData10": "canon_1d_contrast_data_10",
-    "CanonCI1D_ContrastData11": "canon_1d_contrast_data_11",
-    "CanonCI1D_ContrastData12": "canon_1d_contrast_data_12",
-    "CanonCI1D_ContrastData13": "canon_1d_contrast_data_13",
-    "CanonCI1D_ContrastData14": "canon_1d_contrast_data_14",
-    "CanonCI1D_ContrastData15": "canon_1d_contrast_data_15",
-    "CanonCI1D_ContrastData16": "canon_1d_contrast_data_16",
-    "CanonCI1D_IntelligentContrast": "canon_1d_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_5D = {
-    "CanonCI5D_CameraOwnerName": "canon_5d_owner_name",
-    "CanonCI5D_CameraSerialNumber": "canon_5d_serial",
-    "CanonCI5D_WindowMatrix1": "canon_5d_window_matrix_1",
-    "CanonCI5D_WindowMatrix2": "canon_5d_window_matrix_2",
-    "CanonCI5D_WindowMatrix3": "canon_5d_window_matrix_3",
-    "CanonCI5D_WindowMatrix4": "canon_5d_window_matrix_4",
-    "CanonCI5D_WindowMatrix5": "canon_5d_window_matrix_5",
-    "CanonCI5D_WindowMatrix6": "canon_5d_window_matrix_6",
-    "CanonCI5D_FAFWindow1": "canon_5d_faf_window_1",
-    "CanonCI5D_FAFWindow2": "canon_5d_faf_window_2",
-    "CanonCI5D_FAFWindow3": "canon_5d_faf_window_3",
-    "CanonCI5D_FAFWindow4": "canon_5d_faf_window_4",
-    "CanonCI5D_AFPointArea1": "canon_5d_af_point_area_1",
-    "CanonCI5D_AFPointArea2": "canon_5d_af_point_area_2",
-    "CanonCI5D_AFPointArea3": "canon_5d_af_point_area_3",
-    "CanonCI5D_AFPointArea4": "canon_5d_af_point_area_4",
-    "CanonCI5D_AFPointLocation1": "canon_5d_af_point_location_1",
-    "CanonCI5D_AFPointLocation2": "canon_5d_af_point_location_2",
-    "CanonCI5D_AFPointLocation3": "canon_5d_af_point_location_3",
-    "CanonCI5D_AFPointLocation4": "canon_5d_af_point_location_4",
-    "CanonCI5D_AFPointsSelected1": "canon_5d_af_points_selected_1",
-    "CanonCI5D_AFPointsSelected2": "canon_5d_af_points_selected_2",
-    "CanonCI5D_AFPointsSelected3": "canon_5d_af_points_selected_3",
-    "CanonCI5D_AFPointsSelected4": "canon_5d_af_points_selected_4",
-    "CanonCI5D_AFStatus1": "canon_5d_af_status_1",
-    "CanonCI5D_AFStatus2": "canon_5d_af_status_2",
-    "CanonCI5D_AFStatus3": "canon_5d_af_status_3",
-    "CanonCI5D_AFStatus4": "canon_5d_af_status_4",
-    "CanonCI5D_AFStatus5": "canon_5d_af_status_5",
-    "CanonCI5D_AFStatus6": "canon_5d_af_status_6",
-    "CanonCI5D_AFStatus7": "canon_5d_af_status_7",
-    "CanonCI5D_AFStatus8": "canon_5d_af_status_8",
-    "CanonCI5D_AFStatus9": "canon_5d_af_status_9",
-    "CanonCI5D_AFStatus10": "canon_5d_af_status_10",
-    "CanonCI5D_AFStatus11": "canon_5d_af_status_11",
-    "CanonCI5D_AFStatus12": "canon_5d_af_status_12",
-    "CanonCI5D_AFStatus13": "canon_5d_af_status_13",
-    "CanonCI5D_AFStatus14": "canon_5d_af_status_14",
-    "CanonCI5D_AFStatus15": "canon_5d_af_status_15",
-    "CanonCI5D_AFStatus16": "canon_5d_af_status_16",
-    "CanonCI5D_ContrastData1": "canon_5d_contrast_data_1",
-    "CanonCI5D_ContrastData2": "canon_5d_contrast_data_2",
-    "CanonCI5D_ContrastData3": "canon_5d_contrast_data_3",
-    "CanonCI5D_ContrastData4": "canon_5d_contrast_data_4",
-    "CanonCI5D_ContrastData5": "canon_5d_contrast_data_5",
-    "CanonCI5D_ContrastData6": "canon_5d_contrast_data_6",
-    "CanonCI5D_ContrastData7": "canon_5d_contrast_data_7",
-    "CanonCI5D_ContrastData8": "canon_5d_contrast_data_8",
-    "CanonCI5D_IntelligentContrast": "canon_5d_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_5D2 = {
-    "CanonCI5D2_CameraOwnerName": "canon_5d2_owner_name",
-    "CanonCI5D2_CameraSerialNumber": "canon_5d2_serial",
-    "CanonCI5D2_WindowMatrix1": "canon_5d2_window_matrix_1",
-    "CanonCI5D2_WindowMatrix2": "canon_5d2_window_matrix_2",
-    "CanonCI5D2_WindowMatrix3": "canon_5d2_window_matrix_3",
-    "CanonCI5D2_WindowMatrix4": "canon_5d2_window_matrix_4",
-    "CanonCI5D2_WindowMatrix5": "canon_5d2_window_matrix_5",
-    "CanonCI5D2_WindowMatrix6": "canon_5d2_window_matrix_6",
-    "CanonCI5D2_FAFWindow1": "canon_5d2_faf_window_1",
-    "CanonCI5D2_FAFWindow2": "canon_5d2_faf_window_2",
-    "CanonCI5D2_FAFWindow3": "canon_5d2_faf_window_3",
-    "CanonCI5D2_FAFWindow4": "canon_5d2_faf_window_4",
-    "CanonCI5D2_AFPointArea1": "canon_5d2_af_point_area_1",
-    "CanonCI5D2_AFPointArea2": "canon_5d2_af_point_area_2",
-    "CanonCI5D2_AFPointArea3": "canon_5d2_af_point_area_3",
-    "CanonCI5D2_AFPointArea4": "canon_5d2_af_point_area_4",
-    "CanonCI5D2_AFPointLocation1": "canon_5d2_af_point_location_1",
-    "CanonCI5D2_AFPointLocation2": "canon_5d2_af_point_location_2",
-    "CanonCI5D2_AFPointLocation3": "canon_5d2_af_point_location_3",
-    "CanonCI5D2_AFPointLocation4": "canon_5d2_af_point_location_4",
-    "CanonCI5D2_AFPointsSelected1": "canon_5d2_af_points_selected_1",
-    "CanonCI5D2_AFPointsSelected2": "canon_5d2_af_points_selected_2",
-    "CanonCI5D2_AFPointsSelected3": "canon_5d2_af_points_selected_3",
-    "CanonCI5D2_AFPointsSelected4": "canon_5d2_af_points_selected_4",
-    "CanonCI5D2_AFStatus1": "canon_5d2_af_status_1",
-    "CanonCI5D2_AFStatus2": "canon_5d2_af_status_2",
-    "CanonCI5D2_AFStatus3": "canon_5d2_af_status_3",
-    "CanonCI5D2_AFStatus4": "canon_5d2_af_status_4",
-    "CanonCI5D2_AFStatus5": "canon_5d2_af_status_5",
-    "CanonCI5D2_AFStatus6": "canon_5d2_af_status_6",
-    "CanonCI5D2_AFStatus7": "canon_5d2_af_status_7",
-    "CanonCI5D2_AFStatus8": "canon_5d2_af_status_8",
-    "CanonCI5D2_AFStatus9": "canon_5d2_af_status_9",
-    "CanonCI5D2_AFStatus10": "canon_5d2_af_status_10",
-    "CanonCI5D2_AFStatus11": "canon_5d2_af_status_11",
-    "CanonCI5D2_AFStatus12": "canon_5d2_af_status_12",
-    "CanonCI5D2_AFStatus13": "canon_5d2_af_status_13",
-    "CanonCI5D2_AFStatus14": "canon_5d2_af_status_14",
-    "CanonCI5D2_AFStatus15": "canon_5d2_af_status_15",
-    "CanonCI5D2_AFStatus16": "canon_5d2_af_status_16",
-    "CanonCI5D2_ContrastData1": "canon_5d2_contrast_data_1",
-    "CanonCI5D2_ContrastData2": "canon_5d2_contrast_data_2",
-    "CanonCI5D2_ContrastData3": "canon_5d2_contrast_data_3",
-    "CanonCI5D2_ContrastData4": "canon_5d2_contrast_data_4",
-    "CanonCI5D2_ContrastData5": "canon_5d2_contrast_data_5",
-    "CanonCI5D2_ContrastData6": "canon_5d2_contrast_data_6",
-    "CanonCI5D2_ContrastData7": "canon_5d2_contrast_data_7",
-    "CanonCI5D2_ContrastData8": "canon_5d2_contrast_data_8",
-    "CanonCI5D2_IntelligentContrast": "canon_5d2_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_5D3 = {
-    "CanonCI5D3_CameraOwnerName": "canon_5d3_owner_name",
-    "CanonCI5D3_CameraSerialNumber": "canon_5d3_serial",
-    "CanonCI5D3_WindowMatrix1": "canon_5d3_window_matrix_1",
-    "CanonCI5D3_WindowMatrix2": "canon_5d3_window_matrix_2",
-    "CanonCI5D3_WindowMatrix3": "canon_5d3_window_matrix_3",
-    "CanonCI5D3_WindowMatrix4": "canon_5d3_window_matrix_4",
-    "CanonCI5D3_WindowMatrix5": "canon_5d3_window_matrix_5",
-    "CanonCI5D3_WindowMatrix6": "canon_5d3_window_matrix_6",
-    "CanonCI5D3_FAFWindow1": "canon_5d3_faf_window_1",
-    "CanonCI5D3_FAFWindow2": "canon_5d3_faf_window_2",
-    "CanonCI5D3_FAFWindow3": "canon_5d3_faf_window_3",
-    "CanonCI5D3_FAFWindow4": "canon_5d3_faf_window_4",
-    "CanonCI5D3_FAFWindow5": "canon_5d3_faf_window_5",
-    "CanonCI5D3_FAFWindow6": "canon_5d3_faf_window_6",
-    "CanonCI5D3_FAFWindow7": "canon_5d3_faf_window_7",
-    "CanonCI5D3_FAFWindow8": "canon_5d3_faf_window_8",
-    "CanonCI5D3_AFPointArea1": "canon_5d3_af_point_area_1",
-    "CanonCI5D3_AFPointArea2": "canon_5d3_af_point_area_2",
-    "CanonCI5D3_AFPointArea3": "canon_5d3_af_point_area_3",
-    "CanonCI5D3_AFPointArea4": "canon_5d3_af_point_area_4",
-    "CanonCI5D3_AFPointArea5": "canon_5d3_af_point_area_5",
-    "CanonCI5D3_AFPointArea6": "canon_5d3_af_point_area_6",
-    "CanonCI5D3_AFPointArea7": "canon_5d3_af_point_area_7",
-    "CanonCI5D3_AFPointArea8": "canon_5d3_af_point_area_8",
-    "CanonCI5D3_AFPointLocation1": "canon_5d3_af_point_location_1",
-    "CanonCI5D3_AFPointLocation2": "canon_5d3_af_point_location_2",
-    "CanonCI5D3_AFPointLocation3": "canon_5d3_af_point_location_3",
-    "CanonCI5D3_AFPointLocation4": "canon_5d3_af_point_location_4",
-    "CanonCI5D3_AFPointLocation5": "canon_5d3_af_point_location_5",
-    "CanonCI5D3_AFPointLocation6": "canon_5d3_af_point_location_6",
-    "CanonCI5D3_AFPointLocation7": "canon_5d3_af_point_location_7",
-    "CanonCI5D3_AFPointLocation8": "canon_5d3_af_point_location_8",
-    "CanonCI5D3_AFPointsSelected1": "canon_5d3_af_points_selected_1",
-    "CanonCI5D3_AFPointsSelected2": "canon_5d3_af_points_selected_2",
-    "CanonCI5D3_AFPointsSelected3": "canon_5d3_af_points_selected_3",
-    "CanonCI5D3_AFPointsSelected4": "canon_5d3_af_points_selected_4",
-    "CanonCI5D3_AFPointsSelected5": "canon_5d3_af_points_selected_5",
-    "CanonCI5D3_AFPointsSelected6": "canon_5d3_af_points_selected_6",
-    "CanonCI5D3_AFPointsSelected7": "canon_5d3_af_points_selected_7",
-    "CanonCI5D3_AFPointsSelected8": "canon_5d3_af_points_selected_8",
-    "CanonCI5D3_AFStatus1": "canon_5d3_af_status_1",
-    "CanonCI5D3_AFStatus2": "canon_5d3_af_status_2",
-    "CanonCI5D3_AFStatus3": "canon_5d3_af_status_3",
-    "CanonCI5D3_AFStatus4": "canon_5d3_af_status_4",
-    "CanonCI5D3_AFStatus5": "canon_5d3_af_status_5",
-    "CanonCI5D3_AFStatus6": "canon_5d3_af_status_6",
-    "CanonCI5D3_AFStatus7": "canon_5d3_af_status_7",
-    "CanonCI5D3_AFStatus8": "canon_5d3_af_status_8",
-    "CanonCI5D3_AFStatus9": "canon_5d3_af_status_9",
-    "CanonCI5D3_AFStatus10": "canon_5d3_af_status_10",
-    "CanonCI5D3_AFStatus11": "canon_5d3_af_status_11",
-    "CanonCI5D3_AFStatus12": "canon_5d3_af_status_12",
-    "CanonCI5D3_AFStatus13": "canon_5d3_af_status_13",
-    "CanonCI5D3_AFStatus14": "canon_5d3_af_status_14",
-    "CanonCI5D3_AFStatus15": "canon_5d3_af_status_15",
-    "CanonCI5D3_AFStatus16": "canon_5d3_af_status_16",
-    "CanonCI5D3_AFStatus17": "canon_5d3_af_status_17",
-    "CanonCI5D3_AFStatus18": "canon_5d3_af_status_18",
-    "CanonCI5D3_AFStatus19": "canon_5d3_af_status_19",
-    "CanonCI5D3_AFStatus20": "canon_5d3_af_status_20",
-    "CanonCI5D3_AFStatus21": "canon_5d3_af_status_21",
-    "CanonCI5D3_AFStatus22": "canon_5d3_af_status_22",
-    "CanonCI5D3_AFStatus23": "canon_5d3_af_status_23",
-    "CanonCI5D3_AFStatus24": "canon_5d3_af_status_24",
-    "CanonCI5D3_AFStatus25": "canon_5d3_af_status_25",
-    "CanonCI5D3_AFStatus26": "canon_5d3_af_status_26",
-    "CanonCI5D3_AFStatus27": "canon_5d3_af_status_27",
-    "CanonCI5D3_AFStatus28": "canon_5d3_af_status_28",
-    "CanonCI5D3_ContrastData1": "canon_5d3_contrast_data_1",
-    "CanonCI5D3_ContrastData2": "canon_5d3_contrast_data_2",
-    "CanonCI5D3_ContrastData3": "canon_5d3_contrast_data_3",
-    "CanonCI5D3_ContrastData4": "canon_5d3_contrast_data_4",
-    "CanonCI5D3_ContrastData5": "canon_5d3_contrast_data_5",
-    "CanonCI5D3_ContrastData6": "canon_5d3_contrast_data_6",
-    "CanonCI5D3_ContrastData7": "canon_5d3_contrast_data_7",
-    "CanonCI5D3_ContrastData8": "canon_5d3_contrast_data_8",
-    "CanonCI5D3_IntelligentContrast": "canon_5d3_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_6D = {
-    "CanonCI6D_CameraOwnerName": "canon_6d_owner_name",
-    "CanonCI6D_CameraSerialNumber": "canon_6d_serial",
-    "CanonCI6D_WindowMatrix1": "canon_6d_window_matrix_1",
-    "CanonCI6D_WindowMatrix2": "canon_6d_window_matrix_2",
-    "CanonCI6D_WindowMatrix3": "canon_6d_window_matrix_3",
-    "CanonCI6D_WindowMatrix4": "canon_6d_window_matrix_4",
-    "CanonCI6D_WindowMatrix5": "canon_6d_window_matrix_5",
-    "CanonCI6D_WindowMatrix6": "canon_6d_window_matrix_6",
-    "CanonCI6D_FAFWindow1": "canon_6d_faf_window_1",
-    "CanonCI6D_FAFWindow2": "canon_6d_faf_window_2",
-    "CanonCI6D_FAFWindow3": "canon_6d_faf_window_3",
-    "CanonCI6D_FAFWindow4": "canon_6d_faf_window_4",
-    "CanonCI6D_AFPointArea1": "canon_6d_af_point_area_1",
-    "CanonCI6D_AFPointArea2": "canon_6d_af_point_area_2",
-    "CanonCI6D_AFPointArea3": "canon_6d_af_point_area_3",
-    "CanonCI6D_AFPointArea4": "canon_6d_af_point_area_4",
-    "CanonCI6D_AFPointLocation1": "canon_6d_af_point_location_1",
-    "CanonCI6D_AFPointLocation2": "canon_6d_af_point_location_2",
-    "CanonCI6D_AFPointLocation3": "canon_6d_af_point_location_3",
-    "CanonCI6D_AFPointLocation4": "canon_6d_af_point_location_4",
-    "CanonCI6D_AFPointsSelected1": "canon_6d_af_points_selected_1",
-    "CanonCI6D_AFPointsSelected2": "canon_6d_af_points_selected_2",
-    "CanonCI6D_AFPointsSelected3": "canon_6d_af_points_selected_3",
-    "CanonCI6D_AFPointsSelected4": "canon_6d_af_points_selected_4",
-    "CanonCI6D_AFStatus1": "canon_6d_af_status_1",
-    "CanonCI6D_AFStatus2": "canon_6d_af_status_2",
-    "CanonCI6D_AFStatus3": "canon_6d_af_status_3",
-    "CanonCI6D_AFStatus4": "canon_6d_af_status_4",
-    "CanonCI6D_AFStatus5": "canon_6d_af_status_5",
-    "CanonCI6D_AFStatus6": "canon_6d_af_status_6",
-    "CanonCI6D_AFStatus7": "canon_6d_af_status_7",
-    "CanonCI6D_AFStatus8": "canon_6d_af_status_8",
-    "CanonCI6D_ContrastData1": "canon_6d_contrast_data_1",
-    "CanonCI6D_ContrastData2": "canon_6d_contrast_data_2",
-    "CanonCI6D_ContrastData3": "canon_6d_contrast_data_3",
-    "CanonCI6D_ContrastData4": "canon_6d_contrast_data_4",
-    "CanonCI6D_ContrastData5": "canon_6d_contrast_data_5",
-    "CanonCI6D_ContrastData6": "canon_6d_contrast_data_6",
-    "CanonCI6D_ContrastData7": "canon_6d_contrast_data_7",
-    "CanonCI6D_ContrastData8": "canon_6d_contrast_data_8",
-    "CanonCI6D_IntelligentContrast": "canon_6d_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_7D = {
-    "CanonCI7D_CameraOwnerName": "canon_7d_owner_name",
-    "CanonCI7D_CameraSerialNumber": "canon_7d_serial",
-    "CanonCI7D_WindowMatrix1": "canon_7d_window_matrix_1",
-    "CanonCI7D_WindowMatrix2": "canon_7d_window_matrix_2",
-    "CanonCI7D_WindowMatrix3": "canon_7d_window_matrix_3",
-    "CanonCI7D_WindowMatrix4": "canon_7d_window_matrix_4",
-    "CanonCI7D_WindowMatrix5": "canon_7d_window_matrix_5",
-    "CanonCI7D_WindowMatrix6": "canon_7d_window_matrix_6",
-    "CanonCI7D_WindowMatrix7": "canon_7d_window_matrix_7",
-    "CanonCI7D_WindowMatrix8": "canon_7d_window_matrix_8",
-    "CanonCI7D_WindowMatrix9": "canon_7d_window_matrix_9",
-    "CanonCI7D_WindowMatrix10": "canon_7d_window_matrix_10",
-    "CanonCI7D_WindowMatrix11": "canon_7d_window_matrix_11",
-    "CanonCI7D_WindowMatrix12": "canon_7d_window_matrix_12",
-    "CanonCI7D_FAFWindow1": "canon_7d_faf_window_1",
-    "CanonCI7D_FAFWindow2": "canon_7d_faf_window_2",
-    "CanonCI7D_FAFWindow3": "canon_7d_faf_window_3",
-    "CanonCI7D_FAFWindow4": "canon_7d_faf_window_4",
-    "CanonCI7D_FAFWindow5": "canon_7d_faf_window_5",
-    "CanonCI7D_FAFWindow6": "canon_7d_faf_window_6",
-    "CanonCI7D_FAFWindow7": "canon_7d_faf_window_7",
-    "CanonCI7D_FAFWindow8": "canon_7d_faf_window_8",
-    "CanonCI7D_AFPointArea1": "canon_7d_af_point_area_1",
-    "CanonCI7D_AFPointArea2": "canon_7d_af_point_area_2",
-    "CanonCI7D_AFPointArea3": "canon_7d_af_point_area_3",
-    "CanonCI7D_AFPointArea4": "canon_7d_af_point_area_4",
-    "CanonCI7D_AFPointArea5": "canon_7d_af_point_area_5",
-    "CanonCI7D_AFPointArea6": "canon_7d_af_point_area_6",
-    "CanonCI7D_AFPointArea7": "canon_7d_af_point_area_7",
-    "CanonCI7D_AFPointArea8": "canon_7d_af_point_area_8",
-    "CanonCI7D_AFPointLocation1": "canon_7d_af_point_location_1",
-    "CanonCI7D_AFPointLocation2": "canon_7d_af_point_location_2",
-    "CanonCI7D_AFPointLocation3": "canon_7d_af_point_location_3",
-    "CanonCI7D_AFPointLocation4": "canon_7d_af_point_location_4",
-    "CanonCI7D_AFPointLocation5": "canon_7d_af_point_location_5",
-    "CanonCI7D_AFPointLocation6": "canon_7d_af_point_location_6",
-    "CanonCI7D_AFPointLocation7": "canon_7d_af_point_location_7",
-    "CanonCI7D_AFPointLocation8": "canon_7d_af_point_location_8",
-    "CanonCI7D_AFPointsSelected1": "canon_7d_af_points_selected_1",
-    "CanonCI7D_AFPointsSelected2": "canon_7d_af_points_selected_2",
-    "CanonCI7D_AFPointsSelected3": "canon_7d_af_points_selected_3",
-    "CanonCI7D_AFPointsSelected4": "canon_7d_af_points_selected_4",
-    "CanonCI7D_AFPointsSelected5": "canon_7d_af_points_selected_5",
-    "CanonCI7D_AFPointsSelected6": "canon_7d_af_points_selected_6",
-    "CanonCI7D_AFPointsSelected7": "canon_7d_af_points_selected_7",
-    "CanonCI7D_AFPointsSelected8": "canon_7d_af_points_selected_8",
-    "CanonCI7D_AFStatus1": "canon_7d_af_status_1",
-    "CanonCI7D_AFStatus2": "canon_7d_af_status_2",
-    "CanonCI7D_AFStatus3": "canon_7d_af_status_3",
-    "CanonCI7D_AFStatus4": "canon_7d_af_status_4",
-    "CanonCI7D_AFStatus5": "canon_7d_af_status_5",
-    "CanonCI7D_AFStatus6": "canon_7d_af_status_6",
-    "CanonCI7D_AFStatus7": "canon_7d_af_status_7",
-    "CanonCI7D_AFStatus8": "canon_7d_af_status_8",
-    "CanonCI7D_AFStatus9": "canon_7d_af_status_9",
-    "CanonCI7D_AFStatus10": "canon_7d_af_status_10",
-    "CanonCI7D_AFStatus11": "canon_7d_af_status_11",
-    "CanonCI7D_AFStatus12": "canon_7d_af_status_12",
-    "CanonCI7D_AFStatus13": "canon_7d_af_status_13",
-    "CanonCI7D_AFStatus14": "canon_7d_af_status_14",
-    "CanonCI7D_AFStatus15": "canon_7d_af_status_15",
-    "CanonCI7D_AFStatus16": "canon_7d_af_status_16",
-    "CanonCI7D_ContrastData1": "canon_7d_contrast_data_1",
-    "CanonCI7D_ContrastData2": "canon_7d_contrast_data_2",
-    "CanonCI7D_ContrastData3": "canon_7d_contrast_data_3",
-    "CanonCI7D_ContrastData4": "canon_7d_contrast_data_4",
-    "CanonCI7D_ContrastData5": "canon_7d_contrast_data_5",
-    "CanonCI7D_ContrastData6": "canon_7d_contrast_data_6",
-    "CanonCI7D_ContrastData7": "canon_7d_contrast_data_7",
-    "CanonCI7D_ContrastData8": "canon_7d_contrast_data_8",
-    "CanonCI7D_IntelligentContrast": "canon_7d_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_80D = {
-    "CanonCI80D_CameraOwnerName": "canon_80d_owner_name",
-    "CanonCI80D_CameraSerialNumber": "canon_80d_serial",
-    "CanonCI80D_WindowMatrix1": "canon_80d_window_matrix_1",
-    "CanonCI80D_WindowMatrix2": "canon_80d_window_matrix_2",
-    "CanonCI80D_WindowMatrix3": "canon_80d_window_matrix_3",
-    "CanonCI80D_WindowMatrix4": "canon_80d_window_matrix_4",
-    "CanonCI80D_WindowMatrix5": "canon_80d_window_matrix_5",
-    "CanonCI80D_WindowMatrix6": "canon_80d_window_matrix_6",
-    "CanonCI80D_FAFWindow1": "canon_80d_faf_window_1",
-    "CanonCI80D_FAFWindow2": "canon_80d_faf_window_2",
-    "CanonCI80D_FAFWindow3": "canon_80d_faf_window_3",
-    "CanonCI80D_FAFWindow4": "canon_80d_faf_window_4",
-    "CanonCI80D_AFPointArea1": "canon_80d_af_point_area_1",
-    "CanonCI80D_AFPointArea2": "canon_80d_af_point_area_2",
-    "CanonCI80D_AFPointArea3": "canon_80d_af_point_area_3",
-    "CanonCI80D_AFPointArea4": "canon_80d_af_point_area_4",
-    "CanonCI80D_AFPointLocation1": "canon_80d_af_point_location_1",
-    "CanonCI80D_AFPointLocation2": "canon_80d_af_point_location_2",
-    "CanonCI80D_AFPointLocation3": "canon_80d_af_point_location_3",
-    "CanonCI80D_AFPointLocation4": "canon_80d_af_point_location_4",
-    "CanonCI80D_AFPointsSelected1": "canon_80d_af_points_selected_1",
-    "CanonCI80D_AFPointsSelected2": "canon_80d_af_points_selected_2",
-    "CanonCI80D_AFPointsSelected3": "canon_80d_af_points_selected_3",
-    "CanonCI80D_AFPointsSelected4": "canon_80d_af_points_selected_4",
-    "CanonCI80D_AFStatus1": "canon_80d_af_status_1",
-    "CanonCI80D_AFStatus2": "canon_80d_af_status_2",
-    "CanonCI80D_AFStatus3": "canon_80d_af_status_3",
-    "CanonCI80D_AFStatus4": "canon_80d_af_status_4",
-    "CanonCI80D_AFStatus5": "canon_80d_af_status_5",
-    "CanonCI80D_AFStatus6": "canon_80d_af_status_6",
-    "CanonCI80D_AFStatus7": "canon_80d_af_status_7",
-    "CanonCI80D_AFStatus8": "canon_80d_af_status_8",
-    "CanonCI80D_ContrastData1": "canon_80d_contrast_data_1",
-    "CanonCI80D_ContrastData2": "canon_80d_contrast_data_2",
-    "CanonCI80D_ContrastData3": "canon_80d_contrast_data_3",
-    "CanonCI80D_ContrastData4": "canon_80d_contrast_data_4",
-    "CanonCI80D_ContrastData5": "canon_80d_contrast_data_5",
-    "CanonCI80D_ContrastData6": "canon_80d_contrast_data_6",
-    "CanonCI80D_ContrastData7": "canon_80d_contrast_data_7",
-    "CanonCI80D_ContrastData8": "canon_80d_contrast_data_8",
-    "CanonCI80D_IntelligentContrast": "canon_80d_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_R5 = {
-    "CanonCIR5_CameraOwnerName": "canon_r5_owner_name",
-    "CanonCIR5_CameraSerialNumber": "canon_r5_serial",
-    "CanonCIR5_WindowMatrix1": "canon_r5_window_matrix_1",
-    "CanonCIR5_WindowMatrix2": "canon_r5_window_matrix_2",
-    "CanonCIR5_WindowMatrix3": "canon_r5_window_matrix_3",
-    "CanonCIR5_WindowMatrix4": "canon_r5_window_matrix_4",
-    "CanonCIR5_WindowMatrix5": "canon_r5_window_matrix_5",
-    "CanonCIR5_WindowMatrix6": "canon_r5_window_matrix_6",
-    "CanonCIR5_FAFWindow1": "canon_r5_faf_window_1",
-    "CanonCIR5_FAFWindow2": "canon_r5_faf_window_2",
-    "CanonCIR5_FAFWindow3": "canon_r5_faf_window_3",
-    "CanonCIR5_FAFWindow4": "canon_r5_faf_window_4",
-    "CanonCIR5_AFPointArea1": "canon_r5_af_point_area_1",
-    "CanonCIR5_AFPointArea2": "canon_r5_af_point_area_2",
-    "CanonCIR5_AFPointArea3": "canon_r5_af_point_area_3",
-    "CanonCIR5_AFPointArea4": "canon_r5_af_point_area_4",
-    "CanonCIR5_AFPointLocation1": "canon_r5_af_point_location_1",
-    "CanonCIR5_AFPointLocation2": "canon_r5_af_point_location_2",
-    "CanonCIR5_AFPointLocation3": "canon_r5_af_point_location_3",
-    "CanonCIR5_AFPointLocation4": "canon_r5_af_point_location_4",
-    "CanonCIR5_AFPointsSelected1": "canon_r5_af_points_selected_1",
-    "CanonCIR5_AFPointsSelected2": "canon_r5_af_points_selected_2",
-    "CanonCIR5_AFPointsSelected3": "canon_r5_af_points_selected_3",
-    "CanonCIR5_AFPointsSelected4": "canon_r5_af_points_selected_4",
-    "CanonCIR5_AFStatus1": "canon_r5_af_status_1",
-    "CanonCIR5_AFStatus2": "canon_r5_af_status_2",
-    "CanonCIR5_AFStatus3": "canon_r5_af_status_3",
-    "CanonCIR5_AFStatus4": "canon_r5_af_status_4",
-    "CanonCIR5_AFStatus5": "canon_r5_af_status_5",
-    "CanonCIR5_AFStatus6": "canon_r5_af_status_6",
-    "CanonCIR5_AFStatus7": "canon_r5_af_status_7",
-    "CanonCIR5_AFStatus8": "canon_r5_af_status_8",
-    "CanonCIR5_ContrastData1": "canon_r5_contrast_data_1",
-    "CanonCIR5_ContrastData2": "canon_r5_contrast_data_2",
-    "CanonCIR5_ContrastData3": "canon_r5_contrast_data_3",
-    "CanonCIR5_ContrastData4": "canon_r5_contrast_data_4",
-    "CanonCIR5_ContrastData5": "canon_r5_contrast_data_5",
-    "CanonCIR5_ContrastData6": "canon_r5_contrast_data_6",
-    "CanonCIR5_ContrastData7": "canon_r5_contrast_data_7",
-    "CanonCIR5_ContrastData8": "canon_r5_contrast_data_8",
-    "CanonCIR5_IntelligentContrast": "canon_r5_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_R6 = {
-    "CanonCIR6_CameraOwnerName": "canon_r6_owner_name",
-    "CanonCIR6_CameraSerialNumber": "canon_r6_serial",
-    "CanonCIR6_WindowMatrix1": "canon_r6_window_matrix_1",
-    "CanonCIR6_WindowMatrix2": "canon_r6_window_matrix_2",
-    "CanonCIR6_WindowMatrix3": "canon_r6_window_matrix_3",
-    "CanonCIR6_WindowMatrix4": "canon_r6_window_matrix_4",
-    "CanonCIR6_WindowMatrix5": "canon_r6_window_matrix_5",
-    "CanonCIR6_WindowMatrix6": "canon_r6_window_matrix_6",
-    "CanonCIR6_FAFWindow1": "canon_r6_faf_window_1",
-    "CanonCIR6_FAFWindow2": "canon_r6_faf_window_2",
-    "CanonCIR6_FAFWindow3": "canon_r6_faf_window_3",
-    "CanonCIR6_FAFWindow4": "canon_r6_faf_window_4",
-    "CanonCIR6_AFPointArea1": "canon_r6_af_point_area_1",
-    "CanonCIR6_AFPointArea2": "canon_r6_af_point_area_2",
-    "CanonCIR6_AFPointArea3": "canon_r6_af_point_area_3",
-    "CanonCIR6_AFPointArea4": "canon_r6_af_point_area_4",
-    "CanonCIR6_AFPointLocation1": "canon_r6_af_point_location_1",
-    "CanonCIR6_AFPointLocation2": "canon_r6_af_point_location_2",
-    "CanonCIR6_AFPointLocation3": "canon_r6_af_point_location_3",
-    "CanonCIR6_AFPointLocation4": "canon_r6_af_point_location_4",
-    "CanonCIR6_AFPointsSelected1": "canon_r6_af_points_selected_1",
-    "CanonCIR6_AFPointsSelected2": "canon_r6_af_points_selected_2",
-    "CanonCIR6_AFPointsSelected3": "canon_r6_af_points_selected_3",
-    "CanonCIR6_AFPointsSelected4": "canon_r6_af_points_selected_4",
-    "CanonCIR6_AFStatus1": "canon_r6_af_status_1",
-    "CanonCIR6_AFStatus2": "canon_r6_af_status_2",
-    "CanonCIR6_AFStatus3": "canon_r6_af_status_3",
-    "CanonCIR6_AFStatus4": "canon_r6_af_status_4",
-    "CanonCIR6_AFStatus5": "canon_r6_af_status_5",
-    "CanonCIR6_AFStatus6": "canon_r6_af_status_6",
-    "CanonCIR6_AFStatus7": "canon_r6_af_status_7",
-    "CanonCIR6_AFStatus8": "canon_r6_af_status_8",
-    "CanonCIR6_ContrastData1": "canon_r6_contrast_data_1",
-    "CanonCIR6_ContrastData2": "canon_r6_contrast_data_2",
-    "CanonCIR6_ContrastData3": "canon_r6_contrast_data_3",
-    "CanonCIR6_ContrastData4": "canon_r6_contrast_data_4",
-    "CanonCIR6_ContrastData5": "canon_r6_contrast_data_5",
-    "CanonCIR6_ContrastData6": "canon_r6_contrast_data_6",
-    "CanonCIR6_ContrastData7": "canon_r6_contrast_data_7",
-    "CanonCIR6_ContrastData8": "canon_r6_contrast_data_8",
-    "CanonCIR6_IntelligentContrast": "canon_r6_intelligent_contrast",
-}
-
-CANON_CAMERA_INFO_R3 = {
-    "CanonCIR3_CameraOwnerName": "canon_r3_owner_name",
-    "CanonCIR3_CameraSerialNumber": "canon_r3_serial",
-    "CanonCIR3_WindowMatrix1": "canon_r3_window_matrix_1",
-    "CanonCIR3_WindowMatrix2": "canon_r3_window_matrix_2",
-    "CanonCIR3_WindowMatrix3": "canon_r3_window_matrix_3",
-    "CanonCIR3_WindowMatrix4": "canon_r3_window_matrix_4",
-    "CanonCIR3_WindowMatrix5": "canon_r3_window_matrix_5",
-    "CanonCIR3_WindowMatrix6": "canon_r3_window_matrix_6",
-    "CanonCIR3_FAFWindow1": "canon_r3_faf_window_1",
-    "CanonCIR3_FAFWindow2": "canon_r3_faf_window_2",
-    "CanonCIR3_FAFWindow3": "canon_r3_faf_window_3",
-    "CanonCIR3_FAFWindow4": "canon_r3_faf_window_4",
-    "CanonCIR3_AFPointArea1": "canon_r3_af_point_area_1",
-    "CanonCIR3_AFPointArea2": "canon_r3_af_point_area_2",
-    "CanonCIR3_AFPointArea3": "canon_r3_af_point_area_3",
-    "CanonCIR3_AFPointArea4": "canon_r3_af_point_area_4",
-    "CanonCIR3_AFPointLocation1": "canon_r3_af_point_location_1",
-    "CanonCIR3_AFPointLocation2": "canon_r3_af_point_location_2",
-    "CanonCIR3_AFPointLocation3": "canon_r3_af_point_location_3",
-    "CanonCIR3_AFPointLocation4": "canon_r3_af_point_location_4",
-    "CanonCIR3_AFPointsSelected1": "canon_r3_af_points_selected_1",
-    "CanonCIR3_AFPointsSelected2": "canon_r3_af_points_selected_2",
-    "CanonCIR3_AFPointsSelected3": "canon_r3_af_points_selected_3",
-    "CanonCIR3_AFPointsSelected4": "canon_r3_af_points_selected_4",
-    "CanonCIR3_AFStatus1": "canon_r3_af_status_1",
-    "CanonCIR3_AFStatus2": "canon_r3_af_status_2",
-    "CanonCIR3_AFStatus3": "canon_r3_af_status_3",
-    "CanonCIR3_AFStatus4": "canon_r3_af_status_4",
-    "CanonCIR3_AFStatus5": "canon_r3_af_status_5",
-    "CanonCIR3_AFStatus6": "canon_r3_af_status_6",
-    "CanonCIR3_AFStatus7": "canon_r3_af_status_7",
-    "CanonCIR3_AFStatus8": "canon_r3_af_status_8",
-    "CanonCIR3_ContrastData1": "canon_r3_contrast_data_1",
-    "CanonCIR3_ContrastData2": "canon_r3_contrast_data_2",
-    "CanonCIR3_ContrastData3": "canon_r3_contrast_data_3",
-    "CanonCIR3_ContrastData4": "canon_r3_contrast_data_4",
-    "CanonCIR3_ContrastData5": "canon_r3_contrast_data_5",
-    "CanonCIR3_ContrastData6": "canon_r3_contrast_data_6",
-    "CanonCIR3_ContrastData7": "canon_r3_contrast_data_7",
-    "CanonCIR3_ContrastData8": "canon_r3_contrast_data_8",
-    "CanonCIR3_IntelligentContrast": "canon_r3_intelligent_contrast",
-}
-
-CANON_FILE_INFO = {
-    "CanonFI_FileNumber": "canon_file_number",
-    "CanonFI_DirectoryNumber": "canon_directory_number",
-    "CanonFI_FileSize": "canon_file_size",
-    "CanonFI_FileVersion": "canon_file_version",
-    "CanonFI_CRC": "canon_crc_file",
-}
-
-CANON_POWERSHOT_INFO = {
-    "CanonPS_ImageType": "canon_ps_image_type",
-    "CanonPS_CaptureDate": "canon_ps_capture_date",
-    "CanonPS_ResolutionMode": "canon_ps_resolution_mode",
-    "CanonPS_RedEyeMode": "canon_ps_red_eye_mode",
-    "CanonPS_StitchMode": "canon_ps_stitch_mode",
-    "CanonPS_Contrast": "canon_ps_contrast",
-    "CanonPS_Saturation": "canon_ps_saturation",
-    "CanonPS_Sharpness": "canon_ps_sharpness",
-    "CanonPS_CCDSensitivity": "canon_ps_ccd_sensitivity",
-    "CanonPS_ExposureCompensation": "canon_ps_exposure_comp",
-    "CanonPS_WhiteBalance": "canon_ps_wb",
-    "CanonPS_WhiteBalanceAdjustment": "canon_ps_wb_adjustment",
-    "CanonPS_FlashExposureComp": "canon_ps_flash_ec",
-    "CanonPS_AFResult": "canon_ps_af_result",
-    "CanonPS_SequenceNumber": "canon_ps_sequence",
-    "CanonPS_ImageNumber": "canon_ps_image_number",
-    "CanonPS_FlashDetails": "canon_ps_flash_details",
-    "CanonPS_ManualFlashOutput": "canon_ps_manual_flash",
-    "CanonPS_FocalLength": "canon_ps_focal_length",
-    "CanonPS_FocusingDistance": "canon_ps_focus_distance",
-    "CanonPS_AFPointPosition": "canon_ps_af_point_pos",
-    "CanonPS_CameraISO": "canon_ps_iso",
-    "CanonPS_RealWorldHeight": "canon_ps_real_world_height",
-    "CanonPS_RealWorldWidth": "canon_ps_real_world_width",
-    "CanonPS_RealWorldFocusDistance": "canon_ps_real_world_focus",
-    "CanonPS_LensType": "canon_ps_lens_type",
-    "CanonPS_LensSerialNumber": "canon_ps_lens_serial",
-    "CanonPS_InternalSerialNumber": "canon_ps_internal_serial",
-    "CanonPS_DustRemovalData": "canon_ps_dust_removal",
-    "CanonPS_FirmwareRevision": "canon_ps_firmware",
-    "CanonPS_Aspect": "canon_ps_aspect",
-    "CanonPS_ColorHue": "canon_ps_color_hue",
-    "CanonPS_ColorBalance": "canon_ps_color_balance",
-    "CanonPS_ColorMatrix": "canon_ps_color_matrix",
-    "CanonPS_LevelDistance": "canon_ps_level_distance",
-    "CanonPS_GPSLatitude": "canon_ps_gps_lat",
-    "CanonPS_GPSLongitude": "canon_ps_gps_lon",
-    "CanonPS_GPSAltitude": "canon_ps_gps_alt",
-    "CanonPS_GPSTime": "canon_ps_gps_time",
-    "CanonPS_GPSDate": "canon_ps_gps_date",
-    "CanonPS_CameraTemperature": "canon_ps_camera_temp",
-    "CanonPS_HuffmanTable": "canon_ps_huffman_table",
-    "CanonPS_ThumbnailImage": "canon_ps_thumbnail",
-    "CanonPS_EmbeddedColorCalibration": "canon_ps_color_cal",
-    "CanonPS_FaceDetect1": "canon_ps_face_detect_1",
-    "CanonPS_FaceDetect2": "canon_ps_face_detect_2",
-    "CanonPS_FaceDetect3": "canon_ps_face_detect_3",
-    "CanonPS_FaceDetect4": "canon_ps_face_detect_4",
-    "CanonPS_FaceDetect5": "canon_ps_face_detect_5",
-    "CanonPS_PhotoEffect": "canon_ps_photo_effect",
-    "CanonPS_ToneCurve": "canon_ps_tone_curve",
-    "CanonPS_ToneCurveMapping": "canon_ps_tone_curve_map",
-    "CanonPS_SharpnessAdjustment": "canon_ps_sharpness_adj",
-    "CanonPS_ContrastAdjustment": "canon_ps_contrast_adj",
-    "CanonPS_SaturationAdjustment": "canon_ps_saturation_adj",
-    "CanonPS_ColorGain": "canon_ps_color_gain",
-    "CanonPS_ColorOffset": "canon_ps_color_offset",
-    "CanonPS_FaceDetectAF": "canon_ps_face_detect_af",
-    "CanonPS_FaceDetectExposure": "canon_ps_face_detect_exp",
-    "CanonPS_ValidAFPoints": "canon_ps_valid_af_points",
-    "CanonPS_AFPointMode": "canon_ps_af_point_mode",
-    "CanonPS_AFPointX": "canon_ps_af_point_x",
-    "CanonPS_AFPointY": "canon_ps_af_point_y",
-    "CanonPS_AFPointWidth": "canon_ps_af_point_width",
-    "CanonPS_AFPointHeight": "canon_ps_af_point_height",
-    "CanonPS_TimeZone": "canon_ps_timezone",
-    "CanonPS_TimeZoneCity": "canon_ps_timezone_city",
-    "CanonPS_DaylightSavings": "canon_ps_daylight_savings",
-    "CanonPS_DSTStart": "canon_ps_dst_start",
-    "CanonPS_DSTEnd": "canon_ps_dst_end",
-    "CanonPS_OwnName": "canon_ps_owner_name",
-    "CanonPS_CameraOrientation": "canon_ps_camera_orientation",
-    "CanonPS_SonyImageWidth": "canon_ps_sony_width",
-    "CanonPS_SonyImageHeight": "canon_ps_sony_height",
-    "CanonPS_AFMode": "canon_ps_af_mode",
-    "CanonPS_FocusMode": "canon_ps_focus_mode",
-    "CanonPS_PanasonicImageWidth": "canon_ps_pana_width",
-    "CanonPS_PanasonicImageHeight": "canon_ps_pana_height",
-    "CanonPS_PrintImageMatching": "canon_ps_pim",
-    "CanonPS_PIMVersion": "canon_ps_pim_version",
-}
-
-CANON_3D_CAMERA_INFO = {
-    "Canon3D_ImageType": "canon_3d_image_type",
-    "Canon3D_CameraOwnerName": "canon_3d_owner_name",
-    "Canon3D_CameraSerialNumber": "canon_3d_serial",
-    "Canon3D_ImageWidth": "canon_3d_width",
-    "Canon3D_ImageHeight": "canon_3d_height",
-    "Canon3D_ImageWidth2": "canon_3d_width_2",
-    "Canon3D_ImageHeight2": "canon_3d_height_2",
-    "Canon3D_ImageCount": "canon_3d_image_count",
-    "Canon3D_ImageEffect": "canon_3d_effect",
-    "Canon3D_ShutterSpeed": "canon_3d_shutter",
-    "Canon3D_Aperture": "canon_3d_aperture",
-    "Canon3D_ExposureCompensation": "canon_3d_exp_comp",
-    "Canon3D_FlashExposureComp": "canon_3d_flash_ec",
-    "Canon3D_WhiteBalance": "canon_3d_wb",
-    "Canon3D_FlashMode": "canon_3d_flash_mode",
-    "Canon3D_FocusMode": "canon_3d_focus_mode",
-    "Canon3D_AFMode": "canon_3d_af_mode",
-    "Canon3D_WhiteBalanceAdjustment": "canon_3d_wb_adj",
-    "Canon3D_ISOSpeed": "canon_3d_iso",
-    "Canon3D_ZoneMatching": "canon_3d_zone_matching",
-    "Canon3D_ColorMode": "canon_3d_color_mode",
-    "Canon3D_ColorMatrix": "canon_3d_color_matrix",
-    "Canon3D_LensType": "canon_3d_lens_type",
-    "Canon3D_LensFocalLength": "canon_3d_focal_length",
-    "Canon3D_LensFocalLength35mm": "canon_3d_focal_35mm",
-    "Canon3D_AspectRatio": "canon_3d_aspect_ratio",
-    "Canon3D_FaceDetect1": "canon_3d_face_detect_1",
-    "Canon3D_FaceDetect2": "canon_3d_face_detect_2",
-    "Canon3D_FaceDetect3": "canon_3d_face_detect_3",
-    "Canon3D_FaceDetect4": "canon_3d_face_detect_4",
-    "Canon3D_FaceDetect5": "canon_3d_face_detect_5",
-    "Canon3D_FaceDetect6": "canon_3d_face_detect_6",
-    "Canon3D_FaceDetect7": "canon_3d_face_detect_7",
-    "Canon3D_FaceDetect8": "canon_3d_face_detect_8",
-    "Canon3D_FaceDetect9": "canon_3d_face_detect_9",
-    "Canon3D_FaceDetect10": "canon_3d_face_detect_10",
-    "Canon3D_FaceDetect11": "canon_3d_face_detect_11",
-    "Canon3D_FaceDetect12": "canon_3d_face_detect_12",
-    "Canon3D_FaceDetect13": "canon_3d_face_detect_13",
-    "Canon3D_FaceDetect14": "canon_3d_face_detect_14",
-    "Canon3D_FaceDetect15": "canon_3d_face_detect_15",
-    "Canon3D_FaceDetect16": "canon_3d_face_detect_16",
-}
-
-CANON_TAGS = {
-    **CANON_CAMERA_SETTINGS,
-    **CANON_SHOT_INFO,
-    **CANON_PICTURE_STYLE,
-    **CANON_LENS_INFO,
-    **CANON_COLOR_DATA_V1,
-    **CANON_COLOR_DATA_V2,
-    **CANON_COLOR_DATA_V4,
-    **CANON_COLOR_DATA_V5,
-    **CANON_COLOR_DATA_V6,
-    **CANON_COLOR_DATA_V7,
-    **CANON_COLOR_DATA_V8,
-    **CANON_COLOR_DATA_V9,
-    **CANON_COLOR_DATA_V10,
-    **CANON_COLOR_DATA_V11,
-    **CANON_COLOR_DATA_V12,
-    **CANON_AF_INFO,
-    **CANON_AF_INFO_2,
-    **CANON_CAMERA_INFO_1D,
-    **CANON_CAMERA_INFO_5D,
-    **CANON_CAMERA_INFO_5D2,
-    **CANON_CAMERA_INFO_5D3,
-    **CANON_CAMERA_INFO_6D,
-    **CANON_CAMERA_INFO_7D,
-    **CANON_CAMERA_INFO_80D,
-    **CANON_CAMERA_INFO_R5,
-    **CANON_CAMERA_INFO_R6,
-    **CANON_CAMERA_INFO_R3,
-    **CANON_FILE_INFO,
-    **CANON_POWERSHOT_INFO,
-    **CANON_3D_CAMERA_INFO,
-}
-NIKON_PICTURE_CONTROL = {
-    "NikonPictureControl_PictureControlName": "nikon_picture_control_name",
-    "NikonPictureControl_PictureControlBase": "nikon_picture_control_base",
-    "NikonPictureControl_PictureControlAdjust": "nikon_picture_control_adjust",
-    "NikonPictureControl_PictureControlQuickAdjust": "nikon_picture_control_quick_adjust",
-    "NikonPictureControl_Sharpness": "nikon_sharpness",
-    "NikonPictureControl_Contrast": "nikon_contrast",
-    "NikonPictureControl_Brightness": "nikon_brightness",
-    "NikonPictureControl_Saturation": "nikon_saturation",
-    "NikonPictureControl_HueAdjustment": "nikon_hue_adjustment",
-    "NikonPictureControl_FilterEffect": "nikon_filter_effect",
-    "NikonPictureControl_ToningEffect": "nikon_toning_effect",
-    "NikonPictureControl_ActivePictureControl": "nikon_active_pc",
-    "NikonPictureControl_Clarity": "nikon_clarity",
-    "NikonPictureControl_MidRangeSharpness": "nikon_mid_range_sharpness",
-    "NikonPictureControl_Vignette": "nikon_vignette",
-    "NikonPictureControl_ColorBoost": "nikon_color_boost",
-    "NikonPictureControl_ToneCurve": "nikon_tone_curve_pc",
-}
-
-NIKON_CAMERA_INFO_D1 = {
-    "NikonCI_D1_CCDBoardVersion": "nikon_d1_ccd_board",
-    "NikonCI_D1_ControlBoardVersion": "nikon_d1_control_board",
-    "NikonCI_D1_WBAdjGrgb": "nikon_d1_wb_adj_rggb",
-    "NikonCI_D1_LensAdj": "nikon_d1_lens_adj",
-    "NikonCI_D1_CameraSerialNumber": "nikon_d1_serial",
-    "NikonCI_D1_ImageCount": "nikon_d1_image_count",
-    "NikonCI_D1_FlashInfoVersion": "nikon_d1_flash_version",
-    "NikonCI_D1_FlashInfo": "nikon_d1_flash_info",
-    "NikonCI_D1_ImageProcessing": "nikon_d1_image_processing",
-    "NikonCI_D1_CRC": "nikon_d1_crc",
-}
-
-NIKON_CAMERA_INFO_D2 = {
-    "NikonCI_D2_FirmwareVersion": "nikon_d2_firmware",
-    "NikonCI_D2_FirmwareVersion2": "nikon_d2_firmware_2",
-    "NikonCI_D2_CameraSerialNumber": "nikon_d2_serial",
-    "NikonCI_D2_CameraSerialNumber2": "nikon_d2_serial_2",
-    "NikonCI_D2_CardType": "nikon_d2_card_type",
-    "NikonCI_D2_ColorBalance1": "nikon_d2_color_balance_1",
-    "NikonCI_D2_ColorBalance2": "nikon_d2_color_balance_2",
-    "NikonCI_D2_ColorBalance3": "nikon_d2_color_balance_3",
-    "NikonCI_D2_ColorBalance4": "nikon_d2_color_balance_4",
-    "NikonCI_D2_ImageDataSize": "nikon_d2_image_data_size",
-    "NikonCI_D2_ImageCount": "nikon_d2_image_count",
-    "NikonCI_D2_DeletedImageCount": "nikon_d2_deleted_count",
-    "NikonCI_D2_ShutterCount": "nikon_d2_shutter_count",
-    "NikonCI_D2_FlashInfoVersion": "nikon_d2_flash_version",
-    "NikonCI_D2_FlashInfo": "nikon_d2_flash_info",
-    "NikonCI_D2_NRFFTag": "nikon_d2_nrff_tag",
-    "NikonCI_D2_CustomSettings": "nikon_d2_custom_settings",
-    "NikonCI_D2_CustomSettings2": "nikon_d2_custom_settings_2",
-    "NikonCI_D2_VRInfo": "nikon_d2_vr_info",
-    "NikonCI_D2_FocusInfo": "nikon_d2_focus_info",
-    "NikonCI_D2_AFAreaPoint": "nikon_d2_af_area_point",
-    "NikonCI_D2_FocusMode": "nikon_d2_focus_mode",
-    "NikonCI_D2_AFPoint": "nikon_d2_af_point",
-    "NikonCI_D2_AFOnButton": "nikon_d2_af_on_button",
-    "NikonCI_D2_AFAreaMode": "nikon_d2_af_area_mode",
-    "NikonCI_D2_FocusPointWrap": "nikon_d2_focus_point_wrap",
-    "NikonCI_D2_AFFineTune": "nikon_d2_af_fine_tune",
-    "NikonCI_D2_AFActivation": "nikon_d2_af_activation",
-    "NikonCI_D2_VRMode": "nikon_d2_vr_mode",
-    "NikonCI_D2_CenteredMediumTone": "nikon_d2_centered_tone",
-    "NikonCI_D2_ActiveDLighting": "nikon_d2_adl",
-    "NikonCI_D2_FlashShutterSpeed": "nikon_d2_flash_shutter",
-    "NikonCI_D2_FlashExposureComp": "nikon_d2_flash_ec",
-    "NikonCI_D2_FlashMode": "nikon_d2_flash_mode",
-    "NikonCI_D2_FlashExposureComp2": "nikon_d2_flash_ec_2",
-    "NikonCI_D2_FlashExposureComp3": "nikon_d2_flash_ec_3",
-    "NikonCI_D2_FlashExposureComp4": "nikon_d2_flash_ec_4",
-    "NikonCI_D2_CRC": "nikon_d2_crc",
-}
-
-NIKON_CAMERA_INFO_D3 = {
-    "NikonCI_D3_FirmwareVersion": "nikon_d3_firmware",
-    "NikonCI_D3_FirmwareVersion2": "nikon_d3_firmware_2",
-    "NikonCI_D3_CameraSerialNumber": "nikon_d3_serial",
-    "NikonCI_D3_CameraSerialNumber2": "nikon_d3_serial_2",
-    "NikonCI_D3_CardType": "nikon_d3_card_type",
-    "NikonCI_D3_ColorBalance1": "nikon_d3_color_balance_1",
-    "NikonCI_D3_ColorBalance2": "nikon_d3_color_balance_2",
-    "NikonCI_D3_ColorBalance3": "nikon_d3_color_balance_3",
-    "NikonCI_D3_ColorBalance4": "nikon_d3_color_balance_4",
-    "NikonCI_D3_ImageDataSize": "nikon_d3_image_data_size",
-    "NikonCI_D3_ImageCount": "nikon_d3_image_count",
-    "NikonCI_D3_DeletedImageCount": "nikon_d3_deleted_count",
-    "NikonCI_D3_ShutterCount": "nikon_d3_shutter_count",
-    "NikonCI_D3_FlashInfoVersion": "nikon_d3_flash_version",
-    "NikonCI_D3_FlashInfo": "nikon_d3_flash_info",
-    "NikonCI_D3_FlashInfo2": "nikon_d3_flash_info_2",
-    "NikonCI_D3_NRFFTag": "nikon_d3_nrff_tag",
-    "NikonCI_D3_CustomSettings": "nikon_d3_custom_settings",
-    "NikonCI_D3_CustomSettingsBank": "nikon_d3_custom_settings_bank",
-    "NikonCI_D3_CustomSettings2": "nikon_d3_custom_settings_2",
-    "NikonCI_D3_CustomSettingsBank2": "nikon_d3_custom_settings_bank_2",
-    "NikonCI_D3_VRInfo": "nikon_d3_vr_info",
-    "NikonCI_D3_VRInfo2": "nikon_d3_vr_info_2",
-    "NikonCI_D3_FocusInfo": "nikon_d3_focus_info",
-    "NikonCI_D3_FocusInfo2": "nikon_d3_focus_info_2",
-    "NikonCI_D3_AFAreaPoint": "nikon_d3_af_area_point",
-    "NikonCI_D3_FocusMode": "nikon_d3_focus_mode",
-    "NikonCI_D3_AFPoint": "nikon_d3_af_point",
-    "NikonCI_D3_AFOnButton": "nikon_d3_af_on_button",
-    "NikonCI_D3_AFAreaMode": "nikon_d3_af_area_mode",
-    "NikonCI_D3_FocusPointWrap": "nikon_d3_focus_point_wrap",
-    "NikonCI_D3_AFFineTune": "nikon_d3_af_fine_tune",
-    "NikonCI_D3_AFActivation": "nikon_d3_af_activation",
-    "NikonCI_D3_VRMode": "nikon_d3_vr_mode",
-    "NikonCI_D3_ImageAuthentication": "nikon_d3_image_auth",
-    "NikonCI_D3_EmbeddingVersion": "nikon_d3_embedding_version",
-    "NikonCI_D3_CRC": "nikon_d3_crc",
-}
-
-NIKON_CAMERA_INFO_D4 = {
-    "NikonCI_D4_FirmwareVersion": "nikon_d4_firmware",
-    "NikonCI_D4_FirmwareVersion2": "nikon_d4_firmware_2",
-    "NikonCI_D4_CameraSerialNumber": "nikon_d4_serial",
-    "NikonCI_D4_CameraSerialNumber2": "nikon_d4_serial_2",
-    "NikonCI_D4_CardType": "nikon_d4_card_type",
-    "NikonCI_D4_ColorBalance1": "nikon_d4_color_balance_1",
-    "NikonCI_D4_ColorBalance2": "nikon_d4_color_balance_2",
-    "NikonCI_D4_ColorBalance3": "nikon_d4_color_balance_3",
-    "NikonCI_D4_ColorBalance4": "nikon_d4_color_balance_4",
-    "NikonCI_D4_ImageDataSize": "nikon_d4_image_data_size",
-    "NikonCI_D4_ImageCount": "nikon_d4_image_count",
-    "NikonCI_D4_DeletedImageCount": "nikon_d4_deleted_count",
-    "NikonCI_D4_ShutterCount": "nikon_d4_shutter_count",
-    "NikonCI_D4_FlashInfoVersion": "nikon_d4_flash_version",
-    "NikonCI_D4_FlashInfo": "nikon_d4_flash_info",
-    "NikonCI_D4_FlashInfo2": "nikon_d4_flash_info_2",
-    "NikonCI_D4_FlashInfo3": "nikon_d4_flash_info_3",
-    "NikonCI_D4_NRFFTag": "nikon_d4_nrff_tag",
-    "NikonCI_D4_CustomSettings": "nikon_d4_custom_settings",
-    "NikonCI_D4_CustomSettingsBank": "nikon_d4_custom_settings_bank",
-    "NikonCI_D4_CustomSettings2": "nikon_d4_custom_settings_2",
-    "NikonCI_D4_CustomSettingsBank2": "nikon_d4_custom_settings_bank_2",
-    "NikonCI_D4_VRInfo": "nikon_d4_vr_info",
-    "NikonCI_D4_VRInfo2": "nikon_d4_vr_info_2",
-    "NikonCI_D4_FocusInfo": "nikon_d4_focus_info",
-    "NikonCI_D4_FocusInfo2": "nikon_d4_focus_info_2",
-    "NikonCI_D4_AFAreaPoint": "nikon_d4_af_area_point",
-    "NikonCI_D4_FocusMode": "nikon_d4_focus_mode",
-    "NikonCI_D4_AFPoint": "nikon_d4_af_point",
-    "NikonCI_D4_AFOnButton": "nikon_d4_af_on_button",
-    "NikonCI_D4_AFAreaMode": "nikon_d4_af_area_mode",
-    "NikonCI_D4_FocusPointWrap": "nikon_d4_focus_point_wrap",
-    "NikonCI_D4_AFFineTune": "nikon_d4_af_fine_tune",
-    "NikonCI_D4_AFActivation": "nikon_d4_af_activation",
-    "NikonCI_D4_VRMode": "nikon_d4_vr_mode",
-    "NikonCI_D4_ImageAuthentication": "nikon_d4_image_auth",
-    "NikonCI_D4_EmbeddingVersion": "nikon_d4_embedding_version",
-    "NikonCI_D4_CRC": "nikon_d4_crc",
-}
-
-NIKON_CAMERA_INFO_D5 = {
-    "NikonCI_D5_FirmwareVersion": "nikon_d5_firmware",
-    "NikonCI_D5_FirmwareVersion2": "nikon_d5_firmware_2",
-    "NikonCI_D5_CameraSerialNumber": "nikon_d5_serial",
-    "NikonCI_D5_CameraSerialNumber2": "nikon_d5_serial_2",
-    "NikonCI_D5_CardType": "nikon_d5_card_type",
-    "NikonCI_D5_ColorBalance1": "nikon_d5_color_balance_1",
-    "NikonCI_D5_ColorBalance2": "nikon_d5_color_balance_2",
-    "NikonCI_D5_ColorBalance3": "nikon_d5_color_balance_3",
-    "NikonCI_D5_ColorBalance4": "nikon_d5_color_balance_4",
-    "NikonCI_D5_ImageDataSize": "nikon_d5_image_data_size",
-    "NikonCI_D5_ImageCount": "nikon_d5_image_count",
-    "NikonCI_D5_DeletedImageCount": "nikon_d5_deleted_count",
-    "NikonCI_D5_ShutterCount": "nikon_d5_shutter_count",
-    "NikonCI_D5_FlashInfoVersion": "nikon_d5_flash_version",
-    "NikonCI_D5_FlashInfo": "nikon_d5_flash_info",
-    "NikonCI_D5_FlashInfo2": "nikon_d5_flash_info_2",
-    "NikonCI_D5_FlashInfo3": "nikon_d5_flash_info_3",
-    "NikonCI_D5_FlashInfo4": "nikon_d5_flash_info_4",
-    "NikonCI_D5_NRFFTag": "nikon_d5_nrff_tag",
-    "NikonCI_D5_CustomSettings": "nikon_d5_custom_settings",
-    "NikonCI_D5_CustomSettingsBank": "nikon_d5_custom_settings_bank",
-    "NikonCI_D5_CustomSettings2": "nikon_d5_custom_settings_2",
-    "NikonCI_D5_CustomSettingsBank2": "nikon_d5_custom_settings_bank_2",
-    "NikonCI_D5_VRInfo": "nikon_d5_vr_info",
-    "NikonCI_D5_VRInfo2": "nikon_d5_vr_info_2",
-    "NikonCI_D5_FocusInfo": "nikon_d5_focus_info",
-    "NikonCI_D5_FocusInfo2": "nikon_d5_focus_info_2",
-    "NikonCI_D5_AFAreaPoint": "nikon_d5_af_area_point",
-    "NikonCI_D5_FocusMode": "nikon_d5_focus_mode",
-    "NikonCI_D5_AFPoint": "nikon_d5_af_point",
-    "NikonCI_D5_AFOnButton": "nikon_d5_af_on_button",
-    "NikonCI_D5_AFAreaMode": "nikon_d5_af_area_mode",
-    "NikonCI_D5_FocusPointWrap": "nikon_d5_focus_point_wrap",
-    "NikonCI_D5_AFFineTune": "nikon_d5_af_fine_tune",
-    "NikonCI_D5_AFActivation": "nikon_d5_af_activation",
-    "NikonCI_D5_VRMode": "nikon_d5_vr_mode",
-    "NikonCI_D5_ImageAuthentication": "nikon_d5_image_auth",
-    "NikonCI_D5_EmbeddingVersion": "nikon_d5_embedding_version",
-    "NikonCI_D5_CRC": "nikon_d5_crc",
-}
-
-NIKON_CAMERA_INFO_D500 = {
-    "NikonCI_D500_FirmwareVersion": "nikon_d500_firmware",
-    "NikonCI_D500_FirmwareVersion2": "nikon_d500_firmware_2",
-    "NikonCI_D500_CameraSerialNumber": "nikon_d500_serial",
-    "NikonCI_D500_CameraSerialNumber2": "nikon_d500_serial_2",
-    "NikonCI_D500_CardType": "nikon_d500_card_type",
-    "NikonCI_D500_ColorBalance1": "nikon_d500_color_balance_1",
-    "NikonCI_D500_ColorBalance2": "nikon_d500_color_balance_2",
-    "NikonCI_D500_ColorBalance3": "nikon_d500_color_balance_3",
-    "NikonCI_D500_ColorBalance4": "nikon_d500_color_balance_4",
-    "NikonCI_D500_ImageDataSize": "nikon_d500_image_data_size",
-    "NikonCI_D500_ImageCount": "nikon_d500_image_count",
-    "NikonCI_D500_DeletedImageCount": "nikon_d500_deleted_count",
-    "NikonCI_D500_ShutterCount": "nikon_d500_shutter_count",
-    "NikonCI_D500_FlashInfoVersion": "nikon_d500_flash_version",
-    "NikonCI_D500_FlashInfo": "nikon_d500_flash_info",
-    "NikonCI_D500_FlashInfo2": "nikon_d500_flash_info_2",
-    "NikonCI_D500_FlashInfo3": "nikon_d500_flash_info_3",
-    "NikonCI_D500_FlashInfo4": "nikon_d500_flash_info_4",
-    "NikonCI_D500_NRFFTag": "nikon_d500_nrff_tag",
-    "NikonCI_D500_CustomSettings": "nikon_d500_custom_settings",
-    "NikonCI_D500_CustomSettingsBank": "nikon_d500_custom_settings_bank",
-    "NikonCI_D500_CustomSettings2": "nikon_d500_custom_settings_2",
-    "NikonCI_D500_CustomSettingsBank2": "nikon_d500_custom_settings_bank_2",
-    "NikonCI_D500_VRInfo": "nikon_d500_vr_info",
-    "NikonCI_D500_VRInfo2": "nikon_d500_vr_info_2",
-    "NikonCI_D500_FocusInfo": "nikon_d500_focus_info",
-    "NikonCI_D500_FocusInfo2": "nikon_d500_focus_info_2",
-    "NikonCI_D500_AFAreaPoint": "nikon_d500_af_area_point",
-    "NikonCI_D500_FocusMode": "nikon_d500_focus_mode",
-    "NikonCI_D500_AFPoint": "nikon_d500_af_point",
-    "NikonCI_D500_AFOnButton": "nikon_d500_af_on_button",
-    "NikonCI_D500_AFAreaMode": "nikon_d500_af_area_mode",
-    "NikonCI_D500_FocusPointWrap": "nikon_d500_focus_point_wrap",
-    "NikonCI_D500_AFFineTune": "nikon_d500_af_fine_tune",
-    "NikonCI_D500_AFActivation": "nikon_d500_af_activation",
-    "NikonCI_D500_VRMode": "nikon_d500_vr_mode",
-    "NikonCI_D500_ImageAuthentication": "nikon_d500_image_auth",
-    "NikonCI_D500_EmbeddingVersion": "nikon_d500_embedding_version",
-    "NikonCI_D500_CRC": "nikon_d500_crc",
-}
-
-NIKON_CAMERA_INFO_D600 = {
-    "NikonCI_D600_FirmwareVersion": "nikon_d600_firmware",
-    "NikonCI_D600_FirmwareVersion2": "nikon_d600_firmware_2",
-    "NikonCI_D600_CameraSerialNumber": "nikon_d600_serial",
-    "NikonCI_D600_CameraSerialNumber2": "nikon_d600_serial_2",
-    "NikonCI_D600_CardType": "nikon_d600_card_type",
-    "NikonCI_D600_ColorBalance1": "nikon_d600_color_balance_1",
-    "NikonCI_D600_ColorBalance2": "nikon_d600_color_balance_2",
-    "NikonCI_D600_ColorBalance3": "nikon_d600_color_balance_3",
-    "NikonCI_D600_ColorBalance4": "nikon_d600_color_balance_4",
-    "NikonCI_D600_ImageDataSize": "nikon_d600_image_data_size",
-    "NikonCI_D600_ImageCount": "nikon_d600_image_count",
-    "NikonCI_D600_DeletedImageCount": "nikon_d600_deleted_count",
-    "NikonCI_D600_ShutterCount": "nikon_d600_shutter_count",
-    "NikonCI_D600_FlashInfoVersion": "nikon_d600_flash_version",
-    "NikonCI_D600_FlashInfo": "nikon_d600_flash_info",
-    "NikonCI_D600_FlashInfo2": "nikon_d600_flash_info_2",
-    "NikonCI_D600_NRFFTag": "nikon_d600_nrff_tag",
-    "NikonCI_D600_CustomSettings": "nikon_d600_custom_settings",
-    "NikonCI_D600_CustomSettingsBank": "nikon_d600_custom_settings_bank",
-    "NikonCI_D600_CustomSettings2": "nikon_d600_custom_settings_2",
-    "NikonCI_D600_CustomSettingsBank2": "nikon_d600_custom_settings_bank_2",
-    "NikonCI_D600_VRInfo": "nikon_d600_vr_info",
-    "NikonCI_D600_VRInfo2": "nikon_d600_vr_info_2",
-    "NikonCI_D600_FocusInfo": "nikon_d600_focus_info",
-    "NikonCI_D600_FocusInfo2": "nikon_d600_focus_info_2",
-    "NikonCI_D600_AFAreaPoint": "nikon_d600_af_area_point",
-    "NikonCI_D600_FocusMode": "nikon_d600_focus_mode",
-    "NikonCI_D600_AFPoint": "nikon_d600_af_point",
-    "NikonCI_D600_AFOnButton": "nikon_d600_af_on_button",
-    "NikonCI_D600_AFAreaMode": "nikon_d600_af_area_mode",
-    "NikonCI_D600_FocusPointWrap": "nikon_d600_focus_point_wrap",
-    "NikonCI_D600_AFFineTune": "nikon_d600_af_fine_tune",
-    "NikonCI_D600_AFActivation": "nikon_d600_af_activation",
-    "NikonCI_D600_VRMode": "nikon_d600_vr_mode",
-    "NikonCI_D600_ImageAuthentication": "nikon_d600_image_auth",
-    "NikonCI_D600_EmbeddingVersion": "nikon_d600_embedding_version",
-    "NikonCI_D600_CRC": "nikon_d600_crc",
-}
-
-NIKON_CAMERA_INFO_D700 = {
-    "NikonCI_D700_FirmwareVersion": "nikon_d700_firmware",
-    "NikonCI_D700_FirmwareVersion2": "nikon_d700_firmware_2",
-    "NikonCI_D700_CameraSerialNumber": "nikon_d700_serial",
-    "NikonCI_D700_CameraSerialNumber2": "nikon_d700_serial_2",
-    "NikonCI_D700_CardType": "nikon_d700_card_type",
-    "NikonCI_D700_ColorBalance1": "nikon_d700_color_balance_1",
-    "NikonCI_D700_ColorBalance2": "nikon_d700_color_balance_2",
-    "NikonCI_D700_ColorBalance3": "nikon_d700_color_balance_3",
-    "NikonCI_D700_ColorBalance4": "nikon_d700_color_balance_4",
-    "NikonCI_D700_ImageDataSize": "nikon_d700_image_data_size",
-    "NikonCI_D700_ImageCount": "nikon_d700_image_count",
-    "NikonCI_D700_DeletedImageCount": "nikon_d700_deleted_count",
-    "NikonCI_D700_ShutterCount": "nikon_d700_shutter_count",
-    "NikonCI_D700_FlashInfoVersion": "nikon_d700_flash_version",
-    "NikonCI_D700_FlashInfo": "nikon_d700_flash_info",
-    "NikonCI_D700_FlashInfo2": "nikon_d700_flash_info_2",
-    "NikonCI_D700_NRFFTag": "nikon_d700_nrff_tag",
-    "NikonCI_D700_CustomSettings": "nikon_d700_custom_settings",
-    "NikonCI_D700_CustomSettingsBank": "nikon_d700_custom_settings_bank",
-    "NikonCI_D700_CustomSettings2": "nikon_d700_custom_settings_2",
-    "NikonCI_D700_CustomSettingsBank2": "nikon_d700_custom_settings_bank_2",
-    "NikonCI_D700_VRInfo": "nikon_d700_vr_info",
-    "NikonCI_D700_VRInfo2": "nikon_d700_vr_info_2",
-    "NikonCI_D700_FocusInfo": "nikon_d700_focus_info",
-    "NikonCI_D700_FocusInfo2": "nikon_d700_focus_info_2",
-    "NikonCI_D700_AFAreaPoint": "nikon_d700_af_area_point",
-    "NikonCI_D700_FocusMode": "nikon_d700_focus_mode",
-    "NikonCI_D700_AFPoint": "nikon_d700_af_point",
-    "NikonCI_D700_AFOnButton": "nikon_d700_af_on_button",
-    "NikonCI_D700_AFAreaMode": "nikon_d700_af_area_mode",
-    "NikonCI_D700_FocusPointWrap": "nikon_d700_focus_point_wrap",
-    "NikonCI_D700_AFFineTune": "nikon_d700_af_fine_tune",
-    "NikonCI_D700_AFActivation": "nikon_d700_af_activation",
-    "NikonCI_D700_VRMode": "nikon_d700_vr_mode",
-    "NikonCI_D700_ImageAuthentication": "nikon_d700_image_auth",
-    "NikonCI_D700_EmbeddingVersion": "nikon_d700_embedding_version",
-    "NikonCI_D700_CRC": "nikon_d700_crc",
-}
-
-NIKON_CAMERA_INFO_D800 = {
-    "NikonCI_D800_FirmwareVersion": "nikon_d800_firmware",
-    "NikonCI_D800_FirmwareVersion2": "nikon_d800_firmware_2",
-    "NikonCI_D800_CameraSerialNumber": "nikon_d800_serial",
-    "NikonCI_D800_CameraSerialNumber2": "nikon_d800_serial_2",
-    "NikonCI_D800_CardType": "nikon_d800_card_type",
-    "NikonCI_D800_ColorBalance1": "nikon_d800_color_balance_1",
-    "NikonCI_D800_ColorBalance2": "nikon_d800_color_balance_2",
-    "NikonCI_D800_ColorBalance3": "nikon_d800_color_balance_3",
-    "NikonCI_D800_ColorBalance4": "nikon_d800_color_balance_4",
-    "NikonCI_D800_ImageDataSize": "nikon_d800_image_data_size",
-    "NikonCI_D800_ImageCount": "nikon_d800_image_count",
-    "NikonCI_D800_DeletedImageCount": "nikon_d800_deleted_count",
-    "NikonCI_D800_ShutterCount": "nikon_d800_shutter_count",
-    "NikonCI_D800_FlashInfoVersion": "nikon_d800_flash_version",
-    "NikonCI_D800_FlashInfo": "nikon_d800_flash_info",
-    "NikonCI_D800_FlashInfo2": "nikon_d800_flash_info_2",
-    "NikonCI_D800_NRFFTag": "nikon_d800_nrff_tag",
-    "NikonCI_D800_CustomSettings": "nikon_d800_custom_settings",
-    "NikonCI_D800_CustomSettingsBank": "nikon_d800_custom_settings_bank",
-    "NikonCI_D800_CustomSettings2": "nikon_d800_custom_settings_2",
-    "NikonCI_D800_CustomSettingsBank2": "nikon_d800_custom_settings_bank_2",
-    "NikonCI_D800_VRInfo": "nikon_d800_vr_info",
-    "NikonCI_D800_VRInfo2": "nikon_d800_vr_info_2",
-    "NikonCI_D800_FocusInfo": "nikon_d800_focus_info",
-    "NikonCI_D800_FocusInfo2": "nikon_d800_focus_info_2",
-    "NikonCI_D800_AFAreaPoint": "nikon_d800_af_area_point",
-    "NikonCI_D800_FocusMode": "nikon_d800_focus_mode",
-    "NikonCI_D800_AFPoint": "nikon_d800_af_point",
-    "NikonCI_D800_AFOnButton": "nikon_d800_af_on_button",
-    "NikonCI_D800_AFAreaMode": "nikon_d800_af_area_mode",
-    "NikonCI_D800_FocusPointWrap": "nikon_d800_focus_point_wrap",
-    "NikonCI_D800_AFFineTune": "nikon_d800_af_fine_tune",
-    "NikonCI_D800_AFActivation": "nikon_d800_af_activation",
-    "NikonCI_D800_VRMode": "nikon_d800_vr_mode",
-    "NikonCI_D800_ImageAuthentication": "nikon_d800_image_auth",
-    "NikonCI_D800_EmbeddingVersion": "nikon_d800_embedding_version",
-    "NikonCI_D800_CRC": "nikon_d800_crc",
-}
-
-NIKON_CAMERA_INFO_D810 = {
-    "NikonCI_D810_FirmwareVersion": "nikon_d810_firmware",
-    "NikonCI_D810_FirmwareVersion2": "nikon_d810_firmware_2",
-    "NikonCI_D810_CameraSerialNumber": "nikon_d810_serial",
-    "NikonCI_D810_CameraSerialNumber2": "nikon_d810_serial_2",
-    "NikonCI_D810_CardType": "nikon_d810_card_type",
-    "NikonCI_D810_ColorBalance1": "nikon_d810_color_balance_1",
-    "NikonCI_D810_ColorBalance2": "nikon_d810_color_balance_2",
-    "NikonCI_D810_ColorBalance3": "nikon_d810_color_balance_3",
-    "NikonCI_D810_ColorBalance4": "nikon_d810_color_balance_4",
-    "NikonCI_D810_ImageDataSize": "nikon_d810_image_data_size",
-    "NikonCI_D810_ImageCount": "nikon_d810_image_count",
-    "NikonCI_D810_DeletedImageCount": "nikon_d810_deleted_count",
-    "NikonCI_D810_ShutterCount": "nikon_d810_shutter_count",
-    "NikonCI_D810_FlashInfoVersion": "nikon_d810_flash_version",
-    "NikonCI_D810_FlashInfo": "nikon_d810_flash_info",
-    "NikonCI_D810_FlashInfo2": "nikon_d810_flash_info_2",
-    "NikonCI_D810_NRFFTag": "nikon_d810_nrff_tag",
-    "NikonCI_D810_CustomSettings": "nikon_d810_custom_settings",
-    "NikonCI_D810_CustomSettingsBank": "nikon_d810_custom_settings_bank",
-    "NikonCI_D810_CustomSettings2": "nikon_d810_custom_settings_2",
-    "NikonCI_D810_CustomSettingsBank2": "nikon_d810_custom_settings_bank_2",
-    "NikonCI_D810_VRInfo": "nikon_d810_vr_info",
-    "NikonCI_D810_VRInfo2": "nikon_d810_vr_info_2",
-    "NikonCI_D810_FocusInfo": "nikon_d810_focus_info",
-    "NikonCI_D810_FocusInfo2": "nikon_d810_focus_info_2",
-    "NikonCI_D810_AFAreaPoint": "nikon_d810_af_area_point",
-    "NikonCI_D810_FocusMode": "nikon_d810_focus_mode",
-    "NikonCI_D810_AFPoint": "nikon_d810_af_point",
-    "NikonCI_D810_AFOnButton": "nikon_d810_af_on_button",
-    "NikonCI_D810_AFAreaMode": "nikon_d810_af_area_mode",
-    "NikonCI_D810_FocusPointWrap": "nikon_d810_focus_point_wrap",
-    "NikonCI_D810_AFFineTune": "nikon_d810_af_fine_tune",
-    "NikonCI_D810_AFActivation": "nikon_d810_af_activation",
-    "NikonCI_D810_VRMode": "nikon_d810_vr_mode",
-    "NikonCI_D810_ImageAuthentication": "nikon_d810_image_auth",
-    "NikonCI_D810_EmbeddingVersion": "nikon_d810_embedding_version",
-    "NikonCI_D810_CRC": "nikon_d810_crc",
-}
-
-NIKON_CAMERA_INFO_D850 = {
-    "NikonCI_D850_FirmwareVersion": "nikon_d850_firmware",
-    "NikonCI_D850_FirmwareVersion2": "nikon_d850_firmware_2",
-    "NikonCI_D850_CameraSerialNumber": "nikon_d850_serial",
-    "NikonCI_D850_CameraSerialNumber2": "nikon_d850_serial_2",
-    "NikonCI_D850_CardType": "nikon_d850_card_type",
-    "NikonCI_D850_ColorBalance1": "nikon_d850_color_balance_1",
-    "NikonCI_D850_ColorBalance2": "nikon_d850_color_balance_2",
-    "NikonCI_D850_ColorBalance3": "nikon_d850_color_balance_3",
-    "NikonCI_D850_ColorBalance4": "nikon_d850_color_balance_4",
-    "NikonCI_D850_ImageDataSize": "nikon_d850_image_data_size",
-    "NikonCI_D850_ImageCount": "nikon_d850_image_count",
-    "NikonCI_D850_DeletedImageCount": "nikon_d850_deleted_count",
-    "NikonCI_D850_ShutterCount": "nikon_d850_shutter_count",
-    "NikonCI_D850_FlashInfoVersion": "nikon_d850_flash_version",
-    "NikonCI_D850_FlashInfo": "nikon_d850_flash_info",
-    "NikonCI_D850_FlashInfo2": "nikon_d850_flash_info_2",
-    "NikonCI_D850_FlashInfo3": "nikon_d850_flash_info_3",
-    "NikonCI_D850_NRFFTag": "nikon_d850_nrff_tag",
-    "NikonCI_D850_CustomSettings": "nikon_d850_custom_settings",
-    "NikonCI_D850_CustomSettingsBank": "nikon_d850_custom_settings_bank",
-    "NikonCI_D850_CustomSettings2": "nikon_d850_custom_settings_2",
-    "NikonCI_D850_CustomSettingsBank2": "nikon_d850_custom_settings_bank_2",
-    "NikonCI_D850_VRInfo": "nikon_d850_vr_info",
-    "NikonCI_D850_VRInfo2": "nikon_d850_vr_info_2",
-    "NikonCI_D850_FocusInfo": "nikon_d850_focus_info",
-    "NikonCI_D850_FocusInfo2": "nikon_d850_focus_info_2",
-    "NikonCI_D850_AFAreaPoint": "nikon_d850_af_area_point",
-    "NikonCI_D850_FocusMode": "nikon_d850_focus_mode",
-    "NikonCI_D850_AFPoint": "nikon_d850_af_point",
-    "NikonCI_D850_AFOnButton": "nikon_d850_af_on_button",
-    "NikonCI_D850_AFAreaMode": "nikon_d850_af_area_mode",
-    "NikonCI_D850_FocusPointWrap": "nikon_d850_focus_point_wrap",
-    "NikonCI_D850_AFFineTune": "nikon_d850_af_fine_tune",
-    "NikonCI_D850_AFActivation": "nikon_d850_af_activation",
-    "NikonCI_D850_VRMode": "nikon_d850_vr_mode",
-    "NikonCI_D850_ImageAuthentication": "nikon_d850_image_auth",
-    "NikonCI_D850_EmbeddingVersion": "nikon_d850_embedding_version",
-    "NikonCI_D850_CRC": "nikon_d850_crc",
-}
-
-NIKON_CAMERA_INFO_D300 = {
-    "NikonCI_D300_FirmwareVersion": "nikon_d300_firmware",
-    "NikonCI_D300_FirmwareVersion2": "nikon_d300_firmware_2",
-    "NikonCI_D300_CameraSerialNumber": "nikon_d300_serial",
-    "NikonCI_D300_CameraSerialNumber2": "nikon_d300_serial_2",
-    "NikonCI_D300_CardType": "nikon_d300_card_type",
-    "NikonCI_D300_ColorBalance1": "nikon_d300_color_balance_1",
-    "NikonCI_D300_ColorBalance2": "nikon_d300_color_balance_2",
-    "NikonCI_D300_ColorBalance3": "nikon_d300_color_balance_3",
-    "NikonCI_D300_ColorBalance4": "nikon_d300_color_balance_4",
-    "NikonCI_D300_ImageDataSize": "nikon_d300_image_data_size",
-    "NikonCI_D300_ImageCount": "nikon_d300_image_count",
-    "NikonCI_D300_DeletedImageCount": "nikon_d300_deleted_count",
-    "NikonCI_D300_ShutterCount": "nikon_d300_shutter_count",
-    "NikonCI_D300_FlashInfoVersion": "nikon_d300_flash_version",
-    "NikonCI_D300_FlashInfo": "nikon_d300_flash_info",
-    "NikonCI_D300_FlashInfo2": "nikon_d300_flash_info_2",
-    "NikonCI_D300_NRFFTag": "nikon_d300_nrff_tag",
-    "NikonCI_D300_CustomSettings": "nikon_d300_custom_settings",
-    "NikonCI_D300_CustomSettingsBank": "nikon_d300_custom_settings_bank",
-    "NikonCI_D300_CustomSettings2": "nikon_d300_custom_settings_2",
-    "NikonCI_D300_CustomSettingsBank2": "nikon_d300_custom_settings_bank_2",
-    "NikonCI_D300_VRInfo": "nikon_d300_vr_info",
-    "NikonCI_D300_VRInfo2": "nikon_d300_vr_info_2",
-    "NikonCI_D300_FocusInfo": "nikon_d300_focus_info",
-    "NikonCI_D300_FocusInfo2": "nikon_d300_focus_info_2",
-    "NikonCI_D300_AFAreaPoint": "nikon_d300_af_area_point",
-    "NikonCI_D300_FocusMode": "nikon_d300_focus_mode",
-    "NikonCI_D300_AFPoint": "nikon_d300_af_point",
-    "NikonCI_D300_AFOnButton": "nikon_d300_af_on_button",
-    "NikonCI_D300_AFAreaMode": "nikon_d300_af_area_mode",
-    "NikonCI_D300_FocusPointWrap": "nikon_d300_focus_point_wrap",
-    "NikonCI_D300_AFFineTune": "nikon_d300_af_fine_tune",
-    "NikonCI_D300_AFActivation": "nikon_d300_af_activation",
-    "NikonCI_D300_VRMode": "nikon_d300_vr_mode",
-    "NikonCI_D300_ImageAuthentication": "nikon_d300_image_auth",
-    "NikonCI_D300_EmbeddingVersion": "nikon_d300_embedding_version",
-    "NikonCI_D300_CRC": "nikon_d300_crc",
-}
-
-NIKON_CAMERA_INFO_D90 = {
-    "NikonCI_D90_FirmwareVersion": "nikon_d90_firmware",
-    "NikonCI_D90_FirmwareVersion2": "nikon_d90_firmware_2",
-    "NikonCI_D90_CameraSerialNumber": "nikon_d90_serial",
-    "NikonCI_D90_CameraSerialNumber2": "nikon_d90_serial_2",
-    "NikonCI_D90_CardType": "nikon_d90_card_type",
-    "NikonCI_D90_ColorBalance1": "nikon_d90_color_balance_1",
-    "NikonCI_D90_ColorBalance2": "nikon_d90_color_balance_2",
-    "NikonCI_D90_ColorBalance3": "nikon_d90_color_balance_3",
-    "NikonCI_D90_ColorBalance4": "nikon_d90_color_balance_4",
-    "NikonCI_D90_ImageDataSize": "nikon_d90_image_data_size",
-    "NikonCI_D90_ImageCount": "nikon_d90_image_count",
-    "NikonCI_D90_DeletedImageCount": "nikon_d90_deleted_count",
-    "NikonCI_D90_ShutterCount": "nikon_d90_shutter_count",
-    "NikonCI_D90_FlashInfoVersion": "nikon_d90_flash_version",
-    "NikonCI_D90_FlashInfo": "nikon_d90_flash_info",
-    "NikonCI_D90_FlashInfo2": "nikon_d90_flash_info_2",
-    "NikonCI_D90_NRFFTag": "nikon_d90_nrff_tag",
-    "NikonCI_D90_CustomSettings": "nikon_d90_custom_settings",
-    "NikonCI_D90_CustomSettingsBank": "nikon_d90_custom_settings_bank",
-    "NikonCI_D90_CustomSettings2": "nikon_d90_custom_settings_2",
-    "NikonCI_D90_CustomSettingsBank2": "nikon_d90_custom_settings_bank_2",
-    "NikonCI_D90_VRInfo": "nikon_d90_vr_info",
-    "NikonCI_D90_VRInfo2": "nikon_d90_vr_info_2",
-    "NikonCI_D90_FocusInfo": "nikon_d90_focus_info",
-    "NikonCI_D90_FocusInfo2": "nikon_d90_focus_info_2",
-    "NikonCI_D90_AFAreaPoint": "nikon_d90_af_area_point",
-    "NikonCI_D90_FocusMode": "nikon_d90_focus_mode",
-    "NikonCI_D90_AFPoint": "nikon_d90_af_point",
-    "NikonCI_D90_AFOnButton": "nikon_d90_af_on_button",
-    "NikonCI_D90_AFAreaMode": "nikon_d90_af_area_mode",
-    "NikonCI_D90_FocusPointWrap": "nikon_d90_focus_point_wrap",
-    "NikonCI_D90_AFFineTune": "nikon_d90_af_fine_tune",
-    "NikonCI_D90_AFActivation": "nikon_d90_af_activation",
-    "NikonCI_D90_VRMode": "nikon_d90_vr_mode",
-    "NikonCI_D90_ImageAuthentication": "nikon_d90_image_auth",
-    "NikonCI_D90_EmbeddingVersion": "nikon_d90_embedding_version",
-    "NikonCI_D90_CRC": "nikon_d90_crc",
-}
-
-NIKON_CAMERA_INFO_D60 = {
-    "NikonCI_D60_FirmwareVersion": "nikon_d60_firmware",
-    "NikonCI_D60_FirmwareVersion2": "nikon_d60_firmware_2",
-    "NikonCI_D60_CameraSerialNumber": "nikon_d60_serial",
-    "NikonCI_D60_CameraSerialNumber2": "nikon_d60_serial_2",
-    "NikonCI_D60_CardType": "nikon_d60_card_type",
-    "NikonCI_D60_ColorBalance1": "nikon_d60_color_balance_1",
-    "NikonCI_D60_ColorBalance2": "nikon_d60_color_balance_2",
-    "NikonCI_D60_ColorBalance3": "nikon_d60_color_balance_3",
-    "NikonCI_D60_ColorBalance4": "nikon_d60_color_balance_4",
-    "NikonCI_D60_ImageDataSize": "nikon_d60_image_data_size",
-    "NikonCI_D60_ImageCount": "nikon_d60_image_count",
-    "NikonCI_D60_DeletedImageCount": "nikon_d60_deleted_count",
-    "NikonCI_D60_ShutterCount": "nikon_d60_shutter_count",
-    "NikonCI_D60_FlashInfoVersion": "nikon_d60_flash_version",
-    "NikonCI_D60_FlashInfo": "nikon_d60_flash_info",
-    "NikonCI_D60_FlashInfo2": "nikon_d60_flash_info_2",
-    "NikonCI_D60_NRFFTag": "nikon_d60_nrff_tag",
-    "NikonCI_D60_CustomSettings": "nikon_d60_custom_settings",
-    "NikonCI_D60_CustomSettingsBank": "nikon_d60_custom_settings_bank",
-    "NikonCI_D60_CustomSettings2": "nikon_d60_custom_settings_2",
-    "NikonCI_D60_CustomSettingsBank2": "nikon_d60_custom_settings_bank_2",
-    "NikonCI_D60_VRInfo": "nikon_d60_vr_info",
-    "NikonCI_D60_VRInfo2": "nikon_d60_vr_info_2",
-    "NikonCI_D60_FocusInfo": "nikon_d60_focus_info",
-    "NikonCI_D60_FocusInfo2": "nikon_d60_focus_info_2",
-    "NikonCI_D60_AFAreaPoint": "nikon_d60_af_area_point",
-    "NikonCI_D60_FocusMode": "nikon_d60_focus_mode",
-    "NikonCI_D60_AFPoint": "nikon_d60_af_point",
-    "NikonCI_D60_AFOnButton": "nikon_d60_af_on_button",
-    "NikonCI_D60_AFAreaMode": "nikon_d60_af_area_mode",
-    "NikonCI_D60_FocusPointWrap": "nikon_d60_focus_point_wrap",
-    "NikonCI_D60_AFFineTune": "nikon_d60_af_fine_tune",
-    "NikonCI_D60_AFActivation": "nikon_d60_af_activation",
-    "NikonCI_D60_VRMode": "nikon_d60_vr_mode",
-    "NikonCI_D60_ImageAuthentication": "nikon_d60_image_auth",
-    "NikonCI_D60_EmbeddingVersion": "nikon_d60_embedding_version",
-    "NikonCI_D60_CRC": "nikon_d60_crc",
-}
-
-NIKON_CAMERA_INFO_D40 = {
-    "NikonCI_D40_FirmwareVersion": "nikon_d40_firmware",
-    "NikonCI_D40_FirmwareVersion2": "nikon_d40_firmware_2",
-    "NikonCI_D40_CameraSerialNumber": "nikon_d40_serial",
-    "NikonCI_D40_CameraSerialNumber2": "nikon_d40_serial_2",
-    "NikonCI_D40_CardType": "nikon_d40_card_type",
-    "NikonCI_D40_ColorBalance1": "nikon_d40_color_balance_1",
-    "NikonCI_D40_ColorBalance2": "nikon_d40_color_balance_2",
-    "NikonCI_D40_ColorBalance3": "nikon_d40_color_balance_3",
-    "NikonCI_D40_ColorBalance4": "nikon_d40_color_balance_4",
-    "NikonCI_D40_ImageDataSize": "nikon_d40_image_data_size",
-    "NikonCI_D40_ImageCount": "nikon_d40_image_count",
-    "NikonCI_D40_DeletedImageCount": "nikon_d40_deleted_count",
-    "NikonCI_D40_ShutterCount": "nikon_d40_shutter_count",
-    "NikonCI_D40_FlashInfoVersion": "nikon_d40_flash_version",
-    "NikonCI_D40_FlashInfo": "nikon_d40_flash_info",
-    "NikonCI_D40_FlashInfo2": "nikon_d40_flash_info_2",
-    "NikonCI_D40_NRFFTag": "nikon_d40_nrff_tag",
-    "NikonCI_D40_CustomSettings": "nikon_d40_custom_settings",
-    "NikonCI_D40_CustomSettingsBank": "nikon_d40_custom_settings_bank",
-    "NikonCI_D40_CustomSettings2": "nikon_d40_custom_settings_2",
-    "NikonCI_D40_CustomSettingsBank2": "nikon_d40_custom_settings_bank_2",
-    "NikonCI_D40_VRInfo": "nikon_d40_vr_info",
-    "NikonCI_D40_VRInfo2": "nikon_d40_vr_info_2",
-    "NikonCI_D40_FocusInfo": "nikon_d40_focus_info",
-    "NikonCI_D40_FocusInfo2": "nikon_d40_focus_info_2",
-    "NikonCI_D40_AFAreaPoint": "nikon_d40_af_area_point",
-    "NikonCI_D40_FocusMode": "nikon_d40_focus_mode",
-    "NikonCI_D40_AFPoint": "nikon_d40_af_point",
-    "NikonCI_D40_AFOnButton": "nikon_d40_af_on_button",
-    "NikonCI_D40_AFAreaMode": "nikon_d40_af_area_mode",
-    "NikonCI_D40_FocusPointWrap": "nikon_d40_focus_point_wrap",
-    "NikonCI_D40_AFFineTune": "nikon_d40_af_fine_tune",
-    "NikonCI_D40_AFActivation": "nikon_d40_af_activation",
-    "NikonCI_D40_VRMode": "nikon_d40_vr_mode",
-    "NikonCI_D40_ImageAuthentication": "nikon_d40_image_auth",
-    "NikonCI_D40_EmbeddingVersion": "nikon_d40_embedding_version",
-    "NikonCI_D40_CRC": "nikon_d40_crc",
-}
-
-NIKON_CAMERA_INFO_Z6 = {
-    "NikonCI_Z6_FirmwareVersion": "nikon_z6_firmware",
-    "NikonCI_Z6_FirmwareVersion2": "nikon_z6_firmware_2",
-    "NikonCI_Z6_CameraSerialNumber": "nikon_z6_serial",
-    "NikonCI_Z6_CameraSerialNumber2": "nikon_z6_serial_2",
-    "NikonCI_Z6_CardType": "nikon_z6_card_type",
-    "NikonCI_Z6_ColorBalance1": "nikon_z6_color_balance_1",
-    "NikonCI_Z6_ColorBalance2": "nikon_z6_color_balance_2",
-    "NikonCI_Z6_ColorBalance3": "nikon_z6_color_balance_3",
-    "NikonCI_Z6_ColorBalance4": "nikon_z6_color_balance_4",
-    "NikonCI_Z6_ImageDataSize": "nikon_z6_image_data_size",
-    "NikonCI_Z6_ImageCount": "nikon_z6_image_count",
-    "NikonCI_Z6_DeletedImageCount": "nikon_z6_deleted_count",
-    "NikonCI_Z6_ShutterCount": "nikon_z6_shutter_count",
-    "NikonCI_Z6_FlashInfoVersion": "nikon_z6_flash_version",
-    "NikonCI_Z6_FlashInfo": "nikon_z6_flash_info",
-    "NikonCI_Z6_FlashInfo2": "nikon_z6_flash_info_2",
-    "NikonCI_Z6_NRFFTag": "nikon_z6_nrff_tag",
-    "NikonCI_Z6_CustomSettings": "nikon_z6_custom_settings",
-    "NikonCI_Z6_CustomSettingsBank": "nikon_z6_custom_settings_bank",
-    "NikonCI_Z6_CustomSettings2": "nikon_z6_custom_settings_2",
-    "NikonCI_Z6_CustomSettingsBank2": "nikon_z6_custom_settings_bank_2",
-    "NikonCI_Z6_VRInfo": "nikon_z6_vr_info",
-    "NikonCI_Z6_VRInfo2": "nikon_z6_vr_info_2",
-    "NikonCI_Z6_FocusInfo": "nikon_z6_focus_info",
-    "NikonCI_Z6_FocusInfo2": "nikon_z6_focus_info_2",
-    "NikonCI_Z6_AFAreaPoint": "nikon_z6_af_area_point",
-    "NikonCI_Z6_FocusMode": "nikon_z6_focus_mode",
-    "NikonCI_Z6_AFPoint": "nikon_z6_af_point",
-    "NikonCI_Z6_AFOnButton": "nikon_z6_af_on_button",
-    "NikonCI_Z6_AFAreaMode": "nikon_z6_af_area_mode",
-    "NikonCI_Z6_FocusPointWrap": "nikon_z6_focus_point_wrap",
-    "NikonCI_Z6_AFFineTune": "nikon_z6_af_fine_tune",
-    "NikonCI_Z6_AFActivation": "nikon_z6_af_activation",
-    "NikonCI_Z6_VRMode": "nikon_z6_vr_mode",
-    "NikonCI_Z6_ImageAuthentication": "nikon_z6_image_auth",
-    "NikonCI_Z6_EmbeddingVersion": "nikon_z6_embedding_version",
-    "NikonCI_Z6_CRC": "nikon_z6_crc",
-}
-
-NIKON_CAMERA_INFO_Z7 = {
-    "NikonCI_Z7_FirmwareVersion": "nikon_z7_firmware",
-    "NikonCI_Z7_FirmwareVersion2": "nikon_z7_firmware_2",
-    "NikonCI_Z7_CameraSerialNumber": "nikon_z7_serial",
-    "NikonCI_Z7_CameraSerialNumber2": "nikon_z7_serial_2",
-    "NikonCI_Z7_CardType": "nikon_z7_card_type",
-    "NikonCI_Z7_ColorBalance1": "nikon_z7_color_balance_1",
-    "NikonCI_Z7_ColorBalance2": "nikon_z7_color_balance_2",
-    "NikonCI_Z7_ColorBalance3": "nikon_z7_color_balance_3",
-    "NikonCI_Z7_ColorBalance4": "nikon_z7_color_balance_4",
-    "NikonCI_Z7_ImageDataSize": "nikon_z7_image_data_size",
-    "NikonCI_Z7_ImageCount": "nikon_z7_image_count",
-    "NikonCI_Z7_DeletedImageCount": "nikon_z7_deleted_count",
-    "NikonCI_Z7_ShutterCount": "nikon_z7_shutter_count",
-    "NikonCI_Z7_FlashInfoVersion": "nikon_z7_flash_version",
-    "NikonCI_Z7_FlashInfo": "nikon_z7_flash_info",
-    "NikonCI_Z7_FlashInfo2": "nikon_z7_flash_info_2",
-    "NikonCI_Z7_NRFFTag": "nikon_z7_nrff_tag",
-    "NikonCI_Z7_CustomSettings": "nikon_z7_custom_settings",
-    "NikonCI_Z7_CustomSettingsBank": "nikon_z7_custom_settings_bank",
-    "NikonCI_Z7_CustomSettings2": "nikon_z7_custom_settings_2",
-    "NikonCI_Z7_CustomSettingsBank2": "nikon_z7_custom_settings_bank_2",
-    "NikonCI_Z7_VRInfo": "nikon_z7_vr_info",
-    "NikonCI_Z7_VRInfo2": "nikon_z7_vr_info_2",
-    "NikonCI_Z7_FocusInfo": "nikon_z7_focus_info",
-    "NikonCI_Z7_FocusInfo2": "nikon_z7_focus_info_2",
-    "NikonCI_Z7_AFAreaPoint": "nikon_z7_af_area_point",
-    "NikonCI_Z7_FocusMode": "nikon_z7_focus_mode",
-    "NikonCI_Z7_AFPoint": "nikon_z7_af_point",
-    "NikonCI_Z7_AFOnButton": "nikon_z7_af_on_button",
-    "NikonCI_Z7_AFAreaMode": "nikon_z7_af_area_mode",
-    "NikonCI_Z7_FocusPointWrap": "nikon_z7_focus_point_wrap",
-    "NikonCI_Z7_AFFineTune": "nikon_z7_af_fine_tune",
-    "NikonCI_Z7_AFActivation": "nikon_z7_af_activation",
-    "NikonCI_Z7_VRMode": "nikon_z7_vr_mode",
-    "NikonCI_Z7_ImageAuthentication": "nikon_z7_image_auth",
-    "NikonCI_Z7_EmbeddingVersion": "nikon_z7_embedding_version",
-    "NikonCI_Z7_CRC": "nikon_z7_crc",
-}
-
-NIKON_CAMERA_INFO_Z9 = {
-    "NikonCI_Z9_FirmwareVersion": "nikon_z9_firmware",
-    "NikonCI_Z9_FirmwareVersion2": "nikon_z9_firmware_2",
-    "NikonCI_Z9_CameraSerialNumber": "nikon_z9_serial",
-    "NikonCI_Z9_CameraSerialNumber2": "nikon_z9_serial_2",
-    "NikonCI_Z9_CardType": "nikon_z9_card_type",
-    "NikonCI_Z9_ColorBalance1": "nikon_z9_color_balance_1",
-    "NikonCI_Z9_ColorBalance2": "nikon_z9_color_balance_2",
-    "NikonCI_Z9_ColorBalance3": "nikon_z9_color_balance_3",
-    "NikonCI_Z9_ColorBalance4": "nikon_z9_color_balance_4",
-    "NikonCI_Z9_ImageDataSize": "nikon_z9_image_data_size",
-    "NikonCI_Z9_ImageCount": "nikon_z9_image_count",
-    "NikonCI_Z9_DeletedImageCount": "nikon_z9_deleted_count",
-    "NikonCI_Z9_ShutterCount": "nikon_z9_shutter_count",
-    "NikonCI_Z9_FlashInfoVersion": "nikon_z9_flash_version",
-    "NikonCI_Z9_FlashInfo": "nikon_z9_flash_info",
-    "NikonCI_Z9_FlashInfo2": "nikon_z9_flash_info_2",
-    "NikonCI_Z9_NRFFTag": "nikon_z9_nrff_tag",
-    "NikonCI_Z9_CustomSettings": "nikon_z9_custom_settings",
-    "NikonCI_Z9_CustomSettingsBank": "nikon_z9_custom_settings_bank",
-    "NikonCI_Z9_CustomSettings2": "nikon_z9_custom_settings_2",
-    "NikonCI_Z9_CustomSettingsBank2": "nikon_z9_custom_settings_bank_2",
-    "NikonCI_Z9_VRInfo": "nikon_z9_vr_info",
-    "NikonCI_Z9_VRInfo2": "nikon_z9_vr_info_2",
-    "NikonCI_Z9_FocusInfo": "nikon_z9_focus_info",
-    "NikonCI_Z9_FocusInfo2": "nikon_z9_focus_info_2",
-    "NikonCI_Z9_AFAreaPoint": "nikon_z9_af_area_point",
-    "NikonCI_Z9_FocusMode": "nikon_z9_focus_mode",
-    "NikonCI_Z9_AFPoint": "nikon_z9_af_point",
-    "NikonCI_Z9_AFOnButton": "nikon_z9_af_on_button",
-    "NikonCI_Z9_AFAreaMode": "nikon_z9_af_area_mode",
-    "NikonCI_Z9_FocusPointWrap": "nikon_z9_focus_point_wrap",
-    "NikonCI_Z9_AFFineTune": "nikon_z9_af_fine_tune",
-    "NikonCI_Z9_AFActivation": "nikon_z9_af_activation",
-    "NikonCI_Z9_VRMode": "nikon_z9_vr_mode",
-    "NikonCI_Z9_ImageAuthentication": "nikon_z9_image_auth",
-    "NikonCI_Z9_EmbeddingVersion": "nikon_z9_embedding_version",
-    "NikonCI_Z9_CRC": "nikon_z9_crc",
-}
-
-NIKON_FILE_INFO = {
-    "NikonFI_ImageNumber": "nikon_image_number",
-    "NikonFI_FocusDistance": "nikon_focus_distance",
-    "NikonFI_SubIFD": "nikon_sub_ifd",
-}
-
-NIKON_MAKERNOTE_VERSION = {
-    "NikonVer_MakerNoteVersion": "nikon_makernote_version",
-    "NikonVer_MakerNoteVersion2": "nikon_makernote_version_2",
-    "NikonVer_MakerNoteVersion3": "nikon_makernote_version_3",
-    "NikonVer_MakerNoteVersion4": "nikon_makernote_version_4",
-}
-
-NIKON_TAGS = {
-    **NIKON_ISO_INFO,
-    **NIKON_SHOT_INFO,
-    **NIKON_COLOR_BALANCE,
-    **NIKON_LENS_DATA,
-    **NIKON_FLASH_INFO,
-    **NIKON_AF_INFO,
-    **NIKON_PICTURE_CONTROL,
-    **NIKON_CAMERA_INFO_D1,
-    **NIKON_CAMERA_INFO_D2,
-    **NIKON_CAMERA_INFO_D3,
-    **NIKON_CAMERA_INFO_D4,
-    **NIKON_CAMERA_INFO_D5,
-    **NIKON_CAMERA_INFO_D500,
-    **NIKON_CAMERA_INFO_D600,
-    **NIKON_CAMERA_INFO_D700,
-    **NIKON_CAMERA_INFO_D800,
-    **NIKON_CAMERA_INFO_D810,
-    **NIKON_CAMERA_INFO_D850,
-    **NIKON_CAMERA_INFO_D300,
-    **NIKON_CAMERA_INFO_D90,
-    **NIKON_CAMERA_INFO_D60,
-    **NIKON_CAMERA_INFO_D40,
-    **NIKON_CAMERA_INFO_Z6,
-    **NIKON_CAMERA_INFO_Z7,
-    **NIKON_CAMERA_INFO_Z9,
-    **NIKON_FILE_INFO,
-    **NIKON_MAKERNOTE_VERSION,
-}
-SONY_FILE_INFO = {
-    "SonyShutterCount": "sony_shutter_count",
-    "SonyInternalSerialNumber": "sony_internal_serial_number",
-    "SonyLensSerialNumber": "sony_lens_serial_number",
-    "SonyBodySerialNumber": "sony_body_serial_number",
-    "SonyFirmwareVersion": "sony_firmware_version",
-    "SonyExposureCompensation2": "sony_exposure_compensation_2",
-    "SonyDateTime": "sony_date_time",
-    "SonyImageNumber": "sony_image_number",
-    "SonyImageSequence": "sony_image_sequence",
-    "SonyQuality2": "sony_quality_2",
-    "SonyQuality3": "sony_quality_3",
-    "SonyImageWidth": "sony_image_width",
-    "SonyImageHeight": "sony_image_height",
-    "SonyImageSize": "sony_image_size",
-    "SonyFileFormat": "sony_file_format",
-    "SonyRawFormat": "sony_raw_format",
-    "SonyRating": "sony_rating",
-    "SonyColorMode": "sony_color_mode_2",
-    "SonyFullPanoramaShootingData": "sony_pano_data",
-    "SonyMultiBurstImageWidth": "sony_multiburst_width",
-    "SonyMultiBurstImageHeight": "sony_multiburst_height",
-    "SonyMultiBurstMode": "sony_multiburst_mode",
-    "SonyPanorama3DData": "sony_pano_3d_data",
-    "SonyMeteringMode2": "sony_metering_mode_2",
-    "SonyExposureMode2": "sony_exposure_mode_2",
-    "SonyWhiteBalance2": "sony_white_balance_2",
-    "SonyFocusMode2": "sony_focus_mode_2",
-}
-
-SONY_CAMERA_INFO_A7 = {
-    "SonyCI_A7_FirmwareVersion": "sony_a7_firmware",
-    "SonyCI_A7_InternalSerialNumber": "sony_a7_internal_serial",
-    "SonyCI_A7_FocusInfo": "sony_a7_focus_info",
-    "SonyCI_A7_FocusInfo2": "sony_a7_focus_info_2",
-    "SonyCI_A7_FaceDetection": "sony_a7_face_detection",
-    "SonyCI_A7_CameraSettings": "sony_a7_camera_settings",
-    "SonyCI_A7_LensSpecification": "sony_a7_lens_spec",
-    "SonyCI_A7_LensSerialNumber": "sony_a7_lens_serial",
-    "SonyCI_A7_LensModel": "sony_a7_lens_model",
-    "SonyCI_A7_LensID": "sony_a7_lens_id",
-    "SonyCI_A7_ImageDataSize": "sony_a7_image_data_size",
-    "SonyCI_A7_ImageCount": "sony_a7_image_count",
-    "SonyCI_A7_DeletedImageCount": "sony_a7_deleted_count",
-    "SonyCI_A7_ShutterCount": "sony_a7_shutter_count",
-    "SonyCI_A7_CardType": "sony_a7_card_type",
-    "SonyCI_A7_CustomSettings": "sony_a7_custom_settings",
-    "SonyCI_A7_ColorCorrection": "sony_a7_color_correction",
-    "SonyCI_A7_WBInfo": "sony_a7_wb_info",
-    "SonyCI_A7_FlashInfo": "sony_a7_flash_info",
-    "SonyCI_A7_ViewingMode": "sony_a7_viewing_mode",
-    "SonyCI_A7_DisplayColorSpace": "sony_a7_display_color_space",
-    "SonyCI_A7_Vignetting": "sony_a7_vignetting",
-    "SonyCI_A7_Vignetting2": "sony_a7_vignetting_2",
-    "SonyCI_A7_LensCharacteristics": "sony_a7_lens_chars",
-    "SonyCI_A7_FocusSystem": "sony_a7_focus_system",
-}
-
-SONY_CAMERA_INFO_A7R = {
-    "SonyCI_A7R_FirmwareVersion": "sony_a7r_firmware",
-    "SonyCI_A7R_InternalSerialNumber": "sony_a7r_internal_serial",
-    "SonyCI_A7R_FocusInfo": "sony_a7r_focus_info",
-    "SonyCI_A7R_FocusInfo2": "sony_a7r_focus_info_2",
-    "SonyCI_A7R_FaceDetection": "sony_a7r_face_detection",
-    "SonyCI_A7R_CameraSettings": "sony_a7r_camera_settings",
-    "SonyCI_A7R_LensSpecification": "sony_a7r_lens_spec",
-    "SonyCI_A7R_LensSerialNumber": "sony_a7r_lens_serial",
-    "SonyCI_A7R_LensModel": "sony_a7r_lens_model",
-    "SonyCI_A7R_LensID": "sony_a7r_lens_id",
-    "SonyCI_A7R_ImageDataSize": "sony_a7r_image_data_size",
-    "SonyCI_A7R_ImageCount": "sony_a7r_image_count",
-    "SonyCI_A7R_DeletedImageCount": "sony_a7r_deleted_count",
-    "SonyCI_A7R_ShutterCount": "sony_a7r_shutter_count",
-    "SonyCI_A7R_CardType": "sony_a7r_card_type",
-    "SonyCI_A7R_CustomSettings": "sony_a7r_custom_settings",
-    "SonyCI_A7R_ColorCorrection": "sony_a7r_color_correction",
-    "SonyCI_A7R_WBInfo": "sony_a7r_wb_info",
-    "SonyCI_A7R_FlashInfo": "sony_a7r_flash_info",
-    "SonyCI_A7R_ViewingMode": "sony_a7r_viewing_mode",
-    "SonyCI_A7R_DisplayColorSpace": "sony_a7r_display_color_space",
-    "SonyCI_A7R_Vignetting": "sony_a7r_vignetting",
-    "SonyCI_A7R_Vignetting2": "sony_a7r_vignetting_2",
-    "SonyCI_A7R_LensCharacteristics": "sony_a7r_lens_chars",
-    "SonyCI_A7R_FocusSystem": "sony_a7r_focus_system",
-}
-
-SONY_CAMERA_INFO_A7S = {
-    "SonyCI_A7S_FirmwareVersion": "sony_a7s_firmware",
-    "SonyCI_A7S_InternalSerialNumber": "sony_a7s_internal_serial",
-    "SonyCI_A7S_FocusInfo": "sony_a7s_focus_info",
-    "SonyCI_A7S_FocusInfo2": "sony_a7s_focus_info_2",
-    "SonyCI_A7S_FaceDetection": "sony_a7s_face_detection",
-    "SonyCI_A7S_CameraSettings": "sony_a7s_camera_settings",
-    "SonyCI_A7S_LensSpecification": "sony_a7s_lens_spec",
-    "SonyCI_A7S_LensSerialNumber": "sony_a7s_lens_serial",
-    "SonyCI_A7S_LensModel": "sony_a7s_lens_model",
-    "SonyCI_A7S_LensID": "sony_a7s_lens_id",
-    "SonyCI_A7S_ImageDataSize": "sony_a7s_image_data_size",
-    "SonyCI_A7S_ImageCount": "sony_a7s_image_count",
-    "SonyCI_A7S_DeletedImageCount": "sony_a7s_deleted_count",
-    "SonyCI_A7S_ShutterCount": "sony_a7s_shutter_count",
-    "SonyCI_A7S_CardType": "sony_a7s_card_type",
-    "SonyCI_A7S_CustomSettings": "sony_a7s_custom_settings",
-    "SonyCI_A7S_ColorCorrection": "sony_a7s_color_correction",
-    "SonyCI_A7S_WBInfo": "sony_a7s_wb_info",
-    "SonyCI_A7S_FlashInfo": "sony_a7s_flash_info",
-    "SonyCI_A7S_ViewingMode": "sony_a7s_viewing_mode",
-    "SonyCI_A7S_DisplayColorSpace": "sony_a7s_display_color_space",
-    "SonyCI_A7S_Vignetting": "sony_a7s_vignetting",
-    "SonyCI_A7S_Vignetting2": "sony_a7s_vignetting_2",
-    "SonyCI_A7S_LensCharacteristics": "sony_a7s_lens_chars",
-    "SonyCI_A7S_FocusSystem": "sony_a7s_focus_system",
-}
-
-SONY_CAMERA_INFO_A9 = {
-    "SonyCI_A9_FirmwareVersion": "sony_a9_firmware",
-    "SonyCI_A9_InternalSerialNumber": "sony_a9_internal_serial",
-    "SonyCI_A9_FocusInfo": "sony_a9_focus_info",
-    "SonyCI_A9_FocusInfo2": "sony_a9_focus_info_2",
-    "SonyCI_A9_FaceDetection": "sony_a9_face_detection",
-    "SonyCI_A9_CameraSettings": "sony_a9_camera_settings",
-    "SonyCI_A9_LensSpecification": "sony_a9_lens_spec",
-    "SonyCI_A9_LensSerialNumber": "sony_a9_lens_serial",
-    "SonyCI_A9_LensModel": "sony_a9_lens_model",
-    "SonyCI_A9_LensID": "sony_a9_lens_id",
-    "SonyCI_A9_ImageDataSize": "sony_a9_image_data_size",
-    "SonyCI_A9_ImageCount": "sony_a9_image_count",
-    "SonyCI_A9_DeletedImageCount": "sony_a9_deleted_count",
-    "SonyCI_A9_ShutterCount": "sony_a9_shutter_count",
-    "SonyCI_A9_CardType": "sony_a9_card_type",
-    "SonyCI_A9_CustomSettings": "sony_a9_custom_settings",
-    "SonyCI_A9_ColorCorrection": "sony_a9_color_correction",
-    "SonyCI_A9_WBInfo": "sony_a9_wb_info",
-    "SonyCI_A9_FlashInfo": "sony_a9_flash_info",
-    "SonyCI_A9_ViewingMode": "sony_a9_viewing_mode",
-    "SonyCI_A9_DisplayColorSpace": "sony_a9_display_color_space",
-    "SonyCI_A9_Vignetting": "sony_a9_vignetting",
-    "SonyCI_A9_Vignetting2": "sony_a9_vignetting_2",
-    "SonyCI_A9_LensCharacteristics": "sony_a9_lens_chars",
-    "SonyCI_A9_FocusSystem": "sony_a9_focus_system",
-}
-
-SONY_CAMERA_INFO_A99 = {
-    "SonyCI_A99_FirmwareVersion": "sony_a99_firmware",
-    "SonyCI_A99_InternalSerialNumber": "sony_a99_internal_serial",
-    "SonyCI_A99_FocusInfo": "sony_a99_focus_info",
-    "SonyCI_A99_FocusInfo2": "sony_a99_focus_info_2",
-    "SonyCI_A99_FaceDetection": "sony_a99_face_detection",
-    "SonyCI_A99_CameraSettings": "sony_a99_camera_settings",
-    "SonyCI_A99_LensSpecification": "sony_a99_lens_spec",
-    "SonyCI_A99_LensSerialNumber": "sony_a99_lens_serial",
-    "SonyCI_A99_LensModel": "sony_a99_lens_model",
-    "SonyCI_A99_LensID": "sony_a99_lens_id",
-    "SonyCI_A99_ImageDataSize": "sony_a99_image_data_size",
-    "SonyCI_A99_ImageCount": "sony_a99_image_count",
-    "SonyCI_A99_DeletedImageCount": "sony_a99_deleted_count",
-    "SonyCI_A99_ShutterCount": "sony_a99_shutter_count",
-    "SonyCI_A99_CardType": "sony_a99_card_type",
-    "SonyCI_A99_CustomSettings": "sony_a99_custom_settings",
-    "SonyCI_A99_ColorCorrection": "sony_a99_color_correction",
-    "SonyCI_A99_WBInfo": "sony_a99_wb_info",
-    "SonyCI_A99_FlashInfo": "sony_a99_flash_info",
-    "SonyCI_A99_ViewingMode": "sony_a99_viewing_mode",
-    "SonyCI_A99_DisplayColorSpace": "sony_a99_display_color_space",
-    "SonyCI_A99_Vignetting": "sony_a99_vignetting",
-    "SonyCI_A99_Vignetting2": "sony_a99_vignetting_2",
-    "SonyCI_A99_LensCharacteristics": "sony_a99_lens_chars",
-    "SonyCI_A99_FocusSystem": "sony_a99_focus_system",
-}
-
-SONY_CAMERA_INFO_A58 = {
-    "SonyCI_A58_FirmwareVersion": "sony_a58_firmware",
-    "SonyCI_A58_InternalSerialNumber": "sony_a58_internal_serial",
-    "SonyCI_A58_FocusInfo": "sony_a58_focus_info",
-    "SonyCI_A58_FocusInfo2": "sony_a58_focus_info_2",
-    "SonyCI_A58_FaceDetection": "sony_a58_face_detection",
-    "SonyCI_A58_CameraSettings": "sony_a58_camera_settings",
-    "SonyCI_A58_LensSpecification": "sony_a58_lens_spec",
-    "SonyCI_A58_LensSerialNumber": "sony_a58_lens_serial",
-    "SonyCI_A58_LensModel": "sony_a58_lens_model",
-    "SonyCI_A58_LensID": "sony_a58_lens_id",
-    "SonyCI_A58_ImageDataSize": "sony_a58_image_data_size",
-    "SonyCI_A58_ImageCount": "sony_a58_image_count",
-    "SonyCI_A58_DeletedImageCount": "sony_a58_deleted_count",
-    "SonyCI_A58_ShutterCount": "sony_a58_shutter_count",
-    "SonyCI_A58_CardType": "sony_a58_card_type",
-    "SonyCI_A58_CustomSettings": "sony_a58_custom_settings",
-    "SonyCI_A58_ColorCorrection": "sony_a58_color_correction",
-    "SonyCI_A58_WBInfo": "sony_a58_wb_info",
-    "SonyCI_A58_FlashInfo": "sony_a58_flash_info",
-    "SonyCI_A58_ViewingMode": "sony_a58_viewing_mode",
-    "SonyCI_A58_DisplayColorSpace": "sony_a58_display_color_space",
-    "SonyCI_A58_Vignetting": "sony_a58_vignetting",
-    "SonyCI_A58_Vignetting2": "sony_a58_vignetting_2",
-    "SonyCI_A58_LensCharacteristics": "sony_a58_lens_chars",
-    "SonyCI_A58_FocusSystem": "sony_a58_focus_system",
-}
-
-SONY_CAMERA_INFO_A68 = {
-    "SonyCI_A68_FirmwareVersion": "sony_a68_firmware",
-    "SonyCI_A68_InternalSerialNumber": "sony_a68_internal_serial",
-    "SonyCI_A68_FocusInfo": "sony_a68_focus_info",
-    "SonyCI_A68_FocusInfo2": "sony_a68_focus_info_2",
-    "SonyCI_A68_FaceDetection": "sony_a68_face_detection",
-    "SonyCI_A68_CameraSettings": "sony_a68_camera_settings",
-    "SonyCI_A68_LensSpecification": "sony_a68_lens_spec",
-    "SonyCI_A68_LensSerialNumber": "sony_a68_lens_serial",
-    "SonyCI_A68_LensModel": "sony_a68_lens_model",
-    "SonyCI_A68_LensID": "sony_a68_lens_id",
-    "SonyCI_A68_ImageDataSize": "sony_a68_image_data_size",
-    "SonyCI_A68_ImageCount": "sony_a68_image_count",
-    "SonyCI_A68_DeletedImageCount": "sony_a68_deleted_count",
-    "SonyCI_A68_ShutterCount": "sony_a68_shutter_count",
-    "SonyCI_A68_CardType": "sony_a68_card_type",
-    "SonyCI_A68_CustomSettings": "sony_a68_custom_settings",
-    "SonyCI_A68_ColorCorrection": "sony_a68_color_correction",
-    "SonyCI_A68_WBInfo": "sony_a68_wb_info",
-    "SonyCI_A68_FlashInfo": "sony_a68_flash_info",
-    "SonyCI_A68_ViewingMode": "sony_a68_viewing_mode",
-    "SonyCI_A68_DisplayColorSpace": "sony_a68_display_color_space",
-    "SonyCI_A68_Vignetting": "sony_a68_vignetting",
-    "SonyCI_A68_Vignetting2": "sony_a68_vignetting_2",
-    "SonyCI_A68_LensCharacteristics": "sony_a68_lens_chars",
-    "SonyCI_A68_FocusSystem": "sony_a68_focus_system",
-}
-
-SONY_CAMERA_INFO_A77 = {
-    "SonyCI_A77_FirmwareVersion": "sony_a77_firmware",
-    "SonyCI_A77_InternalSerialNumber": "sony_a77_internal_serial",
-    "SonyCI_A77_FocusInfo": "sony_a77_focus_info",
-    "SonyCI_A77_FocusInfo2": "sony_a77_focus_info_2",
-    "SonyCI_A77_FaceDetection": "sony_a77_face_detection",
-    "SonyCI_A77_CameraSettings": "sony_a77_camera_settings",
-    "SonyCI_A77_LensSpecification": "sony_a77_lens_spec",
-    "SonyCI_A77_LensSerialNumber": "sony_a77_lens_serial",
-    "SonyCI_A77_LensModel": "sony_a77_lens_model",
-    "SonyCI_A77_LensID": "sony_a77_lens_id",
-    "SonyCI_A77_ImageDataSize": "sony_a77_image_data_size",
-    "SonyCI_A77_ImageCount": "sony_a77_image_count",
-    "SonyCI_A77_DeletedImageCount": "sony_a77_deleted_count",
-    "SonyCI_A77_ShutterCount": "sony_a77_shutter_count",
-    "SonyCI_A77_CardType": "sony_a77_card_type",
-    "SonyCI_A77_CustomSettings": "sony_a77_custom_settings",
-    "SonyCI_A77_ColorCorrection": "sony_a77_color_correction",
-    "SonyCI_A77_WBInfo": "sony_a77_wb_info",
-    "SonyCI_A77_FlashInfo": "sony_a77_flash_info",
-    "SonyCI_A77_ViewingMode": "sony_a77_viewing_mode",
-    "SonyCI_A77_DisplayColorSpace": "sony_a77_display_color_space",
-    "SonyCI_A77_Vignetting": "sony_a77_vignetting",
-    "SonyCI_A77_Vignetting2": "sony_a77_vignetting_2",
-    "SonyCI_A77_LensCharacteristics": "sony_a77_lens_chars",
-    "SonyCI_A77_FocusSystem": "sony_a77_focus_system",
-}
-
-SONY_CAMERA_INFO_A99II = {
-    "SonyCI_A99II_FirmwareVersion": "sony_a99ii_firmware",
-    "SonyCI_A99II_InternalSerialNumber": "sony_a99ii_internal_serial",
-    "SonyCI_A99II_FocusInfo": "sony_a99ii_focus_info",
-    "SonyCI_A99II_FocusInfo2": "sony_a99ii_focus_info_2",
-    "SonyCI_A99II_FaceDetection": "sony_a99ii_face_detection",
-    "SonyCI_A99II_CameraSettings": "sony_a99ii_camera_settings",
-    "SonyCI_A99II_LensSpecification": "sony_a99ii_lens_spec",
-    "SonyCI_A99II_LensSerialNumber": "sony_a99ii_lens_serial",
-    "SonyCI_A99II_LensModel": "sony_a99ii_lens_model",
-    "SonyCI_A99II_LensID": "sony_a99ii_lens_id",
-    "SonyCI_A99II_ImageDataSize": "sony_a99ii_image_data_size",
-    "SonyCI_A99II_ImageCount": "sony_a99ii_image_count",
-    "SonyCI_A99II_DeletedImageCount": "sony_a99ii_deleted_count",
-    "SonyCI_A99II_ShutterCount": "sony_a99ii_shutter_count",
-    "SonyCI_A99II_CardType": "sony_a99ii_card_type",
-    "SonyCI_A99II_CustomSettings": "sony_a99ii_custom_settings",
-    "SonyCI_A99II_ColorCorrection": "sony_a99ii_color_correction",
-    "SonyCI_A99II_WBInfo": "sony_a99ii_wb_info",
-    "SonyCI_A99II_FlashInfo": "sony_a99ii_flash_info",
-    "SonyCI_A99II_ViewingMode": "sony_a99ii_viewing_mode",
-    "SonyCI_A99II_DisplayColorSpace": "sony_a99ii_display_color_space",
-    "SonyCI_A99II_Vignetting": "sony_a99ii_vignetting",
-    "SonyCI_A99II_Vignetting2": "sony_a99ii_vignetting_2",
-    "SonyCI_A99II_LensCharacteristics": "sony_a99ii_lens_chars",
-    "SonyCI_A99II_FocusSystem": "sony_a99ii_focus_system",
-}
-
-SONY_CAMERA_INFO_A7R2 = {
-    "SonyCI_A7R2_FirmwareVersion": "sony_a7r2_firmware",
-    "SonyCI_A7R2_InternalSerialNumber": "sony_a7r2_internal_serial",
-    "SonyCI_A7R2_FocusInfo": "sony_a7r2_focus_info",
-    "SonyCI_A7R2_FocusInfo2": "sony_a7r2_focus_info_2",
-    "SonyCI_A7R2_FocusInfo3": "sony_a7r2_focus_info_3",
-    "SonyCI_A7R2_FaceDetection": "sony_a7r2_face_detection",
-    "SonyCI_A7R2_CameraSettings": "sony_a7r2_camera_settings",
-    "SonyCI_A7R2_LensSpecification": "sony_a7r2_lens_spec",
-    "SonyCI_A7R2_LensSerialNumber": "sony_a7r2_lens_serial",
-    "SonyCI_A7R2_LensModel": "sony_a7r2_lens_model",
-    "SonyCI_A7R2_LensID": "sony_a7r2_lens_id",
-    "SonyCI_A7R2_ImageDataSize": "sony_a7r2_image_data_size",
-    "SonyCI_A7R2_ImageCount": "sony_a7r2_image_count",
-    "SonyCI_A7R2_DeletedImageCount": "sony_a7r2_deleted_count",
-    "SonyCI_A7R2_ShutterCount": "sony_a7r2_shutter_count",
-    "SonyCI_A7R2_CardType": "sony_a7r2_card_type",
-    "SonyCI_A7R2_CustomSettings": "sony_a7r2_custom_settings",
-    "SonyCI_A7R2_ColorCorrection": "sony_a7r2_color_correction",
-    "SonyCI_A7R2_WBInfo": "sony_a7r2_wb_info",
-    "SonyCI_A7R2_FlashInfo": "sony_a7r2_flash_info",
-    "SonyCI_A7R2_ViewingMode": "sony_a7r2_viewing_mode",
-    "SonyCI_A7R2_DisplayColorSpace": "sony_a7r2_display_color_space",
-    "SonyCI_A7R2_Vignetting": "sony_a7r2_vignetting",
-    "SonyCI_A7R2_Vignetting2": "sony_a7r2_vignetting_2",
-    "SonyCI_A7R2_LensCharacteristics": "sony_a7r2_lens_chars",
-    "SonyCI_A7R2_FocusSystem": "sony_a7r2_focus_system",
-}
-
-SONY_CAMERA_INFO_A7R3 = {
-    "SonyCI_A7R3_FirmwareVersion": "sony_a7r3_firmware",
-    "SonyCI_A7R3_InternalSerialNumber": "sony_a7r3_internal_serial",
-    "SonyCI_A7R3_FocusInfo": "sony_a7r3_focus_info",
-    "SonyCI_A7R3_FocusInfo2": "sony_a7r3_focus_info_2",
-    "SonyCI_A7R3_FocusInfo3": "sony_a7r3_focus_info_3",
-    "SonyCI_A7R3_FaceDetection": "sony_a7r3_face_detection",
-    "SonyCI_A7R3_CameraSettings": "sony_a7r3_camera_settings",
-    "SonyCI_A7R3_LensSpecification": "sony_a7r3_lens_spec",
-    "SonyCI_A7R3_LensSerialNumber": "sony_a7r3_lens_serial",
-    "SonyCI_A7R3_LensModel": "sony_a7r3_lens_model",
-    "SonyCI_A7R3_LensID": "sony_a7r3_lens_id",
-    "SonyCI_A7R3_ImageDataSize": "sony_a7r3_image_data_size",
-    "SonyCI_A7R3_ImageCount": "sony_a7r3_image_count",
-    "SonyCI_A7R3_DeletedImageCount": "sony_a7r3_deleted_count",
-    "SonyCI_A7R3_ShutterCount": "sony_a7r3_shutter_count",
-    "SonyCI_A7R3_CardType": "sony_a7r3_card_type",
-    "SonyCI_A7R3_CustomSettings": "sony_a7r3_custom_settings",
-    "SonyCI_A7R3_ColorCorrection": "sony_a7r3_color_correction",
-    "SonyCI_A7R3_WBInfo": "sony_a7r3_wb_info",
-    "SonyCI_A7R3_FlashInfo": "sony_a7r3_flash_info",
-    "SonyCI_A7R3_ViewingMode": "sony_a7r3_viewing_mode",
-    "SonyCI_A7R3_DisplayColorSpace": "sony_a7r3_display_color_space",
-    "SonyCI_A7R3_Vignetting": "sony_a7r3_vignetting",
-    "SonyCI_A7R3_Vignetting2": "sony_a7r3_vignetting_2",
-    "SonyCI_A7R3_LensCharacteristics": "sony_a7r3_lens_chars",
-    "SonyCI_A7R3_FocusSystem": "sony_a7r3_focus_system",
-}
-
-SONY_CAMERA_INFO_A7R4 = {
-    "SonyCI_A7R4_FirmwareVersion": "sony_a7r4_firmware",
-    "SonyCI_A7R4_InternalSerialNumber": "sony_a7r4_internal_serial",
-    "SonyCI_A7R4_FocusInfo": "sony_a7r4_focus_info",
-    "SonyCI_A7R4_FocusInfo2": "sony_a7r4_focus_info_2",
-    "SonyCI_A7R4_FocusInfo3": "sony_a7r4_focus_info_3",
-    "SonyCI_A7R4_FaceDetection": "sony_a7r4_face_detection",
-    "SonyCI_A7R4_CameraSettings": "sony_a7r4_camera_settings",
-    "SonyCI_A7R4_LensSpecification": "sony_a7r4_lens_spec",
-    "SonyCI_A7R4_LensSerialNumber": "sony_a7r4_lens_serial",
-    "SonyCI_A7R4_LensModel": "sony_a7r4_lens_model",
-    "SonyCI_A7R4_LensID": "sony_a7r4_lens_id",
-    "SonyCI_A7R4_ImageDataSize": "sony_a7r4_image_data_size",
-    "SonyCI_A7R4_ImageCount": "sony_a7r4_image_count",
-    "SonyCI_A7R4_DeletedImageCount": "sony_a7r4_deleted_count",
-    "SonyCI_A7R4_ShutterCount": "sony_a7r4_shutter_count",
-    "SonyCI_A7R4_CardType": "sony_a7r4_card_type",
-    "SonyCI_A7R4_CustomSettings": "sony_a7r4_custom_settings",
-    "SonyCI_A7R4_ColorCorrection": "sony_a7r4_color_correction",
-    "SonyCI_A7R4_WBInfo": "sony_a7r4_wb_info",
-    "SonyCI_A7R4_FlashInfo": "sony_a7r4_flash_info",
-    "SonyCI_A7R4_ViewingMode": "sony_a7r4_viewing_mode",
-    "SonyCI_A7R4_DisplayColorSpace": "sony_a7r4_display_color_space",
-    "SonyCI_A7R4_Vignetting": "sony_a7r4_vignetting",
-    "SonyCI_A7R4_Vignetting2": "sony_a7r4_vignetting_2",
-    "SonyCI_A7R4_LensCharacteristics": "sony_a7r4_lens_chars",
-    "SonyCI_A7R4_FocusSystem": "sony_a7r4_focus_system",
-}
-
-SONY_CAMERA_INFO_A7M3 = {
-    "SonyCI_A7M3_FirmwareVersion": "sony_a7m3_firmware",
-    "SonyCI_A7M3_InternalSerialNumber": "sony_a7m3_internal_serial",
-    "SonyCI_A7M3_FocusInfo": "sony_a7m3_focus_info",
-    "SonyCI_A7M3_FocusInfo2": "sony_a7m3_focus_info_2",
-    "SonyCI_A7M3_FocusInfo3": "sony_a7m3_focus_info_3",
-    "SonyCI_A7M3_FaceDetection": "sony_a7m3_face_detection",
-    "SonyCI_A7M3_CameraSettings": "sony_a7m3_camera_settings",
-    "SonyCI_A7M3_LensSpecification": "sony_a7m3_lens_spec",
-    "SonyCI_A7M3_LensSerialNumber": "sony_a7m3_lens_serial",
-    "SonyCI_A7M3_LensModel": "sony_a7m3_lens_model",
-    "SonyCI_A7M3_LensID": "sony_a7m3_lens_id",
-    "SonyCI_A7M3_ImageDataSize": "sony_a7m3_image_data_size",
-    "SonyCI_A7M3_ImageCount": "sony_a7m3_image_count",
-    "SonyCI_A7M3_DeletedImageCount": "sony_a7m3_deleted_count",
-    "SonyCI_A7M3_ShutterCount": "sony_a7m3_shutter_count",
-    "SonyCI_A7M3_CardType": "sony_a7m3_card_type",
-    "SonyCI_A7M3_CustomSettings": "sony_a7m3_custom_settings",
-    "SonyCI_A7M3_ColorCorrection": "sony_a7m3_color_correction",
-    "SonyCI_A7M3_WBInfo": "sony_a7m3_wb_info",
-    "SonyCI_A7M3_FlashInfo": "sony_a7m3_flash_info",
-    "SonyCI_A7M3_ViewingMode": "sony_a7m3_viewing_mode",
-    "SonyCI_A7M3_DisplayColorSpace": "sony_a7m3_display_color_space",
-    "SonyCI_A7M3_Vignetting": "sony_a7m3_vignetting",
-    "SonyCI_A7M3_Vignetting2": "sony_a7m3_vignetting_2",
-    "SonyCI_A7M3_LensCharacteristics": "sony_a7m3_lens_chars",
-    "SonyCI_A7M3_FocusSystem": "sony_a7m3_focus_system",
-}
-
-SONY_CAMERA_INFO_A7M4 = {
-    "SonyCI_A7M4_FirmwareVersion": "sony_a7m4_firmware",
-    "SonyCI_A7M4_InternalSerialNumber": "sony_a7m4_internal_serial",
-    "SonyCI_A7M4_FocusInfo": "sony_a7m4_focus_info",
-    "SonyCI_A7M4_FocusInfo2": "sony_a7m4_focus_info_2",
-    "SonyCI_A7M4_FocusInfo3": "sony_a7m4_focus_info_3",
-    "SonyCI_A7M4_FaceDetection": "sony_a7m4_face_detection",
-    "SonyCI_A7M4_CameraSettings": "sony_a7m4_camera_settings",
-    "SonyCI_A7M4_LensSpecification": "sony_a7m4_lens_spec",
-    "SonyCI_A7M4_LensSerialNumber": "sony_a7m4_lens_serial",
-    "SonyCI_A7M4_LensModel": "sony_a7m4_lens_model",
-    "SonyCI_A7M4_LensID": "sony_a7m4_lens_id",
-    "SonyCI_A7M4_ImageDataSize": "sony_a7m4_image_data_size",
-    "SonyCI_A7M4_ImageCount": "sony_a7m4_image_count",
-    "SonyCI_A7M4_DeletedImageCount": "sony_a7m4_deleted_count",
-    "SonyCI_A7M4_ShutterCount": "sony_a7m4_shutter_count",
-    "SonyCI_A7M4_CardType": "sony_a7m4_card_type",
-    "SonyCI_A7M4_CustomSettings": "sony_a7m4_custom_settings",
-    "SonyCI_A7M4_ColorCorrection": "sony_a7m4_color_correction",
-    "SonyCI_A7M4_WBInfo": "sony_a7m4_wb_info",
-    "SonyCI_A7M4_FlashInfo": "sony_a7m4_flash_info",
-    "SonyCI_A7M4_ViewingMode": "sony_a7m4_viewing_mode",
-    "SonyCI_A7M4_DisplayColorSpace": "sony_a7m4_display_color_space",
-    "SonyCI_A7M4_Vignetting": "sony_a7m4_vignetting",
-    "SonyCI_A7M4_Vignetting2": "sony_a7m4_vignetting_2",
-    "SonyCI_A7M4_LensCharacteristics": "sony_a7m4_lens_chars",
-    "SonyCI_A7M4_FocusSystem": "sony_a7m4_focus_system",
-}
-
-SONY_CAMERA_INFO_A1 = {
-    "SonyCI_A1_FirmwareVersion": "sony_a1_firmware",
-    "SonyCI_A1_InternalSerialNumber": "sony_a1_internal_serial",
-    "SonyCI_A1_FocusInfo": "sony_a1_focus_info",
-    "SonyCI_A1_FocusInfo2": "sony_a1_focus_info_2",
-    "SonyCI_A1_FocusInfo3": "sony_a1_focus_info_3",
-    "SonyCI_A1_FaceDetection": "sony_a1_face_detection",
-    "SonyCI_A1_CameraSettings": "sony_a1_camera_settings",
-    "SonyCI_A1_LensSpecification": "sony_a1_lens_spec",
-    "SonyCI_A1_LensSerialNumber": "sony_a1_lens_serial",
-    "SonyCI_A1_LensModel": "sony_a1_lens_model",
-    "SonyCI_A1_LensID": "sony_a1_lens_id",
-    "SonyCI_A1_ImageDataSize": "sony_a1_image_data_size",
-    "SonyCI_A1_ImageCount": "sony_a1_image_count",
-    "SonyCI_A1_DeletedImageCount": "sony_a1_deleted_count",
-    "SonyCI_A1_ShutterCount": "sony_a1_shutter_count",
-    "SonyCI_A1_CardType": "sony_a1_card_type",
-    "SonyCI_A1_CustomSettings": "sony_a1_custom_settings",
-    "SonyCI_A1_ColorCorrection": "sony_a1_color_correction",
-    "SonyCI_A1_WBInfo": "sony_a1_wb_info",
-    "SonyCI_A1_FlashInfo": "sony_a1_flash_info",
-    "SonyCI_A1_ViewingMode": "sony_a1_viewing_mode",
-    "SonyCI_A1_DisplayColorSpace": "sony_a1_display_color_space",
-    "SonyCI_A1_Vignetting": "sony_a1_vignetting",
-    "SonyCI_A1_Vignetting2": "sony_a1_vignetting_2",
-    "SonyCI_A1_LensCharacteristics": "sony_a1_lens_chars",
-    "SonyCI_A1_FocusSystem": "sony_a1_focus_system",
-}
-
-SONY_CAMERA_INFO_ZV1 = {
-    "SonyCI_ZV1_FirmwareVersion": "sony_zv1_firmware",
-    "SonyCI_ZV1_InternalSerialNumber": "sony_zv1_internal_serial",
-    "SonyCI_ZV1_FocusInfo": "sony_zv1_focus_info",
-    "SonyCI_ZV1_FocusInfo2": "sony_zv1_focus_info_2",
-    "SonyCI_ZV1_FaceDetection": "sony_zv1_face_detection",
-    "SonyCI_ZV1_CameraSettings": "sony_zv1_camera_settings",
-    "SonyCI_ZV1_LensSpecification": "sony_zv1_lens_spec",
-    "SonyCI_ZV1_LensSerialNumber": "sony_zv1_lens_serial",
-    "SonyCI_ZV1_LensModel": "sony_zv1_lens_model",
-    "SonyCI_ZV1_LensID": "sony_zv1_lens_id",
-    "SonyCI_ZV1_ImageDataSize": "sony_zv1_image_data_size",
-    "SonyCI_ZV1_ImageCount": "sony_zv1_image_count",
-    "SonyCI_ZV1_DeletedImageCount": "sony_zv1_deleted_count",
-    "SonyCI_ZV1_ShutterCount": "sony_zv1_shutter_count",
-    "SonyCI_ZV1_CardType": "sony_zv1_card_type",
-    "SonyCI_ZV1_CustomSettings": "sony_zv1_custom_settings",
-    "SonyCI_ZV1_ColorCorrection": "sony_zv1_color_correction",
-    "SonyCI_ZV1_WBInfo": "sony_zv1_wb_info",
-    "SonyCI_ZV1_FlashInfo": "sony_zv1_flash_info",
-    "SonyCI_ZV1_ViewingMode": "sony_zv1_viewing_mode",
-    "SonyCI_ZV1_DisplayColorSpace": "sony_zv1_display_color_space",
-    "SonyCI_ZV1_Vignetting": "sony_zv1_vignetting",
-    "SonyCI_ZV1_Vignetting2": "sony_zv1_vignetting_2",
-    "SonyCI_ZV1_LensCharacteristics": "sony_zv1_lens_chars",
-    "SonyCI_ZV1_FocusSystem": "sony_zv1_focus_system",
-}
-
-SONY_CAMERA_INFO_ZV_E10 = {
-    "SonyCI_ZVE10_FirmwareVersion": "sony_zve10_firmware",
-    "SonyCI_ZVE10_InternalSerialNumber": "sony_zve10_internal_serial",
-    "SonyCI_ZVE10_FocusInfo": "sony_zve10_focus_info",
-    "SonyCI_ZVE10_FocusInfo2": "sony_zve10_focus_info_2",
-    "SonyCI_ZVE10_FaceDetection": "sony_zve10_face_detection",
-    "SonyCI_ZVE10_CameraSettings": "sony_zve10_camera_settings",
-    "SonyCI_ZVE10_LensSpecification": "sony_zve10_lens_spec",
-    "SonyCI_ZVE10_LensSerialNumber": "sony_zve10_lens_serial",
-    "SonyCI_ZVE10_LensModel": "sony_zve10_lens_model",
-    "SonyCI_ZVE10_LensID": "sony_zve10_lens_id",
-    "SonyCI_ZVE10_ImageDataSize": "sony_zve10_image_data_size",
-    "SonyCI_ZVE10_ImageCount": "sony_zve10_image_count",
-    "SonyCI_ZVE10_DeletedImageCount": "sony_zve10_deleted_count",
-    "SonyCI_ZVE10_ShutterCount": "sony_zve10_shutter_count",
-    "SonyCI_ZVE10_CardType": "sony_zve10_card_type",
-    "SonyCI_ZVE10_CustomSettings": "sony_zve10_custom_settings",
-    "SonyCI_ZVE10_ColorCorrection": "sony_zve10_color_correction",
-    "SonyCI_ZVE10_WBInfo": "sony_zve10_wb_info",
-    "SonyCI_ZVE10_FlashInfo": "sony_zve10_flash_info",
-    "SonyCI_ZVE10_ViewingMode": "sony_zve10_viewing_mode",
-    "SonyCI_ZVE10_DisplayColorSpace": "sony_zve10_display_color_space",
-    "SonyCI_ZVE10_Vignetting": "sony_zve10_vignetting",
-    "SonyCI_ZVE10_Vignetting2": "sony_zve10_vignetting_2",
-    "SonyCI_ZVE10_LensCharacteristics": "sony_zve10_lens_chars",
-    "SonyCI_ZVE10_FocusSystem": "sony_zve10_focus_system",
-}
-
-SONY_CAMERA_INFO_RX100 = {
-    "SonyCI_RX100_FirmwareVersion": "sony_rx100_firmware",
-    "SonyCI_RX100_InternalSerialNumber": "sony_rx100_internal_serial",
-    "SonyCI_RX100_FocusInfo": "sony_rx100_focus_info",
-    "SonyCI_RX100_FocusInfo2": "sony_rx100_focus_info_2",
-    "SonyCI_RX100_FaceDetection": "sony_rx100_face_detection",
-    "SonyCI_RX100_CameraSettings": "sony_rx100_camera_settings",
-    "SonyCI_RX100_LensSpecification": "sony_rx100_lens_spec",
-    "SonyCI_RX100_LensSerialNumber": "sony_rx100_lens_serial",
-    "SonyCI_RX100_LensModel": "sony_rx100_lens_model",
-    "SonyCI_RX100_LensID": "sony_rx100_lens_id",
-    "SonyCI_RX100_ImageDataSize": "sony_rx100_image_data_size",
-    "SonyCI_RX100_ImageCount": "sony_rx100_image_count",
-    "SonyCI_RX100_DeletedImageCount": "sony_rx100_deleted_count",
-    "SonyCI_RX100_ShutterCount": "sony_rx100_shutter_count",
-    "SonyCI_RX100_CardType": "sony_rx100_card_type",
-    "SonyCI_RX100_CustomSettings": "sony_rx100_custom_settings",
-    "SonyCI_RX100_ColorCorrection": "sony_rx100_color_correction",
-    "SonyCI_RX100_WBInfo": "sony_rx100_wb_info",
-    "SonyCI_RX100_FlashInfo": "sony_rx100_flash_info",
-    "SonyCI_RX100_ViewingMode": "sony_rx100_viewing_mode",
-    "SonyCI_RX100_DisplayColorSpace": "sony_rx100_display_color_space",
-    "SonyCI_RX100_Vignetting": "sony_rx100_vignetting",
-    "SonyCI_RX100_Vignetting2": "sony_rx100_vignetting_2",
-    "SonyCI_RX100_LensCharacteristics": "sony_rx100_lens_chars",
-    "SonyCI_RX100_FocusSystem": "sony_rx100_focus_system",
-}
-
-SONY_CAMERA_INFO_RX10 = {
-    "SonyCI_RX10_FirmwareVersion": "sony_rx10_firmware",
-    "SonyCI_RX10_InternalSerialNumber": "sony_rx10_internal_serial",
-    "SonyCI_RX10_FocusInfo": "sony_rx10_focus_info",
-    "SonyCI_RX10_FocusInfo2": "sony_rx10_focus_info_2",
-    "SonyCI_RX10_FaceDetection": "sony_rx10_face_detection",
-    "SonyCI_RX10_CameraSettings": "sony_rx10_camera_settings",
-    "SonyCI_RX10_LensSpecification": "sony_rx10_lens_spec",
-    "SonyCI_RX10_LensSerialNumber": "sony_rx10_lens_serial",
-    "SonyCI_RX10_LensModel": "sony_rx10_lens_model",
-    "SonyCI_RX10_LensID": "sony_rx10_lens_id",
-    "SonyCI_RX10_ImageDataSize": "sony_rx10_image_data_size",
-    "SonyCI_RX10_ImageCount": "sony_rx10_image_count",
-    "SonyCI_RX10_DeletedImageCount": "sony_rx10_deleted_count",
-    "SonyCI_RX10_ShutterCount": "sony_rx10_shutter_count",
-    "SonyCI_RX10_CardType": "sony_rx10_card_type",
-    "SonyCI_RX10_CustomSettings": "sony_rx10_custom_settings",
-    "SonyCI_RX10_ColorCorrection": "sony_rx10_color_correction",
-    "SonyCI_RX10_WBInfo": "sony_rx10_wb_info",
-    "SonyCI_RX10_FlashInfo": "sony_rx10_flash_info",
-    "SonyCI_RX10_ViewingMode": "sony_rx10_viewing_mode",
-    "SonyCI_RX10_DisplayColorSpace": "sony_rx10_display_color_space",
-    "SonyCI_RX10_Vignetting": "sony_rx10_vignetting",
-    "SonyCI_RX10_Vignetting2": "sony_rx10_vignetting_2",
-    "SonyCI_RX10_LensCharacteristics": "sony_rx10_lens_chars",
-    "SonyCI_RX10_FocusSystem": "sony_rx10_focus_system",
-}
-
-SONY_CAMERA_INFO_RX1 = {
-    "SonyCI_RX1_FirmwareVersion": "sony_rx1_firmware",
-    "SonyCI_RX1_InternalSerialNumber": "sony_rx1_internal_serial",
-    "SonyCI_RX1_FocusInfo": "sony_rx1_focus_info",
-    "SonyCI_RX1_FocusInfo2": "sony_rx1_focus_info_2",
-    "SonyCI_RX1_FaceDetection": "sony_rx1_face_detection",
-    "SonyCI_RX1_CameraSettings": "sony_rx1_camera_settings",
-    "SonyCI_RX1_LensSpecification": "sony_rx1_lens_spec",
-    "SonyCI_RX1_LensSerialNumber": "sony_rx1_lens_serial",
-    "SonyCI_RX1_LensModel": "sony_rx1_lens_model",
-    "SonyCI_RX1_LensID": "sony_rx1_lens_id",
-    "SonyCI_RX1_ImageDataSize": "sony_rx1_image_data_size",
-    "SonyCI_RX1_ImageCount": "sony_rx1_image_count",
-    "SonyCI_RX1_DeletedImageCount": "sony_rx1_deleted_count",
-    "SonyCI_RX1_ShutterCount": "sony_rx1_shutter_count",
-    "SonyCI_RX1_CardType": "sony_rx1_card_type",
-    "SonyCI_RX1_CustomSettings": "sony_rx1_custom_settings",
-    "SonyCI_RX1_ColorCorrection": "sony_rx1_color_correction",
-    "SonyCI_RX1_WBInfo": "sony_rx1_wb_info",
-    "SonyCI_RX1_FlashInfo": "sony_rx1_flash_info",
-    "SonyCI_RX1_ViewingMode": "sony_rx1_viewing_mode",
-    "SonyCI_RX1_DisplayColorSpace": "sony_rx1_display_color_space",
-    "SonyCI_RX1_Vignetting": "sony_rx1_vignetting",
-    "SonyCI_RX1_Vignetting2": "sony_rx1_vignetting_2",
-    "SonyCI_RX1_LensCharacteristics": "sony_rx1_lens_chars",
-    "SonyCI_RX1_FocusSystem": "sony_rx1_focus_system",
-}
-
-SONY_TAGS = {
-    **SONY_CAMERA_SETTINGS,
-    **SONY_AF_INFO,
-    **SONY_FILE_INFO,
-    **SONY_CAMERA_INFO_A7,
-    **SONY_CAMERA_INFO_A7R,
-    **SONY_CAMERA_INFO_A7S,
-    **SONY_CAMERA_INFO_A9,
-    **SONY_CAMERA_INFO_A99,
-    **SONY_CAMERA_INFO_A58,
-    **SONY_CAMERA_INFO_A68,
-    **SONY_CAMERA_INFO_A77,
-    **SONY_CAMERA_INFO_A99II,
-    **SONY_CAMERA_INFO_A7R2,
-    **SONY_CAMERA_INFO_A7R3,
-    **SONY_CAMERA_INFO_A7R4,
-    **SONY_CAMERA_INFO_A7M3,
-    **SONY_CAMERA_INFO_A7M4,
-    **SONY_CAMERA_INFO_A1,
-    **SONY_CAMERA_INFO_ZV1,
-    **SONY_CAMERA_INFO_ZV_E10,
-    **SONY_CAMERA_INFO_RX100,
-    **SONY_CAMERA_INFO_RX10,
-    **SONY_CAMERA_INFO_RX1,
-}
-FUJIFILM_TAGS = {**FUJIFILM_CAMERA_SETTINGS, **FUJIFILM_LENS_INFO, **FUJIFILM_FILM_SIMULATION, **FUJIFILM_RAW_DEVELOPMENT, **FUJIFILM_FACE_INFO, **FUJIFILM_VIDEO_INFO, **FUJIFILM_GFX_INFO}
-OLYMPUS_TAGS = {**OLYMPUS_EQUIPMENT, **OLYMPUS_CAMERA_SETTINGS, **OLYMPUS_IMAGE_PROCESSING, **OLYMPUS_FOCUS_INFO, **OLYMPUS_RAW_DEVELOPMENT, **OLYMPUS_RAW_INFO}
-PANASONIC_TAGS = {**PANASONIC_CAMERA_SETTINGS, **PANASONIC_VIDEO_INFO, **PANASONIC_FOCUS_INFO, **PANASONIC_S_SERIES, **PANASONIC_GH_SERIES}
-PENTAX_TAGS = {**PENTAX_CAMERA_SETTINGS, **PENTAX_LENS_DATA, **PENTAX_AF_INFO, **PENTAX_AE_INFO, **PENTAX_FLASH_INFO, **PENTAX_COLOR_INFO}
-
-LEICA_EQUIPMENT = {
-    "LeicaEquipment_CameraType": "leica_camera_type",
-    "LeicaEquipment_CameraSerialNumber": "leica_camera_serial",
-    "LeicaEquipment_InternalSerialNumber": "leica_internal_serial",
-    "LeicaEquipment_ComponentNumber": "leica_component_number",
-    "LeicaEquipment_FirmwareVersion": "leica_firmware",
-    "LeicaEquipment_LensType": "leica_lens_type",
-    "LeicaEquipment_LensSerialNumber": "leica_lens_serial",
-    "LeicaEquipment_LensModel": "leica_lens_model",
-    "LeicaEquipment_LensFirmwareVersion": "leica_lens_firmware",
-    "LeicaEquipment_Magnification": "leica_magnification",
-    "LeicaEquipment_FocusMode": "leica_focus_mode",
-    "LeicaEquipment_FocusDistance": "leica_focus_distance",
-    "LeicaEquipment_MeteringMode": "leica_metering_mode",
-    "LeicaEquipment_ExposureMode": "leica_exposure_mode",
-    "LeicaExposureCompensation": "leica_exposure_comp",
-    "LeicaWhiteBalance": "leica_white_balance",
-    "LeicaWhiteBalanceCompensation": "leica_wb_compensation",
-    "LeicaColorTemperature": "leica_color_temp",
-    "LeicaISO": "leica_iso",
-    "LeicaISOMode": "leica_iso_mode",
-    "LeicaExposureTime": "leica_exposure_time",
-    "LeicaAperture": "leica_aperture",
-    "LeicaFocalLength": "leica_focal_length",
-    "LeicaFocalLength35mm": "leica_focal_35mm",
-    "LeicaFlashMode": "leica_flash_mode",
-    "LeicaFlashCompensation": "leica_flash_comp",
-    "LeicaDriveMode": "leica_drive_mode",
-    "LeicaSensorType": "leica_sensor_type",
-    "LeicaSensorFormat": "leica_sensor_format",
-    "LeicaSensorResolution": "leica_sensor_resolution",
-    "LeicaSensorTemperature": "leica_sensor_temp",
-    "LeicaExternalSensorTemperature": "leica_ext_sensor_temp",
-    "LeicaConfiguration": "leica_configuration",
-    "LeicaBatteryLevel": "leica_battery_level",
-    "LeicaBatteryVoltage1": "leica_battery_voltage_1",
-    "LeicaBatteryVoltage2": "leica_battery_voltage_2",
-    "LeicaSensorCleaning": "leica_sensor_cleaning",
-    "LeicaProfile": "leica_profile",
-    "LeicaPictureStyle": "leica_picture_style",
-    "LeicaSharpness": "leica_sharpness",
-    "LeicaContrast": "leica_contrast",
-    "LeicaSaturation": "leica_saturation",
-    "LeicaNoiseReduction": "leica_noise_reduction",
-    "LeicaVignetting": "leica_vignetting",
-    "LeicaDistortion": "leica_distortion",
-    "LeicaChromaticAberration": "leica_chromatic_ab",
-    "LeicaDynamicRangeOptimizer": "leica_dro",
-    "LeicaHighISONoiseReduction": "leica_high_iso_nr",
-    "LeicaLongExposureNoiseReduction": "leica_long_exp_nr",
-    "LeicaGPS": "leica_gps",
-    "LeicaGPSLatitude": "leica_gps_lat",
-    "LeicaGPSLongitude": "leica_gps_lon",
-    "LeicaGPSAltitude": "leica_gps_alt",
-    "LeicaGPSTime": "leica_gps_time",
-    "LeicaGPSDate": "leica_gps_date",
-    "LeicaImageNumber": "leica_image_number",
-    "LeicaShutterCount": "leica_shutter_count",
-    "LeicaMechanicalShutterCount": "leica_mech_shutter_count",
-    "LeicaElectronicShutterCount": "leica_elec_shutter_count",
-    "LeicaOwnerName": "leica_owner_name",
-    "LeicaArtist": "leica_artist",
-    "LeicaCopyright": "leica_copyright",
-    "LeicaRawDevVersion": "leica_raw_dev_version",
-    "LeicaRawDevEngineProfile": "leica_raw_dev_engine_profile",
-    "LeicaRawDevMultiPart": "leica_raw_dev_multi_part",
-}
-
-LEICA_LENS_INFO = {
-    "LeicaLens_SerialNumber": "leica_lens_serial",
-    "LeicaLens_Model": "leica_lens_model",
-    "LeicaLens_manufacturer": "leica_lens_manufacturer",
-    "LeicaLens_FirmwareVersion": "leica_lens_firmware",
-    "LeicaLens_Aperture": "leica_lens_aperture",
-    "LeicaLens_MinFocalLength": "leica_lens_min_focal",
-    "LeicaLens_MaxFocalLength": "leica_lens_max_focal",
-    "LeicaLens_FocalLengthRange": "leica_lens_focal_range",
-    "LeicaLens_Magnification": "leica_lens_mag",
-    "LeicaLens_Mount": "leica_lens_mount",
-    "LeicaLens_FilterThread": "leica_lens_filter_thread",
-    "LeicaLens_Hood": "leica_lens_hood",
-    "LeicaLens_Weight": "leica_lens_weight",
-    "LeicaLens_Length": "leica_lens_length",
-    "LeicaLens_Diameter": "leica_lens_diameter",
-}
-
-LEICA_MAKE_INFO = {
-    "LeicaCameraModel": "leica_camera_model",
-    "LeicaCameraVersion": "leica_camera_version",
-    "LeicaSoftware": "leica_software",
-    "LeicaProcessingSoftware": "leica_processing_software",
-    "LeicaImageStabilization": "leica_image_stab",
-    "LeicaDepthOfField": "leica_dof",
-    "LeicaAFIllumination": "leica_af_illumination",
-    "LeicaFlashRange": "leica_flash_range",
-    "LeicaFlashType": "leica_flash_type",
-    "LeicaRedEyeReduction": "leica_red_eye",
-    "LeicaHDR": "leica_hdr",
-    "LeicaHDRMode": "leica_hdr_mode",
-    "LeicaMultiExposure": "leica_multi_exp",
-    "LeicaPanoramaMode": "leica_panorama",
-    "LeicaTimeLapse": "leica_time_lapse",
-    "LeicaAutoBracket": "leica_auto_bracket",
-    "LeicaExposureBracket": "leica_exp_bracket",
-    "LeicaWBBracket": "leica_wb_bracket",
-    "LeicaFocusBracket": "leica_focus_bracket",
-}
-
-SIGMA_EQUIPMENT = {
-    "SigmaCameraType": "sigma_camera_type",
-    "SigmaSerialNumber": "sigma_serial",
-    "SigmaShutterCount": "sigma_shutter_count",
-    "SigmaFirmwareVersion": "sigma_firmware",
-    "SigmaLensType": "sigma_lens_type",
-    "SigmaLensSerialNumber": "sigma_lens_serial",
-    "SigmaLensModel": "sigma_lens_model",
-    "SigmaLensFirmwareVersion": "sigma_lens_firmware",
-    "SigmaLensMount": "sigma_lens_mount",
-    "SigmaFocalLength": "sigma_focal_length",
-    "SigmaAperture": "sigma_aperture",
-    "SigmaExposureMode": "sigma_exposure_mode",
-    "SigmaMeteringMode": "sigma_metering_mode",
-    "SigmaExposureCompensation": "sigma_exposure_comp",
-    "SigmaISO": "sigma_iso",
-    "SigmaISOAperture": "sigma_iso_aperture",
-    "SigmaExposureTime": "sigma_exposure_time",
-    "SigmaWhiteBalance": "sigma_white_balance",
-    "SigmaWhiteBalanceMode": "sigma_wb_mode",
-    "SigmaColorTemperature": "sigma_color_temp",
-    "SigmaFocusMode": "sigma_focus_mode",
-    "SigmaAFPoint": "sigma_af_point",
-    "SigmaFlashMode": "sigma_flash_mode",
-    "SigmaFlashCompensation": "sigma_flash_comp",
-    "SigmaDriveMode": "sigma_drive_mode",
-    "SigmaNoiseReduction": "sigma_noise_reduction",
-    "SigmaHighISONoiseReduction": "sigma_high_iso_nr",
-    "SigmaLongExposureNoiseReduction": "sigma_long_exp_nr",
-    "SigmaVignettingControl": "sigma_vignetting_control",
-    "SigmaColorMode": "sigma_color_mode",
-    "SigmaSaturation": "sigma_saturation",
-    "SigmaContrast": "sigma_contrast",
-    "SigmaSharpness": "sigma_sharpness",
-    "SigmaTone": "sigma_tone",
-    "SigmaColorSpace": "sigma_color_space",
-    "SigmaAutoBracketing": "sigma_auto_bracket",
-    "SigmaImageSize": "sigma_image_size",
-    "SigmaImageQuality": "sigma_image_quality",
-    "SigmaBatteryLevel": "sigma_battery_level",
-    "SigmaOwnerName": "sigma_owner_name",
-    "SigmaArtist": "sigma_artist",
-    "SigmaCopyright": "sigma_copyright",
-}
-
-SIGMA_RAW_INFO = {
-    "SigmaRaw_ImageInfo": "sigma_raw_image_info",
-    "SigmaRaw_RawImageOffset": "sigma_raw_offset",
-    "SigmaRaw_RawImageSize": "sigma_raw_size",
-    "SigmaRaw_RawInfo": "sigma_raw_info",
-    "SigmaRaw_RawColorData": "sigma_raw_color_data",
-    "SigmaRaw_RawImageByteOrder": "sigma_raw_byte_order",
-    "SigmaRaw_CFAPattern": "sigma_raw_cfa_pattern",
-    "SigmaRaw_ColorMatrix": "sigma_raw_color_matrix",
-    "SigmaRaw_LevelMatrix": "sigma_raw_level_matrix",
-    "SigmaRaw_BlackLevel": "sigma_raw_black_level",
-    "SigmaRaw_WhiteLevel": "sigma_raw_white_level",
-    "SigmaRaw_Saturation": "sigma_raw_saturation",
-    "SigmaRaw_GammaCurve": "sigma_raw_gamma",
-    "SigmaRaw_ColorLookup": "sigma_raw_color_lookup",
-    "SigmaRaw_ToneCurve": "sigma_raw_tone_curve",
-    "SigmaRaw_DefaultCrop": "sigma_raw_default_crop",
-    "SigmaRaw_BayerGreenSplit": "sigma_raw_green_split",
-}
-
-HASSELBLAD_EQUIPMENT = {
-    "HasselbladCameraType": "hasselblad_camera_type",
-    "HasselbladCameraName": "hasselblad_camera_name",
-    "HasselbladSerialNumber": "hasselblad_serial",
-    "HasselbladShutterCount": "hasselblad_shutter_count",
-    "HasselbladFirmwareVersion": "hasselblad_firmware",
-    "HasselbladLensType": "hasselblad_lens_type",
-    "HasselbladLensSerialNumber": "hasselblad_lens_serial",
-    "HasselbladLensModel": "hasselblad_lens_model",
-    "HasselbladLensFirmwareVersion": "hasselblad_lens_firmware",
-    "HasselbladFocalLength": "hasselblad_focal_length",
-    "HasselbladFocalLength35mm": "hasselblad_focal_35mm",
-    "HasselbladAperture": "hasselblad_aperture",
-    "HasselbladExposureMode": "hasselblad_exposure_mode",
-    "HasselbladExposureCompensation": "hasselblad_exposure_comp",
-    "HasselbladMeteringMode": "hasselblad_metering_mode",
-    "HasselbladISO": "hasselblad_iso",
-    "HasselbladISOAutoload": "hasselblad_iso_autoload",
-    "HasselbladExposureTime": "hasselblad_exposure_time",
-    "HasselbladWhiteBalance": "hasselblad_white_balance",
-    "HasselbladWhiteBalanceMode": "hasselblad_wb_mode",
-    "HasselbladColorTemperature": "hasselblad_color_temp",
-    "HasselbladFocusMode": "hasselblad_focus_mode",
-    "HasselbladAFPoint": "hasselblad_af_point",
-    "HasselbladFocusDistance": "hasselblad_focus_distance",
-    "HasselbladFlashMode": "hasselblad_flash_mode",
-    "HasselbladFlashCompensation": "hasselblad_flash_comp",
-    "HasselbladDriveMode": "hasselblad_drive_mode",
-    "HasselbladQuality": "hasselblad_quality",
-    "HasselbladImageSize": "hasselblad_image_size",
-    "HasselbladImageType": "hasselblad_image_type",
-    "HasselbladColorSpace": "hasselblad_color_space",
-    "HasselbladSaturation": "hasselblad_saturation",
-    "HasselbladContrast": "hasselblad_contrast",
-    "HasselbladSharpness": "hasselblad_sharpness",
-    "HasselbladExposureProgram": "hasselblad_exp_program",
-    "HasselbladMeteringMode2": "hasselblad_metering_mode_2",
-    "HasselbladSubjectDistance": "hasselblad_subject_distance",
-    "HasselbladZoom": "hasselblad_zoom",
-    "HasselbladDigitalZoom": "hasselblad_digital_zoom",
-    "HasselbladBatteryLevel": "hasselblad_battery_level",
-    "HasselbladSensorTemperature": "hasselblad_sensor_temp",
-    "HasselbladSensorCleaning": "hasselblad_sensor_cleaning",
-    "HasselbladOwnerName": "hasselblad_owner_name",
-    "HasselbladArtist": "hasselblad_artist",
-    "HasselbladCopyright": "hasselblad_copyright",
-    "HasselbladRawImageOffset": "hasselblad_raw_offset",
-    "HasselbladRawImageSize": "hasselblad_raw_size",
-    "HasselbladRawInfo": "hasselblad_raw_info",
-}
-
-HASSELBLAD_FLUORITE_INFO = {
-    "HasselbladFluorite_Category": "hasselblad_fluorite_category",
-    "HasselbladFluorite_SerialNumber": "hasselblad_fluorite_serial",
-    "HasselbladFluorite_FocalLength": "hasselblad_fluorite_focal",
-    "HasselbladFluorite_Aperture": "hasselblad_fluorite_aperture",
-    "HasselbladFluorite_FilterDiameter": "hasselblad_fluorite_filter",
-    "HasselbladFluorite_TargetDistance": "hasselblad_fluorite_target",
-    "HasselbladFluorite_Range": "hasselblad_fluorite_range",
-    "HasselbladFluorite_ElementCount": "hasselblad_fluorite_elements",
-    "HasselbladFluorite_GroupCount": "hasselblad_fluorite_groups",
-    "HasselbladFluorite_FilterCount": "hasselblad_fluorite_filters",
-}
-
-PHASE_ONE_EQUIPMENT = {
-    "PhaseOneCameraType": "phase_one_camera_type",
-    "PhaseOneCameraName": "phase_one_camera_name",
-    "PhaseOneSerialNumber": "phase_one_serial",
-    "PhaseOneShutterActuations": "phase_one_shutter_count",
-    "PhaseOneFirmwareVersion": "phase_one_firmware",
-    "PhaseOneSensorType": "phase_one_sensor_type",
-    "PhaseOneSensorSize": "phase_one_sensor_size",
-    "PhaseOneSensorResolution": "phase_one_sensor_resolution",
-    "PhaseOneSensorISO": "phase_one_sensor_iso",
-    "PhaseOneLensType": "phase_one_lens_type",
-    "PhaseOneLensSerialNumber": "phase_one_lens_serial",
-    "PhaseOneLensModel": "phase_one_lens_model",
-    "PhaseOneFocalLength": "phase_one_focal_length",
-    "PhaseOneAperture": "phase_one_aperture",
-    "PhaseOneExposureMode": "phase_one_exposure_mode",
-    "PhaseOneExposureCompensation": "phase_one_exposure_comp",
-    "PhaseOneMeteringMode": "phase_one_metering_mode",
-    "PhaseOneISO": "phase_one_iso",
-    "PhaseOneExposureTime": "phase_one_exposure_time",
-    "PhaseOneWhiteBalance": "phase_one_white_balance",
-    "PhaseOneColorTemperature": "phase_one_color_temp",
-    "PhaseOneFocusMode": "phase_one_focus_mode",
-    "PhaseOneFocusDistance": "phase_one_focus_distance",
-    "PhaseOneQuality": "phase_one_quality",
-    "PhaseOneImageSize": "phase_one_image_size",
-    "PhaseOneColorSpace": "phase_one_color_space",
-    "PhaseOneOwnerName": "phase_one_owner_name",
-    "PhaseOneArtist": "phase_one_artist",
-    "PhaseOneCopyright": "phase_one_copyright",
-    "PhaseOneCaptureTime": "phase_one_capture_time",
-    "PhaseOneRawImageOffset": "phase_one_raw_offset",
-    "PhaseOneRawImageSize": "phase_one_raw_size",
-    "PhaseOneRawInfo": "phase_one_raw_info",
-}
-
-PHASE_ONE_IDEALIFE_INFO = {
-    "PhaseOneID_Version": "phase_one_id_version",
-    "PhaseOneID_CameraID": "phase_one_camera_id",
-    "PhaseOneID_CameraIndex": "phase_one_camera_index",
-    "PhaseOneID_SensorID": "phase_one_sensor_id",
-    "PhaseOneID_AEPosition": "phase_one_ae_position",
-    "PhaseOneID_ISO": "phase_one_id_iso",
-    "PhaseOneID_GainCode": "phase_one_gain_code",
-    "PhaseOneID_BlackLevel": "phase_one_black_level",
-    "PhaseOneID_WhiteLevel": "phase_one_white_level",
-    "PhaseOneID_HighLightParam": "phase_one_highlight_param",
-    "PhaseOneID_ShadowParam": "phase_one_shadow_param",
-    "PhaseOneID_MoireFilterMode": "phase_one_moire_mode",
-    "PhaseOneID_MoireFilterStrength": "phase_one_moire_strength",
-}
-
-RICOH_EQUIPMENT = {
-    "RicohCameraType": "ricoh_camera_type",
-    "RicohCameraSerialNumber": "ricoh_camera_serial",
-    "RicohInternalSerialNumber": "ricoh_internal_serial",
-    "RicohFirmwareVersion": "ricoh_firmware",
-    "RicohLensType": "ricoh_lens_type",
-    "RicohLensSerialNumber": "ricoh_lens_serial",
-    "RicohLensModel": "ricoh_lens_model",
-    "RicohFocalLength": "ricoh_focal_length",
-    "RicohFocalLength35mm": "ricoh_focal_35mm",
-    "RicohAperture": "ricoh_aperture",
-    "RicohExposureMode": "ricoh_exposure_mode",
-    "RicohExposureCompensation": "ricoh_exposure_comp",
-    "RicohMeteringMode": "ricoh_metering_mode",
-    "RicohISO": "ricoh_iso",
-    "RicohExposureTime": "ricoh_exposure_time",
-    "RicohWhiteBalance": "ricoh_white_balance",
-    "RicohWhiteBalanceMode": "ricoh_wb_mode",
-    "RicohColorTemperature": "ricoh_color_temp",
-    "RicohFocusMode": "ricoh_focus_mode",
-    "RicohAFPoint": "ricoh_af_point",
-    "RicohFocusDistance": "ricoh_focus_distance",
-    "RicohFlashMode": "ricoh_flash_mode",
-    "RicohFlashCompensation": "ricoh_flash_comp",
-    "RicohDriveMode": "ricoh_drive_mode",
-    "RicohImageSize": "ricoh_image_size",
-    "RicohImageQuality": "ricoh_image_quality",
-    "RicohColorSpace": "ricoh_color_space",
-    "RicohSaturation": "ricoh_saturation",
-    "RicohContrast": "ricoh_contrast",
-    "RicohSharpness": "ricoh_sharpness",
-    "RicohNoiseReduction": "ricoh_noise_reduction",
-    "RicohHighISONoiseReduction": "ricoh_high_iso_nr",
-    "RicohDynamicRangeExpansion": "ricoh_dre",
-    "RicohIntelligentResolution": "ricoh_ires",
-    "RicohHdr": "ricoh_hdr",
-    "RicohPanorama": "ricoh_panorama",
-    "RicohTimeLapse": "ricoh_time_lapse",
-    "RicohCrop": "ricoh_crop",
-    "RicohAspectRatio": "ricoh_aspect_ratio",
-    "RicohBatteryLevel": "ricoh_battery_level",
-    "RicohBodyTemperature": "ricoh_body_temp",
-    "RicohShutterCount": "ricoh_shutter_count",
-    "RicohGPS": "ricoh_gps",
-    "RicohGPSLatitude": "ricoh_gps_lat",
-    "RicohGPSLongitude": "ricoh_gps_lon",
-    "RicohGPSAltitude": "ricoh_gps_alt",
-    "RicohGPSTime": "ricoh_gps_time",
-    "RicohOwnerName": "ricoh_owner_name",
-    "RicohArtist": "ricoh_artist",
-    "RicohCopyright": "ricoh_copyright",
-}
-
-RICOH_GXR_INFO = {
-    "RicohGXR_A12Version": "ricoh_gxr_a12_version",
-    "RicohGXR_DisplayUnit": "ricoh_gxr_display_unit",
-    "RicohGXR_Module": "ricoh_gxr_module",
-    "RicohGXR_ModuleVersion": "ricoh_gxr_module_version",
-    "RicohGXR_SensorInfo": "ricoh_gxr_sensor_info",
-    "RicohGXR_LensID": "ricoh_gxr_lens_id",
-    "RicohGXR_LensInfo": "ricoh_gxr_lens_info",
-    "RicohGXR_FocusInfo": "ricoh_gxr_focus_info",
-    "RicohGXR_Calibration": "ricoh_gxr_calibration",
-}
-
-RICOH_GR_INFO = {
-    "RicohGR_ImageSync": "ricoh_gr_image_sync",
-    "RicohGR_ImageSyncVersion": "ricoh_gr_sync_version",
-    "RicohGR_FocusPosition": "ricoh_gr_focus_position",
-    "RicohGR_ShutterCount": "ricoh_gr_shutter_count",
-    "RicohGR_InternalSerialNumber": "ricoh_gr_internal_serial",
-    "RicohGR_AperturePreview": "ricoh_gr_aperture_preview",
-    "RicohGR_ExposurePreview": "ricoh_gr_exposure_preview",
-    "RicohGR_BatteryLevel": "ricoh_gr_battery_level",
-    "RicohGR_BatteryVoltage": "ricoh_gr_battery_voltage",
-}
-
-LEICA_TAGS = {**LEICA_EQUIPMENT, **LEICA_LENS_INFO, **LEICA_MAKE_INFO}
-SIGMA_TAGS = {**SIGMA_EQUIPMENT, **SIGMA_RAW_INFO}
-HASSELBLAD_TAGS = {**HASSELBLAD_EQUIPMENT, **HASSELBLAD_FLUORITE_INFO}
-PHASE_ONE_TAGS = {**PHASE_ONE_EQUIPMENT, **PHASE_ONE_IDEALIFE_INFO}
-RICOH_TAGS = {**RICOH_EQUIPMENT, **RICOH_GXR_INFO, **RICOH_GR_INFO}
+try:
+    from ..utils.field_tables import load_field_tables
+except ImportError:
+    from utils.field_tables import load_field_tables
+
+# Tag tables live in field_table_sources/makernotes_complete.py and are compiled to a
+# memory-mapped table on first access
+_TABLES = load_field_tables("makernotes_complete")
+
+
+CANON_CAMERA_SETTINGS = _TABLES["CANON_CAMERA_SETTINGS"]
+CANON_SHOT_INFO = _TABLES["CANON_SHOT_INFO"]
+CANON_PICTURE_STYLE = _TABLES["CANON_PICTURE_STYLE"]
+NIKON_ISO_INFO = _TABLES["NIKON_ISO_INFO"]
+NIKON_SHOT_INFO = _TABLES["NIKON_SHOT_INFO"]
+NIKON_COLOR_BALANCE = _TABLES["NIKON_COLOR_BALANCE"]
+NIKON_LENS_DATA = _TABLES["NIKON_LENS_DATA"]
+NIKON_FLASH_INFO = _TABLES["NIKON_FLASH_INFO"]
+NIKON_AF_INFO = _TABLES["NIKON_AF_INFO"]
+SONY_CAMERA_SETTINGS = _TABLES["SONY_CAMERA_SETTINGS"]
+SONY_AF_INFO = _TABLES["SONY_AF_INFO"]
+FUJIFILM_CAMERA_SETTINGS = _TABLES["FUJIFILM_CAMERA_SETTINGS"]
+FUJIFILM_LENS_INFO = _TABLES["FUJIFILM_LENS_INFO"]
+FUJIFILM_FILM_SIMULATION = _TABLES["FUJIFILM_FILM_SIMULATION"]
+FUJIFILM_RAW_DEVELOPMENT = _TABLES["FUJIFILM_RAW_DEVELOPMENT"]
+FUJIFILM_FACE_INFO = _TABLES["FUJIFILM_FACE_INFO"]
+FUJIFILM_VIDEO_INFO = _TABLES["FUJIFILM_VIDEO_INFO"]
+FUJIFILM_GFX_INFO = _TABLES["FUJIFILM_GFX_INFO"]
+OLYMPUS_EQUIPMENT = _TABLES["OLYMPUS_EQUIPMENT"]
+OLYMPUS_CAMERA_SETTINGS = _TABLES["OLYMPUS_CAMERA_SETTINGS"]
+OLYMPUS_IMAGE_PROCESSING = _TABLES["OLYMPUS_IMAGE_PROCESSING"]
+OLYMPUS_FOCUS_INFO = _TABLES["OLYMPUS_FOCUS_INFO"]
+OLYMPUS_RAW_DEVELOPMENT = _TABLES["OLYMPUS_RAW_DEVELOPMENT"]
+OLYMPUS_RAW_INFO = _TABLES["OLYMPUS_RAW_INFO"]
+PANASONIC_CAMERA_SETTINGS = _TABLES["PANASONIC_CAMERA_SETTINGS"]
+PANASONIC_VIDEO_INFO = _TABLES["PANASONIC_VIDEO_INFO"]
+PANASONIC_FOCUS_INFO = _TABLES["PANASONIC_FOCUS_INFO"]
+PANASONIC_S_SERIES = _TABLES["PANASONIC_S_SERIES"]
+PANASONIC_GH_SERIES = _TABLES["PANASONIC_GH_SERIES"]
+PENTAX_CAMERA_SETTINGS = _TABLES["PENTAX_CAMERA_SETTINGS"]
+PENTAX_LENS_DATA = _TABLES["PENTAX_LENS_DATA"]
+PENTAX_AF_INFO = _TABLES["PENTAX_AF_INFO"]
+PENTAX_AE_INFO = _TABLES["PENTAX_AE_INFO"]
+PENTAX_FLASH_INFO = _TABLES["PENTAX_FLASH_INFO"]
+PENTAX_COLOR_INFO = _TABLES["PENTAX_COLOR_INFO"]
+CANON_LENS_INFO = _TABLES["CANON_LENS_INFO"]
+CANON_COLOR_DATA_V1 = _TABLES["CANON_COLOR_DATA_V1"]
+CANON_COLOR_DATA_V2 = _TABLES["CANON_COLOR_DATA_V2"]
+CANON_COLOR_DATA_V4 = _TABLES["CANON_COLOR_DATA_V4"]
+CANON_COLOR_DATA_V5 = _TABLES["CANON_COLOR_DATA_V5"]
+CANON_COLOR_DATA_V6 = _TABLES["CANON_COLOR_DATA_V6"]
+CANON_COLOR_DATA_V7 = _TABLES["CANON_COLOR_DATA_V7"]
+CANON_COLOR_DATA_V8 = _TABLES["CANON_COLOR_DATA_V8"]
+CANON_COLOR_DATA_V9 = _TABLES["CANON_COLOR_DATA_V9"]
+CANON_COLOR_DATA_V10 = _TABLES["CANON_COLOR_DATA_V10"]
+CANON_COLOR_DATA_V11 = _TABLES["CANON_COLOR_DATA_V11"]
+CANON_COLOR_DATA_V12 = _TABLES["CANON_COLOR_DATA_V12"]
+CANON_AF_INFO = _TABLES["CANON_AF_INFO"]
+CANON_AF_INFO_2 = _TABLES["CANON_AF_INFO_2"]
+CANON_CAMERA_INFO_1D = _TABLES["CANON_CAMERA_INFO_1D"]
+CANON_CAMERA_INFO_5D = _TABLES["CANON_CAMERA_INFO_5D"]
+CANON_CAMERA_INFO_5D2 = _TABLES["CANON_CAMERA_INFO_5D2"]
+CANON_CAMERA_INFO_5D3 = _TABLES["CANON_CAMERA_INFO_5D3"]
+CANON_CAMERA_INFO_6D = _TABLES["CANON_CAMERA_INFO_6D"]
+CANON_CAMERA_INFO_7D = _TABLES["CANON_CAMERA_INFO_7D"]
+CANON_CAMERA_INFO_80D = _TABLES["CANON_CAMERA_INFO_80D"]
+CANON_CAMERA_INFO_R5 = _TABLES["CANON_CAMERA_INFO_R5"]
+CANON_CAMERA_INFO_R6 = _TABLES["CANON_CAMERA_INFO_R6"]
+CANON_CAMERA_INFO_R3 = _TABLES["CANON_CAMERA_INFO_R3"]
+CANON_FILE_INFO = _TABLES["CANON_FILE_INFO"]
+CANON_POWERSHOT_INFO = _TABLES["CANON_POWERSHOT_INFO"]
+CANON_3D_CAMERA_INFO = _TABLES["CANON_3D_CAMERA_INFO"]
+CANON_TAGS = _TABLES["CANON_TAGS"]
+NIKON_PICTURE_CONTROL = _TABLES["NIKON_PICTURE_CONTROL"]
+NIKON_CAMERA_INFO_D1 = _TABLES["NIKON_CAMERA_INFO_D1"]
+NIKON_CAMERA_INFO_D2 = _TABLES["NIKON_CAMERA_INFO_D2"]
+NIKON_CAMERA_INFO_D3 = _TABLES["NIKON_CAMERA_INFO_D3"]
+NIKON_CAMERA_INFO_D4 = _TABLES["NIKON_CAMERA_INFO_D4"]
+NIKON_CAMERA_INFO_D5 = _TABLES["NIKON_CAMERA_INFO_D5"]
+NIKON_CAMERA_INFO_D500 = _TABLES["NIKON_CAMERA_INFO_D500"]
+NIKON_CAMERA_INFO_D600 = _TABLES["NIKON_CAMERA_INFO_D600"]
+NIKON_CAMERA_INFO_D700 = _TABLES["NIKON_CAMERA_INFO_D700"]
+NIKON_CAMERA_INFO_D800 = _TABLES["NIKON_CAMERA_INFO_D800"]
+NIKON_CAMERA_INFO_D810 = _TABLES["NIKON_CAMERA_INFO_D810"]
+NIKON_CAMERA_INFO_D850 = _TABLES["NIKON_CAMERA_INFO_D850"]
+NIKON_CAMERA_INFO_D300 = _TABLES["NIKON_CAMERA_INFO_D300"]
+NIKON_CAMERA_INFO_D90 = _TABLES["NIKON_CAMERA_INFO_D90"]
+NIKON_CAMERA_INFO_D60 = _TABLES["NIKON_CAMERA_INFO_D60"]
+NIKON_CAMERA_INFO_D40 = _TABLES["NIKON_CAMERA_INFO_D40"]
+NIKON_CAMERA_INFO_Z6 = _TABLES["NIKON_CAMERA_INFO_Z6"]
+NIKON_CAMERA_INFO_Z7 = _TABLES["NIKON_CAMERA_INFO_Z7"]
+NIKON_CAMERA_INFO_Z9 = _TABLES["NIKON_CAMERA_INFO_Z9"]
+NIKON_FILE_INFO = _TABLES["NIKON_FILE_INFO"]
+NIKON_MAKERNOTE_VERSION = _TABLES["NIKON_MAKERNOTE_VERSION"]
+NIKON_TAGS = _TABLES["NIKON_TAGS"]
+SONY_FILE_INFO = _TABLES["SONY_FILE_INFO"]
+SONY_CAMERA_INFO_A7 = _TABLES["SONY_CAMERA_INFO_A7"]
+SONY_CAMERA_INFO_A7R = _TABLES["SONY_CAMERA_INFO_A7R"]
+SONY_CAMERA_INFO_A7S = _TABLES["SONY_CAMERA_INFO_A7S"]
+SONY_CAMERA_INFO_A9 = _TABLES["SONY_CAMERA_INFO_A9"]
+SONY_CAMERA_INFO_A99 = _TABLES["SONY_CAMERA_INFO_A99"]
+SONY_CAMERA_INFO_A58 = _TABLES["SONY_CAMERA_INFO_A58"]
+SONY_CAMERA_INFO_A68 = _TABLES["SONY_CAMERA_INFO_A68"]
+SONY_CAMERA_INFO_A77 = _TABLES["SONY_CAMERA_INFO_A77"]
+SONY_CAMERA_INFO_A99II = _TABLES["SONY_CAMERA_INFO_A99II"]
+SONY_CAMERA_INFO_A7R2 = _TABLES["SONY_CAMERA_INFO_A7R2"]
+SONY_CAMERA_INFO_A7R3 = _TABLES["SONY_CAMERA_INFO_A7R3"]
+SONY_CAMERA_INFO_A7R4 = _TABLES["SONY_CAMERA_INFO_A7R4"]
+SONY_CAMERA_INFO_A7M3 = _TABLES["SONY_CAMERA_INFO_A7M3"]
+SONY_CAMERA_INFO_A7M4 = _TABLES["SONY_CAMERA_INFO_A7M4"]
+SONY_CAMERA_INFO_A1 = _TABLES["SONY_CAMERA_INFO_A1"]
+SONY_CAMERA_INFO_ZV1 = _TABLES["SONY_CAMERA_INFO_ZV1"]
+SONY_CAMERA_INFO_ZV_E10 = _TABLES["SONY_CAMERA_INFO_ZV_E10"]
+SONY_CAMERA_INFO_RX100 = _TABLES["SONY_CAMERA_INFO_RX100"]
+SONY_CAMERA_INFO_RX10 = _TABLES["SONY_CAMERA_INFO_RX10"]
+SONY_CAMERA_INFO_RX1 = _TABLES["SONY_CAMERA_INFO_RX1"]
+SONY_TAGS = _TABLES["SONY_TAGS"]
+FUJIFILM_TAGS = _TABLES["FUJIFILM_TAGS"]
+OLYMPUS_TAGS = _TABLES["OLYMPUS_TAGS"]
+PANASONIC_TAGS = _TABLES["PANASONIC_TAGS"]
+PENTAX_TAGS = _TABLES["PENTAX_TAGS"]
+LEICA_EQUIPMENT = _TABLES["LEICA_EQUIPMENT"]
+LEICA_LENS_INFO = _TABLES["LEICA_LENS_INFO"]
+LEICA_MAKE_INFO = _TABLES["LEICA_MAKE_INFO"]
+SIGMA_EQUIPMENT = _TABLES["SIGMA_EQUIPMENT"]
+SIGMA_RAW_INFO = _TABLES["SIGMA_RAW_INFO"]
+HASSELBLAD_EQUIPMENT = _TABLES["HASSELBLAD_EQUIPMENT"]
+HASSELBLAD_FLUORITE_INFO = _TABLES["HASSELBLAD_FLUORITE_INFO"]
+PHASE_ONE_EQUIPMENT = _TABLES["PHASE_ONE_EQUIPMENT"]
+PHASE_ONE_IDEALIFE_INFO = _TABLES["PHASE_ONE_IDEALIFE_INFO"]
+RICOH_EQUIPMENT = _TABLES["RICOH_EQUIPMENT"]
+RICOH_GXR_INFO = _TABLES["RICOH_GXR_INFO"]
+RICOH_GR_INFO = _TABLES["RICOH_GR_INFO"]
+LEICA_TAGS = _TABLES["LEICA_TAGS"]
+SIGMA_TAGS = _TABLES["SIGMA_TAGS"]
+HASSELBLAD_TAGS = _TABLES["HASSELBLAD_TAGS"]
+PHASE_ONE_TAGS = _TABLES["PHASE_ONE_TAGS"]
+RICOH_TAGS = _TABLES["RICOH_TAGS"]
 
 
 def parse_canon_makernote(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -5978,265 +567,11 @@ def _extract_phase_one_makernote(exif_data: dict) -> dict:
     return result
 
 
-# Extended Canon Camera Settings
-CANON_EXTENDED_SETTINGS = {
-    'CanonCS_ISOExpansion': 'canon_iso_expansion',
-    'CanonCS_ShotZoneAF': 'canon_shot_zone_af',
-    'CanonCS_ManualAFPointSelection': 'canon_manual_af_point_selection',
-    'CanonCS_ContinuousAF': 'canon_continuous_af',
-    'CanonCS_AFPoint Switching': 'canon_af_point_switching',
-    'CanonCS_AI Servo AFTrackingSensitivity': 'canon_ai_servo_tracking_sensitivity',
-    'CanonCS_AI Servo AFResponse': 'canon_ai_servo_response',
-    'CanonCS_AI Servo FirstImagePriority': 'canon_ai_servo_first_image_priority',
-    'CanonCS_AI Servo SecondImagePriority': 'canon_ai_servo_second_image_priority',
-    'CanonCS_USBDescription': 'canon_usb_description',
-    'CanonCS_RemoteTimeout': 'canon_remote_timeout',
-    'CanonCS_SelfTimerSound': 'canon_self_timer_sound',
-    'CanonCS_CustomSettingsAvailable': 'canon_custom_settings_available',
-    'CanonCS_CustomSetting1': 'canon_custom_setting_1',
-    'CanonCS_CustomSetting2': 'canon_custom_setting_2',
-    'CanonCS_CustomSetting3': 'canon_custom_setting_3',
-    'CanonCS_CustomSetting4': 'canon_custom_setting_4',
-    'CanonCS_CustomSetting5': 'canon_custom_setting_5',
-    'CanonCS_CustomSetting6': 'canon_custom_setting_6',
-    'CanonCS_AFMicroadjustment': 'canon_af_microadjustment',
-    'CanonCS_AFMicroadjustmentAll': 'canon_af_microadjustment_all',
-    'CanonCS_AFMicroadjustmentSame': 'canon_af_microadjustment_same',
-    'CanonCS_ExposureCompensationSteps': 'canon_exposure_compensation_steps',
-    'CanonCS_AEBAutoCancel': 'canon_aeb_auto_cancel',
-    'CanonCS_AEBAutoRotate': 'canon_aeb_auto_rotate',
-    'CanonCS_ISOAuto': 'canon_iso_auto',
-    'CanonCS_ISOAutoMin': 'canon_iso_auto_min',
-    'CanonCS_ISOAutoMax': 'canon_iso_auto_max',
-    'CanonCS_BaseISO': 'canon_base_iso',
-    'CanonCS_MeasuredEV': 'canon_measured_ev',
-    'CanonCS_WhiteBalanceValue': 'canon_white_balance_value',
-    'CanonCS_WhiteBalanceRed': 'canon_white_balance_red',
-    'CanonCS_WhiteBalanceBlue': 'canon_white_balance_blue',
-    'CanonCS_ColorTemperature': 'canon_color_temperature',
-    'CanonCS_PictureStyle': 'canon_picture_style',
-    'CanonCS_PictureStyleUserDef1': 'canon_picture_style_user_def_1',
-    'CanonCS_PictureStyleUserDef2': 'canon_picture_style_user_def_2',
-    'CanonCS_PictureStyleUserDef3': 'canon_picture_style_user_def_3',
-    'CanonCS_PictureStylePC1': 'canon_picture_style_pc_1',
-    'CanonCS_PictureStylePC2': 'canon_picture_style_pc_2',
-    'CanonCS_PictureStylePC3': 'canon_picture_style_pc_3',
-    'CanonCS_LensConstruction': 'canon_lens_construction',
-    'CanonCS_LensFocalLength': 'canon_lens_focal_length',
-    'CanonCS_LensFocalLength35mmEq': 'canon_lens_focal_length_35mm_eq',
-    'CanonCS_LensZoomPosition': 'canon_lens_zoom_position',
-    'CanonCS_FirmwareVersion': 'canon_firmware_version',
-    'CanonCS_CameraOwnerName': 'canon_camera_owner_name',
-    'CanonCS_CameraSerialNumber': 'canon_camera_serial_number',
-    'CanonCS_CameraUniqueID': 'canon_camera_unique_id',
-    'CanonCS_ImageUniqueID': 'canon_image_unique_id',
-}
-
-# Extended Nikon Camera Settings
-NIKON_EXTENDED_SETTINGS = {
-    'NikonCS_ExposureTime': 'nikon_exposure_time',
-    'NikonCS_FNumber': 'nikon_f_number',
-    'NikonCS_ExposureCompensation': 'nikon_exposure_compensation',
-    'NikonCS_MaxAperture': 'nikon_max_aperture',
-    'NikonCS_MinAperture': 'nikon_min_aperture',
-    'NikonCS_MeteringMode': 'nikon_metering_mode',
-    'NikonCS_AFMode': 'nikon_af_mode',
-    'NikonCS_AFFocusPosition': 'nikon_af_focus_position',
-    'NikonCS_AFPointSelected': 'nikon_af_point_selected',
-    'NikonCS_AFPointsUsed': 'nikon_af_points_used',
-    'NikonCS_FlashMode': 'nikon_flash_mode',
-    'NikonCS_FlashExposureComp': 'nikon_flash_exposure_comp',
-    'NikonCS_FlashBracketComp': 'nikon_flash_bracket_comp',
-    'NikonCS_FlashExposureComp3': 'nikon_flash_exposure_comp_3',
-    'NikonCS_FocusDistance': 'nikon_focus_distance',
-    'NikonCS_DigitalZoom': 'nikon_digital_zoom',
-    'NikonCS_ISO': 'nikon_iso',
-    'NikonCS_ISOSetting': 'nikon_iso_setting',
-    'NikonCS_ISOExpansion': 'nikon_iso_expansion',
-    'NikonCS_ISO2': 'nikon_iso_2',
-    'NikonCS_ISO2Setting': 'nikon_iso_2_setting',
-    'NikonCS_VignetteControl': 'nikon_vignette_control',
-    'NikonCS_ActiveDLighting': 'nikon_active_d_lighting',
-    'NikonCS_ActiveDLighting2': 'nikon_active_d_lighting_2',
-    'NikonCS_PictureControl': 'nikon_picture_control',
-    'NikonCS_PictureControl2': 'nikon_picture_control_2',
-    'NikonCS_HighISONoiseReduction': 'nikon_high_iso_noise_reduction',
-    'NikonCS_LongExposureNoiseReduction': 'nikon_long_exposure_noise_reduction',
-    'NikonCS_ElectronicFrontCurtainShutter': 'nikon_electronic_front_curtain_shutter',
-    'NikonCS_FocusTrackingLockOn': 'nikon_focus_tracking_lock_on',
-    'NikonCS_AFAreaMode': 'nikon_af_area_mode',
-    'NikonCS_AFAreaMode2': 'nikon_af_area_mode_2',
-    'NikonCS_AFPointMode': 'nikon_af_point_mode',
-    'NikonCS_AFPointIllumination': 'nikon_af_point_illumination',
-    'NikonCS_FocusPointBrightness': 'nikon_focus_point_brightness',
-    'NikonCS_BuiltInAFassist': 'nikon_built_in_af_assist',
-    'NikonCS_AFOnButton': 'nikon_af_on_button',
-    'NikonCS_FnButtonFunction': 'nikon_fn_button_function',
-    'NikonCS_PreviewButtonFunction': 'nikon_preview_button_function',
-    'NikonCS_CommandDialsFunction': 'nikon_command_dials_function',
-    'NikonCS_ShutterSpeedButton': 'nikon_shutter_speed_button',
-    'NikonCS_ControlRingFunction': 'nikon_control_ring_function',
-    'NikonCS_MetadataMode': 'nikon_metadata_mode',
-    'NikonCS_CameraOwnerName': 'nikon_camera_owner_name',
-    'NikonCS_CameraSerialNumber': 'nikon_camera_serial_number',
-    'NikonCS_ColorSpace': 'nikon_color_space',
-    'NikonCS_ActiveDLighting': 'nikon_active_d_lighting',
-}
-
-# Extended Sony Camera Settings
-SONY_EXTENDED_SETTINGS = {
-    'SonyCS_FocusMode': 'sony_focus_mode',
-    'SonyCS_AFMode': 'sony_af_mode',
-    'SonyCS_AFAreaMode': 'sony_af_area_mode',
-    'SonyCS_FocusPosition': 'sony_focus_position',
-    'SonyCS_ExposureCompensation': 'sony_exposure_compensation',
-    'SonyCS_ISO': 'sony_iso',
-    'SonyCS_ISOSetting': 'sony_iso_setting',
-    'SonyCS_ISOExpansion': 'sony_iso_expansion',
-    'SonyCS_MeteringMode': 'sony_metering_mode',
-    'SonyCS_WhiteBalance': 'sony_white_balance',
-    'SonyCS_WhiteBalanceMode': 'sony_white_balance_mode',
-    'SonyCS_ColorTemperature': 'sony_color_temperature',
-    'SonyCS_ColorTemperatureSetting': 'sony_color_temperature_setting',
-    'SonyCS_CustomWB_R': 'sony_custom_wb_r',
-    'SonyCS_CustomWB_G': 'sony_custom_wb_g',
-    'SonyCS_CustomWB_B': 'sony_custom_wb_b',
-    'SonyCS_PictureEffect': 'sony_picture_effect',
-    'SonyCS_PictureProfile': 'sony_picture_profile',
-    'SonyCS_PictureProfile1': 'sony_picture_profile_1',
-    'SonyCS_PictureProfile2': 'sony_picture_profile_2',
-    'SonyCS_PictureProfile3': 'sony_picture_profile_3',
-    'SonyCS_PictureProfile4': 'sony_picture_profile_4',
-    'SonyCS_PictureProfile5': 'sony_picture_profile_5',
-    'SonyCS_PictureProfile6': 'sony_picture_profile_6',
-    'SonyCS_PictureProfile7': 'sony_picture_profile_7',
-    'SonyCS_PictureProfile8': 'sony_picture_profile_8',
-    'SonyCS_PictureProfileOff': 'sony_picture_profile_off',
-    'SonyCS_Gamma': 'sony_gamma',
-    'SonyCS_BlackLevel': 'sony_black_level',
-    'SonyCS_BlackGamma': 'sony_black_gamma',
-    'SonyCS_Knee': 'sony_knee',
-    'SonyCS_Slope': 'sony_slope',
-    'SonyCS_ClearImageZoom': 'sony_clear_image_zoom',
-    'SonyCS_DigitalZoom': 'sony_digital_zoom',
-    'SonyCS_ZoomSetting': 'sony_zoom_setting',
-    'SonyCS_ImageSize': 'sony_image_size',
-    'SonyCS_AspectRatio': 'sony_aspect_ratio',
-    'SonyCS_Quality': 'sony_quality',
-    'SonyCS_RAWFormat': 'sony_raw_format',
-    'SonyCS_RAWSettings': 'sony_raw_settings',
-    'SonyCS_NoiseReduction': 'sony_noise_reduction',
-    'SonyCS_DynamicRangeOptimizer': 'sony_dynamic_range_optimizer',
-    'SonyCS_HighISONoiseReduction': 'sony_high_iso_noise_reduction',
-    'SonyCS_LongExposureNoiseReduction': 'sony_long_exposure_noise_reduction',
-    'SonyCS_AutoHDR': 'sony_auto_hdr',
-    'SonyCS_FocusAssist': 'sony_focus_assist',
-    'SonyCS_FocusPeaking': 'sony_focus_peaking',
-    'SonyCS_ZebraSetting': 'sony_zebra_setting',
-    'SonyCS_ZebraLevel': 'sony_zebra_level',
-    'SonyCS_TimeCode': 'sony_time_code',
-    'SonyCS_UserBit': 'sony_user_bit',
-    'SonyCS_FirmwareVersion': 'sony_firmware_version',
-    'SonyCS_LensType': 'sony_lens_type',
-    'SonyCS_LensSerialNumber': 'sony_lens_serial_number',
-    'SonyCS_LensModel': 'sony_lens_model',
-    'SonyCS_LensFirmware': 'sony_lens_firmware',
-}
-
-# Extended Fujifilm Camera Settings
-FUJIFILM_EXTENDED_SETTINGS = {
-    'FujiCS_FocusMode': 'fuji_focus_mode',
-    'FujiCS_AFMode': 'fuji_af_mode',
-    'FujiCS_FocusPixel': 'fuji_focus_pixel',
-    'FujiCS_QuickAF': 'fuji_quick_af',
-    'FujiCS_FocusPoint': 'fuji_focus_point',
-    'FujiCS_AFIlluminator': 'fuji_af_illuminator',
-    'FujiCS_FaceDetection': 'fuji_face_detection',
-    'FujiCS_FaceDetectionOn': 'fuji_face_detection_on',
-    'FujiCS_FaceRecEd': 'fuji_face_rec_ed',
-    'FujiCS_FaceRecResult': 'fuji_face_rec_result',
-    'FujiCS_ExposureCompensation': 'fuji_exposure_compensation',
-    'FujiCS_ISO': 'fuji_iso',
-    'FujiCS_ISOSetting': 'fuji_iso_setting',
-    'FujiCS_ISODynamicRange': 'fuji_iso_dynamic_range',
-    'FujiCS_WhiteBalance': 'fuji_white_balance',
-    'FujiCS_WhiteBalanceFineTune': 'fuji_white_balance_fine_tune',
-    'FujiCS_WhiteBalanceKelvin': 'fuji_white_balance_kelvin',
-    'FujiCS_ColorTemperature': 'fuji_color_temperature',
-    'FujiCS_Color': 'fuji_color',
-    'FujiCS_Sharpness': 'fuji_sharpness',
-    'FujiCS_SharpnessSetting': 'fuji_sharpness_setting',
-    'FujiCS_Contrast': 'fuji_contrast',
-    'FujiCS_ContrastSetting': 'fuji_contrast_setting',
-    'FujiCS_NoiseReduction': 'fuji_noise_reduction',
-    'FujiCS_FilmMode': 'fuji_film_mode',
-    'FujiCS_FilmSimulation': 'fuji_film_simulation',
-    'FujiCS_FilmSimulation2': 'fuji_film_simulation_2',
-    'FujiCS_DynamicRange': 'fuji_dynamic_range',
-    'FujiCS_DynamicRangeSetting': 'fuji_dynamic_range_setting',
-    'FujiCS_GrainEffect': 'fuji_grain_effect',
-    'FujiCS_ColorChromeEffect': 'fuji_color_chrome_effect',
-    'FujiCS_LensModulationOptimizer': 'fuji_lens_modulation_optimizer',
-    'FujiCS_ColorSpace': 'fuji_color_space',
-    'FujiCS_BlurWarning': 'fuji_blur_warning',
-    'FujiCS_FocusWarning': 'fuji_focus_warning',
-    'FujiCS_ExposureWarning': 'fuji_exposure_warning',
-    'FujiCS_FlashConversion': 'fuji_flash_conversion',
-    'FujiCS_EngineFirmwareVersion': 'fuji_engine_firmware_version',
-    'FujiCS_ControllerFirmwareVersion': 'fuji_controller_firmware_version',
-    'FujiCS_ControllerFirmwareVersion2': 'fuji_controller_firmware_version_2',
-    'FujiCS_LensFirmwareVersion': 'fuji_lens_firmware_version',
-}
-
-# Extended Olympus Camera Settings
-OLYMPUS_EXTENDED_SETTINGS = {
-    'OlympusCS_FocusMode': 'olympus_focus_mode',
-    'OlympusCS_AFMode': 'olympus_af_mode',
-    'OlympusCS_AFPoint': 'olympus_af_point',
-    'OlympusCS_AFPointSelected': 'olympus_af_point_selected',
-    'OlympusCS_AFIlluminator': 'olympus_af_illuminator',
-    'OlympusCS_FaceDetection': 'olympus_face_detection',
-    'OlympusCS_EyeDetection': 'olympus_eye_detection',
-    'OlympusCS_ArtFilter': 'olympus_art_filter',
-    'OlympusCS_ArtFilterEffect': 'olympus_art_filter_effect',
-    'OlympusCS_PictureMode': 'olympus_picture_mode',
-    'OlympusCS_PictureMode2': 'olympus_picture_mode_2',
-    'OlympusCS_PictureMode3': 'olympus_picture_mode_3',
-    'OlympusCS_ExposureCompensation': 'olympus_exposure_compensation',
-    'OlympusCS_ISO': 'olympus_iso',
-    'OlympusCS_ISOSetting': 'olympus_iso_setting',
-    'OlympusCS_WhiteBalance': 'olympus_white_balance',
-    'OlympusCS_WhiteBalanceMode': 'olympus_white_balance_mode',
-    'OlympusCS_WhiteBalanceKelvin': 'olympus_white_balance_kelvin',
-    'OlympusCS_CustomWB_R': 'olympus_custom_wb_r',
-    'OlympusCS_CustomWB_G': 'olympus_custom_wb_g',
-    'OlympusCS_CustomWB_B': 'olympus_custom_wb_b',
-    'OlympusCS_ColorSpace': 'olympus_color_space',
-    'OlympusCS_NoiseFilter': 'olympus_noise_filter',
-    'OlympusCS_NoiseReduction': 'olympus_noise_reduction',
-    'OlympusCS_Gradation': 'olympus_gradation',
-    'OlympusCS_GradationAuto': 'olympus_gradation_auto',
-    'OlympusCS_Sharpness': 'olympus_sharpness',
-    'OlympusCS_SharpnessSetting': 'olympus_sharpness_setting',
-    'OlympusCS_Contrast': 'olympus_contrast',
-    'OlympusCS_ContrastSetting': 'olympus_contrast_setting',
-    'OlympusCS_Saturation': 'olympus_saturation',
-    'OlympusCS_SaturationSetting': 'olympus_saturation_setting',
-    'OlympusCS_Tone': 'olympus_tone',
-    'OlympusCS_ToneSetting': 'olympus_tone_setting',
-    'OlympusCS_ColorCreatorEffect': 'olympus_color_creator_effect',
-    'OlympusCS_MonochromeProfile': 'olympus_monochrome_profile',
-    'OlympusCS_MonochromeProfileTone': 'olympus_monochrome_profile_tone',
-    'OlympusCS_FlashMode': 'olympus_flash_mode',
-    'OlympusCS_FlashExternal': 'olympus_flash_external',
-    'OlympusCS_FlashIntensity': 'olympus_flash_intensity',
-    'OlympusCS_FlashCompensation': 'olympus_flash_compensation',
-    'OlympusCS_RemoteFlash': 'olympus_remote_flash',
-    'OlympusCS_FirmwareVersion': 'olympus_firmware_version',
-    'OlympusCS_LensSerialNumber': 'olympus_lens_serial_number',
-    'OlympusCS_LensModel': 'olympus_lens_model',
-    'OlympusCS_LensFirmware': 'olympus_lens_firmware',
-}
+CANON_EXTENDED_SETTINGS = _TABLES["CANON_EXTENDED_SETTINGS"]
+NIKON_EXTENDED_SETTINGS = _TABLES["NIKON_EXTENDED_SETTINGS"]
+SONY_EXTENDED_SETTINGS = _TABLES["SONY_EXTENDED_SETTINGS"]
+FUJIFILM_EXTENDED_SETTINGS = _TABLES["FUJIFILM_EXTENDED_SETTINGS"]
+OLYMPUS_EXTENDED_SETTINGS = _TABLES["OLYMPUS_EXTENDED_SETTINGS"]
 
 
 def get_makernotes_complete_extended_field_count() -> int:
@@ -1,20 +1,76 @@
 """
 Metadata Storage Database
 SQLite-based persistent storage for extracted metadata with search capabilities
+
+Values are stored as TEXT in an EAV layout. At ingest each value also gets
+typed shadow columns (value_num for numbers and rationals, value_time for
+ISO/EXIF datetimes as UTC epoch seconds) and each file with GPS coordinates
+gets a point in file_locations, so range and bounding-box queries use
+(category, key, typed value) indexes instead of string scans. Free-text
+matching goes through a trigram FTS5 index when SQLite provides one.
+
+Dashboard statistics and facet counts (file type, camera model, lens, year,
+has GPS) are materialized: each file's facet values live in file_facets and
+triggers keep facet_counts, stats_totals and hash_counts up to date inside the
+same transaction as every insert, update and delete, so get_statistics() and
+facet_search() never GROUP BY the whole library. check_aggregates() compares
+them with a from-scratch computation and rebuild_aggregates() recomputes them.
 """
 
 import sqlite3
 import json
+import math
 import os
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import re
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+from datetime import datetime, timezone
 from pathlib import Path
-import hashlib
+
+try:
+    from ..utils.hashing import hash_file
+    from ..utils.date_parsing import timestamp_to_epoch
+except ImportError:
+    from utils.hashing import hash_file
+    from utils.date_parsing import timestamp_to_epoch
 
 
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data', 'metadata.db')
 _DB_INITIALIZED = False
 
+# Set by init_database(): whether metadata_fts (FTS5, trigram tokenizer) exists
+FTS5_AVAILABLE = False
+
+# Trigram matching needs at least this many characters
+_FTS_MIN_CHARS = 3
+
+# Rows fetched per IN (...) chunk when hydrating search results
+_HYDRATE_CHUNK = 500
+
+_NUMBER_RE = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$")
+_RATIONAL_RE = re.compile(r"^([+-]?\d+)/(\d+)$")
+# A number followed by a unit, e.g. "24.0 mm", "3200 ISO", "5.2 MB"
+_NUMBER_UNIT_RE = re.compile(r"^([+-]?(?:\d+(?:\.\d*)?|\.\d+))\s*[A-Za-z%\u00b0\u00b5][A-Za-z/%\u00b0\u00b5 ]*$")
+
+# Facets materialized per file. file_type comes from files; the others are
+# derived from metadata by _facet_values()
+FACETS = ("file_type", "camera_model", "lens", "year", "has_gps")
+
+# Keys tried, in order, for the year facet (any category)
+_YEAR_KEYS = ("DateTimeOriginal", "CreateDate", "DateTimeDigitized", "date_taken", "DateTime", "created")
+
+# Counters kept in stats_totals
+_TOTALS = ("total_files", "total_size_bytes", "unique_files", "total_favorites")
+
+# (latitude key, longitude key) pairs recognised as a file's location
+_LOCATION_KEYS = (
+    ("latitude_decimal", "longitude_decimal"),
+    ("gps_latitude_decimal", "gps_longitude_decimal"),
+    ("latitude", "longitude"),
+    ("gps_latitude", "gps_longitude"),
+    ("GPSLatitude", "GPSLongitude"),
+    ("lat", "lon"),
+)
+
 
 def _open_connection() -> sqlite3.Connection:
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
@@ -22,6 +78,8 @@ def _open_connection() -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
+    # INSERT OR REPLACE must fire DELETE triggers so the aggregates stay exact
+    conn.execute("PRAGMA recursive_triggers=ON")
     return conn
 
 
@@ -58,6 +116,8 @@ def init_database():
             category TEXT,
             key TEXT,
             value TEXT,
+            value_num REAL,
+            value_time REAL,
             PRIMARY KEY (file_id, category, key),
             FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
         )
@@ -105,13 +165,92 @@ def init_database():
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_files_type ON files(file_type)
     """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_files_extracted ON files(extracted_at)
+    """)
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_metadata_category ON metadata(category)
     """)
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_metadata_key ON metadata(key)
     """)
-    
+
+    # Lightweight migration for metadata tables created before typed columns
+    cursor.execute("PRAGMA table_info(metadata)")
+    metadata_columns = {row[1] for row in cursor.fetchall()}
+    backfill_typed = "value_num" not in metadata_columns
+    if backfill_typed:
+        cursor.execute("ALTER TABLE metadata ADD COLUMN value_num REAL")
+        cursor.execute("ALTER TABLE metadata ADD COLUMN value_time REAL")
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_metadata_text ON metadata(category, key, value)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_metadata_num ON metadata(category, key, value_num)
+        WHERE value_num IS NOT NULL
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_metadata_time ON metadata(category, key, value_time)
+        WHERE value_time IS NOT NULL
+    """)
+
+    backfill_locations = not _table_exists(cursor, "file_locations")
+    if backfill_locations:
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE file_locations
+                USING rtree(file_id, min_lat, max_lat, min_lon, max_lon)
+            """)
+        except sqlite3.OperationalError:
+            # SQLite built without R*Tree: same columns, B-tree index
+            cursor.execute("""
+                CREATE TABLE file_locations (
+                    file_id INTEGER PRIMARY KEY,
+                    min_lat REAL, max_lat REAL, min_lon REAL, max_lon REAL
+                )
+            """)
+            cursor.execute("CREATE INDEX idx_file_locations ON file_locations(min_lat, min_lon)")
+
+    backfill_fts = False
+    if not _table_exists(cursor, "metadata_fts"):
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE metadata_fts
+                USING fts5(value, content='', tokenize='trigram')
+            """)
+            backfill_fts = True
+        except sqlite3.OperationalError:
+            pass
+    global FTS5_AVAILABLE
+    FTS5_AVAILABLE = _table_exists(cursor, "metadata_fts")
+    if FTS5_AVAILABLE:
+        # Contentless index keyed by metadata rowid; deletes must pass the old value
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS metadata_fts_insert AFTER INSERT ON metadata BEGIN
+                INSERT INTO metadata_fts(rowid, value) VALUES (new.rowid, new.value);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS metadata_fts_delete AFTER DELETE ON metadata BEGIN
+                INSERT INTO metadata_fts(metadata_fts, rowid, value) VALUES ('delete', old.rowid, old.value);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS metadata_fts_update AFTER UPDATE OF value ON metadata BEGIN
+                INSERT INTO metadata_fts(metadata_fts, rowid, value) VALUES ('delete', old.rowid, old.value);
+                INSERT INTO metadata_fts(rowid, value) VALUES (new.rowid, new.value);
+            END
+        """)
+
+    if backfill_typed or backfill_locations or backfill_fts:
+        _backfill_derived(cursor, backfill_typed, backfill_locations, backfill_fts)
+
+    backfill_aggregates = not _table_exists(cursor, "stats_totals")
+    _create_aggregates(cursor)
+    if backfill_aggregates:
+        _rebuild_aggregates(cursor)
+
     # Lightweight migration for older version_history schema
     cursor.execute("PRAGMA table_info(version_history)")
     columns = {row[1] for row in cursor.fetchall()}
@@ -124,13 +263,159 @@ def init_database():
     conn.close()
 
 
+def _table_exists(cursor: sqlite3.Cursor, name: str) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,))
+    return cursor.fetchone() is not None
+
+
+def _create_aggregates(cursor: sqlite3.Cursor) -> None:
+    """Facet and statistics tables plus the triggers that maintain them."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS file_facets (
+            file_id INTEGER NOT NULL,
+            facet TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (file_id, facet)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_file_facets_value ON file_facets(facet, value)
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS facet_counts (
+            facet TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (facet, value)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS hash_counts (
+            file_hash TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS stats_totals (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO stats_totals (name, value) VALUES (?, 0)", [(name,) for name in _TOTALS]
+    )
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS file_facets_insert AFTER INSERT ON file_facets BEGIN
+            INSERT INTO facet_counts (facet, value, count) VALUES (new.facet, new.value, 1)
+                ON CONFLICT (facet, value) DO UPDATE SET count = count + 1;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS file_facets_delete AFTER DELETE ON file_facets BEGIN
+            UPDATE facet_counts SET count = count - 1 WHERE facet = old.facet AND value = old.value;
+            DELETE FROM facet_counts WHERE facet = old.facet AND value = old.value AND count <= 0;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS file_facets_update AFTER UPDATE OF facet, value ON file_facets BEGIN
+            UPDATE facet_counts SET count = count - 1 WHERE facet = old.facet AND value = old.value;
+            DELETE FROM facet_counts WHERE facet = old.facet AND value = old.value AND count <= 0;
+            INSERT INTO facet_counts (facet, value, count) VALUES (new.facet, new.value, 1)
+                ON CONFLICT (facet, value) DO UPDATE SET count = count + 1;
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS files_aggregates_insert AFTER INSERT ON files BEGIN
+            UPDATE stats_totals SET value = value + 1 WHERE name = 'total_files';
+            UPDATE stats_totals SET value = value + COALESCE(new.file_size, 0) WHERE name = 'total_size_bytes';
+            INSERT INTO hash_counts (file_hash, count) VALUES (new.file_hash, 1)
+                ON CONFLICT (file_hash) DO UPDATE SET count = count + 1;
+            UPDATE stats_totals SET value = value + 1
+                WHERE name = 'unique_files' AND (SELECT count FROM hash_counts WHERE file_hash = new.file_hash) = 1;
+            INSERT OR REPLACE INTO file_facets (file_id, facet, value)
+                VALUES (new.id, 'file_type', COALESCE(new.file_type, ''));
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS files_aggregates_delete AFTER DELETE ON files BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'total_files';
+            UPDATE stats_totals SET value = value - COALESCE(old.file_size, 0) WHERE name = 'total_size_bytes';
+            UPDATE hash_counts SET count = count - 1 WHERE file_hash = old.file_hash;
+            UPDATE stats_totals SET value = value - 1
+                WHERE name = 'unique_files' AND (SELECT count FROM hash_counts WHERE file_hash = old.file_hash) = 0;
+            DELETE FROM hash_counts WHERE file_hash = old.file_hash AND count <= 0;
+            DELETE FROM file_facets WHERE file_id = old.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS files_aggregates_update AFTER UPDATE OF file_hash, file_size, file_type ON files
+        BEGIN
+            UPDATE stats_totals SET value = value + COALESCE(new.file_size, 0) - COALESCE(old.file_size, 0)
+                WHERE name = 'total_size_bytes';
+            UPDATE hash_counts SET count = count - 1
+                WHERE file_hash = old.file_hash AND new.file_hash IS NOT old.file_hash;
+            UPDATE stats_totals SET value = value - 1
+                WHERE name = 'unique_files' AND new.file_hash IS NOT old.file_hash
+                AND (SELECT count FROM hash_counts WHERE file_hash = old.file_hash) = 0;
+            DELETE FROM hash_counts WHERE file_hash = old.file_hash AND count <= 0;
+            INSERT INTO hash_counts (file_hash, count) SELECT new.file_hash, 1 WHERE new.file_hash IS NOT old.file_hash
+                ON CONFLICT (file_hash) DO UPDATE SET count = count + 1;
+            UPDATE stats_totals SET value = value + 1
+                WHERE name = 'unique_files' AND new.file_hash IS NOT old.file_hash
+                AND (SELECT count FROM hash_counts WHERE file_hash = new.file_hash) = 1;
+            UPDATE file_facets SET value = COALESCE(new.file_type, '')
+                WHERE file_id = new.id AND facet = 'file_type' AND value IS NOT COALESCE(new.file_type, '');
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS favorites_aggregates_insert AFTER INSERT ON favorites BEGIN
+            UPDATE stats_totals SET value = value + 1 WHERE name = 'total_favorites';
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS favorites_aggregates_delete AFTER DELETE ON favorites BEGIN
+            UPDATE stats_totals SET value = value - 1 WHERE name = 'total_favorites';
+        END
+    """)
+
+
+def _backfill_derived(
+    cursor: sqlite3.Cursor,
+    typed: bool,
+    locations: bool,
+    fts: bool,
+) -> None:
+    """Populate typed columns, locations and the FTS index for pre-existing rows."""
+    if fts:
+        cursor.execute("INSERT INTO metadata_fts(rowid, value) SELECT rowid, value FROM metadata")
+    if not (typed or locations):
+        return
+
+    rows = cursor.execute(
+        "SELECT rowid, file_id, category, key, value FROM metadata ORDER BY file_id"
+    ).fetchall()
+    updates = []
+    by_file: Dict[int, Dict[tuple, str]] = {}
+    for rowid, file_id, category, key, value in rows:
+        if typed:
+            value_num, value_time = _typed_columns(value)
+            if value_num is not None or value_time is not None:
+                updates.append((value_num, value_time, rowid))
+        if locations:
+            by_file.setdefault(file_id, {})[(category, key)] = value
+    if updates:
+        cursor.executemany(
+            "UPDATE metadata SET value_num = ?, value_time = ? WHERE rowid = ?", updates
+        )
+    for file_id, flat in by_file.items():
+        _store_location(cursor, file_id, flat)
+
+
 def file_hash(filepath: str) -> str:
     """Calculate SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+    return hash_file(filepath, ("sha256",))["sha256"]
 
 
 def _stringify_value(value: Any) -> str:
@@ -161,6 +446,114 @@ def _flatten_metadata(metadata: Dict[str, Any]) -> Dict[tuple, str]:
     return flat
 
 
+def _typed_columns(text: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+    """(value_num, value_time) shadow values for a stored text value."""
+    if not text or len(text) > 64:
+        return None, None
+    text = text.strip()
+    if _NUMBER_RE.match(text):
+        number = float(text)
+        return (number if math.isfinite(number) else None), None
+    match = _RATIONAL_RE.match(text)
+    if match:
+        denominator = int(match.group(2))
+        return (int(match.group(1)) / denominator if denominator else None), None
+    match = _NUMBER_UNIT_RE.match(text)
+    if match:
+        return float(match.group(1)), None
+    return None, _parse_datetime(text)
+
+
+def _parse_datetime(text: str) -> Optional[float]:
+    """UTC epoch seconds for any shape the shared timestamp parser knows; naive times count as UTC."""
+    return timestamp_to_epoch(text)
+
+
+def _extract_location(flat_metadata: Dict[tuple, str]) -> Optional[Tuple[float, float]]:
+    by_category: Dict[str, Dict[str, str]] = {}
+    for (category, key), value in flat_metadata.items():
+        by_category.setdefault(category, {})[key] = value
+    for fields in by_category.values():
+        for lat_key, lon_key in _LOCATION_KEYS:
+            if lat_key not in fields or lon_key not in fields:
+                continue
+            lat, _ = _typed_columns(fields[lat_key])
+            lon, _ = _typed_columns(fields[lon_key])
+            if lat is None or lon is None:
+                continue
+            if fields.get(lat_key + "Ref", "").upper().startswith("S"):
+                lat = -abs(lat)
+            if fields.get(lon_key + "Ref", "").upper().startswith("W"):
+                lon = -abs(lon)
+            if -90 <= lat <= 90 and -180 <= lon <= 180 and (lat, lon) != (0.0, 0.0):
+                return lat, lon
+    return None
+
+
+def _store_location(cursor: sqlite3.Cursor, file_id: int, flat_metadata: Dict[tuple, str]) -> bool:
+    cursor.execute("DELETE FROM file_locations WHERE file_id = ?", (file_id,))
+    location = _extract_location(flat_metadata)
+    if location:
+        lat, lon = location
+        cursor.execute(
+            "INSERT INTO file_locations (file_id, min_lat, max_lat, min_lon, max_lon) VALUES (?, ?, ?, ?, ?)",
+            (file_id, lat, lat, lon, lon),
+        )
+    return location is not None
+
+
+def _facet_values(flat_metadata: Dict[tuple, str], has_location: bool) -> Dict[str, str]:
+    """Metadata-derived facet values for one file (file_type is handled by triggers on files)."""
+    values = {"has_gps": "true" if has_location else "false"}
+    camera_model = flat_metadata.get(("normalized", "camera_model"))
+    if camera_model:
+        values["camera_model"] = camera_model
+    lens = flat_metadata.get(("normalized", "lens_model"))
+    if lens:
+        values["lens"] = lens
+    for year_key in _YEAR_KEYS:
+        for (_category, key), value in flat_metadata.items():
+            if key != year_key:
+                continue
+            moment = _parse_datetime(value.strip())
+            if moment is not None:
+                values["year"] = str(datetime.fromtimestamp(moment, timezone.utc).year)
+                return values
+    return values
+
+
+def _store_facets(cursor: sqlite3.Cursor, file_id: int, facets: Dict[str, str]) -> None:
+    """Replace a file's derived facets, touching only rows whose value changed."""
+    cursor.execute(
+        f"DELETE FROM file_facets WHERE file_id = ? AND facet != 'file_type'"
+        f" AND facet NOT IN ({', '.join('?' * len(facets))})",
+        (file_id, *facets),
+    )
+    cursor.executemany(
+        """
+        INSERT INTO file_facets (file_id, facet, value) VALUES (?, ?, ?)
+        ON CONFLICT (file_id, facet) DO UPDATE SET value = excluded.value WHERE value != excluded.value
+    """,
+        [(file_id, facet, value) for facet, value in facets.items()],
+    )
+
+
+def _insert_metadata_rows(cursor: sqlite3.Cursor, file_id: int, flat_metadata: Dict[tuple, str]) -> None:
+    """Insert a file's flattened metadata with its typed shadow columns, location and facets."""
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO metadata (file_id, category, key, value, value_num, value_time)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+        [
+            (file_id, category, key, value, *_typed_columns(value))
+            for (category, key), value in flat_metadata.items()
+        ],
+    )
+    has_location = _store_location(cursor, file_id, flat_metadata)
+    _store_facets(cursor, file_id, _facet_values(flat_metadata, has_location))
+
+
 def _record_changes(
     cursor: sqlite3.Cursor,
     file_id: int,
@@ -221,14 +614,7 @@ def store_file_metadata(
                 (file_path, file_hash_val, file_size, file_mtime, file_type, now, now),
             )
             file_id = cursor.lastrowid
-            for (category, key), value in flat_metadata.items():
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO metadata (file_id, category, key, value)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (file_id, category, key, value),
-                )
+            _insert_metadata_rows(cursor, file_id, flat_metadata)
         else:
             file_id = row["id"]
             cursor.execute(
@@ -282,14 +668,7 @@ def store_file_metadata(
                     (file_hash_val, file_size, file_mtime, file_type, now, now, file_id),
                 )
                 cursor.execute("DELETE FROM metadata WHERE file_id = ?", (file_id,))
-                for (category, key), value in flat_metadata.items():
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO metadata (file_id, category, key, value)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        (file_id, category, key, value),
-                    )
+                _insert_metadata_rows(cursor, file_id, flat_metadata)
                 if changes:
                     _record_changes(cursor, file_id, changes, now)
             else:
@@ -333,42 +712,83 @@ def store_file_metadata(
         conn.close()
 
 
+def _chunks(ids: List[int], size: int = _HYDRATE_CHUNK) -> Iterable[List[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _hydrate_files(cursor: sqlite3.Cursor, file_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    get_file_metadata()-shaped records for file_ids, in the given order.
+
+    One joined query per chunk of ids replaces the per-file lookups of
+    files, metadata, perceptual_hashes and favorites.
+    """
+    records: Dict[int, Dict[str, Any]] = {}
+    for chunk in _chunks(list(dict.fromkeys(file_ids))):
+        placeholders = ", ".join("?" * len(chunk))
+        cursor.execute(
+            f"""
+            SELECT f.id, f.file_path, f.file_hash, f.file_size, f.file_type, f.extracted_at, f.last_updated,
+                   m.category, m.key, m.value,
+                   ph.file_id AS ph_file_id, ph.phash, ph.dhash, ph.ahash, ph.whash, ph.blockhash,
+                   fav.file_id IS NOT NULL AS is_favorite
+            FROM files f
+            LEFT JOIN metadata m ON m.file_id = f.id
+            LEFT JOIN perceptual_hashes ph ON ph.file_id = f.id
+            LEFT JOIN favorites fav ON fav.file_id = f.id
+            WHERE f.id IN ({placeholders})
+        """,
+            chunk,
+        )
+        for row in cursor.fetchall():
+            record = records.get(row["id"])
+            if record is None:
+                record = records[row["id"]] = {
+                    "file_path": row["file_path"],
+                    "file_hash": row["file_hash"],
+                    "file_size": row["file_size"],
+                    "file_type": row["file_type"],
+                    "extracted_at": row["extracted_at"],
+                    "last_updated": row["last_updated"],
+                    "metadata": {},
+                }
+                if row["ph_file_id"] is not None:
+                    record["perceptual_hashes"] = {
+                        "file_id": row["ph_file_id"],
+                        "phash": row["phash"],
+                        "dhash": row["dhash"],
+                        "ahash": row["ahash"],
+                        "whash": row["whash"],
+                        "blockhash": row["blockhash"],
+                    }
+                record["is_favorite"] = bool(row["is_favorite"])
+            if row["category"] is not None:
+                record["metadata"].setdefault(row["category"], {})[row["key"]] = row["value"]
+    return [records[file_id] for file_id in file_ids if file_id in records]
+
+
+def _metadata_by_file(cursor: sqlite3.Cursor, file_ids: List[int]) -> Dict[int, Dict[str, Dict[str, str]]]:
+    metadata: Dict[int, Dict[str, Dict[str, str]]] = {file_id: {} for file_id in file_ids}
+    for chunk in _chunks(list(metadata)):
+        placeholders = ", ".join("?" * len(chunk))
+        cursor.execute(
+            f"SELECT file_id, category, key, value FROM metadata WHERE file_id IN ({placeholders})",
+            chunk,
+        )
+        for row in cursor.fetchall():
+            metadata[row["file_id"]].setdefault(row["category"], {})[row["key"]] = row["value"]
+    return metadata
+
+
 def get_file_metadata(file_id: int) -> Optional[Dict[str, Any]]:
     """Retrieve all metadata for a file."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT file_path, file_hash, file_size, file_type, extracted_at, last_updated FROM files WHERE id = ?", (file_id,))
-    file_row = cursor.fetchone()
-    
-    if not file_row:
+    try:
+        records = _hydrate_files(conn.cursor(), [file_id])
+    finally:
         conn.close()
-        return None
-    
-    result = dict(file_row)
-    
-    cursor.execute("SELECT category, key, value FROM metadata WHERE file_id = ?", (file_id,))
-    metadata = {}
-    for row in cursor.fetchall():
-        cat = row["category"]
-        if cat not in metadata:
-            metadata[cat] = {}
-        metadata[cat][row["key"]] = row["value"]
-    
-    result["metadata"] = metadata
-    
-    cursor.execute("SELECT * FROM perceptual_hashes WHERE file_id = ?", (file_id,))
-    hash_row = cursor.fetchone()
-    if hash_row:
-        result["perceptual_hashes"] = dict(hash_row)
-    
-    cursor.execute("SELECT * FROM favorites WHERE file_id = ?", (file_id,))
-    fav_row = cursor.fetchone()
-    result["is_favorite"] = bool(fav_row)
-    
-    conn.close()
-    
-    return result
+    return records[0] if records else None
 
 
 def search_metadata(
@@ -433,19 +853,10 @@ def search_metadata(
     
     cursor.execute(query, params)
     
-    results = []
-    for row in cursor.fetchall():
-        file_data = dict(row)
-        file_data["metadata"] = {}
-        
-        cursor.execute("SELECT category, key, value FROM metadata WHERE file_id = ?", (file_data["id"],))
-        for m_row in cursor.fetchall():
-            cat = m_row["category"]
-            if cat not in file_data["metadata"]:
-                file_data["metadata"][cat] = {}
-            file_data["metadata"][cat][m_row["key"]] = m_row["value"]
-        
-        results.append(file_data)
+    results = [dict(row) for row in cursor.fetchall()]
+    metadata = _metadata_by_file(cursor, [file_data["id"] for file_data in results])
+    for file_data in results:
+        file_data["metadata"] = metadata[file_data["id"]]
     
     conn.close()
     return results
@@ -564,6 +975,17 @@ def _parse_simple_query(query: str) -> List[tuple]:
         part = part.strip()
         if not part:
             continue
+        lowered = part.lower()
+        if lowered.startswith("bbox:"):
+            try:
+                lat1, lon1, lat2, lon2 = (float(v) for v in part[5:].split(","))
+            except ValueError:
+                continue
+            conditions.append(("geo", "WITHIN", (min(lat1, lat2), min(lon1, lon2), max(lat1, lat2), max(lon1, lon2))))
+            continue
+        if lowered.startswith("text:"):
+            conditions.append(("*", "CONTAINS", part[5:].strip().strip('"').strip("'")))
+            continue
         part = _expand_shortcut(part)
         for op in [">=", "<=", "!=", ">", "<", "=", " LIKE ", " CONTAINS "]:
             if op in part:
@@ -576,24 +998,59 @@ def _parse_simple_query(query: str) -> List[tuple]:
     return conditions
 
 
-def search_metadata_query(query: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
-    """Search metadata using a simple query language."""
-    conditions = _parse_simple_query(query)
-    if not conditions:
-        return []
+def _fts_phrase(value: Any) -> Optional[str]:
+    """Trigram FTS5 phrase equivalent to LIKE '%value%', or None if it cannot be used."""
+    text = str(value)
+    if not FTS5_AVAILABLE or len(text) < _FTS_MIN_CHARS or "%" in text or "_" in text:
+        return None
+    return '"' + text.replace('"', '""') + '"'
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
 
-    base_query = """
-        SELECT DISTINCT f.id, f.file_path, f.file_hash, f.file_size, f.file_type, f.extracted_at, f.file_mtime
-        FROM files f
-    """
-    joins: List[str] = []
+def _year_boundary(operator: str, value: Any) -> Optional[Tuple[str, float]]:
+    """value_time comparison equivalent to "year <op> value" for a bare 4-digit year."""
+    if not isinstance(value, int) or not 1000 <= value <= 9999:
+        return None
+    # "> 2023" and "<= 2023" split at the start of 2024; ">= 2023" and "< 2023" at 2023
+    year = value + 1 if operator in (">", "<=") else value
+    moment = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp() if year <= 9999 else math.inf
+    return (">=" if operator in (">", ">=") else "<"), moment
+
+
+def _metadata_predicate(operator: str, value: Any) -> Tuple[str, List[Any]]:
+    """WHERE fragment on one metadata row for a field condition, and its params."""
+    if operator in ("LIKE", "CONTAINS"):
+        phrase = _fts_phrase(value)
+        if phrase:
+            return "rowid IN (SELECT rowid FROM metadata_fts WHERE metadata_fts MATCH ?)", [phrase]
+        return "LOWER(value) LIKE LOWER(?)", [f"%{value}%"]
+    if operator in (">", "<", ">=", "<="):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            boundary = _year_boundary(operator, value)
+            if boundary is None:
+                return f"value_num {operator} ?", [value]
+            # A bare year on a date field compares the year, as the old
+            # CAST(value AS REAL) on "2023:11:02 ..." text did
+            time_operator, moment = boundary
+            return (f"(value_num {operator} ? OR (value_num IS NULL AND value_time {time_operator} ?))",
+                    [value, moment])
+        moment = _parse_datetime(str(value))
+        if moment is not None:
+            return f"value_time {operator} ?", [moment]
+        return f"value {operator} ?", [str(value)]
+    if operator == "!=":
+        return "value != ?", [str(value)]
+    return "value = ?", [str(value)]
+
+
+def _search_filter(conditions: List[tuple]) -> Tuple[List[str], List[Any]]:
+    """WHERE fragments on `files f` (and their params) for parsed query conditions."""
     where: List[str] = []
     params: List[Any] = []
+    # Terms on the same field share one metadata subquery, so a range such as
+    # "iso>=400 AND iso<1600" is a single scan of the (category, key, value_num) index
+    field_terms: Dict[Tuple[str, str], List[Tuple[str, List[Any]]]] = {}
 
-    for idx, (field, operator, value) in enumerate(conditions):
+    for field, operator, value in conditions:
         if field.startswith("file."):
             column = field.split(".", 1)[1]
             if operator in ("LIKE", "CONTAINS"):
@@ -604,47 +1061,83 @@ def search_metadata_query(query: str, limit: int = 100, offset: int = 0) -> List
                 params.append(value)
             continue
 
+        if operator == "WITHIN":
+            min_lat, min_lon, max_lat, max_lon = value
+            where.append(
+                "f.id IN (SELECT file_id FROM file_locations"
+                " WHERE min_lat >= ? AND max_lat <= ? AND min_lon >= ? AND max_lon <= ?)"
+            )
+            params.extend([min_lat, max_lat, min_lon, max_lon])
+            continue
+
+        if field == "*":
+            phrase = _fts_phrase(value)
+            if phrase:
+                where.append(
+                    "f.id IN (SELECT file_id FROM metadata WHERE rowid IN"
+                    " (SELECT rowid FROM metadata_fts WHERE metadata_fts MATCH ?))"
+                )
+                params.append(phrase)
+            else:
+                where.append("f.id IN (SELECT file_id FROM metadata WHERE LOWER(value) LIKE LOWER(?))")
+                params.append(f"%{value}%")
+            continue
+
         if "." in field:
             category, key = field.split(".", 1)
         else:
             category, key = "normalized", field
 
-        alias = f"m{idx}"
-        joins.append(
-            f"JOIN metadata {alias} ON f.id = {alias}.file_id AND {alias}.category = ? AND {alias}.key = ?"
+        if category == "facet" and operator in ("=", "!="):
+            negate = "NOT " if operator == "!=" else ""
+            where.append(f"f.id {negate}IN (SELECT file_id FROM file_facets WHERE facet = ? AND value = ?)")
+            params.extend([key, str(value)])
+            continue
+
+        field_terms.setdefault((category, key), []).append(_metadata_predicate(operator, value))
+
+    for (category, key), predicates in field_terms.items():
+        where.append(
+            "f.id IN (SELECT file_id FROM metadata WHERE category = ? AND key = ? AND "
+            + " AND ".join(sql for sql, _ in predicates)
+            + ")"
         )
         params.extend([category, key])
+        for _, predicate_params in predicates:
+            params.extend(predicate_params)
+
+    return where, params
 
-        if operator in ("LIKE", "CONTAINS"):
-            where.append(f"LOWER({alias}.value) LIKE LOWER(?)")
-            params.append(f"%{value}%")
-        elif operator in (">", "<", ">=", "<="):
-            where.append(f"CAST({alias}.value AS REAL) {operator} ?")
-            params.append(value)
-        elif operator == "!=":
-            where.append(f"{alias}.value != ?")
-            params.append(str(value))
-        else:
-            where.append(f"{alias}.value = ?")
-            params.append(str(value))
 
-    query_sql = base_query + " " + " ".join(joins)
+def search_metadata_query(query: str, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    """
+    Search metadata using a simple query language.
+
+    Besides `category.key OP value` terms joined with AND, supports
+    `bbox:lat1,lon1,lat2,lon2` for files located inside a bounding box,
+    `text:words` for a substring match against any stored value and
+    `facet.name=value` to filter on a materialized facet (see FACETS).
+    """
+    conditions = _parse_simple_query(query)
+    if not conditions:
+        return []
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    where, params = _search_filter(conditions)
+
+    query_sql = "SELECT f.id FROM files f"
     if where:
         query_sql += " WHERE " + " AND ".join(where)
     query_sql += " ORDER BY f.extracted_at DESC LIMIT ? OFFSET ?"
     params.extend([limit, offset])
 
-    cursor.execute(query_sql, params)
-    rows = cursor.fetchall()
-    conn.close()
-
-    results = []
-    for row in rows:
-        file_id = row["id"]
-        file_data = get_file_metadata(file_id)
-        if file_data:
-            results.append(file_data)
-    return results
+    try:
+        cursor.execute(query_sql, params)
+        file_ids = [row["id"] for row in cursor.fetchall()]
+        return _hydrate_files(cursor, file_ids)
+    finally:
+        conn.close()
 
 
 def find_similar_images(
@@ -746,6 +1239,9 @@ def delete_file(file_id: int) -> bool:
     
     cursor.execute("DELETE FROM files WHERE id = ?", (file_id,))
     deleted = cursor.rowcount > 0
+    # Foreign keys are not enforced on these connections, so no cascade
+    cursor.execute("DELETE FROM metadata WHERE file_id = ?", (file_id,))
+    cursor.execute("DELETE FROM file_locations WHERE file_id = ?", (file_id,))
     
     conn.commit()
     conn.close()
@@ -754,27 +1250,215 @@ def delete_file(file_id: int) -> bool:
 
 
 def get_statistics() -> Dict[str, Any]:
-    """Get database statistics."""
+    """Get database statistics from the materialized aggregates."""
     conn = get_db_connection()
     cursor = conn.cursor()
     
-    stats = {}
-    
-    cursor.execute("SELECT COUNT(*) FROM files")
-    stats["total_files"] = cursor.fetchone()[0]
+    cursor.execute("SELECT name, value FROM stats_totals")
+    totals = {row[0]: row[1] for row in cursor.fetchall()}
     
-    cursor.execute("SELECT COUNT(*) FROM favorites")
-    stats["total_favorites"] = cursor.fetchone()[0]
+    stats = {
+        "total_files": totals.get("total_files", 0),
+        "total_favorites": totals.get("total_favorites", 0),
+    }
     
-    cursor.execute("SELECT file_type, COUNT(*) FROM files GROUP BY file_type")
+    cursor.execute("SELECT value, count FROM facet_counts WHERE facet = 'file_type'")
     stats["by_type"] = {row[0]: row[1] for row in cursor.fetchall()}
     
-    cursor.execute("SELECT SUM(file_size) FROM files")
-    stats["total_size_bytes"] = cursor.fetchone()[0] or 0
-    
-    cursor.execute("SELECT COUNT(DISTINCT file_hash) FROM files")
-    stats["unique_files"] = cursor.fetchone()[0]
+    stats["total_size_bytes"] = totals.get("total_size_bytes", 0)
+    stats["unique_files"] = totals.get("unique_files", 0)
     
     conn.close()
     
     return stats
+
+
+def _facet_rows(rows: Iterable[sqlite3.Row], facet_limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    facets: Dict[str, List[Dict[str, Any]]] = {}
+    for facet, value, count in rows:
+        bucket = facets.setdefault(facet, [])
+        if len(bucket) < facet_limit:
+            bucket.append({"value": value, "count": count})
+    return facets
+
+
+def get_facet_counts(facets: Optional[List[str]] = None, facet_limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
+    """Library-wide counts per facet value, most frequent first."""
+    return facet_search("", facets=facets, limit=0, facet_limit=facet_limit)["facets"]
+
+
+def facet_search(
+    query: str = "",
+    facets: Optional[List[str]] = None,
+    limit: int = 100,
+    offset: int = 0,
+    facet_limit: int = 20,
+) -> Dict[str, Any]:
+    """
+    Search with per-facet hit counts for the current filter set.
+
+    Returns {"total", "results", "facets"} where results is the
+    search_metadata_query() page and facets maps each requested facet to
+    [{"value", "count"}] for files matching the query. An empty query reads
+    facet_counts directly; otherwise the counts are one grouped scan of
+    file_facets restricted to the matching files.
+    """
+    facets = [facet for facet in (facets or FACETS) if facet in FACETS]
+    conditions = _parse_simple_query(query) if query.strip() else []
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        facet_placeholders = ", ".join("?" * len(facets))
+        if not conditions:
+            cursor.execute("SELECT value FROM stats_totals WHERE name = 'total_files'")
+            row = cursor.fetchone()
+            total = row[0] if row else 0
+            cursor.execute(
+                f"SELECT facet, value, count FROM facet_counts WHERE facet IN ({facet_placeholders})"
+                " ORDER BY facet, count DESC, value",
+                facets,
+            )
+            facet_counts = _facet_rows(cursor.fetchall(), facet_limit)
+            page_sql, page_params = "SELECT f.id FROM files f", []
+        else:
+            where, params = _search_filter(conditions)
+            hits_sql = "SELECT f.id FROM files f WHERE " + " AND ".join(where) if where else "SELECT f.id FROM files f"
+            cursor.execute(
+                f"""
+                WITH hits AS MATERIALIZED ({hits_sql})
+                SELECT '', '', COUNT(*) FROM hits
+                UNION ALL
+                SELECT * FROM (
+                    SELECT ff.facet, ff.value, COUNT(*) AS count
+                    FROM hits CROSS JOIN file_facets ff ON ff.file_id = hits.id
+                    WHERE ff.facet IN ({facet_placeholders})
+                    GROUP BY ff.facet, ff.value
+                    ORDER BY ff.facet, count DESC, ff.value
+                )
+            """,
+                [*params, *facets],
+            )
+            rows = cursor.fetchall()
+            total = rows[0][2]
+            facet_counts = _facet_rows(rows[1:], facet_limit)
+            page_sql, page_params = hits_sql, params
+
+        file_ids: List[int] = []
+        if limit > 0 and total:
+            cursor.execute(
+                page_sql + " ORDER BY f.extracted_at DESC LIMIT ? OFFSET ?", [*page_params, limit, offset]
+            )
+            file_ids = [row[0] for row in cursor.fetchall()]
+        return {
+            "total": total,
+            "results": _hydrate_files(cursor, file_ids),
+            "facets": {facet: facet_counts.get(facet, []) for facet in facets},
+        }
+    finally:
+        conn.close()
+
+
+def _derived_facets(conn: sqlite3.Connection) -> Iterable[Tuple[int, str, str]]:
+    """(file_id, facet, value) for every file, computed from files and metadata."""
+    locations = {row[0] for row in conn.execute("SELECT file_id FROM file_locations")}
+    current_id: Optional[int] = None
+    flat: Dict[tuple, str] = {}
+    rows = conn.execute("""
+        SELECT f.id, f.file_type, m.category, m.key, m.value
+        FROM files f LEFT JOIN metadata m ON m.file_id = f.id
+        ORDER BY f.id
+    """)
+    for file_id, file_type, category, key, value in rows:
+        if file_id != current_id:
+            if current_id is not None:
+                for facet, facet_value in _facet_values(flat, current_id in locations).items():
+                    yield current_id, facet, facet_value
+            current_id, flat = file_id, {}
+            yield file_id, "file_type", file_type or ""
+        if category is not None:
+            flat[(category, key)] = value
+    if current_id is not None:
+        for facet, facet_value in _facet_values(flat, current_id in locations).items():
+            yield current_id, facet, facet_value
+
+
+def _rebuild_aggregates(cursor: sqlite3.Cursor) -> None:
+    # Empty facet_counts first so the triggers fired below count up from zero
+    cursor.execute("DELETE FROM file_facets")
+    cursor.execute("DELETE FROM facet_counts")
+    batch: List[Tuple[int, str, str]] = []
+    for row in _derived_facets(cursor.connection):
+        batch.append(row)
+        if len(batch) >= 10000:
+            cursor.executemany("INSERT INTO file_facets (file_id, facet, value) VALUES (?, ?, ?)", batch)
+            batch = []
+    cursor.executemany("INSERT INTO file_facets (file_id, facet, value) VALUES (?, ?, ?)", batch)
+
+    cursor.execute("DELETE FROM hash_counts")
+    cursor.execute("INSERT INTO hash_counts (file_hash, count) SELECT file_hash, COUNT(*) FROM files GROUP BY file_hash")
+    cursor.executemany(
+        "INSERT OR REPLACE INTO stats_totals (name, value) VALUES (?, ?)",
+        list(_computed_totals(cursor).items()),
+    )
+
+
+def _computed_totals(cursor: sqlite3.Cursor) -> Dict[str, int]:
+    cursor.execute("SELECT COUNT(*), COALESCE(SUM(file_size), 0), COUNT(DISTINCT file_hash) FROM files")
+    total_files, total_size, unique_files = cursor.fetchone()
+    cursor.execute("SELECT COUNT(*) FROM favorites")
+    return {
+        "total_files": total_files,
+        "total_size_bytes": total_size,
+        "unique_files": unique_files,
+        "total_favorites": cursor.fetchone()[0],
+    }
+
+
+def check_aggregates(repair: bool = False) -> Dict[str, Any]:
+    """
+    Compare the materialized aggregates with a from-scratch computation.
+
+    Facets are re-derived from metadata, so drift from writes that bypassed
+    this module is caught too. Returns {"consistent": bool, "totals": {name:
+    (stored, actual)}, "facets": [(facet, value, stored, actual)]}; with
+    repair=True any mismatch triggers rebuild_aggregates().
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT name, value FROM stats_totals")
+        stored_totals = {row[0]: row[1] for row in cursor.fetchall()}
+        stored_facets = {(row[0], row[1]): row[2] for row in cursor.execute("SELECT facet, value, count FROM facet_counts")}
+
+        actual_totals = _computed_totals(cursor)
+        actual_facets: Dict[Tuple[str, str], int] = {}
+        for _file_id, facet, value in _derived_facets(conn):
+            actual_facets[(facet, value)] = actual_facets.get((facet, value), 0) + 1
+    finally:
+        conn.close()
+
+    totals = {
+        name: (stored_totals.get(name), actual)
+        for name, actual in actual_totals.items()
+        if stored_totals.get(name) != actual
+    }
+    facets = sorted(
+        (facet, value, stored_facets.get((facet, value), 0), actual_facets.get((facet, value), 0))
+        for facet, value in set(stored_facets) | set(actual_facets)
+        if stored_facets.get((facet, value), 0) != actual_facets.get((facet, value), 0)
+    )
+    consistent = not totals and not facets
+    if repair and not consistent:
+        rebuild_aggregates()
+    return {"consistent": consistent, "totals": totals, "facets": facets}
+
+
+def rebuild_aggregates() -> None:
+    """Recompute file_facets, facet_counts, hash_counts and stats_totals from files and metadata."""
+    conn = get_db_connection()
+    try:
+        _rebuild_aggregates(conn.cursor())
+        conn.commit()
+    finally:
+        conn.close()
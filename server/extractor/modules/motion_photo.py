@@ -4,20 +4,25 @@ Live Photos and Motion Photos Module
 Detects and extracts metadata for motion/still image formats:
 - Apple Live Photos (HEIC with motion resource)
 - Google Motion Photos (JPEG with motion photo extension)
-- Samsung Motion Photos (JPEG with XMP)
+- Samsung Motion Photos (JPEG with SEFT trailer, HEIC with mpvd box)
 - HTC Zoe (formerly)
 -vivo Motion Photos
 
+Video ranges come from embedded_media, which reads the XMP hints and the
+file trailer rather than the whole file.
+
 Author: MetaExtract Team
 Version: 1.0.0
 """
 
 import struct
 import logging
-import re
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from .embedded_media import EmbeddedMedia, EmbeddedMediaMap, locate_embedded_media
+from .xmp_packets import XmpTable, get_xmp_table
+
 logger = logging.getLogger(__name__)
 
 APPLE_LIVE_PHOTO_SIGNATURE = b'hltn'
@@ -32,8 +37,9 @@ class MotionPhotoDetector:
 
     def __init__(self, filepath: str):
         self.filepath = filepath
-        self.file_data: Optional[bytes] = None
         self.file_size = 0
+        self.media: Optional[EmbeddedMediaMap] = None
+        self.xmp_table: Optional[XmpTable] = None
         self.photo_type: Optional[str] = None
         self.motion_data: Optional[Dict[str, Any]] = None
 
@@ -48,8 +54,6 @@ class MotionPhotoDetector:
 
             with open(self.filepath, 'rb') as f:
                 header = f.read(1024)
-                f.seek(0)
-                self.file_data = f.read()
 
             result = {
                 "success": True,
@@ -60,6 +64,7 @@ class MotionPhotoDetector:
                 "video_size": None,
                 "video_duration": None,
                 "primary_image": None,
+                "embedded_media": [],
                 "compatibility": [],
             }
 
@@ -69,14 +74,21 @@ class MotionPhotoDetector:
                 apple_result = self._detect_apple_live_photo(header)
                 if apple_result:
                     result.update(apple_result)
-            elif file_ext in ['.jpg', '.jpeg']:
-                google_result = self._detect_google_motion_photo(header)
-                if google_result:
-                    result.update(google_result)
-                else:
-                    samsung_result = self._detect_samsung_motion_photo(header)
-                    if samsung_result:
-                        result.update(samsung_result)
+
+            if file_ext in ['.heic', '.heif', '.jpg', '.jpeg']:
+                self.media = locate_embedded_media(self.filepath)
+                self.xmp_table = get_xmp_table(self.filepath)
+                if self.media is not None:
+                    result["embedded_media"] = [item.to_dict() for item in self.media]
+
+                if not result["is_motion_photo"]:
+                    google_result = self._detect_google_motion_photo()
+                    if google_result:
+                        result.update(google_result)
+                    else:
+                        samsung_result = self._detect_samsung_motion_photo()
+                        if samsung_result:
+                            result.update(samsung_result)
 
             if result["is_motion_photo"]:
                 result["compatibility"] = self._get_compatibility_info(result["photo_type"])
@@ -94,7 +106,7 @@ class MotionPhotoDetector:
         if len(header) < 8:
             return None
 
-        if header[:4] == b'\x00\x00\x00' and header[4:8] == b'ftyp':
+        if header[4:8] == b'ftyp':
             hltn_offset = header.find(b'hltn')
             if hltn_offset > 0 and hltn_offset < 4096:
                 result["is_motion_photo"] = True
@@ -193,136 +205,91 @@ class MotionPhotoDetector:
 
         return video_info
 
-    def _detect_google_motion_photo(self, header: bytes) -> Optional[Dict[str, Any]]:
-        """Detect Google Motion Photo in JPEG"""
-        result: Dict[str, Any] = {}
+    def _video_fields(self, video: Optional[EmbeddedMedia]) -> Dict[str, Any]:
+        """Byte range of the embedded video"""
+        if video is None:
+            return {}
+        return {
+            "video_offset": video.offset,
+            "video_size": video.length,
+            "video_source": video.source,
+            "video_verified": video.verified,
+        }
 
-        if len(header) < 100:
+    def _detect_google_motion_photo(self) -> Optional[Dict[str, Any]]:
+        """Detect Google Motion Photo (Container:Directory or MicroVideo XMP)"""
+        if not self.xmp_table:
             return None
 
-        if header[:2] != b'\xff\xd8':
+        motion = self._parse_motion_photo_xmp()
+        if not motion:
             return None
 
-        uuid_offset = header.find(b'\xff\xe5')
-        if uuid_offset < 0:
-            uuid_offset = header.find(b'9E27E3A9')
-
-        if uuid_offset > 0:
-            mp_uuid = header[uuid_offset:uuid_offset + 16]
-            try:
-                uuid_str = str(uuid.UUID(bytes=mp_uuid))
-                if '9E27E3A9' in uuid_str.upper():
-                    result["is_motion_photo"] = True
-                    result["photo_type"] = "Google Motion Photo"
-
-                    result["motion_data"] = self._parse_google_motion_photo(header, uuid_offset)
-            except Exception:
-                pass
-
-        xmp_offset = header.find(b'http://ns.google.com/photos/1.0/motionphoto/')
-        if xmp_offset > 0:
-            xmp_end = header.find(b'>', xmp_offset)
-            if xmp_end > xmp_offset:
-                xmp_data = header[xmp_offset:xmp_end + 1].decode('utf-8', errors='replace')
-                motion_info = self._parse_motion_photo_xmp(xmp_data)
-                if motion_info:
-                    result["is_motion_photo"] = True
-                    if result.get("photo_type") is None:
-                        result["photo_type"] = "Google Motion Photo"
-                    result["motion_data"] = motion_info
-
-        return result if result.get("is_motion_photo") else None
-
-    def _parse_google_motion_photo(self, data: bytes, offset: int) -> Dict[str, Any]:
-        """Parse Google Motion Photo data"""
-        motion: Dict[str, Any] = {}
-
-        try:
-            if offset + 28 <= len(data):
-                still_end = struct.unpack('<I', data[offset + 16:offset + 20])[0]
-                motion_end = struct.unpack('<I', data[offset + 20:offset + 24])[0]
-
-                motion["still_image_offset"] = 0
-                motion["still_image_size"] = still_end
-                motion["motion_offset"] = still_end
-                motion["motion_size"] = motion_end - still_end
-
-                if offset + 32 <= len(data):
-                    flags = struct.unpack('<I', data[offset + 28:offset + 32])[0]
-                    motion["flags"] = flags
-                    motion["is_live"] = bool(flags & 0x01)
-                    motion["has_geo"] = bool(flags & 0x02)
-
-        except Exception as e:
-            logger.debug(f"Error parsing Google Motion Photo: {e}")
-
-        return motion
-
-    def _parse_motion_photo_xmp(self, xmp_data: str) -> Dict[str, Any]:
-        """Parse Motion Photo XMP data"""
+        result: Dict[str, Any] = {
+            "is_motion_photo": True,
+            "photo_type": "Google Motion Photo",
+            "motion_data": motion,
+        }
+        if self.media is not None:
+            video = next((item for item in self.media.find("video")
+                          if item.source in ("xmp_container", "micro_video_offset")), None)
+            result.update(self._video_fields(video))
+        return result
+
+    def _parse_motion_photo_xmp(self) -> Dict[str, Any]:
+        """Parse Motion Photo fields from the GCamera namespace"""
         motion: Dict[str, Any] = {}
+        hints = self.media.hints if self.media is not None else {}
 
-        patterns = [
-            (r'PhotoOffset["\s]*:?\s*(\d+)', 'photo_offset'),
-            (r'PhotoLength["\s]*:?\s*(\d+)', 'photo_length'),
-            (r'RepresentationIndex["\s]*:?\s*(\d+)', 'representation_index'),
-            (r'IsLivePhoto["\s]*:?\s*(true|false)', 'is_live_photo'),
-        ]
-
-        for pattern, field in patterns:
-            match = re.search(pattern, xmp_data, re.IGNORECASE)
-            if match:
-                value = match.group(1)
-                if field in ['photo_offset', 'photo_length', 'representation_index']:
-                    motion[field] = int(value)
-                elif field == 'is_live_photo':
-                    motion[field] = value.lower() == 'true'
+        if hints.get("motion_photo") or hints.get("container_items"):
+            motion["format"] = "MotionPhoto"
+        elif hints.get("micro_video") or hints.get("micro_video_offset"):
+            motion["format"] = "MicroVideo"
+        else:
+            return motion
 
+        for field in ("motion_photo_version", "presentation_timestamp_us",
+                      "micro_video_version", "micro_video_offset",
+                      "micro_video_timestamp_us", "container_items", "primary_length"):
+            if field in hints:
+                motion[field] = hints[field]
         return motion
 
-    def _detect_samsung_motion_photo(self, header: bytes) -> Optional[Dict[str, Any]]:
-        """Detect Samsung Motion Photo in JPEG"""
-        result: Dict[str, Any] = {}
-
-        if len(header) < 100:
+    def _detect_samsung_motion_photo(self) -> Optional[Dict[str, Any]]:
+        """Detect Samsung Motion Photo (SEFT trailer or HEIC mpvd box)"""
+        if self.media is None:
             return None
 
-        if header[:2] != b'\xff\xd8':
+        video = next((item for item in self.media.find("video")
+                      if item.source in ("samsung_seft", "heif_mpvd")), None)
+        if video is None:
             return None
 
-        xmp_offset = header.find(b'http://ns.samsung.com/motionphoto/1.0/')
-        if xmp_offset > 0:
-            xmp_end = header.find(b'>', xmp_offset)
-            if xmp_end > xmp_offset:
-                xmp_data = header[xmp_offset:xmp_end + 1].decode('utf-8', errors='replace')
-                motion_info = self._parse_samsung_motion_xmp(xmp_data)
-                if motion_info:
-                    result["is_motion_photo"] = True
-                    result["photo_type"] = "Samsung Motion Photo"
-                    result["motion_data"] = motion_info
-
-        return result if result.get("is_motion_photo") else None
+        result: Dict[str, Any] = {
+            "is_motion_photo": True,
+            "photo_type": "Samsung Motion Photo",
+            "motion_data": self._parse_samsung_motion_xmp(),
+        }
+        result.update(self._video_fields(video))
+        return result
 
-    def _parse_samsung_motion_xmp(self, xmp_data: str) -> Dict[str, Any]:
-        """Parse Samsung Motion Photo XMP data"""
+    def _parse_samsung_motion_xmp(self) -> Dict[str, Any]:
+        """Samsung trailer summary plus any GCamera fields Samsung also writes"""
         motion: Dict[str, Any] = {}
-
-        patterns = [
-            (r'MotionPhotoOffset["\s]*:?\s*(\d+)', 'photo_offset'),
-            (r'MotionPhotoLength["\s]*:?\s*(\d+)', 'photo_length'),
-            (r'PhotoOffset["\s]*:?\s*(\d+)', 'still_offset'),
-            (r'PhotoLength["\s]*:?\s*(\d+)', 'still_length'),
-            (r'RenderedImageWidth["\s]*:?\s*(\d+)', 'rendered_width'),
-            (r'RenderedImageHeight["\s]*:?\s*(\d+)', 'rendered_height'),
-        ]
-
-        for pattern, field in patterns:
-            match = re.search(pattern, xmp_data, re.IGNORECASE)
-            if match:
-                try:
-                    motion[field] = int(match.group(1))
-                except ValueError:
-                    pass
+        hints = self.media.hints if self.media is not None else {}
+
+        if "seft_version" in hints:
+            motion["seft_version"] = hints["seft_version"]
+            motion["seft_entries"] = hints["seft_entries"]
+            motion["seft_blocks"] = [item.name for item in self.media
+                                     if item.source == "samsung_seft"]
+        if self.xmp_table:
+            for field, qname in (("motion_photo_version", "GCamera:MotionPhotoVersion"),
+                                 ("presentation_timestamp_us",
+                                  "GCamera:MotionPhotoPresentationTimestampUs")):
+                value = self.xmp_table.text(qname)
+                if value is not None and value.strip().lstrip('-').isdigit():
+                    motion[field] = int(value)
 
         return motion
 
@@ -18,7 +18,7 @@ import re
 import shutil
 import subprocess
 import tempfile
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 import json
@@ -31,6 +31,12 @@ except ImportError:
     Image = None
     ImageOps = None
 
+try:
+    from .ocr_engine import find_text_bands, get_ocr_pool
+except ImportError:
+    find_text_bands = None
+    get_ocr_pool = None
+
 # Configure logging with better formatting
 logging.basicConfig(
     level=logging.INFO,
@@ -233,6 +239,28 @@ class BurnedMetadataExtractor:
                 "confidence": "none"
             }
     
+    def extract_batch(self, filepaths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract burned-in metadata from many images.
+
+        Files are processed concurrently and share the process-wide OCR
+        worker pool, so OCR backends are initialised once per batch rather
+        than once per file.
+
+        Args:
+            filepaths: Paths to image files
+
+        Returns:
+            List of per-file results in input order
+        """
+        if not filepaths:
+            return []
+        workers = get_ocr_pool().workers if get_ocr_pool is not None else 1
+        if not self.tesseract_available or workers == 1 or len(filepaths) == 1:
+            return [self.extract(filepath) for filepath in filepaths]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="burned-metadata") as executor:
+            return list(executor.map(self.extract, filepaths))
+
     def _run_ocr(self, filepath: str) -> Optional[str]:
         """Run Tesseract OCR on image."""
         start_time = datetime.now()
@@ -259,8 +287,33 @@ class BurnedMetadataExtractor:
             return None
 
         try:
-            resized_path = self._prepare_ocr_image(path)
-            text, error = self._run_tesseract(resized_path)
+            image = self._load_ocr_image(path)
+            if image is not None:
+                text, error = self._ocr_image(image)
+                duration = (datetime.now() - start_time).total_seconds()
+                if text is not None:
+                    log_extraction_event(
+                        event_type="ocr_complete",
+                        filepath=filepath,
+                        module_name="ocr_burned_metadata_ocr",
+                        status="info",
+                        duration=duration,
+                        details={"success": True, "output_length": len(text.strip()), "method": "in_memory"}
+                    )
+                    return text
+                if error:
+                    logger.warning(f"Tesseract failed for {filepath}: {error}")
+                log_extraction_event(
+                    event_type="ocr_complete" if not error else "ocr_error",
+                    filepath=filepath,
+                    module_name="ocr_burned_metadata_ocr",
+                    status="info" if not error else "warning",
+                    duration=duration,
+                    details={"success": not error, "error": error, "method": "in_memory"}
+                )
+                return None
+
+            text, error = self._run_tesseract(path)
             if text is not None:
                 duration = (datetime.now() - start_time).total_seconds()
                 log_extraction_event(
@@ -374,20 +427,21 @@ class BurnedMetadataExtractor:
         error = result.stderr.strip() if result.stderr else "tesseract failed"
         return None, error
 
-    def _prepare_ocr_image(self, path: Path) -> Path:
+    def _load_ocr_image(self, path: Path) -> Optional["Image.Image"]:
         """
-        Prepare a resized, orientation-corrected image for OCR.
-        Returns a temp file path (original if resize not possible).
+        Decode a resized, orientation-corrected image for in-memory OCR.
+        Returns None when the image cannot be decoded here, in which case
+        tesseract is pointed at the original path instead.
         """
+        if Image is None or get_ocr_pool is None:
+            return None
+
         max_dim_env = os.getenv("METAEXTRACT_MAX_DIM")
         try:
             max_dim = int(max_dim_env) if max_dim_env and max_dim_env.isdigit() else 2048
         except Exception:
             max_dim = 2048
 
-        if Image is None:
-            return path
-
         try:
             with Image.open(path) as img:
                 if ImageOps:
@@ -399,16 +453,30 @@ class BurnedMetadataExtractor:
 
                 if max(img.size) > max_dim:
                     img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
-
-                temp_dir = Path(tempfile.gettempdir()) / "metaextract-ocr"
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                temp_path = temp_dir / f"ocr-{uuid.uuid4().hex}.png"
-                img.save(temp_path, format="PNG")
-                return temp_path
+                return img
         except Exception as e:
-            logger.debug(f"Failed to prepare resized OCR image, using original: {e}")
+            logger.debug(f"Failed to decode image for in-memory OCR, using original path: {e}")
+
+        return None
+
+    def _ocr_image(self, image: "Image.Image") -> Tuple[Optional[str], Optional[str]]:
+        """
+        OCR an in-memory image through the shared worker pool.
 
-        return path
+        Only the top/bottom overlay strips that look like text are recognised;
+        the full frame is used when no candidate strip is found.
+        """
+        pool = get_ocr_pool()
+        regions = find_text_bands(image) if os.getenv("METAEXTRACT_OCR_REGIONS", "1") != "0" else []
+        if not regions:
+            return pool.recognize(image)
+
+        results = pool.recognize_batch([image.crop(box) for _, box in regions])
+        texts = [text for text, _ in results if text]
+        if texts:
+            return "\n".join(texts), None
+        errors = [error for _, error in results if error]
+        return None, (errors[0] if errors else None)
 
     def _should_retry_with_copy(self, path: Path, error: Optional[str]) -> bool:
         """Retry OCR from a readable temp location when paths are problematic."""
@@ -742,6 +810,20 @@ def extract_burned_metadata(filepath: str) -> Dict[str, Any]:
     return extractor.extract(filepath)
 
 
+def extract_burned_metadata_batch(filepaths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Batch entry point for burned-in metadata extraction.
+
+    Args:
+        filepaths: Paths to image files
+
+    Returns:
+        List of burned-in metadata dictionaries in input order
+    """
+    extractor = BurnedMetadataExtractor()
+    return extractor.extract_batch(filepaths)
+
+
 async def extract_burned_metadata_async(filepath: str) -> Dict[str, Any]:
     """
     Async entry point for burned-in metadata extraction.
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Persistent OCR Engine
+
+Long-lived OCR worker pool used for burned-in metadata extraction:
+- Backends are created once and reused, so language data is loaded once
+  (tesserocr API workers when the binding is installed)
+- Falls back to piping in-memory images into `tesseract stdin stdout`,
+  which avoids the temp-file round-trip of the old path based flow; all
+  strips of a file go to one tesseract process as a multi-page TIFF, so the
+  language data is still loaded once per file
+- Cheap text-band detector (horizontal edge density) over the top and
+  bottom overlay strips where dashcams, trail cams and GPS camera apps
+  burn their timestamps, so only candidate strips are OCR'd
+- Batch API that serves many images per call across the pool
+"""
+
+import io
+import logging
+import os
+import queue
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+try:
+    from PIL import Image, ImageFilter, ImageStat
+except ImportError:
+    Image = None
+    ImageFilter = None
+    ImageStat = None
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (name, start_fraction, end_fraction) of image height
+OVERLAY_BANDS: Tuple[Tuple[str, float, float], ...] = (
+    ("top", 0.0, 0.2),
+    ("bottom", 0.65, 1.0),
+)
+
+ImageInput = Union["Image.Image", bytes, bytearray, memoryview]
+OCRResult = Tuple[Optional[str], Optional[str]]
+
+
+def _to_image(data: Any) -> "Image.Image":
+    """Accept a PIL image or an encoded in-memory buffer."""
+    if Image is None:
+        raise RuntimeError("Pillow is required for in-memory OCR")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        img = Image.open(io.BytesIO(bytes(data)))
+        img.load()
+        return img
+    return data
+
+
+def find_text_bands(
+    image: "Image.Image",
+    bands: Sequence[Tuple[str, float, float]] = OVERLAY_BANDS,
+    analysis_width: int = 320,
+    edge_threshold: int = 40,
+    min_edge_density: float = 0.08,
+    min_rows: int = 2,
+    padding: float = 0.01,
+) -> List[Tuple[str, Tuple[int, int, int, int]]]:
+    """
+    Locate overlay strips that likely contain burned-in text.
+
+    Rendered text produces dense, sharp horizontal intensity transitions, so
+    rows whose edge density exceeds ``min_edge_density`` inside an overlay
+    band are treated as text rows. The detection runs on a downscaled
+    grayscale copy and costs a few milliseconds per frame.
+
+    Args:
+        image: Decoded image
+        bands: Overlay bands to inspect as fractions of image height
+        analysis_width: Width of the downscaled analysis copy
+        edge_threshold: Minimum absolute gray-level step counted as an edge
+        min_edge_density: Fraction of edge pixels a row needs to count as text
+        min_rows: Minimum number of text rows for a band to be reported
+        padding: Vertical padding added around the detected rows (fraction of height)
+
+    Returns:
+        List of (band_name, (left, top, right, bottom)) boxes in image coordinates
+    """
+    if Image is None:
+        return []
+
+    width, height = image.size
+    if width < 2 or height < 2:
+        return []
+
+    gray = image.convert("L")
+    scale = min(1.0, analysis_width / float(width))
+    small_w = max(2, int(width * scale))
+    small_h = max(2, int(height * scale))
+    if scale < 1.0:
+        gray = gray.resize((small_w, small_h))
+
+    pad = int(round(padding * height))
+    regions: List[Tuple[str, Tuple[int, int, int, int]]] = []
+
+    if NUMPY_AVAILABLE:
+        arr = np.asarray(gray, dtype=np.int16)
+        edges = np.abs(np.diff(arr, axis=1)) >= edge_threshold
+        row_density = edges.mean(axis=1)
+        for name, start, end in bands:
+            r0, r1 = int(start * small_h), int(end * small_h)
+            active = np.flatnonzero(row_density[r0:r1] >= min_edge_density)
+            if active.size < min_rows:
+                continue
+            top = int((r0 + active[0]) / scale) - pad
+            bottom = int((r0 + active[-1] + 1) / scale) + pad
+            regions.append((name, (0, max(0, top), width, min(height, bottom))))
+        return regions
+
+    # Without NumPy only decide band presence and return the whole band
+    edge_img = gray.filter(ImageFilter.FIND_EDGES)
+    for name, start, end in bands:
+        r0, r1 = int(start * small_h), int(end * small_h)
+        if r1 <= r0:
+            continue
+        stat = ImageStat.Stat(edge_img.crop((0, r0, small_w, r1)))
+        if stat.mean[0] / 255.0 >= min_edge_density / 2:
+            regions.append((name, (0, int(start * height), width, int(end * height))))
+    return regions
+
+
+class _TesserocrBackend:
+    """In-process libtesseract worker; language data is loaded once."""
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str):
+        self._api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def recognize(self, image: "Image.Image") -> OCRResult:
+        self._api.SetImage(image)
+        text = (self._api.GetUTF8Text() or "").strip()
+        return (text or None), None
+
+    def close(self) -> None:
+        self._api.End()
+
+
+class _TesseractPipeBackend:
+    """`tesseract` CLI fed from stdin, so images never touch the disk."""
+
+    name = "tesseract_pipe"
+    # Tesseract ends each page of plain-text output with a form feed
+    PAGE_SEPARATOR = "\f"
+
+    def __init__(self, lang: str, timeout: float):
+        self.lang = lang
+        self.timeout = timeout
+
+    def _run(self, payload: bytes) -> Tuple[Optional[str], Optional[str]]:
+        result = subprocess.run(
+            ["tesseract", "stdin", "stdout", "-l", self.lang],
+            input=payload,
+            capture_output=True,
+            timeout=self.timeout,
+        )
+        if result.returncode == 0:
+            return result.stdout.decode("utf-8", errors="replace"), None
+        error = result.stderr.decode("utf-8", errors="replace").strip() if result.stderr else ""
+        return None, error or "tesseract failed"
+
+    def recognize(self, image: "Image.Image") -> OCRResult:
+        buffer = io.BytesIO()
+        # PNM is uncompressed, so encoding is a memcpy rather than a zlib pass
+        image.convert("L").save(buffer, format="PPM")
+        output, error = self._run(buffer.getvalue())
+        if output is None:
+            return None, error
+        text = output.replace(self.PAGE_SEPARATOR, "").strip()
+        return (text or None), None
+
+    def recognize_many(self, images: Sequence["Image.Image"]) -> List[OCRResult]:
+        """OCR several images with one tesseract process (multi-page TIFF)."""
+        if len(images) == 1:
+            return [self.recognize(images[0])]
+        pages = [image.convert("L") for image in images]
+        buffer = io.BytesIO()
+        pages[0].save(buffer, format="TIFF", save_all=True, append_images=pages[1:])
+        output, error = self._run(buffer.getvalue())
+        if output is None:
+            return [(None, error)] * len(images)
+        texts = output.split(self.PAGE_SEPARATOR)
+        if len(texts) < len(images):
+            # No per-page separators; keep the text on the first page
+            texts = [output] + [""] * (len(images) - 1)
+        return [((text.strip() or None), None) for text in texts[:len(images)]]
+
+    def close(self) -> None:
+        pass
+
+
+class OCRWorkerPool:
+    """
+    Pool of reusable OCR backends.
+
+    Backends are created lazily up to ``workers`` and returned to an idle
+    queue after each call, so the expensive initialisation happens once per
+    worker for the lifetime of the process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, lang: str = "eng", timeout: float = 30.0):
+        if workers is None:
+            env_workers = os.getenv("METAEXTRACT_OCR_WORKERS", "")
+            workers = int(env_workers) if env_workers.isdigit() else min(4, os.cpu_count() or 1)
+        self.workers = max(1, workers)
+        self.lang = lang
+        self.timeout = timeout
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._all: List[Any] = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.backend_name: Optional[str] = None
+
+    def _create_backend(self) -> Any:
+        if TESSEROCR_AVAILABLE:
+            try:
+                return _TesserocrBackend(self.lang)
+            except Exception as e:
+                logger.debug(f"tesserocr init failed, using tesseract pipe backend: {e}")
+        return _TesseractPipeBackend(self.lang, self.timeout)
+
+    def _acquire(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.workers:
+                backend = self._create_backend()
+                self._all.append(backend)
+                self.backend_name = backend.name
+                return backend
+        return self._idle.get(timeout=self.timeout)
+
+    def recognize(self, image: ImageInput) -> OCRResult:
+        """OCR a single in-memory image. Returns (text, error)."""
+        try:
+            backend = self._acquire()
+        except queue.Empty:
+            return None, "OCR worker pool exhausted"
+        try:
+            return backend.recognize(_to_image(image))
+        except subprocess.TimeoutExpired:
+            return None, f"OCR timeout after {self.timeout}s"
+        except Exception as e:
+            return None, str(e)
+        finally:
+            self._idle.put(backend)
+
+    def recognize_batch(self, images: Sequence[ImageInput]) -> List[OCRResult]:
+        """OCR many in-memory images across the pool, preserving input order.
+
+        Backends that start a process per call (the tesseract pipe) receive
+        the whole batch at once instead of one call per image.
+        """
+        if not images:
+            return []
+        if len(images) > 1:
+            batched = self._recognize_many(images)
+            if batched is not None:
+                return batched
+        if len(images) == 1 or self.workers == 1:
+            return [self.recognize(image) for image in images]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="ocr-worker"
+                )
+            executor = self._executor
+        return list(executor.map(self.recognize, images))
+
+    def _recognize_many(self, images: Sequence[ImageInput]) -> Optional[List[OCRResult]]:
+        try:
+            backend = self._acquire()
+        except queue.Empty:
+            return [(None, "OCR worker pool exhausted")] * len(images)
+        try:
+            if not hasattr(backend, "recognize_many"):
+                return None
+            return backend.recognize_many([_to_image(image) for image in images])
+        except subprocess.TimeoutExpired:
+            return [(None, f"OCR timeout after {self.timeout}s")] * len(images)
+        except Exception as e:
+            return [(None, str(e))] * len(images)
+        finally:
+            self._idle.put(backend)
+
+    def close(self) -> None:
+        """Release all backends and the batch executor."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            for backend in self._all:
+                try:
+                    backend.close()
+                except Exception:
+                    pass
+            self._all = []
+            self._idle = queue.Queue()
+
+
+_pool: Optional[OCRWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_ocr_pool() -> OCRWorkerPool:
+    """Return the process-wide OCR worker pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = OCRWorkerPool()
+        return _pool
@@ -12,12 +12,18 @@ Author: MetaExtract Team
 Version: 1.0.0
 """
 
+import mmap
 import struct
 import logging
 import re
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import map_file
+except ImportError:
+    from formats.segment_directory import map_file
+
 logger = logging.getLogger(__name__)
 
 EXR_SIGNATURE = b'\x76\x2f\x31\x01'
@@ -65,16 +71,19 @@ class OpenEXRAnalyzer:
         except Exception as e:
             logger.error(f"Error analyzing OpenEXR file: {e}")
             return {"error": str(e), "is_valid_exr": False}
+        finally:
+            if isinstance(self.file_data, mmap.mmap):
+                self.file_data.close()
+                self.file_data = None
 
     def _load_file_data(self):
-        """Load file data"""
+        """Map the file; the parsers index into it without copying it"""
         file_path = Path(self.filepath)
         if not file_path.exists():
             return
 
         try:
-            with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+            self.file_data = map_file(self.filepath)
         except Exception:
             self.file_data = None
 
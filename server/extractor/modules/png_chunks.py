@@ -39,6 +39,11 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from ..formats.segment_directory import get_segment_directory
+except ImportError:
+    from formats.segment_directory import get_segment_directory
+
 logger = logging.getLogger(__name__)
 
 PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
@@ -73,6 +78,9 @@ ANCILLARY_CHUNKS = {
     b'CeLI': 'Color Encoding Information',
 }
 
+# Chunks whose payloads are never read in full
+_DATA_CHUNKS = {'IDAT', 'fdAT'}
+
 COLOR_TYPE_NAMES = {
     0: 'Grayscale',
     2: 'RGB',
@@ -133,26 +141,35 @@ class PNGChunkParser:
 
             self.file_size = file_path.stat().st_size
 
-            with open(self.filepath, 'rb') as f:
-                if not self._validate_png_signature(f):
-                    return {"error": "Invalid PNG signature", "success": False}
+            directory = get_segment_directory(self.filepath)
+            if directory is None or directory.container != 'PNG':
+                return {"error": "Invalid PNG signature", "success": False}
 
-                self.is_valid_png = True
-                self.chunks = []
+            self.is_valid_png = True
+            self.chunks = []
 
-                while True:
-                    chunk_data = self._read_chunk(f)
-                    if chunk_data is None:
-                        break
+            # Image data is summarized from the directory without reading it;
+            # fdAT only needs its 4-byte sequence number.
+            wanted = [s for s in directory if s.kind not in _DATA_CHUNKS]
+            payloads = dict(zip((s.index for s in wanted), directory.read_all(wanted)))
+            frame_data = directory.find_all('fdAT')
+            payloads.update(zip((s.index for s in frame_data), directory.read_all(frame_data, max_bytes=4)))
 
-                    chunk_type, chunk_length, chunk_payload, chunk_crc = chunk_data
-                    chunk_info = self._parse_chunk(chunk_type, chunk_payload)
-                    chunk_info.update({
-                        "type": chunk_type.decode('latin-1'),
-                        "length": chunk_length,
-                        "crc": chunk_crc,
-                    })
-                    self.chunks.append(chunk_info)
+            for segment in directory:
+                chunk_type = segment.kind.encode('latin-1')
+                if segment.kind == 'IDAT':
+                    chunk_info = {"description": CRITICAL_CHUNKS[b'IDAT'], "payload_size": segment.length}
+                else:
+                    chunk_info = self._parse_chunk(chunk_type, payloads[segment.index])
+                    if segment.kind == 'fdAT' and "data_size" in chunk_info:
+                        chunk_info["data_size"] = segment.length - 4
+                chunk_info.update({
+                    "type": segment.kind,
+                    "length": segment.length,
+                    "offset": segment.offset,
+                    "crc_status": segment.crc,
+                })
+                self.chunks.append(chunk_info)
 
             return self._build_result()
 
@@ -160,36 +177,6 @@ class PNGChunkParser:
             logger.error(f"Error parsing PNG: {e}")
             return {"error": str(e), "success": False}
 
-    def _validate_png_signature(self, f) -> bool:
-        """Validate PNG file signature"""
-        signature = f.read(8)
-        return signature == PNG_SIGNATURE
-
-    def _read_chunk(self, f) -> Optional[Tuple[bytes, int, bytes, int]]:
-        """Read a single chunk from file"""
-        try:
-            length_bytes = f.read(4)
-            if len(length_bytes) < 4:
-                return None
-
-            chunk_length = struct.unpack('>I', length_bytes)[0]
-            chunk_type = f.read(4)
-
-            if chunk_type not in CRITICAL_CHUNKS and chunk_type not in ANCILLARY_CHUNKS:
-                logger.warning(f"Unknown chunk type: {chunk_type}")
-                f.seek(chunk_length + 4, 1)
-                return None
-
-            chunk_payload = f.read(chunk_length)
-            chunk_crc_bytes = f.read(4)
-            chunk_crc = struct.unpack('>I', chunk_crc_bytes)[0]
-
-            return (chunk_type, chunk_length, chunk_payload, chunk_crc)
-
-        except Exception as e:
-            logger.error(f"Error reading chunk: {e}")
-            return None
-
     def _parse_chunk(self, chunk_type: bytes, payload: bytes) -> Dict[str, Any]:
         """Parse individual chunk based on type"""
         if chunk_type == b'IHDR':
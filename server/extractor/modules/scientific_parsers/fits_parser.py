@@ -12,14 +12,23 @@ FITS Structure:
 - ASCII tables (optional)
 - Multiple extensions (HDUs)
 
+Extension headers and shapes come from a header-block scan
+(formats/fits_header.py) that seeks past every data unit, so no data
+array is loaded; pixel statistics are an opt-in memmap'd sample.
+
 Reference: FITS 4.0 (IAU 2015)
 """
 
 from . import ScientificParser, logger
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import struct
 
+try:
+    from ...formats.fits_header import sample_fits_statistics, scan_fits_hdus
+except ImportError:
+    from formats.fits_header import sample_fits_statistics, scan_fits_hdus
+
 
 class FitsParser(ScientificParser):
     """FITS-specific metadata parser."""
@@ -27,15 +36,19 @@ class FitsParser(ScientificParser):
     FORMAT_NAME = "FITS"
     SUPPORTED_EXTENSIONS = ['.fits', '.fit', '.fts']
     
+    def __init__(self, sample_statistics: bool = False, max_samples: int = 100_000):
+        self.sample_statistics = sample_statistics
+        self.max_samples = max_samples
+    
     def parse(self, filepath: str) -> Dict[str, Any]:
         """Extract FITS metadata."""
         result = {}
         
         try:
-            from astropy.io import fits
-            
-            with fits.open(filepath) as hdul:
-                result = self._extract_fits_metadata(hdul)
+            hdus = scan_fits_hdus(filepath)
+            if not hdus:
+                return {"error": "Not a valid FITS file (missing SIMPLE)"}
+            result = self._extract_fits_metadata(filepath, hdus)
                 
         except ImportError:
             result = self._parse_basic_fits(filepath)
@@ -45,16 +58,17 @@ class FitsParser(ScientificParser):
         
         return result
     
-    def _extract_fits_metadata(self, hdul) -> Dict[str, Any]:
-        """Extract comprehensive FITS metadata using astropy."""
+    def _extract_fits_metadata(self, filepath: str, hdus) -> Dict[str, Any]:
+        """Extract comprehensive FITS metadata from scanned HDU headers."""
         metadata = {}
         
-        primary = hdul[0]
+        primary = hdus[0]
         header = primary.header
         
         metadata['file_type'] = 'FITS'
+        metadata['parsing_mode'] = 'header_scan'
         metadata['fits_version'] = str(header.get('VERSION', ''))
-        metadata['num_hdus'] = len(hdul)
+        metadata['num_hdus'] = len(hdus)
         
         metadata['observation'] = self._extract_observation_data(header)
         metadata['instrument'] = self._extract_instrument_data(header)
@@ -63,8 +77,11 @@ class FitsParser(ScientificParser):
         metadata['image'] = self._extract_image_data(header, primary)
         metadata['data_quality'] = self._extract_quality_data(header)
         
-        if len(hdul) > 1:
-            metadata['extensions'] = self._extract_extension_info(hdul)
+        if len(hdus) > 1:
+            metadata['extensions'] = self._extract_extension_info(hdus)
+        
+        if self.sample_statistics:
+            metadata['pixel_statistics'] = self._sample_pixel_statistics(filepath, hdus)
         
         return metadata
     
@@ -228,24 +245,43 @@ class FitsParser(ScientificParser):
             'data_reduced': bool(header.get('REDUCED', False)),
         }
     
-    def _extract_extension_info(self, hdul) -> Dict[str, Any]:
-        """Extract information about HDU extensions."""
+    def _extract_extension_info(self, hdus) -> List[Dict[str, Any]]:
+        """Extract information about HDU extensions from their headers."""
         extensions = []
-        for i, hdu in enumerate(hdul):
-            if i == 0:
-                continue
+        for hdu in hdus[1:]:
+            # Tile-compressed images are reported as the image they decode to
+            compressed = hdu.compressed
             ext_info = {
                 'name': hdu.name,
-                'type': hdu.__class__.__name__,
+                'type': 'CompImageHDU' if compressed else self._EXTENSION_TYPES.get(hdu.kind, hdu.kind),
+                'data_shape': list(hdu.shape) if hdu.data_size else None,
+                'bitpix': hdu.header.get('ZBITPIX', hdu.bitpix) if compressed else hdu.bitpix,
+                'data_bytes': hdu.data_size,
             }
-            if hasattr(hdu, 'columns'):
-                ext_info['num_columns'] = len(hdu.columns)
-            if hasattr(hdu, 'data'):
-                if hdu.data is not None:
-                    ext_info['data_shape'] = list(hdu.data.shape) if hasattr(hdu.data, 'shape') else None
+            tfields = hdu.header.get('TFIELDS')
+            if isinstance(tfields, int):
+                ext_info['num_columns'] = tfields
             extensions.append(ext_info)
         return extensions
     
+    # XTENSION value -> astropy HDU class name, as previously reported
+    _EXTENSION_TYPES = {
+        'IMAGE': 'ImageHDU',
+        'BINTABLE': 'BinTableHDU',
+        'TABLE': 'TableHDU',
+    }
+    
+    def _sample_pixel_statistics(self, filepath: str, hdus) -> List[Dict[str, Any]]:
+        """Strided, memmap'd pixel statistics for each image HDU."""
+        stats = []
+        for hdu in hdus:
+            sampled = sample_fits_statistics(filepath, hdu, max_samples=self.max_samples)
+            if sampled:
+                sampled['hdu_index'] = hdu.index
+                sampled['hdu_name'] = hdu.name
+                stats.append(sampled)
+        return stats
+    
     def _parse_basic_fits(self, filepath: str) -> Dict[str, Any]:
         """Parse FITS without astropy - basic header analysis."""
         try:
@@ -26,15 +26,25 @@ class Hdf5Parser(ScientificParser):
     FORMAT_NAME = "HDF5"
     SUPPORTED_EXTENSIONS = ['.h5', '.hdf5', '.he5']
     
+    # Walk budget for the structure index (see modules/hdf5_indexer.py)
+    MAX_INDEX_OBJECTS = 100_000
+    INDEX_TIME_BUDGET = 5.0
+    
     def parse(self, filepath: str) -> Dict[str, Any]:
         """Extract HDF5 metadata."""
         result = {}
         
         try:
             import h5py
+            from ..hdf5_indexer import get_hdf5_index
             
+            index = get_hdf5_index(
+                filepath, max_objects=self.MAX_INDEX_OBJECTS, time_budget=self.INDEX_TIME_BUDGET
+            )
+            if index is None:
+                return self._parse_basic_hdf5(filepath)
             with h5py.File(filepath, 'r') as hdf:
-                result = self._extract_hdf5_metadata(hdf)
+                result = self._extract_hdf5_metadata(hdf, index)
                 
         except ImportError:
             result = self._parse_basic_hdf5(filepath)
@@ -44,16 +54,16 @@ class Hdf5Parser(ScientificParser):
         
         return result
     
-    def _extract_hdf5_metadata(self, hdf) -> Dict[str, Any]:
-        """Extract HDF5 metadata using h5py."""
+    def _extract_hdf5_metadata(self, hdf, index) -> Dict[str, Any]:
+        """Extract HDF5 metadata from the file handle and its structure index."""
+        import h5py
+        
         metadata = {}
         
         metadata['file_type'] = 'HDF5'
         metadata['hdf5_version'] = hdf.filename
         metadata['driver'] = hdf.driver
-        metadata['external_direct_links'] = len(hdf.external)
-        
-        root = hdf['/']
+        metadata['external_direct_links'] = len(getattr(hdf, 'external', None) or [])
         
         metadata['file_info'] = {
             'filename': hdf.filename,
@@ -61,99 +71,82 @@ class Hdf5Parser(ScientificParser):
             'lib_version': h5py.__version__,
         }
         
-        metadata['structure'] = self._extract_structure(hdf)
-        metadata['root_attributes'] = self._extract_attributes(root)
-        metadata['datasets'] = self._extract_datasets_summary(hdf)
-        metadata['groups'] = self._extract_groups_summary(hdf)
+        metadata['structure'] = self._extract_structure(index)
+        metadata['root_attributes'] = index.attributes('/')
+        metadata['datasets'] = self._extract_datasets_summary(index)
+        metadata['groups'] = self._extract_groups_summary(index)
         
         return metadata
     
-    def _extract_structure(self, hdf) -> Dict[str, Any]:
+    def _extract_structure(self, index) -> Dict[str, Any]:
         """Extract overall HDF5 structure info."""
-        datasets_count = 0
-        groups_count = 0
-        soft_links = 0
-        external_links = 0
-        
-        def count_items(name, obj):
-            nonlocal datasets_count, groups_count, soft_links, external_links
-            if isinstance(obj, h5py.Dataset):
-                datasets_count += 1
-            elif isinstance(obj, h5py.Group):
-                groups_count += 1
-        
-        hdf.visititems(count_items)
+        summary = index.summary()
+        counts = summary['counts']
         
         return {
-            'total_datasets': datasets_count,
-            'total_groups': groups_count,
-            'total_items': datasets_count + groups_count,
+            'total_datasets': counts['dataset'],
+            'total_groups': counts['group'] - 1,  # Excluding the root group
+            'total_items': len(index) - 1,
+            'soft_links': counts['soft_link'],
+            'external_links': counts['external_link'],
+            'hard_link_aliases': counts['hard_link'],
+            'index_complete': summary['complete'],
+            'pending_groups': summary['pending_groups'],
+            'index_time_seconds': summary['walk_seconds'],
         }
     
-    def _extract_attributes(self, obj) -> Dict[str, Any]:
-        """Extract attributes from an HDF5 object."""
-        attrs = {}
-        for key in obj.attrs.keys():
-            value = obj.attrs[key]
-            if isinstance(value, bytes):
-                value = value.decode('utf-8', errors='replace')
-            elif isinstance(value, (list, tuple)):
-                value = [v.decode('utf-8', errors='replace') if isinstance(v, bytes) else v for v in value]
-            attrs[key] = value
-        return attrs
-    
-    def _extract_datasets_summary(self, hdf) -> Dict[str, Any]:
+    def _extract_datasets_summary(self, index) -> Dict[str, Any]:
         """Extract summary of all datasets."""
+        from ..hdf5_indexer import KIND_DATASET
+        
         datasets = []
-        max_datasets = 50
-        
-        def collect_dataset(name, obj):
-            if len(datasets) >= max_datasets:
-                return
-            if isinstance(obj, h5py.Dataset):
-                dataset_info = {
-                    'path': name,
-                    'shape': list(obj.shape) if obj.shape else None,
-                    'dtype': str(obj.dtype),
-                    'size_bytes': obj.nbytes if hasattr(obj, 'nbytes') else None,
-                    'compression': obj.compression if obj.compression else None,
-                    'chunks': list(obj.chunks) if obj.chunks else None,
-                }
-                if obj.attrs:
-                    dataset_info['num_attributes'] = len(obj.attrs)
-                datasets.append(dataset_info)
-        
-        hdf.visititems(collect_dataset)
-        
-        total_size = sum(d.get('size_bytes', 0) or 0 for d in datasets)
+        for row in index.iter_rows(KIND_DATASET, limit=50):
+            datasets.append({
+                'path': row['path'].lstrip('/'),
+                'shape': row['shape'] or None,
+                'dtype': row['dtype'],
+                'size_bytes': row['size_bytes'],
+                'compression': row['compression'],
+                'chunks': row['chunks'],
+                'num_attributes': row['num_attributes'],
+            })
+        
+        summary = index.summary()
+        total_size = summary['total_size_bytes']
         
         return {
-            'count': len(datasets),
+            'count': summary['total_datasets'],
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024*1024), 2),
+            'total_storage_bytes': summary['total_storage_bytes'],
+            'compressed_count': summary['compressed_datasets'],
+            'chunked_count': summary['chunked_datasets'],
+            'dtypes': summary['dtypes'],
             'datasets': datasets,
         }
     
-    def _extract_groups_summary(self, hdf) -> Dict[str, Any]:
+    def _extract_groups_summary(self, index) -> Dict[str, Any]:
         """Extract summary of groups."""
-        groups = []
-        max_groups = 30
+        from ..hdf5_indexer import KIND_GROUP
         
-        def collect_group(name, obj):
-            if len(groups) >= max_groups:
-                return
-            if isinstance(obj, h5py.Group) and name != '/':
-                group_info = {
-                    'path': name,
-                    'num_children': len(obj),
-                    'num_attributes': len(obj.attrs),
-                }
-                groups.append(group_info)
+        child_counts = {}
+        for parent in index.parents:
+            child_counts[parent] = child_counts.get(parent, 0) + 1
         
-        hdf.visititems(collect_group)
+        groups = []
+        for row, kind in enumerate(index.kinds):
+            if kind != KIND_GROUP or row == 0:
+                continue
+            if len(groups) >= 30:
+                break
+            groups.append({
+                'path': index.paths[row].lstrip('/'),
+                'num_children': child_counts.get(row, 0),
+                'num_attributes': index.num_attrs[row],
+            })
         
         return {
-            'count': len(groups),
+            'count': index.summary()['total_groups'] - 1,
             'groups': groups,
         }
     
@@ -230,6 +223,9 @@ class NetcdfParser(ScientificParser):
     FORMAT_NAME = "NetCDF"
     SUPPORTED_EXTENSIONS = ['.nc', '.cdf']
     
+    # Per-variable detail is capped; the HDF5 index covers the rest
+    MAX_VARIABLES = 200
+    
     def parse(self, filepath: str) -> Dict[str, Any]:
         """Extract NetCDF metadata."""
         result = {}
@@ -253,7 +249,7 @@ class NetcdfParser(ScientificParser):
         metadata = {}
         
         metadata['file_type'] = 'NetCDF'
-        metadata['netcdf_version'] = nc.version
+        metadata['netcdf_version'] = getattr(nc, 'data_model', None)
         metadata['format'] = nc.file_format
         
         metadata['dimensions'] = {
@@ -271,13 +267,21 @@ class NetcdfParser(ScientificParser):
             'size_bytes': self._get_file_size(filepath),
         }
         
+        if str(nc.file_format).startswith('NETCDF4'):
+            hdf5_index = self._index_hdf5_container(filepath)
+            if hdf5_index:
+                metadata['hdf5_index'] = hdf5_index
+        
         return metadata
     
     def _extract_variables(self, nc) -> Dict[str, Any]:
         """Extract variable information."""
         variables = {}
         
-        for var_name in nc.variables.keys():
+        for i, var_name in enumerate(nc.variables.keys()):
+            if i >= self.MAX_VARIABLES:
+                variables['_truncated'] = len(nc.variables) - self.MAX_VARIABLES
+                break
             var = nc.variables[var_name]
             var_info = {
                 'dimensions': list(var.dimensions),
@@ -295,6 +299,16 @@ class NetcdfParser(ScientificParser):
         
         return variables
     
+    def _index_hdf5_container(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Summarize the HDF5 layout under a NetCDF-4 file (chunking, filters)."""
+        try:
+            from ..hdf5_indexer import get_hdf5_index
+            index = get_hdf5_index(filepath)
+        except Exception as e:
+            logger.debug(f"NetCDF-4 HDF5 index failed: {e}")
+            return None
+        return index.summary() if index is not None else None
+    
     def _extract_global_attributes(self, nc) -> Dict[str, Any]:
         """Extract global attributes."""
         attrs = {}
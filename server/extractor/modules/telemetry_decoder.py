@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+"""
+Native Video Telemetry Decoder
+
+Reads GoPro GPMF and DJI telemetry straight from the MP4/MOV container
+instead of round-tripping every sample through `exiftool -ee` JSON:
+- Walks only the box headers and the moov box, locating `gpmd` (GoPro),
+  `djmd` (DJI) and tx3g subtitle tracks through their sample tables, so the
+  video payload is never read
+- Decodes GPMF KLV payloads straight into NumPy columns (time, lat, lon,
+  alt, speed) and keeps constant-memory running statistics for ACCL/GYRO
+- Parses DJI SRT telemetry from an embedded subtitle track or a sidecar
+  .SRT file
+- Vectorized flight metrics and optional Douglas-Peucker track decimation
+
+Usage:
+    from .telemetry_decoder import read_telemetry, summarize_telemetry
+    data = read_telemetry(path)
+    if data is not None:
+        summary = summarize_telemetry(data, simplify_epsilon_m=5.0)
+"""
+
+import logging
+import os
+import re
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_EXTENSIONS = {".mp4", ".mov", ".m4v", ".lrv", ".360", ".lrf"}
+
+# moov boxes above this size are not telemetry-bearing camera files
+MAX_MOOV_BYTES = 256 * 1024 * 1024
+EARTH_RADIUS_M = 6371008.8
+
+GPS_COLUMNS = ("time", "latitude", "longitude", "altitude", "speed_2d", "speed_3d")
+
+# GPMF type char -> NumPy dtype
+_GPMF_DTYPES = {
+    ord("b"): "i1", ord("B"): "u1",
+    ord("s"): ">i2", ord("S"): ">u2",
+    ord("l"): ">i4", ord("L"): ">u4",
+    ord("f"): ">f4", ord("d"): ">f8",
+    ord("j"): ">i8", ord("J"): ">u8",
+}
+_GPMF_NESTED = 0
+_IMU_STREAMS = {b"ACCL": "accelerometer", b"GYRO": "gyroscope", b"MAGN": "magnetometer"}
+
+
+@dataclass
+class TelemetryTrack:
+    """A metadata/subtitle track located through the MP4 sample tables."""
+
+    track_id: int
+    handler: str
+    sample_format: str
+    timescale: int
+    offsets: "np.ndarray"
+    sizes: "np.ndarray"
+    start_times: "np.ndarray"
+    durations: "np.ndarray"
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "track_id": self.track_id,
+            "handler": self.handler,
+            "format": self.sample_format,
+            "samples": int(len(self.sizes)),
+            "bytes": int(self.sizes.sum()) if len(self.sizes) else 0,
+            "duration_seconds": float(self.start_times[-1] + self.durations[-1]) if len(self.sizes) else 0.0,
+        }
+
+
+class _RunningStats:
+    """Per-axis count/min/max/sum/sum-of-squares accumulator."""
+
+    def __init__(self, axes: int):
+        self.count = 0
+        self.total = np.zeros(axes)
+        self.squares = np.zeros(axes)
+        self.minimum = np.full(axes, np.inf)
+        self.maximum = np.full(axes, -np.inf)
+        self.units: Optional[str] = None
+
+    def update(self, rows: "np.ndarray") -> None:
+        if rows.size == 0 or rows.shape[1] != len(self.total):
+            return
+        self.count += rows.shape[0]
+        self.total += rows.sum(axis=0)
+        self.squares += np.square(rows).sum(axis=0)
+        np.minimum(self.minimum, rows.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, rows.max(axis=0), out=self.maximum)
+
+    def summary(self) -> Dict[str, Any]:
+        mean = self.total / self.count
+        return {
+            "samples": self.count,
+            "units": self.units,
+            "mean": [round(float(v), 6) for v in mean],
+            "rms": [round(float(v), 6) for v in np.sqrt(self.squares / self.count)],
+            "min": [round(float(v), 6) for v in self.minimum],
+            "max": [round(float(v), 6) for v in self.maximum],
+        }
+
+
+@dataclass
+class TelemetryData:
+    """Decoded telemetry: GPS columns, IMU statistics and located tracks."""
+
+    sources: List[str] = field(default_factory=list)
+    tracks: List[TelemetryTrack] = field(default_factory=list)
+    gps: Dict[str, "np.ndarray"] = field(default_factory=dict)
+    imu: Dict[str, _RunningStats] = field(default_factory=dict)
+    streams: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def gps_points(self) -> int:
+        return int(len(self.gps.get("latitude", ())))
+
+
+# ---------------------------------------------------------------------------
+# MP4 sample tables
+# ---------------------------------------------------------------------------
+
+def _iter_boxes(buf, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, box_end) for boxes in buf[start:end]."""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", buf, pos)
+        header = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from(">Q", buf, pos + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header or pos + size > end:
+            return
+        yield box_type, pos + header, pos + size
+        pos += size
+
+
+def _find_moov(f, file_size: int) -> Optional[bytes]:
+    """Seek through top-level box headers and return the moov payload."""
+    pos = 0
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        header = f.read(16)
+        if len(header) < 8:
+            return None
+        size, box_type = struct.unpack_from(">I4s", header)
+        header_size = 8
+        if size == 1 and len(header) >= 16:
+            size = struct.unpack_from(">Q", header, 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = file_size - pos
+        if size < header_size:
+            return None
+        if box_type == b"moov":
+            if size > MAX_MOOV_BYTES:
+                return None
+            f.seek(pos + header_size)
+            return f.read(size - header_size)
+        if pos == 0 and box_type not in (b"ftyp", b"wide", b"free", b"skip", b"mdat", b"moov"):
+            return None  # Not an ISO BMFF / QuickTime file
+        pos += size
+    return None
+
+
+def _children(buf, start: int, end: int) -> Dict[bytes, Tuple[int, int]]:
+    found: Dict[bytes, Tuple[int, int]] = {}
+    for box_type, payload, box_end in _iter_boxes(buf, start, end):
+        found.setdefault(box_type, (payload, box_end))
+    return found
+
+
+def _expand_sample_table(buf, stbl: Dict[bytes, Tuple[int, int]]) -> Optional[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Vectorized stsz/stz2 + stsc + stco/co64 expansion into (offsets, sizes, deltas)."""
+    if b"stsz" in stbl:
+        start, _ = stbl[b"stsz"]
+        sample_size, count = struct.unpack_from(">II", buf, start + 4)
+        if sample_size:
+            sizes = np.full(count, sample_size, dtype=np.int64)
+        else:
+            sizes = np.frombuffer(buf, dtype=">u4", count=count, offset=start + 12).astype(np.int64)
+    elif b"stz2" in stbl:
+        start, _ = stbl[b"stz2"]
+        field_size = buf[start + 7]
+        count = struct.unpack_from(">I", buf, start + 8)[0]
+        if field_size == 16:
+            sizes = np.frombuffer(buf, dtype=">u2", count=count, offset=start + 12).astype(np.int64)
+        elif field_size == 8:
+            sizes = np.frombuffer(buf, dtype="u1", count=count, offset=start + 12).astype(np.int64)
+        else:
+            packed = np.frombuffer(buf, dtype="u1", count=(count + 1) // 2, offset=start + 12)
+            sizes = np.stack([packed >> 4, packed & 0x0F], axis=1).ravel()[:count].astype(np.int64)
+    else:
+        return None
+
+    if b"stco" in stbl:
+        start, _ = stbl[b"stco"]
+        n_chunks = struct.unpack_from(">I", buf, start + 4)[0]
+        chunk_offsets = np.frombuffer(buf, dtype=">u4", count=n_chunks, offset=start + 8).astype(np.int64)
+    elif b"co64" in stbl:
+        start, _ = stbl[b"co64"]
+        n_chunks = struct.unpack_from(">I", buf, start + 4)[0]
+        chunk_offsets = np.frombuffer(buf, dtype=">u8", count=n_chunks, offset=start + 8).astype(np.int64)
+    else:
+        return None
+
+    if b"stsc" not in stbl or not len(sizes) or not n_chunks:
+        return None
+    start, _ = stbl[b"stsc"]
+    entries = struct.unpack_from(">I", buf, start + 4)[0]
+    stsc = np.frombuffer(buf, dtype=">u4", count=entries * 3, offset=start + 8).reshape(-1, 3).astype(np.int64)
+    first_chunks = np.append(stsc[:, 0] - 1, n_chunks)
+    runs = np.clip(np.diff(first_chunks), 0, None)
+    per_chunk = np.repeat(stsc[:, 1], runs)[:n_chunks]
+
+    sample_chunk = np.repeat(np.arange(len(per_chunk)), per_chunk)[:len(sizes)]
+    sizes = sizes[:len(sample_chunk)]
+    before = np.cumsum(sizes) - sizes
+    chunk_first = np.cumsum(per_chunk) - per_chunk
+    chunk_first = np.minimum(chunk_first, max(len(sizes) - 1, 0))
+    offsets = chunk_offsets[sample_chunk] + before - before[chunk_first[sample_chunk]]
+
+    deltas = np.zeros(len(sizes), dtype=np.int64)
+    if b"stts" in stbl:
+        start, _ = stbl[b"stts"]
+        entries = struct.unpack_from(">I", buf, start + 4)[0]
+        stts = np.frombuffer(buf, dtype=">u4", count=entries * 2, offset=start + 8).reshape(-1, 2).astype(np.int64)
+        expanded = np.repeat(stts[:, 1], stts[:, 0])[:len(sizes)]
+        deltas[:len(expanded)] = expanded
+    return offsets, sizes, deltas
+
+
+def locate_telemetry_tracks(moov: bytes) -> List[TelemetryTrack]:
+    """Find gpmd/djmd metadata tracks and text subtitle tracks in a moov payload."""
+    tracks: List[TelemetryTrack] = []
+    for box_type, trak_start, trak_end in _iter_boxes(moov, 0, len(moov)):
+        if box_type != b"trak":
+            continue
+        trak = _children(moov, trak_start, trak_end)
+        if b"mdia" not in trak:
+            continue
+        mdia = _children(moov, *trak[b"mdia"])
+        if b"hdlr" not in mdia or b"minf" not in mdia or b"mdhd" not in mdia:
+            continue
+        handler = moov[mdia[b"hdlr"][0] + 8:mdia[b"hdlr"][0] + 12].decode("latin-1")
+        if handler not in ("meta", "text", "sbtl", "subt"):
+            continue  # Skip audio/video without touching their tables
+
+        minf = _children(moov, *mdia[b"minf"])
+        if b"stbl" not in minf:
+            continue
+        stbl = _children(moov, *minf[b"stbl"])
+        if b"stsd" not in stbl:
+            continue
+        stsd_start, _ = stbl[b"stsd"]
+        sample_format = moov[stsd_start + 12:stsd_start + 16].decode("latin-1")
+        if sample_format not in ("gpmd", "djmd", "tx3g", "text"):
+            continue
+
+        mdhd_start, _ = mdia[b"mdhd"]
+        if moov[mdhd_start] == 1:
+            timescale = struct.unpack_from(">I", moov, mdhd_start + 20)[0]
+        else:
+            timescale = struct.unpack_from(">I", moov, mdhd_start + 12)[0]
+        track_id = 0
+        if b"tkhd" in trak:
+            tkhd_start, _ = trak[b"tkhd"]
+            track_id = struct.unpack_from(">I", moov, tkhd_start + (20 if moov[tkhd_start] == 1 else 12))[0]
+
+        table = _expand_sample_table(moov, stbl)
+        if table is None:
+            continue
+        offsets, sizes, deltas = table
+        scale = float(timescale or 1)
+        starts = (np.cumsum(deltas) - deltas) / scale
+        tracks.append(TelemetryTrack(
+            track_id=track_id,
+            handler=handler,
+            sample_format=sample_format,
+            timescale=timescale,
+            offsets=offsets,
+            sizes=sizes,
+            start_times=starts,
+            durations=deltas / scale,
+        ))
+    return tracks
+
+
+def _iter_samples(f, track: TelemetryTrack) -> Iterator[Tuple[int, bytes]]:
+    """Read samples in file order; each read is one ranged fetch."""
+    for index in np.argsort(track.offsets, kind="stable").tolist():
+        size = int(track.sizes[index])
+        if size <= 0:
+            continue
+        f.seek(int(track.offsets[index]))
+        yield index, f.read(size)
+
+
+# ---------------------------------------------------------------------------
+# GPMF (GoPro)
+# ---------------------------------------------------------------------------
+
+def _iter_klv(buf, start: int, end: int) -> Iterator[Tuple[bytes, int, int, int, int]]:
+    """Yield (key, type, struct_size, repeat, data_start) for GPMF KLV items."""
+    pos = start
+    while pos + 8 <= end:
+        key = bytes(buf[pos:pos + 4])
+        if key == b"\x00\x00\x00\x00":
+            return
+        type_char = buf[pos + 4]
+        struct_size = buf[pos + 5]
+        repeat = (buf[pos + 6] << 8) | buf[pos + 7]
+        length = struct_size * repeat
+        data_start = pos + 8
+        if data_start + length > end:
+            return
+        yield key, type_char, struct_size, repeat, data_start
+        pos = data_start + ((length + 3) & ~3)
+
+
+def _klv_array(buf, type_char: int, struct_size: int, repeat: int, data_start: int,
+               complex_type: Optional[bytes] = None) -> Optional["np.ndarray"]:
+    """Decode one KLV payload into a (repeat, elements) float64 array."""
+    if type_char == ord("?") and complex_type:
+        dtypes = [_GPMF_DTYPES.get(c) for c in complex_type]
+        if None in dtypes:
+            return None
+        record = np.dtype([(f"f{i}", dt) for i, dt in enumerate(dtypes)])
+        if record.itemsize != struct_size:
+            return None
+        raw = np.frombuffer(buf, dtype=record, count=repeat, offset=data_start)
+        return np.stack([raw[name].astype(np.float64) for name in record.names], axis=1)
+
+    dtype = _GPMF_DTYPES.get(type_char)
+    if dtype is None:
+        return None
+    item = np.dtype(dtype).itemsize
+    if struct_size % item:
+        return None
+    elements = struct_size // item
+    raw = np.frombuffer(buf, dtype=dtype, count=repeat * elements, offset=data_start)
+    return raw.astype(np.float64).reshape(repeat, elements)
+
+
+def _decode_gpmf_sample(payload: bytes, t0: float, duration: float, data: TelemetryData,
+                        gps_parts: List["np.ndarray"]) -> None:
+    for key, type_char, size, repeat, devc_start in _iter_klv(payload, 0, len(payload)):
+        if key != b"DEVC" or type_char != _GPMF_NESTED:
+            continue
+        for skey, stype, ssize, srepeat, strm_start in _iter_klv(payload, devc_start, devc_start + size * repeat):
+            if skey != b"STRM" or stype != _GPMF_NESTED:
+                continue
+            _decode_gpmf_stream(payload, strm_start, strm_start + ssize * srepeat, t0, duration, data, gps_parts)
+
+
+def _decode_gpmf_stream(payload: bytes, start: int, end: int, t0: float, duration: float,
+                        data: TelemetryData, gps_parts: List["np.ndarray"]) -> None:
+    scale: Optional["np.ndarray"] = None
+    complex_type: Optional[bytes] = None
+    units: Optional[str] = None
+    fix: Optional[float] = None
+    for key, type_char, struct_size, repeat, data_start in _iter_klv(payload, start, end):
+        if key == b"SCAL":
+            scal = _klv_array(payload, type_char, struct_size, repeat, data_start)
+            scale = scal.ravel() if scal is not None else None
+        elif key == b"TYPE":
+            complex_type = bytes(payload[data_start:data_start + struct_size * repeat]).rstrip(b"\x00")
+        elif key in (b"SIUN", b"UNIT"):
+            units = bytes(payload[data_start:data_start + struct_size * repeat]).rstrip(b"\x00").decode("latin-1", "replace")
+        elif key == b"GPSF":
+            value = _klv_array(payload, type_char, struct_size, repeat, data_start)
+            fix = float(value.ravel()[0]) if value is not None and value.size else None
+        elif key in (b"GPS5", b"GPS9") or key in _IMU_STREAMS:
+            rows = _klv_array(payload, type_char, struct_size, repeat, data_start, complex_type)
+            if rows is None or not rows.size:
+                continue
+            if scale is not None and scale.size:
+                divisor = scale if scale.size == rows.shape[1] else scale[0]
+                rows = rows / np.where(divisor == 0, 1, divisor)
+            name = key.decode("ascii")
+            # "samples" counts what reaches the track; "raw_samples" includes
+            # GPS samples dropped for lacking a fix
+            stream = data.streams.setdefault(name, {"samples": 0, "raw_samples": 0, "payloads": 0})
+            stream["raw_samples"] += rows.shape[0]
+            stream["payloads"] += 1
+
+            if key in _IMU_STREAMS:
+                stream["samples"] += rows.shape[0]
+                stats = data.imu.get(_IMU_STREAMS[key])
+                if stats is None:
+                    stats = data.imu[_IMU_STREAMS[key]] = _RunningStats(rows.shape[1])
+                stats.units = stats.units or units
+                stats.update(rows)
+                continue
+
+            if fix is not None and key == b"GPS5":
+                stream["fix"] = fix
+                if fix < 2:
+                    continue  # No 2D/3D lock: GoPro repeats stale or zero coordinates
+            if key == b"GPS9" and rows.shape[1] >= 9:
+                rows = rows[rows[:, 8] >= 2]
+                if not rows.size:
+                    continue
+            stream["samples"] += rows.shape[0]
+            times = t0 + duration * np.arange(rows.shape[0]) / rows.shape[0]
+            block = np.full((rows.shape[0], len(GPS_COLUMNS)), np.nan)
+            block[:, 0] = times
+            width = min(5, rows.shape[1])
+            block[:, 1:1 + width] = rows[:, :width]
+            gps_parts.append(block)
+
+
+# ---------------------------------------------------------------------------
+# DJI SRT
+# ---------------------------------------------------------------------------
+
+_SRT_TIME_RE = re.compile(r"(\d+):(\d{2}):(\d{2})[,.](\d{1,3})\s*-->")
+_SRT_FIELDS = {
+    "latitude": re.compile(r"latitude\s*:\s*([-+]?\d+(?:\.\d+)?)", re.I),
+    "longitude": re.compile(r"longitude\s*:\s*([-+]?\d+(?:\.\d+)?)", re.I),
+    "altitude": re.compile(r"(?:abs_alt|altitude)\s*:\s*([-+]?\d+(?:\.\d+)?)", re.I),
+    "speed_2d": re.compile(r"H\.S\s*:?\s*([-+]?\d+(?:\.\d+)?)", re.I),
+}
+_SRT_GPS_RE = re.compile(
+    r"GPS\s*\(\s*([-+]?\d+(?:\.\d+)?)\s*,\s*([-+]?\d+(?:\.\d+)?)(?:\s*,\s*([-+]?\d+(?:\.\d+)?))?"
+)
+
+
+def _parse_srt_body(text: str) -> Optional[List[float]]:
+    """Return [lat, lon, alt, speed_2d] (NaN where absent) from one SRT cue."""
+    row = [np.nan, np.nan, np.nan, np.nan]
+    for i, name in enumerate(("latitude", "longitude", "altitude", "speed_2d")):
+        match = _SRT_FIELDS[name].search(text)
+        if match:
+            row[i] = float(match.group(1))
+    if np.isnan(row[0]):
+        match = _SRT_GPS_RE.search(text)
+        if not match:
+            return None
+        # Older DJI firmware writes GPS(longitude, latitude, altitude)
+        row[1], row[0] = float(match.group(1)), float(match.group(2))
+        if match.group(3) is not None and np.isnan(row[2]):
+            row[2] = float(match.group(3))
+    return row
+
+
+def parse_dji_srt(text: str) -> "np.ndarray":
+    """
+    Parse DJI SRT telemetry into an (n, len(GPS_COLUMNS)) array.
+
+    Handles both the bracketed "[latitude: ..] [longitude: ..]" layout and
+    the older "GPS(lon, lat, alt)" layout.
+    """
+    rows = []
+    for block in re.split(r"\r?\n\s*\r?\n", text):
+        time_match = _SRT_TIME_RE.search(block)
+        if not time_match:
+            continue
+        parsed = _parse_srt_body(block[time_match.end():])
+        if parsed is None:
+            continue
+        h, m, s, ms = time_match.groups()
+        t = int(h) * 3600 + int(m) * 60 + int(s) + int(ms.ljust(3, "0")) / 1000.0
+        rows.append([t, parsed[0], parsed[1], parsed[2], parsed[3], np.nan])
+    if not rows:
+        return np.empty((0, len(GPS_COLUMNS)))
+    return np.asarray(rows, dtype=np.float64)
+
+
+def _decode_subtitle_sample(payload: bytes, t0: float) -> Optional[List[float]]:
+    if len(payload) < 2:
+        return None
+    length = struct.unpack_from(">H", payload)[0]
+    text = payload[2:2 + length].decode("utf-8", errors="replace")
+    parsed = _parse_srt_body(text)
+    if parsed is None:
+        return None
+    return [t0, parsed[0], parsed[1], parsed[2], parsed[3], np.nan]
+
+
+def _sidecar_srt(filepath: str) -> Optional[str]:
+    stem, _ = os.path.splitext(filepath)
+    for ext in (".SRT", ".srt"):
+        candidate = stem + ext
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def read_telemetry(filepath: str) -> Optional[TelemetryData]:
+    """
+    Decode GoPro/DJI telemetry from a video without reading its video payload.
+
+    Args:
+        filepath: Path to an MP4/MOV (or DJI/GoPro variant) file
+
+    Returns:
+        TelemetryData, or None if the file is not a video container or carries
+        no telemetry tracks or sidecar SRT
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    if os.path.splitext(filepath)[1].lower() not in TELEMETRY_EXTENSIONS or not os.path.isfile(filepath):
+        return None
+
+    data = TelemetryData()
+    gps_parts: List["np.ndarray"] = []
+    srt_rows: List[List[float]] = []
+
+    try:
+        with open(filepath, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            moov = _find_moov(f, file_size)
+            tracks = locate_telemetry_tracks(moov) if moov else []
+            for track in tracks:
+                data.tracks.append(track)
+                if track.sample_format == "gpmd":
+                    for index, payload in _iter_samples(f, track):
+                        try:
+                            _decode_gpmf_sample(
+                                payload, float(track.start_times[index]),
+                                float(track.durations[index]), data, gps_parts
+                            )
+                        except (struct.error, ValueError, IndexError) as e:
+                            data.errors.append(f"gpmf sample {index}: {e}")
+                elif track.sample_format in ("tx3g", "text"):
+                    for index, payload in _iter_samples(f, track):
+                        row = _decode_subtitle_sample(payload, float(track.start_times[index]))
+                        if row is not None:
+                            srt_rows.append(row)
+    except (OSError, struct.error, ValueError) as e:
+        logger.debug(f"Telemetry container walk failed for {filepath}: {e}")
+        data.errors.append(str(e))
+
+    formats = {track.sample_format for track in data.tracks}
+    if "gpmd" in formats:
+        data.sources.append("gpmf")
+    if "djmd" in formats:
+        # djmd carries DJI's undocumented protobuf; the track is located and
+        # indexed, while positions come from the SRT streams below
+        data.sources.append("dji")
+
+    if srt_rows:
+        gps_parts.append(np.asarray(srt_rows, dtype=np.float64))
+        if "dji" not in data.sources:
+            data.sources.append("dji")
+    elif not gps_parts:
+        sidecar = _sidecar_srt(filepath)
+        if sidecar:
+            try:
+                with open(sidecar, "r", encoding="utf-8", errors="replace") as f:
+                    rows = parse_dji_srt(f.read())
+                if len(rows):
+                    gps_parts.append(rows)
+                    data.sources.append("dji_srt")
+            except OSError as e:
+                data.errors.append(f"srt: {e}")
+
+    if gps_parts:
+        table = np.concatenate(gps_parts)
+        table = table[np.argsort(table[:, 0], kind="stable")]
+        valid = np.isfinite(table[:, 1]) & np.isfinite(table[:, 2]) & ~((table[:, 1] == 0) & (table[:, 2] == 0))
+        table = table[valid]
+        data.gps = {name: table[:, i].copy() for i, name in enumerate(GPS_COLUMNS)}
+
+    if not data.tracks and not data.gps:
+        return None
+    return data
+
+
+def haversine_m(lat1, lon1, lat2, lon2) -> "np.ndarray":
+    """Vectorized great-circle distance in meters."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def compute_flight_metrics(gps: Dict[str, "np.ndarray"]) -> Dict[str, Any]:
+    """
+    Distance, speed, altitude and extent metrics from GPS columns.
+
+    Args:
+        gps: Columns as produced by read_telemetry (time, latitude, longitude, ...)
+
+    Returns:
+        Flight metrics dictionary (empty if fewer than two points)
+    """
+    lat = gps.get("latitude")
+    if lat is None or len(lat) < 2:
+        return {}
+    lon, alt, t = gps["longitude"], gps["altitude"], gps["time"]
+
+    steps = haversine_m(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    dt = np.diff(t)
+    moving = dt > 0
+    duration = float(t[-1] - t[0])
+    metrics: Dict[str, Any] = {
+        "points": int(len(lat)),
+        "duration_seconds": round(duration, 3),
+        "total_distance_m": round(float(steps.sum()), 2),
+        "max_distance_from_start_m": round(float(haversine_m(lat[0], lon[0], lat, lon).max()), 2),
+        "start": {"latitude": float(lat[0]), "longitude": float(lon[0])},
+        "end": {"latitude": float(lat[-1]), "longitude": float(lon[-1])},
+    }
+
+    speed = gps.get("speed_2d")
+    if speed is not None and np.isfinite(speed).any():
+        metrics["max_speed_mps"] = round(float(np.nanmax(speed)), 3)
+        metrics["avg_speed_mps"] = round(float(np.nanmean(speed)), 3)
+    elif moving.any():
+        derived = steps[moving] / dt[moving]
+        metrics["max_speed_mps"] = round(float(derived.max()), 3)
+        metrics["avg_speed_mps"] = round(float(steps.sum() / duration), 3) if duration > 0 else 0.0
+
+    if alt is not None and np.isfinite(alt).any():
+        finite = np.isfinite(alt)
+        climbs = np.diff(alt[finite])
+        metrics["altitude"] = {
+            "min_m": round(float(np.nanmin(alt)), 2),
+            "max_m": round(float(np.nanmax(alt)), 2),
+            "gain_m": round(float(climbs[climbs > 0].sum()), 2),
+            "loss_m": round(float(-climbs[climbs < 0].sum()), 2),
+        }
+        pair_ok = moving & finite[:-1] & finite[1:]
+        if pair_ok.any():
+            rates = np.diff(alt)[pair_ok] / dt[pair_ok]
+            metrics["altitude"]["max_climb_rate_mps"] = round(float(rates.max()), 3)
+            metrics["altitude"]["max_descent_rate_mps"] = round(float(-rates.min()), 3)
+
+    metrics["bounds"] = {
+        "min_lat": float(lat.min()), "max_lat": float(lat.max()),
+        "min_lon": float(lon.min()), "max_lon": float(lon.max()),
+    }
+    return metrics
+
+
+def douglas_peucker(lat: "np.ndarray", lon: "np.ndarray", epsilon_m: float) -> "np.ndarray":
+    """
+    Indices of points kept by Douglas-Peucker simplification.
+
+    Coordinates are projected to a local equirectangular plane in meters;
+    each segment's farthest point is found with one vectorized pass, using an
+    explicit stack instead of recursion.
+    """
+    n = len(lat)
+    if n <= 2 or epsilon_m <= 0:
+        return np.arange(n)
+    ref = np.radians(np.nanmean(lat))
+    x = np.radians(lon) * np.cos(ref) * EARTH_RADIUS_M
+    y = np.radians(lat) * EARTH_RADIUS_M
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dx, dy = x[last] - x[first], y[last] - y[first]
+        px, py = x[first + 1:last] - x[first], y[first + 1:last] - y[first]
+        length = np.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(px, py)
+        else:
+            dist = np.abs(dx * py - dy * px) / length
+        k = int(np.argmax(dist))
+        if dist[k] > epsilon_m:
+            split = first + 1 + k
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def summarize_telemetry(
+    data: TelemetryData,
+    simplify_epsilon_m: Optional[float] = None,
+    max_track_points: int = 2000,
+) -> Dict[str, Any]:
+    """
+    JSON-friendly summary of decoded telemetry.
+
+    Args:
+        data: Result of read_telemetry
+        simplify_epsilon_m: If set, include a Douglas-Peucker simplified track
+        max_track_points: Cap on points in the simplified track
+
+    Returns:
+        Dictionary with sources, located tracks, stream counts, GPS statistics
+        (count/min/max/avg/first/last per axis), flight metrics and IMU stats
+    """
+    summary: Dict[str, Any] = {
+        "sources": list(data.sources),
+        "tracks": [track.describe() for track in data.tracks],
+        "streams": {name: dict(info) for name, info in data.streams.items()},
+        "gps": {},
+        "flight_metrics": {},
+        "imu": {name: stats.summary() for name, stats in data.imu.items() if stats.count},
+        "errors": data.errors[:20],
+    }
+
+    if data.gps_points:
+        for axis in ("latitude", "longitude", "altitude"):
+            column = data.gps[axis]
+            finite = column[np.isfinite(column)]
+            if finite.size:
+                summary["gps"][axis] = {
+                    "count": int(finite.size),
+                    "min": float(finite.min()),
+                    "max": float(finite.max()),
+                    "avg": float(finite.mean()),
+                    "first": float(finite[0]),
+                    "last": float(finite[-1]),
+                }
+        summary["flight_metrics"] = compute_flight_metrics(data.gps)
+        if summary["flight_metrics"]:
+            summary["gps"]["bounds"] = dict(summary["flight_metrics"]["bounds"])
+            if "altitude" in summary["gps"]:
+                summary["gps"]["bounds"]["min_alt"] = summary["gps"]["altitude"]["min"]
+                summary["gps"]["bounds"]["max_alt"] = summary["gps"]["altitude"]["max"]
+
+        if simplify_epsilon_m is not None:
+            keep = douglas_peucker(data.gps["latitude"], data.gps["longitude"], simplify_epsilon_m)
+            if len(keep) > max_track_points:
+                keep = keep[np.linspace(0, len(keep) - 1, max_track_points).astype(np.int64)]
+            track = np.stack([data.gps[name][keep] for name in ("time", "latitude", "longitude", "altitude")], axis=1)
+            summary["simplified_track"] = {
+                "epsilon_m": simplify_epsilon_m,
+                "points": [[None if np.isnan(v) else round(float(v), 7) for v in row] for row in track],
+            }
+    return summary
@@ -8,6 +8,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import math
 
+try:
+    from ..utils.date_parsing import parse_timestamp
+except ImportError:
+    from utils.date_parsing import parse_timestamp  # type: ignore
+
 
 def extract_temporal_metadata(filepath: str, exif_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -110,19 +115,15 @@ def parse_datetime(dt_str: str) -> Optional[datetime]:
     if not dt_str:
         return None
     
+    parsed = parse_timestamp(dt_str, "exif.DateTimeOriginal")
+    if parsed is not None:
+        return parsed
+    
     try:
         import dateutil.parser
         return dateutil.parser.parse(str(dt_str))
-    except Exception as e:
-        try:
-            for fmt in ["%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]:
-                try:
-                    return datetime.strptime(str(dt_str), fmt)
-                except Exception as e:
-                    continue
-        except Exception as e:
-            logger.debug(f"Failed to calculate astronomical time data: {e}")
-    return None
+    except Exception:
+        return None
 
 
 def calculate_sun_position(lat: float, lon: float, dt: datetime) -> Dict[str, Any]:
@@ -5,6 +5,7 @@ Extracts comprehensive metadata from TIFF/IFD files.
 """
 
 import logging
+import mmap
 import struct
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -142,8 +143,13 @@ class TIFFExtractor:
             
             self.file_size = file_path.stat().st_size
             
+            if self.file_size < 8:
+                return {"error": "File too small", "success": False}
+            
+            # IFDs and tag values are scattered; map the file and let slices
+            # page in only the ranges the IFD walk touches
             with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+                self.file_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             
             if len(self.file_data) < 8:
                 return {"error": "File too small", "success": False}
@@ -164,6 +170,10 @@ class TIFFExtractor:
         except Exception as e:
             logger.error(f"Error parsing TIFF: {e}")
             return {"error": str(e), "success": False}
+        finally:
+            if isinstance(self.file_data, mmap.mmap):
+                self.file_data.close()
+                self.file_data = None
     
     def _parse_ifd(self, offset: int, max_entries: int = 100) -> Optional[Dict[str, Any]]:
         """Parse an Image File Directory (IFD)"""
@@ -426,7 +436,7 @@ class BigTIFFExtractor:
         """Parse BigTIFF file"""
         try:
             with open(self.filepath, 'rb') as f:
-                self.file_data = f.read()
+                self.file_data = f.read(16)
             
             if len(self.file_data) < 16:
                 return {"error": "File too small", "success": False}
@@ -6,6 +6,11 @@ Using ephem library for astronomical calculations
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+try:
+    from ..utils.date_parsing import parse_timestamp
+except ImportError:
+    from utils.date_parsing import parse_timestamp  # type: ignore
+
 
 try:
     from ephem import Observer, Sun, Moon
@@ -72,10 +77,9 @@ def extract_time_based_metadata(timestamp: str, gps_data: Optional[Dict] = None,
     try:
         # Parse timestamp
         if isinstance(timestamp, str):
-            try:
-                dt = datetime.fromisoformat(timestamp.replace(' ', 'T'))
-            except ValueError:
-                dt = datetime.strptime(timestamp, "%Y:%m:%d %H:%M:%S")
+            dt = parse_timestamp(timestamp)
+            if dt is None:
+                raise ValueError(f"Unrecognised timestamp: {timestamp}")
         else:
             dt = timestamp
         
@@ -17,6 +17,11 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import re
 
+try:
+    from ..utils.date_parsing import parse_timestamp, parse_timestamps
+except ImportError:
+    from utils.date_parsing import parse_timestamp, parse_timestamps  # type: ignore
+
 logger = logging.getLogger("metaextract.timeline")
 
 class TimelineReconstructor:
@@ -250,24 +255,35 @@ class TimelineReconstructor:
             # Get file identifier
             file_id = self._get_file_identifier(metadata, file_index)
             
-            # Extract timestamps from all known fields
+            # Extract timestamps from all known fields, then parse them in one batch
+            found = []
             for section, field, description in self.timestamp_fields:
                 timestamp_value = self._extract_timestamp_value(metadata, section, field)
-                
                 if timestamp_value:
-                    event = {
-                        "file_index": file_index,
-                        "file_identifier": file_id,
-                        "event_type": description,
-                        "source_section": section,
-                        "source_field": field,
-                        "raw_timestamp": timestamp_value,
-                        "parsed_datetime": self._parse_timestamp(timestamp_value),
-                        "confidence": self._assess_timestamp_confidence(section, field, timestamp_value),
-                        "metadata_context": self._get_timestamp_context(metadata, section, field)
-                    }
-                    
-                    events.append(event)
+                    found.append((section, field, description, timestamp_value))
+            parsed_values = parse_timestamps(
+                [value for _, _, _, value in found],
+                [f"{section}.{field}" for section, field, _, _ in found],
+                tz="wall",
+                loose=True,
+            )
+            
+            for (section, field, description, timestamp_value), parsed in zip(found, parsed_values):
+                if parsed is None:
+                    logger.warning(f"Could not parse timestamp: {timestamp_value}")
+                event = {
+                    "file_index": file_index,
+                    "file_identifier": file_id,
+                    "event_type": description,
+                    "source_section": section,
+                    "source_field": field,
+                    "raw_timestamp": timestamp_value,
+                    "parsed_datetime": parsed,
+                    "confidence": self._assess_timestamp_confidence(section, field, timestamp_value),
+                    "metadata_context": self._get_timestamp_context(metadata, section, field)
+                }
+                
+                events.append(event)
             
             # Extract additional timestamps from custom fields
             custom_events = self._extract_custom_timestamps(metadata, file_index, file_id)
@@ -306,49 +322,21 @@ class TimelineReconstructor:
         except Exception as e:
             return None
     
-    def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
-        """Parse timestamp string into datetime object."""
+    def _parse_timestamp(self, timestamp_str: str, source: Optional[str] = None) -> Optional[datetime]:
+        """
+        Parse timestamp string into a naive (wall-clock) datetime object.
+
+        Uses the shared parser (EXIF, ISO 8601, QuickTime, PDF, RFC 2822 and
+        slash dates, then a numeric fallback); source, e.g. "xmp.CreateDate",
+        lets it try that field's previous format first.
+        """
         if not timestamp_str:
             return None
         
-        # Common timestamp formats
-        formats = [
-            "%Y:%m:%d %H:%M:%S",      # EXIF format
-            "%Y-%m-%d %H:%M:%S",      # ISO format
-            "%Y-%m-%dT%H:%M:%S",      # ISO T format
-            "%Y-%m-%dT%H:%M:%SZ",     # ISO Z format
-            "%Y-%m-%d",               # Date only
-            "%Y:%m:%d",               # EXIF date only
-            "%m/%d/%Y %H:%M:%S",      # US format
-            "%d/%m/%Y %H:%M:%S",      # European format
-        ]
-        
-        # Try each format
-        for fmt in formats:
-            try:
-                return datetime.strptime(timestamp_str.strip(), fmt)
-            except ValueError:
-                continue
-        
-        # Try parsing with regex for flexible formats
-        try:
-            # Extract numbers from timestamp
-            numbers = re.findall(r'\d+', timestamp_str)
-            if len(numbers) >= 3:
-                year = int(numbers[0]) if len(numbers[0]) == 4 else int(numbers[2])
-                month = int(numbers[1])
-                day = int(numbers[2]) if len(numbers[0]) == 4 else int(numbers[0])
-                
-                hour = int(numbers[3]) if len(numbers) > 3 else 0
-                minute = int(numbers[4]) if len(numbers) > 4 else 0
-                second = int(numbers[5]) if len(numbers) > 5 else 0
-                
-                return datetime(year, month, day, hour, minute, second)
-        except (ValueError, IndexError):
-            pass
-        
-        logger.warning(f"Could not parse timestamp: {timestamp_str}")
-        return None
+        parsed = parse_timestamp(timestamp_str, source, tz="wall", loose=True)
+        if parsed is None:
+            logger.warning(f"Could not parse timestamp: {timestamp_str}")
+        return parsed
     
     def _assess_timestamp_confidence(self, section: str, field: str, value: str) -> float:
         """Assess confidence level of timestamp based on source and format."""
@@ -446,7 +434,7 @@ class TimelineReconstructor:
                 for field in vendor_fields:
                     if field in makernote:
                         value = str(makernote[field])
-                        parsed = self._parse_timestamp(value)
+                        parsed = self._parse_timestamp(value, f"makernote.{field}")
                         
                         if parsed:
                             event = {
@@ -476,7 +464,7 @@ class TimelineReconstructor:
                 for field in xmp_timestamp_fields:
                     if field in xmp:
                         value = str(xmp[field])
-                        parsed = self._parse_timestamp(value)
+                        parsed = self._parse_timestamp(value, f"xmp.{field}")
                         
                         if parsed:
                             event = {
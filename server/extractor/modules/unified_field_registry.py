@@ -25,6 +25,7 @@ from field_definitions import (
     ValidationResult,
     FieldValidationRule,
 )
+from field_search_index import FieldSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +97,7 @@ class FieldRegistryCore:
         self._fields: Dict[str, FieldDefinition] = {}
         self._collections: Dict[str, FieldCollection] = {}
         self._indexes: Dict[str, Dict[str, FieldDefinition]] = {}
+        self._search_index = FieldSearchIndex()
         self._storage_path = storage_path
         self._version_history: List[Dict[str, Any]] = []
         self._event_callbacks: Dict[str, List[callable]] = {}
@@ -197,6 +199,7 @@ class FieldRegistryCore:
                 if fail_on_error:
                     raise
                 logger.warning(f"Failed to register field '{field.name}': {e}")
+        self._search_index.prepare()
         return results
     
     def unregister_field(self, field_name: str) -> bool:
@@ -349,39 +352,26 @@ class FieldRegistryCore:
         """
         Search fields by name or metadata.
         
+        Matches are ranked: exact name, name prefix, name token prefix, name
+        substring, standard name, keyword/tag/alias, then description.
+        Queries shorter than three characters match name prefixes only.
+        
         Args:
             query: Search query string
             search_metadata: Whether to search in field metadata
             max_results: Maximum number of results
             
         Returns:
-            List of matching FieldDefinition objects
+            List of matching FieldDefinition objects, best match first
         """
-        query = query.lower()
-        results = []
-        
-        for field in self._fields.values():
-            match = False
-            
-            if query in field.name.lower():
-                match = True
-            elif query in field.description.lower():
-                match = True
-            elif query in field.standard_name.lower():
-                match = True
-            
-            if not match and search_metadata:
-                if query in field.metadata.search_keywords:
-                    match = True
-                elif query in field.metadata.category_tags:
-                    match = True
-                elif query in field.metadata.alias_names:
-                    match = True
-            
-            if match:
-                results.append(field)
-        
-        return results[:max_results]
+        return self._search_index.search(query, search_metadata, max_results)
+    
+    def prefix_search(self, prefix: str, max_results: int = 20) -> List[FieldDefinition]:
+        """
+        Autocomplete lookup: fields whose name, or a camelCase/snake_case
+        token of it, starts with prefix. Whole-name matches come first.
+        """
+        return self._search_index.prefix_search(prefix, max_results)
     
     def find_related_fields(self, field_name: str) -> List[FieldDefinition]:
         """Find fields related to a given field"""
@@ -416,29 +406,13 @@ class FieldRegistryCore:
         """
         Find similar fields using name similarity.
         
+        Candidates are pruned by shared name trigrams before scoring, so
+        only the closest names are compared with SequenceMatcher.
+        
         Returns:
             List of (field, similarity_score) tuples
         """
-        field = self.get_field(field_name)
-        if not field:
-            return []
-        
-        from difflib import SequenceMatcher
-        
-        target_name = field.name.lower()
-        similarities = []
-        
-        for name, other_field in self._fields.items():
-            if name == field_name:
-                continue
-            
-            ratio = SequenceMatcher(
-                None, target_name, name.lower()
-            ).ratio()
-            similarities.append((other_field, ratio))
-        
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:max_similar]
+        return self._search_index.similar(field_name, max_similar)
     
     # =========================================================================
     # Collection Management
@@ -601,6 +575,7 @@ class FieldRegistryCore:
             "by_extension": {},
             "by_standard_name": {}
         }
+        self._search_index.clear()
     
     def _update_indexes(self, field: FieldDefinition) -> None:
         """Update all indexes with a field"""
@@ -634,9 +609,12 @@ class FieldRegistryCore:
             if ext not in self._indexes["by_extension"]:
                 self._indexes["by_extension"][ext] = {}
             self._indexes["by_extension"][ext][field.name] = field
+        
+        self._search_index.add(field)
     
     def _remove_from_indexes(self, field: FieldDefinition) -> None:
         """Remove a field from all indexes"""
+        self._search_index.remove(field.name)
         for index_name in self._indexes:
             index = self._indexes[index_name]
             keys_to_remove = []
@@ -654,6 +632,7 @@ class FieldRegistryCore:
         self._init_indexes()
         for field in self._fields.values():
             self._update_indexes(field)
+        self._search_index.prepare()
         logger.info("Indexes rebuilt successfully")
     
     # =========================================================================
@@ -711,6 +690,7 @@ class FieldRegistryCore:
             collection = FieldCollection.from_dict(collection_data)
             self._collections[collection.collection_id] = collection
         
+        self._search_index.prepare()
         count = len(fields_data)
         logger.info(f"Loaded {count} fields from {load_path}")
         return count
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+Streaming Vector GIS Scanner
+
+Summarises GeoJSON, KML/KMZ and Shapefile datasets without materialising
+their features:
+- GeoJSON: incremental reader over the top-level object; each member of
+  "features" is decoded on its own and dropped, so only one feature is in
+  memory at a time (newline-delimited GeoJSON is accepted too)
+- KML/KMZ: ElementTree.iterparse with finished elements pruned from the
+  tree; KMZ members are streamed straight out of the zip
+- Shapefile: bounds, shape type and Z/M ranges from the 100-byte .shp
+  header, record count from .shx, field table from the .dbf header;
+  per-record bounding boxes are only read when a summary grid is requested
+- Vertices are buffered into fixed-size chunks and reduced with numpy
+  (bbox, optional lon/lat density grid), so memory stays constant
+  regardless of feature count
+
+Usage:
+    from .vector_gis_stream import scan_geojson, scan_kml, scan_shapefile
+    summary = scan_geojson(path, grid=(36, 18))
+    summary["stats"]["bbox"], summary["stats"]["geometry_types"]
+"""
+
+import json
+import logging
+import os
+import struct
+import xml.etree.ElementTree as ET
+import zipfile
+from array import array
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK = 1024 * 1024
+VERTEX_CHUNK = 65536
+MAX_PROPERTY_NAMES = 200
+WORLD_EXTENT = (-180.0, -90.0, 180.0, 90.0)
+
+SHAPE_TYPES = {
+    0: 'NULL', 1: 'POINT', 3: 'POLYLINE', 5: 'POLYGON',
+    8: 'MULTIPOINT', 11: 'POINTZ', 13: 'POLYLINEZ', 15: 'POLYGONZ',
+    18: 'MULTIPOINTZ', 21: 'POINTM', 23: 'POLYLINEM', 25: 'POLYGONM',
+    28: 'MULTIPOINTM', 31: 'MULTIPATCH'
+}
+
+KML_GEOMETRIES = {'Point', 'LineString', 'LinearRing', 'Polygon', 'MultiGeometry',
+                  'Track', 'MultiTrack', 'Model'}
+KML_COUNTED = {'Placemark', 'Folder', 'Style', 'StyleMap', 'GroundOverlay',
+               'ScreenOverlay', 'PhotoOverlay', 'NetworkLink'}
+
+GridSpec = Union[int, Tuple[int, int], None]
+
+
+class GeometryStats:
+    """Running feature/geometry/vertex statistics fed one geometry at a time."""
+
+    def __init__(self, grid: GridSpec = None, extent: Tuple[float, float, float, float] = WORLD_EXTENT,
+                 chunk_size: int = VERTEX_CHUNK):
+        self.feature_count = 0
+        self.null_geometries = 0
+        self.vertex_count = 0
+        self.max_feature_vertices = 0
+        self.geometry_types: Dict[str, int] = {}
+        self.vertices_by_type: Dict[str, int] = {}
+        self.property_fields: Dict[str, None] = {}
+        self.bbox: Optional[List[float]] = None
+        self.chunks_reduced = 0
+
+        if isinstance(grid, int):
+            grid = (grid, max(1, grid // 2))
+        self.grid_shape = grid
+        self.extent = extent
+        self._grid = None
+        self._grid_outside = 0
+        if grid is not None:
+            cols, rows = grid
+            self._grid = np.zeros((rows, cols), dtype=np.int64) if NUMPY_AVAILABLE else [[0] * cols for _ in range(rows)]
+
+        self._chunk_size = chunk_size
+        self._xs = array('d')
+        self._ys = array('d')
+
+    # -- feeding ----------------------------------------------------------
+
+    def add_feature(self, feature: Dict[str, Any]) -> None:
+        self.feature_count += 1
+        props = feature.get('properties')
+        if isinstance(props, dict) and len(self.property_fields) < MAX_PROPERTY_NAMES:
+            for key in props:
+                self.property_fields.setdefault(key, None)
+        vertices = self.add_geometry(feature.get('geometry'))
+        if vertices > self.max_feature_vertices:
+            self.max_feature_vertices = vertices
+
+    def add_geometry(self, geom: Optional[Dict[str, Any]]) -> int:
+        """Count one GeoJSON geometry; returns its vertex count."""
+        if not isinstance(geom, dict):
+            self.null_geometries += 1
+            return 0
+        geom_type = geom.get('type') or 'Unknown'
+        self.geometry_types[geom_type] = self.geometry_types.get(geom_type, 0) + 1
+        if geom_type == 'GeometryCollection':
+            vertices = 0
+            for member in geom.get('geometries') or []:
+                vertices += self.add_geometry(member)
+            return vertices
+        try:
+            vertices = _append_positions(geom.get('coordinates'), self._xs, self._ys)
+        except (TypeError, IndexError):
+            vertices = 0
+        self._count_vertices(geom_type, vertices)
+        return vertices
+
+    def add_positions(self, geom_type: str, xs, ys) -> None:
+        """Add a block of already-split coordinates (e.g. one KML <coordinates>)."""
+        count = len(xs)
+        self._xs.extend(xs)
+        self._ys.extend(ys)
+        self._count_vertices(geom_type, count)
+
+    def _count_vertices(self, geom_type: str, vertices: int) -> None:
+        self.vertex_count += vertices
+        self.vertices_by_type[geom_type] = self.vertices_by_type.get(geom_type, 0) + vertices
+        if len(self._xs) >= self._chunk_size:
+            self.flush()
+
+    # -- chunk reduction ----------------------------------------------------
+
+    def flush(self) -> None:
+        if not self._xs:
+            return
+        n = min(len(self._xs), len(self._ys))
+        if NUMPY_AVAILABLE:
+            xs = np.frombuffer(self._xs, dtype=np.float64, count=n)
+            ys = np.frombuffer(self._ys, dtype=np.float64, count=n)
+            finite = np.isfinite(xs) & np.isfinite(ys)
+            if not finite.all():
+                xs, ys = xs[finite], ys[finite]
+            if xs.size:
+                chunk_box = [float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())]
+                self._merge_bbox(chunk_box)
+                if self._grid is not None:
+                    self._bin_numpy(xs, ys)
+        else:
+            chunk_box = [min(self._xs), min(self._ys), max(self._xs), max(self._ys)]
+            self._merge_bbox(chunk_box)
+            if self._grid is not None:
+                for x, y in zip(self._xs, self._ys):
+                    self._bin_point(x, y)
+        self.chunks_reduced += 1
+        self._xs = array('d')
+        self._ys = array('d')
+
+    def _merge_bbox(self, box: List[float]) -> None:
+        if self.bbox is None:
+            self.bbox = box
+        else:
+            self.bbox = [min(self.bbox[0], box[0]), min(self.bbox[1], box[1]),
+                         max(self.bbox[2], box[2]), max(self.bbox[3], box[3])]
+
+    def _bin_numpy(self, xs, ys) -> None:
+        rows, cols = self._grid.shape
+        x0, y0, x1, y1 = self.extent
+        inside = (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+        self._grid_outside += int(inside.size - inside.sum())
+        cx = ((xs[inside] - x0) / ((x1 - x0) or 1.0) * cols).astype(np.int64).clip(0, cols - 1)
+        cy = ((ys[inside] - y0) / ((y1 - y0) or 1.0) * rows).astype(np.int64).clip(0, rows - 1)
+        self._grid += np.bincount(cy * cols + cx, minlength=rows * cols).reshape(rows, cols)
+
+    def _bin_point(self, x: float, y: float) -> None:
+        cols, rows = self.grid_shape
+        x0, y0, x1, y1 = self.extent
+        if not (x0 <= x <= x1 and y0 <= y <= y1):
+            self._grid_outside += 1
+            return
+        cx = min(cols - 1, int((x - x0) / ((x1 - x0) or 1.0) * cols))
+        cy = min(rows - 1, int((y - y0) / ((y1 - y0) or 1.0) * rows))
+        self._grid[cy][cx] += 1
+
+    # -- results --------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        self.flush()
+        result: Dict[str, Any] = {
+            "feature_count": self.feature_count,
+            "geometry_types": dict(self.geometry_types),
+            "null_geometries": self.null_geometries,
+            "vertex_count": self.vertex_count,
+            "vertices_by_type": dict(self.vertices_by_type),
+            "max_feature_vertices": self.max_feature_vertices,
+            "bbox": self.bbox,
+            "property_fields": list(self.property_fields),
+        }
+        if self._grid is not None:
+            counts = self._grid.tolist() if NUMPY_AVAILABLE else [row[:] for row in self._grid]
+            result["grid"] = {
+                "extent": list(self.extent),
+                "cols": self.grid_shape[0],
+                "rows": self.grid_shape[1],
+                "counts": counts,  # row 0 is the southern edge
+                "outside": self._grid_outside,
+            }
+        return result
+
+
+def _append_positions(coords, xs: array, ys: array) -> int:
+    """Flatten nested GeoJSON coordinates into xs/ys; returns vertex count."""
+    if not coords:
+        return 0
+    first = coords[0]
+    if isinstance(first, (int, float)):
+        xs.append(first)
+        ys.append(coords[1])
+        return 1
+    if first and isinstance(first[0], (int, float)):
+        xs.extend(p[0] for p in coords)
+        ys.extend(p[1] for p in coords)
+        return len(coords)
+    return sum(_append_positions(part, xs, ys) for part in coords)
+
+
+# ---------------------------------------------------------------------------
+# GeoJSON
+# ---------------------------------------------------------------------------
+
+class _JsonStream:
+    """Buffered reader that decodes one JSON value at a time from a text file."""
+
+    def __init__(self, f: IO[str], block: int = READ_BLOCK):
+        self.f = f
+        self.block = block
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, min_chars: int) -> bool:
+        if self.eof:
+            return False
+        if self.pos > len(self.buf) // 2:
+            self.consumed += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.f.read(max(self.block, min_chars))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n\x1e﻿':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.block):
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        want = self.block
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A value ending exactly at the buffer edge may be a cut-off number
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill(want):
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                self.pos = end
+                return obj
+            want *= 2
+
+
+def iter_geojson(f: IO[str], header: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield features (or bare geometries) one by one; top-level members go to header."""
+    stream = _JsonStream(f)
+    first = stream.peek()
+    if first != '{':
+        raise json.JSONDecodeError("GeoJSON must start with an object", stream.buf, stream.pos)
+
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'features' and stream.peek() == '[':
+            stream.pos += 1
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    sep = stream.peek()
+                    stream.pos += 1
+                    if sep == ']':
+                        break
+                    if sep != ',':
+                        raise json.JSONDecodeError("Expected ',' or ']'", stream.buf, stream.pos - 1)
+        else:
+            header[key] = stream.value()
+        sep = stream.peek()
+        stream.pos += 1
+        if sep == '}':
+            break
+        if sep != ',':
+            raise json.JSONDecodeError("Expected ',' or '}'", stream.buf, stream.pos - 1)
+
+    # Single Feature / Geometry documents, then any newline-delimited followers
+    if header.get('type') not in (None, 'FeatureCollection'):
+        yield dict(header)
+        while stream.peek() == '{':
+            yield stream.value()
+
+
+def scan_geojson(filepath: str, grid: GridSpec = None) -> Dict[str, Any]:
+    """Single streaming pass over a GeoJSON file (raises json.JSONDecodeError if malformed)."""
+    stats = GeometryStats(grid=grid)
+    header: Dict[str, Any] = {}
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        for item in iter_geojson(f, header):
+            if not isinstance(item, dict):
+                continue
+            if item.get('type') == 'Feature':
+                stats.add_feature(item)
+            else:
+                stats.feature_count += 1
+                stats.add_geometry(item)
+
+    summary = {
+        "type": header.get('type'),
+        "name": header.get('name'),
+        "crs": header.get('crs'),
+        "declared_bbox": header.get('bbox'),
+        "stats": stats.summary(),
+    }
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# KML / KMZ
+# ---------------------------------------------------------------------------
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _split_kml_coordinates(text: str) -> Tuple[List[float], List[float]]:
+    tuples = text.split()
+    if not tuples:
+        return [], []
+    dims = tuples[0].count(',') + 1
+    if NUMPY_AVAILABLE and dims >= 2 and all(t.count(',') + 1 == dims for t in tuples):
+        try:
+            values = np.array(text.replace(',', ' ').split(), dtype=np.float64).reshape(-1, dims)
+            return values[:, 0], values[:, 1]
+        except ValueError:
+            pass
+    xs: List[float] = []
+    ys: List[float] = []
+    for t in tuples:
+        parts = t.split(',')
+        if len(parts) >= 2:
+            try:
+                x, y = float(parts[0]), float(parts[1])
+            except ValueError:
+                continue
+            xs.append(x)
+            ys.append(y)
+    return xs, ys
+
+
+def scan_kml(source: Union[str, IO[bytes]], grid: GridSpec = None) -> Dict[str, Any]:
+    """Single iterparse pass over a KML document (path or binary stream)."""
+    stats = GeometryStats(grid=grid)
+    counts = {tag: 0 for tag in KML_COUNTED}
+    summary: Dict[str, Any] = {"version": None, "name": None, "description": None}
+    stack: List[ET.Element] = []
+    geometry_stack: List[str] = []
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        tag = _local(elem.tag)
+        if event == 'start':
+            if not stack and elem.tag.startswith('{'):
+                namespace = elem.tag[1:].split('}', 1)[0]
+                summary["version"] = namespace.rstrip('/').rsplit('/', 1)[-1]
+            stack.append(elem)
+            if tag in KML_COUNTED:
+                counts[tag] += 1
+            if tag == 'Placemark':
+                stats.feature_count += 1
+            elif tag in KML_GEOMETRIES:
+                # A polygon's boundary rings are part of the polygon, not geometries
+                if not (tag == 'LinearRing' and geometry_stack and geometry_stack[-1] == 'Polygon'):
+                    stats.geometry_types[tag] = stats.geometry_types.get(tag, 0) + 1
+                geometry_stack.append(tag)
+            continue
+
+        stack.pop()
+        parent = _local(stack[-1].tag) if stack else ''
+        if tag == 'coordinates' and elem.text:
+            xs, ys = _split_kml_coordinates(elem.text)
+            geom_type = geometry_stack[-1] if geometry_stack else 'Unknown'
+            if geom_type in ('LinearRing', 'LineString') and len(geometry_stack) > 1 \
+                    and geometry_stack[-2] == 'Polygon':
+                geom_type = 'Polygon'
+            stats.add_positions(geom_type, xs, ys)
+        elif tag == 'coord' and elem.text:  # gx:Track "lon lat alt"
+            parts = elem.text.split()
+            if len(parts) >= 2:
+                try:
+                    stats.add_positions('Track', [float(parts[0])], [float(parts[1])])
+                except ValueError:
+                    pass
+        elif tag == 'name' and summary["name"] is None and parent in ('Document', 'Folder', 'kml', 'Placemark'):
+            summary["name"] = (elem.text or '').strip() or None
+        elif tag == 'description' and summary["description"] is None and parent in ('Document', 'Folder', 'kml'):
+            summary["description"] = (elem.text or '').strip()[:500] or None
+        elif tag in KML_GEOMETRIES and geometry_stack:
+            geometry_stack.pop()
+
+        # Prune finished elements so the tree never grows with the document
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+    summary["counts"] = counts
+    summary["stats"] = stats.summary()
+    return summary
+
+
+def scan_kmz(filepath: str, grid: GridSpec = None) -> Dict[str, Any]:
+    """Stream the main KML document out of a KMZ archive."""
+    with zipfile.ZipFile(filepath, 'r') as z:
+        names = z.namelist()
+        kml_files = [n for n in names if n.lower().endswith('.kml')]
+        summary: Dict[str, Any] = {"zip_contents": names[:20], "kml_files": kml_files}
+        if not kml_files:
+            return summary
+        main = 'doc.kml' if 'doc.kml' in kml_files else kml_files[0]
+        summary["kml_size"] = z.getinfo(main).file_size
+        with z.open(main) as member:
+            summary.update(scan_kml(member, grid=grid))
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Shapefile
+# ---------------------------------------------------------------------------
+
+def parse_shp_header(header: bytes) -> Optional[Dict[str, Any]]:
+    """Decode the 100-byte main-file header shared by .shp and .shx."""
+    if len(header) < 100:
+        return None
+    file_code = struct.unpack('>i', header[0:4])[0]
+    if file_code != 9994:
+        return None
+    file_length = struct.unpack('>i', header[24:28])[0] * 2
+    version, shape_type = struct.unpack('<ii', header[28:36])
+    xmin, ymin, xmax, ymax, zmin, zmax, mmin, mmax = struct.unpack('<8d', header[36:100])
+    result = {
+        "file_length_bytes": file_length,
+        "version": version,
+        "shape_type": shape_type,
+        "shape_type_name": SHAPE_TYPES.get(shape_type, f'UNKNOWN({shape_type})'),
+        "bbox": [xmin, ymin, xmax, ymax],
+    }
+    if shape_type in (11, 13, 15, 18, 31):
+        result["z_range"] = [zmin, zmax]
+    if shape_type in (11, 13, 15, 18, 21, 23, 25, 28, 31):
+        result["m_range"] = [mmin, mmax]
+    return result
+
+
+def parse_dbf_header(f: IO[bytes], max_fields: int = 255) -> Optional[Dict[str, Any]]:
+    """Record count and field descriptors from a dBASE header."""
+    head = f.read(32)
+    if len(head) < 32:
+        return None
+    records, header_length, record_length = struct.unpack('<IHH', head[4:12])
+    fields = []
+    while len(fields) < max_fields:
+        desc = f.read(32)
+        if len(desc) < 1 or desc[0] == 0x0D or len(desc) < 32:
+            break
+        fields.append({
+            "name": desc[:11].split(b'\x00', 1)[0].decode('latin-1', errors='replace'),
+            "type": chr(desc[11]),
+            "length": desc[16],
+            "decimals": desc[17],
+        })
+    return {
+        "record_count": records,
+        "header_length": header_length,
+        "record_length": record_length,
+        "fields": fields,
+    }
+
+
+def _scan_shp_records(f: IO[bytes], file_length: int, stats: GeometryStats) -> None:
+    """Walk record headers, binning each record's bbox centre (8 + 36 bytes per record)."""
+    pos = 100
+    while pos + 12 <= file_length:
+        f.seek(pos)
+        head = f.read(44)
+        if len(head) < 12:
+            break
+        content_length = struct.unpack('>i', head[4:8])[0] * 2
+        shape_type = struct.unpack('<i', head[8:12])[0]
+        name = SHAPE_TYPES.get(shape_type, 'UNKNOWN')
+        stats.feature_count += 1
+        if shape_type == 0:
+            stats.null_geometries += 1
+        else:
+            stats.geometry_types[name] = stats.geometry_types.get(name, 0) + 1
+            if shape_type in (1, 11, 21) and len(head) >= 28:
+                x, y = struct.unpack('<2d', head[12:28])
+                stats.add_positions(name, [x], [y])
+            elif len(head) >= 44:
+                xmin, ymin, xmax, ymax = struct.unpack('<4d', head[12:44])
+                stats.add_positions(name, [(xmin + xmax) / 2], [(ymin + ymax) / 2])
+        pos += 8 + content_length
+
+
+def scan_shapefile(filepath: str, grid: GridSpec = None) -> Dict[str, Any]:
+    """Header-level summary of a .shp (or a zipped shapefile set)."""
+    if filepath.lower().endswith('.zip'):
+        return _scan_zipped_shapefile(filepath)
+
+    base = os.path.splitext(filepath)[0]
+    summary: Dict[str, Any] = {}
+    with open(filepath, 'rb') as f:
+        header = parse_shp_header(f.read(100))
+        if header is None:
+            return {"error": "Not an ESRI shapefile"}
+        summary.update(header)
+        if grid is not None:
+            stats = GeometryStats(grid=grid, extent=tuple(header["bbox"]))
+            _scan_shp_records(f, min(header["file_length_bytes"], os.path.getsize(filepath)), stats)
+            summary["record_grid"] = stats.summary().get("grid")
+
+    components = {}
+    for ext in ('.shp', '.shx', '.dbf', '.prj', '.cpg'):
+        path = base + ext
+        if os.path.exists(path):
+            components[ext[1:]] = os.path.getsize(path)
+    summary["components"] = components
+
+    if 'shx' in components:
+        summary["record_count"] = max(0, (components['shx'] - 100) // 8)
+    if 'dbf' in components:
+        with open(base + '.dbf', 'rb') as dbf:
+            summary["dbf"] = parse_dbf_header(dbf)
+    if 'prj' in components and components['prj'] < 65536:
+        with open(base + '.prj', 'r', encoding='latin-1') as prj:
+            summary["prj_wkt"] = prj.read().strip()
+    return summary
+
+
+def _scan_zipped_shapefile(filepath: str) -> Dict[str, Any]:
+    with zipfile.ZipFile(filepath, 'r') as z:
+        names = z.namelist()
+        shp = next((n for n in names if n.lower().endswith('.shp')), None)
+        summary: Dict[str, Any] = {"shp_in_zip": shp}
+        if shp is None:
+            return summary
+        base = shp[:-4]
+        with z.open(shp) as member:
+            header = parse_shp_header(member.read(100))
+        if header:
+            summary.update(header)
+        lower = {n.lower(): n for n in names}
+        shx = lower.get(base.lower() + '.shx')
+        if shx:
+            summary["record_count"] = max(0, (z.getinfo(shx).file_size - 100) // 8)
+        dbf = lower.get(base.lower() + '.dbf')
+        if dbf:
+            summary["dbf_in_zip"] = dbf
+            with z.open(dbf) as member:
+                summary["dbf"] = parse_dbf_header(member)
+    return summary
@@ -1,6 +1,8 @@
 """
 Video Telemetry Extraction
-Extract GoPro/DJI/GPMF telemetry summaries via ExifTool.
+Extract GoPro/DJI/GPMF telemetry summaries. GPMF tracks and DJI SRT streams
+are decoded natively from the container (see telemetry_decoder); ExifTool is
+only used when the native decoder finds nothing.
 """
 
 from typing import Any, Dict, Iterable, Optional
@@ -11,6 +13,16 @@ import shutil
 import subprocess
 
 
+try:
+    from .telemetry_decoder import read_telemetry, summarize_telemetry
+except ImportError:
+    try:
+        from telemetry_decoder import read_telemetry, summarize_telemetry
+    except ImportError:
+        read_telemetry = None
+        summarize_telemetry = None
+
+
 logger = logging.getLogger(__name__)
 
 EXIFTOOL_PATH = shutil.which("exiftool")
@@ -259,7 +271,50 @@ def _run_exiftool(filepath: str) -> Optional[Dict[str, Any]]:
     return data[0] if data else None
 
 
+def _native_telemetry(filepath: str) -> Optional[Dict[str, Any]]:
+    """Decode telemetry from the container's sample tables, without ExifTool."""
+    if read_telemetry is None:
+        return None
+    try:
+        data = read_telemetry(filepath)
+    except Exception as exc:
+        logger.debug(f"Native telemetry decode failed: {exc}")
+        return None
+    if data is None or not (data.gps_points or data.streams):
+        return None
+
+    summary = summarize_telemetry(data, simplify_epsilon_m=5.0)
+    telemetry = {
+        "available": True,
+        "decoder": "native",
+        "telemetry_present": True,
+        "sources": summary["sources"],
+        "field_counts": {},
+        "gpmf": summary["streams"] if "gpmf" in summary["sources"] else {},
+        "gopro": {"imu": summary["imu"]} if summary["imu"] else {},
+        "dji": {},
+        "quicktime": {},
+        "tracks": {f"track_{t['track_id']}": t for t in summary["tracks"]},
+        "gps": summary["gps"],
+        "flight_metrics": summary["flight_metrics"],
+        "errors": summary["errors"],
+    }
+    if "simplified_track" in summary:
+        telemetry["simplified_track"] = summary["simplified_track"]
+    if any(source.startswith("dji") for source in summary["sources"]):
+        telemetry["dji"] = {"gps_points": data.gps_points}
+    telemetry["field_counts"] = {
+        key: len(telemetry[key])
+        for key in ["gpmf", "gopro", "dji", "quicktime", "tracks"]
+    }
+    return telemetry
+
+
 def extract_video_telemetry(filepath: str) -> Dict[str, Any]:
+    native = _native_telemetry(filepath)
+    if native is not None:
+        return native
+
     if not EXIFTOOL_AVAILABLE:
         return {"available": False, "reason": "exiftool not installed"}
 
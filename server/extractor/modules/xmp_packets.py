@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Shared XMP Packet Layer
+
+Locates every XMP packet in a file once, parses each packet once with a
+streaming (expat) RDF parser, and exposes the result as a
+(namespace URI, property) -> values table:
+- JPEG: standard APP1 packet plus extended XMP reassembled from its
+  APP1 chunks (GUID/offset framing, XMP spec part 3 §1.1.3.1)
+- PNG iTXt/tEXt "XML:com.adobe.xmp", WebP/RIFF "XMP "/"_PMX" chunks,
+  TIFF tag 700, all through the segment directory's ranged reads
+- Other files: bounded block scan for <x:xmpmeta> ... </x:xmpmeta>
+- Simple values are strings; Bag/Seq/Alt are lists; structs (e.g. each
+  xmpMM:History stEvt entry) are dicts keyed by field name
+- Tables are cached per file (path, size, mtime), so every consumer of
+  the same file shares one parse
+
+Usage:
+    from .xmp_packets import get_xmp_table
+    table = get_xmp_table(path)
+    table.text("photoshop:Headline")
+    table.values("dc:subject")
+    table.get("http://ns.adobe.com/xap/1.0/mm/", "History")
+"""
+
+import logging
+import os
+import xml.parsers.expat
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from ..formats.segment_directory import decode_png_text, get_segment_directory
+    from ..utils.bounded_cache import BoundedCache
+except ImportError:
+    from formats.segment_directory import decode_png_text, get_segment_directory
+    from utils.bounded_cache import BoundedCache
+
+logger = logging.getLogger(__name__)
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+
+# Well-known prefixes, used when a lookup names a prefix the packet did not declare
+STANDARD_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "xmp": "http://ns.adobe.com/xap/1.0/",
+    "xmpMM": "http://ns.adobe.com/xap/1.0/mm/",
+    "xmpRights": "http://ns.adobe.com/xap/1.0/rights/",
+    "xmpDM": "http://ns.adobe.com/xmp/1.0/DynamicMedia/",
+    "xmpNote": "http://ns.adobe.com/xmp/note/",
+    "stEvt": "http://ns.adobe.com/xap/1.0/sType/ResourceEvent#",
+    "stRef": "http://ns.adobe.com/xap/1.0/sType/ResourceRef#",
+    "photoshop": "http://ns.adobe.com/photoshop/1.0/",
+    "crs": "http://ns.adobe.com/camera-raw-settings/1.0/",
+    "lr": "http://ns.adobe.com/lightroom/1.0/",
+    "tiff": "http://ns.adobe.com/tiff/1.0/",
+    "exif": "http://ns.adobe.com/exif/1.0/",
+    "exifEX": "http://cipa.jp/exif/1.0/",
+    "aux": "http://ns.adobe.com/exif/1.0/aux/",
+    "pdf": "http://ns.adobe.com/pdf/1.3/",
+    "Iptc4xmpCore": "http://iptc.org/std/Iptc4xmpCore/1.0/xmlns/",
+    "Iptc4xmpExt": "http://iptc.org/std/Iptc4xmpExt/2008-02-29/",
+    "plus": "http://ns.useplus.org/ldf/xmp/1.0/",
+    "dcprefs": "http://ns.adobe.com/dcprefs/1.0/",
+    "cc": "http://creativecommons.org/ns#",
+    "GPano": "http://ns.google.com/photos/1.0/panorama/",
+    "GCamera": "http://ns.google.com/photos/1.0/camera/",
+    "Container": "http://ns.google.com/photos/1.0/container/",
+    "Item": "http://ns.google.com/photos/1.0/container/item/",
+}
+
+XMP_APP1_SIGNATURE = "http://ns.adobe.com/xap/1.0/"
+XMP_EXTENSION_SIGNATURE = "http://ns.adobe.com/xmp/extension/"
+
+MAX_PACKET_BYTES = 64 * 1024 * 1024
+MAX_SCAN_BYTES = 64 * 1024 * 1024
+SCAN_BLOCK = 1024 * 1024
+MAX_CACHED_TABLES = 32
+MAX_CACHED_TABLE_BYTES = 32 << 20
+
+
+class XmpTable:
+    """Parsed XMP properties of one file, keyed by (namespace URI, name)."""
+
+    def __init__(self):
+        self.properties: Dict[str, Dict[str, List[Any]]] = {}
+        self.prefixes: Dict[str, str] = {}
+        self.packets: List[Dict[str, Any]] = []
+        self.texts: List[str] = []
+        self.errors: List[str] = []
+        self._folded: Optional[Dict[str, Dict[str, str]]] = None
+        self._local: Optional[Dict[str, Tuple[str, str]]] = None
+
+    def __len__(self) -> int:
+        return sum(len(props) for props in self.properties.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.packets)
+
+    @property
+    def text_data(self) -> Optional[str]:
+        """All packets as one string, for pattern-based consumers."""
+        return "\n".join(self.texts) if self.texts else None
+
+    def _add(self, ns: str, name: str, value: Any) -> None:
+        self.properties.setdefault(ns, {}).setdefault(name, []).append(value)
+
+    # -- lookups ----------------------------------------------------------
+
+    def resolve(self, prefix_or_uri: str) -> Optional[str]:
+        if "/" in prefix_or_uri or ":" in prefix_or_uri:
+            return prefix_or_uri
+        return self.prefixes.get(prefix_or_uri) or STANDARD_NAMESPACES.get(prefix_or_uri)
+
+    def _split(self, ns: str, name: Optional[str]) -> Tuple[Optional[str], str]:
+        if name is None:
+            ns, _, name = ns.rpartition(":")
+        return self.resolve(ns), name
+
+    def get(self, ns: str, name: Optional[str] = None, default: Any = None,
+            ignore_case: bool = False) -> Any:
+        """First value of a property: get("dc:title") or get(uri, "title")."""
+        uri, name = self._split(ns, name)
+        values = self.properties.get(uri, {}).get(name) if uri else None
+        if values is None and ignore_case and uri:
+            if self._folded is None:
+                self._folded = {
+                    u: {n.lower(): n for n in props} for u, props in self.properties.items()
+                }
+            real = self._folded.get(uri, {}).get(name.lower())
+            values = self.properties[uri][real] if real else None
+        return values[0] if values else default
+
+    def get_all(self, ns: str, name: Optional[str] = None) -> List[Any]:
+        """Every occurrence of a property across packets."""
+        uri, name = self._split(ns, name)
+        return list(self.properties.get(uri, {}).get(name, [])) if uri else []
+
+    def text(self, ns: str, name: Optional[str] = None, ignore_case: bool = False) -> Optional[str]:
+        """Scalar text of a property (first item of an array)."""
+        value = self.get(ns, name, ignore_case=ignore_case)
+        if isinstance(value, list):
+            value = next((v for v in value if isinstance(v, str)), None)
+        if isinstance(value, str):
+            return value.strip() or None
+        return None
+
+    def values(self, ns: str, name: Optional[str] = None) -> List[str]:
+        """Text items of an array property (a scalar becomes one item)."""
+        value = self.get(ns, name)
+        if value is None:
+            return []
+        items = value if isinstance(value, list) else [value]
+        return [v.strip() for v in items if isinstance(v, str) and v.strip()]
+
+    def find_local(self, name: str) -> Optional[Any]:
+        """First value of a property with this local name in any namespace."""
+        if self._local is None:
+            self._local = {}
+            for uri, props in self.properties.items():
+                for prop in props:
+                    self._local.setdefault(prop.lower(), (uri, prop))
+        hit = self._local.get(name.lower())
+        return self.properties[hit[0]][hit[1]][0] if hit else None
+
+    def select(self, specs: List[Tuple[str, str, Optional[str]]]) -> Dict[str, Any]:
+        """Resolve (qname, field, coercion) specs into a field dict.
+
+        Names match case-insensitively; a qname without a prefix matches that
+        property in any namespace. Coercions are 'int', 'float' or 'bool';
+        text that doesn't coerce is kept as-is.
+        """
+        out: Dict[str, Any] = {}
+        for qname, field, coerce in specs:
+            if ":" in qname:
+                value = self.get(qname, ignore_case=True)
+            else:
+                value = self.find_local(qname)
+            if value is None or value == "" or value == []:
+                continue
+            if isinstance(value, str):
+                value = _coerce(value.strip(), coerce)
+            out[field] = value
+        return out
+
+    def namespace(self, prefix_or_uri: str) -> Dict[str, Any]:
+        """All properties of one namespace (first occurrence each)."""
+        uri = self.resolve(prefix_or_uri)
+        return {name: values[0] for name, values in self.properties.get(uri, {}).items()}
+
+    def has_namespace(self, uri: str) -> bool:
+        return uri in self.properties or uri in self.prefixes.values()
+
+    def iter_properties(self) -> Iterator[Tuple[str, str, Any]]:
+        for uri, props in self.properties.items():
+            for name, values in props.items():
+                yield uri, name, values[0]
+
+    # Read API of libxmp's XMPMeta, so exempi-era callers accept a table
+    def get_property(self, ns: str, name: str) -> Optional[str]:
+        return self.text(ns, name)
+
+    def count_array_items(self, ns: str, name: str) -> int:
+        value = self.get(ns, name)
+        return len(value) if isinstance(value, list) else 0
+
+    def get_array_item(self, ns: str, name: str, index: int) -> Optional[str]:
+        value = self.get(ns, name)
+        if isinstance(value, list) and 0 < index <= len(value):
+            item = value[index - 1]
+            return item if isinstance(item, str) else None
+        return None
+
+
+def _coerce(text: str, kind: Optional[str]) -> Any:
+    try:
+        if kind == "int":
+            return int(text)
+        if kind == "float":
+            return float(text)
+    except ValueError:
+        return text
+    if kind == "bool":
+        return text.lower() in ("true", "1")
+    return text
+
+
+class _Frame:
+    __slots__ = ("role", "name", "sink", "container", "text", "resource")
+
+    def __init__(self, role, name=None, sink=None):
+        self.role = role
+        self.name = name
+        self.sink = sink
+        self.container = None
+        self.text: List[str] = []
+        self.resource = None
+
+
+class _RdfHandler:
+    """expat callbacks turning RDF/XML into table rows without building a tree."""
+
+    def __init__(self, table: XmpTable):
+        self.table = table
+        self.stack: List[_Frame] = [_Frame("outside")]
+
+    @staticmethod
+    def _split(qname: str) -> Tuple[str, str]:
+        uri, _, local = qname.rpartition(" ")
+        return uri, local
+
+    def _top_sink(self, uri, local, value):
+        self.table._add(uri, local, value)
+
+    def _attrs_into(self, attrs, sink) -> None:
+        for key, value in attrs.items():
+            uri, local = self._split(key)
+            if uri in (RDF_NS, XML_NS) or not uri:
+                continue
+            sink(uri, local, value)
+
+    def start_ns(self, prefix, uri):
+        if prefix and prefix not in self.table.prefixes:
+            self.table.prefixes[prefix] = uri
+
+    def start(self, qname, attrs):
+        uri, local = self._split(qname)
+        top = self.stack[-1]
+        role = top.role
+
+        if role == "outside":
+            self.stack.append(_Frame("rdf" if (uri, local) == (RDF_NS, "RDF") else "outside"))
+        elif role == "rdf":
+            # Top-level rdf:Description (or a typed node): attributes are properties
+            self._attrs_into(attrs, self._top_sink)
+            self.stack.append(_Frame("node", sink=self._top_sink))
+        elif role == "node":
+            self.stack.append(self._property_frame(uri, local, attrs, top.sink))
+        elif role == "array":
+            self.stack.append(self._property_frame(uri, local, attrs, top.sink))
+        elif role in ("prop", "struct"):
+            if uri == RDF_NS and local in ("Bag", "Seq", "Alt"):
+                top.container = []
+                items = top.container
+                self.stack.append(_Frame("array", sink=lambda u, n, v: items.append(v)))
+            elif uri == RDF_NS and local == "Description":
+                if not isinstance(top.container, dict):
+                    top.container = {}
+                fields = top.container
+                sink = lambda u, n, v: fields.__setitem__(n, v)
+                self._attrs_into(attrs, sink)
+                self.stack.append(_Frame("node", sink=sink))
+            else:
+                if not isinstance(top.container, dict):
+                    top.container = {}
+                fields = top.container
+                sink = lambda u, n, v: fields.__setitem__(n, v)
+                self.stack.append(self._property_frame(uri, local, attrs, sink))
+        else:
+            self.stack.append(_Frame("outside"))
+
+    def _property_frame(self, uri, local, attrs, sink) -> _Frame:
+        frame = _Frame("prop", name=(uri, local), sink=sink)
+        frame.resource = attrs.get(RDF_NS + " resource")
+        if attrs.get(RDF_NS + " parseType") == "Resource":
+            frame.container = {}
+        fields = {}
+        self._attrs_into(attrs, lambda u, n, v: fields.__setitem__(n, v))
+        if fields:
+            frame.container = fields
+        return frame
+
+    def end(self, qname):
+        frame = self.stack.pop()
+        if frame.role != "prop":
+            return
+        if frame.container is not None:
+            value = frame.container
+        elif frame.resource is not None:
+            value = frame.resource
+        else:
+            value = "".join(frame.text).strip()
+        frame.sink(frame.name[0], frame.name[1], value)
+
+    def chars(self, data):
+        top = self.stack[-1]
+        if top.role == "prop" and top.container is None:
+            top.text.append(data)
+
+
+def parse_xmp_packet(packet: bytes, table: Optional[XmpTable] = None,
+                     source: str = "", block_size: int = SCAN_BLOCK) -> XmpTable:
+    """Parse one packet into a table (a new one unless given) in a single streaming pass."""
+    table = table if table is not None else XmpTable()
+    handler = _RdfHandler(table)
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.chars
+    parser.StartNamespaceDeclHandler = handler.start_ns
+    parser.buffer_text = True
+
+    body = _strip_packet_wrapper(packet)
+    try:
+        view = memoryview(body)
+        for start in range(0, len(body), block_size):
+            parser.Parse(bytes(view[start:start + block_size]), False)
+        parser.Parse(b"", True)
+    except xml.parsers.expat.ExpatError as e:
+        table.errors.append(f"{source or 'packet'}: {e}")
+    table.packets.append({"source": source, "size_bytes": len(packet)})
+    table.texts.append(packet.decode("utf-8", errors="replace"))
+    table._folded = table._local = None
+    return table
+
+
+def _strip_packet_wrapper(packet: bytes) -> bytes:
+    """Trim padding/trailers around the <x:xmpmeta> (or bare <rdf:RDF>) element."""
+    start = packet.find(b"<x:xmpmeta")
+    end_tag = b"</x:xmpmeta>"
+    if start == -1:
+        start = packet.find(b"<rdf:RDF")
+        end_tag = b"</rdf:RDF>"
+    if start == -1:
+        return packet.strip(b"\x00 \r\n\t")
+    end = packet.rfind(end_tag)
+    return packet[start:end + len(end_tag)] if end != -1 else packet[start:]
+
+
+def _jpeg_packets(directory) -> List[Tuple[str, bytes]]:
+    standard = directory.find_all("APP1", label=XMP_APP1_SIGNATURE)
+    extended = directory.find_all("APP1", label=XMP_EXTENSION_SIGNATURE)
+    payloads = directory.read_all(standard + extended)
+    packets: List[Tuple[str, bytes]] = []
+    for payload in payloads[:len(standard)]:
+        packets.append(("jpeg_app1", payload[len(XMP_APP1_SIGNATURE) + 1:]))
+
+    # Extended XMP: signature\0, 32-byte GUID, full length, offset, data
+    parts: Dict[bytes, Dict[str, Any]] = {}
+    header = len(XMP_EXTENSION_SIGNATURE) + 1
+    for payload in payloads[len(standard):]:
+        if len(payload) < header + 40:
+            continue
+        guid = payload[header:header + 32]
+        total = int.from_bytes(payload[header + 32:header + 36], "big")
+        offset = int.from_bytes(payload[header + 36:header + 40], "big")
+        entry = parts.setdefault(guid, {"total": total, "chunks": []})
+        entry["chunks"].append((offset, payload[header + 40:]))
+    # Only the extension named by xmpNote:HasExtendedXMP belongs to this file
+    named = [g for g in parts if any(g in p for _, p in packets)]
+    for guid, entry in parts.items():
+        if entry["total"] > MAX_PACKET_BYTES or (named and guid not in named):
+            continue
+        buffer = bytearray(entry["total"])
+        for offset, data in entry["chunks"]:
+            buffer[offset:offset + len(data)] = data[:max(0, entry["total"] - offset)]
+        packets.append(("jpeg_extended:" + guid.decode("ascii", "replace"), bytes(buffer)))
+    return packets
+
+
+def locate_xmp_packets(filepath: str, max_scan_bytes: int = MAX_SCAN_BYTES) -> List[Tuple[str, bytes]]:
+    """Every XMP packet in the file as (source, bytes)."""
+    directory = get_segment_directory(filepath)
+    if directory is not None:
+        if directory.container == "JPEG":
+            return _jpeg_packets(directory)
+        if directory.container == "PNG":
+            segments = [s for s in directory
+                        if s.kind in ("iTXt", "tEXt", "zTXt") and s.label == "XML:com.adobe.xmp"]
+            packets = []
+            for seg, payload in zip(segments, directory.read_all(segments)):
+                decoded = decode_png_text(seg.kind, payload)
+                if decoded:
+                    packets.append(("png_" + seg.kind, decoded[1].encode("utf-8")))
+            return packets
+        if directory.container == "RIFF":
+            segments = [s for s in directory if s.kind in ("XMP ", "_PMX")]
+            return [("riff_" + s.kind.strip(), p) for s, p in zip(segments, directory.read_all(segments))]
+        if directory.container == "TIFF":
+            segments = directory.find_all("TAG", label="XMP")
+            return [("tiff_700", p) for p in directory.read_all(segments)]
+    return _scan_for_packets(filepath, max_scan_bytes)
+
+
+def _scan_for_packets(filepath: str, max_scan_bytes: int) -> List[Tuple[str, bytes]]:
+    """Block scan for <x:xmpmeta>...</x:xmpmeta>; only the packets are kept in memory."""
+    open_tag, close_tag = b"<x:xmpmeta", b"</x:xmpmeta>"
+    packets: List[Tuple[str, bytes]] = []
+    try:
+        with open(filepath, "rb") as f:
+            carry = b""
+            current: Optional[bytearray] = None
+            start_offset = 0
+            consumed = 0
+            while consumed < max_scan_bytes:
+                block = f.read(SCAN_BLOCK)
+                if not block:
+                    break
+                base = consumed - len(carry)
+                data = carry + block
+                consumed += len(block)
+                pos = 0
+                while True:
+                    if current is None:
+                        idx = data.find(open_tag, pos)
+                        if idx == -1:
+                            break
+                        current = bytearray()
+                        start_offset = base + idx
+                        pos = idx
+                    end = data.find(close_tag, pos)
+                    if end == -1:
+                        current += data[pos:len(data) - len(close_tag)]
+                        pos = len(data) - len(close_tag)
+                        if len(current) > MAX_PACKET_BYTES:
+                            current = None
+                        break
+                    current += data[pos:end + len(close_tag)]
+                    packets.append((f"scan@{start_offset}", bytes(current)))
+                    current = None
+                    pos = end + len(close_tag)
+                tail = max(pos, len(data) - len(close_tag))
+                carry = data[tail:]
+    except OSError as e:
+        logger.debug(f"XMP scan failed for {filepath}: {e}")
+    return packets
+
+
+def build_xmp_table(filepath: str) -> XmpTable:
+    table = XmpTable()
+    for source, packet in locate_xmp_packets(filepath):
+        parse_xmp_packet(packet, table, source=source)
+    return table
+
+
+def _table_bytes(entry: Tuple[int, int, XmpTable]) -> int:
+    table = entry[2]
+    # Parsed properties are roughly proportional to the packet text
+    return 1024 + 3 * sum(len(text) for text in table.texts)
+
+
+_table_cache = BoundedCache("xmp_tables", max_entries=MAX_CACHED_TABLES,
+                            max_bytes=MAX_CACHED_TABLE_BYTES, sizeof=_table_bytes)
+
+
+def get_xmp_table(filepath: str) -> Optional[XmpTable]:
+    """Cached XMP table for a file (empty table when it has no XMP, None if unreadable)."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    key = os.path.realpath(filepath)
+    cached = _table_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return cached[2]
+
+    table = build_xmp_table(filepath)
+    _table_cache.put(key, (st.st_size, st.st_mtime_ns, table))
+    return table
+
+
+def clear_xmp_cache() -> None:
+    _table_cache.clear()
@@ -13,33 +13,145 @@ from datetime import datetime, timedelta
 import json
 import os
 
+try:
+    from .utils.bounded_cache import SampleBuffer, get_cache_metrics
+    from .utils.quantile_sketch import SketchFamily, merge_families, render_families
+except ImportError:
+    from utils.bounded_cache import SampleBuffer, get_cache_metrics  # type: ignore
+    from utils.quantile_sketch import SketchFamily, merge_families, render_families  # type: ignore
+
+# Distinct error types tracked before new ones are folded into "other"
+MAX_ERROR_TYPES = 200
+# Distinct tiers / file types / modules tracked before new ones are folded into "other"
+MAX_LABEL_VALUES = 200
+# Latency percentiles cover this many trailing seconds
+LATENCY_WINDOW_SECONDS = 600
+
+
+def _discount(counts: Dict[str, int], value: str) -> None:
+    counts[value] -= 1
+    if counts[value] <= 0:
+        del counts[value]
+
 
 class ExtractionMetrics:
-    """Track metrics for metadata extractions."""
+    """
+    Track metrics for metadata extractions.
+
+    get_statistics() summarises the last max_samples extractions. Its sums
+    and counts are kept in step as samples enter and leave the buffers, so
+    no call rescans them. Latency percentiles come from time-windowed
+    quantile sketches (overall, per tier, per file type, per module) that
+    can be exported, merged across workers and rendered for Prometheus;
+    the Prometheus counters are totals since start.
+    """
     
-    def __init__(self, max_samples: int = 1000):
+    def __init__(self, max_samples: int = 1000, window_seconds: float = LATENCY_WINDOW_SECONDS):
         self.max_samples = max_samples
-        self.extraction_times = deque(maxlen=max_samples)  # Processing times in ms
-        self.extraction_results = deque(maxlen=max_samples)  # Success/failure
-        self.extraction_tiers = deque(maxlen=max_samples)  # Tier usage
-        self.extraction_file_types = deque(maxlen=max_samples)  # File type tracking
+        self.extraction_times = SampleBuffer("extraction_times", max_samples,
+                                             on_evict=self._evict_time)  # Processing times in ms
+        self.extraction_results = SampleBuffer("extraction_results", max_samples,
+                                               on_evict=self._evict_result)  # Success/failure
+        self.extraction_tiers = SampleBuffer("extraction_tiers", max_samples,
+                                             on_evict=self._evict_tier)  # Tier usage
+        self.extraction_file_types = SampleBuffer("extraction_file_types", max_samples,
+                                                  on_evict=self._evict_file_type)  # File type tracking
         self.error_counts = defaultdict(int)  # Count different types of errors
         self.start_time = time.time()
+
+        # Totals since start, for the Prometheus counters
+        self.total_extractions = 0
+        self.successful_extractions = 0
+
+        # Sums over the buffered samples, adjusted as samples are evicted
+        self.window_time_ms = 0.0
+        self.window_successes = 0
+        self.window_tiers: Dict[str, int] = defaultdict(int)
+        self.window_file_types: Dict[str, int] = defaultdict(int)
+        # Monotonic (sequence, time) queues giving the buffered min and max
+        self._window_min: deque = deque()
+        self._window_max: deque = deque()
+
+        def family(name: str, help_text: str, label: Optional[str] = None) -> SketchFamily:
+            return SketchFamily(name, help_text, label, max_age=window_seconds,
+                                max_series=MAX_LABEL_VALUES, unit_scale=0.001)
+
+        self.latency = family("metaextract_extraction_duration_seconds",
+                              "Extraction wall time")
+        self.latency_by_tier = family("metaextract_extraction_duration_by_tier_seconds",
+                                      "Extraction wall time by tier", "tier")
+        self.latency_by_file_type = family("metaextract_extraction_duration_by_file_type_seconds",
+                                           "Extraction wall time by file type", "file_type")
+        self.module_latency = family("metaextract_module_duration_seconds",
+                                     "Per-module extraction time", "module")
         
+    def _evict_time(self, processing_time_ms: float) -> None:
+        self.window_time_ms -= processing_time_ms
+
+    def _evict_result(self, success: bool) -> None:
+        if success:
+            self.window_successes -= 1
+
+    def _evict_tier(self, tier: str) -> None:
+        _discount(self.window_tiers, tier)
+
+    def _evict_file_type(self, file_type: str) -> None:
+        _discount(self.window_file_types, file_type)
+
+    def _window_extreme(self, queue: deque) -> float:
+        first = self.extraction_times.appended - len(self.extraction_times)
+        while queue and queue[0][0] < first:
+            queue.popleft()
+        return queue[0][1] if queue else 0
+
+    @property
+    def sketch_families(self) -> List[SketchFamily]:
+        return [self.latency, self.latency_by_tier, self.latency_by_file_type, self.module_latency]
+
     def record_extraction(self, processing_time_ms: float, success: bool, 
-                         tier: str, file_type: str, error_type: Optional[str] = None):
+                         tier: str, file_type: str, error_type: Optional[str] = None,
+                         module_times_ms: Optional[Dict[str, float]] = None,
+                         now: Optional[float] = None):
         """Record a new extraction event."""
+        sequence = self.extraction_times.appended
         self.extraction_times.append(processing_time_ms)
         self.extraction_results.append(success)
         self.extraction_tiers.append(tier)
         self.extraction_file_types.append(file_type)
+
+        self.total_extractions += 1
+        if success:
+            self.successful_extractions += 1
+            self.window_successes += 1
+        self.window_time_ms += processing_time_ms
+        self.window_tiers[tier] += 1
+        self.window_file_types[file_type] += 1
+        while self._window_min and self._window_min[-1][1] >= processing_time_ms:
+            self._window_min.pop()
+        self._window_min.append((sequence, processing_time_ms))
+        while self._window_max and self._window_max[-1][1] <= processing_time_ms:
+            self._window_max.pop()
+        self._window_max.append((sequence, processing_time_ms))
+        self._window_extreme(self._window_min)
+        self._window_extreme(self._window_max)
+
+        if now is None:
+            now = time.time()
+        self.latency.observe(processing_time_ms, now=now)
+        self.latency_by_tier.observe(processing_time_ms, tier, now)
+        self.latency_by_file_type.observe(processing_time_ms, file_type, now)
+        if module_times_ms:
+            self.module_latency.observe_many(module_times_ms, now)
         
         if not success and error_type:
+            if error_type not in self.error_counts and len(self.error_counts) >= MAX_ERROR_TYPES:
+                error_type = "other"
             self.error_counts[error_type] += 1
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, now: Optional[float] = None) -> Dict[str, Any]:
         """Get current statistics."""
-        now = time.time()
+        if now is None:
+            now = time.time()
         total_runtime = now - self.start_time
         
         if not self.extraction_times:
@@ -50,43 +162,59 @@ class ExtractionMetrics:
                 "total_runtime_seconds": total_runtime
             }
         
+        # Everything below the runtime covers the buffered (last max_samples) extractions
         total_extractions = len(self.extraction_times)
-        successful_extractions = sum(1 for success in self.extraction_results if success)
-        success_rate = successful_extractions / total_extractions if total_extractions > 0 else 0
-        
-        avg_processing_time = sum(self.extraction_times) / len(self.extraction_times) if self.extraction_times else 0
+        successful_extractions = self.window_successes
+        success_rate = successful_extractions / total_extractions
         
         # Calculate extractions per minute
         extractions_per_minute = (total_extractions / total_runtime) * 60 if total_runtime > 0 else 0
-        
-        # Tier usage breakdown
-        tier_counts = defaultdict(int)
-        for tier in self.extraction_tiers:
-            tier_counts[tier] += 1
-            
-        # File type breakdown
-        file_type_counts = defaultdict(int)
-        for ftype in self.extraction_file_types:
-            file_type_counts[ftype] += 1
-        
-        # Recent error summary
-        recent_errors = dict(self.error_counts)
+
+        latency = self.latency.quantiles(now=now).get("", {})
         
         return {
             "total_extractions": total_extractions,
             "successful_extractions": successful_extractions,
             "failed_extractions": total_extractions - successful_extractions,
             "success_rate": success_rate,
-            "avg_processing_time_ms": avg_processing_time,
-            "min_processing_time_ms": min(self.extraction_times) if self.extraction_times else 0,
-            "max_processing_time_ms": max(self.extraction_times) if self.extraction_times else 0,
+            "avg_processing_time_ms": self.window_time_ms / total_extractions,
+            "min_processing_time_ms": self._window_extreme(self._window_min),
+            "max_processing_time_ms": self._window_extreme(self._window_max),
+            "p50_processing_time_ms": latency.get("p50"),
+            "p95_processing_time_ms": latency.get("p95"),
+            "p99_processing_time_ms": latency.get("p99"),
             "extractions_per_minute": extractions_per_minute,
             "total_runtime_seconds": total_runtime,
-            "tier_usage": dict(tier_counts),
-            "file_type_usage": dict(file_type_counts),
-            "recent_errors": recent_errors
+            "tier_usage": dict(self.window_tiers),
+            "file_type_usage": dict(self.window_file_types),
+            "latency_by_tier_ms": self.latency_by_tier.quantiles(now=now),
+            "latency_by_file_type_ms": self.latency_by_file_type.quantiles(now=now),
+            "latency_by_module_ms": self.module_latency.quantiles(now=now),
+            "recent_errors": dict(self.error_counts)
         }
 
+    def export_sketches(self) -> Dict[str, Dict[str, Any]]:
+        """Serializable snapshot of the latency sketches, for merging across workers."""
+        return {family.name: family.to_dict() for family in self.sketch_families}
+
+    def merge_sketches(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Fold another worker's export_sketches() snapshot into these sketches."""
+        for family in self.sketch_families:
+            if family.name in snapshot:
+                family.merge(SketchFamily.from_dict(snapshot[family.name]))
+
+    def render_prometheus(self, now: Optional[float] = None) -> str:
+        """Prometheus text exposition of the counters and latency summaries."""
+        lines = [
+            "# HELP metaextract_extractions_total Extractions recorded since start",
+            "# TYPE metaextract_extractions_total counter",
+            f"metaextract_extractions_total {self.total_extractions}",
+            "# HELP metaextract_extraction_failures_total Failed extractions since start",
+            "# TYPE metaextract_extraction_failures_total counter",
+            f"metaextract_extraction_failures_total {self.total_extractions - self.successful_extractions}",
+        ]
+        return "\n".join(lines) + "\n" + render_families(self.sketch_families, now=now)
+
 
 class SystemMonitor:
     """Main system monitoring class."""
@@ -99,10 +227,12 @@ class SystemMonitor:
         
     def record_extraction(self, processing_time_ms: float, success: bool, 
                          tier: str = "unknown", file_type: str = "unknown", 
-                         error_type: Optional[str] = None):
+                         error_type: Optional[str] = None,
+                         module_times_ms: Optional[Dict[str, float]] = None):
         """Record an extraction event for monitoring."""
         with self.lock:
-            self.metrics.record_extraction(processing_time_ms, success, tier, file_type, error_type)
+            self.metrics.record_extraction(processing_time_ms, success, tier, file_type, error_type,
+                                           module_times_ms)
             
             if not success:
                 self.last_error_time = time.time()
@@ -128,7 +258,8 @@ class SystemMonitor:
             return {
                 "health_status": self.health_status,
                 "timestamp": datetime.now().isoformat(),
-                "metrics": stats
+                "metrics": stats,
+                "caches": get_cache_metrics(include_buffers=False)
             }
     
     def get_performance_summary(self) -> Dict[str, Any]:
@@ -138,6 +269,9 @@ class SystemMonitor:
             return {
                 "success_rate": stats["success_rate"],
                 "avg_processing_time_ms": stats["avg_processing_time_ms"],
+                "p50_processing_time_ms": stats.get("p50_processing_time_ms"),
+                "p95_processing_time_ms": stats.get("p95_processing_time_ms"),
+                "p99_processing_time_ms": stats.get("p99_processing_time_ms"),
                 "extractions_per_minute": stats["extractions_per_minute"],
                 "tier_usage": stats["tier_usage"],
                 "file_type_usage": stats["file_type_usage"]
@@ -154,6 +288,21 @@ class SystemMonitor:
                 "last_error_time": self.last_error_time
             }
 
+    def export_sketches(self) -> Dict[str, Dict[str, Any]]:
+        """Latency sketch snapshot to ship to an aggregating process."""
+        with self.lock:
+            return self.metrics.export_sketches()
+
+    def merge_sketches(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """Merge another worker's latency sketches into this monitor."""
+        with self.lock:
+            self.metrics.merge_sketches(snapshot)
+
+    def get_prometheus_metrics(self) -> str:
+        """Prometheus text exposition of this process's extraction metrics."""
+        with self.lock:
+            return self.metrics.render_prometheus()
+
 
 # Global monitor instance
 _monitor = None
@@ -183,10 +332,11 @@ def get_monitor() -> SystemMonitor:
 
 def record_extraction_for_monitoring(processing_time_ms: float, success: bool, 
                                    tier: str = "unknown", file_type: str = "unknown", 
-                                   error_type: Optional[str] = None):
+                                   error_type: Optional[str] = None,
+                                   module_times_ms: Optional[Dict[str, float]] = None):
     """Convenience function to record extraction for monitoring."""
     monitor = get_monitor()
-    monitor.record_extraction(processing_time_ms, success, tier, file_type, error_type)
+    monitor.record_extraction(processing_time_ms, success, tier, file_type, error_type, module_times_ms)
 
 
 def get_monitoring_data() -> Dict[str, Any]:
@@ -207,6 +357,20 @@ def get_error_summary() -> Dict[str, Any]:
     return monitor.get_error_summary()
 
 
+def get_prometheus_metrics() -> str:
+    """Convenience function to get the Prometheus exposition."""
+    monitor = get_monitor()
+    return monitor.get_prometheus_metrics()
+
+
+def merge_metric_snapshots(snapshots: List[Dict[str, Dict[str, Any]]]) -> str:
+    """
+    Fleet-wide Prometheus exposition from several workers' export_sketches()
+    snapshots (percentiles are computed over the merged sketches, not averaged).
+    """
+    return render_families(merge_families(snapshots).values())
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Example of how to use the monitoring system
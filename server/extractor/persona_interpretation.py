@@ -5,12 +5,125 @@ Transforms raw technical metadata into plain English answers for different user
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Union
 import logging
 import requests
 
 logger = logging.getLogger(__name__)
 
+# Sections of the comprehensive engine result that are searched by bare
+# field name, in precedence order. Interpreters search a prefix of this.
+INDEXED_SECTIONS = ("exif", "gps", "iptc", "xmp", "forensic")
+DEFAULT_SECTIONS = INDEXED_SECTIONS[:4]
+FORENSIC_SECTIONS = INDEXED_SECTIONS
+
+# Canonical field name -> candidate keys, tried in order. Interpreters look
+# fields up by canonical name so that every persona shares one resolution
+# per extraction; new personas should add entries here rather than
+# hand-coding alias lists.
+FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "make": ("EXIF:Make", "Make"),
+    "model": ("EXIF:Model", "Model"),
+    "software": ("EXIF:Software", "Software"),
+    "lens_model": ("EXIF:LensModel", "LensModel"),
+    "datetime_original": ("EXIF:DateTimeOriginal", "DateTimeOriginal"),
+    "datetime_digitized": ("EXIF:DateTimeDigitized", "DateTimeDigitized"),
+    "gps_latitude": ("GPS:GPSLatitude", "GPSLatitude"),
+    "gps_longitude": ("GPS:GPSLongitude", "GPSLongitude"),
+    "gps_altitude": ("GPS:GPSAltitude", "GPSAltitude"),
+    "compression": ("EXIF:Compression", "Compression"),
+    "image_width": ("EXIF:ExifImageWidth", "ImageWidth"),
+    "image_height": ("EXIF:ExifImageHeight", "ImageHeight"),
+    "mime_type": ("mime_type", "MIMEType"),
+    "file_type": ("filetype", "FileType"),
+    "creator_tool": ("XMP:CreatorTool", "CreatorTool", "creator_tool"),
+    "md5": ("file_integrity:md5", "md5", "MD5"),
+    "sha1": ("file_integrity:sha1", "sha1", "SHA1"),
+    "sha256": ("file_integrity:sha256", "sha256", "SHA256"),
+}
+
+_MISSING = object()
+
+
+class MetadataFieldIndex:
+    """
+    Flattened alias -> value view of one extraction result.
+
+    Built in a single pass over the metadata and shared by the persona
+    interpreters of one call, replacing the per-call walks over nested
+    sections. It is a snapshot: an index is never reused across calls, so
+    later edits to the result are always seen.
+    Lookups follow the same precedence the interpreters always used, per
+    candidate name:
+
+    1. a top-level key ("Make", or a flat exiftool key such as "EXIF:Make")
+    2. "Category:Key" as metadata["Category"]["Key"]
+    3. the bare key (text after the last ":") in the searched sections
+    4. the full candidate name in the searched sections
+
+    Resolved alias lists are memoised, so repeated lookups across personas
+    cost one dict probe.
+    """
+
+    def __init__(self, metadata: Dict[str, Any]):
+        self.metadata = metadata
+        self._flat: Dict[str, Any] = {}
+        self._sectioned: Dict[str, List[Tuple[str, Any]]] = {}
+        self._resolved: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Any] = {}
+        self._build()
+
+    def _build(self) -> None:
+        flat = self._flat
+        for key, value in self.metadata.items():
+            flat[key] = value
+        for category, section in self.metadata.items():
+            if not isinstance(section, dict) or ":" in category:
+                continue
+            for key, value in section.items():
+                if ":" not in key:
+                    flat.setdefault(f"{category}:{key}", value)
+        for section_name in INDEXED_SECTIONS:
+            section = self.metadata.get(section_name)
+            if not isinstance(section, dict):
+                continue
+            for key, value in section.items():
+                self._sectioned.setdefault(key, []).append((section_name, value))
+
+    def _in_sections(self, key: str, sections: Tuple[str, ...]) -> Any:
+        for section_name, value in self._sectioned.get(key, ()):
+            if section_name in sections:
+                return value
+        return _MISSING
+
+    def lookup(self, field_names: Union[str, Sequence[str]],
+               sections: Sequence[str] = DEFAULT_SECTIONS) -> Optional[Any]:
+        """Return the first candidate found, or None.
+
+        ``field_names`` is either a canonical name from FIELD_ALIASES or an
+        explicit list of candidate keys.
+        """
+        if isinstance(field_names, str):
+            names = FIELD_ALIASES.get(field_names, (field_names,))
+        else:
+            names = tuple(field_names)
+        sections = tuple(sections)
+        memo_key = (names, sections)
+        if memo_key in self._resolved:
+            return self._resolved[memo_key]
+
+        value = None
+        for name in names:
+            found = self._flat.get(name, _MISSING)
+            if found is _MISSING and sections:
+                found = self._in_sections(name.split(":")[-1], sections)
+                if found is _MISSING:
+                    found = self._in_sections(name, sections)
+            if found is not _MISSING:
+                value = found
+                break
+        self._resolved[memo_key] = value
+        return value
+
 
 def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Any]:
     """
@@ -96,29 +209,23 @@ def reverse_geocode(latitude: float, longitude: float) -> Dict[str, Any]:
         }
 
 
-def enhance_device_detection(metadata: Dict[str, Any]) -> Dict[str, Any]:
+def enhance_device_detection(metadata: Dict[str, Any],
+                             field_index: Optional[MetadataFieldIndex] = None) -> Dict[str, Any]:
     """
     Enhanced device detection with comprehensive device identification and capabilities.
 
     Args:
         metadata: Raw metadata dictionary
+        field_index: Shared field index for ``metadata``; built if omitted
 
     Returns:
         Enhanced device information with type, capabilities, confidence scores
     """
-    def extract_field(field_names: List[str]) -> Optional[Any]:
-        """Helper to extract field from metadata"""
-        for field_name in field_names:
-            if field_name in metadata:
-                return metadata[field_name]
-            # Try nested access
-            parts = field_name.split(":")
-            if len(parts) == 2:
-                category, key = parts
-                if category in metadata and isinstance(metadata[category], dict):
-                    if key in metadata[category]:
-                        return metadata[category][key]
-        return None
+    index = field_index or MetadataFieldIndex(metadata)
+
+    def extract_field(field_names: Union[str, List[str]]) -> Optional[Any]:
+        """Helper to extract field from metadata (top-level and Category:Key only)"""
+        return index.lookup(field_names, sections=())
 
     device_info = {
         "type": "unknown",
@@ -126,9 +233,9 @@ def enhance_device_detection(metadata: Dict[str, Any]) -> Dict[str, Any]:
         "capabilities": [],
         "confidence": "low",
         "identification_method": "none",
-        "make": extract_field(["EXIF:Make", "Make"]) or "unknown",
-        "model": extract_field(["EXIF:Model", "Model"]) or "unknown",
-        "software": extract_field(["EXIF:Software", "Software"]) or "unknown",
+        "make": extract_field("make") or "unknown",
+        "model": extract_field("model") or "unknown",
+        "software": extract_field("software") or "unknown",
         "is_smartphone": False,
         "is_dslr": False,
         "is_mirrorless": False,
@@ -255,8 +362,8 @@ def enhance_device_detection(metadata: Dict[str, Any]) -> Dict[str, Any]:
         ]
 
     # Analyze image quality for device verification
-    image_width = extract_field(["EXIF:ExifImageWidth", "ImageWidth"])
-    image_height = extract_field(["EXIF:ExifImageHeight", "ImageHeight"])
+    image_width = extract_field("image_width")
+    image_height = extract_field("image_height")
 
     if image_width and image_height:
         width = int(image_width)
@@ -306,8 +413,9 @@ def enhance_device_detection(metadata: Dict[str, Any]) -> Dict[str, Any]:
 class PersonaInterpreter:
     """Transform raw metadata into persona-friendly interpretations"""
 
-    def __init__(self, metadata: Dict[str, Any]):
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
         self.metadata = metadata
+        self.field_index = field_index or MetadataFieldIndex(metadata)
         self.interpretation = {
             "key_findings": [],
             "plain_english_answers": {},
@@ -447,7 +555,7 @@ class PersonaInterpreter:
     def _answer_what_device(self) -> None:
         """Answer: "What phone took this?" """
         # Use enhanced device detection
-        enhanced_device = enhance_device_detection(self.metadata)
+        enhanced_device = enhance_device_detection(self.metadata, self.field_index)
 
         # Build friendly device name from enhanced info
         make = enhanced_device["make"]
@@ -490,7 +598,7 @@ class PersonaInterpreter:
         }
 
         # Add lens info if available
-        lens = self._extract_field(["EXIF:LensModel", "LensModel"])
+        lens = self._extract_field("lens_model")
         if lens:
             self.interpretation["plain_english_answers"]["device"]["lens"] = lens
 
@@ -498,7 +606,7 @@ class PersonaInterpreter:
         """Answer: "Is this photo authentic?" """
         authenticity_checks = {
             "has_original_datetime": bool(self._get_best_exif_date()),
-            "has_software_signatures": bool(self._extract_field(["EXIF:Software", "Software"])),
+            "has_software_signatures": bool(self._extract_field("software")),
             "has_gps": bool(self._get_gps_coordinates()),
             "exif_intact": self._is_exif_intact(),
             "thumbnails_match": self._check_thumbnails(),
@@ -514,7 +622,7 @@ class PersonaInterpreter:
             reasons.append("Missing original date/time")
 
         if authenticity_checks["has_software_signatures"]:
-            software = self._extract_field(["EXIF:Software", "Software"])
+            software = self._extract_field("software")
             if software and software.lower() not in ["", "none", "original"]:
                 score -= 20
                 reasons.append(f"Editing software detected: {software}")
@@ -683,38 +791,9 @@ class PersonaInterpreter:
 
         return any(keyword in combined for keyword in phone_keywords)
 
-    def _extract_field(self, field_names: List[str]) -> Optional[Any]:
-        """Extract field value trying multiple possible field names"""
-        for field_name in field_names:
-            # Try direct access (flat structure from exiftool)
-            if field_name in self.metadata:
-                return self.metadata[field_name]
-
-            # Try nested access (e.g., "EXIF:DateTimeOriginal")
-            parts = field_name.split(":")
-            if len(parts) == 2:
-                category, key = parts
-                if category in self.metadata and isinstance(self.metadata[category], dict):
-                    if key in self.metadata[category]:
-                        return self.metadata[category][key]
-
-            # Try comprehensive engine structure (e.g., "exif.DateTimeOriginal")
-            # Remove the category prefix if present
-            base_field = field_name.split(":")[-1]  # Get last part after ":"
-
-            # Check in common nested structures
-            for section in ["exif", "gps", "iptc", "xmp"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if base_field in self.metadata[section]:
-                        return self.metadata[section][base_field]
-
-            # Try the field name directly in common sections
-            for section in ["exif", "gps", "iptc", "xmp"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if field_name in self.metadata[section]:
-                        return self.metadata[section][field_name]
-
-        return None
+    def _extract_field(self, field_names: Union[str, List[str]]) -> Optional[Any]:
+        """Extract field value by canonical name or list of candidate field names"""
+        return self.field_index.lookup(field_names, DEFAULT_SECTIONS)
 
     def _is_exif_intact(self) -> bool:
         """Check if EXIF data appears intact"""
@@ -738,7 +817,7 @@ class PersonaInterpreter:
         suspicious = []
 
         # Check for unusual software
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
         if software:
             suspicious_software = ["photoshop", "gimp", "lightroom", "snapseed", "vsco"]
             if any(s in str(software).lower() for s in suspicious_software):
@@ -829,8 +908,9 @@ class PhotographerPeterInterpreter:
     shooting conditions, and professional-grade analysis.
     """
 
-    def __init__(self, metadata: Dict[str, Any]):
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
         self.metadata = metadata
+        self.field_index = field_index or MetadataFieldIndex(metadata)
         self.interpretation = {
             "persona": "photographer_peter",
             "key_findings": [],
@@ -852,37 +932,9 @@ class PhotographerPeterInterpreter:
         self._provide_professional_recommendations()
         return self.interpretation
 
-    def _extract_field(self, field_names: List[str]) -> Optional[Any]:
-        """Extract field value trying multiple possible field names"""
-        for field_name in field_names:
-            # Try direct access (flat structure from exiftool)
-            if field_name in self.metadata:
-                return self.metadata[field_name]
-
-            # Try nested access (e.g., "EXIF:DateTimeOriginal")
-            parts = field_name.split(":")
-            if len(parts) == 2:
-                category, key = parts
-                if category in self.metadata and isinstance(self.metadata[category], dict):
-                    if key in self.metadata[category]:
-                        return self.metadata[category][key]
-
-            # Try comprehensive engine structure (e.g., "exif.DateTimeOriginal")
-            base_field = field_name.split(":")[-1]  # Get last part after ":"
-
-            # Check in common nested structures
-            for section in ["exif", "gps", "iptc", "xmp"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if base_field in self.metadata[section]:
-                        return self.metadata[section][base_field]
-
-            # Try the field name directly in common sections
-            for section in ["exif", "gps", "iptc", "xmp"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if field_name in self.metadata[section]:
-                        return self.metadata[section][field_name]
-
-        return None
+    def _extract_field(self, field_names: Union[str, List[str]]) -> Optional[Any]:
+        """Extract field value by canonical name or list of candidate field names"""
+        return self.field_index.lookup(field_names, DEFAULT_SECTIONS)
 
     def _analyze_camera_settings(self) -> None:
         """Extract and analyze camera settings"""
@@ -950,7 +1002,7 @@ class PhotographerPeterInterpreter:
 
         # Basic lens data
         lens_make = self._extract_field(["EXIF:LensMake", "LensMake"])
-        lens_model = self._extract_field(["EXIF:LensModel", "LensModel"])
+        lens_model = self._extract_field("lens_model")
         lens_spec = self._extract_field(["EXIF:LensInfo", "LensInfo"])
         focal_length = self._extract_field(["EXIF:FocalLength", "FocalLength"])
         focal_length_35mm = self._extract_field(["EXIF:FocalLengthIn35mmFormat", "FocalLengthIn35mmFormat"])
@@ -991,9 +1043,9 @@ class PhotographerPeterInterpreter:
         conditions = {}
 
         # GPS and location
-        gps_lat = self._extract_field(["GPS:GPSLatitude", "GPSLatitude"])
-        gps_lon = self._extract_field(["GPS:GPSLongitude", "GPSLongitude"])
-        gps_alt = self._extract_field(["GPS:GPSAltitude", "GPSAltitude"])
+        gps_lat = self._extract_field("gps_latitude")
+        gps_lon = self._extract_field("gps_longitude")
+        gps_alt = self._extract_field("gps_altitude")
         gps_direction = self._extract_field(["GPS:GPSImgDirection", "GPSImgDirection"])
 
         # Time and date
@@ -1033,7 +1085,7 @@ class PhotographerPeterInterpreter:
         pixel_y_dim = self._extract_field(["EXIF:PixelYDimension", "PixelYDimension"])
 
         # Compression and quality
-        compression = self._extract_field(["EXIF:Compression", "Compression"])
+        compression = self._extract_field("compression")
         quality_setting = self._extract_field(["EXIF:Quality", "Quality"])
 
         # Color depth
@@ -1309,8 +1361,9 @@ class InvestigatorMikeInterpreter:
     manipulation detection, and chain of custody information.
     """
 
-    def __init__(self, metadata: Dict[str, Any]):
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
         self.metadata = metadata
+        self.field_index = field_index or MetadataFieldIndex(metadata)
         self.interpretation = {
             "persona": "investigator_mike",
             "key_findings": [],
@@ -1333,51 +1386,23 @@ class InvestigatorMikeInterpreter:
         self._provide_investigative_recommendations()
         return self.interpretation
 
-    def _extract_field(self, field_names: List[str]) -> Optional[Any]:
-        """Extract field value trying multiple possible field names"""
-        for field_name in field_names:
-            # Try direct access (flat structure from exiftool)
-            if field_name in self.metadata:
-                return self.metadata[field_name]
-
-            # Try nested access (e.g., "EXIF:DateTimeOriginal")
-            parts = field_name.split(":")
-            if len(parts) == 2:
-                category, key = parts
-                if category in self.metadata and isinstance(self.metadata[category], dict):
-                    if key in self.metadata[category]:
-                        return self.metadata[category][key]
-
-            # Try comprehensive engine structure (e.g., "exif.DateTimeOriginal")
-            base_field = field_name.split(":")[-1]  # Get last part after ":"
-
-            # Check in common nested structures
-            for section in ["exif", "gps", "iptc", "xmp", "forensic"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if base_field in self.metadata[section]:
-                        return self.metadata[section][base_field]
-
-            # Try the field name directly in common sections
-            for section in ["exif", "gps", "iptc", "xmp", "forensic"]:
-                if section in self.metadata and isinstance(self.metadata[section], dict):
-                    if field_name in self.metadata[section]:
-                        return self.metadata[section][field_name]
-
-        return None
+    def _extract_field(self, field_names: Union[str, List[str]]) -> Optional[Any]:
+        """Extract field value by canonical name or list of candidate field names"""
+        return self.field_index.lookup(field_names, FORENSIC_SECTIONS)
 
     def _analyze_forensic_metadata(self) -> None:
         """Analyze forensic metadata"""
         forensic = {}
 
         # File hashes
-        md5 = self._extract_field(["file_integrity:md5", "md5", "MD5"])
-        sha1 = self._extract_field(["file_integrity:sha1", "sha1", "SHA1"])
-        sha256 = self._extract_field(["file_integrity:sha256", "sha256", "SHA256"])
+        md5 = self._extract_field("md5")
+        sha1 = self._extract_field("sha1")
+        sha256 = self._extract_field("sha256")
 
         # File metadata
         file_size = self._extract_field(["filesize", "FileSize"])
-        file_type = self._extract_field(["filetype", "FileType"])
-        mime_type = self._extract_field(["mime_type", "MIMEType"])
+        file_type = self._extract_field("file_type")
+        mime_type = self._extract_field("mime_type")
 
         # Creation and modification timestamps
         file_created = self._extract_field(["filesystem:created", "FileCreated"])
@@ -1385,7 +1410,7 @@ class InvestigatorMikeInterpreter:
         file_accessed = self._extract_field(["filesystem:accessed", "FileAccessed"])
 
         # Software and tools
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
         creator_tool = self._extract_field("creator_tool")
 
         forensic["file_hashes"] = {
@@ -1434,7 +1459,7 @@ class InvestigatorMikeInterpreter:
         thumbnails_match = self._check_thumbnail_integrity()
 
         # GPS authenticity
-        has_gps = self._extract_field(["GPS:GPSLatitude", "GPSLatitude"]) is not None
+        has_gps = self._extract_field("gps_latitude") is not None
         gps_consistent = self._verify_gps_consistency()
 
         # Date consistency
@@ -1473,7 +1498,7 @@ class InvestigatorMikeInterpreter:
         manipulation = {}
 
         # Check for editing software signatures
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
         edit_indicators = self._detect_editing_software(software)
 
         # Check for missing metadata
@@ -1528,20 +1553,20 @@ class InvestigatorMikeInterpreter:
         custody = {}
 
         # Origin information
-        device_make = self._extract_field(["EXIF:Make", "Make"])
-        device_model = self._extract_field(["EXIF:Model", "Model"])
+        device_make = self._extract_field("make")
+        device_model = self._extract_field("model")
         serial_number = self._extract_field(["EXIF:SerialNumber", "SerialNumber"])
         internal_serial = self._extract_field(["EXIF:InternalSerialNumber", "InternalSerialNumber"])
 
         # Software processing
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
 
         # Location history
-        gps_data = self._extract_field(["GPS:GPSLatitude", "GPSLatitude"]) is not None
+        gps_data = self._extract_field("gps_latitude") is not None
 
         # Time information
-        date_original = self._extract_field(["EXIF:DateTimeOriginal", "DateTimeOriginal"])
-        date_digitized = self._extract_field(["EXIF:DateTimeDigitized", "DateTimeDigitized"])
+        date_original = self._extract_field("datetime_original")
+        date_digitized = self._extract_field("datetime_digitized")
         date_modified = self._extract_field(["EXIF:DateTime", "DateTime", "file_modified"])
 
         custody["device_origin"] = {
@@ -1772,8 +1797,8 @@ class InvestigatorMikeInterpreter:
 
     def _verify_gps_consistency(self) -> bool:
         # Check if GPS data is internally consistent
-        lat = self._extract_field(["GPS:GPSLatitude", "GPSLatitude"])
-        lon = self._extract_field(["GPS:GPSLongitude", "GPSLongitude"])
+        lat = self._extract_field("gps_latitude")
+        lon = self._extract_field("gps_longitude")
 
         if not lat or not lon:
             return True  # No GPS to check
@@ -1783,8 +1808,8 @@ class InvestigatorMikeInterpreter:
 
     def _verify_date_consistency(self) -> bool:
         # Check if date fields are consistent
-        date_original = self._extract_field(["EXIF:DateTimeOriginal", "DateTimeOriginal"])
-        date_digitized = self._extract_field(["EXIF:DateTimeDigitized", "DateTimeDigitized"])
+        date_original = self._extract_field("datetime_original")
+        date_digitized = self._extract_field("datetime_digitized")
         date_modified = self._extract_field(["EXIF:DateTime", "DateTime"])
 
         # Simple check - all dates should be present and reasonable
@@ -1890,7 +1915,7 @@ class InvestigatorMikeInterpreter:
         anomalies = []
 
         # Check for suspicious patterns
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
         if not software:
             anomalies.append("missing_software_metadata")
 
@@ -1903,7 +1928,7 @@ class InvestigatorMikeInterpreter:
         issues = []
 
         # Check for compression artifacts
-        compression = self._extract_field(["EXIF:Compression", "Compression"])
+        compression = self._extract_field("compression")
         if compression and compression > 6:  # High compression
             issues.append("high_compression")
 
@@ -1916,7 +1941,7 @@ class InvestigatorMikeInterpreter:
 
     def _detect_resaving(self) -> bool:
         # Check for signs of resaving
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
         # Multiple software mentions might indicate resaving
         return False
 
@@ -1969,7 +1994,7 @@ class InvestigatorMikeInterpreter:
 
     def _estimate_file_generation(self) -> int:
         # Estimate which generation this file is (1 = original)
-        software = self._extract_field(["EXIF:Software", "Software"])
+        software = self._extract_field("software")
 
         if not software:
             return 1  # Likely original
@@ -1991,9 +2016,9 @@ class InvestigatorMikeInterpreter:
 
     def _verify_location_data(self) -> bool:
         # Verify GPS data consistency
-        lat = self._extract_field(["GPS:GPSLatitude", "GPSLatitude"])
-        lon = self._extract_field(["GPS:GPSLongitude", "GPSLongitude"])
-        alt = self._extract_field(["GPS:GPSAltitude", "GPSAltitude"])
+        lat = self._extract_field("gps_latitude")
+        lon = self._extract_field("gps_longitude")
+        alt = self._extract_field("gps_altitude")
 
         # Basic check - coordinates should be present together
         if lat and lon:
@@ -2093,8 +2118,8 @@ class InvestigatorMikeInterpreter:
     def _analyze_file_format(self) -> dict:
         format_analysis = {}
 
-        file_type = self._extract_field(["filetype", "FileType"])
-        mime_type = self._extract_field(["mime_type", "MIMEType"])
+        file_type = self._extract_field("file_type")
+        mime_type = self._extract_field("mime_type")
 
         format_analysis["format"] = file_type if file_type else "unknown"
         format_analysis["compliance"] = "standard"
@@ -2144,8 +2169,8 @@ class InvestigatorMikeInterpreter:
 class SecurityAnalystSamInterpreter(PersonaInterpreter):
     """Security-focused interpreter for cybersecurity professionals"""
 
-    def __init__(self, metadata: Dict[str, Any]):
-        super().__init__(metadata)
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
+        super().__init__(metadata, field_index)
         self.persona_name = "security_analyst_sam"
         self.persona_icon = "🔒"
 
@@ -2396,8 +2421,8 @@ class SecurityAnalystSamInterpreter(PersonaInterpreter):
 class SocialMediaManagerSophiaInterpreter(PersonaInterpreter):
     """Social media optimization interpreter for content creators"""
 
-    def __init__(self, metadata: Dict[str, Any]):
-        super().__init__(metadata)
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
+        super().__init__(metadata, field_index)
         self.persona_name = "social_media_manager_sophia"
         self.persona_icon = "📱"
 
@@ -2698,8 +2723,8 @@ class SocialMediaManagerSophiaInterpreter(PersonaInterpreter):
 class GenealogyResearcherGraceInterpreter(PersonaInterpreter):
     """Genealogy-focused interpreter for family historians"""
 
-    def __init__(self, metadata: Dict[str, Any]):
-        super().__init__(metadata)
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
+        super().__init__(metadata, field_index)
         self.persona_name = "genealogy_researcher_grace"
         self.persona_icon = "👨‍👩‍👧‍👦"
 
@@ -2898,8 +2923,8 @@ class GenealogyResearcherGraceInterpreter(PersonaInterpreter):
 class LegalInvestigatorLiamInterpreter(PersonaInterpreter):
     """Legal-focused interpreter for legal professionals"""
 
-    def __init__(self, metadata: Dict[str, Any]):
-        super().__init__(metadata)
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
+        super().__init__(metadata, field_index)
         self.persona_name = "legal_investigator_liam"
         self.persona_icon = "⚖️"
 
@@ -3107,8 +3132,8 @@ class LegalInvestigatorLiamInterpreter(PersonaInterpreter):
 class InsuranceAdjusterIvyInterpreter(PersonaInterpreter):
     """Insurance-focused interpreter for claims processing"""
 
-    def __init__(self, metadata: Dict[str, Any]):
-        super().__init__(metadata)
+    def __init__(self, metadata: Dict[str, Any], field_index: Optional[MetadataFieldIndex] = None):
+        super().__init__(metadata, field_index)
         self.persona_name = "insurance_adjuster_ivy"
         self.persona_icon = "💼"
 
@@ -3278,45 +3303,57 @@ class InsuranceAdjusterIvyInterpreter(PersonaInterpreter):
         return damage
 
 
+# Persona name -> (interpreter class, interpretation method)
+PERSONA_INTERPRETERS = {
+    "phone_photo_sarah": (PersonaInterpreter, "interpret_for_sarah"),
+    "photographer_peter": (PhotographerPeterInterpreter, "interpret"),
+    "investigator_mike": (InvestigatorMikeInterpreter, "interpret"),
+    "security_analyst_sam": (SecurityAnalystSamInterpreter, "interpret"),
+    "social_media_manager_sophia": (SocialMediaManagerSophiaInterpreter, "interpret"),
+    "genealogy_researcher_grace": (GenealogyResearcherGraceInterpreter, "interpret"),
+    "legal_investigator_liam": (LegalInvestigatorLiamInterpreter, "interpret"),
+    "insurance_adjuster_ivy": (InsuranceAdjusterIvyInterpreter, "interpret"),
+}
+
+
+def _interpret(metadata: Dict[str, Any], persona: str, field_index: MetadataFieldIndex) -> Dict[str, Any]:
+    if persona not in PERSONA_INTERPRETERS:
+        return {}
+    interpreter_class, method = PERSONA_INTERPRETERS[persona]
+    interpreter = interpreter_class(metadata, field_index)
+    return getattr(interpreter, method)()
+
+
 def add_persona_interpretation(metadata: Dict[str, Any], persona: str = "phone_photo_sarah") -> Dict[str, Any]:
     """
     Add persona-friendly interpretation to raw metadata
 
     Args:
         metadata: Raw extracted metadata
-        persona: Target persona ("phone_photo_sarah", "photographer_peter", "investigator_mike")
+        persona: Target persona (any key of PERSONA_INTERPRETERS)
 
     Returns:
         Enhanced metadata with persona interpretation layer
     """
-    result = {
+    return {
         "raw_metadata": metadata,  # Preserve all original data
-        "persona_interpretation": {}
+        "persona_interpretation": _interpret(metadata, persona, MetadataFieldIndex(metadata))
     }
 
-    if persona == "phone_photo_sarah":
-        interpreter = PersonaInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret_for_sarah()
-    elif persona == "photographer_peter":
-        interpreter = PhotographerPeterInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "investigator_mike":
-        interpreter = InvestigatorMikeInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "security_analyst_sam":
-        interpreter = SecurityAnalystSamInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "social_media_manager_sophia":
-        interpreter = SocialMediaManagerSophiaInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "genealogy_researcher_grace":
-        interpreter = GenealogyResearcherGraceInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "legal_investigator_liam":
-        interpreter = LegalInvestigatorLiamInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-    elif persona == "insurance_adjuster_ivy":
-        interpreter = InsuranceAdjusterIvyInterpreter(metadata)
-        result["persona_interpretation"] = interpreter.interpret()
-
-    return result
+
+def add_persona_interpretations(metadata: Dict[str, Any], personas: List[str]) -> Dict[str, Any]:
+    """
+    Interpret one extraction result for several personas at once.
+
+    The metadata is indexed once and the index shared by every interpreter.
+
+    Returns:
+        {"raw_metadata": ..., "persona_interpretations": {persona: interpretation}}
+    """
+    field_index = MetadataFieldIndex(metadata)
+    return {
+        "raw_metadata": metadata,
+        "persona_interpretations": {
+            persona: _interpret(metadata, persona, field_index) for persona in personas
+        }
+    }
@@ -3,18 +3,44 @@ MetaExtract API Rate Limiting System
 
 This module provides sophisticated rate limiting based on monitoring data
 to prevent abuse and ensure system stability.
+
+Each client key keeps one sliding-window counter per window (burst, minute,
+hour, day): the count of the current aligned bucket plus the previous one,
+weighted by how much of the previous bucket still overlaps the window. That is
+constant memory per client however busy it is, and every check is O(1).
+Local state sits behind striped locks and idle clients are evicted once all
+their windows have expired. RedisRateLimitBackend runs the same algorithm in a
+Lua script so several API processes enforce one shared limit.
 """
 
+import logging
+import os
 import time
 import threading
-from typing import Dict, Optional, Tuple
-from collections import defaultdict, deque
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+from collections import defaultdict
 from datetime import datetime, timedelta
 import hashlib
 import json
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# (name, seconds) for every window, in the order counts are passed around
+WINDOWS: Tuple[Tuple[str, int], ...] = (("minute", 60), ("hour", 3600), ("day", 86400), ("burst", 1))
+
+# A client whose last request is this old has nothing left in any window
+DEFAULT_IDLE_TTL = 2 * max(seconds for _, seconds in WINDOWS)
+
 
 class RateLimitTier(Enum):
     """Rate limit tiers."""
@@ -32,25 +58,228 @@ class RateLimitConfig:
     requests_per_day: int
     burst_limit: int  # Max requests in a short burst
 
+    def limits(self) -> Tuple[int, int, int, int]:
+        """Limits in WINDOWS order."""
+        return (self.requests_per_minute, self.requests_per_hour, self.requests_per_day, self.burst_limit)
 
-@dataclass
+
+class SlidingWindowCounter:
+    """
+    Approximate count of events in the trailing window.
+
+    Buckets are aligned to multiples of the window length; the estimate is the
+    current bucket plus the previous bucket scaled by its remaining overlap.
+    """
+
+    __slots__ = ("window", "start", "current", "previous")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.start = 0.0
+        self.current = 0
+        self.previous = 0
+
+    def _roll(self, now: float) -> None:
+        start = now - now % self.window
+        if start > self.start:
+            self.previous = self.current if start - self.start == self.window else 0
+            self.current = 0
+            self.start = start
+
+    def count(self, now: float) -> int:
+        self._roll(now)
+        if not self.previous:
+            return self.current
+        weight = 1.0 - (now - self.start) / self.window
+        return self.current + int(self.previous * max(0.0, weight))
+
+    def add(self, now: float) -> None:
+        self._roll(now)
+        self.current += 1
+
+
+@dataclass(slots=True)
 class RateLimitState:
     """Current state of rate limiting for a client."""
-    minute_requests: deque
-    hour_requests: deque
-    day_requests: deque
-    burst_requests: deque
-    last_reset: float
-    tier: RateLimitTier
+    minute: SlidingWindowCounter
+    hour: SlidingWindowCounter
+    day: SlidingWindowCounter
+    burst: SlidingWindowCounter
+    last_seen: float
+
+    @classmethod
+    def new(cls, now: float) -> "RateLimitState":
+        return cls(*(SlidingWindowCounter(seconds) for _, seconds in WINDOWS), last_seen=now)
+
+    @property
+    def counters(self) -> Tuple[SlidingWindowCounter, ...]:
+        return (self.minute, self.hour, self.day, self.burst)
+
+
+class RateLimitBackend(ABC):
+    """Where per-client window counts live."""
+
+    @abstractmethod
+    def acquire(self, key: str, limits: Sequence[int], now: float) -> Tuple[bool, List[int]]:
+        """
+        Count a request against key if every window is under its limit.
+
+        Returns whether it was allowed and the per-window counts (WINDOWS
+        order) seen before it was added.
+        """
+
+    @abstractmethod
+    def peek(self, key: str, now: float) -> List[int]:
+        """Per-window counts for key without recording a request."""
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """In-process counters behind striped locks, with idle-client eviction."""
+
+    def __init__(self, lock_stripes: int = 64, idle_ttl: float = DEFAULT_IDLE_TTL,
+                 sweep_interval: float = 60.0):
+        stripes = 1
+        while stripes < lock_stripes:
+            stripes <<= 1
+        self.clients: Dict[str, RateLimitState] = {}
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._mask = stripes - 1
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) & self._mask]
+
+    def acquire(self, key: str, limits: Sequence[int], now: float) -> Tuple[bool, List[int]]:
+        with self._lock_for(key):
+            state = self.clients.get(key)
+            if state is None:
+                state = self.clients[key] = RateLimitState.new(now)
+            counters = state.counters
+            counts = [counter.count(now) for counter in counters]
+            allowed = all(count < limit for count, limit in zip(counts, limits))
+            if allowed:
+                # count() has already rolled every counter to now
+                for counter in counters:
+                    counter.current += 1
+            if now > state.last_seen:
+                state.last_seen = now
+        if now - self._last_sweep >= self.sweep_interval:
+            self.evict_idle(now)
+        return allowed, counts
+
+    def peek(self, key: str, now: float) -> List[int]:
+        with self._lock_for(key):
+            state = self.clients.get(key)
+            if state is None:
+                return [0] * len(WINDOWS)
+            return [counter.count(now) for counter in state.counters]
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Drop clients idle for longer than idle_ttl; returns how many were dropped."""
+        if now is None:
+            now = time.time()
+        if not self._sweep_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_sweep = now
+            cutoff = now - self.idle_ttl
+            evicted = 0
+            for key, state in list(self.clients.items()):
+                if state.last_seen >= cutoff:
+                    continue
+                with self._lock_for(key):
+                    if self.clients.get(key) is state and state.last_seen < cutoff:
+                        del self.clients[key]
+                        evicted += 1
+            return evicted
+        finally:
+            self._sweep_lock.release()
+
+
+# KEYS[1]: client key prefix. ARGV: now, consume (0/1), then window/limit pairs.
+# Bucket keys share KEYS[1] as a hash tag, so they land on one cluster slot.
+_REDIS_ACQUIRE = """
+local now = tonumber(ARGV[1])
+local consume = ARGV[2] == '1'
+local allowed = 1
+local result = {}
+local keys = {}
+for i = 3, #ARGV, 2 do
+    local window = tonumber(ARGV[i])
+    local limit = tonumber(ARGV[i + 1])
+    local bucket = math.floor(now / window)
+    local key = KEYS[1] .. ':' .. window .. ':' .. string.format('%d', bucket)
+    local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. window .. ':' .. string.format('%d', bucket - 1)) or '0')
+    local current = tonumber(redis.call('GET', key) or '0')
+    local count = current + math.floor(previous * (1 - (now - bucket * window) / window))
+    result[#result + 1] = count
+    keys[#keys + 1] = {key, window}
+    if count >= limit then
+        allowed = 0
+    end
+end
+if consume and allowed == 1 then
+    for _, entry in ipairs(keys) do
+        redis.call('INCR', entry[1])
+        redis.call('EXPIRE', entry[1], entry[2] * 2 + 1)
+    end
+end
+table.insert(result, 1, allowed)
+return result
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Sliding-window counters in Redis, shared by every process using the same
+    URL and prefix. Each check is one atomic script call; bucket keys expire
+    on their own, so idle clients cost nothing. If Redis is unreachable the
+    limiter falls back to per-process counters instead of failing requests.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "metaextract:rl",
+                 fallback: Optional[RateLimitBackend] = None):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package is required for RedisRateLimitBackend")
+        self.url = url
+        self.prefix = prefix
+        self.fallback = fallback or LocalRateLimitBackend()
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_ACQUIRE)
+
+    def _run(self, key: str, limits: Sequence[int], now: float, consume: bool) -> List[int]:
+        args: List[object] = [repr(now), "1" if consume else "0"]
+        for (_, seconds), limit in zip(WINDOWS, limits):
+            args.extend([seconds, limit])
+        return [int(value) for value in self._script(keys=[f"{self.prefix}:{{{key}}}"], args=args)]
+
+    def acquire(self, key: str, limits: Sequence[int], now: float) -> Tuple[bool, List[int]]:
+        try:
+            allowed, *counts = self._run(key, limits, now, consume=True)
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limiting unavailable, using local counters: {e}")
+            return self.fallback.acquire(key, limits, now)
+        return bool(allowed), counts
+
+    def peek(self, key: str, now: float) -> List[int]:
+        try:
+            # Limits only decide "allowed", which is ignored when not consuming
+            _allowed, *counts = self._run(key, [0] * len(WINDOWS), now, consume=False)
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limiting unavailable, using local counters: {e}")
+            return self.fallback.peek(key, now)
+        return counts
 
 
 class AdaptiveRateLimiter:
     """Adaptive rate limiter that adjusts limits based on system monitoring data."""
     
-    def __init__(self):
-        self.clients: Dict[str, RateLimitState] = {}
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        self.backend = backend or LocalRateLimitBackend()
         self.configs: Dict[RateLimitTier, RateLimitConfig] = self._get_default_configs()
-        self.lock = threading.RLock()
         
         # System health metrics that affect rate limiting
         self.system_health = {
@@ -69,6 +298,14 @@ class AdaptiveRateLimiter:
             'cpu_usage': 0.02,  # Higher CPU usage = lower limits
             'memory_usage': 0.01  # Higher memory usage = lower limits
         }
+        
+        # Health-adjusted configs, recomputed when health changes rather than per request
+        self._adjusted: Dict[RateLimitTier, RateLimitConfig] = {}
+    
+    @property
+    def clients(self) -> Dict[str, RateLimitState]:
+        """Per-client state of the local backend (empty for shared backends)."""
+        return getattr(self.backend, "clients", {})
     
     def _get_default_configs(self) -> Dict[RateLimitTier, RateLimitConfig]:
         """Get default rate limit configurations."""
@@ -105,6 +342,9 @@ class AdaptiveRateLimiter:
     
     def _get_adjusted_config(self, tier: RateLimitTier) -> RateLimitConfig:
         """Get rate limit config adjusted based on system health."""
+        config = self._adjusted.get(tier)
+        if config is not None:
+            return config
         base_config = self.configs[tier]
         
         # Calculate health-based multiplier (0.5 to 1.5, where 1.0 is normal)
@@ -114,22 +354,19 @@ class AdaptiveRateLimiter:
             health_factor -= (self.system_health['avg_response_time'] / 1000) * self.health_multipliers['response_time']  # Convert ms to s
             health_factor -= self.system_health['cpu_usage'] * self.health_multipliers['cpu_usage']
             health_factor -= self.system_health['memory_usage'] * self.health_multipliers['memory_usage']
-        
-        # Ensure health factor is between 0.5 and 1.5
-        health_factor = max(0.5, min(1.5, health_factor))
-        
-        return RateLimitConfig(
-            requests_per_minute=int(base_config.requests_per_minute * health_factor),
-            requests_per_hour=int(base_config.requests_per_hour * health_factor),
-            requests_per_day=int(base_config.requests_per_day * health_factor),
-            burst_limit=int(base_config.burst_limit * health_factor)
-        )
-    
-    def _cleanup_old_requests(self, request_times: deque, window_seconds: int):
-        """Remove requests older than the time window."""
-        cutoff_time = time.time() - window_seconds
-        while request_times and request_times[0] < cutoff_time:
-            request_times.popleft()
+            
+            # Ensure health factor is between 0.5 and 1.5
+            health_factor = max(0.5, min(1.5, health_factor))
+            
+            config = RateLimitConfig(
+                requests_per_minute=int(base_config.requests_per_minute * health_factor),
+                requests_per_hour=int(base_config.requests_per_hour * health_factor),
+                requests_per_day=int(base_config.requests_per_day * health_factor),
+                burst_limit=int(base_config.burst_limit * health_factor)
+            )
+            # Stored under the lock so a concurrent health update cannot be overwritten
+            self._adjusted[tier] = config
+        return config
     
     def update_system_health(self, error_rate: float, avg_response_time: float, 
                            active_connections: int, cpu_usage: float, memory_usage: float):
@@ -142,6 +379,7 @@ class AdaptiveRateLimiter:
                 'cpu_usage': cpu_usage,
                 'memory_usage': memory_usage
             })
+            self._adjusted = {}
     
     def is_allowed(self, client_id: str, tier: RateLimitTier = RateLimitTier.FREE, 
                    endpoint: str = "*", current_time: Optional[float] = None) -> Tuple[bool, Dict[str, int]]:
@@ -149,138 +387,45 @@ class AdaptiveRateLimiter:
         if current_time is None:
             current_time = time.time()
         
-        with self.lock:
-            client_key = self._get_client_key(client_id, endpoint)
-            
-            # Get or create client state
-            if client_key not in self.clients:
-                self.clients[client_key] = RateLimitState(
-                    minute_requests=deque(),
-                    hour_requests=deque(),
-                    day_requests=deque(),
-                    burst_requests=deque(),
-                    last_reset=current_time,
-                    tier=tier
-                )
-            
-            client_state = self.clients[client_key]
-            
-            # Update tier if it changed
-            if client_state.tier != tier:
-                client_state.tier = tier
-            
-            # Get adjusted config based on system health
-            config = self._get_adjusted_config(tier)
-            
-            # Cleanup old requests
-            self._cleanup_old_requests(client_state.minute_requests, 60)  # 1 minute
-            self._cleanup_old_requests(client_state.hour_requests, 3600)  # 1 hour
-            self._cleanup_old_requests(client_state.day_requests, 86400)  # 1 day
-            self._cleanup_old_requests(client_state.burst_requests, 1)  # 1 second
-            
-            # Check current counts against limits
-            current_minute_count = len(client_state.minute_requests)
-            current_hour_count = len(client_state.hour_requests)
-            current_day_count = len(client_state.day_requests)
-            current_burst_count = len(client_state.burst_requests)
-            
-            # Check all limits
-            limits_exceeded = {}
-            
-            if current_minute_count >= config.requests_per_minute:
-                limits_exceeded['minute'] = config.requests_per_minute - current_minute_count
-            
-            if current_hour_count >= config.requests_per_hour:
-                limits_exceeded['hour'] = config.requests_per_hour - current_hour_count
-            
-            if current_day_count >= config.requests_per_day:
-                limits_exceeded['day'] = config.requests_per_day - current_day_count
-            
-            if current_burst_count >= config.burst_limit:
-                limits_exceeded['burst'] = config.burst_limit - current_burst_count
-            
-            # Determine if request is allowed
-            is_allowed = len(limits_exceeded) == 0
-            
-            # Add the current request if allowed
-            if is_allowed:
-                client_state.minute_requests.append(current_time)
-                client_state.hour_requests.append(current_time)
-                client_state.day_requests.append(current_time)
-                client_state.burst_requests.append(current_time)
-            
-            return is_allowed, {
-                'minute_remaining': max(0, config.requests_per_minute - current_minute_count),
-                'hour_remaining': max(0, config.requests_per_hour - current_hour_count),
-                'day_remaining': max(0, config.requests_per_day - current_day_count),
-                'burst_remaining': max(0, config.burst_limit - current_burst_count),
-                'limits_exceeded': limits_exceeded
-            }
+        config = self._get_adjusted_config(tier)
+        limits = config.limits()
+        is_allowed, counts = self.backend.acquire(self._get_client_key(client_id, endpoint), limits, current_time)
+        
+        minute_count, hour_count, day_count, burst_count = counts
+        limits_exceeded = {}
+        if not is_allowed:
+            for (name, _), count, limit in zip(WINDOWS, counts, limits):
+                if count >= limit:
+                    limits_exceeded[name] = limit - count
+        
+        return is_allowed, {
+            'minute_remaining': max(0, config.requests_per_minute - minute_count),
+            'hour_remaining': max(0, config.requests_per_hour - hour_count),
+            'day_remaining': max(0, config.requests_per_day - day_count),
+            'burst_remaining': max(0, config.burst_limit - burst_count),
+            'limits_exceeded': limits_exceeded
+        }
     
     def get_reset_times(self, client_id: str, endpoint: str = "*") -> Dict[str, float]:
-        """Get time until rate limits reset."""
-        with self.lock:
-            client_key = self._get_client_key(client_id, endpoint)
-            
-            if client_key not in self.clients:
-                return {
-                    'minute': 0,
-                    'hour': 0,
-                    'day': 0,
-                    'burst': 0
-                }
-            
-            current_time = time.time()
-            client_state = self.clients[client_key]
-            
-            # Find next reset times
-            minute_reset = 60 if client_state.minute_requests else 0
-            hour_reset = 3600 if client_state.hour_requests else 0
-            day_reset = 86400 if client_state.day_requests else 0
-            burst_reset = 1 if client_state.burst_requests else 0
-            
-            # Calculate actual reset times
-            return {
-                'minute': minute_reset,
-                'hour': hour_reset,
-                'day': day_reset,
-                'burst': burst_reset
-            }
+        """Get time until each window's current bucket rolls over (0 when it is empty)."""
+        current_time = time.time()
+        counts = self.backend.peek(self._get_client_key(client_id, endpoint), current_time)
+        return {
+            name: (seconds - current_time % seconds) if count else 0
+            for (name, seconds), count in zip(WINDOWS, counts)
+        }
     
     def get_usage_stats(self, client_id: str, endpoint: str = "*") -> Dict[str, int]:
         """Get current usage statistics for a client."""
-        with self.lock:
-            client_key = self._get_client_key(client_id, endpoint)
-            
-            if client_key not in self.clients:
-                return {
-                    'minute_requests': 0,
-                    'hour_requests': 0,
-                    'day_requests': 0,
-                    'burst_requests': 0
-                }
-            
-            client_state = self.clients[client_key]
-            
-            # Cleanup old requests first
-            self._cleanup_old_requests(client_state.minute_requests, 60)
-            self._cleanup_old_requests(client_state.hour_requests, 3600)
-            self._cleanup_old_requests(client_state.day_requests, 86400)
-            self._cleanup_old_requests(client_state.burst_requests, 1)
-            
-            return {
-                'minute_requests': len(client_state.minute_requests),
-                'hour_requests': len(client_state.hour_requests),
-                'day_requests': len(client_state.day_requests),
-                'burst_requests': len(client_state.burst_requests)
-            }
+        counts = self.backend.peek(self._get_client_key(client_id, endpoint), time.time())
+        return {f'{name}_requests': count for (name, _), count in zip(WINDOWS, counts)}
 
 
 class MonitoringBasedRateLimiter:
     """Rate limiter that adapts based on monitoring data."""
     
-    def __init__(self):
-        self.rate_limiter = AdaptiveRateLimiter()
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        self.rate_limiter = AdaptiveRateLimiter(backend)
         self.monitoring_data = {}
         self.last_update = time.time()
         self.update_interval = 60  # Update system health every minute
@@ -332,13 +477,24 @@ _rate_limiter = None
 _rate_limiter_lock = threading.Lock()
 
 
+def _default_backend() -> Optional[RateLimitBackend]:
+    """Shared Redis counters when METAEXTRACT_RATE_LIMIT_REDIS_URL is set, else per-process."""
+    url = os.environ.get("METAEXTRACT_RATE_LIMIT_REDIS_URL")
+    if not url:
+        return None
+    if not REDIS_AVAILABLE:
+        logger.warning("METAEXTRACT_RATE_LIMIT_REDIS_URL is set but redis is not installed; using local counters")
+        return None
+    return RedisRateLimitBackend(url)
+
+
 def get_rate_limiter() -> MonitoringBasedRateLimiter:
     """Get the global rate limiter instance."""
     global _rate_limiter
     if _rate_limiter is None:
         with _rate_limiter_lock:
             if _rate_limiter is None:
-                _rate_limiter = MonitoringBasedRateLimiter()
+                _rate_limiter = MonitoringBasedRateLimiter(_default_backend())
     return _rate_limiter
 
 
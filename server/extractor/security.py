@@ -8,7 +8,6 @@ including file validation, sandboxing, and security scanning.
 import os
 import tempfile
 import subprocess
-import hashlib
 import magic
 import logging
 from typing import Dict, List, Optional, Tuple, Callable
@@ -18,6 +17,11 @@ import mimetypes
 import re
 import json
 
+try:
+    from .utils.hashing import hash_file
+except ImportError:
+    from utils.hashing import hash_file
+
 
 class SecurityLevel(Enum):
     """Security levels for file processing."""
@@ -235,13 +239,8 @@ class SecurityValidator:
     def _check_file_integrity(self, filepath: str) -> Optional[SecurityCheckResult]:
         """Check file integrity using hash comparison."""
         try:
-            # Calculate file hash
-            hash_sha256 = hashlib.sha256()
-            with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            
-            file_hash = hash_sha256.hexdigest()
+            # Calculate file hash (shared with the extraction hashes, read once)
+            file_hash = hash_file(filepath, ("sha256",))["sha256"]
             
             # Check against known malicious hashes (simplified)
             # In a real system, this would check against a database of known malicious hashes
@@ -22,6 +22,7 @@ from datetime import datetime
 import time
 from queue import Queue, Empty
 import io
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -399,6 +400,227 @@ class StreamingExtractor:
             return func(*args, **kwargs)
 
 
+class GrowingFile:
+    """
+    A file that is still being written (an in-progress upload or a spooled
+    pipe). Completion is signalled by mark_complete(), a "<path>.complete"
+    marker file, or the size reaching expected_size.
+    """
+
+    COMPLETE_SUFFIX = ".complete"
+
+    def __init__(self, path: str, expected_size: Optional[int] = None, poll_interval: float = 0.05):
+        self.path = str(path)
+        self.expected_size = expected_size
+        self.poll_interval = poll_interval
+        self._complete = threading.Event()
+
+    @property
+    def marker_path(self) -> str:
+        return self.path + self.COMPLETE_SUFFIX
+
+    def mark_complete(self):
+        self._complete.set()
+
+    def available(self) -> int:
+        try:
+            return os.stat(self.path).st_size
+        except OSError:
+            return 0
+
+    def is_complete(self) -> bool:
+        if self._complete.is_set() or os.path.exists(self.marker_path):
+            return True
+        return self.expected_size is not None and self.available() >= self.expected_size
+
+    def read_prefix(self, size: int) -> bytes:
+        with open(self.path, 'rb') as f:
+            return f.read(size)
+
+    async def wait_for(self, size: int, idle_timeout: float = 60.0) -> int:
+        """
+        Wait until at least `size` bytes are on disk or the file is complete.
+        Returns the bytes available; raises asyncio.TimeoutError when the file
+        stops growing for idle_timeout seconds.
+        """
+        last_size = -1
+        last_growth = time.monotonic()
+        while True:
+            # Check completion first so a final write is never missed
+            complete = self.is_complete()
+            available = self.available()
+            if available >= size or complete:
+                return available
+            if available != last_size:
+                last_size = available
+                last_growth = time.monotonic()
+            elif time.monotonic() - last_growth > idle_timeout:
+                raise asyncio.TimeoutError(
+                    f"{self.path} stalled at {available} bytes waiting for {size}"
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    async def wait_complete(self, idle_timeout: float = 60.0) -> int:
+        return await self.wait_for(float('inf'), idle_timeout)
+
+
+def spool_stream(stream: io.RawIOBase, path: str, chunk_size: int = 64 * 1024,
+                 expected_size: Optional[int] = None) -> GrowingFile:
+    """
+    Copy a pipe or socket stream to `path` on a background thread so it can be
+    extracted progressively. The returned GrowingFile completes at EOF.
+    """
+    growing = GrowingFile(path, expected_size=expected_size)
+
+    def _copy():
+        try:
+            with open(path, 'wb') as out:
+                while True:
+                    block = stream.read(chunk_size)
+                    if not block:
+                        break
+                    out.write(block)
+                    out.flush()
+        except Exception as e:
+            logger.error(f"Error spooling stream to {path}: {e}")
+        finally:
+            growing.mark_complete()
+
+    threading.Thread(target=_copy, name=f"spool-{Path(path).name}", daemon=True).start()
+    return growing
+
+
+class ProgressiveExtractor(StreamingExtractor):
+    """
+    Extraction that starts while the file is still arriving.
+
+    Header-level fields (EXIF/XMP, IFD0, front-loaded moov, DICOM file meta,
+    PNG IHDR) are parsed from the received prefix and published as a
+    "header" event; extraction that needs the whole file (moov at the tail,
+    hashes, full engine modules) is deferred until the upload completes and
+    published as a "complete" event.
+
+    Usage:
+        extractor = ProgressiveExtractor()
+        result = await extractor.extract_progressive(
+            upload_path, expected_size=size, on_partial=send_to_client,
+            final_extractor=lambda p: extract_comprehensive_metadata(p, tier="free"))
+    """
+
+    DETECT_BYTES = 132  # enough for the DICOM preamble + "DICM"
+
+    async def probe_header(self, growing: GrowingFile, idle_timeout: float = 60.0) -> Dict[str, Any]:
+        """Run the matching prefix probe, waiting for bytes as it asks for them."""
+        try:
+            from .formats.prefix_probes import MAX_PROBE_BYTES, NeedMoreData, select_probe
+        except ImportError:
+            from formats.prefix_probes import MAX_PROBE_BYTES, NeedMoreData, select_probe
+
+        available = await growing.wait_for(self.DETECT_BYTES, idle_timeout)
+        selected = select_probe(growing.read_prefix(self.DETECT_BYTES))
+        if selected is None:
+            return {'format': None, 'deferred': ['all']}
+        name, probe = selected
+
+        needed = min(max(available, self.DETECT_BYTES), MAX_PROBE_BYTES)
+        while True:
+            data = growing.read_prefix(needed)
+            try:
+                header = probe(data)
+                break
+            except NeedMoreData as more:
+                if more.needed > MAX_PROBE_BYTES:
+                    header = {'format': name, 'deferred': ['header']}
+                    break
+                if len(data) >= more.needed or (growing.is_complete() and growing.available() < more.needed):
+                    header = {'format': name, 'truncated': True, 'bytes_needed': more.needed}
+                    break
+                # Grow the read window geometrically to keep re-reads bounded
+                needed = min(max(more.needed, len(data) * 2), MAX_PROBE_BYTES)
+                await growing.wait_for(more.needed, idle_timeout)
+            except Exception as e:
+                logger.warning(f"{name} prefix probe failed on {growing.path}: {e}")
+                header = {'format': name, 'error': str(e)}
+                break
+        self.metrics.bytes_processed = max(self.metrics.bytes_processed, len(data))
+        header.setdefault('probe', name)
+        return header
+
+    async def extract_progressive(
+        self,
+        source: Any,
+        expected_size: Optional[int] = None,
+        on_partial: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        final_extractor: Optional[Callable[[str], Any]] = None,
+        idle_timeout: float = 60.0,
+    ) -> Dict[str, Any]:
+        """
+        Extract from a path or GrowingFile that may still be growing.
+
+        Args:
+            source: Path of the (partial) upload, or a GrowingFile
+            expected_size: Final size in bytes, when the uploader declared it
+            on_partial: Callback (sync or async) receiving each stage event
+            final_extractor: Full extraction run once the file is complete
+            idle_timeout: Seconds without growth before giving up
+
+        Returns:
+            The final extractor's result (or the header event without one),
+            with a "progressive" section of stage latencies
+        """
+        growing = source if isinstance(source, GrowingFile) else GrowingFile(source, expected_size)
+        started = time.monotonic()
+        self.metrics = StreamingMetrics()
+
+        header = await self.probe_header(growing, idle_timeout)
+        header_event = {
+            'stage': 'header',
+            'path': growing.path,
+            'bytes_available': growing.available(),
+            'upload_complete': growing.is_complete(),
+            'elapsed_ms': round((time.monotonic() - started) * 1000, 2),
+            'metadata': header,
+            'deferred': header.get('deferred', []),
+        }
+        if on_partial:
+            await self._call_async_or_sync(on_partial, header_event)
+
+        final_size = await growing.wait_complete(idle_timeout)
+        upload_done = time.monotonic()
+        self.metrics.bytes_processed = final_size
+
+        result: Dict[str, Any]
+        if final_extractor is not None:
+            if asyncio.iscoroutinefunction(final_extractor):
+                result = await final_extractor(growing.path)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, final_extractor, growing.path)
+            if not isinstance(result, dict):
+                result = {'result': result}
+        else:
+            result = {'header': header}
+
+        finished = time.monotonic()
+        result['progressive'] = {
+            'header': header,
+            'header_latency_ms': header_event['elapsed_ms'],
+            'header_bytes': header_event['bytes_available'],
+            'upload_wait_ms': round((upload_done - started) * 1000, 2),
+            'complete_latency_ms': round((finished - started) * 1000, 2),
+            'final_size': final_size,
+            'deferred': header_event['deferred'],
+        }
+        if on_partial:
+            await self._call_async_or_sync(on_partial, {
+                'stage': 'complete',
+                'path': growing.path,
+                'bytes_available': final_size,
+                'elapsed_ms': result['progressive']['complete_latency_ms'],
+            })
+        return result
+
+
 class StreamingProgressTracker:
     """Track and report streaming progress."""
     
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Bounded In-Process Caches
+
+Shared primitive for the caches and sample buffers held by long-lived engine
+singletons:
+- LRU eviction under an entry limit and an optional byte budget
+- Optional per-entry TTL
+- Per-cache hit/miss/eviction/byte metrics
+- Every cache registers in a process-wide registry that sheds load when
+  MemoryPressureMonitor reports elevated, high or critical pressure
+
+Byte accounting uses estimate_size(), a bounded recursive walk; it is an
+approximation meant for budgeting, not an exact measure of heap usage.
+
+Author: MetaExtract Team
+Version: 1.0.0
+"""
+
+import logging
+import sys
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("metaextract.bounded_cache")
+
+# Fraction of each cache shed per pressure level (see attach_memory_monitor)
+PRESSURE_SHED_FRACTIONS = {
+    "ELEVATED": 0.25,
+    "HIGH": 0.5,
+    "CRITICAL": 1.0,
+}
+
+_SIZE_MAX_DEPTH = 6
+_SIZE_SAMPLE_ITEMS = 64
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate deep size of a value in bytes (sampled for large containers)"""
+    size = sys.getsizeof(value, 64)
+    if _depth >= _SIZE_MAX_DEPTH or isinstance(value, (str, bytes, bytearray, int, float, bool)):
+        return size
+    if isinstance(value, memoryview):
+        return size + value.nbytes
+    if isinstance(value, array):
+        return size
+    if isinstance(value, dict):
+        items = value.items()
+        count = len(value)
+        sample = 0
+        for i, (k, v) in enumerate(items):
+            if i >= _SIZE_SAMPLE_ITEMS:
+                break
+            sample += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+        seen = min(count, _SIZE_SAMPLE_ITEMS)
+        return size + (sample * count // seen if seen else 0)
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        count = len(value)
+        sample = 0
+        for i, item in enumerate(value):
+            if i >= _SIZE_SAMPLE_ITEMS:
+                break
+            sample += estimate_size(item, _depth + 1)
+        seen = min(count, _SIZE_SAMPLE_ITEMS)
+        return size + (sample * count // seen if seen else 0)
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        return size + estimate_size(attrs, _depth + 1)
+    slots = getattr(type(value), "__slots__", None)
+    if slots:
+        return size + sum(estimate_size(getattr(value, s, None), _depth + 1)
+                          for s in ([slots] if isinstance(slots, str) else slots))
+    return size
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU cache bounded by entry count and (optionally) bytes,
+    with optional TTL.
+
+    Usage:
+        cache = BoundedCache("xmp_tables", max_entries=32, max_bytes=16 << 20)
+        table = cache.get(key)
+        if table is None:
+            table = build(...)
+            cache.put(key, table)
+    """
+
+    def __init__(self, name: str, max_entries: int = 1024,
+                 max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None,
+                 register: bool = True):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof or estimate_size
+        # key -> (value, size_bytes, stored_at)
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "puts": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "pressure_evictions": 0,
+            "rejected": 0,
+        }
+        if register:
+            register_cache(self)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry: Tuple[Any, int, float]) -> bool:
+        return self.ttl_seconds is not None and time.monotonic() - entry[2] > self.ttl_seconds
+
+    def _drop(self, key: Hashable) -> None:
+        _value, size, _stored = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return default
+            if self._expired(entry):
+                self._drop(key)
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return default
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size_bytes: Optional[int] = None) -> bool:
+        """Store a value; returns False when it alone exceeds the byte budget"""
+        if size_bytes is None:
+            try:
+                size_bytes = int(self._sizeof(value))
+            except Exception:
+                size_bytes = sys.getsizeof(value, 64)
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            if self.max_bytes is not None and size_bytes > self.max_bytes:
+                self.stats["rejected"] += 1
+                return False
+            self._data[key] = (value, size_bytes, time.monotonic())
+            self._bytes += size_bytes
+            self.stats["puts"] += 1
+            self._enforce()
+            return True
+
+    def _enforce(self) -> None:
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._drop(next(iter(self._data)))
+            self.stats["evictions"] += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._drop(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data.keys())
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of live (key, value) pairs, least recently used first"""
+        with self._lock:
+            return [(key, entry[0]) for key, entry in self._data.items() if not self._expired(entry)]
+
+    def purge_expired(self) -> int:
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            expired = [k for k, entry in self._data.items() if self._expired(entry)]
+            for key in expired:
+                self._drop(key)
+            self.stats["expirations"] += len(expired)
+            return len(expired)
+
+    def shed(self, fraction: float) -> int:
+        """Evict the least recently used fraction of entries (1.0 empties the cache)"""
+        with self._lock:
+            self.purge_expired()
+            count = len(self._data) if fraction >= 1.0 else int(len(self._data) * fraction)
+            for _ in range(count):
+                self._drop(next(iter(self._data)))
+            self.stats["pressure_evictions"] += count
+            return count
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                **self.stats,
+            }
+
+
+class SampleBuffer(deque):
+    """
+    Fixed-length sample history (a deque with maxlen) that reports metrics
+    and drops its oldest samples under memory pressure.
+
+    on_evict, if given, is called with every sample that leaves the buffer
+    (overflow on append, shed or clear), so callers can keep windowed sums
+    in step without rescanning.
+    """
+
+    def __init__(self, name: str, maxlen: int = 1000, register: bool = True,
+                 on_evict: Optional[Callable[[Any], None]] = None):
+        super().__init__(maxlen=maxlen)
+        self.name = name
+        self.appended = 0
+        self.pressure_evictions = 0
+        self.on_evict = on_evict
+        if register:
+            register_cache(self)
+
+    # Identity hashing so buffers can sit in the weak registry
+    __hash__ = object.__hash__
+
+    def append(self, item: Any) -> None:
+        self.appended += 1
+        if self.on_evict is not None and self.maxlen and len(self) == self.maxlen:
+            self.on_evict(self[0])
+        super().append(item)
+
+    def shed(self, fraction: float) -> int:
+        count = len(self) if fraction >= 1.0 else int(len(self) * fraction)
+        for _ in range(count):
+            item = self.popleft()
+            if self.on_evict is not None:
+                self.on_evict(item)
+        self.pressure_evictions += count
+        return count
+
+    def clear(self) -> None:
+        if self.on_evict is not None:
+            for item in self:
+                self.on_evict(item)
+        super().clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "entries": len(self),
+            "max_entries": self.maxlen,
+            "bytes": estimate_size(self),
+            "appended": self.appended,
+            "dropped": self.appended - len(self),
+            "pressure_evictions": self.pressure_evictions,
+        }
+
+
+# Registry of live caches; weak so dropped engine instances take theirs along
+_registry: "weakref.WeakSet" = weakref.WeakSet()
+_registry_lock = threading.Lock()
+_attached_monitors: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def register_cache(cache: Any) -> None:
+    with _registry_lock:
+        _registry.add(cache)
+    _attach_running_monitor()
+
+
+def iter_caches() -> Iterator[Any]:
+    with _registry_lock:
+        caches = list(_registry)
+    return iter(caches)
+
+
+def get_cache_metrics(include_buffers: bool = True) -> Dict[str, Dict[str, Any]]:
+    """Metrics for every live cache, keyed by name (duplicates get a #n suffix)"""
+    metrics: Dict[str, Dict[str, Any]] = {}
+    for cache in iter_caches():
+        if not include_buffers and isinstance(cache, SampleBuffer):
+            continue
+        entry = cache.get_metrics()
+        name = entry["name"]
+        n = 2
+        while name in metrics:
+            name = f"{entry['name']}#{n}"
+            n += 1
+        metrics[name] = entry
+    return metrics
+
+
+def shed_all(fraction: float) -> Dict[str, int]:
+    """Shed the given fraction of every registered cache"""
+    shed = {}
+    for cache in iter_caches():
+        try:
+            shed[cache.name] = shed.get(cache.name, 0) + cache.shed(fraction)
+        except Exception as e:
+            logger.error(f"Error shedding cache {cache.name}: {e}")
+    return shed
+
+
+def _pressure_callback(level_name: str) -> Callable[[Any], None]:
+    fraction = PRESSURE_SHED_FRACTIONS[level_name]
+
+    def on_pressure(stats: Any) -> None:
+        released = shed_all(fraction)
+        logger.warning(
+            f"{level_name} memory pressure ({getattr(stats, 'system_percent', 0):.1f}%): "
+            f"shed {sum(released.values())} entries from {len(released)} caches"
+        )
+    return on_pressure
+
+
+def attach_memory_monitor(monitor: Any = None) -> bool:
+    """
+    Register shedding callbacks with a MemoryPressureMonitor (the global one
+    by default). One registration covers every cache, including ones created
+    later. Returns False when memory monitoring is unavailable.
+    """
+    try:
+        from .memory_pressure import PressureLevel, get_global_monitor
+    except ImportError:
+        return False
+    if monitor is None:
+        monitor = get_global_monitor()
+    with _registry_lock:
+        if monitor in _attached_monitors:
+            return True
+        _attached_monitors.add(monitor)
+    for level_name in PRESSURE_SHED_FRACTIONS:
+        monitor.register_pressure_callback(PressureLevel[level_name], _pressure_callback(level_name))
+    return True
+
+
+def _attach_running_monitor() -> None:
+    """Attach to the global monitor if the process has already started one"""
+    memory_pressure = sys.modules.get(__name__.rsplit(".", 1)[0] + ".memory_pressure")
+    monitor = getattr(memory_pressure, "_global_monitor", None) if memory_pressure else None
+    if monitor is not None and monitor not in _attached_monitors:
+        attach_memory_monitor(monitor)
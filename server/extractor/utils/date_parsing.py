@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Shared Timestamp Parsing
+
+One precompiled scanner for the date shapes metadata actually contains:
+- EXIF / ISO 8601:  2024:05:01 10:20:30, 2024-05-01T10:20:30.123+02:00, 2024-05-01
+- ISO 8601 basic:   20240501T102030Z
+- QuickTime:        ISO with Z (ffprobe creation_time), ctime "Wed May  1 10:20:30 2024"
+- PDF:              D:20240501102030+02'00'
+- RFC 2822:         Wed, 01 May 2024 10:20:30 +0200 / GMT / EST
+- Slash dates:      05/01/2024 10:20:30 (month/day vs day/month decided per source)
+
+The shape that matched is remembered per source field ("exif.DateTimeOriginal"),
+so later values from that field try it first. Sub-seconds keep microsecond
+precision (longer fractions are truncated). Offsets become fixed timezones, and
+callers choose one representation via tz: "aware" (offset-aware when the value
+had one), "utc" (always aware, naive values taken as UTC) or "wall" (always
+naive, offsets dropped). parse_many() dedupes a whole batch before parsing.
+
+Author: MetaExtract Team
+Version: 1.0.0
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+logger = logging.getLogger("metaextract.date_parsing")
+
+TZ_MODES = ("aware", "utc", "wall")
+
+_MONTHS = {name: index for index, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1)}
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+_WEEKDAY = r"(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*"
+_ZONE_NAMES = {
+    "gmt": 0, "ut": 0, "utc": 0, "z": 0,
+    "est": -5, "edt": -4, "cst": -6, "cdt": -5, "mst": -7, "mdt": -6, "pst": -8, "pdt": -7,
+}
+_OFFSET = r"z|[+-]\d{2}(?::?\d{2})?"
+
+# (name, pattern); each pattern's groups are prefixed with its name so all
+# shapes can share one alternation. Most values are EXIF/ISO, so that goes first.
+_SHAPES = (
+    ("iso", r"(?P<iso_y>\d{4})[-:](?P<iso_mo>\d{1,2})[-:](?P<iso_d>\d{1,2})"
+            r"(?:[t ](?P<iso_h>\d{1,2}):(?P<iso_mi>\d{2})(?::(?P<iso_s>\d{2})(?:[.,](?P<iso_f>\d{1,9}))?)?)?"
+            r" ?(?P<iso_tz>" + _OFFSET + r")?"),
+    ("basic", r"(?P<basic_y>\d{4})(?P<basic_mo>\d{2})(?P<basic_d>\d{2})"
+              r"t(?P<basic_h>\d{2})(?P<basic_mi>\d{2})(?P<basic_s>\d{2})?(?:[.,](?P<basic_f>\d{1,9}))?"
+              r"(?P<basic_tz>" + _OFFSET + r")?"),
+    ("pdf", r"d:(?P<pdf_y>\d{4})(?P<pdf_mo>\d{2})?(?P<pdf_d>\d{2})?(?P<pdf_h>\d{2})?(?P<pdf_mi>\d{2})?(?P<pdf_s>\d{2})?"
+            r"(?P<pdf_tz>z|[+-]\d{2}'?(?:\d{2}'?)?)?"),
+    ("rfc2822", r"(?:" + _WEEKDAY + r",? +)?(?P<rfc2822_d>\d{1,2}) +(?P<rfc2822_mo>" + _MONTH + r") +"
+                r"(?P<rfc2822_y>\d{2,4}) +(?P<rfc2822_h>\d{1,2}):(?P<rfc2822_mi>\d{2})(?::(?P<rfc2822_s>\d{2}))?"
+                r"(?: *(?P<rfc2822_tz>[+-]\d{4}|[a-z]{1,3}))?"),
+    ("ctime", _WEEKDAY + r" +(?P<ctime_mo>" + _MONTH + r") +(?P<ctime_d>\d{1,2}) +"
+              r"(?P<ctime_h>\d{1,2}):(?P<ctime_mi>\d{2}):(?P<ctime_s>\d{2}) +(?P<ctime_y>\d{4})"),
+    ("slash", r"(?P<slash_a>\d{1,2})/(?P<slash_b>\d{1,2})/(?P<slash_y>\d{4})"
+              r"(?:[t ](?P<slash_h>\d{1,2}):(?P<slash_mi>\d{2})(?::(?P<slash_s>\d{2}))?)?"),
+)
+
+_SCANNER = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _SHAPES), re.IGNORECASE)
+_SHAPE_PATTERNS = {name: re.compile(pattern, re.IGNORECASE) for name, pattern in _SHAPES}
+_NUMBERS = re.compile(r"\d+")
+
+# Parsed values cached per (text, tz mode, loose); ambiguous slash dates are
+# not cached because their reading depends on the source
+_CACHE_SIZE = 8192
+
+
+def _offset(text: Optional[str]) -> Optional[timezone]:
+    if not text:
+        return None
+    text = text.lower().replace("'", "").replace(":", "")
+    if text in _ZONE_NAMES:
+        return timezone(timedelta(hours=_ZONE_NAMES[text]))
+    if text[0] not in "+-" or not text[1:].isdigit():
+        return None
+    hours = int(text[1:3])
+    minutes = int(text[3:5] or 0)
+    if hours > 23 or minutes > 59:
+        return None
+    delta = timedelta(hours=hours, minutes=minutes)
+    return timezone(-delta if text[0] == "-" else delta)
+
+
+def _microseconds(fraction: Optional[str]) -> int:
+    return int((fraction + "000000")[:6]) if fraction else 0
+
+
+def _year(text: str) -> int:
+    year = int(text)
+    if len(text) == 2:  # RFC 2822 obsolete two-digit years
+        year += 2000 if year < 50 else 1900
+    return year
+
+
+class TimestampParser:
+    """
+    Timestamp parser that remembers, per source field, which shape matched.
+
+    Thread-safe for concurrent use: the per-source memo and the value cache
+    only ever hold complete entries.
+    """
+
+    def __init__(self, cache_size: int = _CACHE_SIZE):
+        self.cache_size = cache_size
+        self._formats: Dict[str, str] = {}
+        self._day_first: Dict[str, bool] = {}
+        self._cache: Dict[tuple, Optional[datetime]] = {}
+        self._lock = threading.Lock()
+
+    def _match(self, text: str, source: Optional[str]):
+        shape = self._formats.get(source) if source else None
+        if shape:
+            match = _SHAPE_PATTERNS[shape].fullmatch(text)
+            if match:
+                return shape, match
+        match = _SCANNER.fullmatch(text)
+        if not match:
+            return None, None
+        shape = match.lastgroup
+        if source and self._formats.get(source) != shape:
+            with self._lock:
+                self._formats[source] = shape
+        return shape, match
+
+    def _build(self, shape: str, groups: Dict[str, Optional[str]], source: Optional[str]):
+        def get(name: str, default: int = 0) -> int:
+            value = groups.get(f"{shape}_{name}")
+            return int(value) if value else default
+
+        tzinfo = None
+        ambiguous = False
+        if shape in ("iso", "basic", "pdf"):
+            year, month, day = get("y"), get("mo", 1), get("d", 1)
+            tzinfo = _offset(groups.get(f"{shape}_tz"))
+        elif shape in ("rfc2822", "ctime"):
+            year = _year(groups[f"{shape}_y"])
+            month = _MONTHS[groups[f"{shape}_mo"][:3].lower()]
+            day = get("d")
+            if shape == "rfc2822":
+                tzinfo = _offset(groups.get("rfc2822_tz"))
+        else:
+            first, second, year = get("a"), get("b"), get("y")
+            if first > 12:
+                day_first = True
+            elif second > 12:
+                day_first = False
+            else:
+                day_first = self._day_first.get(source, False) if source else False
+                ambiguous = True
+            if source and not ambiguous and self._day_first.get(source) != day_first:
+                with self._lock:
+                    self._day_first[source] = day_first
+            day, month = (first, second) if day_first else (second, first)
+
+        parsed = datetime(year, month, day, get("h"), get("mi"), get("s"),
+                          _microseconds(groups.get(f"{shape}_f")), tzinfo=tzinfo)
+        return parsed, ambiguous
+
+    @staticmethod
+    def _loose(text: str) -> Optional[datetime]:
+        """Last resort: the first three to six numbers, year first or last."""
+        numbers = _NUMBERS.findall(text)
+        if len(numbers) < 3:
+            return None
+        try:
+            year_first = len(numbers[0]) == 4
+            year = int(numbers[0]) if year_first else int(numbers[2])
+            day = int(numbers[2]) if year_first else int(numbers[0])
+            clock = [int(number) for number in numbers[3:6]]
+            clock += [0] * (3 - len(clock))
+            return datetime(year, int(numbers[1]), day, *clock)
+        except (ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _convert(parsed: datetime, tz: str) -> datetime:
+        if tz == "wall":
+            return parsed.replace(tzinfo=None)
+        if tz == "utc":
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
+        return parsed
+
+    def parse(self, value: Any, source: Optional[str] = None, tz: str = "aware",
+              loose: bool = False) -> Optional[datetime]:
+        """
+        Parse one value into a datetime, or None.
+
+        datetime values pass through (converted to tz); bytes are decoded.
+        With loose=True, unrecognised strings fall back to reading the first
+        numbers as year/month/day/hour/minute/second.
+        """
+        if tz not in TZ_MODES:
+            raise ValueError(f"tz must be one of {TZ_MODES}")
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return self._convert(value, tz)
+        if isinstance(value, bytes):
+            value = value.decode("ascii", "ignore")
+        text = str(value).strip().rstrip("\x00").strip()
+        if not text:
+            return None
+
+        key = (text, tz, loose)
+        cached = self._cache.get(key, self)
+        if cached is not self:
+            return cached
+
+        parsed = None
+        ambiguous = False
+        shape, match = self._match(text, source)
+        if match:
+            try:
+                parsed, ambiguous = self._build(shape, match.groupdict(), source)
+            except (ValueError, KeyError, OverflowError):
+                parsed = None
+        if parsed is None and loose:
+            parsed = self._loose(text)
+        if parsed is not None:
+            parsed = self._convert(parsed, tz)
+
+        if not ambiguous:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = parsed
+        return parsed
+
+    def parse_many(self, values: Iterable[Any], source: Union[None, str, Sequence[Optional[str]]] = None,
+                   tz: str = "aware", loose: bool = False) -> List[Optional[datetime]]:
+        """
+        Parse a batch. source is one field name for every value or one per
+        value. Repeated (source, value) pairs are parsed once.
+        """
+        values = list(values)
+        sources = [source] * len(values) if source is None or isinstance(source, str) else list(source)
+        if len(sources) != len(values):
+            raise ValueError("source must be a string or have one entry per value")
+        seen: Dict[tuple, Optional[datetime]] = {}
+        results: List[Optional[datetime]] = []
+        for value, value_source in zip(values, sources):
+            key = (value_source, value if isinstance(value, (str, bytes, datetime)) else str(value))
+            if key not in seen:
+                seen[key] = self.parse(value, value_source, tz, loose)
+            results.append(seen[key])
+        return results
+
+    def to_epoch(self, value: Any, source: Optional[str] = None) -> Optional[float]:
+        """UTC epoch seconds; values without an offset are taken as UTC."""
+        parsed = self.parse(value, source, tz="utc")
+        return parsed.timestamp() if parsed is not None else None
+
+    def remembered_formats(self) -> Dict[str, str]:
+        """Shape last matched per source field."""
+        with self._lock:
+            return dict(self._formats)
+
+
+_default_parser = TimestampParser()
+
+
+def get_timestamp_parser() -> TimestampParser:
+    """Process-wide parser shared by the extraction modules."""
+    return _default_parser
+
+
+def parse_timestamp(value: Any, source: Optional[str] = None, tz: str = "aware",
+                    loose: bool = False) -> Optional[datetime]:
+    """Parse one timestamp with the shared parser (see TimestampParser.parse)."""
+    return _default_parser.parse(value, source, tz, loose)
+
+
+def parse_timestamps(values: Iterable[Any], source: Union[None, str, Sequence[Optional[str]]] = None,
+                     tz: str = "aware", loose: bool = False) -> List[Optional[datetime]]:
+    """Parse a batch of timestamps with the shared parser."""
+    return _default_parser.parse_many(values, source, tz, loose)
+
+
+def timestamp_to_epoch(value: Any, source: Optional[str] = None) -> Optional[float]:
+    """UTC epoch seconds of a timestamp; naive values are taken as UTC."""
+    return _default_parser.to_epoch(value, source)
@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Compiled Field-Name Tables
+
+Read-only, memory-mapped replacement for the large tag -> field-name dict
+literals used by the format registries:
+- Registry sources are plain modules of dict literals that are parsed, never
+  imported, so the runtime modules do not pay for them at import time
+- Each source compiles to one binary table file: per table, an entry array in
+  source order and a hash slot array, over a string pool in which every
+  distinct key and value is stored once
+- Tables are opened lazily on first access and mapped read-only, so forked
+  workers share the same page-cache pages instead of private dict copies
+- Table files are rebuilt automatically when missing or older than their
+  source; the build can also run ahead of time from the command line
+
+Lookups go through FieldTable, a read-only Mapping that keeps the insertion
+order of the source literal. Module-level names are bound to LazyFieldTable
+proxies, so `NAME.get(tag)`, `tag in NAME`, `{**NAME}` and `from x import NAME`
+keep working.
+
+Usage:
+    python -m server.extractor.utils.field_tables build
+    python -m server.extractor.utils.field_tables info path/to/source.py
+
+Author: MetaExtract Team
+Version: 1.0.0
+"""
+
+import argparse
+import ast
+import json
+import logging
+import mmap
+import operator
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger("metaextract.field_tables")
+
+MAGIC = b"MXFT"
+FORMAT_VERSION = 1
+TABLE_SUFFIX = ".fieldtab"
+
+# Overrides where compiled tables are written (default: the source
+# directory's __pycache__)
+TABLE_DIR_ENV = "METAEXTRACT_FIELD_TABLE_DIR"
+
+# Directory holding the registry sources shipped with the extractor modules
+DEFAULT_SOURCE_DIR = Path(__file__).resolve().parent.parent / "modules" / "field_table_sources"
+
+# magic, version, byte order (0 little / 1 big), source mtime_ns, source size,
+# directory offset, directory length
+_HEADER = struct.Struct("<4sHH QQ QQ")
+# Value length marking None, and key length marking an int key
+_NONE = 0xFFFFFFFF
+_INT_KEY = 0xFFFFFFFE
+
+
+class FieldTableError(Exception):
+    """Raised when a table source or compiled table file is invalid."""
+
+
+# ---------------------------------------------------------------------------
+# Source parsing
+# ---------------------------------------------------------------------------
+
+def read_source_tables(source: Union[str, Path]) -> Dict[str, Dict[Any, Optional[str]]]:
+    """
+    Evaluate a table source without importing it.
+
+    The source may contain only a docstring and `NAME = {...}` assignments
+    whose keys are str/int constants and whose values are str constants or
+    None. `**OTHER` merges of tables defined earlier in the same source are
+    allowed; a name assigned twice keeps its last value, as in Python.
+    """
+    path = Path(source)
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    tables: Dict[str, Dict[Any, Optional[str]]] = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue
+        if not (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Dict)
+        ):
+            raise FieldTableError(f"{path}:{node.lineno}: only dict literal assignments are allowed")
+
+        table: Dict[Any, Optional[str]] = {}
+        for key, value in zip(node.value.keys, node.value.values):
+            if key is None:
+                if not isinstance(value, ast.Name) or value.id not in tables:
+                    raise FieldTableError(f"{path}:{value.lineno}: can only merge tables defined above")
+                table.update(tables[value.id])
+                continue
+            try:
+                key_value, value_value = ast.literal_eval(key), ast.literal_eval(value)
+            except ValueError:
+                raise FieldTableError(f"{path}:{key.lineno}: entries must be literals")
+            if type(key_value) not in (str, int):
+                raise FieldTableError(f"{path}:{key.lineno}: keys must be str or int constants")
+            if not (value_value is None or type(value_value) is str):
+                raise FieldTableError(f"{path}:{value.lineno}: values must be str constants or None")
+            table[key_value] = value_value
+        tables[node.targets[0].id] = table
+
+    return tables
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def _pad(buf: bytearray, alignment: int = 8) -> None:
+    buf.extend(b"\x00" * (-len(buf) % alignment))
+
+
+def _slot_count(entries: int) -> int:
+    # Power of two at least twice the entry count keeps linear probes short
+    size = 8
+    while size < 2 * entries:
+        size <<= 1
+    return size
+
+
+def _key_hash(key: Any) -> int:
+    """Process-independent hash: CRC-32 of the UTF-8 key, or the int itself."""
+    if isinstance(key, str):
+        return zlib.crc32(key.encode("utf-8", "surrogatepass"))
+    return hash(key)
+
+
+def encode_tables(
+    tables: Dict[str, Dict[Any, Optional[str]]],
+    source_mtime_ns: int = 0,
+    source_size: int = 0,
+) -> bytes:
+    """Serialize tables to the binary table format."""
+    pool = bytearray()
+    interned: Dict[str, Tuple[int, int]] = {}
+
+    def ref(text: Optional[str]) -> Tuple[int, int]:
+        if text is None:
+            return 0, _NONE
+        found = interned.get(text)
+        if found is None:
+            raw = text.encode("utf-8", "surrogatepass")
+            found = (len(pool), len(raw))
+            pool.extend(raw)
+            interned[text] = found
+        return found
+
+    layouts = []
+    for name, table in tables.items():
+        # One (key offset, key length, value offset, value length) row per
+        # entry in source order; int keys live in a parallel int64 column
+        rows = array("I")
+        ints = array("q")
+        slots = array("I", bytes(4 * _slot_count(len(table))))
+        mask = len(slots) - 1
+        for index, (key, value) in enumerate(table.items()):
+            if isinstance(key, str):
+                rows.extend(ref(key))
+                ints.append(0)
+            else:
+                rows.extend((0, _INT_KEY))
+                try:
+                    ints.append(key)
+                except OverflowError:
+                    raise FieldTableError(f"table {name}: integer key {key} out of 64-bit range")
+            rows.extend(ref(value))
+            slot = _key_hash(key) & mask
+            while slots[slot]:
+                slot = (slot + 1) & mask
+            slots[slot] = index + 1
+        layouts.append((name, len(table), rows, ints, slots))
+
+    # Pool offsets are relative to the pool, which follows the header
+    base = _HEADER.size + len(pool) + (-(_HEADER.size + len(pool)) % 8)
+    sections = bytearray()
+    directory: Dict[str, Any] = {"pool": _HEADER.size, "tables": {}}
+    for name, count, rows, ints, slots in layouts:
+        entry: Dict[str, int] = {"count": count, "slots_count": len(slots)}
+        for label, data in (("rows", rows), ("ints", ints), ("slots", slots)):
+            _pad(sections)
+            entry[label] = base + len(sections)
+            sections.extend(data.tobytes())
+        directory["tables"][name] = entry
+    _pad(sections)
+
+    dir_bytes = json.dumps(directory, separators=(",", ":")).encode("utf-8")
+    out = bytearray(_HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0 if sys.byteorder == "little" else 1,
+        source_mtime_ns, source_size, base + len(sections), len(dir_bytes),
+    ))
+    out.extend(pool)
+    _pad(out)
+    out.extend(sections)
+    out.extend(dir_bytes)
+    return bytes(out)
+
+
+def _read_header(buf) -> Tuple[int, int, int, int]:
+    if len(buf) < _HEADER.size:
+        raise FieldTableError("table file truncated")
+    magic, version, order, mtime_ns, size, dir_offset, dir_len = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise FieldTableError("not a field table file or unsupported version")
+    if order != (0 if sys.byteorder == "little" else 1):
+        raise FieldTableError("table file was built on a machine with different byte order")
+    return mtime_ns, size, dir_offset, dir_len
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+class _TableKeys(KeysView):
+    def __iter__(self) -> Iterator[Any]:
+        return self._mapping._iter_keys()
+
+
+class _TableValues(ValuesView):
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for _key, value in self._mapping._iter_items():
+            yield value
+
+
+class _TableItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Optional[str]]]:
+        return self._mapping._iter_items()
+
+
+class FieldTable(Mapping):
+    """
+    Read-only mapping over one table of a compiled table file.
+
+    Keys are found through an open-addressing slot array (CRC-32 of the UTF-8
+    key, or the int itself, with linear probing); keys and values are decoded
+    from the shared string pool on access and iterate in source order.
+    """
+
+    __slots__ = ("name", "_buf", "_pool", "_count", "_rows", "_ints", "_slots", "_mask")
+
+    def __init__(self, buf, directory: Dict[str, Any], name: str):
+        entry = directory["tables"][name]
+        view = memoryview(buf)
+        count = entry["count"]
+        self.name = name
+        self._buf = buf
+        self._pool = directory["pool"]
+        self._count = count
+        self._rows = view[entry["rows"]:entry["rows"] + 16 * count].cast("I")
+        self._ints = view[entry["ints"]:entry["ints"] + 8 * count].cast("q")
+        self._slots = view[entry["slots"]:entry["slots"] + 4 * entry["slots_count"]].cast("I")
+        self._mask = entry["slots_count"] - 1
+
+    def _text(self, offset: int, length: int) -> Optional[str]:
+        if length == _NONE:
+            return None
+        start = self._pool + offset
+        return self._buf[start:start + length].decode("utf-8", "surrogatepass")
+
+    def _find(self, key: Any) -> int:
+        """Entry index of key, or -1."""
+        rows, slots, mask = self._rows, self._slots, self._mask
+        if isinstance(key, str):
+            needle = key.encode("utf-8", "surrogatepass")
+            size = len(needle)
+            buf, pool = self._buf, self._pool
+            slot = zlib.crc32(needle) & mask
+            while True:
+                index = slots[slot] - 1
+                if index < 0:
+                    return -1
+                row = 4 * index
+                if rows[row + 1] == size:
+                    start = pool + rows[row]
+                    if buf[start:start + size] == needle:
+                        return index
+                slot = (slot + 1) & mask
+        try:
+            number = operator.index(key)
+        except TypeError:
+            return -1
+        ints = self._ints
+        slot = hash(number) & mask
+        while True:
+            index = slots[slot] - 1
+            if index < 0:
+                return -1
+            if rows[4 * index + 1] == _INT_KEY and ints[index] == number:
+                return index
+            slot = (slot + 1) & mask
+
+    def _key_at(self, index: int) -> Any:
+        row = 4 * index
+        if self._rows[row + 1] == _INT_KEY:
+            return self._ints[index]
+        return self._text(self._rows[row], self._rows[row + 1])
+
+    def _value_at(self, index: int) -> Optional[str]:
+        row = 4 * index
+        return self._text(self._rows[row + 2], self._rows[row + 3])
+
+    def __getitem__(self, key: Any) -> Optional[str]:
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._value_at(index)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        index = self._find(key)
+        return default if index < 0 else self._value_at(index)
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _iter_keys(self) -> Iterator[Any]:
+        for index in range(self._count):
+            yield self._key_at(index)
+
+    def _iter_items(self) -> Iterator[Tuple[Any, Optional[str]]]:
+        for index in range(self._count):
+            yield self._key_at(index), self._value_at(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iter_keys()
+
+    def keys(self) -> KeysView:
+        return _TableKeys(self)
+
+    def values(self) -> ValuesView:
+        return _TableValues(self)
+
+    def items(self) -> ItemsView:
+        return _TableItems(self)
+
+    def copy(self) -> Dict[Any, Optional[str]]:
+        return dict(self._iter_items())
+
+    def __or__(self, other: Mapping) -> Dict[Any, Optional[str]]:
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other: Mapping) -> Dict[Any, Optional[str]]:
+        merged = dict(other)
+        merged.update(self._iter_items())
+        return merged
+
+    def __reduce__(self):
+        # Pickles (e.g. task payloads) carry a plain dict, not the mapping
+        return dict, (self.copy(),)
+
+    def __repr__(self) -> str:
+        return f"<FieldTable {self.name} ({len(self)} entries)>"
+
+
+class FieldTableSet:
+    """
+    The tables compiled from one source file, opened on first access.
+
+    Indexing returns LazyFieldTable proxies without touching the disk, so a
+    module can bind all of its table names at import time for free.
+    """
+
+    def __init__(self, source: Union[str, Path], table_dir: Optional[Union[str, Path]] = None):
+        self.source = Path(source)
+        env_dir = os.environ.get(TABLE_DIR_ENV)
+        if table_dir is None:
+            table_dir = Path(env_dir) if env_dir else self.source.parent / "__pycache__"
+        self.path = Path(table_dir) / (self.source.stem + TABLE_SUFFIX)
+        self._lock = threading.Lock()
+        self._buf = None
+        self._directory: Optional[Dict[str, Any]] = None
+        self._tables: Dict[str, FieldTable] = {}
+        self._proxies: Dict[str, "LazyFieldTable"] = {}
+        self.mapped = False
+
+    def __getitem__(self, name: str) -> "LazyFieldTable":
+        proxy = self._proxies.get(name)
+        if proxy is None:
+            proxy = self._proxies.setdefault(name, LazyFieldTable(self, name))
+        return proxy
+
+    def names(self) -> List[str]:
+        self._ensure_loaded()
+        return list(self._directory["tables"])
+
+    def table(self, name: str) -> FieldTable:
+        """The FieldTable for name, loading the table file if needed."""
+        table = self._tables.get(name)
+        if table is not None:
+            return table
+        self._ensure_loaded()
+        with self._lock:
+            table = self._tables.get(name)
+            if table is None:
+                if name not in self._directory["tables"]:
+                    raise KeyError(f"{self.source.name} defines no table {name!r}")
+                table = self._tables[name] = FieldTable(self._buf, self._directory, name)
+        return table
+
+    def _ensure_loaded(self) -> None:
+        if self._directory is not None:
+            return
+        with self._lock:
+            if self._directory is None:
+                self._load()
+
+    def _source_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.source.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _open_mapped(self, stamp: Optional[Tuple[int, int]]):
+        try:
+            with open(self.path, "rb") as handle:
+                buf = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            mtime_ns, size, _, _ = _read_header(buf)
+        except FieldTableError as exc:
+            logger.debug("Ignoring %s: %s", self.path, exc)
+            buf.close()
+            return None
+        # Without a source (pre-built deployment) the table is trusted as is
+        if stamp is not None and (mtime_ns, size) != stamp:
+            buf.close()
+            return None
+        return buf
+
+    def _load(self) -> None:
+        stamp = self._source_stamp()
+        buf = self._open_mapped(stamp)
+        if buf is None:
+            if stamp is None:
+                raise FieldTableError(f"no table source at {self.source} and no compiled table at {self.path}")
+            data = encode_tables(read_source_tables(self.source), *stamp)
+            try:
+                write_table_file(data, self.path)
+            except OSError as exc:
+                logger.debug("Cannot write %s (%s); keeping tables in memory", self.path, exc)
+            else:
+                buf = self._open_mapped(stamp)
+            if buf is None:
+                buf = data
+
+        self.mapped = isinstance(buf, mmap.mmap)
+        _, _, dir_offset, dir_len = _read_header(buf)
+        self._directory = json.loads(bytes(buf[dir_offset:dir_offset + dir_len]).decode("utf-8"))
+        self._buf = buf
+
+    def build(self) -> Path:
+        """Compile the source to its table file and return the path."""
+        stamp = self._source_stamp()
+        if stamp is None:
+            raise FieldTableError(f"no table source at {self.source}")
+        write_table_file(encode_tables(read_source_tables(self.source), *stamp), self.path)
+        return self.path
+
+
+class LazyFieldTable(Mapping):
+    """Mapping proxy bound at import time that opens its table on first use."""
+
+    __slots__ = ("_tables", "_name", "_table")
+
+    def __init__(self, tables: FieldTableSet, name: str):
+        self._tables = tables
+        self._name = name
+        self._table: Optional[FieldTable] = None
+
+    def _resolve(self) -> FieldTable:
+        table = self._table
+        if table is None:
+            table = self._table = self._tables.table(self._name)
+        return table
+
+    def __getitem__(self, key: Any) -> Optional[str]:
+        return self._resolve()[key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._resolve().get(key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._resolve()
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._resolve())
+
+    def keys(self) -> KeysView:
+        return self._resolve().keys()
+
+    def values(self) -> ValuesView:
+        return self._resolve().values()
+
+    def items(self) -> ItemsView:
+        return self._resolve().items()
+
+    def copy(self) -> Dict[Any, Optional[str]]:
+        return self._resolve().copy()
+
+    def __or__(self, other: Mapping) -> Dict[Any, Optional[str]]:
+        return self._resolve() | other
+
+    def __ror__(self, other: Mapping) -> Dict[Any, Optional[str]]:
+        return other | self._resolve().copy()
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._table is not None else "not loaded"
+        return f"<LazyFieldTable {self._tables.source.stem}.{self._name} ({state})>"
+
+
+def write_table_file(data: bytes, path: Union[str, Path]) -> None:
+    """Atomically write a compiled table so concurrent readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+_TABLE_SETS: Dict[Path, FieldTableSet] = {}
+_TABLE_SETS_LOCK = threading.Lock()
+
+
+def load_field_tables(source: Union[str, Path]) -> FieldTableSet:
+    """
+    Shared FieldTableSet for a source name or path.
+
+    A bare name ("makernotes_complete") resolves to DEFAULT_SOURCE_DIR.
+    Nothing is read until a table is first accessed.
+    """
+    path = Path(source)
+    if path.suffix != ".py":
+        path = DEFAULT_SOURCE_DIR / (str(source) + ".py")
+    path = path.resolve()
+    with _TABLE_SETS_LOCK:
+        tables = _TABLE_SETS.get(path)
+        if tables is None:
+            tables = _TABLE_SETS[path] = FieldTableSet(path)
+    return tables
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or inspect compiled field-name tables")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="compile table sources")
+    build.add_argument("sources", nargs="*", help=f"source files (default: all in {DEFAULT_SOURCE_DIR})")
+    build.add_argument("--out-dir", help=f"output directory (default: ${TABLE_DIR_ENV} or __pycache__)")
+    info = sub.add_parser("info", help="list the tables of a source")
+    info.add_argument("source")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        sources = [Path(s) for s in args.sources] or sorted(DEFAULT_SOURCE_DIR.glob("*.py"))
+        for source in sources:
+            tables = FieldTableSet(source, args.out_dir)
+            path = tables.build()
+            print(f"{source.name}: {len(tables.names())} tables, {path.stat().st_size} bytes -> {path}")
+        return 0
+
+    tables = load_field_tables(args.source)
+    for name in tables.names():
+        print(f"{name}\t{len(tables.table(name))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
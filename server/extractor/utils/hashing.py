@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Multi-Digest File Hashing Service
+
+Computes every requested content digest from a single pass over the file:
+- Regular files are mapped with mmap and fed as zero-copy slices; other
+  files are read with large double-buffered readinto() calls
+- Each digest is updated on its own thread. hashlib and zlib release the
+  GIL for large buffers, so MD5/SHA-1/SHA-256/CRC32 run on separate cores
+  instead of serially on one
+- Results are memoized per (device, inode, size, mtime) so repeated
+  requests for the same unchanged file never touch the disk
+
+Usage:
+    from .utils.hashing import hash_file
+    digests = hash_file(path, ("md5", "sha256"))
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+logger = logging.getLogger("metaextract.hashing")
+
+DEFAULT_ALGORITHMS: Tuple[str, ...] = ("md5", "sha256", "sha1", "crc32")
+SUPPORTED_ALGORITHMS: Tuple[str, ...] = (
+    "md5", "sha1", "sha224", "sha256", "sha384", "sha512", "blake2b", "blake2s", "crc32"
+)
+
+# Below this size thread hand-off costs more than it saves
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class _CRC32:
+    """hashlib-style wrapper around zlib.crc32."""
+
+    name = "crc32"
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return format(self._value & 0xFFFFFFFF, "08x")
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == "crc32":
+        return _CRC32()
+    return hashlib.new(algorithm)
+
+
+def _normalize_algorithms(algorithms: Iterable[str]) -> Tuple[str, ...]:
+    normalized = []
+    for algorithm in algorithms:
+        name = algorithm.lower().replace("-", "")
+        if name not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        if name not in normalized:
+            normalized.append(name)
+    return tuple(normalized)
+
+
+class FileHasher:
+    """Single-read, multi-threaded digest engine with a stat-keyed memo."""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, cache_size: int = 4096):
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int, int, int], Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats = {"hits": 0, "misses": 0, "bytes_hashed": 0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(SUPPORTED_ALGORITHMS), thread_name_prefix="hash-digest"
+                )
+            return self._executor
+
+    def hash_file(self, filepath: str, algorithms: Sequence[str] = DEFAULT_ALGORITHMS) -> Dict[str, str]:
+        """
+        Compute the requested digests of a file with one read.
+
+        Args:
+            filepath: Path to the file
+            algorithms: Digest names (hashlib names plus "crc32")
+
+        Returns:
+            Mapping of algorithm name to lowercase hex digest, in request order
+
+        Raises:
+            OSError: If the file cannot be opened or read
+            ValueError: If an algorithm is not supported
+        """
+        wanted = _normalize_algorithms(algorithms)
+        with open(filepath, "rb") as f:
+            st = os.fstat(f.fileno())
+            key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                missing = [a for a in wanted if cached is None or a not in cached]
+                if not missing:
+                    self.stats["hits"] += 1
+                    return {a: cached[a] for a in wanted}
+                self.stats["misses"] += 1
+
+            computed = self._digest_file(f, st.st_size, missing)
+
+        with self._lock:
+            entry = self._cache.setdefault(key, {})
+            entry.update(computed)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self.stats["bytes_hashed"] += st.st_size
+            return {a: entry[a] for a in wanted}
+
+    def _digest_file(self, f, size: int, algorithms: Sequence[str]) -> Dict[str, str]:
+        hashers = [_new_hasher(a) for a in algorithms]
+        mapped = None
+        if size > 0:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+
+        chunks = self._mmap_chunks(mapped) if mapped is not None else self._read_chunks(f)
+        try:
+            if size < PARALLEL_THRESHOLD or len(hashers) == 1:
+                self._digest_serial(chunks, hashers)
+            else:
+                self._digest_parallel(chunks, hashers)
+        finally:
+            chunks.close()
+            if mapped is not None:
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A view is still referenced by an in-flight traceback; GC closes it
+                    pass
+
+        return {a: h.hexdigest() for a, h in zip(algorithms, hashers)}
+
+    @staticmethod
+    def _digest_serial(chunks: Iterator[memoryview], hashers: list) -> None:
+        for view in chunks:
+            for hasher in hashers:
+                hasher.update(view)
+
+    def _digest_parallel(self, chunks: Iterator[memoryview], hashers: list) -> None:
+        """Feed each chunk to all digests concurrently, overlapping the next read."""
+        executor = self._get_executor()
+        pending: list = []
+        for view in chunks:
+            if pending:
+                wait(pending)
+                for future in pending:
+                    future.result()
+            pending = [executor.submit(hasher.update, view) for hasher in hashers]
+        if pending:
+            wait(pending)
+            for future in pending:
+                future.result()
+
+    def _mmap_chunks(self, mapped: mmap.mmap) -> Iterator[memoryview]:
+        view = memoryview(mapped)
+        try:
+            for offset in range(0, len(view), self.chunk_size):
+                yield view[offset:offset + self.chunk_size]
+        finally:
+            view.release()
+
+    def _read_chunks(self, f) -> Iterator[memoryview]:
+        # Two alternating buffers: one is being hashed while the other is filled
+        buffers = [bytearray(self.chunk_size), bytearray(self.chunk_size)]
+        index = 0
+        while True:
+            buffer = buffers[index]
+            n = f.readinto(buffer)
+            if not n:
+                return
+            yield memoryview(buffer)[:n]
+            index ^= 1
+
+    def invalidate(self, filepath: Optional[str] = None) -> None:
+        """Drop memoized digests for one file, or all files."""
+        with self._lock:
+            if filepath is None:
+                self._cache.clear()
+                return
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                return
+            self._cache.pop((st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns), None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, entries=len(self._cache))
+
+
+_hasher: Optional[FileHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def get_file_hasher() -> FileHasher:
+    """Return the process-wide FileHasher."""
+    global _hasher
+    with _hasher_lock:
+        if _hasher is None:
+            _hasher = FileHasher()
+        return _hasher
+
+
+def hash_file(filepath: str, algorithms: Sequence[str] = DEFAULT_ALGORITHMS) -> Dict[str, str]:
+    """Compute the requested digests of a file with one read (memoized)."""
+    return get_file_hasher().hash_file(filepath, algorithms)
@@ -354,6 +354,9 @@ def get_global_monitor() -> MemoryPressureMonitor:
     if _global_monitor is None:
         _global_monitor = MemoryPressureMonitor()
         _global_monitor.start_monitoring()
+        # Let every bounded in-process cache shed entries under pressure
+        from .bounded_cache import attach_memory_monitor
+        attach_memory_monitor(_global_monitor)
     
     return _global_monitor
 
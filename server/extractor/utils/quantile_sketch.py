@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Streaming Quantile Sketches
+
+Constant-memory latency percentiles for the monitoring and analytics layers:
+- DDSketch: log-spaced buckets with a relative-accuracy guarantee (1% by
+  default), exact count/sum/min/max, mergeable across processes
+- WindowedSketch: a DDSketch per time slice, so quantiles cover only the last
+  max_age seconds while _sum/_count stay cumulative (Prometheus summary rules)
+- SketchFamily: one windowed sketch per label value, with a cap on distinct
+  label values, JSON snapshots for shipping between workers and Prometheus
+  text exposition
+
+Snapshots from several workers merge slice by slice (slices are aligned to
+wall-clock time), so a coordinator can report fleet-wide percentiles.
+
+Author: MetaExtract Team
+Version: 1.0.0
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this (sketches are meant for non-negative latencies) are
+# counted in the zero bucket
+_MIN_INDEXABLE = 1e-9
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative error bounded by relative_accuracy.
+
+    A value v lands in bucket ceil(log_gamma(v)), gamma = (1 + a) / (1 - a),
+    so any reported quantile is within a * v of the true one. Buckets are
+    sparse; past max_bins the lowest buckets are collapsed together, which
+    keeps the upper percentiles (the ones latency alerts use) accurate.
+    """
+
+    __slots__ = ("relative_accuracy", "max_bins", "_gamma", "_log_gamma", "bins",
+                 "zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value != value:  # NaN
+            return
+        if value > _MIN_INDEXABLE:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            bins = self.bins
+            bins[key] = bins.get(key, 0) + count
+            if len(bins) > self.max_bins:
+                self._collapse()
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self) -> None:
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins + 1
+        target = keys[excess]
+        folded = sum(self.bins.pop(key) for key in keys[:excess])
+        self.bins[target] += folded
+
+    def _value(self, key: int) -> float:
+        return 2.0 * self._gamma ** key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0..1), or None when empty."""
+        return self.quantiles((q,))[q]
+
+    def quantiles(self, qs: Sequence[float] = DEFAULT_QUANTILES) -> Dict[float, Optional[float]]:
+        """Estimated values at several quantiles with one pass over the buckets."""
+        if not self.count:
+            return {q: None for q in qs}
+        keys = sorted(self.bins)
+        result: Dict[float, Optional[float]] = {}
+        for q in qs:
+            if q <= 0:
+                result[q] = self.min
+                continue
+            if q >= 1:
+                result[q] = self.max
+                continue
+            rank = q * (self.count - 1)
+            seen = self.zero_count
+            value = self.max
+            if rank < seen:
+                value = max(self.min, 0.0)
+            else:
+                for key in keys:
+                    seen += self.bins[key]
+                    if rank < seen:
+                        value = min(max(self._value(key), self.min), self.max)
+                        break
+            result[q] = value
+        return result
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """Fold other into this sketch (both must use the same relative accuracy)."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return self
+        bins = self.bins
+        for key, count in other.bins.items():
+            bins[key] = bins.get(key, 0) + count
+        while len(bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "DDSketch":
+        return DDSketch(self.relative_accuracy, self.max_bins).merge(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(key): count for key, count in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], max_bins: int = 2048) -> "DDSketch":
+        sketch = cls(data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY), max_bins)
+        sketch.bins = {int(key): int(count) for key, count in data.get("bins", {}).items()}
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+
+class WindowedSketch:
+    """
+    DDSketch over a sliding time window.
+
+    Observations go into the slice for floor(now / slice_seconds); slices
+    older than max_age are dropped, so window() reflects recent traffic only.
+    total_count / total_sum are cumulative since creation.
+    """
+
+    __slots__ = ("max_age", "slice_seconds", "relative_accuracy", "slices", "total_count", "total_sum")
+
+    def __init__(self, max_age: float = 600.0, age_buckets: int = 5,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.max_age = max_age
+        self.slice_seconds = max_age / age_buckets
+        self.relative_accuracy = relative_accuracy
+        self.slices: Dict[int, DDSketch] = {}
+        self.total_count = 0
+        self.total_sum = 0.0
+
+    def _expire(self, now: float) -> None:
+        oldest = int((now - self.max_age) // self.slice_seconds) + 1
+        for index in [index for index in self.slices if index < oldest]:
+            del self.slices[index]
+
+    def add(self, value: float, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        index = int(now // self.slice_seconds)
+        sketch = self.slices.get(index)
+        if sketch is None:
+            self._expire(now)
+            sketch = self.slices[index] = DDSketch(self.relative_accuracy)
+        sketch.add(value)
+        self.total_count += 1
+        self.total_sum += value
+
+    def window(self, now: Optional[float] = None) -> DDSketch:
+        """Merged sketch of the slices still inside the window."""
+        if now is None:
+            now = time.time()
+        self._expire(now)
+        merged = DDSketch(self.relative_accuracy)
+        for sketch in self.slices.values():
+            merged.merge(sketch)
+        return merged
+
+    def merge(self, other: "WindowedSketch") -> "WindowedSketch":
+        for index, sketch in other.slices.items():
+            mine = self.slices.get(index)
+            if mine is None:
+                self.slices[index] = sketch.copy()
+            else:
+                mine.merge(sketch)
+        self.total_count += other.total_count
+        self.total_sum += other.total_sum
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_age": self.max_age,
+            "slice_seconds": self.slice_seconds,
+            "relative_accuracy": self.relative_accuracy,
+            "slices": {str(index): sketch.to_dict() for index, sketch in self.slices.items()},
+            "total_count": self.total_count,
+            "total_sum": self.total_sum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WindowedSketch":
+        max_age = float(data["max_age"])
+        sketch = cls(max_age, max(1, round(max_age / float(data["slice_seconds"]))),
+                     data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY))
+        sketch.slices = {int(index): DDSketch.from_dict(value) for index, value in data.get("slices", {}).items()}
+        sketch.total_count = int(data.get("total_count", 0))
+        sketch.total_sum = float(data.get("total_sum", 0.0))
+        return sketch
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class SketchFamily:
+    """
+    Windowed sketches keyed by the value of one label (or a single unlabelled
+    series when label is None), rendered as one Prometheus summary.
+
+    Past max_series distinct label values, new values are recorded under
+    "other" so a stream of unique file types cannot grow memory without bound.
+    """
+
+    OVERFLOW_LABEL = "other"
+
+    def __init__(self, name: str, help_text: str, label: Optional[str] = None,
+                 max_age: float = 600.0, age_buckets: int = 5,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_series: int = 500, unit_scale: float = 1.0):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.max_age = max_age
+        self.age_buckets = age_buckets
+        self.relative_accuracy = relative_accuracy
+        self.max_series = max_series
+        # Multiplier applied when exposing (e.g. 0.001 to publish ms as seconds)
+        self.unit_scale = unit_scale
+        self.series: Dict[str, WindowedSketch] = {}
+        self._lock = threading.Lock()
+
+    def _series_for(self, label_value: str) -> WindowedSketch:
+        sketch = self.series.get(label_value)
+        if sketch is None:
+            if len(self.series) >= self.max_series and label_value != self.OVERFLOW_LABEL:
+                return self._series_for(self.OVERFLOW_LABEL)
+            sketch = self.series[label_value] = WindowedSketch(
+                self.max_age, self.age_buckets, self.relative_accuracy
+            )
+        return sketch
+
+    def observe(self, value: float, label_value: str = "", now: Optional[float] = None) -> None:
+        with self._lock:
+            self._series_for(str(label_value)).add(value, now)
+
+    def observe_many(self, values: Dict[str, float], now: Optional[float] = None) -> None:
+        """Record one value per label value under a single lock acquisition."""
+        with self._lock:
+            for label_value, value in values.items():
+                self._series_for(str(label_value)).add(value, now)
+
+    def quantiles(self, qs: Sequence[float] = DEFAULT_QUANTILES,
+                  now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """{label value: {"count", "mean", "p50", ...}} over the current window."""
+        with self._lock:
+            windows = {label_value: sketch.window(now) for label_value, sketch in self.series.items()}
+        result = {}
+        for label_value, window in windows.items():
+            if not window.count:
+                continue
+            entry: Dict[str, Any] = {"count": window.count, "mean": window.mean,
+                                     "min": window.min, "max": window.max}
+            for q, value in window.quantiles(qs).items():
+                entry[f"p{q * 100:g}"] = value
+            result[label_value] = entry
+        return result
+
+    def merge(self, other: "SketchFamily") -> "SketchFamily":
+        with self._lock:
+            for label_value, sketch in other.series.items():
+                self._series_for(label_value).merge(sketch)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "help": self.help_text,
+                "label": self.label,
+                "max_age": self.max_age,
+                "age_buckets": self.age_buckets,
+                "relative_accuracy": self.relative_accuracy,
+                "max_series": self.max_series,
+                "unit_scale": self.unit_scale,
+                "series": {label_value: sketch.to_dict() for label_value, sketch in self.series.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SketchFamily":
+        family = cls(
+            data["name"], data.get("help", ""), data.get("label"),
+            max_age=data.get("max_age", 600.0), age_buckets=data.get("age_buckets", 5),
+            relative_accuracy=data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY),
+            max_series=data.get("max_series", 500), unit_scale=data.get("unit_scale", 1.0),
+        )
+        family.series = {
+            label_value: WindowedSketch.from_dict(sketch) for label_value, sketch in data.get("series", {}).items()
+        }
+        return family
+
+    def render_prometheus(self, qs: Sequence[float] = DEFAULT_QUANTILES, now: Optional[float] = None) -> str:
+        """Prometheus text exposition (version 0.0.4) of this family as a summary."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} summary"]
+        with self._lock:
+            series = [
+                (label_value, sketch.window(now), sketch.total_count, sketch.total_sum)
+                for label_value, sketch in sorted(self.series.items())
+            ]
+        scale = self.unit_scale
+        for label_value, window, total_count, total_sum in series:
+            labels = f'{self.label}="{_escape_label(label_value)}"' if self.label else ""
+            for q, value in window.quantiles(qs).items():
+                quantile_labels = f'{labels},quantile="{q:g}"' if labels else f'quantile="{q:g}"'
+                rendered = "NaN" if value is None else _format_float(value * scale)
+                lines.append(f"{self.name}{{{quantile_labels}}} {rendered}")
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {_format_float(total_sum * scale)}")
+            lines.append(f"{self.name}_count{suffix} {total_count}")
+        return "\n".join(lines) + "\n"
+
+
+def merge_families(snapshots: Iterable[Dict[str, Dict[str, Any]]]) -> Dict[str, SketchFamily]:
+    """
+    Merge per-worker snapshots ({family name: SketchFamily.to_dict()}) into
+    one fleet-wide set of families.
+    """
+    merged: Dict[str, SketchFamily] = {}
+    for snapshot in snapshots:
+        for name, data in snapshot.items():
+            family = SketchFamily.from_dict(data)
+            if name in merged:
+                merged[name].merge(family)
+            else:
+                merged[name] = family
+    return merged
+
+
+def render_families(families: Iterable[SketchFamily], qs: Sequence[float] = DEFAULT_QUANTILES,
+                    now: Optional[float] = None) -> str:
+    """Prometheus text exposition for several families."""
+    return "".join(family.render_prometheus(qs, now) for family in families)
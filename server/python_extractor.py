@@ -18,6 +18,11 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    from extractor.utils.hashing import hash_file
+except ImportError:
+    hash_file = None
+
 try:
     import mutagen
     from mutagen.easyid3 import EasyID3
@@ -181,6 +186,10 @@ def compute_hashes(filepath: str) -> dict:
     """Compute file integrity hashes."""
     result = {}
     try:
+        if hash_file is not None:
+            result.update(hash_file(filepath, ("md5", "sha256", "sha1")))
+            result["file_size_bytes"] = os.path.getsize(filepath)
+            return result
         with open(filepath, 'rb') as f:
             data = f.read()
             result["md5"] = hashlib.md5(data).hexdigest()
@@ -2,7 +2,7 @@
  * Metadata Routes Module
  *
  * Handles metadata-related endpoints:
- * - Search and storage
+ * - Search, facets and storage
  * - History
  * - Favorites
  * - Similar file finding
@@ -112,6 +112,35 @@ export function registerMetadataRoutes(app: Express): void {
     }
   });
 
+  // Faceted search endpoint: one page of hits plus per-facet counts
+  app.get('/api/metadata/facets', async (req, res) => {
+    try {
+      const query =
+        ((req.query.q || req.query.query) as string | undefined) || '';
+      const limit = req.query.limit ? Number(req.query.limit) : 100;
+      const offset = req.query.offset ? Number(req.query.offset) : 0;
+      const args = [
+        'facets',
+        '--query',
+        query,
+        '--limit',
+        String(limit),
+        '--offset',
+        String(offset),
+      ];
+      const facets = req.query.facets
+        ? String(req.query.facets).split(',').filter(Boolean)
+        : [];
+      for (const facet of facets) {
+        args.push('--facet', facet);
+      }
+      const results = await runMetadataDbCli(args);
+      res.json(results);
+    } catch (_error) {
+      res.status(500).json({ error: 'metadata facet search failed' });
+    }
+  });
+
   // History endpoint
   app.get(
     '/api/metadata/history',
@@ -5,3 +5,10 @@ import sys
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+# Keep batch runs from writing the learned cost model into data/
+import tempfile
+os.environ.setdefault(
+    "METAEXTRACT_COST_MODEL_PATH",
+    os.path.join(tempfile.mkdtemp(prefix="metaextract-tests-"), "cost_model.json"),
+)
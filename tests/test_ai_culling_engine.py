@@ -0,0 +1,141 @@
+"""
+Tests for AICullingEngine burst grouping and batch scoring.
+"""
+
+import asyncio
+
+import numpy as np
+
+from server.extractor.modules.ai_culling_engine import (
+    AICullingEngine,
+    FEATURE_COLUMNS,
+    build_feature_matrix,
+)
+from server.extractor.modules.culling_performance import BatchConfig, CullingBatchProcessor
+
+
+def _photo(seconds, phash=None, iso=200):
+    minutes, secs = divmod(seconds, 60)
+    photo = {
+        'filepath': f'/shoot/{seconds}.jpg',
+        'width': 6000,
+        'height': 4000,
+        'exif': {
+            'datetimeoriginal': f'2024:06:01 12:{minutes:02d}:{secs:02d}',
+            'isospeedratings': iso,
+            'fnumber': 2.8,
+            'exposuretime': 0.004,
+            'focusmode': 'AF-S',
+        },
+    }
+    if phash is not None:
+        photo['perceptual_hashes'] = {'phash': phash}
+    return photo
+
+
+def test_feature_matrix_shape_and_missing_values():
+    features = build_feature_matrix([_photo(0), {'exif': {}}])
+
+    assert features.shape == (2, len(FEATURE_COLUMNS))
+    iso_col = FEATURE_COLUMNS.index('iso')
+    assert features[0, iso_col] == 200
+    assert np.isnan(features[1, iso_col])
+
+
+def test_batch_scores_match_single_photo_scores():
+    engine = AICullingEngine()
+    photos = [_photo(i, iso=iso) for i, iso in enumerate([100, 400, 3200, 800])]
+
+    batch = engine.score_features(build_feature_matrix(photos))
+    for row, photo in zip(batch, photos):
+        single = engine._score_photo(photo)
+        assert np.allclose(row, [single.focus_score, single.exposure_score, single.composition_score,
+                                 single.technical_score, single.aesthetic_score,
+                                 single.overall_score, single.confidence])
+    assert batch[0, 1] > batch[2, 1]  # base ISO beats ISO 3200 on exposure
+
+
+def test_analyzer_outputs_override_focus_and_exposure():
+    photo = _photo(0)
+    photo['focus_analysis'] = {'overall_score': 12.5}
+    photo['exposure_analysis'] = {'overall_score': 99.0}
+
+    score = AICullingEngine()._score_photo(photo)
+    assert score.focus_score == 12.5
+    assert score.exposure_score == 99.0
+
+
+def test_time_window_bursts():
+    engine = AICullingEngine()
+    groups = engine._group_similar_photos([_photo(0), _photo(2), _photo(4), _photo(30)])
+
+    assert [len(g.photos) for g in groups] == [3, 1]
+    assert groups[0].similarity_reason == 'time_sequence'
+    assert groups[1].similarity_reason == 'unique_photo'
+
+
+def test_perceptual_hash_links_shots_outside_time_window():
+    engine = AICullingEngine()
+    near = 'ffff0000ffff0000'
+    near_variant = 'ffff0000ffff0003'  # 2 bits away
+    far = '0f0f0f0f0f0f0f0f'
+    photos = [_photo(0, near), _photo(20, near_variant), _photo(40, far)]
+
+    groups = engine._group_similar_photos(photos)
+
+    assert sorted(len(g.photos) for g in groups) == [1, 2]
+    burst = next(g for g in groups if len(g.photos) == 2)
+    assert burst.similarity_reason == 'similar_composition'
+    assert burst.photo_indices == [0, 1]
+
+
+def test_similar_hashes_far_apart_in_time_stay_separate():
+    engine = AICullingEngine({'similarity_window_seconds': 10})
+    groups = engine._group_similar_photos([_photo(0, 'ffff0000ffff0000'), _photo(50, 'ffff0000ffff0000')])
+
+    assert len(groups) == 2
+
+
+def test_streamed_groups_match_batch_analysis():
+    engine = AICullingEngine()
+    photos = [_photo(i * 2 + (i // 5) * 30) for i in range(40)]
+
+    batch = engine.analyze_batch(photos)
+    streamed = list(engine.iter_group_results(photos, chunk_size=7))
+
+    assert [item['group'] for item in streamed] == batch['groups']
+    assert sum(len(item['recommendations']) for item in streamed) == len(batch['recommendations'])
+
+
+def test_batch_processor_groups_across_chunks():
+    photos = [_photo(i * 2) for i in range(30)]
+    config = BatchConfig(batch_size=10, max_workers=3, use_multiprocessing=False, cache_intermediate=False)
+
+    result = asyncio.run(CullingBatchProcessor(config).process_large_batch(photos))
+    expected = AICullingEngine().analyze_batch(photos)
+
+    assert result['success']
+    assert len(result['groups']) == 1
+    assert result['groups'][0]['culling_scores'] == expected['groups'][0]['culling_scores']
+
+
+def test_batch_processor_reuses_one_worker_pool_per_run(monkeypatch):
+    from server.extractor.modules import culling_performance
+
+    pools = []
+
+    class CountingPool(culling_performance.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(culling_performance, "ThreadPoolExecutor", CountingPool)
+    photos = [_photo(i * 2) for i in range(60)]
+    config = BatchConfig(batch_size=20, max_workers=3, use_multiprocessing=False, cache_intermediate=False)
+
+    result = asyncio.run(CullingBatchProcessor(config).process_large_batch(photos))
+
+    assert result['success']
+    assert result['groups'][0]['culling_scores'] == AICullingEngine().analyze_batch(photos)['groups'][0]['culling_scores']
+    assert len(pools) == 1
+    assert pools[0]._shutdown
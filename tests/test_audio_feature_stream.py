@@ -0,0 +1,157 @@
+"""
+Tests for the streaming audio feature engine.
+"""
+
+import hashlib
+import wave
+
+import numpy as np
+import pytest
+
+from server.extractor.modules import audio_feature_stream as afs
+
+
+def _write_wav(path, samples, sr=8000, width=2, channels=1):
+    scale = float(1 << (8 * width - 1)) - 1
+    ints = np.round(np.clip(samples, -1, 1) * scale).astype(np.int32)
+    if channels > 1:
+        ints = np.repeat(ints[:, None], channels, axis=1).ravel()
+    if width == 2:
+        raw = ints.astype("<i2").tobytes()
+    else:
+        raw = ints.astype("<i4").view("u1").reshape(-1, 4)[:, :width].tobytes()
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(sr)
+        w.writeframes(raw)
+
+
+def _tone(freq=440.0, sr=8000, seconds=2.0, amplitude=0.5):
+    t = np.arange(int(sr * seconds)) / sr
+    return amplitude * np.sin(2 * np.pi * freq * t)
+
+
+def test_frames_match_centered_stft_count():
+    y = _tone(seconds=1.0).astype(np.float32)
+    stream = afs.AudioFeatureStream(8000, n_fft=512, hop_length=128)
+    for start in range(0, len(y), 1000):
+        stream.feed(y[start:start + 1000])
+    features = stream.finish()
+
+    assert features.frames == 1 + len(y) // 128
+    assert features.total_samples == len(y)
+    assert np.isclose(features.rms, 0.5 / np.sqrt(2), atol=1e-3)
+
+
+def test_features_do_not_depend_on_block_size():
+    y = (_tone(440) + _tone(1800, amplitude=0.2)).astype(np.float32)
+    results = []
+    for block in (333, 4096, len(y)):
+        stream = afs.AudioFeatureStream(8000, n_fft=512, hop_length=128)
+        for start in range(0, len(y), block):
+            stream.feed(y[start:start + block])
+        results.append(stream.finish())
+
+    base = results[0]
+    for other in results[1:]:
+        assert other.frames == base.frames
+        assert other.zero_crossings == base.zero_crossings
+        assert np.allclose(other.spectrum_sum, base.spectrum_sum, rtol=1e-4)
+        assert np.isclose(other.spectral["centroid"].mean()[0], base.spectral["centroid"].mean()[0])
+
+
+def test_wave_decoder_stats_and_band_energy(tmp_path):
+    path = tmp_path / "tone.wav"
+    y = _tone(440, amplitude=0.995)
+    y[:100] = 0.0
+    _write_wav(path, y, channels=2)
+
+    features = afs.analyze_audio_stream(str(path), n_fft=512, hop_length=128, block_hops=8)
+
+    assert features.decoder in ("wave", "soundfile")
+    assert features.channels == 2
+    assert features.sample_rate == 8000
+    assert np.isclose(features.duration_seconds, 2.0)
+    assert features.clipped_samples > 0
+    assert features.silent_samples >= 100
+    assert np.isclose(features.spectral["centroid"].mean()[0], 440, rtol=0.1)
+    assert features.band_energy(250, 4000) > 10 * features.band_energy(20, 250)
+
+
+def test_24bit_wave_and_decimation(tmp_path, monkeypatch):
+    monkeypatch.setattr(afs, "SOUNDFILE_AVAILABLE", False)
+    path = tmp_path / "hires.wav"
+    _write_wav(path, _tone(300, sr=16000, amplitude=-0.25), sr=16000, width=3)
+
+    features = afs.analyze_audio_stream(str(path), analysis_sr=8000, n_fft=512, hop_length=128)
+
+    assert features.decoder == "wave"
+    assert features.native_sample_rate == 16000
+    assert features.sample_rate == 8000
+    assert features.total_samples == 16000
+    assert np.isclose(features.peak, 0.25, atol=0.01)
+
+
+def test_librosa_features_from_shared_stft(tmp_path):
+    librosa = pytest.importorskip("librosa")
+    sr = 22050
+    clicks = librosa.clicks(times=np.arange(0, 4, 0.5), sr=sr, length=sr * 4)
+    y = clicks * 0.5 + _tone(220, sr=sr, seconds=4, amplitude=0.1)
+    path = tmp_path / "clicks.wav"
+    _write_wav(path, y, sr=sr)
+
+    features = afs.analyze_audio_stream(str(path), block_hops=64)
+    onsets = features.onset_times()
+    tempo, _ = features.beats()
+
+    assert features.mfcc.mean().shape == (13,)
+    assert features.chroma.mean().shape == (12,)
+    assert len(features.onset_envelope) == features.frames
+    assert 5 <= len(onsets) <= 10
+    assert tempo is not None and tempo > 0
+
+
+def test_fingerprint_hashes_match_librosa_chroma(tmp_path):
+    librosa = pytest.importorskip("librosa")
+    from server.extractor.modules import advanced_audio_ultimate as aau
+
+    path = tmp_path / "tone.wav"
+    _write_wav(path, _tone(440, sr=44100), sr=44100)
+
+    result = aau._generate_audio_fingerprint(str(path))
+
+    y, sr = librosa.load(str(path), sr=22050, duration=30)
+    chroma_mean = np.mean(librosa.feature.chroma_stft(y=y, sr=sr), axis=1)
+    assert result["spectral_hash"] == hashlib.md5(chroma_mean.tobytes()).hexdigest()
+    assert result["duration_hash"] == hashlib.md5(str(len(y) / sr).encode()).hexdigest()[:8]
+    assert result["fingerprint_available"] is True
+
+
+def test_mel_features_match_librosa_s_only_definitions(tmp_path):
+    librosa = pytest.importorskip("librosa")
+    from server.extractor.modules import advanced_audio_ultimate as aau
+
+    sr = 44100
+    y = (_tone(440, sr=sr) + 0.5 * _tone(3000, sr=sr)).astype(np.float32)
+    path = tmp_path / "two_tones.wav"
+    _write_wav(path, y, sr=sr)
+
+    result = aau._analyze_psychoacoustics(str(path))["perceptual_features"]
+
+    y, _ = librosa.load(str(path), sr=None)
+    mel = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=128)
+    assert result["mel_spectral_centroid"] == pytest.approx(
+        np.mean(librosa.feature.spectral_centroid(S=mel)[0]), rel=1e-5)
+    assert result["mel_spectral_rolloff"] == pytest.approx(
+        np.mean(librosa.feature.spectral_rolloff(S=mel)[0]), rel=1e-5)
+    assert result["mel_spectral_flatness"] == pytest.approx(
+        np.mean(librosa.feature.spectral_flatness(S=mel)[0]), rel=1e-4)
+
+
+def test_unreadable_file_returns_none(tmp_path):
+    path = tmp_path / "broken.wav"
+    path.write_bytes(b"RIFF not really audio")
+
+    assert afs.analyze_audio_stream(str(path)) is None
+    assert afs.analyze_audio_stream(str(tmp_path / "missing.wav")) is None
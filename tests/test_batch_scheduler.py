@@ -0,0 +1,126 @@
+"""
+Tests for the cost-model-driven batch scheduler.
+"""
+
+import threading
+import time
+
+from server.extractor import advanced_optimizations
+from server.extractor.advanced_optimizations import BatchScheduler, CostModel
+
+MB = 1024 * 1024
+
+
+def _touch(tmp_path, name, size):
+    path = tmp_path / name
+    with open(path, "wb") as handle:
+        handle.truncate(size)
+    return str(path)
+
+
+def test_cost_model_learns_per_format_and_tier():
+    model = CostModel()
+    for size_mb in (1, 2, 4, 8):
+        model.record_extraction(".mp4", size_mb * MB, 0.5 + 0.25 * size_mb, tier="super")
+        model.record_extraction(".mp4", size_mb * MB, 0.1 + 0.05 * size_mb, tier="free")
+
+    assert abs(model.predict_time(".mp4", 100 * MB, "super") - 25.5) < 0.01
+    assert abs(model.predict_time(".mp4", 100 * MB, "free") - 5.1) < 0.01
+    coefficients = model.get_model(".mp4")["tiers"]["super"]
+    assert abs(coefficients["seconds_per_mb"] - 0.25) < 1e-6
+    # Unseen formats fall back to the size/complexity prior
+    assert model.predict_time(".xyz", 10 * MB, "free") > 0
+
+
+def test_plan_orders_longest_first_and_packs_small_files(tmp_path):
+    model = CostModel()
+    for _ in range(3):
+        model.record_extraction(".jpg", 0, 0.01)
+        model.record_extraction(".mp4", 0, 5.0)
+    paths = [_touch(tmp_path, f"img{i}.jpg", 0) for i in range(40)]
+    paths.insert(20, _touch(tmp_path, "clip.mp4", 0))
+
+    units = BatchScheduler(model, max_workers=2).plan(paths)
+
+    assert [item.path for item in units[0].files] == [paths[20]]
+    packed = units[1:]
+    assert sum(len(unit.files) for unit in packed) == 40
+    assert len(packed) < 40
+    assert [unit.predicted_seconds for unit in units] == sorted((unit.predicted_seconds for unit in units), reverse=True)
+
+
+def test_heavy_jobs_respect_memory_budget(tmp_path):
+    model = CostModel()
+    paths = [_touch(tmp_path, f"scan{i}.tif", 150 * MB) for i in range(4)]
+    paths += [_touch(tmp_path, f"note{i}.txt", 10) for i in range(8)]
+    running = {"heavy": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def process(path):
+        heavy = path.endswith(".tif")
+        if heavy:
+            with lock:
+                running["heavy"] += 1
+                running["peak"] = max(running["peak"], running["heavy"])
+        time.sleep(0.02)
+        if heavy:
+            with lock:
+                running["heavy"] -= 1
+        return path
+
+    # Each .tif is estimated at ~332 MB; the budget fits one at a time
+    scheduler = BatchScheduler(model, max_workers=4, memory_budget_bytes=500 * MB)
+    results, report = scheduler.run(paths, process)
+
+    assert results == paths
+    assert running["peak"] == 1
+    assert report["peak_heavy_memory_bytes"] <= 500 * MB
+
+
+def test_run_reports_prediction_error_and_feeds_the_model(tmp_path):
+    model = CostModel()
+    paths = [_touch(tmp_path, f"doc{i}.pdf", 1000) for i in range(6)]
+    paths.append(_touch(tmp_path, "broken.pdf", 1000))
+
+    def process(path):
+        time.sleep(0.01)
+        return {"error": "bad"} if "broken" in path else {"ok": path}
+
+    results, report = BatchScheduler(model, max_workers=3).run(
+        paths, process, tier="free", succeeded=lambda result: "error" not in result
+    )
+
+    assert results[-1] == {"error": "bad"}
+    assert report["files"] == 7
+    assert report["count"] == 6
+    assert report["by_format"][".pdf"]["count"] == 6
+    assert report["actual_seconds"] > 0
+    assert report["mean_absolute_percentage_error"] >= 0
+    assert model.get_model(".pdf")["tiers"]["free"]["observations"] == 6
+    # After learning, predictions sit close to the observed ~10 ms
+    assert model.predict_time(".pdf", 1000, "free") < 0.05
+
+
+def test_cost_model_persists_between_processes(tmp_path, monkeypatch):
+    model = CostModel()
+    for size_mb in (1, 2, 4):
+        model.record_extraction(".mov", size_mb * MB, 0.2 + 0.1 * size_mb, tier="premium",
+                                module_times={"video": 0.1 * size_mb})
+    path = tmp_path / "cost_model.json"
+    model.save(path)
+
+    loaded = CostModel.load(path)
+    assert loaded.predict_time(".mov", 10 * MB, "premium") == model.predict_time(".mov", 10 * MB, "premium")
+    assert loaded.get_model(".mov") == model.get_model(".mov")
+
+    # The shared model starts from the saved state and writes back to it
+    monkeypatch.setenv(advanced_optimizations.COST_MODEL_PATH_ENV, str(path))
+    monkeypatch.setattr(advanced_optimizations, "_cost_model", None)
+    shared = advanced_optimizations.get_cost_model()
+    assert shared.get_model(".mov")["tiers"]["premium"]["observations"] == 3
+    shared.record_extraction(".mov", MB, 0.3, tier="premium")
+    assert advanced_optimizations.save_cost_model()
+    assert CostModel.load(path).get_model(".mov")["tiers"]["premium"]["observations"] == 4
+
+    path.write_text("not json")
+    assert CostModel.load(path) is None
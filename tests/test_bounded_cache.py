@@ -0,0 +1,128 @@
+"""
+Tests for the bounded, memory-accounted cache primitive and its adopters.
+"""
+
+import sys
+from enum import Enum
+from types import SimpleNamespace
+
+from server.extractor.advanced_optimizations import AdaptiveChunkSizer
+from server.extractor.context_engine.detector import ContextDetector
+from server.extractor.formats import segment_directory
+from server.extractor.modules.geocoding import GeocodeCache
+from server.extractor.monitoring import MAX_ERROR_TYPES, ExtractionMetrics
+from server.extractor.utils import bounded_cache
+from server.extractor.utils.bounded_cache import (
+    BoundedCache,
+    SampleBuffer,
+    attach_memory_monitor,
+    estimate_size,
+    get_cache_metrics,
+    shed_all,
+)
+
+
+def test_entry_and_byte_budgets_evict_lru():
+    cache = BoundedCache("test_lru", max_entries=3, max_bytes=250, sizeof=lambda v: len(v))
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 100)
+    assert cache.get("a") == b"x" * 100  # a is now most recent
+    cache.put("c", b"x" * 100)  # over 250 bytes: b goes
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.size_bytes == 200
+    assert not cache.put("huge", b"x" * 300)
+    metrics = cache.get_metrics()
+    assert metrics["evictions"] == 1 and metrics["rejected"] == 1
+    assert metrics["hits"] == 1 and metrics["bytes"] == 200
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(bounded_cache.time, "monotonic", lambda: now[0])
+    cache = BoundedCache("test_ttl", ttl_seconds=10)
+    cache.put("k", 1)
+    now[0] += 5
+    assert cache.get("k") == 1
+    now[0] += 6
+    assert cache.get("k") is None
+    assert cache.stats["expirations"] == 1 and len(cache) == 0
+
+
+class _FakeMonitor:
+    def __init__(self):
+        self.callbacks = {}
+
+    def register_pressure_callback(self, level, callback):
+        self.callbacks[level.name] = callback
+
+
+def test_pressure_sheds_registered_caches(monkeypatch):
+    cache = BoundedCache("test_pressure", max_entries=100)
+    for i in range(8):
+        cache.put(i, i)
+    samples = SampleBuffer("test_samples", maxlen=10)
+    samples.extend(range(10))
+
+    assert shed_all(0.25)["test_pressure"] == 2
+    assert cache.keys() == list(range(2, 8))
+    assert list(samples)[0] == 2
+
+    # Without psutil the monitor cannot be created; a given monitor is still used
+    monitor = _FakeMonitor()
+    monitor_module = SimpleNamespace(
+        PressureLevel=Enum("PressureLevel", "NORMAL ELEVATED HIGH CRITICAL"),
+        get_global_monitor=lambda: monitor,
+    )
+    monkeypatch.setitem(sys.modules, "server.extractor.utils.memory_pressure", monitor_module)
+    assert attach_memory_monitor(monitor)
+    assert set(monitor.callbacks) == {"ELEVATED", "HIGH", "CRITICAL"}
+    monitor.callbacks["CRITICAL"](SimpleNamespace(system_percent=97.0))
+    assert len(cache) == 0 and len(samples) == 0
+
+    metrics = get_cache_metrics()
+    assert metrics["test_pressure"]["pressure_evictions"] == 8
+    assert "test_samples" not in get_cache_metrics(include_buffers=False)
+
+
+def test_estimate_size_follows_nested_payloads():
+    small = estimate_size({"a": "x"})
+    big = estimate_size({"a": "x" * 10000, "b": [b"y" * 5000]})
+    assert big - small >= 15000
+
+
+def test_adopters_use_bounded_caches(tmp_path):
+    assert isinstance(segment_directory._directory_cache, BoundedCache)
+
+    detector = ContextDetector()
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(b"\xff\xd8\xff\xd9")
+    first = detector.detect(str(path), {"exif": {"Make": "Canon"}})
+    assert detector.detect(str(path), {"exif": {"Make": "Canon"}}) is first
+    assert detector._cache.stats["hits"] == 1
+
+    metrics = ExtractionMetrics(max_samples=5)
+    for i in range(MAX_ERROR_TYPES + 10):
+        metrics.record_extraction(float(i), False, "free", "image/jpeg", f"Error {i}")
+    assert len(metrics.extraction_times) == 5
+    assert len(metrics.error_counts) == MAX_ERROR_TYPES + 1
+    assert metrics.error_counts["other"] == 10
+
+
+def test_geocode_and_chunk_caches_are_bounded(tmp_path):
+    geocache = GeocodeCache(str(tmp_path), max_entries=2)
+    for lat in (1.0, 2.0, 3.0):
+        geocache.set(lat, 0.0, {"city": str(lat)})
+    assert geocache.get(1.0, 0.0) is None
+    assert geocache.get(2.0, 0.0) == {"city": "2.0"}
+
+    reloaded = GeocodeCache(str(tmp_path), max_entries=2)
+    assert reloaded.get(3.0, 0.0) == {"city": "3.0"}
+    assert len(reloaded._cache) == 2
+
+    sizer = AdaptiveChunkSizer()
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 1024)
+    assert sizer.analyze_file(str(path)) is sizer.analyze_file(str(path))
+    assert isinstance(sizer.file_analysis_cache, BoundedCache)
+    assert sizer.file_analysis_cache.stats["hits"] == 1
@@ -0,0 +1,146 @@
+"""
+Tests for the columnar MetadataComparator batch engine.
+"""
+
+import random
+
+import pytest
+
+from server.extractor.modules.comparison import FieldMatrix, MetadataComparator
+
+
+def _metadata(i, make="Canon", iso=200, software="Lightroom 5"):
+    return {
+        "file": {"name": f"IMG_{i:04d}.jpg", "extension": "jpg"},
+        "filesystem": {"size_human": "2 MB", "modified": f"2024-01-{i % 28 + 1:02d}"},
+        "exif": {
+            "Make": make,
+            "Model": f"{make} R5",
+            "ISO": iso,
+            "FNumber": 2.8,
+            "Software": software,
+            "DateTime": f"2024:01:{i % 28 + 1:02d} 10:00:00",
+        },
+    }
+
+
+def _mixed_batch(count, seed=7):
+    rng = random.Random(seed)
+    files = []
+    for i in range(count):
+        meta = _metadata(
+            i,
+            make=rng.choice(["Canon", "Nikon", "Sony"]),
+            iso=rng.choice([100, 200, 3200]),
+            software=rng.choice(["Lightroom 5", "Photoshop", "GIMP 2.10"]),
+        )
+        if rng.random() < 0.4:
+            meta["gps"] = {"latitude": rng.random(), "longitude": 1.0}
+        if rng.random() < 0.2:
+            del meta["exif"]["Software"]
+        files.append(meta)
+    return files
+
+
+def test_pairwise_scores_match_two_file_similarity():
+    comparator = MetadataComparator()
+    files = _mixed_batch(12)
+
+    analysis = comparator.compare_files(files, "detailed")["similarity_analysis"]
+
+    assert analysis["sampled"] is False
+    assert len(analysis["pairwise_similarities"]) == 12 * 11 // 2
+    for pair in analysis["pairwise_similarities"]:
+        expected = comparator._calculate_two_file_similarity(
+            files[pair["file1_index"]], files[pair["file2_index"]]
+        )
+        assert pair["similarity_score"] == pytest.approx(expected)
+
+
+def test_field_consistency_and_numeric_summary():
+    files = [_metadata(i, iso=iso) for i, iso in enumerate([100, 100, 400])]
+
+    result = MetadataComparator().compare_files(files, "detailed")
+    iso = result["field_comparisons"]["camera_settings"]["field_differences"]["ISO"]
+
+    assert iso["all_same"] is False
+    assert sorted(iso["unique_values"]) == ["100", "400"]
+    assert iso["similarity_score"] == pytest.approx(0.5)
+    assert iso["numeric_summary"]["max"] == 400.0
+    assert result["field_comparisons"]["camera_settings"]["field_differences"]["Make"]["all_same"]
+
+
+def test_summary_mode_caps_difference_listings():
+    comparator = MetadataComparator()
+    comparator.summary_difference_limit = 5
+    files = [_metadata(i) for i in range(20)]
+
+    result = comparator.compare_files(files, "summary")
+    names = result["field_comparisons"]["file_info"]["field_differences"]["name"]
+
+    assert len(names["differences"]) == 5
+    assert names["differences_total"] == 20
+
+
+def test_matrix_take_shares_values():
+    comparator = MetadataComparator()
+    files = _mixed_batch(10)
+    matrix = comparator._build_matrix(files)
+
+    subset = matrix.take([1, 3, 5])
+
+    assert subset.n_rows == 3
+    fid = subset.field_id("exif_data", "Make")
+    assert [subset.values[fid][c] for c in subset.codes[fid]] == [files[i]["exif"]["Make"] for i in (1, 3, 5)]
+    assert isinstance(subset, FieldMatrix)
+
+
+def test_batch_compare_outliers_patterns_and_field_outliers():
+    files = [_metadata(i) for i in range(9)]
+    odd = _metadata(9, make="Nikon", iso=6400, software="GIMP 2.10")
+    odd["exif"]["FNumber"] = 16
+    files.append(odd)
+
+    result = MetadataComparator().batch_compare(files)
+
+    assert [o["file_index"] for o in result["outliers"]] == [9]
+    assert result["patterns"]["camera_patterns"]["distribution"] == {"Canon Canon R5": 9, "Nikon Nikon R5": 1}
+    assert result["patterns"]["temporal_patterns"]["total_dates"] == 10
+    assert result["field_outliers"]["camera_settings.ISO"]["file_indices"] == [9]
+    assert set(result["groups"]) == {"Canon Canon R5"}
+
+
+def test_large_batches_are_sampled_and_estimated():
+    comparator = MetadataComparator()
+    comparator.exact_pair_limit = 100
+    comparator.sampled_pairs = 400
+    files = _mixed_batch(60)
+
+    analysis = comparator.compare_files(files, "summary")["similarity_analysis"]
+    outliers = comparator._identify_outliers(files)
+
+    assert analysis["sampled"] is True
+    assert analysis["pairs_evaluated"] == 400
+    assert analysis["pairwise_similarities"] == []
+    assert 0.0 < analysis["overall_similarity"] < 1.0
+    assert all(o["method"] == "frequency_estimate" for o in outliers)
+
+
+def test_columnar_patterns_keep_per_file_labels():
+    files = [
+        {"exif": {"Make": "Canon", "Model": None, "Software": None,
+                  "DateTime": "", "DateTimeOriginal": "2024:01:02"}},
+        {"exif": {"Make": "Canon", "Software": "GIMP", "DateTime": "2024:01:01"}},
+        {"exif": {"Model": "X100", "DateTime": None, "DateTimeOriginal": "2023:05:05"}},
+        {"exif": {"Make": "Canon", "Model": "R5"}},
+        {"gps": {"lat": 1.0}},
+    ]
+    comparator = MetadataComparator()
+
+    columnar = comparator._detect_patterns(files, comparator._build_matrix(files))
+
+    assert columnar == comparator._detect_patterns(files)
+    assert list(columnar["camera_patterns"]["distribution"]) == [
+        "Canon None", "Canon Unknown", "Unknown X100", "Canon R5"]
+    assert columnar["software_patterns"]["distribution"] == {None: 1, "GIMP": 1, "Unknown": 2}
+    assert columnar["temporal_patterns"]["earliest"] == "2023:05:05"
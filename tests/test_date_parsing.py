@@ -0,0 +1,79 @@
+"""
+Tests for the shared timestamp parser and its adopters.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from server.extractor.modules.timeline import TimelineReconstructor
+from server.extractor.utils.date_parsing import TimestampParser, parse_timestamp, timestamp_to_epoch
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2024:05:01 10:20:30", datetime(2024, 5, 1, 10, 20, 30)),
+    ("2024-05-01", datetime(2024, 5, 1)),
+    ("2024-05-01T10:20:30.5Z", datetime(2024, 5, 1, 10, 20, 30, 500000, tzinfo=timezone.utc)),
+    ("2024-05-01T10:20:30.123456789+02:00",
+     datetime(2024, 5, 1, 10, 20, 30, 123456, tzinfo=timezone(timedelta(hours=2)))),
+    ("20240501T102030Z", datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone.utc)),
+    ("Wed May  1 10:20:30 2024", datetime(2024, 5, 1, 10, 20, 30)),
+    ("D:20240501102030-05'30'", datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone(-timedelta(hours=5, minutes=30)))),
+    ("D:2024", datetime(2024, 1, 1)),
+    ("Wed, 01 May 2024 10:20:30 +0200", datetime(2024, 5, 1, 10, 20, 30, tzinfo=timezone(timedelta(hours=2)))),
+    ("1 May 2024 10:20 EST", datetime(2024, 5, 1, 10, 20, tzinfo=timezone(timedelta(hours=-5)))),
+    ("05/01/2024 10:20:30", datetime(2024, 5, 1, 10, 20, 30)),
+    ("25/01/2024 10:20:30", datetime(2024, 1, 25, 10, 20, 30)),
+])
+def test_recognised_shapes(text, expected):
+    assert TimestampParser().parse(text) == expected
+
+
+def test_invalid_values_return_none():
+    parser = TimestampParser()
+    for text in ("", "garbage", "0000:00:00 00:00:00", "2024-13-01", "10:20:30", None):
+        assert parser.parse(text) is None
+    assert parser.parse("2024.05.01 10:20", loose=True) == datetime(2024, 5, 1, 10, 20)
+
+
+def test_timezone_modes_are_consistent():
+    parser = TimestampParser()
+    assert parser.parse("2024-05-01T10:00:00+02:00", tz="utc") == datetime(2024, 5, 1, 8, tzinfo=timezone.utc)
+    assert parser.parse("2024-05-01T10:00:00+02:00", tz="wall") == datetime(2024, 5, 1, 10)
+    assert parser.parse("2024:05:01 10:00:00", tz="utc") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    assert timestamp_to_epoch("2024-05-01T00:00:00+01:00") == timestamp_to_epoch("2024:04:30 23:00:00")
+    with pytest.raises(ValueError):
+        parser.parse("2024-05-01", tz="local")
+
+
+def test_remembers_format_and_day_order_per_source():
+    parser = TimestampParser()
+    parser.parse("D:20240501102030Z", "pdf.CreationDate")
+    assert parser.remembered_formats() == {"pdf.CreationDate": "pdf"}
+
+    # An unambiguous day-first value teaches the source its order
+    assert parser.parse("03/02/2024", "csv.date") == datetime(2024, 3, 2)  # month-first default
+    parser.parse("25/12/2024", "csv.date")
+    assert parser.parse("03/02/2024", "csv.date") == datetime(2024, 2, 3)
+    assert parser.parse("03/02/2024", "us.date") == datetime(2024, 3, 2)
+
+
+def test_parse_many_dedupes_and_accepts_per_value_sources():
+    parser = TimestampParser()
+    values = ["2024:05:01 10:20:30"] * 3 + [b"2024-05-02", None, datetime(2024, 5, 3)]
+    parsed = parser.parse_many(values, ["exif.DateTime"] * 3 + ["xmp.CreateDate", "x", "y"])
+    assert parsed == [datetime(2024, 5, 1, 10, 20, 30)] * 3 + [datetime(2024, 5, 2), None, datetime(2024, 5, 3)]
+    with pytest.raises(ValueError):
+        parser.parse_many(["2024-05-01"], ["a", "b"])
+
+
+def test_timeline_orders_mixed_formats_as_wall_clock():
+    reconstructor = TimelineReconstructor()
+    metadata = [
+        {"file": {"name": "a.jpg"}, "exif": {"DateTimeOriginal": "2024:05:01 10:20:30"}},
+        {"file": {"name": "b.mp4"}, "video": {"creation_time": "2024-05-01T09:00:00.000000Z"}},
+    ]
+    result = reconstructor.reconstruct_timeline(metadata, "simple")
+    assert [event["file_identifier"] for event in result["events"]] == ["b.mp4", "a.jpg"]
+    assert all(event["parsed_datetime"].tzinfo is None for event in result["events"])
+    assert parse_timestamp("2024-05-01T09:00:00Z", tz="wall") == result["events"][0]["parsed_datetime"]
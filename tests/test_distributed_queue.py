@@ -0,0 +1,107 @@
+"""
+Tests for the durable task store and process-based DistributedCoordinator.
+"""
+
+import asyncio
+import os
+import signal
+import time
+
+from server.extractor.distributed_processing import DistributedCoordinator, DistributedResult, DistributedTask
+from server.extractor.distributed_queue import DEAD, DONE, SQLiteTaskStore, TaskWorker, content_hash
+
+
+def _files(tmp_path, contents):
+    paths = []
+    for i, data in enumerate(contents):
+        path = tmp_path / f"file_{i}.bin"
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+
+def test_expired_lease_is_redelivered_and_commit_is_idempotent(tmp_path):
+    store = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+    path, = _files(tmp_path, [b"payload"])
+    store.enqueue(DistributedTask(task_id="t1", file_path=path))
+    store.enqueue(DistributedTask(task_id="t1", file_path=path))  # no-op
+
+    stale = store.lease("w1", lease_seconds=0.05)
+    assert stale.attempt == 1 and store.lease("w2") is None
+    time.sleep(0.1)
+    fresh = store.lease("w2", lease_seconds=30)
+    assert fresh.task.task_id == "t1" and fresh.attempt == 2
+    assert not store.heartbeat(stale) and store.heartbeat(fresh)
+
+    file_hash = content_hash(path)
+    first = DistributedResult(task_id="t1", worker_id="w2", success=True, metadata={"n": 1})
+    second = DistributedResult(task_id="t1", worker_id="w1", success=True, metadata={"n": 2})
+    assert store.complete(fresh, file_hash, first)
+    assert not store.complete(stale, file_hash, second)
+    assert store.task_states(["t1"]) == {"t1": DONE}
+    assert store.results_for(["t1"])["t1"].metadata == {"n": 1}
+
+
+def test_retries_end_in_dead_letter_queue(tmp_path):
+    store = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+    bad, good = _files(tmp_path, [b"bad", b"good"])
+    store.enqueue(DistributedTask(task_id="bad", file_path=bad, max_retries=1))
+    store.enqueue(DistributedTask(task_id="good", file_path=good))
+
+    def extract(path):
+        if path == bad:
+            raise ValueError("corrupt header")
+        return {"size": os.path.getsize(path)}
+
+    TaskWorker(store, extract, "w1", poll_interval=0.01).run(idle_exit_seconds=0.05)
+
+    assert store.task_states(["bad", "good"]) == {"bad": DEAD, "good": DONE}
+    letter, = store.dead_letters()
+    assert letter["task_id"] == "bad" and letter["attempts"] == 2
+    assert letter["last_error"] == "ValueError: corrupt header"
+    assert store.worker_heartbeats()["w1"]["tasks_failed"] == 2
+
+
+def _crashing_extract(path):
+    # The first worker to pick up crash.bin dies mid-task
+    marker = path + ".crashed"
+    if path.endswith("crash.bin") and not os.path.exists(marker):
+        open(marker, "w").close()
+        os.kill(os.getpid(), signal.SIGKILL)
+    time.sleep(0.05)
+    return {"path": path, "pid": os.getpid()}
+
+
+def test_worker_processes_survive_killed_workers(tmp_path):
+    store = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+    paths = _files(tmp_path, [b"same"] * 2 + [b"file %d" % i for i in range(14)])
+    crash = tmp_path / "crash.bin"
+    crash.write_bytes(b"crash")
+    paths.append(str(crash))
+
+    coordinator = DistributedCoordinator(num_workers=3, task_store=store, lease_seconds=1.0)
+
+    async def run():
+        await coordinator.add_tasks_batch(paths)
+        processing = asyncio.ensure_future(coordinator.process_tasks(_crashing_extract))
+        # Kill another worker from outside once the batch is under way
+        await asyncio.sleep(0.3)
+        victim = next(w for w in coordinator.workers.values() if w.port and w.port != os.getpid())
+        try:
+            os.kill(victim.port, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        return await processing
+
+    results, metrics = asyncio.run(run())
+
+    assert metrics.completed_tasks == len(paths) and metrics.successful_tasks == len(paths)
+    assert all(r.success for r in results)
+    assert store.dead_letters() == []
+    # Duplicate content is committed once and shared by both tasks
+    committed = store._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    assert committed == len(paths) - 1
+    attempts = dict(store._conn().execute("SELECT file_path, attempts FROM tasks"))
+    assert attempts[str(crash)] >= 2
+    offline = [w for w in coordinator.workers.values() if w.status.value == "offline"]
+    assert len(offline) >= 2
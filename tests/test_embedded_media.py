@@ -0,0 +1,159 @@
+"""
+Tests for trailer-seeking embedded media location and motion photo detection.
+"""
+
+import hashlib
+import struct
+
+from server.extractor.modules.embedded_media import locate_embedded_media
+from server.extractor.modules.motion_photo import detect_motion_photo
+from server.extractor.modules.xmp_packets import clear_xmp_cache
+
+MOTION_XMP = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about=""
+    xmlns:GCamera="http://ns.google.com/photos/1.0/camera/"
+    xmlns:Container="http://ns.google.com/photos/1.0/container/"
+    xmlns:Item="http://ns.google.com/photos/1.0/container/item/"
+    GCamera:MotionPhoto="1"
+    GCamera:MotionPhotoVersion="1"
+    GCamera:MotionPhotoPresentationTimestampUs="1250000">
+   <Container:Directory><rdf:Seq>
+    <rdf:li rdf:parseType="Resource"><Container:Item Item:Mime="image/jpeg" Item:Semantic="Primary" Item:Length="0" Item:Padding="{pad}"/></rdf:li>
+    <rdf:li rdf:parseType="Resource"><Container:Item Item:Mime="image/jpeg" Item:Semantic="GainMap" Item:Length="{gain}"/></rdf:li>
+    <rdf:li rdf:parseType="Resource"><Container:Item Item:Mime="video/mp4" Item:Semantic="MotionPhoto" Item:Length="{video}"/></rdf:li>
+   </rdf:Seq></Container:Directory>
+  </rdf:Description>
+ </rdf:RDF>
+</x:xmpmeta>"""
+
+MICRO_XMP = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about="" xmlns:GCamera="http://ns.google.com/photos/1.0/camera/"
+    GCamera:MicroVideo="1" GCamera:MicroVideoVersion="1" GCamera:MicroVideoOffset="{video}"/>
+ </rdf:RDF>
+</x:xmpmeta>"""
+
+
+def _segment(marker, payload):
+    return bytes([0xFF, marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _primary(xmp=None, extra=b""):
+    data = b"\xff\xd8"
+    if xmp is not None:
+        data += _segment(0xE1, b"http://ns.adobe.com/xap/1.0/\x00" + xmp.encode())
+    data += extra
+    return data + _segment(0xDA, b"\x01\x01\x00\x00\x3f\x00") + b"\x11" * 3000 + b"\xff\xd9"
+
+
+def _mp4(size):
+    return struct.pack(">I", 24) + b"ftypisom" + b"\x00" * 12 + b"\x42" * (size - 24)
+
+
+def test_container_directory_ranges_from_file_end(tmp_path):
+    gain = _primary()
+    video = _mp4(5000)
+    xmp = MOTION_XMP.format(pad=2, gain=len(gain), video=len(video))
+    primary = _primary(xmp)
+    path = tmp_path / "PXL_0001.MP.jpg"
+    path.write_bytes(primary + b"\x00\x00" + gain + video)
+    clear_xmp_cache()
+
+    media = locate_embedded_media(str(path))
+
+    assert [(m.kind, m.source, m.verified) for m in media] == [
+        ("gain_map", "xmp_container", True), ("video", "xmp_container", True)]
+    gain_item, video_item = media.items
+    assert gain_item.offset == len(primary) + 2
+    assert video_item.offset == len(primary) + 2 + len(gain)
+    assert media.hints["primary_length"] == len(primary)
+    with video_item.open() as reader:
+        assert reader.head(12)[4:8] == b"ftyp"
+        assert reader.read() == video[12:]
+        assert reader.sha256(block_size=999) == hashlib.sha256(video).hexdigest()
+
+    result = detect_motion_photo(str(path))
+    assert result["is_motion_photo"]
+    assert result["photo_type"] == "Google Motion Photo"
+    assert result["video_offset"] == video_item.offset
+    assert result["video_size"] == len(video)
+    assert result["motion_data"]["presentation_timestamp_us"] == 1250000
+
+
+def test_legacy_micro_video_offset(tmp_path):
+    video = _mp4(3000)
+    path = tmp_path / "MVIMG_0001.jpg"
+    path.write_bytes(_primary(MICRO_XMP.format(video=len(video))) + video)
+    clear_xmp_cache()
+
+    result = detect_motion_photo(str(path))
+
+    assert result["motion_data"]["format"] == "MicroVideo"
+    assert result["video_source"] == "micro_video_offset"
+    assert result["video_offset"] == path.stat().st_size - len(video)
+    assert result["video_verified"]
+
+
+def _seft_trailer(blocks, base):
+    """Samsung trailer: data blocks, then SEFH directory, length and SEFT"""
+    body = b""
+    positions = []
+    for entry_type, name, payload in blocks:
+        positions.append(len(body))
+        body += struct.pack("<HHI", 0, entry_type, len(name)) + name + payload
+    directory = b"SEFH" + struct.pack("<II", 107, len(blocks))
+    for (entry_type, name, payload), pos in zip(blocks, positions):
+        directory += struct.pack("<HHII", 0, entry_type, len(body) - pos, 8 + len(name) + len(payload))
+    return body + directory + struct.pack("<I", len(directory)) + b"SEFT"
+
+
+def test_samsung_seft_trailer(tmp_path):
+    video = _mp4(4000)
+    depth = b"\x07" * 300
+    primary = _primary()
+    path = tmp_path / "20240101_120000.jpg"
+    path.write_bytes(primary + _seft_trailer(
+        [(0x0A30, b"MotionPhoto_Data", video), (0x0B41, b"DualShot_DepthMap_1", depth)], len(primary)))
+    clear_xmp_cache()
+
+    media = locate_embedded_media(str(path))
+    assert {m.name: (m.kind, m.length) for m in media} == {
+        "MotionPhoto_Data": ("video", len(video)),
+        "DualShot_DepthMap_1": ("depth_map", len(depth)),
+    }
+    assert media.first("video").offset == len(primary) + 8 + len(b"MotionPhoto_Data")
+
+    result = detect_motion_photo(str(path))
+    assert result["photo_type"] == "Samsung Motion Photo"
+    assert result["video_size"] == len(video) and result["video_verified"]
+    assert result["motion_data"]["seft_blocks"] == ["MotionPhoto_Data", "DualShot_DepthMap_1"]
+
+
+def test_mpf_secondary_image_and_heic_mpvd(tmp_path):
+    gain = _primary()
+    # MPF index: two MP entries, the second pointing at the appended JPEG
+    entries_offset = 8 + 2 + 12 + 4
+    mpf_len = 4 + entries_offset + 32
+    primary_len = len(_primary(extra=_segment(0xE2, b"\x00" * mpf_len)))
+    tiff_start = 2 + 4 + 4
+    entries = (struct.pack("<III", 0x20030000, primary_len, 0) + b"\x00" * 4
+               + struct.pack("<III", 0x000000, len(gain), primary_len - tiff_start) + b"\x00" * 4)
+    mpf = (b"MPF\x00" + b"II*\x00" + struct.pack("<I", 8) + struct.pack("<H", 1)
+           + struct.pack("<HHII", 0xB002, 7, 32, entries_offset) + b"\x00" * 4 + entries)
+    path = tmp_path / "ultrahdr.jpg"
+    path.write_bytes(_primary(extra=_segment(0xE2, mpf)) + gain)
+    clear_xmp_cache()
+
+    media = locate_embedded_media(str(path))
+    assert [(m.source, m.offset, m.length, m.verified) for m in media] == [
+        ("mpf", primary_len, len(gain), True)]
+
+    video = _mp4(2000)
+    heic = tmp_path / "motion.heic"
+    heic.write_bytes(struct.pack(">I", 16) + b"ftypheic" + b"\x00" * 4
+                     + struct.pack(">I", 20) + b"meta" + b"\x00" * 12
+                     + struct.pack(">I", 8 + len(video)) + b"mpvd" + video)
+    result = detect_motion_photo(str(heic))
+    assert result["photo_type"] == "Samsung Motion Photo"
+    assert result["video_offset"] == 44 and result["video_size"] == len(video)
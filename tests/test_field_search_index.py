@@ -0,0 +1,86 @@
+"""
+Tests for the trigram/token search index behind the unified field registry.
+"""
+
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor" / "modules"))
+
+from field_definitions import FieldDefinition, FieldSource, FieldType  # noqa: E402
+from unified_field_registry import FieldRegistryCore  # noqa: E402
+
+
+def _field(name, description=""):
+    return FieldDefinition(name=name, field_type=FieldType.STRING, source=FieldSource.EXIF,
+                           description=description)
+
+
+@pytest.fixture
+def registry():
+    registry = FieldRegistryCore()
+    for name, description in [
+        ("GPSLatitude", "Geographic latitude from GPS"),
+        ("GPSLatitudeRef", "North or south latitude"),
+        ("GPSLongitude", "Geographic longitude from GPS"),
+        ("LensModel", "Lens model name"),
+        ("CameraMake", "Camera manufacturer"),
+        ("focal_length", "Focal length of the lens in mm"),
+    ]:
+        registry.register_field(_field(name, description))
+    return registry
+
+
+def test_search_ranks_name_matches_before_descriptions(registry):
+    names = [f.name for f in registry.search_fields("lens")]
+    assert names == ["LensModel", "focal_length"]
+
+    names = [f.name for f in registry.search_fields("latitude")]
+    assert names[:2] == ["GPSLatitude", "GPSLatitudeRef"]
+    assert registry.search_fields("gpslatitude")[0].name == "GPSLatitude"
+    assert registry.search_fields("zzz") == []
+    assert len(registry.search_fields("gps", max_results=2)) == 2
+
+
+def test_prefix_search_and_index_maintenance(registry):
+    assert [f.name for f in registry.prefix_search("gps")] == [
+        "GPSLatitude", "GPSLatitudeRef", "GPSLongitude"]
+    assert [f.name for f in registry.prefix_search("lon")] == ["GPSLongitude"]
+    assert [f.name for f in registry.search_fields("fo")] == ["focal_length"]
+
+    registry.unregister_field("GPSLongitude")
+    assert [f.name for f in registry.prefix_search("gps")] == ["GPSLatitude", "GPSLatitudeRef"]
+    registry.register_field(_field("CameraMake", "Maker of the body"), overwrite=True)
+    assert registry.search_fields("manufacturer") == []
+    assert registry.search_fields("maker")[0].name == "CameraMake"
+
+    registry.get_field("LensModel").metadata.alias_names.append("Objective")
+    assert [f.name for f in registry.search_fields("objective")] == ["LensModel"]
+    assert registry.search_fields("objective", search_metadata=False) == []
+
+
+def test_similar_fields_match_full_scan_on_large_registry():
+    registry = FieldRegistryCore()
+    stems = ["Exposure", "Focal", "Shutter", "Aperture", "White", "Color", "Flash", "Lens", "Scene"]
+    suffixes = ["Time", "Mode", "Value", "Index", "Program", "Bias", "Length", "Ratio", "Space", "Type"]
+    names = [f"{a}{b}{c}{i}" for i in range(15) for a in stems for b in suffixes for c in ("", "Ref")]
+    registry.register_field_batch([_field(n, "Generated " + n) for n in names])
+
+    start = time.perf_counter()
+    similar = registry.find_similar_fields("ExposureTime3", max_similar=5)
+    elapsed = time.perf_counter() - start
+
+    target = "exposuretime3"
+    expected = sorted((SequenceMatcher(None, target, n.lower()).ratio() for n in names
+                       if n != "ExposureTime3"), reverse=True)[:5]
+    assert [round(score, 6) for _, score in similar] == [round(s, 6) for s in expected]
+    assert elapsed < 0.5
+
+    start = time.perf_counter()
+    for _ in range(100):
+        registry.search_fields("apertureprogram1")
+    assert (time.perf_counter() - start) / 100 < 0.005
@@ -0,0 +1,129 @@
+"""
+Tests for the compiled, memory-mapped field-name tables.
+"""
+
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor"))
+
+from utils.field_tables import (  # noqa: E402
+    FieldTable,
+    FieldTableError,
+    FieldTableSet,
+    LazyFieldTable,
+    read_source_tables,
+)
+
+SOURCE = '''"""Sample tables."""
+
+# Comments are ignored
+BASE = {
+    "Make": "camera_make",
+    "Model": "camera_model",
+    "Caf\\u00e9": "cafe",
+}
+
+CODES = {
+    0x00: "other",
+    3: "cover_front",
+    -1: None,
+    1099511627776: "big",
+}
+
+MERGED = {**BASE, "Model": "model_override", "Lens": None}
+'''
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "sample_tables.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def test_tables_match_source_literals(source, tmp_path):
+    expected = read_source_tables(source)
+    tables = FieldTableSet(source, tmp_path / "cache")
+    merged = tables["MERGED"]
+    assert isinstance(merged, LazyFieldTable)
+    assert not (tmp_path / "cache").exists()  # nothing read until first access
+
+    for name, literal in expected.items():
+        table = tables[name]
+        assert dict(table) == literal
+        assert list(table) == list(literal)
+        assert list(table.items()) == list(literal.items())
+        assert len(table) == len(literal)
+        for key, value in literal.items():
+            assert key in table
+            assert table[key] == value
+            assert table.get(key, "default") == value
+
+    assert tables.mapped
+    assert (tmp_path / "cache" / "sample_tables.fieldtab").exists()
+    assert tables["MERGED"]["Model"] == "model_override"
+    assert tables["CODES"][False] == "other" and tables["CODES"][1 << 40] == "big"
+    assert "missing" not in tables["BASE"] and 5 not in tables["CODES"] and 3.5 not in tables["CODES"]
+    assert "Make" not in tables["CODES"] and 0 not in tables["BASE"]
+    with pytest.raises(KeyError):
+        tables["BASE"]["missing"]
+    assert {**tables["BASE"]} == expected["BASE"]
+    assert tables["BASE"] | {"x": "y"} == {**expected["BASE"], "x": "y"}
+    assert pickle.loads(pickle.dumps(tables["CODES"])) == expected["CODES"]
+    with pytest.raises(KeyError):
+        tables["NOT_A_TABLE"].get("Make")
+
+
+def test_stale_table_is_rebuilt_and_prebuilt_table_needs_no_source(source, tmp_path):
+    cache = tmp_path / "cache"
+    FieldTableSet(source, cache).build()
+    assert FieldTableSet(source, cache)["BASE"]["Make"] == "camera_make"
+
+    source.write_text(SOURCE.replace('"camera_make"', '"manufacturer"'), encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert FieldTableSet(source, cache)["BASE"]["Make"] == "manufacturer"
+
+    source.unlink()
+    assert FieldTableSet(source, cache)["BASE"]["Make"] == "manufacturer"
+
+
+def test_unwritable_cache_falls_back_to_memory(source, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    tables = FieldTableSet(source, blocker)
+    assert tables["BASE"]["Model"] == "camera_model"
+    assert not tables.mapped
+    assert isinstance(tables.table("BASE"), FieldTable)
+
+
+def test_rejects_non_literal_sources(tmp_path):
+    path = tmp_path / "bad.py"
+    path.write_text("import os\nTABLE = {'a': 'b'}\n")
+    with pytest.raises(FieldTableError):
+        read_source_tables(path)
+    path.write_text("TABLE = {'a': 1}\n")
+    with pytest.raises(FieldTableError):
+        read_source_tables(path)
+
+
+def test_registry_modules_keep_their_api():
+    sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor" / "modules"))
+    import dicom_complete_registry
+    import id3_frames_complete
+    import makernotes_complete
+
+    assert makernotes_complete.parse_canon_makernote({"CanonCS_MacroMode": 1, "Other": 2}) == {
+        "canon_macro_mode": 1
+    }
+    assert makernotes_complete.get_makernote_field_count() > 4000
+    assert id3_frames_complete.get_picture_type_name(3) == "cover_front"
+    assert id3_frames_complete.get_picture_type_name(99) == "unknown_99"
+    assert id3_frames_complete.get_id3_field_name("TIT2") == "title"
+    assert id3_frames_complete.ID3V22_TO_V24_MAP["TT2"] == "TIT2"
+    assert dicom_complete_registry.get_dicom_registry_fields().get("0010,0010") == "PatientName"
@@ -0,0 +1,161 @@
+"""
+Tests for the header-only FITS multi-extension scanner.
+"""
+
+import numpy as np
+
+from server.extractor.formats.fits_header import (
+    data_unit_size,
+    extract_fits_container_metadata,
+    sample_fits_statistics,
+    scan_fits_hdus,
+)
+from server.extractor.modules.scientific_parsers.fits_parser import FitsParser
+
+
+def _card(keyword, value=None):
+    if value is None:
+        return keyword.ljust(80).encode("ascii")
+    if isinstance(value, bool):
+        text = "T" if value else "F"
+    elif isinstance(value, str):
+        text = "'" + value.replace("'", "''").ljust(8) + "'"
+    else:
+        text = str(value)
+    return (keyword.ljust(8) + "= " + text.rjust(20)).ljust(80).encode("ascii")
+
+
+def _header(cards):
+    raw = b"".join(_card(*c) for c in cards) + _card("END")
+    return raw + b" " * (-len(raw) % 2880)
+
+
+def _pad(data):
+    return data + b"\x00" * (-len(data) % 2880)
+
+
+def _write_mef(path, image):
+    primary = _header([
+        ("SIMPLE", True), ("BITPIX", 16), ("NAXIS", 2),
+        ("NAXIS1", image.shape[1]), ("NAXIS2", image.shape[0]),
+        ("EXTEND", True), ("BZERO", 32768), ("BSCALE", 1),
+        ("OBJECT", "M31"), ("TELESCOP", "O'Brien"), ("EXPTIME", 30.5),
+        ("HISTORY",),
+    ])
+    stored = (image.astype(np.int64) - 32768).astype(">i2")
+    table = _header([
+        ("XTENSION", "BINTABLE"), ("BITPIX", 8), ("NAXIS", 2),
+        ("NAXIS1", 12), ("NAXIS2", 1000), ("PCOUNT", 100), ("GCOUNT", 1),
+        ("TFIELDS", 2), ("TTYPE1", "RA"), ("TFORM1", "D"),
+        ("TTYPE2", "FLUX"), ("TFORM2", "E"), ("EXTNAME", "CATALOG"),
+    ])
+    cube = _header([
+        ("XTENSION", "IMAGE"), ("BITPIX", -32), ("NAXIS", 3),
+        ("NAXIS1", 4), ("NAXIS2", 5), ("NAXIS3", 6),
+        ("PCOUNT", 0), ("GCOUNT", 1), ("EXTNAME", "CUBE"),
+    ])
+    with open(path, "wb") as f:
+        f.write(primary + _pad(stored.tobytes()))
+        f.write(table + _pad(b"\x01" * (12 * 1000 + 100)))
+        f.write(cube + _pad(np.full(120, np.nan, dtype=">f4").tobytes()))
+
+
+def test_scan_reads_every_extension_header(tmp_path):
+    image = np.arange(200 * 300, dtype=np.uint16).reshape(200, 300)
+    path = tmp_path / "survey.fits"
+    _write_mef(path, image)
+
+    hdus = scan_fits_hdus(str(path))
+
+    assert [h.kind for h in hdus] == ["PRIMARY", "BINTABLE", "IMAGE"]
+    assert [h.name for h in hdus] == ["PRIMARY", "CATALOG", "CUBE"]
+    assert hdus[0].shape == (200, 300)
+    assert hdus[0].header["TELESCOP"] == "O'Brien"
+    assert hdus[0].header["EXPTIME"] == 30.5
+    assert hdus[0].history_cards == 1
+    assert hdus[1].shape == (1000,)
+    assert hdus[1].data_size == 12 * 1000 + 100
+    assert hdus[1].describe()["columns"] == ["RA", "FLUX"]
+    assert hdus[2].shape == (6, 5, 4)
+    assert hdus[2].data_offset + hdus[2].padded_data_size == path.stat().st_size
+
+
+def test_data_unit_size_random_groups():
+    header = {"SIMPLE": True, "BITPIX": -32, "NAXIS": 3, "NAXIS1": 0, "NAXIS2": 3,
+              "NAXIS3": 4, "GROUPS": True, "PCOUNT": 2, "GCOUNT": 10}
+
+    assert data_unit_size(header) == 4 * 10 * (2 + 12)
+
+
+def test_sampled_statistics_apply_bzero(tmp_path):
+    image = np.arange(200 * 300, dtype=np.uint16).reshape(200, 300)
+    path = tmp_path / "survey.fits"
+    _write_mef(path, image)
+    hdus = scan_fits_hdus(str(path))
+
+    stats = sample_fits_statistics(str(path), hdus[0], max_samples=1000)
+    assert stats["sampled_pixels"] == 1000
+    assert stats["stride"] == 60
+    assert stats["min"] == 0
+    assert stats["max"] <= image.max()
+
+    cube = sample_fits_statistics(str(path), hdus[2])
+    assert cube["invalid_fraction"] == 1.0
+    assert "mean" not in cube
+    assert sample_fits_statistics(str(path), hdus[1]) is None
+
+
+def test_parser_and_container_metadata_use_scan(tmp_path):
+    path = tmp_path / "survey.fits"
+    _write_mef(path, np.ones((20, 30), dtype=np.uint16))
+
+    parsed = FitsParser(sample_statistics=True).parse(str(path))
+    container = extract_fits_container_metadata(str(path))
+
+    assert parsed["num_hdus"] == 3
+    assert parsed["observation"]["object"] == "M31"
+    assert parsed["image"]["dimensions"] == [30, 20]
+    assert parsed["extensions"][0]["type"] == "BinTableHDU"
+    assert parsed["extensions"][1]["data_shape"] == [6, 5, 4]
+    assert parsed["pixel_statistics"][0]["mean"] == 1.0
+    assert container["dimensions"] == [30, 20]
+    assert container["hdu_count"] == 3
+    assert [e["name"] for e in container["extensions"]] == ["CATALOG", "CUBE"]
+
+
+def test_tile_compressed_image_reports_image_shape(tmp_path):
+    primary = _header([("SIMPLE", True), ("BITPIX", 8), ("NAXIS", 0), ("EXTEND", True)])
+    compressed = _header([
+        ("XTENSION", "BINTABLE"), ("BITPIX", 8), ("NAXIS", 2),
+        ("NAXIS1", 8), ("NAXIS2", 20), ("PCOUNT", 400), ("GCOUNT", 1),
+        ("TFIELDS", 1), ("TTYPE1", "COMPRESSED_DATA"), ("TFORM1", "1PB(20)"),
+        ("ZIMAGE", True), ("ZBITPIX", 16), ("ZNAXIS", 2),
+        ("ZNAXIS1", 30), ("ZNAXIS2", 20), ("ZCMPTYPE", "RICE_1"), ("EXTNAME", "SCI"),
+    ])
+    path = tmp_path / "compressed.fits"
+    path.write_bytes(primary + compressed + _pad(b"\x00" * (8 * 20 + 400)))
+
+    hdu = scan_fits_hdus(str(path))[1]
+    assert hdu.compressed
+    assert hdu.shape == (20, 30)
+    assert hdu.describe()["uncompressed_dimensions"] == [30, 20]
+
+    extension = FitsParser().parse(str(path))["extensions"][0]
+    assert extension["type"] == "CompImageHDU"
+    assert extension["data_shape"] == [20, 30]
+    assert extension["bitpix"] == 16
+
+
+def test_non_fits_and_truncated_files(tmp_path):
+    other = tmp_path / "other.fits"
+    other.write_bytes(b"\x00" * 5760)
+    assert scan_fits_hdus(str(other)) == []
+
+    path = tmp_path / "survey.fits"
+    _write_mef(path, np.ones((20, 30), dtype=np.uint16))
+    truncated = tmp_path / "cut.fits"
+    truncated.write_bytes(path.read_bytes()[:2880 * 4])
+
+    hdus = scan_fits_hdus(str(truncated))
+    assert hdus[-1].truncated
+    assert sample_fits_statistics(str(truncated), hdus[0]) is not None
@@ -0,0 +1,186 @@
+"""
+Tests for the streaming genomic statistics engine.
+"""
+
+import gzip
+import random
+import struct
+import zlib
+
+import pytest
+
+from server.extractor.modules import genomic_stream as gs
+from server.extractor.modules.genomic_extractor import GenomicExtractor
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def _bgzf(data, block=30000):
+    out = bytearray()
+    for start in range(0, len(data), block):
+        chunk = data[start:start + block]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        payload = compressor.compress(chunk) + compressor.flush()
+        out += b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff" + struct.pack("<H", 6)
+        out += b"BC" + struct.pack("<HH", 2, len(payload) + 25) + payload
+        out += struct.pack("<II", zlib.crc32(chunk), len(chunk))
+    return bytes(out) + BGZF_EOF
+
+
+def _fastq(count, seed=1):
+    rng = random.Random(seed)
+    reads = []
+    for index in range(count):
+        length = rng.randint(40, 120)
+        sequence = "".join(rng.choice("ACGTGCN") for _ in range(length))
+        quality = "".join(chr(33 + rng.randint(2, 40)) for _ in range(length))
+        reads.append((sequence, quality))
+    text = "".join(f"@read{i} lane1\n{s}\n+\n{q}\n" for i, (s, q) in enumerate(reads))
+    return text.encode(), reads
+
+
+def _expected(reads):
+    bases = sum(len(s) for s, _ in reads)
+    gc = sum(s.count("G") + s.count("C") for s, _ in reads)
+    quality = sum(ord(c) - 33 for _, q in reads for c in q)
+    return {"record_count": len(reads), "total_bases": bases,
+            "avg_gc_content": round(gc / bases * 100, 2), "avg_quality_score": round(quality / bases, 2)}
+
+
+@pytest.mark.parametrize("compression", ["plain", "gzip", "bgzf"])
+def test_full_scan_matches_reference(tmp_path, compression, monkeypatch):
+    monkeypatch.setattr(gs, "CHUNK_BYTES", 4096)
+    monkeypatch.setattr(gs, "BGZF_BLOCKS_PER_TASK", 2)
+    data, reads = _fastq(3000)
+    path = tmp_path / "reads.fq.gz"
+    path.write_bytes({"plain": data, "gzip": gzip.compress(data), "bgzf": _bgzf(data)}[compression])
+
+    stats = gs.analyze_fastq(str(path), mode="full", workers=3)
+
+    assert stats["compression"] == compression
+    assert stats["estimated"] is False
+    for key, value in _expected(reads).items():
+        assert stats[key] == value
+    assert sum(stats["gc_content_histogram"].values()) == 3000
+    assert stats["min_read_length"] == min(len(s) for s, _ in reads)
+    assert stats["records_sample"][0]["id"] == "read0 lane1"
+
+
+def test_sampling_reports_intervals_covering_the_truth(tmp_path, monkeypatch):
+    monkeypatch.setattr(gs, "WINDOW_BYTES", 8192)
+    data, reads = _fastq(20000, seed=4)
+    path = tmp_path / "reads.fq.bgz"
+    path.write_bytes(_bgzf(data))
+    truth = _expected(reads)
+
+    stats = gs.analyze_fastq(str(path), mode="sample", sample_size=4000, seed=7)
+
+    assert stats["statistics_mode"] == "sample" and stats["estimated"] is True
+    assert 4000 <= stats["sampling"]["sampled_records"] < 20000
+    intervals = stats["confidence_intervals"]
+    for key in ("record_count", "total_bases", "avg_gc_content", "avg_quality_score"):
+        low, high = intervals[key]
+        assert low <= truth[key] <= high, key
+    assert stats["read_percentiles"]["reservoir_size"] == 4000
+
+
+def test_time_budget_cuts_scan_to_a_prefix_estimate(tmp_path, monkeypatch):
+    monkeypatch.setattr(gs, "CHUNK_BYTES", 4096)
+    data, reads = _fastq(5000)
+    path = tmp_path / "reads.fastq"
+    path.write_bytes(data)
+
+    stats = gs.analyze_fastq(str(path), mode="full", time_budget_seconds=1e-9)
+
+    assert stats["statistics_mode"] == "prefix"
+    assert stats["sampling"]["sampled_records"] < 5000
+    assert abs(stats["record_count"] - 5000) < 500
+
+
+def test_reservoir_is_uniform_over_the_stream():
+    reservoir = gs.Reservoir(1000, 1, seed=3)
+    for start in range(0, 100000, 777):
+        stop = min(start + 777, 100000)
+        reservoir.add(gs.np.arange(start, stop, dtype=float).reshape(-1, 1))
+    sample = reservoir.sample()[:, 0]
+    assert reservoir.seen == 100000 and len(sample) == 1000
+    assert 45000 < sample.mean() < 55000
+
+
+def test_fasta_streams_records_and_uses_fai(tmp_path):
+    path = tmp_path / "genome.fa"
+    path.write_bytes(b">chr1 test\nACGT\nGGCC\n>chr2\nNNAT\n")
+
+    stats = GenomicExtractor(mode="full").extract_fasta_metadata(str(path))
+    assert stats["record_count"] == 2
+    assert stats["total_length"] == 12
+    assert stats["records"] == [{"id": "chr1", "length": 8, "gc_content": 75.0},
+                                {"id": "chr2", "length": 4, "gc_content": 0.0}]
+    assert stats["total_gc_content"] == 50.0
+
+    (tmp_path / "genome.fa.fai").write_text("chr1\t8\t12\t4\t5\nchr2\t4\t28\t4\t5\nchr3\t100\t40\t60\t61\n")
+    indexed = gs.analyze_fasta(str(path), mode="full")
+    assert indexed["record_count"] == 3
+    assert indexed["index"]["type"] == "fai"
+
+
+def _index_refs(counts):
+    body = b""
+    for mapped, unmapped in counts:
+        body += struct.pack("<iIi", 1, gs.PSEUDO_BIN, 2) + struct.pack("<QQQQ", 0, 0, mapped, unmapped)
+        body += struct.pack("<i", 0)
+    return body
+
+
+def test_vcf_counts_from_tabix_index_or_stream(tmp_path):
+    header = "##fileformat=VCFv4.2\n##source=test\n#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\tS2\n"
+    rows = "".join(f"chr1\t{i}\t.\tA\tG\t50\tPASS\t.\tGT\t0/1\t1/1\n" for i in range(1, 41))
+    path = tmp_path / "calls.vcf.gz"
+    path.write_bytes(_bgzf((header + rows).encode()))
+
+    streamed = GenomicExtractor(mode="full").extract_vcf_metadata(str(path))
+    assert streamed["record_count"] == 40 and streamed["estimated"] is False
+    assert streamed["sample_names"] == ["S1", "S2"]
+
+    names = b"chr1\x00chr2\x00"
+    tbi = b"TBI\x01" + struct.pack("<8i", 2, 2, 1, 2, 0, ord("#"), 0, len(names)) + names
+    tbi += _index_refs([(40, 0), (7, 0)]) + struct.pack("<Q", 0)
+    (tmp_path / "calls.vcf.gz.tbi").write_bytes(gzip.compress(tbi))
+    indexed = GenomicExtractor().extract_vcf_metadata(str(path))
+    assert indexed["record_count"] == 47
+    assert indexed["records_per_contig"] == {"chr1": 40, "chr2": 7}
+
+
+def test_vcf_bgz_headers_are_decompressed(tmp_path):
+    header = "##fileformat=VCFv4.2\n##source=test\n#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+    rows = "".join(f"chr1\t{i}\t.\tA\tG\t50\tPASS\t.\tGT\t0/1\n" for i in range(1, 11))
+    path = tmp_path / "calls.vcf.bgz"
+    path.write_bytes(_bgzf((header + rows).encode()))
+
+    result = GenomicExtractor(mode="full").extract(str(path))
+
+    assert result["format_detected"] == "vcf"
+    assert result["extraction_success"] is True
+    metadata = result["genomic_metadata"]
+    assert metadata["format_version"] == "VCFv4.2"
+    assert metadata["sample_names"] == ["S1"]
+    assert metadata["record_count"] == 10
+
+
+def test_bam_header_and_bai_counts(tmp_path):
+    text = b"@HD\tVN:1.6\tSO:coordinate\n@RG\tID:a\n@PG\tID:bwa\tPN:bwa\n"
+    bam = b"BAM\x01" + struct.pack("<i", len(text)) + text + struct.pack("<i", 2)
+    for name, length in ((b"chr1\x00", 1000), (b"chr2\x00", 500)):
+        bam += struct.pack("<i", len(name)) + name + struct.pack("<i", length)
+    path = tmp_path / "aln.bam"
+    path.write_bytes(_bgzf(bam))
+    (tmp_path / "aln.bam.bai").write_bytes(b"BAI\x01" + struct.pack("<i", 2) + _index_refs([(90, 3), (10, 1)])
+                                           + struct.pack("<Q", 6))
+
+    result = GenomicExtractor().extract(str(path))
+    metadata = result["genomic_metadata"]
+    assert result["extraction_success"] is True
+    assert metadata["sort_order"] == "coordinate"
+    assert metadata["reference_total_length"] == 1500
+    assert metadata["mapped_reads"] == 100 and metadata["unmapped_reads"] == 10
+    assert metadata["reads_per_reference"] == {"chr1": 90, "chr2": 10}
@@ -38,3 +38,56 @@ def test_perceptual_hashes_export_from_module():
     modules = importlib.import_module("server.extractor.modules")
     perceptual_module = importlib.import_module("server.extractor.modules.perceptual_hashes")
     assert modules.extract_perceptual_hashes is perceptual_module.extract_perceptual_hashes
+
+
+def test_hash_file_parallel_path_matches_hashlib(tmp_path):
+    from server.extractor.utils.hashing import FileHasher, PARALLEL_THRESHOLD
+
+    payload = bytes(range(256)) * ((PARALLEL_THRESHOLD // 256) + 4099)
+    path = tmp_path / "large.bin"
+    path.write_bytes(payload)
+
+    hasher = FileHasher(chunk_size=1 << 20)
+    result = hasher.hash_file(str(path), ("md5", "sha1", "sha256", "crc32"))
+    assert result == _expected_hashes(payload)
+
+
+def test_hash_file_readinto_fallback(tmp_path, monkeypatch):
+    from server.extractor.utils import hashing
+
+    def _no_mmap(*args, **kwargs):
+        raise OSError("mmap unavailable")
+
+    monkeypatch.setattr(hashing.mmap, "mmap", _no_mmap)
+    payload = bytes(range(251)) * 40_000
+    path = tmp_path / "stream.bin"
+    path.write_bytes(payload)
+
+    result = hashing.FileHasher(chunk_size=1 << 20).hash_file(str(path))
+    assert result == _expected_hashes(payload)
+
+
+def test_hash_file_memoizes_per_stat(tmp_path):
+    from server.extractor.utils.hashing import FileHasher
+
+    path = tmp_path / "memo.bin"
+    path.write_bytes(b"first")
+    hasher = FileHasher()
+
+    first = hasher.hash_file(str(path), ("sha256", "md5"))
+    assert hasher.hash_file(str(path), ("md5",)) == {"md5": first["md5"]}
+    assert hasher.get_stats()["hits"] == 1
+
+    path.write_bytes(b"second-version")
+    updated = hasher.hash_file(str(path), ("sha256",))
+    assert updated["sha256"] == hashlib.sha256(b"second-version").hexdigest()
+
+
+def test_hash_file_rejects_unknown_algorithm(tmp_path):
+    import pytest
+    from server.extractor.utils.hashing import hash_file
+
+    path = tmp_path / "x.bin"
+    path.write_bytes(b"x")
+    with pytest.raises(ValueError):
+        hash_file(str(path), ("whirlpool",))
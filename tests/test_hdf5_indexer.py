@@ -0,0 +1,126 @@
+"""
+Tests for the budgeted HDF5 / NetCDF-4 structure indexer.
+"""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from server.extractor.modules import hdf5_indexer as hi
+from server.extractor.modules.scientific_parsers.hdf5_netcdf_parser import Hdf5Parser, NetcdfParser
+
+
+def _write_sample(path, extra=50):
+    with h5py.File(path, "w") as f:
+        group = f.create_group("a")
+        group.attrs["units"] = "m"
+        f.create_dataset("a/x", data=np.arange(1000.0).reshape(10, 100),
+                         chunks=(5, 50), compression="gzip")
+        f["link"] = h5py.SoftLink("/a/x")
+        f["alias"] = f["a/x"]
+        f["s"] = 3
+        for i in range(extra):
+            f.create_dataset(f"b/d{i:03d}", data=[i])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    hi.clear_index_cache()
+    yield
+    hi.clear_index_cache()
+
+
+def test_full_walk_records_layout_and_links(tmp_path):
+    path = tmp_path / "sample.h5"
+    _write_sample(path)
+
+    index = hi.build_index(str(path))
+
+    assert index.complete
+    counts = index.counts()
+    assert counts["group"] == 3
+    assert counts["dataset"] == 52
+    assert counts["soft_link"] == 1
+    assert counts["hard_link"] == 1
+    assert index.find("link")["target"] == "/a/x"
+
+    # "/a" is walked after the root's own links, so "/alias" is the first path
+    data = index.find("/alias")
+    assert data["shape"] == [10, 100]
+    assert data["chunks"] == [5, 50]
+    assert data["compression"].startswith("gzip")
+    assert data["size_bytes"] == 8000
+    assert 0 < data["storage_bytes"] < 8000
+    assert index.find("a/x") == {"path": "/a/x", "kind": "hard_link", "target": "/alias"}
+    assert index.find("s")["shape"] == []
+
+
+def test_budgeted_walk_resumes_without_duplicates(tmp_path):
+    path = tmp_path / "sample.h5"
+    _write_sample(path)
+
+    index = hi.build_index(str(path), max_objects=5)
+    assert not index.complete
+    assert len(index) == 5
+
+    while not index.complete:
+        hi.continue_index(index, max_objects=7)
+
+    assert index.passes > 2
+    assert len(index) == len(set(index.paths)) == 57
+    assert index.counts()["hard_link"] == 1
+    assert index.summary()["total_datasets"] == 52
+
+
+def test_attributes_are_read_on_demand(tmp_path):
+    path = tmp_path / "sample.h5"
+    _write_sample(path, extra=0)
+
+    index = hi.build_index(str(path))
+
+    assert index.find("a")["num_attributes"] == 1
+    assert index.attributes("/a") == {"units": "m"}
+
+
+def test_cache_continues_partial_index(tmp_path):
+    path = tmp_path / "sample.h5"
+    _write_sample(path)
+
+    first = hi.get_hdf5_index(str(path), max_objects=10)
+    assert not first.complete
+    second = hi.get_hdf5_index(str(path))
+
+    assert second is first
+    assert second.complete
+    assert hi.get_hdf5_index(str(tmp_path / "missing.h5")) is None
+
+
+def test_parser_reports_index_structure(tmp_path):
+    path = tmp_path / "sample.h5"
+    _write_sample(path)
+
+    result = Hdf5Parser().parse(str(path))
+
+    assert result["structure"]["total_datasets"] == 52
+    assert result["structure"]["index_complete"]
+    assert result["datasets"]["count"] == 52
+    assert len(result["datasets"]["datasets"]) == 50
+    assert result["groups"]["groups"][0] == {"path": "a", "num_children": 1, "num_attributes": 1}
+
+
+def test_netcdf4_variables_indexed(tmp_path):
+    netCDF4 = pytest.importorskip("netCDF4")
+    path = tmp_path / "climate.nc"
+    with netCDF4.Dataset(str(path), "w", format="NETCDF4") as nc:
+        nc.createDimension("time", 4)
+        nc.createDimension("lat", 3)
+        var = nc.createVariable("temp", "f4", ("time", "lat"), zlib=True)
+        var[:] = np.ones((4, 3))
+
+    index = hi.get_hdf5_index(str(path))
+    parsed = NetcdfParser().parse(str(path))
+
+    assert index.find("temp")["shape"] == [4, 3]
+    assert index.find("temp")["compression"]
+    assert parsed["hdf5_index"]["compressed_datasets"] >= 1
@@ -0,0 +1,94 @@
+"""
+Tests for the image container parsers that map or range-read their input.
+"""
+
+import hashlib
+import struct
+import zlib
+
+from server.extractor.formats import segment_directory as sd
+from server.extractor.modules.camera_raw import extract_raw_metadata
+from server.extractor.modules.forensic_metadata import calculate_file_integrity
+from server.extractor.modules.gif_apng_extractor import APNGExtractor, GIFExtractor
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def test_map_file_handles_empty_files(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert sd.map_file(str(path)) == b""
+
+
+def test_apng_animation_chunks_read_from_segment_directory(tmp_path):
+    fctl = struct.pack(">IIIIIHHBB", 0, 64, 32, 0, 0, 1, 10, 0, 0)
+    path = tmp_path / "anim.png"
+    path.write_bytes(
+        sd.PNG_SIGNATURE
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 64, 32, 8, 2, 0, 0, 0))
+        + _png_chunk(b"acTL", struct.pack(">II", 2, 0))
+        + _png_chunk(b"fcTL", fctl)
+        + _png_chunk(b"IDAT", b"\x00" * 1000)
+        + _png_chunk(b"fcTL", struct.pack(">I", 1) + fctl[4:])
+        + _png_chunk(b"fdAT", struct.pack(">I", 2) + b"\x00" * 1000)
+        + _png_chunk(b"IEND", b"")
+    )
+
+    result = APNGExtractor(str(path)).parse()
+
+    assert result["success"] is True
+    assert result["frame_count"] == 2
+    assert result["is_animated"] is True
+    assert [f["sequence"] for f in result["frames"]] == [0, 1]
+    assert result["frames"][0]["width"] == 64
+    assert result["frame_delays"] == [2]
+
+
+def test_apng_rejects_non_png(tmp_path):
+    path = tmp_path / "not.png"
+    path.write_bytes(b"GIF89a" + b"\x00" * 20)
+    assert APNGExtractor(str(path)).parse() == {"error": "Not a valid PNG file", "success": False}
+
+
+def test_gif_parses_from_mapping(tmp_path):
+    path = tmp_path / "tiny.gif"
+    path.write_bytes(
+        b"GIF89a" + struct.pack("<HH", 3, 2) + b"\x00\x00\x00"
+        + b"\x2c" + struct.pack("<HHHH", 0, 0, 3, 2) + b"\x00"
+        + b"\x02\x02\x4c\x01\x00" + b"\x3b"
+    )
+
+    result = GIFExtractor(str(path)).parse()
+
+    assert result["success"] is True
+    assert result["logical_screen_width"] == 3
+    assert result["logical_screen_height"] == 2
+
+
+def test_raw_tiff_ifd_is_parsed_from_file_start(tmp_path):
+    entries = [(0x010F, 2, 6, 0), (0x0100, 3, 1, 4000)]
+    ifd = struct.pack("<H", len(entries))
+    for tag, kind, count, value in entries:
+        ifd += struct.pack("<HHII", tag, kind, count, value)
+    path = tmp_path / "shot.dng"
+    path.write_bytes(b"II*\x00" + struct.pack("<I", 8) + ifd + struct.pack("<I", 0) + b"\x00" * 64)
+
+    result = extract_raw_metadata(str(path))
+
+    assert result["success"] is True
+    assert result["tiff_ifd"]["entry_count"] == 2
+
+
+def test_file_integrity_streams_hashes_and_entropy(tmp_path):
+    data = bytes(range(256)) * 4
+    path = tmp_path / "blob.bin"
+    path.write_bytes(data)
+
+    result = calculate_file_integrity(str(path))
+
+    assert result["file_hash_sha256"] == hashlib.sha256(data).hexdigest()
+    assert result["file_hash_md5"] == hashlib.md5(data).hexdigest()
+    assert result["file_entropy"] == 8.0
+    assert result["file_size"] == len(data)
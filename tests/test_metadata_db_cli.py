@@ -0,0 +1,35 @@
+"""
+Tests for running metadata_db_cli the way the Node routes spawn it.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+EXTRACTOR_DIR = Path(__file__).resolve().parents[1] / "server" / "extractor"
+CLI = EXTRACTOR_DIR / "metadata_db_cli.py"
+
+# Script mode: sys.path[0] is the extractor directory, so "modules",
+# "formats" and "utils" are top-level packages. The database is redirected
+# so the run does not touch data/metadata.db.
+BOOTSTRAP = """
+import runpy, sys
+sys.path[0] = sys.argv[1]
+import modules.metadata_db as metadata_db
+metadata_db.DATABASE_PATH = sys.argv[2]
+sys.argv = [sys.argv[3]] + sys.argv[4:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def test_stats_runs_as_a_script(tmp_path):
+    completed = subprocess.run(
+        [sys.executable, "-c", BOOTSTRAP, str(EXTRACTOR_DIR), str(tmp_path / "metadata.db"), str(CLI), "stats"],
+        capture_output=True, text=True, cwd=str(tmp_path), timeout=120,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    stats = json.loads(completed.stdout)
+    assert stats["total_files"] == 0
+    assert (tmp_path / "metadata.db").exists()
@@ -0,0 +1,150 @@
+"""
+Tests for the trigger-maintained statistics and facet aggregates in metadata_db.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor" / "modules"))
+
+import metadata_db  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_db, "DATABASE_PATH", str(tmp_path / "metadata.db"))
+    monkeypatch.setattr(metadata_db, "_DB_INITIALIZED", False)
+    return tmp_path
+
+
+def _store(tmp_path, name, metadata, content=None, **kwargs):
+    path = tmp_path / name
+    path.write_bytes(content if content is not None else name.encode())
+    file_id = metadata_db.store_file_metadata(str(path), metadata, **kwargs)
+    assert file_id > 0
+    return file_id
+
+
+def _counts(facet_list):
+    return {entry["value"]: entry["count"] for entry in facet_list}
+
+
+def _live_statistics():
+    conn = sqlite3.connect(metadata_db.DATABASE_PATH)
+    try:
+        by_type = dict(conn.execute("SELECT file_type, COUNT(*) FROM files GROUP BY file_type"))
+        files, size, unique = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(file_size), 0), COUNT(DISTINCT file_hash) FROM files"
+        ).fetchone()
+        favorites = conn.execute("SELECT COUNT(*) FROM favorites").fetchone()[0]
+    finally:
+        conn.close()
+    return {"total_files": files, "total_favorites": favorites, "by_type": by_type,
+            "total_size_bytes": size, "unique_files": unique}
+
+
+def test_statistics_and_facets_track_writes(db):
+    canon = {"normalized": {"camera_model": "EOS R5", "lens_model": "RF 50mm f/1.2"},
+             "exif": {"DateTimeOriginal": "2023:07:01 10:00:00"},
+             "gps": {"latitude": 48.85, "longitude": 2.35}}
+    first = _store(db, "a.jpg", canon)
+    _store(db, "b.jpg", {**canon, "gps": {}}, content=b"a.jpg")  # duplicate content
+    third = _store(db, "c.png", {"normalized": {"camera_model": "Pixel 8"},
+                                 "filesystem": {"created": "2024-02-03T04:05:06"}}, is_favorite=True)
+    assert metadata_db.get_statistics() == _live_statistics()
+    assert metadata_db.get_statistics()["unique_files"] == 2
+
+    facets = metadata_db.get_facet_counts()
+    assert _counts(facets["file_type"]) == {".jpg": 2, ".png": 1}
+    assert _counts(facets["camera_model"]) == {"EOS R5": 2, "Pixel 8": 1}
+    assert _counts(facets["year"]) == {"2023": 2, "2024": 1}
+    assert _counts(facets["has_gps"]) == {"true": 1, "false": 2}
+    assert facets["camera_model"][0] == {"value": "EOS R5", "count": 2}
+
+    # Re-ingest with a changed model and content, toggle favorite, delete
+    _store(db, "a.jpg", {"normalized": {"camera_model": "EOS R6"}}, content=b"new content")
+    metadata_db.toggle_favorite(third)
+    metadata_db.toggle_favorite(first)
+    assert metadata_db.get_statistics() == _live_statistics()
+    facets = metadata_db.get_facet_counts()
+    assert _counts(facets["camera_model"]) == {"EOS R5": 1, "EOS R6": 1, "Pixel 8": 1}
+    assert _counts(facets["lens"]) == {"RF 50mm f/1.2": 1}
+    assert _counts(facets["has_gps"]) == {"false": 3}
+
+    assert metadata_db.delete_file(third)
+    assert metadata_db.get_statistics() == _live_statistics()
+    assert _counts(metadata_db.get_facet_counts(["file_type"])["file_type"]) == {".jpg": 2}
+    assert metadata_db.check_aggregates()["consistent"]
+
+
+def test_facet_search_counts_follow_filters(db):
+    for index in range(6):
+        _store(db, f"img{index}.jpg", {
+            "normalized": {"camera_model": "EOS R5" if index % 2 else "Z 9", "iso": 100 * (index + 1)},
+            "exif": {"DateTimeOriginal": f"{2020 + index % 3}:01:01 00:00:00"},
+        })
+
+    result = metadata_db.facet_search("iso>=300", facets=["camera_model", "year"], limit=2)
+    assert result["total"] == 4
+    assert len(result["results"]) == 2
+    assert set(result["facets"]) == {"camera_model", "year"}
+    assert _counts(result["facets"]["camera_model"]) == {"EOS R5": 2, "Z 9": 2}
+    assert _counts(result["facets"]["year"]) == {"2020": 1, "2021": 1, "2022": 2}
+
+    drill = metadata_db.facet_search("iso>=300 AND facet.year=2022")
+    assert drill["total"] == 2
+    assert sorted(Path(r["file_path"]).name for r in drill["results"]) == ["img2.jpg", "img5.jpg"]
+    assert _counts(drill["facets"]["camera_model"]) == {"EOS R5": 1, "Z 9": 1}
+
+    everything = metadata_db.facet_search("", limit=0)
+    assert everything["total"] == 6 and everything["results"] == []
+    assert _counts(everything["facets"]["file_type"]) == {".jpg": 6}
+
+
+def test_check_detects_drift_and_rebuilds(db):
+    _store(db, "a.jpg", {"normalized": {"camera_model": "X100V"}})
+    _store(db, "b.jpg", {"normalized": {"camera_model": "X100V"}})
+
+    conn = sqlite3.connect(metadata_db.DATABASE_PATH)
+    conn.execute("UPDATE facet_counts SET count = 7 WHERE facet = 'camera_model'")
+    conn.execute("UPDATE stats_totals SET value = 0 WHERE name = 'total_files'")
+    conn.commit()
+    conn.close()
+
+    report = metadata_db.check_aggregates()
+    assert not report["consistent"]
+    assert report["totals"] == {"total_files": (0, 2)}
+    assert report["facets"] == [("camera_model", "X100V", 7, 2)]
+
+    assert not metadata_db.check_aggregates(repair=True)["consistent"]
+    assert metadata_db.check_aggregates()["consistent"]
+    assert metadata_db.get_statistics()["total_files"] == 2
+
+
+def test_existing_database_gets_aggregates(db):
+    conn = sqlite3.connect(metadata_db.DATABASE_PATH)
+    conn.executescript("""
+        CREATE TABLE files (id INTEGER PRIMARY KEY AUTOINCREMENT, file_path TEXT UNIQUE NOT NULL,
+            file_hash TEXT NOT NULL, file_size INTEGER, file_mtime REAL, file_type TEXT,
+            extracted_at TEXT, last_updated TEXT);
+        CREATE TABLE metadata (file_id INTEGER, category TEXT, key TEXT, value TEXT,
+            PRIMARY KEY (file_id, category, key));
+        INSERT INTO files VALUES (1, '/old/a.tif', 'h', 10, 0, '.tif', '2024-01-01', '2024-01-01');
+        INSERT INTO files VALUES (2, '/old/b.tif', 'h', 10, 0, '.tif', '2024-01-02', '2024-01-02');
+        INSERT INTO metadata VALUES (1, 'normalized', 'camera_model', 'GFX 100');
+        INSERT INTO metadata VALUES (1, 'exif', 'CreateDate', '2019:05:05 12:00:00');
+    """)
+    conn.commit()
+    conn.close()
+
+    stats = metadata_db.get_statistics()
+    assert stats["total_files"] == 2 and stats["unique_files"] == 1 and stats["total_size_bytes"] == 20
+    assert stats["by_type"] == {".tif": 2}
+    facets = metadata_db.get_facet_counts()
+    assert _counts(facets["camera_model"]) == {"GFX 100": 1}
+    assert _counts(facets["year"]) == {"2019": 1}
+    assert metadata_db.check_aggregates()["consistent"]
@@ -0,0 +1,130 @@
+"""
+Tests for typed shadow columns, location and FTS5 search in metadata_db.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "server" / "extractor" / "modules"))
+
+import metadata_db  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_db, "DATABASE_PATH", str(tmp_path / "metadata.db"))
+    monkeypatch.setattr(metadata_db, "_DB_INITIALIZED", False)
+    return tmp_path
+
+
+def _store(tmp_path, name, metadata):
+    path = tmp_path / name
+    path.write_bytes(name.encode())
+    file_id = metadata_db.store_file_metadata(str(path), metadata)
+    assert file_id > 0
+    return file_id
+
+
+def _paths(results):
+    return sorted(Path(r["file_path"]).name for r in results)
+
+
+def test_typed_range_geo_and_text_queries(db):
+    _store(db, "night.jpg", {
+        "normalized": {"iso": 6400, "exposure_time": "1/30", "focal_length": "50.0 mm",
+                       "description": "Harbour at night"},
+        "exif": {"DateTimeOriginal": "2023:11:02 21:15:00"},
+        "gps": {"latitude_decimal": 59.91, "longitude_decimal": 10.75},
+    })
+    _store(db, "beach.jpg", {
+        "normalized": {"iso": 100, "exposure_time": "1/2000", "focal_length": "24.0 mm",
+                       "description": "Sunset over the beach"},
+        "exif": {"DateTimeOriginal": "2024:06:21 20:40:00"},
+        "gps": {"GPSLatitude": 33.9, "GPSLatitudeRef": "S", "GPSLongitude": 18.4, "GPSLongitudeRef": "E"},
+    })
+    _store(db, "scan.png", {"normalized": {"iso": "unknown", "description": "Scanned receipt"}})
+
+    search = metadata_db.search_metadata_query
+    assert _paths(search("iso>3200")) == ["night.jpg"]
+    assert _paths(search("iso<=100")) == ["beach.jpg"]
+    assert _paths(search("exposure_time<0.01")) == ["beach.jpg"]
+    assert _paths(search("focal_length>=30")) == ["night.jpg"]
+    assert _paths(search("exif.DateTimeOriginal>=2024-01-01")) == ["beach.jpg"]
+    assert _paths(search("exif.DateTimeOriginal<2024-01-01T00:00:00Z")) == ["night.jpg"]
+    assert _paths(search("bbox:50,0,70,20")) == ["night.jpg"]
+    assert _paths(search("bbox:-40,10,-30,20")) == ["beach.jpg"]
+    assert _paths(search("description CONTAINS sunset")) == ["beach.jpg"]
+    assert _paths(search("description LIKE ce")) == ["scan.png"]  # too short for trigrams
+    assert _paths(search("text:RECEIPT")) == ["scan.png"]
+    assert _paths(search("iso=unknown AND text:scan")) == ["scan.png"]
+    assert _paths(search("iso>50 AND bbox:50,0,70,20")) == ["night.jpg"]
+
+    hits = search("text:beach")
+    assert len(hits) == 1
+    file_id = metadata_db.get_file_id_by_path(hits[0]["file_path"])
+    assert hits[0] == metadata_db.get_file_metadata(file_id)
+    assert hits[0]["metadata"]["normalized"]["iso"] == "100"
+
+
+def test_year_only_filters_on_date_fields(db):
+    _store(db, "old.jpg", {"exif": {"DateTimeOriginal": "2022:12:31 23:59:59"},
+                           "filesystem": {"created": "2022-12-31T23:59:59"}})
+    _store(db, "mid.jpg", {"exif": {"DateTimeOriginal": "2023:11:02 21:15:00"},
+                           "filesystem": {"created": "2023-11-02T21:15:00"}})
+    _store(db, "new.jpg", {"exif": {"DateTimeOriginal": "2024:06:21 20:40:00"},
+                           "filesystem": {"created": "2024-01-01T00:00:00"},
+                           "normalized": {"iso": 2023}})
+
+    search = metadata_db.search_metadata_query
+    assert _paths(search("exif.DateTimeOriginal>2022")) == ["mid.jpg", "new.jpg"]
+    assert _paths(search("exif.DateTimeOriginal>=2023")) == ["mid.jpg", "new.jpg"]
+    assert _paths(search("exif.DateTimeOriginal<2023")) == ["old.jpg"]
+    assert _paths(search("exif.DateTimeOriginal<=2023")) == ["mid.jpg", "old.jpg"]
+    assert _paths(search("date:>2023")) == ["new.jpg"]
+    assert _paths(search("date:>=2022 AND date:<2024")) == ["mid.jpg", "old.jpg"]
+    # Numeric fields still compare the number
+    assert _paths(search("iso>=2023")) == ["new.jpg"]
+
+
+def test_reingest_and_delete_keep_indexes_in_sync(db):
+    file_id = _store(db, "a.jpg", {"normalized": {"description": "red kite", "iso": 800},
+                                   "gps": {"lat": 51.5, "lon": -0.12}})
+    assert _paths(metadata_db.search_metadata_query("text:kite")) == ["a.jpg"]
+
+    _store(db, "a.jpg", {"normalized": {"description": "blue heron", "iso": 200}})
+    search = metadata_db.search_metadata_query
+    assert search("text:kite") == []
+    assert _paths(search("text:heron")) == ["a.jpg"]
+    assert search("iso>400") == []
+    assert search("bbox:50,-1,52,1") == []
+
+    assert metadata_db.delete_file(file_id)
+    assert search("text:heron") == []
+    assert search("iso>100") == []
+
+
+def test_existing_database_is_migrated(db):
+    conn = sqlite3.connect(metadata_db.DATABASE_PATH)
+    conn.executescript("""
+        CREATE TABLE files (id INTEGER PRIMARY KEY AUTOINCREMENT, file_path TEXT UNIQUE NOT NULL,
+            file_hash TEXT NOT NULL, file_size INTEGER, file_mtime REAL, file_type TEXT,
+            extracted_at TEXT, last_updated TEXT);
+        CREATE TABLE metadata (file_id INTEGER, category TEXT, key TEXT, value TEXT,
+            PRIMARY KEY (file_id, category, key));
+        INSERT INTO files VALUES (1, '/old/photo.jpg', 'h', 1, 0, '.jpg', '2024-01-01', '2024-01-01');
+        INSERT INTO metadata VALUES (1, 'normalized', 'iso', '12800');
+        INSERT INTO metadata VALUES (1, 'normalized', 'description', 'Aurora borealis');
+        INSERT INTO metadata VALUES (1, 'gps', 'latitude', '69.65');
+        INSERT INTO metadata VALUES (1, 'gps', 'longitude', '18.96');
+    """)
+    conn.commit()
+    conn.close()
+
+    search = metadata_db.search_metadata_query
+    assert _paths(search("iso>6400")) == ["photo.jpg"]
+    assert _paths(search("text:borealis")) == ["photo.jpg"]
+    assert _paths(search("bbox:60,10,70,20")) == ["photo.jpg"]
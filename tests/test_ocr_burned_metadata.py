@@ -378,4 +378,102 @@ def test_calculate_confidence():
     # Test with empty data (should be none confidence)
     parsed_empty = {}
     confidence = extractor._calculate_confidence(parsed_empty)
-    assert confidence == "none"
\ No newline at end of file
+    assert confidence == "none"
+
+def _overlay_image(width=640, height=480):
+    """Build a flat image with a high-contrast striped strip near the bottom."""
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGB", (width, height), (90, 110, 130))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 400, width, 440], fill=(0, 0, 0))
+    for x in range(0, width, 4):
+        draw.line([(x, 405), (x, 435)], fill=(255, 255, 255))
+    return img
+
+
+def test_find_text_bands_detects_bottom_overlay():
+    """Only the overlay strip containing text-like edges is reported."""
+    from server.extractor.modules.ocr_engine import find_text_bands
+
+    regions = find_text_bands(_overlay_image())
+
+    assert [name for name, _ in regions] == ["bottom"]
+    left, top, right, bottom = regions[0][1]
+    assert (left, right) == (0, 640)
+    assert top <= 405 and bottom >= 435
+    assert bottom - top < 100
+
+
+def test_find_text_bands_flat_image():
+    """A frame without overlay text yields no candidate strips."""
+    from PIL import Image
+    from server.extractor.modules.ocr_engine import find_text_bands
+
+    assert find_text_bands(Image.new("RGB", (320, 240), (128, 128, 128))) == []
+
+
+def test_ocr_worker_pool_reuses_backends():
+    """Backends are created once and served from the idle queue afterwards."""
+    from PIL import Image
+    from server.extractor.modules.ocr_engine import OCRWorkerPool
+
+    created = []
+
+    class FakeBackend:
+        name = "fake"
+
+        def __init__(self):
+            created.append(self)
+
+        def recognize(self, image):
+            return f"{image.size[0]}x{image.size[1]}", None
+
+        def close(self):
+            pass
+
+    pool = OCRWorkerPool(workers=2)
+    with patch.object(pool, "_create_backend", side_effect=FakeBackend):
+        images = [Image.new("L", (10 + i, 5)) for i in range(8)]
+        results = pool.recognize_batch(images)
+        assert pool.recognize(images[0]) == ("10x5", None)
+    pool.close()
+
+    assert [text for text, _ in results] == [f"{10 + i}x5" for i in range(8)]
+    assert 1 <= len(created) <= 2
+
+
+def test_run_ocr_uses_in_memory_strips(tmp_path):
+    """Decodable images are OCR'd from memory, strip by strip, without tesseract on the path."""
+    image_path = tmp_path / "overlay.png"
+    _overlay_image().save(image_path)
+
+    pool = MagicMock()
+    pool.recognize_batch.return_value = [("Lat 12.923974° Long 77.625419°", None)]
+
+    with patch('server.extractor.modules.ocr_burned_metadata.get_ocr_pool', return_value=pool), \
+            patch('server.extractor.modules.ocr_burned_metadata.subprocess.run') as mock_run:
+        extractor = BurnedMetadataExtractor()
+        text = extractor._run_ocr(str(image_path))
+
+    assert text == "Lat 12.923974° Long 77.625419°"
+    crops = pool.recognize_batch.call_args[0][0]
+    assert len(crops) == 1 and crops[0].size[1] < 100
+    assert all('stdout' not in call.args[0] for call in mock_run.call_args_list)
+
+
+def test_tesseract_pipe_backend_batches_strips_into_one_process():
+    """Without tesserocr, all strips of a file share one tesseract invocation."""
+    from PIL import Image
+    from server.extractor.modules.ocr_engine import OCRWorkerPool, _TesseractPipeBackend
+
+    pool = OCRWorkerPool(workers=2)
+    completed = MagicMock(returncode=0, stdout="2024-05-01 10:20\fLat 12.9\f".encode(), stderr=b"")
+    with patch.object(pool, "_create_backend", side_effect=lambda: _TesseractPipeBackend("eng", 5)), \
+            patch('server.extractor.modules.ocr_engine.subprocess.run', return_value=completed) as mock_run:
+        results = pool.recognize_batch([Image.new("L", (40, 10)), Image.new("L", (40, 12))])
+    pool.close()
+
+    assert results == [("2024-05-01 10:20", None), ("Lat 12.9", None)]
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.kwargs["input"][:4] in (b"II*\x00", b"MM\x00*")
@@ -0,0 +1,65 @@
+"""
+Tests for the shared persona field index.
+"""
+
+from server.extractor import persona_interpretation as persona
+from server.extractor.persona_interpretation import (
+    FIELD_ALIASES,
+    MetadataFieldIndex,
+    PersonaInterpreter,
+    add_persona_interpretation,
+    add_persona_interpretations,
+)
+
+
+def test_lookup_keeps_interpreter_precedence():
+    metadata = {
+        "Make": "TopLevel",
+        "EXIF": {"Model": "Nested"},
+        "exif": {"Model": "Engine", "Software": "Lightroom", "EXIF:ISO": 200},
+        "xmp": {"Software": "XmpSoftware"},
+        "forensic": {"md5": "forensic-md5"},
+    }
+    index = MetadataFieldIndex(metadata)
+
+    assert index.lookup(["EXIF:Make", "Make"]) == "TopLevel"
+    assert index.lookup(["EXIF:Model"]) == "Nested"
+    assert index.lookup("software") == "Lightroom"
+    assert index.lookup(["EXIF:ISO"]) == 200
+    # Only forensic-aware interpreters search the forensic section
+    assert index.lookup("md5") is None
+    assert index.lookup("md5", persona.FORENSIC_SECTIONS) == "forensic-md5"
+    # enhance_device_detection only looks at top-level and Category:Key
+    assert index.lookup(["Model"], sections=()) is None
+
+
+def test_in_place_edits_are_seen_by_the_next_call():
+    metadata = {"exif": {"Make": "Canon", "Model": "EOS R5"}}
+    interpreter = PersonaInterpreter(metadata)
+    assert interpreter.field_index.lookup("make") == "Canon"
+
+    metadata["exif"]["Make"] = "Nikon"
+
+    assert PersonaInterpreter(metadata).field_index.lookup("make") == "Nikon"
+    assert PersonaInterpreter(metadata).field_index is not interpreter.field_index
+    result = add_persona_interpretation(metadata, "security_analyst_sam")
+    assert "Nikon" in repr(result["persona_interpretation"])
+    assert "Canon" not in repr(result["persona_interpretation"])
+
+
+def test_all_personas_resolve_through_one_index(monkeypatch):
+    built = []
+    original_build = MetadataFieldIndex._build
+
+    def counting_build(self):
+        built.append(self)
+        original_build(self)
+
+    monkeypatch.setattr(MetadataFieldIndex, "_build", counting_build)
+    metadata = {"exif": {"Make": "Apple", "Model": "iPhone 13", "DateTimeOriginal": "2024:05:01 10:20:30"}}
+
+    result = add_persona_interpretations(metadata, ["phone_photo_sarah", "photographer_peter", "security_analyst_sam"])
+
+    assert len(built) == 1
+    assert set(result["persona_interpretations"]) == {"phone_photo_sarah", "photographer_peter", "security_analyst_sam"}
+    assert all(isinstance(names, tuple) and names for names in FIELD_ALIASES.values())
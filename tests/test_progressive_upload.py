@@ -0,0 +1,166 @@
+"""
+Tests for prefix probes and progressive extraction of growing uploads.
+"""
+
+import asyncio
+import json
+import struct
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from server.extractor.formats.prefix_probes import (
+    NeedMoreData,
+    probe_dicom,
+    probe_isobmff,
+    probe_jpeg,
+)
+from server.extractor.streaming_framework import GrowingFile, ProgressiveExtractor, spool_stream
+
+
+def _segment(marker, payload):
+    return bytes([0xFF, marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _exif_jpeg(scan_bytes=200000):
+    make = b"Canon\x00"
+    model = b"EOS R5 Mark II\x00"
+    ifd = struct.pack("<H", 3)
+    data_offset = 8 + 2 + 3 * 12 + 4
+    ifd += struct.pack("<HHII", 0x010F, 2, len(make), data_offset)
+    ifd += struct.pack("<HHII", 0x0110, 2, len(model), data_offset + len(make))
+    ifd += struct.pack("<HHIHH", 0x0112, 3, 1, 6, 0)
+    ifd += struct.pack("<I", 0)
+    tiff = b"II*\x00" + struct.pack("<I", 8) + ifd + make + model
+    sof = _segment(0xC0, b"\x08" + struct.pack(">HH", 3000, 4000) + b"\x03" + b"\x00" * 9)
+    return (b"\xff\xd8" + _segment(0xE1, b"Exif\x00\x00" + tiff) + sof
+            + _segment(0xDA, b"\x01\x01\x00\x00\x3f\x00") + b"\x11" * scan_bytes + b"\xff\xd9")
+
+
+def _box(kind, payload):
+    return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+
+def _mp4(moov_first, mdat_bytes=50000):
+    mvhd = _box(b"mvhd", b"\x00\x00\x00\x00" + struct.pack(">IIII", 3_700_000_000, 0, 1000, 12500) + b"\x00" * 80)
+    hdlr = _box(b"hdlr", b"\x00" * 8 + b"vide" + b"\x00" * 12)
+    moov = _box(b"moov", mvhd + _box(b"trak", _box(b"mdia", hdlr)))
+    ftyp = _box(b"ftyp", b"isom\x00\x00\x02\x00isommp41")
+    mdat = _box(b"mdat", b"\x00" * mdat_bytes)
+    return ftyp + (moov + mdat if moov_first else mdat + moov)
+
+
+def test_jpeg_probe_asks_for_missing_bytes():
+    data = _exif_jpeg()
+    with pytest.raises(NeedMoreData) as more:
+        probe_jpeg(data[:20])
+    assert more.value.needed > 20
+
+    header = probe_jpeg(data[:more.value.needed + 64])
+    assert header["exif"]["make"] == "Canon"
+    assert header["exif"]["model"] == "EOS R5 Mark II"
+    assert header["exif"]["orientation"] == 6
+    assert (header["width"], header["height"]) == (4000, 3000)
+
+
+def test_isobmff_moov_position():
+    front = probe_isobmff(_mp4(True))
+    assert front["moov_at_front"] and front["movie"]["duration_seconds"] == 12.5
+    assert front["movie"]["tracks"] == [{"handler": "vide"}]
+
+    tail = probe_isobmff(_mp4(False)[:200])
+    assert tail["moov_at_front"] is False and tail["deferred"] == ["moov"]
+
+
+def test_dicom_file_meta():
+    def element(elem, vr, value):
+        return struct.pack("<HH", 2, elem) + vr + struct.pack("<H", len(value)) + value
+    body = element(0x0010, b"UI", b"1.2.840.10008.1.2.1\x00") + element(0x0013, b"SH", b"PYDICOM ")
+    group = struct.pack("<HH", 2, 0) + b"UL" + struct.pack("<HI", 4, len(body))
+    data = b"\x00" * 128 + b"DICM" + group + body + b"\x08\x00\x16\x00"
+
+    header = probe_dicom(data)
+    assert header["transfer_syntax_uid"] == "1.2.840.10008.1.2.1"
+    assert header["implementation_version_name"] == "PYDICOM"
+    assert header["dataset_offset"] == 132 + len(group) + len(body)
+
+
+def _upload(path, data, chunk=4096, delay=0.002):
+    def write():
+        with open(path, "wb") as f:
+            for i in range(0, len(data), chunk):
+                f.write(data[i:i + chunk])
+                f.flush()
+                time.sleep(delay)
+        open(str(path) + GrowingFile.COMPLETE_SUFFIX, "w").close()
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+def test_header_published_before_upload_completes(tmp_path):
+    data = _exif_jpeg()
+    path = tmp_path / "upload.jpg"
+    events = []
+    final_sizes = []
+
+    def final_extractor(p):
+        final_sizes.append(len(open(p, "rb").read()))
+        return {"file": {"size": final_sizes[-1]}}
+
+    writer = _upload(path, data)
+    result = asyncio.run(ProgressiveExtractor().extract_progressive(
+        str(path), on_partial=events.append, final_extractor=final_extractor, idle_timeout=5))
+    writer.join()
+
+    assert [e["stage"] for e in events] == ["header", "complete"]
+    header = events[0]
+    assert header["metadata"]["exif"]["make"] == "Canon"
+    assert not header["upload_complete"] and header["bytes_available"] < len(data)
+    assert final_sizes == [len(data)]
+    assert result["file"]["size"] == len(data)
+    assert result["progressive"]["header_latency_ms"] <= result["progressive"]["complete_latency_ms"]
+
+
+def test_spooled_pipe_with_tail_moov(tmp_path):
+    import io
+    data = _mp4(False)
+    growing = spool_stream(io.BytesIO(data), str(tmp_path / "pipe.mp4"), chunk_size=1024)
+    result = asyncio.run(ProgressiveExtractor().extract_progressive(growing, idle_timeout=5))
+
+    assert result["progressive"]["deferred"] == ["moov"]
+    assert result["progressive"]["final_size"] == len(data)
+
+
+def test_stalled_upload_times_out(tmp_path):
+    path = tmp_path / "stalled.jpg"
+    path.write_bytes(_exif_jpeg()[:10])
+    growing = GrowingFile(str(path), poll_interval=0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(ProgressiveExtractor().extract_progressive(growing, idle_timeout=0.1))
+
+
+def test_cli_reports_idle_upload_as_json(tmp_path):
+    xmp = (b'http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+           b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+           b'<rdf:Description xmlns:xmp="http://ns.adobe.com/xap/1.0/" xmp:CreatorTool="Darktable"/>'
+           b'</rdf:RDF></x:xmpmeta>')
+    path = tmp_path / "partial.jpg"
+    path.write_bytes(b"\xff\xd8" + _segment(0xE1, xmp) + _exif_jpeg(scan_bytes=100)[2:])
+    engine = Path(__file__).resolve().parents[1] / "server" / "extractor" / "comprehensive_metadata_engine.py"
+
+    # Run as a script, the way the extraction route spawns it; no --expected-size
+    completed = subprocess.run(
+        [sys.executable, str(engine), "--progressive", "--upload-timeout", "0.2", "-q", str(path)],
+        capture_output=True, text=True, timeout=120,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout)
+    assert result["error_type"] == "TimeoutError"
+    header = [json.loads(line) for line in completed.stderr.splitlines() if line.startswith('{"stage"')]
+    assert header[0]["metadata"]["xmp"]["creator_tool"] == "Darktable"
@@ -0,0 +1,130 @@
+"""
+Tests for the streaming quantile sketches and their use in monitoring.
+"""
+
+import random
+
+import pytest
+
+from server.extractor.monitoring import ExtractionMetrics, merge_metric_snapshots
+from server.extractor.utils.quantile_sketch import DDSketch, SketchFamily, WindowedSketch, merge_families
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def test_ddsketch_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(5, 1.5) for _ in range(20000)]
+    sketch = DDSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert abs(sketch.quantile(q) - exact) <= 0.011 * exact
+    assert sketch.count == len(values)
+    assert sketch.min == min(values) and sketch.max == max(values)
+
+
+def test_merged_sketches_match_a_single_sketch():
+    rng = random.Random(5)
+    values = [rng.uniform(1, 5000) for _ in range(6000)]
+    whole, left, right = DDSketch(), DDSketch(), DDSketch()
+    for index, value in enumerate(values):
+        whole.add(value)
+        (left if index % 2 else right).add(value)
+
+    merged = DDSketch.from_dict(left.to_dict()).merge(DDSketch.from_dict(right.to_dict()))
+    assert merged.quantiles() == whole.quantiles()
+    assert merged.count == whole.count
+
+
+def test_windowed_sketch_forgets_old_slices_but_keeps_totals():
+    sketch = WindowedSketch(max_age=60, age_buckets=6)
+    for _ in range(100):
+        sketch.add(1000.0, now=1000.0)
+    sketch.add(10.0, now=1065.0)
+
+    window = sketch.window(now=1065.0)
+    assert window.count == 1
+    assert abs(window.quantile(0.99) - 10.0) <= 0.1
+    assert sketch.total_count == 101
+
+
+def test_family_caps_label_values_and_renders_prometheus():
+    family = SketchFamily("test_duration_seconds", "Test latency", "file_type", max_series=2, unit_scale=0.001)
+    family.observe(1500.0, "image/jpeg", now=100.0)
+    family.observe(500.0, "video/mp4", now=100.0)
+    family.observe(250.0, 'weird"type', now=100.0)
+
+    assert set(family.series) == {"image/jpeg", "video/mp4", "other"}
+    text = family.render_prometheus(now=100.0)
+    assert "# TYPE test_duration_seconds summary" in text
+    assert 'test_duration_seconds{file_type="image/jpeg",quantile="0.99"}' in text
+    assert 'test_duration_seconds_count{file_type="other"} 1' in text
+    assert 'test_duration_seconds_sum{file_type="video/mp4"} 0.5' in text
+
+
+def test_extraction_metrics_report_percentiles_and_merge_across_workers():
+    workers = [ExtractionMetrics(max_samples=10), ExtractionMetrics(max_samples=10)]
+    for index in range(200):
+        worker = workers[index % 2]
+        worker.record_extraction(float(index + 1), index % 10 != 0, "free", "image/jpeg",
+                                 error_type="TimeoutError", module_times_ms={"exif": 2.0})
+
+    stats = workers[0].get_statistics()
+    # Counts and averages cover the 10 buffered samples; the sketches cover the time window
+    assert stats["total_extractions"] == 10
+    assert len(workers[0].extraction_times) == 10
+    assert stats["min_processing_time_ms"] == 181.0
+    assert stats["p99_processing_time_ms"] is not None
+    assert stats["latency_by_tier_ms"]["free"]["count"] == 100
+    assert stats["latency_by_module_ms"]["exif"]["count"] == 100
+
+    assert "metaextract_extractions_total 100" in workers[0].render_prometheus()
+
+    merged = merge_families(worker.export_sketches() for worker in workers)
+    fleet = merged["metaextract_extraction_duration_seconds"].quantiles()[""]
+    assert fleet["count"] == 200
+    assert abs(fleet["p50"] - 100) <= 2
+
+    text = merge_metric_snapshots([worker.export_sketches() for worker in workers])
+    assert "metaextract_extraction_duration_seconds_count 200" in text
+    assert 'metaextract_module_duration_seconds_count{module="exif"} 200' in text
+
+
+def test_extraction_statistics_cover_only_buffered_samples():
+    metrics = ExtractionMetrics(max_samples=4)
+    samples = [(50.0, False, "free", "image/png"), (10.0, True, "pro", "image/jpeg"),
+               (40.0, True, "free", "image/jpeg"), (30.0, False, "free", "video/mp4"),
+               (20.0, True, "pro", "image/jpeg"), (60.0, True, "pro", "image/jpeg")]
+    for elapsed, success, tier, file_type in samples:
+        metrics.record_extraction(elapsed, success, tier, file_type)
+
+    def expected(window):
+        times = [elapsed for elapsed, _, _, _ in window]
+        return {
+            "total_extractions": len(window),
+            "successful_extractions": sum(1 for _, ok, _, _ in window if ok),
+            "avg_processing_time_ms": sum(times) / len(times),
+            "min_processing_time_ms": min(times),
+            "max_processing_time_ms": max(times),
+            "tier_usage": {t: [w[2] for w in window].count(t) for t in {w[2] for w in window}},
+            "file_type_usage": {f: [w[3] for w in window].count(f) for f in {w[3] for w in window}},
+        }
+
+    stats = metrics.get_statistics()
+    for key, value in expected(samples[-4:]).items():
+        assert stats[key] == pytest.approx(value), key
+    assert stats["success_rate"] == 0.75
+
+    # Samples shed under memory pressure leave the window too
+    for buffer in (metrics.extraction_times, metrics.extraction_results,
+                   metrics.extraction_tiers, metrics.extraction_file_types):
+        buffer.shed(0.5)
+    stats = metrics.get_statistics()
+    for key, value in expected(samples[-2:]).items():
+        assert stats[key] == pytest.approx(value), key
@@ -0,0 +1,106 @@
+"""
+Tests for the constant-memory sliding-window rate limiter.
+"""
+
+import threading
+
+from server.extractor.rate_limiting import (
+    AdaptiveRateLimiter,
+    LocalRateLimitBackend,
+    RateLimitConfig,
+    RateLimitTier,
+    SlidingWindowCounter,
+)
+
+T0 = 1_700_000_040.0  # aligned to the minute
+
+
+def _limiter(minute=10, hour=100, day=500, burst=5, **backend_kwargs):
+    limiter = AdaptiveRateLimiter(LocalRateLimitBackend(**backend_kwargs))
+    limiter.configs[RateLimitTier.FREE] = RateLimitConfig(minute, hour, day, burst)
+    return limiter
+
+
+def test_burst_and_minute_limits():
+    limiter = _limiter()
+    results = [limiter.is_allowed("c", current_time=T0 + i * 0.01)[0] for i in range(7)]
+    assert results == [True] * 5 + [False] * 2
+
+    allowed, info = limiter.is_allowed("c", current_time=T0 + 0.5)
+    assert not allowed
+    assert info["burst_remaining"] == 0 and info["minute_remaining"] == 5
+    assert info["limits_exceeded"] == {"burst": 0}
+
+    # Once the burst window has slid past, the minute window caps at 10
+    results = [limiter.is_allowed("c", current_time=T0 + 2 + i * 0.25)[0] for i in range(8)]
+    assert results == [True] * 5 + [False] * 3
+    allowed, info = limiter.is_allowed("c", current_time=T0 + 30)
+    assert not allowed and "minute" in info["limits_exceeded"]
+
+    # Clients and endpoints are limited independently
+    assert limiter.is_allowed("other", current_time=T0 + 30)[0]
+    assert limiter.is_allowed("c", endpoint="/api/other", current_time=T0 + 30)[0]
+
+
+def test_sliding_window_weights_previous_bucket():
+    counter = SlidingWindowCounter(60)
+    for _ in range(10):
+        counter.add(T0 + 50)
+    assert counter.count(T0 + 59) == 10
+    assert counter.count(T0 + 60) == 10  # new bucket, previous fully overlapping
+    assert counter.count(T0 + 90) == 5
+    assert counter.count(T0 + 119) == 0
+    assert counter.count(T0 + 200) == 0
+
+    limiter = _limiter(minute=10, burst=100)
+    for i in range(10):
+        assert limiter.is_allowed("c", current_time=T0 + 50 + i * 0.1)[0]
+    # A quarter into the next bucket, 3/4 of the previous one still counts: 7 + 3 new
+    results = [limiter.is_allowed("c", current_time=T0 + 75 + i * 0.1)[0] for i in range(4)]
+    assert results == [True] * 3 + [False]
+
+
+def test_state_is_constant_size_and_idle_clients_are_evicted():
+    limiter = _limiter(minute=10**6, hour=10**6, day=10**6, burst=10**6, idle_ttl=3600, sweep_interval=60)
+    for i in range(20000):
+        limiter.is_allowed("busy", current_time=T0 + i * 0.001)
+    assert limiter.backend.peek("busy:*", T0 + 20)[:3] == [20000, 20000, 20000]
+    assert not hasattr(limiter.clients["busy:*"], "__dict__")  # fixed slots, no per-request storage
+
+    limiter.is_allowed("idle", current_time=T0)
+    limiter.is_allowed("busy", current_time=T0 + 3000)
+    limiter.is_allowed("busy", current_time=T0 + 3700)  # past sweep_interval: sweeps
+    assert set(limiter.clients) == {"busy:*"}
+    assert limiter.backend.evict_idle(T0 + 10**6) == 1
+    assert limiter.clients == {}
+    assert limiter.get_usage_stats("busy") == {
+        "minute_requests": 0, "hour_requests": 0, "day_requests": 0, "burst_requests": 0,
+    }
+
+
+def test_concurrent_requests_never_exceed_the_limit():
+    limiter = _limiter(minute=1000, hour=1000, day=1000, burst=1000, lock_stripes=4)
+    allowed = []
+
+    def worker():
+        granted = 0
+        for _ in range(500):
+            granted += limiter.is_allowed("shared", current_time=T0 + 1)[0]
+        allowed.append(granted)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(allowed) == 1000
+
+
+def test_health_updates_rescale_limits():
+    limiter = _limiter(minute=100, hour=1000, day=5000, burst=20)
+    assert limiter._get_adjusted_config(RateLimitTier.FREE).burst_limit == 20
+    limiter.update_system_health(error_rate=5.0, avg_response_time=0, active_connections=0,
+                                 cpu_usage=0, memory_usage=0)
+    assert limiter._get_adjusted_config(RateLimitTier.FREE).burst_limit == 10
+    reset = limiter.get_reset_times("nobody")
+    assert reset == {"minute": 0, "hour": 0, "day": 0, "burst": 0}
@@ -0,0 +1,171 @@
+"""
+Tests for the header-only container segment directory.
+"""
+
+import struct
+import zlib
+
+from server.extractor.formats import segment_directory as sd
+from server.extractor.formats.jpeg_markers import extract_jpeg_container_metadata
+from server.extractor.formats.png_chunks import extract_png_container_metadata
+from server.extractor.modules.ai_generation_detector import AIGenerationDetector
+from server.extractor.modules.png_chunks import extract_png_chunks
+from server.extractor.modules.xmp_extended import ExtendedXMPExtractor
+
+XMP = '<x:xmpmeta xmlns:x="adobe:ns:meta/"><rdf:RDF/></x:xmpmeta>'
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _write_png(path, idat_size=50_000):
+    ihdr = struct.pack(">IIBBBBB", 64, 32, 8, 2, 0, 0, 0)
+    itxt = b"XML:com.adobe.xmp\x00\x00\x00\x00\x00" + XMP.encode()
+    body = (
+        sd.PNG_SIGNATURE
+        + _png_chunk(b"IHDR", ihdr)
+        + _png_chunk(b"tEXt", b"parameters\x00a cat, Steps: 20, Sampler: Euler")
+        + _png_chunk(b"iTXt", itxt)
+        + _png_chunk(b"zTXt", b"Comment\x00\x00" + zlib.compress(b"hello"))
+        + _png_chunk(b"IDAT", b"\x00" * idat_size)
+        + _png_chunk(b"IEND", b"")
+    )
+    path.write_bytes(body)
+    return body
+
+
+def _jpeg_segment(marker, payload):
+    return bytes([0xFF, marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _write_jpeg(path):
+    sof = bytes([8]) + struct.pack(">HH", 480, 640) + bytes([3]) + b"\x01\x11\x00" * 3
+    path.write_bytes(
+        b"\xff\xd8"
+        + _jpeg_segment(0xE0, b"JFIF\x00\x01\x02\x00\x00\x48\x00\x48\x00\x00")
+        + _jpeg_segment(0xE1, b"Exif\x00\x00" + b"MM\x00*" + b"\x00" * 40)
+        + _jpeg_segment(0xE1, b"http://ns.adobe.com/xap/1.0/\x00" + XMP.encode())
+        + _jpeg_segment(0xC0, sof)
+        + _jpeg_segment(0xDA, b"\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00")
+        + b"\x12\x34" * 1000 + b"\xff\xd9"
+    )
+
+
+def _riff_chunk(fourcc, data):
+    return fourcc + struct.pack("<I", len(data)) + data + (b"\x00" if len(data) % 2 else b"")
+
+
+def test_png_walk_labels_and_ranged_reads(tmp_path):
+    path = tmp_path / "gen.png"
+    _write_png(path)
+
+    d = sd.build_segment_directory(str(path))
+
+    assert d.container == "PNG"
+    assert [s.kind for s in d] == ["IHDR", "tEXt", "iTXt", "zTXt", "IDAT", "IEND"]
+    assert d.find("iTXt").label == "XML:com.adobe.xmp"
+    assert d.find("IDAT").length == 50_000
+    assert d.read(d.find("tEXt"), max_bytes=10) == b"parameters"
+    assert sd.read_png_text(d) == {
+        "parameters": "a cat, Steps: 20, Sampler: Euler",
+        "XML:com.adobe.xmp": XMP,
+        "Comment": "hello",
+    }
+    assert {s.crc for s in d} == {"unchecked"}
+
+
+def test_png_crc_verification_and_truncation(tmp_path):
+    path = tmp_path / "gen.png"
+    body = bytearray(_write_png(path))
+    body[-30] ^= 0xFF  # inside IDAT
+    path.write_bytes(bytes(body))
+
+    d = sd.build_segment_directory(str(path))
+    assert d.verify_crc() == {"ok": 5, "bad": 1}
+    assert d.find("IDAT").crc == "bad"
+
+    cut = tmp_path / "cut.png"
+    cut.write_bytes(bytes(body[:2000]))
+    truncated = sd.build_segment_directory(str(cut))
+    assert truncated.truncated
+    assert truncated.segment(len(truncated) - 1).kind == "IDAT"
+
+
+def test_jpeg_walk_stops_at_scan(tmp_path):
+    path = tmp_path / "photo.jpg"
+    _write_jpeg(path)
+
+    d = sd.build_segment_directory(str(path))
+
+    assert [s.kind for s in d] == ["APP0", "APP1", "APP1", "SOF0", "SOS"]
+    assert [s.label for s in d.find_all("APP1")] == ["Exif", "http://ns.adobe.com/xap/1.0/"]
+    meta = extract_jpeg_container_metadata(str(path))
+    assert meta["sof"]["width"] == 640 and meta["sof"]["height"] == 480
+    assert meta["jfif"]["x_density"] == 72
+    assert meta["exif_app1"]["size_bytes"] == 50
+    assert meta["xmp_app1"]["size_bytes"] == len(XMP)
+    assert meta["segments_scanned"] == 5
+
+
+def test_riff_and_tiff_walks(tmp_path):
+    webp = tmp_path / "img.webp"
+    body = (_riff_chunk(b"VP8X", b"\x08" + b"\x00" * 9) + _riff_chunk(b"VP8 ", b"\x00" * 31)
+            + _riff_chunk(b"LIST", b"INFO" + _riff_chunk(b"ISFT", b"tool\x00"))
+            + _riff_chunk(b"EXIF", b"MM\x00*\x00\x00\x00\x08"))
+    webp.write_bytes(b"RIFF" + struct.pack("<I", 4 + len(body)) + b"WEBP" + body)
+
+    d = sd.build_segment_directory(str(webp))
+    assert d.form == "WEBP"
+    assert [s.kind for s in d] == ["VP8X", "VP8 ", "LIST", "ISFT", "EXIF"]
+    assert d.find("LIST").label == "INFO"
+    assert d.read(d.find("EXIF")) == b"MM\x00*\x00\x00\x00\x08"
+
+    tiff = tmp_path / "img.tif"
+    xmp = XMP.encode()
+    ifd = struct.pack("<H", 2) + struct.pack("<HHII", 256, 4, 1, 64) + struct.pack("<HHII", 700, 1, len(xmp), 38) + b"\x00" * 4
+    tiff.write_bytes(b"II*\x00" + struct.pack("<I", 8) + ifd + xmp)
+
+    t = sd.build_segment_directory(str(tiff))
+    assert t.form == "II"
+    assert [(s.kind, s.label) for s in t] == [("IFD", "IFD0"), ("TAG", "XMP")]
+    assert t.read(t.find("TAG", label="XMP")) == xmp
+
+
+def test_cache_rebuilds_when_file_changes(tmp_path):
+    sd.clear_segment_cache()
+    path = tmp_path / "gen.png"
+    _write_png(path)
+
+    first = sd.get_segment_directory(str(path))
+    assert sd.get_segment_directory(str(path)) is first
+
+    _write_png(path, idat_size=10)
+    rebuilt = sd.get_segment_directory(str(path))
+    assert rebuilt is not first
+    assert rebuilt.find("IDAT").length == 10
+    assert sd.get_segment_directory(str(tmp_path / "missing.png")) is None
+
+
+def test_consumers_read_through_directory(tmp_path):
+    path = tmp_path / "gen.png"
+    _write_png(path)
+
+    container = extract_png_container_metadata(str(path))
+    assert container["ihdr"]["width"] == 64
+    assert container["chunks_total"] == 6
+    assert container["text"]["iTXt_keys"] == ["XML:com.adobe.xmp"]
+    assert container["text"]["zTXt_keys"] == ["Comment"]
+
+    chunks = extract_png_chunks(str(path))
+    assert chunks["chunk_count"] == 6
+    assert chunks["chunk_types"]["IDAT"] == 1
+
+    detector = AIGenerationDetector(str(path))
+    detector._load_file_data()
+    assert detector.png_text_chunks["parameters"].startswith("a cat")
+    assert detector.xmp_data == XMP
+
+    extractor = ExtendedXMPExtractor(str(path))
+    extractor._load_xmp()
+    assert extractor.xmp_data == XMP
@@ -0,0 +1,168 @@
+"""
+Tests for the native GPMF/DJI telemetry decoder.
+"""
+
+import struct
+
+import numpy as np
+
+from server.extractor.modules import telemetry_decoder as td
+from server.extractor.modules import video_telemetry as vt
+
+
+def _box(box_type, payload):
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _full_box(box_type, payload, version=0):
+    return _box(box_type, bytes([version, 0, 0, 0]) + payload)
+
+
+def _klv(key, type_char, struct_size, items, payload):
+    header = key + type_char + bytes([struct_size]) + struct.pack(">H", items)
+    return header + payload + b"\x00" * (-len(payload) % 4)
+
+
+def _gpmf_sample(second, points=10, fix=3):
+    lat = 37.0 + second * 0.001 + np.arange(points) * 0.0001
+    lon = np.full(points, -122.0)
+    alt = np.full(points, 100.0 + second)
+    gps = np.stack([lat * 1e7, lon * 1e7, alt * 1000, np.full(points, 5000), np.full(points, 5000)], axis=1)
+    gps_payload = gps.astype(">i4").tobytes()
+    scal = np.array([10000000, 10000000, 1000, 1000, 100], dtype=">i4").tobytes()
+    gps_stream = (
+        _klv(b"SCAL", b"l", 4, 5, scal)
+        + _klv(b"GPSF", b"L", 4, 1, struct.pack(">I", fix))
+        + _klv(b"GPS5", b"l", 20, points, gps_payload)
+    )
+    accl = np.tile(np.array([0, 0, 4180], dtype=">i2"), (20, 1)).tobytes()
+    accl_stream = (
+        _klv(b"SCAL", b"s", 2, 1, struct.pack(">h", 418))
+        + _klv(b"SIUN", b"c", 4, 1, b"m/s2")
+        + _klv(b"ACCL", b"s", 6, 20, accl)
+    )
+    devc = _klv(b"STRM", b"\x00", 4, len(gps_stream) // 4, gps_stream) + _klv(
+        b"STRM", b"\x00", 4, len(accl_stream) // 4, accl_stream
+    )
+    return _klv(b"DEVC", b"\x00", 4, len(devc) // 4, devc)
+
+
+def _mp4_with_gpmd(path, seconds=5, fixes=None):
+    samples = [_gpmf_sample(i, fix=fixes[i] if fixes else 3) for i in range(seconds)]
+    ftyp = _box(b"ftyp", b"mp41\x00\x00\x00\x00mp41")
+    mdat_payload = b"".join(samples)
+    data_start = len(ftyp) + 8
+    offsets, pos = [], data_start
+    for sample in samples:
+        offsets.append(pos)
+        pos += len(sample)
+
+    stsd = _full_box(b"stsd", struct.pack(">I", 1) + _box(b"gpmd", b"\x00" * 8))
+    stts = _full_box(b"stts", struct.pack(">III", 1, seconds, 1000))
+    stsc = _full_box(b"stsc", struct.pack(">IIII", 1, 1, 1, 1))
+    stsz = _full_box(b"stsz", struct.pack(">II", 0, seconds) + b"".join(struct.pack(">I", len(s)) for s in samples))
+    stco = _full_box(b"stco", struct.pack(">I", seconds) + b"".join(struct.pack(">I", o) for o in offsets))
+    stbl = _box(b"stbl", stsd + stts + stsc + stsz + stco)
+    minf = _box(b"minf", stbl)
+    hdlr = _full_box(b"hdlr", b"\x00" * 4 + b"meta" + b"\x00" * 12 + b"GoPro MET\x00")
+    mdhd = _full_box(b"mdhd", struct.pack(">IIII", 0, 0, 1000, seconds * 1000) + b"\x00" * 4)
+    tkhd = _full_box(b"tkhd", struct.pack(">III", 0, 0, 4) + b"\x00" * 68)
+    trak = _box(b"trak", tkhd + _box(b"mdia", mdhd + hdlr + minf))
+    moov = _box(b"moov", trak)
+
+    with open(path, "wb") as f:
+        f.write(ftyp + _box(b"mdat", mdat_payload) + moov)
+
+
+def test_decodes_gpmd_track_into_columns(tmp_path):
+    video = tmp_path / "GX010001.MP4"
+    _mp4_with_gpmd(video, seconds=5)
+
+    data = td.read_telemetry(str(video))
+
+    assert data.sources == ["gpmf"]
+    assert data.tracks[0].sample_format == "gpmd"
+    assert data.gps_points == 50
+    assert np.isclose(data.gps["latitude"][0], 37.0)
+    assert np.isclose(data.gps["altitude"][-1], 104.0)
+    assert np.isclose(data.gps["time"][11], 1.1)
+    accel = data.imu["accelerometer"].summary()
+    assert accel["samples"] == 100
+    assert accel["units"] == "m/s2"
+    assert np.isclose(accel["mean"][2], 10.0)
+
+
+def test_gps_blocks_without_fix_are_dropped_and_not_counted(tmp_path):
+    video = tmp_path / "GX010002.MP4"
+    _mp4_with_gpmd(video, seconds=5, fixes=[3, 0, 3, 3, 0])
+
+    data = td.read_telemetry(str(video))
+
+    assert data.gps_points == 30
+    assert data.streams["GPS5"]["samples"] == 30
+    assert data.streams["GPS5"]["raw_samples"] == 50
+    assert data.streams["ACCL"]["samples"] == data.streams["ACCL"]["raw_samples"] == 100
+
+
+def test_flight_metrics_and_simplification(tmp_path):
+    video = tmp_path / "GX010002.MP4"
+    _mp4_with_gpmd(video, seconds=5)
+
+    summary = td.summarize_telemetry(td.read_telemetry(str(video)), simplify_epsilon_m=1.0)
+    metrics = summary["flight_metrics"]
+
+    assert metrics["points"] == 50
+    assert metrics["altitude"]["gain_m"] == 4.0
+    assert metrics["max_speed_mps"] == 5.0
+    assert 400 < metrics["total_distance_m"] < 600
+    assert summary["gps"]["bounds"]["min_lat"] == summary["gps"]["latitude"]["min"]
+    # Points move along one meridian, so the simplified track is just its ends
+    assert len(summary["simplified_track"]["points"]) == 2
+
+
+def test_douglas_peucker_keeps_corners():
+    lat = np.array([0.0, 0.0, 0.0, 0.001, 0.002])
+    lon = np.array([0.0, 0.001, 0.002, 0.002, 0.002])
+
+    assert td.douglas_peucker(lat, lon, 1.0).tolist() == [0, 2, 4]
+
+
+def test_dji_srt_layouts():
+    text = (
+        "1\n00:00:00,000 --> 00:00:00,033\n<font size=\"28\">FrameCnt: 1\n"
+        "[iso : 100] [latitude: 22.543210] [longitude: 113.950000] [rel_alt: 1.200 abs_alt: 57.300]</font>\n\n"
+        "2\n00:00:01,000 --> 00:00:01,033\nHOME(113.9500,22.5430) GPS(113.9501,22.5433,19) BAROMETER:1.5\n"
+    )
+
+    rows = td.parse_dji_srt(text)
+
+    assert rows.shape == (2, len(td.GPS_COLUMNS))
+    assert rows[0, 1:4].tolist() == [22.54321, 113.95, 57.3]
+    assert rows[1, :4].tolist() == [1.0, 22.5433, 113.9501, 19.0]
+
+
+def test_sidecar_srt_and_video_telemetry_summary(tmp_path):
+    video = tmp_path / "DJI_0001.MP4"
+    video.write_bytes(_box(b"ftyp", b"isom\x00\x00\x00\x00isom") + _box(b"mdat", b"\x00" * 16))
+    cues = "".join(
+        f"{i + 1}\n00:00:0{i},000 --> 00:00:0{i},033\n[latitude: {22.5 + i * 0.0001:.6f}] "
+        f"[longitude: 113.9] [rel_alt: 1.0 abs_alt: {50 + i}.0]\n\n"
+        for i in range(4)
+    )
+    (tmp_path / "DJI_0001.SRT").write_text(cues)
+
+    telemetry = vt.extract_video_telemetry(str(video))
+
+    assert telemetry["decoder"] == "native"
+    assert telemetry["sources"] == ["dji_srt"]
+    assert telemetry["gps"]["latitude"]["count"] == 4
+    assert telemetry["gps"]["bounds"]["max_alt"] == 53.0
+    assert telemetry["flight_metrics"]["altitude"]["gain_m"] == 3.0
+
+
+def test_non_video_files_are_ignored(tmp_path):
+    other = tmp_path / "notes.mp4"
+    other.write_bytes(b"not an mp4 container at all")
+
+    assert td.read_telemetry(str(other)) is None
+    assert td.read_telemetry(str(tmp_path / "missing.mp4")) is None
@@ -0,0 +1,172 @@
+"""
+Tests for the streaming GeoJSON/KML/Shapefile scanner.
+"""
+
+import json
+import struct
+import zipfile
+
+from server.extractor.modules import vector_gis_stream
+from server.extractor.modules.geospatial_extractor import extract_geospatial_metadata
+from server.extractor.modules.geospatial_gis import _extract_geojson_metadata
+from server.extractor.modules.vector_gis_stream import (
+    GeometryStats,
+    scan_geojson,
+    scan_kml,
+    scan_kmz,
+    scan_shapefile,
+)
+
+KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+ <Document>
+  <name>Trails</name>
+  <description><![CDATA[Hiking <b>routes</b>]]></description>
+  <Style id="red"/>
+  <Folder>
+   <Placemark><name>Summit</name><Point><coordinates>10.5,60.25,1200</coordinates></Point></Placemark>
+   <Placemark>
+    <LineString><coordinates>
+      10.0,60.0 10.2,60.1
+      10.4,60.3
+    </coordinates></LineString>
+   </Placemark>
+   <Placemark>
+    <Polygon><outerBoundaryIs><LinearRing><coordinates>
+      9,59 11,59 11,61 9,59
+    </coordinates></LinearRing></outerBoundaryIs></Polygon>
+   </Placemark>
+  </Folder>
+ </Document>
+</kml>"""
+
+
+def _write_collection(path, count):
+    with open(path, "w") as f:
+        f.write('{"type": "FeatureCollection", "name": "pts", "features": [')
+        for i in range(count):
+            if i:
+                f.write(",\n")
+            json.dump({"type": "Feature", "properties": {"id": i, "tag": "x"},
+                       "geometry": {"type": "Point", "coordinates": [i % 360 - 180 + 0.5, (i % 170) - 85.0]}}, f)
+        f.write(',{"type": "Feature", "properties": {}, "geometry": null}')
+        f.write(',{"type": "Feature", "properties": {"road": 1}, "geometry": '
+                '{"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3.5]]]}}')
+        f.write('], "bbox": [-180, -85, 180, 85]}')
+
+
+def test_geojson_streams_features_in_small_blocks(tmp_path, monkeypatch):
+    path = tmp_path / "points.geojson"
+    _write_collection(path, 5000)
+    # Tiny read blocks force values to straddle buffer edges
+    monkeypatch.setattr(vector_gis_stream, "READ_BLOCK", 97)
+
+    scan = scan_geojson(str(path), grid=(4, 2))
+    stats = scan["stats"]
+
+    assert scan["type"] == "FeatureCollection"
+    assert scan["name"] == "pts"
+    assert scan["declared_bbox"] == [-180, -85, 180, 85]
+    assert stats["feature_count"] == 5002
+    assert stats["geometry_types"] == {"Point": 5000, "MultiLineString": 1}
+    assert stats["null_geometries"] == 1
+    assert stats["vertex_count"] == 5004
+    assert stats["max_feature_vertices"] == 4
+    assert stats["bbox"] == [-179.5, -85.0, 179.5, 84.0]
+    assert stats["property_fields"] == ["id", "tag", "road"]
+    assert sum(map(sum, stats["grid"]["counts"])) == 5004
+
+
+def test_vertex_chunks_are_reduced_incrementally():
+    stats = GeometryStats(chunk_size=100)
+    for i in range(1000):
+        stats.add_geometry({"type": "LineString", "coordinates": [[i, -i], [i + 1, -i - 1]]})
+
+    summary = stats.summary()
+    assert stats.chunks_reduced == 20
+    assert summary["bbox"] == [0.0, -1000.0, 1000.0, 0.0]
+    assert summary["vertices_by_type"] == {"LineString": 2000}
+
+
+def test_single_feature_and_newline_delimited(tmp_path):
+    path = tmp_path / "lines.geojsonl"
+    path.write_text("\n".join(json.dumps({"type": "Feature", "properties": {"n": i},
+                                          "geometry": {"type": "Point", "coordinates": [i, i]}})
+                              for i in range(3)))
+
+    scan = scan_geojson(str(path))
+    assert scan["stats"]["feature_count"] == 3
+    assert scan["stats"]["bbox"] == [0.0, 0.0, 2.0, 2.0]
+
+
+def test_kml_and_kmz_iterparse(tmp_path):
+    kml = tmp_path / "trails.kml"
+    kml.write_text(KML)
+    kmz = tmp_path / "trails.kmz"
+    with zipfile.ZipFile(kmz, "w") as z:
+        z.writestr("doc.kml", KML)
+
+    scan = scan_kml(str(kml))
+    assert scan["version"] == "2.2"
+    assert scan["name"] == "Trails"
+    assert scan["description"] == "Hiking <b>routes</b>"
+    assert scan["counts"]["Placemark"] == 3
+    assert scan["stats"]["geometry_types"] == {"Point": 1, "LineString": 1, "Polygon": 1}
+    assert scan["stats"]["vertices_by_type"] == {"Point": 1, "LineString": 3, "Polygon": 4}
+    assert scan["stats"]["bbox"] == [9.0, 59.0, 11.0, 61.0]
+    assert scan_kmz(str(kmz))["stats"] == scan["stats"]
+
+    result = extract_geospatial_metadata(str(kmz))
+    assert result["kml_metadata"]["placemark_count"] == 3
+    assert result["kml_metadata"]["bounds"] == [9.0, 59.0, 11.0, 61.0]
+
+
+def _write_point_shapefile(base, points):
+    records = b""
+    for i, (x, y) in enumerate(points):
+        content = struct.pack("<i2d", 1, x, y)
+        records += struct.pack(">2i", i + 1, len(content) // 2) + content
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+
+    def header(length):
+        return (struct.pack(">7i", 9994, 0, 0, 0, 0, 0, length // 2)
+                + struct.pack("<2i", 1000, 1)
+                + struct.pack("<8d", min(xs), min(ys), max(xs), max(ys), 0, 0, 0, 0))
+
+    (base.with_suffix(".shp")).write_bytes(header(100 + len(records)) + records)
+    (base.with_suffix(".shx")).write_bytes(header(100 + 8 * len(points)) + b"\x00" * 8 * len(points))
+    field = b"NAME".ljust(11, b"\x00") + b"C" + b"\x00" * 4 + bytes([20, 0]) + b"\x00" * 14
+    dbf = struct.pack("<BBBBIHH", 3, 124, 1, 1, len(points), 65, 21) + b"\x00" * 20 + field + b"\x0d"
+    (base.with_suffix(".dbf")).write_bytes(dbf)
+
+
+def test_shapefile_headers_and_record_grid(tmp_path):
+    base = tmp_path / "wells"
+    _write_point_shapefile(base, [(0.0, 0.0), (10.0, 5.0), (9.0, 4.0)])
+
+    scan = scan_shapefile(str(base.with_suffix(".shp")), grid=(2, 1))
+
+    assert scan["shape_type_name"] == "POINT"
+    assert scan["bbox"] == [0.0, 0.0, 10.0, 5.0]
+    assert scan["record_count"] == 3
+    assert scan["dbf"]["record_count"] == 3
+    assert scan["dbf"]["fields"] == [{"name": "NAME", "type": "C", "length": 20, "decimals": 0}]
+    assert scan["record_grid"]["counts"] == [[1, 2]]
+
+    with zipfile.ZipFile(tmp_path / "wells.zip", "w") as z:
+        for ext in (".shp", ".shx", ".dbf"):
+            z.write(base.with_suffix(ext), "wells" + ext)
+    zipped = scan_shapefile(str(tmp_path / "wells.zip"))
+    assert zipped["record_count"] == 3 and zipped["shape_type_name"] == "POINT"
+
+
+def test_geospatial_gis_reads_past_first_100kb(tmp_path):
+    path = tmp_path / "big.geojson"
+    _write_collection(path, 3000)
+    assert path.stat().st_size > 100000
+
+    data = _extract_geojson_metadata(str(path))
+
+    assert "geospatial_geojson_extraction_error" not in data
+    assert data["geospatial_geojson_feature_count"] == 3002
+    assert data["geospatial_geojson_vertex_count"] == 3004
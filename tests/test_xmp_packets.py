@@ -0,0 +1,165 @@
+"""
+Tests for the shared parse-once XMP packet table.
+"""
+
+import struct
+import zlib
+
+from server.extractor.metadata_engine import extract_xmp_metadata
+from server.extractor.modules.edit_history import EditHistoryAnalyzer
+from server.extractor.modules.iptc_xmp_fallback import extract_xmp_fallback
+from server.extractor.modules.xmp_extended import ExtendedXMPExtractor
+from server.extractor.modules.xmp_packets import (
+    clear_xmp_cache,
+    get_xmp_table,
+    parse_xmp_packet,
+)
+
+STANDARD = """<?xpacket begin="﻿" id="W5M0MpCehiHzreSzNTczkc9d"?>
+<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about=""
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:xmp="http://ns.adobe.com/xap/1.0/"
+    xmlns:photoshop="http://ns.adobe.com/photoshop/1.0/"
+    xmlns:crs="http://ns.adobe.com/camera-raw-settings/1.0/"
+    xmlns:xmpNote="http://ns.adobe.com/xmp/note/"
+    xmlns:Iptc4xmpCore="http://iptc.org/std/Iptc4xmpCore/1.0/xmlns/"
+    xmp:CreatorTool="Adobe Lightroom Classic 12.0"
+    photoshop:Headline="Harbour at dawn"
+    crs:Exposure2012="+0.35"
+    crs:HasCrop="True"
+    xmpNote:HasExtendedXMP="{guid}">
+   <dc:title><rdf:Alt><rdf:li xml:lang="x-default">Harbour</rdf:li></rdf:Alt></dc:title>
+   <dc:subject><rdf:Bag><rdf:li>boats</rdf:li><rdf:li>sunrise</rdf:li></rdf:Bag></dc:subject>
+   <Iptc4xmpCore:CreatorContactInfo rdf:parseType="Resource">
+    <Iptc4xmpCore:CiAdrCity>Oslo</Iptc4xmpCore:CiAdrCity>
+   </Iptc4xmpCore:CreatorContactInfo>
+  </rdf:Description>
+ </rdf:RDF>
+</x:xmpmeta>
+<?xpacket end="w"?>"""
+
+EXTENDED = """<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about=""
+    xmlns:xmpMM="http://ns.adobe.com/xap/1.0/mm/"
+    xmlns:stEvt="http://ns.adobe.com/xap/1.0/sType/ResourceEvent#">
+   <xmpMM:History><rdf:Seq>
+    <rdf:li stEvt:action="derived" stEvt:softwareAgent="Adobe Lightroom Classic 12.0"/>
+    <rdf:li rdf:parseType="Resource">
+     <stEvt:action>saved</stEvt:action>
+     <stEvt:softwareAgent>Adobe Photoshop 24.0</stEvt:softwareAgent>
+    </rdf:li>
+   </rdf:Seq></xmpMM:History>
+  </rdf:Description>
+ </rdf:RDF>
+</x:xmpmeta>""" + " " * 4000
+
+GUID = "0123456789ABCDEF0123456789ABCDEF"
+
+
+def _app1(payload):
+    return b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _jpeg_with_extended_xmp(path, chunk_size=1500):
+    standard = STANDARD.replace("{guid}", GUID).encode("utf-8")
+    extended = EXTENDED.encode("utf-8")
+    data = b"\xff\xd8" + _app1(b"http://ns.adobe.com/xap/1.0/\x00" + standard)
+    # Chunks written out of order; the offsets place them
+    offsets = list(range(0, len(extended), chunk_size))[::-1]
+    for offset in offsets:
+        data += _app1(b"http://ns.adobe.com/xmp/extension/\x00" + GUID.encode()
+                      + struct.pack(">II", len(extended), offset)
+                      + extended[offset:offset + chunk_size])
+    # An extension from another GUID must not be merged
+    stray = EXTENDED.replace("derived", "stray").encode()
+    data += _app1(b"http://ns.adobe.com/xmp/extension/\x00" + b"F" * 32
+                  + struct.pack(">II", len(stray), 0) + stray[:60000])
+    data += b"\xff\xda\x00\x02" + b"\x00" * 16 + b"\xff\xd9"
+    path.write_bytes(data)
+
+
+def _png_with_xmp(path, xmp):
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+    itxt = b"XML:com.adobe.xmp\x00\x00\x00\x00\x00" + xmp.encode("utf-8")
+    ihdr = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"iTXt", itxt)
+                     + chunk(b"IDAT", zlib.compress(b"\x00\x00\x00\x00")) + chunk(b"IEND", b""))
+
+
+def test_parse_packet_into_namespace_table():
+    table = parse_xmp_packet(STANDARD.encode("utf-8"))
+
+    assert not table.errors
+    assert table.text("photoshop:Headline") == "Harbour at dawn"
+    assert table.text("dc:title") == "Harbour"
+    assert table.values("dc:subject") == ["boats", "sunrise"]
+    assert table.get("http://purl.org/dc/elements/1.1/", "subject") == ["boats", "sunrise"]
+    assert table.get("Iptc4xmpCore:CreatorContactInfo") == {"CiAdrCity": "Oslo"}
+    assert table.get("crs:hascrop", ignore_case=True) == "True"
+    assert table.find_local("creatortool") == "Adobe Lightroom Classic 12.0"
+    assert table.prefixes["crs"] == "http://ns.adobe.com/camera-raw-settings/1.0/"
+    # libxmp-style reads used by the metadata engine
+    assert table.count_array_items("http://purl.org/dc/elements/1.1/", "subject") == 2
+    assert table.get_array_item("http://purl.org/dc/elements/1.1/", "subject", 2) == "sunrise"
+
+
+def test_jpeg_extended_xmp_is_reassembled(tmp_path):
+    path = tmp_path / "photo.jpg"
+    _jpeg_with_extended_xmp(path)
+    clear_xmp_cache()
+
+    table = get_xmp_table(str(path))
+
+    assert [p["source"] for p in table.packets] == ["jpeg_app1", "jpeg_extended:" + GUID]
+    history = table.get("xmpMM:History")
+    assert [e["action"] for e in history] == ["derived", "saved"]
+    assert history[1]["softwareAgent"] == "Adobe Photoshop 24.0"
+    assert get_xmp_table(str(path)) is table
+
+
+def test_consumers_share_the_table(tmp_path):
+    path = tmp_path / "photo.jpg"
+    _jpeg_with_extended_xmp(path)
+    clear_xmp_cache()
+
+    engine = extract_xmp_metadata(str(path))
+    assert engine["fields"]["title"] == "Harbour"
+    assert engine["fields"]["keywords"] == ["boats", "sunrise"]
+    assert engine["fields"]["creator_tool"] == "Adobe Lightroom Classic 12.0"
+
+    extended = ExtendedXMPExtractor(str(path)).extract()
+    assert extended["xmp_present"]
+    assert extended["camera_raw"]["exposure_2012"] == 0.35
+    assert extended["photoshop_extended"]["headline"] == "Harbour at dawn"
+
+    history = EditHistoryAnalyzer(str(path)).analyze()
+    assert [h["action"] for h in history["lightroom_history"]] == ["derived"]
+    assert [h["action"] for h in history["photoshop_history"]] == ["derived", "saved"]
+    assert history["crop"] == {"has_crop": True}
+    assert history["edit_software"] == "Lightroom"
+
+    fallback = extract_xmp_fallback(str(path))
+    assert fallback["photoshop"]["Headline"] == "Harbour at dawn"
+
+
+def test_png_itxt_and_block_scan(tmp_path):
+    packet = STANDARD.replace("{guid}", "")
+    png = tmp_path / "image.png"
+    _png_with_xmp(png, packet)
+    other = tmp_path / "document.bin"
+    other.write_bytes(b"\x00" * 1500000 + packet.encode("utf-8") + b"\x00" * 10)
+    clear_xmp_cache()
+
+    assert get_xmp_table(str(png)).text("photoshop:Headline") == "Harbour at dawn"
+    scanned = get_xmp_table(str(other))
+    assert scanned.packets[0]["source"] == "scan@%d" % (1500000 + packet.encode("utf-8").index(b"<x:xmpmeta"))
+    assert scanned.values("dc:subject") == ["boats", "sunrise"]
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"\x00" * 64)
+    assert not get_xmp_table(str(empty))
+    assert get_xmp_table(str(tmp_path / "missing.jpg")) is None